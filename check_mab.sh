@@ -1,11 +1,18 @@
 
-diff \
-  --suppress-common-lines \
-  -y \
-  <(cat src/contract_mab.py | sed -e "/^#.*/d" -e "1,5d" -e "s/ -> UInt64:/:/" -e "s/: UInt64//" -e "/@subroutine/d" -e "s/UInt64(0)/0/") \
-  <(cat src/simulate_mab.py | sed -e "/#.*/d")
-test ! ${?} -ne 0 || {
-	echo "[!] contract and simulate mab functions do not match!"
-	false
+extract() {
+  sed -n "/^def ${1}(/,/^[^ )]/p" ${2} | sed -e "/^[^ )]/{/^def /!d}" -e "/#.*/d" -e "/^$/d"
 }
-
+status=0
+for name in $(grep -oP "^def \K\w+" src/contract_mab.py)
+do
+  diff \
+    --suppress-common-lines \
+    -y \
+    <(extract ${name} src/contract_mab.py | sed -e "s/ -> UInt64:/:/" -e "s/: UInt64//" -e "s/UInt64(0)/0/") \
+    <(extract ${name} src/simulate_mab.py)
+  test ! ${?} -ne 0 || {
+    echo "[!] contract and simulate mab functions do not match!"
+    status=1
+  }
+done
+test ${status} -eq 0
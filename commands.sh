@@ -14,10 +14,10 @@ scs-build-all() {
   scs-build-image && scs-build-artifacts
 }
 scs-simulate() {
-  (
-    cd src
-    python simulate.py
-  )
+  python -m src.simulate ${@:-airdrop}
+}
+scs-benchmark() {
+  python -m src.benchmark ${@}
 }
 scs-cli() {
   (
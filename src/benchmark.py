@@ -0,0 +1,261 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import numpy as np
+from src import simulate
+from src.simulate_mab import calculate_mab_pure, calculate_mab_schedule
+from src.simulate_mab_batch import calculate_mab_batch
+from src.simulate_supply import get_unlock_events
+
+default_sizes = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+# pure python benchmarks above this size take minutes
+default_max_scalar_size = 10**5
+
+# airdrop mainnet settings, see docs/factory.md
+vesting_delay = 1
+period_seconds = 2628288
+lockup_delay = 12
+distribution_count = 12
+distribution_seconds = 2628288
+
+
+def get_contracts(size: int, seed: int = 0):
+    """
+    Random airdrop contracts in calculate_mab_pure argument order without now.
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        np.full(size, vesting_delay, dtype=np.uint64),
+        np.full(size, period_seconds, dtype=np.uint64),
+        np.full(size, lockup_delay, dtype=np.uint64),
+        rng.integers(0, 6, size, dtype=np.uint64),
+        rng.integers(1_700_000_000, 1_750_000_000, size, dtype=np.uint64),
+        rng.integers(0, 10**12, size, dtype=np.uint64),
+        np.full(size, distribution_count, dtype=np.uint64),
+        np.full(size, distribution_seconds, dtype=np.uint64),
+    ]
+
+
+def get_now(size: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    return rng.integers(1_700_000_000, 2_100_000_000, size, dtype=np.uint64)
+
+
+##############################################
+# benchmarks
+#   each takes a size and returns a callable
+#   doing size evaluations
+##############################################
+
+
+def bench_mab_scalar(size: int):
+    contracts = [column.tolist() for column in get_contracts(size)]
+    now = get_now(size).tolist()
+
+    def run():
+        for i in range(size):
+            calculate_mab_pure(now[i], *(column[i] for column in contracts))
+
+    return run
+
+
+def bench_mab_batch(size: int):
+    contracts = get_contracts(size)
+    now = get_now(size)
+
+    def run():
+        calculate_mab_batch(now, *contracts)
+
+    return run
+
+
+def bench_schedule_scalar(size: int):
+    # size evaluations, one schedule covers distribution_count breakpoints
+    count = max(1, size // distribution_count)
+    contracts = [column.tolist() for column in get_contracts(count)]
+
+    def run():
+        for i in range(count):
+            calculate_mab_schedule(*(column[i] for column in contracts))
+
+    return run
+
+
+def bench_schedule_batch(size: int):
+    contracts = get_contracts(max(1, size // distribution_count))
+
+    def run():
+        get_unlock_events(*contracts)
+
+    return run
+
+
+def bench_bonus(size: int):
+    # one bonus per sample without the table, as before
+    def run():
+        for i in range(size):
+            simulate.calculate_accumulated(
+                simulate.tokens, simulate.get_apr(i % 19, 18), i % 19
+            )
+
+    return run
+
+
+def bench_bonus_table(size: int):
+    def run():
+        simulate.get_bonus_table.cache_clear()
+        for i in range(size):
+            simulate.get_bonus_table(simulate.tokens, 18, 0.075)[i % 19]
+
+    return run
+
+
+def bench_program(name: str):
+    program = simulate.programs[name]
+
+    def bench(size: int):
+        # plot_mab_* equivalent, samples x periods evaluations
+        samples = max(1, size // (program.period_limit + 1))
+        x_values = range(0, samples * 1000, 1000)
+        args = simulate.get_program_args(program, simulate.tokens, 0)
+
+        def run():
+            for _ in simulate.iter_mab_columns(x_values, *args):
+                pass
+
+        return run
+
+    return bench
+
+
+benchmarks = {
+    "mab_scalar": (bench_mab_scalar, True),
+    "mab_batch": (bench_mab_batch, False),
+    "schedule_scalar": (bench_schedule_scalar, True),
+    "schedule_batch": (bench_schedule_batch, False),
+    "bonus": (bench_bonus, True),
+    "bonus_table": (bench_bonus_table, True),
+    "program_airdrop": (bench_program("airdrop"), False),
+    "program_staking": (bench_program("staking"), False),
+    "program_compensation": (bench_program("compensation"), False),
+}
+
+
+##############################################
+
+
+def measure(run, repeat: int):
+    """
+    Best wall time of repeat runs.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmarks(
+    names=None,
+    sizes=default_sizes,
+    max_scalar_size: int = default_max_scalar_size,
+    repeat: int = 3,
+):
+    results = []
+    for name in names or benchmarks:
+        bench, scalar = benchmarks[name]
+        for size in sizes:
+            if scalar and size > max_scalar_size:
+                continue
+            seconds = measure(bench(size), repeat)
+            results.append(
+                {
+                    "name": name,
+                    "size": size,
+                    "seconds": seconds,
+                    "per_second": size / seconds if seconds > 0 else None,
+                }
+            )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "timestamp": int(time.time()),
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.25):
+    """
+    Compare report against baseline by (name, size).
+
+    Returns a list of comparisons, each with the baseline seconds, the
+    ratio report / baseline and whether it is a regression, ie) slower
+    than baseline by more than tolerance.
+    """
+    baseline_seconds = {
+        (result["name"], result["size"]): result["seconds"]
+        for result in baseline["results"]
+    }
+    comparisons = []
+    for result in report["results"]:
+        key = (result["name"], result["size"])
+        if key not in baseline_seconds:
+            continue
+        ratio = result["seconds"] / baseline_seconds[key]
+        comparisons.append(
+            {
+                **result,
+                "baseline_seconds": baseline_seconds[key],
+                "ratio": ratio,
+                "regression": ratio > 1 + tolerance,
+            }
+        )
+    return comparisons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark MAB and simulation hot paths."
+    )
+    parser.add_argument("--names", nargs="+", choices=list(benchmarks))
+    parser.add_argument("--sizes", type=int, nargs="+", default=default_sizes)
+    parser.add_argument("--max-scalar-size", type=int, default=default_max_scalar_size)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument(
+        "--baseline",
+        help="baseline json to compare against, ex) src/benchmark_baseline.json",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+    report = run_benchmarks(args.names, args.sizes, args.max_scalar_size, args.repeat)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            report["comparisons"] = compare(
+                report, json.load(baseline_file), args.tolerance
+            )
+    with open(args.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    for result in report.get("comparisons", report["results"]):
+        print(
+            f"{result['name']:>22} {result['size']:>9} {result['seconds']:.6f}s"
+            + (
+                f" x{result['ratio']:.2f}{' REGRESSION' if result['regression'] else ''}"
+                if "ratio" in result
+                else ""
+            )
+        )
+    if any(result["regression"] for result in report.get("comparisons", [])):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+import copy
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+from algosdk import mnemonic, transaction
+from algosdk.account import address_from_private_key
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import (
+    AlgodHTTPError,
+    ConfirmationTimeoutError,
+    IndexerHTTPError,
+    TransactionRejectedError,
+)
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+# atomic group size limit
+max_group_size = 16
+
+default_algod_server = "https://testnet-api.voi.nodly.io"
+default_indexer_server = "https://testnet-idx.voi.nodly.io"
+
+
+@dataclass
+class Item:
+    """
+    Unit of work, key identifies it in outcomes, txns builds its
+    transactions from suggested params.
+    """
+
+    key: Any
+    size: int
+    txns: Callable[[transaction.SuggestedParams], list]
+
+
+@dataclass
+class Outcome:
+    key: Any
+    confirmed: bool
+    txid: str | None = None
+    confirmed_round: int | None = None
+    error: str | None = None
+
+
+class ClientPool:
+    """
+    Algod clients shared by worker threads, each client used by one
+    thread at a time.
+    """
+
+    def __init__(self, clients: Iterable[AlgodClient]):
+        self.clients = queue.Queue()
+        for client in clients:
+            self.clients.put(client)
+
+    @classmethod
+    def from_env(cls, size: int, servers=None):
+        """
+        Clients for ALGOD_SERVER or servers, ALGOD_TOKEN and ALGOD_PORT,
+        size per server.
+        """
+        token = os.environ.get("ALGOD_TOKEN", "")
+        port = os.environ.get("ALGOD_PORT", "")
+        servers = servers or [os.environ.get("ALGOD_SERVER", default_algod_server)]
+        return cls(
+            AlgodClient(token, f"{server}:{port}" if port else server)
+            for server in servers
+            for _ in range(size)
+        )
+
+    @contextmanager
+    def client(self):
+        client = self.clients.get()
+        try:
+            yield client
+        finally:
+            self.clients.put(client)
+
+
+def get_indexer_from_env(server=None) -> IndexerClient:
+    """
+    Indexer client for INDEXER_SERVER or server, INDEXER_TOKEN and
+    INDEXER_PORT.
+    """
+    token = os.environ.get("INDEXER_TOKEN", "")
+    port = os.environ.get("INDEXER_PORT", "")
+    server = server or os.environ.get("INDEXER_SERVER", default_indexer_server)
+    return IndexerClient(token, f"{server}:{port}" if port else server)
+
+
+class ParamsCache:
+    """
+    Suggested params shared by all groups, refreshed every ttl seconds,
+    valid for validity_rounds if given, algod default otherwise.
+    """
+
+    def __init__(
+        self, pool: ClientPool, ttl: float = 30, validity_rounds: int | None = None
+    ):
+        self.pool = pool
+        self.ttl = ttl
+        self.validity_rounds = validity_rounds
+        self.lock = threading.Lock()
+        self.params = None
+        self.fetched = 0.0
+
+    def get(self) -> transaction.SuggestedParams:
+        with self.lock:
+            if self.params is None or time.monotonic() - self.fetched > self.ttl:
+                with self.pool.client() as client:
+                    self.params = client.suggested_params()
+                if self.validity_rounds is not None:
+                    self.params.last = self.params.first + self.validity_rounds
+                self.fetched = time.monotonic()
+            return self.params
+
+    def invalidate(self):
+        with self.lock:
+            self.params = None
+
+
+def get_params(params: transaction.SuggestedParams, fee: int):
+    """
+    Copy of params with a flat fee.
+    """
+    params = copy.copy(params)
+    params.flat_fee = True
+    params.fee = fee
+    return params
+
+
+def get_signer(private_key: str):
+    signer = AccountTransactionSigner(private_key)
+
+    def sign(txns):
+        return signer.sign_transactions(txns, list(range(len(txns))))
+
+    return sign
+
+
+def get_account_from_env(name: str = "MN"):
+    """
+    Address and private key of the mnemonic in environment variable name.
+    """
+    private_key = mnemonic.to_private_key(os.environ[name])
+    return address_from_private_key(private_key), private_key
+
+
+def pack_groups(items: Iterable[Item], size: int = max_group_size) -> Iterator[list]:
+    """
+    Greedily pack items in order into groups of at most size transactions,
+    consuming items lazily.
+    """
+    group = []
+    group_size = 0
+    for item in items:
+        if item.size > size:
+            raise ValueError(f"item {item.key} exceeds group size")
+        if group_size + item.size > size:
+            yield group
+            group = []
+            group_size = 0
+        group.append(item)
+        group_size += item.size
+    if group:
+        yield group
+
+
+def is_rejected(error: Exception) -> bool:
+    """
+    Whether algod rejected the group itself, ie) logic eval error or
+    overspend, as opposed to a transient failure worth retrying.
+    """
+    if isinstance(error, TransactionRejectedError):
+        return True
+    return (
+        isinstance(error, AlgodHTTPError)
+        and error.code is not None
+        and 400 <= error.code < 500
+        and error.code != 429
+    )
+
+
+class Submitter:
+    """
+    Sign, send and confirm groups of items with retries.
+
+    Transient failures resend the same signed group with exponential
+    backoff, a group is only rebuilt once its last valid round has passed
+    without it being confirmed, so it is never confirmed twice. A group
+    rejected by algod is split in halves and resubmitted until the
+    rejected items are isolated, so one bad item does not fail the others.
+    on_send(group, txid, last_valid_round) is called before a newly built
+    group is first sent, ie) to journal it. Whether an expired group was
+    confirmed is looked up in indexer, see await_expiry.
+    """
+
+    def __init__(
+        self,
+        pool: ClientPool,
+        sign,
+        indexer: IndexerClient,
+        params: ParamsCache | None = None,
+        retries: int = 3,
+        backoff: float = 1,
+        wait_rounds: int = 10,
+        on_send=None,
+    ):
+        self.pool = pool
+        self.sign = sign
+        self.indexer = indexer
+        self.params = params or ParamsCache(pool)
+        self.retries = retries
+        self.backoff = backoff
+        self.wait_rounds = wait_rounds
+        self.on_send = on_send
+
+    def build(self, group: list):
+        """
+        Signed transactions of group, txid of the first and last valid round.
+        """
+        params = self.params.get()
+        txns = [txn for item in group for txn in item.txns(params)]
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        signed = self.sign(txns)
+        txid = signed[0].get_txid()
+        if self.on_send:
+            self.on_send(group, txid, txns[0].last_valid_round)
+        return signed, txid, txns[0].last_valid_round
+
+    def send(self, signed, txid: str, last_valid_round: int) -> int | None:
+        """
+        Send signed and wait for confirmation, returns the confirmed round,
+        None if the group expired unconfirmed.
+        """
+        with self.pool.client() as client:
+            client.send_transactions(signed)
+            try:
+                result = transaction.wait_for_confirmation(
+                    client, txid, self.wait_rounds
+                )
+                return result["confirmed-round"]
+            except ConfirmationTimeoutError:
+                return self.await_expiry(client, txid, last_valid_round)
+
+    def get_confirmed_round(self, txid: str, last_valid_round: int):
+        with self.pool.client() as client:
+            return self.await_expiry(client, txid, last_valid_round)
+
+    def await_expiry(self, client: AlgodClient, txid: str, last_valid_round: int):
+        """
+        Confirmed round of txid, once last_valid_round has passed unless
+        already confirmed, None if it was not confirmed.
+
+        A 404 from pending transaction info is no proof txid was not
+        confirmed, algod forgets confirmed transactions after a while and
+        nodes behind a load balancer do not share their pools, so once
+        expired txid is looked up in indexer.
+        """
+        while True:
+            try:
+                confirmed_round = client.pending_transaction_info(txid).get(
+                    "confirmed-round"
+                )
+            except AlgodHTTPError:
+                confirmed_round = None
+            if confirmed_round:
+                return confirmed_round
+            last_round = client.status()["last-round"]
+            if last_round > last_valid_round:
+                return self.lookup_confirmed_round(txid, last_valid_round)
+            client.status_after_block(last_round)
+
+    def lookup_confirmed_round(self, txid: str, last_valid_round: int):
+        """
+        Confirmed round of txid in indexer, None if it was not confirmed,
+        once indexer has caught up to last_valid_round. Transient indexer
+        failures are retried with exponential backoff.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = self.indexer.search_transactions(txid=txid)
+            except (IndexerHTTPError, OSError):
+                if attempt >= self.retries:
+                    raise
+                result = None
+            if result is not None:
+                if result["transactions"]:
+                    return result["transactions"][0]["confirmed-round"]
+                if result["current-round"] >= last_valid_round:
+                    return None
+            time.sleep(self.backoff * 2**attempt)
+            attempt = min(attempt + 1, self.retries)
+
+    def submit(self, group: list) -> list[Outcome]:
+        signed, txid, last_valid_round = self.build(group)
+        # a failed send may have reached the node
+        maybe_sent = False
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                confirmed_round = self.send(signed, txid, last_valid_round)
+            except (AlgodHTTPError, TransactionRejectedError, OSError) as e:
+                if not is_rejected(e):
+                    maybe_sent = True
+                    error = e
+                    continue
+                # duplicate of an earlier send or rejected
+                confirmed_round = (
+                    self.get_confirmed_round(txid, last_valid_round)
+                    if maybe_sent
+                    else None
+                )
+                if confirmed_round is None:
+                    if len(group) > 1:
+                        half = len(group) // 2
+                        return self.submit(group[:half]) + self.submit(group[half:])
+                    return [Outcome(group[0].key, False, txid, error=str(e))]
+            if confirmed_round is None:
+                # expired unconfirmed, rebuild with fresh params
+                self.params.invalidate()
+                signed, txid, last_valid_round = self.build(group)
+                maybe_sent = False
+                error = ConfirmationTimeoutError(f"{txid} expired")
+                continue
+            return [Outcome(item.key, True, txid, confirmed_round) for item in group]
+        return [Outcome(item.key, False, txid, error=str(error)) for item in group]
+
+    def run(self, groups: Iterable[list], max_in_flight: int = 8) -> Iterator[list]:
+        """
+        Submit groups concurrently, at most max_in_flight at a time,
+        consuming groups lazily. Yields outcomes of each group as it
+        completes.
+        """
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            pending = set()
+            for group in groups:
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(self.submit, group))
+            for future in as_completed(pending):
+                yield future.result()
@@ -2,7 +2,12 @@ import typing
 from algopy import (
     ARC4Contract,
     Account,
+    Application,
+    Box,
+    BoxMap,
+    Bytes,
     Global,
+    GlobalState,
     OnCompleteAction,
     TemplateVar,
     Txn,
@@ -12,9 +17,22 @@ from algopy import (
     op,
     subroutine,
     compile_contract,
+    urange,
+)
+from src.contract_mab import (
+    calculate_fully_vested,
+    calculate_mab_vested,
+    calculate_next_unlock,
+)
+from src.utils import (
+    require_payment,
+    get_available_balance,
+    get_min_balance,
+    settle_mbr_payment,
+    append_paged,
+    get_paged,
+    close_offline_on_delete,
 )
-from src.contract_mab import calculate_mab_pure
-from src.utils import require_payment, get_available_balance, close_offline_on_delete
 
 Bytes32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
 Bytes64: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[64]]
@@ -278,6 +296,21 @@ class StakeableInterface(ARC4Contract):
         """
         pass
 
+    @arc4.abimethod
+    def participate_pooled(
+        self,
+        vote_k: Bytes32,
+        sel_k: Bytes32,
+        vote_fst: arc4.UInt64,
+        vote_lst: arc4.UInt64,
+        vote_kd: arc4.UInt64,
+        sp_key: Bytes64,
+    ) -> None:  # pragma: no cover
+        """
+        Participate in consensus, key registration fee pooled.
+        """
+        pass
+
 
 class Stakeable(StakeableInterface, OwnableInterface):
     def __init__(self) -> None:  # pragma: no cover
@@ -314,6 +347,46 @@ class Stakeable(StakeableInterface, OwnableInterface):
         # require payment of min fee to prevent draining
         assert require_payment(Txn.sender) == key_reg_fee, "payment amout accurate"
         ###########################################
+        self.register_key(
+            vote_k, sel_k, vote_fst, vote_lst, vote_kd, sp_key, key_reg_fee
+        )
+
+    @arc4.abimethod
+    def participate_pooled(
+        self,
+        vote_k: Bytes32,
+        sel_k: Bytes32,
+        vote_fst: arc4.UInt64,
+        vote_lst: arc4.UInt64,
+        vote_kd: arc4.UInt64,
+        sp_key: Bytes64,
+    ) -> None:
+        ###########################################
+        assert (
+            Txn.sender == self.owner or Txn.sender == self.delegate
+        ), "must be owner or delegate"
+        ###########################################
+        # require app call fee to cover key registration to prevent draining
+        assert Txn.fee >= Global.min_txn_fee * 2, "fee covers key registration"
+        ###########################################
+        self.register_key(
+            vote_k, sel_k, vote_fst, vote_lst, vote_kd, sp_key, UInt64(0)
+        )
+
+    @subroutine
+    def register_key(
+        self,
+        vote_k: Bytes32,
+        sel_k: Bytes32,
+        vote_fst: arc4.UInt64,
+        vote_lst: arc4.UInt64,
+        vote_kd: arc4.UInt64,
+        sp_key: Bytes64,
+        fee: UInt64,
+    ) -> None:
+        """
+        Emit Participated and register participation key.
+        """
         arc4.emit(
             Participated(
                 arc4.Address(Txn.sender),
@@ -335,7 +408,7 @@ class Stakeable(StakeableInterface, OwnableInterface):
             vote_last=vote_lst.native,
             vote_key_dilution=vote_kd.native,
             state_proof_key=sp_key.bytes,
-            fee=key_reg_fee,
+            fee=fee,
         ).submit()
 
 
@@ -541,6 +614,15 @@ class Template(arc4.Struct):
     delegate: arc4.Address
 
 
+class Params(arc4.Struct):
+    period_limit: arc4.UInt64
+    vesting_delay: arc4.UInt64
+    lockup_delay: arc4.UInt64
+    period_seconds: arc4.UInt64
+    distribution_count: arc4.UInt64
+    distribution_seconds: arc4.UInt64
+
+
 class Setup(arc4.Struct):
     deployer: arc4.Address
     owner: arc4.Address
@@ -573,22 +655,19 @@ class LockableInterface(ARC4Contract):
     - period, lockup period
     - initial, initial balance
     - deadline, deadline for lockup period configuration
-    - period_seconds, seconds in a period
-    - lockup_delay, lockup delay
-    - vesting_delay, vesting delay
-    - period_limit, period limit
+    - params, packed template parameters, absent when shared by parent
+      - period_limit, period limit
+      - vesting_delay, vesting delay
+      - lockup_delay, lockup delay
+      - period_seconds, seconds in a period
+      - distribution_count, periods in distribution
+      - distribution_seconds, seconds in distribution
     """
 
     def __init__(self) -> None:  # pragma: no cover
         self.period = UInt64()  # 0
         self.initial = UInt64()  # 0
         self.deadline = UInt64()  # 0
-        self.period_seconds = UInt64()  # 0
-        self.lockup_delay = UInt64()  # 0
-        self.vesting_delay = UInt64()  # 0
-        self.period_limit = UInt64()  # 0
-        self.distribution_count = UInt64()  # 0
-        self.distribution_seconds = UInt64()  # 0
 
     @arc4.abimethod
     def template(
@@ -611,6 +690,20 @@ class LockableInterface(ARC4Contract):
         """
         pass
 
+    @arc4.abimethod
+    def template_shared(
+        self,
+        period: arc4.UInt64,
+        deadline: arc4.UInt64,
+        total: arc4.UInt64,
+        funding: arc4.UInt64,
+        delegate: arc4.Address,
+    ) -> None:  # pragma: no cover
+        """
+        Template method reading shared template parameters from parent.
+        """
+        pass
+
     @arc4.abimethod
     def setup(
         self,
@@ -638,6 +731,30 @@ class LockableInterface(ARC4Contract):
         """
         return UInt64()
 
+    @arc4.abimethod
+    def withdraw_max(self) -> tuple[UInt64, UInt64]:  # pragma: no cover
+        """
+        Withdraw all available funds from contract. Should be called by owner.
+        """
+        return UInt64(), UInt64()
+
+    @arc4.abimethod(readonly=True)
+    def mab_at(self, timestamp: arc4.UInt64) -> UInt64:  # pragma: no cover
+        """
+        Get minimum allowable balance at timestamp.
+        """
+        return UInt64()
+
+    @arc4.abimethod(readonly=True)
+    def next_unlock(
+        self, timestamp: arc4.UInt64
+    ) -> tuple[UInt64, UInt64]:  # pragma: no cover
+        """
+        Get next timestamp after timestamp at which minimum allowable
+        balance decreases and its value there.
+        """
+        return UInt64(), UInt64()
+
     @arc4.abimethod
     def close(self) -> None:  # pragma: no cover
         """
@@ -664,6 +781,11 @@ class LockableInterface(ARC4Contract):
 #     - total, total amount funded
 #     - initial, initial balance
 #     - deadline, funding deadline
+#     - fully_vested, when fully vested
+#       derived when funding is set, 0 until
+#       then, absent in apps created before it
+#       was added, whose schema has no room
+#       for it, derived on every read instead
 #   warm state
 #     - vesting_delay, vesting delay
 #       periods from funding until lockup
@@ -678,6 +800,21 @@ class LockableInterface(ARC4Contract):
 #     - period_seconds, period seconds
 #     - lockup_delay, lockup delay
 #     - period_limit, period limit
+#   params, set once by template, packs
+#     vesting delay and cold template
+#     parameters into one key, read once
+#     per call and extracted
+#     absent when templated with
+#     template_shared, read from parent
+#     params instead, and in apps upgraded
+#     from before it was added, read from
+#     their individual legacy keys instead
+#     - period_limit, bytes 0-7
+#     - vesting_delay, bytes 8-15
+#     - lockup_delay, bytes 16-23
+#     - period_seconds, bytes 24-31
+#     - distribution_count, bytes 32-39
+#     - distribution_seconds, bytes 40-47
 ##################################################
 class Lockable(
     LockableInterface,
@@ -693,12 +830,8 @@ class Lockable(
         self.period = UInt64()
         self.initial = UInt64()
         self.deadline = UInt64()
-        self.period_seconds = UInt64()
-        self.lockup_delay = UInt64()
-        self.vesting_delay = UInt64()
-        self.period_limit = UInt64()
-        self.distribution_count = UInt64()
-        self.distribution_seconds = UInt64()
+        self.params = GlobalState(Params)
+        self.fully_vested = GlobalState(UInt64(0))
         # fundable state
         self.funder = Account()
         self.funding = UInt64()
@@ -737,13 +870,29 @@ class Lockable(
         ##########################################
         assert Txn.sender == self.owner, "must be owner"
         ##########################################
-        assert period <= self.period_limit
+        assert period <= self.get_params().period_limit
         ##########################################
         assert self.deadline > Global.latest_timestamp, "deadline not passed"
         ##########################################
         arc4.emit(Configured(arc4.UInt64(self.period), period))
         self.period = period.native
 
+    # override fundable set_funding abimethod
+    #   derive fully vested once, period can no
+    #   longer be configured after funding is set
+    @arc4.abimethod
+    def set_funding(self, funding: arc4.UInt64) -> None:
+        #########################################
+        assert Txn.sender == self.funder, "must be funder"
+        #########################################
+        assert (
+            self.funding == UInt64(0) or self.funding > Global.latest_timestamp
+        ), "funding not be initialized or can be extended"
+        #########################################
+        arc4.emit(FundingSet(arc4.UInt64(self.funding), funding))
+        self.funding = funding.native
+        self.store_fully_vested(self.get_params())
+
     ##############################################
     # function: withdraw
     # arguments:
@@ -786,6 +935,99 @@ class Lockable(
                 itxn.Payment(amount=amount.native, receiver=Txn.sender, fee=0).submit()
             return min_balance
 
+    ##############################################
+    # function: withdraw_max
+    # purpose: withdraw all funds above min
+    #   balance in one call
+    # returns:
+    # - amount withdrawn
+    # - min balance after withdraw
+    ##############################################
+    @arc4.abimethod
+    def withdraw_max(self) -> tuple[UInt64, UInt64]:
+        """
+        Withdraw all available funds from contract.
+        """
+        ##########################################
+        assert Txn.sender == self.owner, "must be owner"
+        ##########################################
+        if self.funding > 0:
+            min_balance = self.calculate_min_balance()
+        else:
+            min_balance = self.total
+        available_balance = get_available_balance()
+        amount = UInt64(0)
+        if available_balance > min_balance:
+            amount = available_balance - min_balance
+        arc4.emit(Withdrawn(arc4.UInt64(min_balance), arc4.UInt64(amount)))
+        if amount > 0:
+            itxn.Payment(amount=amount, receiver=Txn.sender, fee=0).submit()
+        return amount, min_balance
+
+    ##############################################
+    # function: mab_at
+    # arguments:
+    # - timestamp, when
+    # purpose: minimum allowable balance
+    #   withdraw would enforce at timestamp
+    # returns: minimum allowable balance, total
+    #   before funding is set
+    ##############################################
+    @arc4.abimethod(readonly=True)
+    def mab_at(self, timestamp: arc4.UInt64) -> UInt64:
+        """
+        Get minimum allowable balance at timestamp.
+        """
+        if self.funding == 0:
+            return self.total
+        params = self.get_params()
+        return calculate_mab_vested(
+            timestamp.native,
+            self.get_fully_vested(params),
+            self.total,
+            params.distribution_count.native,
+            params.distribution_seconds.native,
+        )
+
+    ##############################################
+    # function: next_unlock
+    # arguments:
+    # - timestamp, when
+    # purpose: schedule next withdraw
+    # returns:
+    # - first timestamp after timestamp at which
+    #   minimum allowable balance decreases, 0 if
+    #   it does not before funding is set or
+    #   once fully distributed
+    # - minimum allowable balance then, or at
+    #   timestamp if it does not decrease
+    ##############################################
+    @arc4.abimethod(readonly=True)
+    def next_unlock(self, timestamp: arc4.UInt64) -> tuple[UInt64, UInt64]:
+        """
+        Get next timestamp at which minimum allowable balance decreases.
+        """
+        if self.funding == 0:
+            return UInt64(0), self.total
+        params = self.get_params()
+        fully_vested = self.get_fully_vested(params)
+        next_timestamp = calculate_next_unlock(
+            timestamp.native,
+            fully_vested,
+            self.total,
+            params.distribution_count.native,
+            params.distribution_seconds.native,
+        )
+        if next_timestamp == 0:
+            return next_timestamp, UInt64(0)
+        return next_timestamp, calculate_mab_vested(
+            next_timestamp,
+            fully_vested,
+            self.total,
+            params.distribution_count.native,
+            params.distribution_seconds.native,
+        )
+
     ##############################################
     # function: close
     # purpose: deletes contract
@@ -825,23 +1067,120 @@ class Lockable(
     #       p = 1 / (self.period x 12) or 1 / (period)
     # - mimumum balance =
     #     total x min(1, p x max(0, (period - (now() - funding + y x seconds-in-month)) / seconds-in-month))
+    # - fully vested from get_fully_vested
     ##############################################
     @subroutine
     def calculate_min_balance(self) -> UInt64:
         now: UInt64 = Global.latest_timestamp
-        min_balance: UInt64 = calculate_mab_pure(
+        params = self.get_params()
+        min_balance: UInt64 = calculate_mab_vested(
             now,
-            self.vesting_delay,
-            self.period_seconds,
-            self.lockup_delay,
-            self.period,
-            self.funding,
+            self.get_fully_vested(params),
             self.total,
-            self.distribution_count,
-            self.distribution_seconds,
+            params.distribution_count.native,
+            params.distribution_seconds.native,
         )
         return min_balance
 
+    ##############################################
+    # function: get_fully_vested (internal)
+    # arguments:
+    # - params, template parameters
+    # purpose: when fully vested
+    # pre-conditions:
+    # - funding set
+    # post-conditions: None
+    # notes:
+    # - derived at funding when stored,
+    #   otherwise derived from vesting delay,
+    #   lockup delay, period and funding
+    ##############################################
+    @subroutine
+    def get_fully_vested(self, params: Params) -> UInt64:
+        fully_vested, exists = self.fully_vested.maybe()
+        if exists and fully_vested > 0:
+            return fully_vested
+        return calculate_fully_vested(
+            params.vesting_delay.native,
+            params.period_seconds.native,
+            params.lockup_delay.native,
+            self.period,
+            self.funding,
+        )
+
+    ##############################################
+    # function: store_fully_vested (internal)
+    # arguments:
+    # - params, template parameters
+    # purpose: derive fully vested once funding
+    #   is set
+    # pre-conditions:
+    # - funding set
+    # post-conditions: None
+    # notes:
+    # - only stored when key exists, apps
+    #   upgraded from before it was added
+    #   have no room for it in their schema
+    ##############################################
+    @subroutine
+    def store_fully_vested(self, params: Params) -> None:
+        if self.fully_vested.maybe()[1]:
+            self.fully_vested.value = calculate_fully_vested(
+                params.vesting_delay.native,
+                params.period_seconds.native,
+                params.lockup_delay.native,
+                self.period,
+                self.funding,
+            )
+
+    ##############################################
+    # function: get_params (internal)
+    # arguments: None
+    # purpose: template parameters
+    # pre-conditions:
+    # - templated
+    # post-conditions: None
+    # notes:
+    # - own params when templated with template,
+    #   own legacy keys when templated before
+    #   params was added, otherwise params of
+    #   parent, parent must be in foreign apps
+    ##############################################
+    @subroutine
+    def get_params(self) -> Params:
+        params, exists = op.AppGlobal.get_ex_bytes(
+            Global.current_application_id, b"params"
+        )
+        if exists:
+            return Params.from_bytes(params)
+        if self.is_legacy():
+            return Params(
+                arc4.UInt64(op.AppGlobal.get_uint64(b"period_limit")),
+                arc4.UInt64(op.AppGlobal.get_uint64(b"vesting_delay")),
+                arc4.UInt64(op.AppGlobal.get_uint64(b"lockup_delay")),
+                arc4.UInt64(op.AppGlobal.get_uint64(b"period_seconds")),
+                arc4.UInt64(op.AppGlobal.get_uint64(b"distribution_count")),
+                arc4.UInt64(op.AppGlobal.get_uint64(b"distribution_seconds")),
+            )
+        params, exists = op.AppGlobal.get_ex_bytes(self.parent_id, b"params")
+        assert exists, "params exist"
+        return Params.from_bytes(params)
+
+    ##############################################
+    # function: is_legacy (internal)
+    # arguments: None
+    # purpose: whether upgraded in place from a
+    #   version storing template parameters in
+    #   individual keys instead of params
+    # pre-conditions: None
+    # post-conditions: None
+    ##############################################
+    @subroutine
+    def is_legacy(self) -> bool:
+        return op.AppGlobal.get_ex_uint64(
+            Global.current_application_id, b"period_limit"
+        )[1]
+
 
 ##################################################
 # Messenger
@@ -875,6 +1214,15 @@ class MessengerInterface(ARC4Contract):
         """
         pass
 
+    @arc4.abimethod
+    def partkey_broastcast_many(
+        self, partkeys: arc4.DynamicArray[PartKeyInfo]
+    ) -> None:  # pragma: no cover
+        """
+        Broastcast partkey information of many addresses.
+        """
+        pass
+
 
 class Messenger(MessengerInterface, Upgradeable):
     def __init__(self) -> None:  # pragma: no cover
@@ -883,6 +1231,12 @@ class Messenger(MessengerInterface, Upgradeable):
         self.deployment_version = UInt64()
         self.updatable = bool(1)
         self.upgrader = Global.creator_address
+        # registry state, in boxes so messenger updated
+        #   in place keeps its global schema
+        self.registry = Box(UInt64, key=b"registry")
+        # keyed by sender and address without prefix, box names are
+        #   at most 64 bytes
+        self.partkeys = BoxMap(Bytes, PartKeyInfo, key_prefix=b"")
 
     @arc4.abimethod
     def partkey_broastcast(
@@ -895,14 +1249,126 @@ class Messenger(MessengerInterface, Upgradeable):
         vote_kd: arc4.UInt64,
         sp_key: Bytes64,
     ) -> None:
-        arc4.emit(
-            MessagePartKeyInfo(
-                arc4.Address(Txn.sender),
-                PartKeyInfo(
-                    address, vote_k, sel_k, vote_fst, vote_lst, vote_kd, sp_key
-                ),
-            )
+        partkey = PartKeyInfo(
+            address,
+            vote_k.copy(),
+            sel_k.copy(),
+            vote_fst,
+            vote_lst,
+            vote_kd,
+            sp_key.copy(),
         )
+        arc4.emit(MessagePartKeyInfo(arc4.Address(Txn.sender), partkey.copy()))
+        if self.registry:
+            min_balance = get_min_balance()
+            self.record(partkey)
+            settle_mbr_payment(min_balance)
+
+    @arc4.abimethod
+    def partkey_broastcast_many(
+        self, partkeys: arc4.DynamicArray[PartKeyInfo]
+    ) -> None:
+        """
+        Broastcast partkey information of many addresses, emits one
+        MessagePartKeyInfo per address like partkey_broastcast.
+        """
+        ##########################################
+        assert partkeys.length > 0, "partkeys not empty"
+        # each log is 220 bytes of the 1024 bytes of logs per call
+        assert partkeys.length <= 4, "partkeys at most 4"
+        ##########################################
+        min_balance = get_min_balance()
+        for i in urange(partkeys.length):
+            partkey = partkeys[i].copy()
+            arc4.emit(MessagePartKeyInfo(arc4.Address(Txn.sender), partkey.copy()))
+            if self.registry:
+                self.record(partkey)
+        if self.registry:
+            settle_mbr_payment(min_balance)
+
+    @arc4.abimethod
+    def enable_registry(self) -> None:
+        """
+        Keep latest partkey broadcast by each sender for each address
+        in box registry from now on. Senders pay for the boxes,
+        upgrader for the registry box with a payment preceding call.
+        Can not be disabled.
+        """
+        assert Txn.sender == self.upgrader, "must be upgrader"
+        min_balance = get_min_balance()
+        self.registry.value = UInt64(1)
+        settle_mbr_payment(min_balance)
+
+    @arc4.abimethod(readonly=True)
+    def get_partkey(self, who: arc4.Address, address: arc4.Address) -> PartKeyInfo:
+        """
+        Get latest partkey broadcast by who for address.
+        """
+        key = who.bytes + address.bytes
+        assert key in self.partkeys, "partkey registered"
+        return self.partkeys[key]
+
+    @arc4.abimethod(readonly=True)
+    def get_partkey_addresses(
+        self, who: arc4.Address, offset: arc4.UInt64, limit: arc4.UInt64
+    ) -> tuple[UInt64, arc4.DynamicArray[arc4.Address]]:
+        """
+        Get page of addresses who broadcast partkeys for, in order of
+        first broadcast.
+
+        Returns:
+        - number of addresses
+        - addresses from offset, at most limit, at most 31
+        """
+        count, addresses = get_paged(
+            b"a" + who.bytes, offset.native, limit.native, UInt64(32), UInt64(31)
+        )
+        return count, arc4.DynamicArray[arc4.Address].from_bytes(
+            arc4.UInt16(addresses.length // 32).bytes + addresses
+        )
+
+    @subroutine
+    def record(self, partkey: PartKeyInfo) -> None:
+        """
+        Record partkey broadcast by sender, addresses in pages of 31
+        addresses, 992 bytes, so a page fits the 1024 bytes of the
+        get_partkey_addresses return log.
+        """
+        key = Txn.sender.bytes + partkey.address.bytes
+        if key not in self.partkeys:
+            append_paged(
+                b"a" + Txn.sender.bytes, partkey.address.bytes, UInt64(31)
+            )
+        self.partkeys[key] = partkey.copy()
+
+
+class AirdropState(arc4.Struct):
+    owner: arc4.Address
+    funder: arc4.Address
+    delegate: arc4.Address
+    deployer: arc4.Address
+    upgrader: arc4.Address
+    parent_id: arc4.UInt64
+    messenger_id: arc4.UInt64
+    period_limit: arc4.UInt64
+    vesting_delay: arc4.UInt64
+    lockup_delay: arc4.UInt64
+    period_seconds: arc4.UInt64
+    distribution_count: arc4.UInt64
+    distribution_seconds: arc4.UInt64
+    period: arc4.UInt64
+    deadline: arc4.UInt64
+    total: arc4.UInt64
+    funding: arc4.UInt64
+    initial: arc4.UInt64
+    fully_vested: arc4.UInt64
+    contract_version: arc4.UInt64
+    deployment_version: arc4.UInt64
+    updatable: arc4.Bool
+    stakeable: arc4.Bool
+    balance: arc4.UInt64
+    min_balance: arc4.UInt64
+    available_balance: arc4.UInt64
 
 
 ##################################################
@@ -915,6 +1381,8 @@ class Airdrop(
     Lockable, Ownable, Fundable, Deployable, Stakeable, Upgradeable, Receiver
 ):
     def __init__(self) -> None:  # pragma: no cover
+        # lockable state, declares params and fully vested
+        super().__init__()
         # deployable state
         self.parent_id = UInt64()
         self.deployer = Account()
@@ -932,12 +1400,6 @@ class Airdrop(
         self.period = UInt64()
         self.initial = UInt64()
         self.deadline = UInt64()
-        self.period_seconds = UInt64()
-        self.lockup_delay = UInt64()
-        self.vesting_delay = UInt64()
-        self.period_limit = UInt64()
-        self.distribution_count = UInt64()
-        self.distribution_seconds = UInt64()
         # fundable state
         self.funder = Account()
         self.funding = UInt64()
@@ -967,23 +1429,8 @@ class Airdrop(
         """
         ##########################################
         assert Txn.sender == Global.creator_address, "must be creator"
-        assert self.period_limit == UInt64(0), "period limit not initialized"
-        assert self.vesting_delay == UInt64(0), "vesting delay not initialized"
-        assert self.lockup_delay == UInt64(0), "lockup delay not initialized"
-        assert self.period_seconds == UInt64(0), "period seconds not initialized"
+        assert not self.params.maybe()[1], "params not initialized"
         assert self.messenger_id == UInt64(0), "messenger id not initialized"
-        assert self.distribution_count == UInt64(
-            0
-        ), "distribution count not initialized"
-        assert self.distribution_seconds == UInt64(
-            0
-        ), "distribution seconds not initialized"
-        assert self.distribution_count == UInt64(
-            0
-        ), "distribution count not initialized"
-        assert self.distribution_seconds == UInt64(
-            0
-        ), "distribution seconds not initialized"
         assert distribution_seconds > UInt64(0), "distribution seconds must be positive"
         assert distribution_count > UInt64(0), "distribution count must be positive"
         assert self.period == UInt64(0), "period not initialized"
@@ -1008,18 +1455,194 @@ class Airdrop(
                 delegate,
             )
         )
-        self.period_limit = period_limit.native
-        self.vesting_delay = vesting_delay.native
-        self.lockup_delay = lockup_delay.native
-        self.period_seconds = period_seconds.native
+        self.params.value = Params(
+            period_limit,
+            vesting_delay,
+            lockup_delay,
+            period_seconds,
+            distribution_count,
+            distribution_seconds,
+        )
         self.messenger_id = messenger_id.native
-        self.distribution_count = distribution_count.native
-        self.distribution_seconds = distribution_seconds.native
         self.period = period.native
         self.deadline = deadline.native
         self.total = total.native
         self.funding = funding.native
         self.delegate = delegate.native
+        if self.funding > 0:
+            self.store_fully_vested(self.params.value.copy())
+
+    # implements lockable template_shared method
+    #   params and messenger id are read from parent
+    @arc4.abimethod
+    def template_shared(
+        self,
+        period: arc4.UInt64,
+        deadline: arc4.UInt64,
+        total: arc4.UInt64,
+        funding: arc4.UInt64,
+        delegate: arc4.Address,
+    ) -> None:
+        """
+        Template method reading shared template parameters from parent.
+        """
+        ##########################################
+        assert Txn.sender == Global.creator_address, "must be creator"
+        assert not self.params.maybe()[1], "params not initialized"
+        assert self.period == UInt64(0), "period not initialized"
+        assert self.deadline == UInt64(0), "deadline not initialized"
+        assert self.total == UInt64(0), "total not initialized"
+        assert self.funding == UInt64(0), "funding not initialized"
+        assert self.delegate == Global.zero_address, "delegate not initialized"
+        ##########################################
+        params = self.get_params()
+        assert params.distribution_seconds > 0, "distribution seconds must be positive"
+        assert params.distribution_count > 0, "distribution count must be positive"
+        messenger_id, messenger_id_exists = op.AppGlobal.get_ex_uint64(
+            self.parent_id, b"messenger_id"
+        )
+        assert messenger_id_exists, "messenger id exists"
+        ##########################################
+        arc4.emit(
+            Template(
+                params.period_limit,
+                params.vesting_delay,
+                params.lockup_delay,
+                params.period_seconds,
+                arc4.UInt64(messenger_id),
+                params.distribution_count,
+                params.distribution_seconds,
+                period,
+                deadline,
+                total,
+                funding,
+                delegate,
+            )
+        )
+        self.period = period.native
+        self.deadline = deadline.native
+        self.total = total.native
+        self.funding = funding.native
+        self.delegate = delegate.native
+        if self.funding > 0:
+            self.store_fully_vested(params)
+
+    # combines template, grant_upgrader and setup
+    #   so that factory creation is create, payment
+    #   and init, emits same events
+    @arc4.abimethod
+    def init(
+        self,
+        period_limit: arc4.UInt64,
+        vesting_delay: arc4.UInt64,
+        lockup_delay: arc4.UInt64,
+        period_seconds: arc4.UInt64,
+        messenger_id: arc4.UInt64,
+        distribution_count: arc4.UInt64,
+        distribution_seconds: arc4.UInt64,
+        period: arc4.UInt64,
+        deadline: arc4.UInt64,
+        total: arc4.UInt64,
+        funding: arc4.UInt64,
+        delegate: arc4.Address,
+        upgrader: arc4.Address,
+        deployer: arc4.Address,
+        owner: arc4.Address,
+        funder: arc4.Address,
+        initial: arc4.UInt64,
+    ) -> None:
+        """
+        Initialize template, upgrader and setup. Should be called by creator.
+        """
+        self.template(
+            period_limit,
+            vesting_delay,
+            lockup_delay,
+            period_seconds,
+            messenger_id,
+            distribution_count,
+            distribution_seconds,
+            period,
+            deadline,
+            total,
+            funding,
+            delegate,
+        )
+        self.grant_upgrader(upgrader)
+        self.setup(deployer, owner, funder, initial)
+
+    # combines template_shared, grant_upgrader and setup
+    @arc4.abimethod
+    def init_shared(
+        self,
+        period: arc4.UInt64,
+        deadline: arc4.UInt64,
+        total: arc4.UInt64,
+        funding: arc4.UInt64,
+        delegate: arc4.Address,
+        upgrader: arc4.Address,
+        deployer: arc4.Address,
+        owner: arc4.Address,
+        funder: arc4.Address,
+        initial: arc4.UInt64,
+    ) -> None:
+        """
+        Initialize template from parent, upgrader and setup. Should be
+        called by creator.
+        """
+        self.template_shared(period, deadline, total, funding, delegate)
+        self.grant_upgrader(upgrader)
+        self.setup(deployer, owner, funder, initial)
+
+    # snapshot of state for wallets and indexers
+    #   template parameters are read from parent
+    #   when shared, min balance is the one
+    #   withdraw enforces now
+    @arc4.abimethod(readonly=True)
+    def get_state(self) -> AirdropState:
+        """
+        Get state.
+        """
+        params = self.get_params()
+        messenger_id = self.messenger_id
+        if not self.params.maybe()[1] and not self.is_legacy():
+            messenger_id, messenger_id_exists = op.AppGlobal.get_ex_uint64(
+                self.parent_id, b"messenger_id"
+            )
+        fully_vested = UInt64(0)
+        if self.funding > 0:
+            fully_vested = self.get_fully_vested(params)
+            min_balance = self.calculate_min_balance()
+        else:
+            min_balance = self.total
+        return AirdropState(
+            arc4.Address(self.owner),
+            arc4.Address(self.funder),
+            arc4.Address(self.delegate),
+            arc4.Address(self.deployer),
+            arc4.Address(self.upgrader),
+            arc4.UInt64(self.parent_id),
+            arc4.UInt64(messenger_id),
+            params.period_limit,
+            params.vesting_delay,
+            params.lockup_delay,
+            params.period_seconds,
+            params.distribution_count,
+            params.distribution_seconds,
+            arc4.UInt64(self.period),
+            arc4.UInt64(self.deadline),
+            arc4.UInt64(self.total),
+            arc4.UInt64(self.funding),
+            arc4.UInt64(self.initial),
+            arc4.UInt64(fully_vested),
+            arc4.UInt64(self.contract_version),
+            arc4.UInt64(self.deployment_version),
+            arc4.Bool(self.updatable),
+            arc4.Bool(self.stakeable),
+            arc4.UInt64(op.balance(Global.current_application_address)),
+            arc4.UInt64(min_balance),
+            arc4.UInt64(get_available_balance()),
+        )
 
     # override fundable abort_funding abimethod
     #   close offline on delete to owner
@@ -1059,6 +1682,17 @@ class FactoryCreated(arc4.Struct):
     created_app: arc4.UInt64
 
 
+class ParamsShared(arc4.Struct):
+    params: Params
+    messenger_id: arc4.UInt64
+
+
+class ChildInfo(arc4.Struct):
+    app_id: arc4.UInt64
+    funder: arc4.Address
+    created_round: arc4.UInt64
+
+
 class BaseFactory(Upgradeable):
     """
     Base factory for all factories.
@@ -1073,6 +1707,12 @@ class BaseFactory(Upgradeable):
         self.deployment_version = UInt64()
         self.updatable = bool(1)
         self.upgrader = Global.creator_address
+        # shared template state
+        self.params = GlobalState(Params)
+        self.messenger_id = GlobalState(UInt64)
+        # registry state, in boxes so factories updated
+        #   in place keep their global schema
+        self.registry = Box(UInt64, key=b"registry")
 
         ##############################################
         # @arc4.abimethod
@@ -1081,18 +1721,107 @@ class BaseFactory(Upgradeable):
         ##############################################
 
     @subroutine
-    def get_initial_payment(self) -> UInt64:
+    def share(self, params: Params, messenger_id: UInt64) -> None:
         """
-        Get initial payment.
+        Share template parameters with children created from now on.
+        Once shared children read them from factory global state, so
+        they can not be unshared. Factories deployed before sharing was
+        added keep their 3 uint, 2 byte slice global schema when updated
+        in place, which has no room for them, so they must be redeployed.
         """
-        payment_amount = require_payment(Txn.sender)
-        mbr_increase = UInt64(1234500)
-        min_balance = op.Global.min_balance  # 100000
-        assert (
-            payment_amount >= mbr_increase + min_balance
-        ), "payment amount accurate"  # 1234500 + 100000 = 1334500
-        initial = payment_amount - mbr_increase - min_balance
-        return initial
+        assert Txn.sender == self.upgrader, "must be upgrader"
+        assert not self.params.maybe()[1], "params not shared"
+        num_uint, _exists = op.AppParamsGet.app_global_num_uint(
+            Global.current_application_id
+        )
+        num_byte_slice, _exists = op.AppParamsGet.app_global_num_byte_slice(
+            Global.current_application_id
+        )
+        assert num_uint > 3 and num_byte_slice > 2, "schema has room for params"
+        arc4.emit(ParamsShared(params, arc4.UInt64(messenger_id)))
+        self.params.value = params.copy()
+        self.messenger_id.value = messenger_id
+
+    @arc4.abimethod
+    def enable_registry(self) -> None:
+        """
+        Record children created from now on in box registry by owner.
+        Creators pay for the boxes, upgrader for the registry box with
+        a payment preceding call. Can not be disabled.
+        """
+        assert Txn.sender == self.upgrader, "must be upgrader"
+        min_balance = get_min_balance()
+        self.registry.value = UInt64(1)
+        settle_mbr_payment(min_balance)
+
+    @arc4.abimethod(readonly=True)
+    def get_children(
+        self, owner: arc4.Address, offset: arc4.UInt64, limit: arc4.UInt64
+    ) -> tuple[UInt64, arc4.DynamicArray[ChildInfo]]:
+        """
+        Get page of children of owner in creation order.
+
+        Returns:
+        - number of children of owner
+        - app id, funder and creation round of children from offset,
+          at most limit, at most 21
+        """
+        count, children = get_paged(
+            b"c" + owner.bytes, offset.native, limit.native, UInt64(48), UInt64(21)
+        )
+        return count, arc4.DynamicArray[ChildInfo].from_bytes(
+            arc4.UInt16(children.length // 48).bytes + children
+        )
+
+    @subroutine
+    def register(
+        self, app_id: UInt64, owner: arc4.Address, funder: arc4.Address
+    ) -> None:
+        """
+        Record child in registry, in pages of 21 children, 1008 bytes.
+        """
+        append_paged(
+            b"c" + owner.bytes,
+            ChildInfo(arc4.UInt64(app_id), funder, arc4.UInt64(Global.round)).bytes,
+            UInt64(21),
+        )
+
+    @subroutine
+    def create_child(
+        self, owner: arc4.Address, funder: arc4.Address
+    ) -> tuple[Application, UInt64]:
+        """
+        Create child, record it when registry is enabled.
+
+        Returns:
+        - child app
+        - increase in factory min balance, derived by the avm from
+          the child extra pages and global schema and registry boxes
+        """
+        min_balance = get_min_balance()
+        shared = self.params.maybe()[1]
+        if shared:
+            compiled = compile_contract(
+                Airdrop, extra_program_pages=3, global_bytes=5
+            )  # without params
+        else:
+            compiled = compile_contract(Airdrop, extra_program_pages=3) # max extra pages
+        base_app = arc4.arc4_create(Airdrop, compiled=compiled).created_app
+        arc4.emit(FactoryCreated(arc4.UInt64(base_app.id)))
+        if self.registry:
+            self.register(base_app.id, owner, funder)
+        return base_app, get_min_balance() - min_balance
+
+    @subroutine
+    def settle_payment(self, payment_amount: UInt64, cost: UInt64) -> None:
+        """
+        Reject payment short of cost, refund excess to sender.
+        """
+        assert payment_amount >= cost, "payment amount accurate"
+        if payment_amount > cost:
+            itxn.Payment(
+                receiver=Txn.sender, amount=payment_amount - cost, fee=0
+            ).submit()
 
 
 ##################################################
@@ -1102,6 +1831,13 @@ class BaseFactory(Upgradeable):
 ##################################################
 
 
+class AirdropCreateArgs(arc4.Struct):
+    owner: arc4.Address
+    funder: arc4.Address
+    deadline: arc4.UInt64
+    initial: arc4.UInt64
+
+
 class AirdropFactory(BaseFactory):
     """
     Factory for airdrop requiring lockup period
@@ -1111,6 +1847,24 @@ class AirdropFactory(BaseFactory):
     def __init__(self) -> None:  # pragma: no cover
         super().__init__()
 
+    @arc4.abimethod
+    def share_params(self) -> None:
+        """
+        Share template parameters, children created from now on read
+        them from factory global state instead of storing a copy.
+        """
+        self.share(
+            Params(
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
+                arc4.UInt64(UInt64(0)),  # vesting delay
+                arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_SECONDS")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_COUNT")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_SECONDS")),
+            ),
+            TemplateVar[UInt64]("MESSENGER_ID"),
+        )
+
     @arc4.abimethod
     def create(
         self,
@@ -1132,43 +1886,96 @@ class AirdropFactory(BaseFactory):
         - app id
         """
         ##########################################
-        self.get_initial_payment()
+        payment_amount = require_payment(Txn.sender)
         ##########################################
-        compiled = compile_contract(Airdrop, extra_program_pages=3) # max extra pages
-        base_app = arc4.arc4_create(Airdrop, compiled=compiled).created_app
-        arc4.emit(FactoryCreated(arc4.UInt64(base_app.id)))
-        arc4.abi_call(
-            Airdrop.template,
-            arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
-            arc4.UInt64(UInt64(0)),  # vesting delay
-            arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
-            arc4.UInt64(TemplateVar[UInt64]("PERIOD_SECONDS")),
-            arc4.UInt64(TemplateVar[UInt64]("MESSENGER_ID")),
-            arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_COUNT")),
-            arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_SECONDS")),
-            arc4.UInt64(UInt64(0)),  # period
-            deadline,
-            arc4.UInt64(UInt64(0)),  # total
-            arc4.UInt64(UInt64(0)),  # funding
-            arc4.Address(Global.zero_address),  # delegate
-            app_id=base_app,
-        )
-        arc4.abi_call(  # inherit upgrader
-            Airdrop.grant_upgrader,
-            Global.creator_address,
-            app_id=base_app,
-        )
-        arc4.abi_call(  # inherit upgrader
-            Airdrop.grant_upgrader,
-            Global.creator_address,
-            app_id=base_app,
-        )
+        base_app, mbr_increase = self.create_child(owner, funder)
+        self.init_airdrop(base_app, owner, funder, deadline, initial)
+        self.settle_payment(payment_amount, mbr_increase + op.Global.min_balance)
+        return base_app.id
+
+    @arc4.abimethod
+    def create_many(
+        self, args: arc4.DynamicArray[AirdropCreateArgs]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Create airdrops from a single payment.
+
+        Arguments:
+        - args, owner, funder, deadline and initial of each airdrop
+
+        Returns:
+        - app ids
+        """
+        ##########################################
+        payment_amount = require_payment(Txn.sender)
+        assert args.length > 0, "args not empty"
+        ##########################################
+        app_ids = arc4.DynamicArray[arc4.UInt64]()
+        cost = UInt64(0)
+        for i in urange(args.length):
+            arg = args[i].copy()
+            base_app, mbr_increase = self.create_child(arg.owner, arg.funder)
+            self.init_airdrop(
+                base_app, arg.owner, arg.funder, arg.deadline, arg.initial
+            )
+            cost += mbr_increase + op.Global.min_balance
+            app_ids.append(arc4.UInt64(base_app.id))
+        self.settle_payment(payment_amount, cost)
+        return app_ids
+
+    @subroutine
+    def init_airdrop(
+        self,
+        base_app: Application,
+        owner: arc4.Address,
+        funder: arc4.Address,
+        deadline: arc4.UInt64,
+        initial: arc4.UInt64,
+    ) -> None:
+        """
+        Fund and initialize airdrop.
+        """
+        shared = self.params.maybe()[1]
         itxn.Payment(
             receiver=base_app.address, amount=op.Global.min_balance, fee=0  # 100000
         ).submit()
-        arc4.abi_call(  # setup(deployer, owner, funder, initial)
-            Airdrop.setup, Txn.sender, owner, funder, initial, app_id=base_app
-        )
+        if shared:
+            arc4.abi_call(  # emit Template, UpgraderGranted, Setup
+                Airdrop.init_shared,
+                arc4.UInt64(UInt64(0)),  # period
+                deadline,
+                arc4.UInt64(UInt64(0)),  # total
+                arc4.UInt64(UInt64(0)),  # funding
+                arc4.Address(Global.zero_address),  # delegate
+                Global.creator_address,  # inherit upgrader
+                Txn.sender,  # deployer
+                owner,
+                funder,
+                initial,
+                app_id=base_app,
+            )
+        else:
+            arc4.abi_call(  # emit Template, UpgraderGranted, Setup
+                Airdrop.init,
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
+                arc4.UInt64(UInt64(0)),  # vesting delay
+                arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_SECONDS")),
+                arc4.UInt64(TemplateVar[UInt64]("MESSENGER_ID")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_COUNT")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_SECONDS")),
+                arc4.UInt64(UInt64(0)),  # period
+                deadline,
+                arc4.UInt64(UInt64(0)),  # total
+                arc4.UInt64(UInt64(0)),  # funding
+                arc4.Address(Global.zero_address),  # delegate
+                Global.creator_address,  # inherit upgrader
+                Txn.sender,  # deployer
+                owner,
+                funder,
+                initial,
+                app_id=base_app,
+            )
         # configured by owner
         # funder
         #   fill
@@ -1177,7 +1984,6 @@ class AirdropFactory(BaseFactory):
         # lockup
         # done
         ##########################################
-        return base_app.id
 
     # TODO remove me later
     @arc4.abimethod
@@ -1193,6 +1999,14 @@ class AirdropFactory(BaseFactory):
 ##################################################
 
 
+class StakingCreateArgs(arc4.Struct):
+    owner: arc4.Address
+    funder: arc4.Address
+    delegate: arc4.Address
+    period: arc4.UInt64
+    initial: arc4.UInt64
+
+
 class StakingFactory(BaseFactory):
     def __init__(self) -> None:  # pragma: no cover
         """
@@ -1221,15 +2035,73 @@ class StakingFactory(BaseFactory):
         - app id
         """
         ##########################################
-        initial = self.get_initial_payment()
+        payment_amount = require_payment(Txn.sender)
+        ##########################################
+        base_app, mbr_increase = self.create_child(owner, funder)
+        # surplus is the initial balance of the child, not refunded
+        assert (
+            payment_amount >= mbr_increase + op.Global.min_balance
+        ), "payment amount accurate"
+        initial = payment_amount - mbr_increase - op.Global.min_balance
+        self.init_staking(base_app, owner, funder, delegate, period, initial)
+        return base_app.id
+
+    @arc4.abimethod
+    def create_many(
+        self, args: arc4.DynamicArray[StakingCreateArgs]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Create early stake rewards from a single payment.
+
+        Arguments:
+        - args, owner, funder, delegate, period and initial of each contract
+
+        Returns:
+        - app ids
+        """
+        ##########################################
+        payment_amount = require_payment(Txn.sender)
+        assert args.length > 0, "args not empty"
+        ##########################################
+        app_ids = arc4.DynamicArray[arc4.UInt64]()
+        cost = UInt64(0)
+        for i in urange(args.length):
+            arg = args[i].copy()
+            base_app, mbr_increase = self.create_child(arg.owner, arg.funder)
+            self.init_staking(
+                base_app,
+                arg.owner,
+                arg.funder,
+                arg.delegate,
+                arg.period,
+                arg.initial.native,
+            )
+            cost += mbr_increase + op.Global.min_balance + arg.initial.native
+            app_ids.append(arc4.UInt64(base_app.id))
+        self.settle_payment(payment_amount, cost)
+        return app_ids
+
+    @subroutine
+    def init_staking(
+        self,
+        base_app: Application,
+        owner: arc4.Address,
+        funder: arc4.Address,
+        delegate: arc4.Address,
+        period: arc4.UInt64,
+        initial: UInt64,
+    ) -> None:
+        """
+        Fund and initialize early stake reward.
+        """
         ##########################################
         assert period < 18, "period less than 18"
         ##########################################
-        compiled = compile_contract(Airdrop, extra_program_pages=3) # max extra pages
-        base_app = arc4.arc4_create(Airdrop, compiled=compiled).created_app
-        arc4.emit(FactoryCreated(arc4.UInt64(base_app.id)))
-        arc4.abi_call(  # emit Template
-            Airdrop.template,
+        itxn.Payment(
+            receiver=base_app.address, amount=initial + op.Global.min_balance, fee=0
+        ).submit()
+        arc4.abi_call(  # emit Template, UpgraderGranted, Setup
+            Airdrop.init,
             arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
             arc4.UInt64(TemplateVar[UInt64]("VESTING_DELAY")),
             arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
@@ -1242,19 +2114,8 @@ class StakingFactory(BaseFactory):
             initial,  # total
             arc4.UInt64(UInt64(0)),  # funding
             delegate,
-            app_id=base_app,
-        )
-        arc4.abi_call(  # inherit upgrader
-            Airdrop.grant_upgrader,
-            Global.creator_address,
-            app_id=base_app,
-        )
-        itxn.Payment(
-            receiver=base_app.address, amount=initial + op.Global.min_balance, fee=0
-        ).submit()
-        arc4.abi_call(  # emit Setup(deployer, owner, funder, inttial)
-            Airdrop.setup,
-            Txn.sender,
+            Global.creator_address,  # inherit upgrader
+            Txn.sender,  # deployer
             owner,
             funder,
             initial,
@@ -1266,7 +2127,6 @@ class StakingFactory(BaseFactory):
         #   withdraw, participate
         # close
         #########################################
-        return base_app.id
 
 
 ##################################################
@@ -1274,6 +2134,11 @@ class StakingFactory(BaseFactory):
 ##################################################
 
 
+class CompensationCreateArgs(arc4.Struct):
+    owner: arc4.Address
+    initial: arc4.UInt64
+
+
 class CompensationFactory(BaseFactory):
     def __init__(self) -> None:  # pragma: no cover
         """
@@ -1281,6 +2146,24 @@ class CompensationFactory(BaseFactory):
         """
         super().__init__()
 
+    @arc4.abimethod
+    def share_params(self) -> None:
+        """
+        Share template parameters, children created from now on read
+        them from factory global state instead of storing a copy.
+        """
+        self.share(
+            Params(
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
+                arc4.UInt64(UInt64(0)),  # vesting delay
+                arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_SECONDS")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_COUNT")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_SECONDS")),
+            ),
+            TemplateVar[UInt64]("MESSENGER_ID"),
+        )
+
     @arc4.abimethod
     def create(
         self,
@@ -1297,7 +2180,54 @@ class CompensationFactory(BaseFactory):
         - app id
         """
         ##########################################
-        initial = self.get_initial_payment()
+        payment_amount = require_payment(Txn.sender)
+        ##########################################
+        base_app, mbr_increase = self.create_child(owner, arc4.Address(Txn.sender))
+        # surplus is the initial balance of the child, not refunded
+        assert (
+            payment_amount >= mbr_increase + op.Global.min_balance
+        ), "payment amount accurate"
+        initial = payment_amount - mbr_increase - op.Global.min_balance
+        self.init_compensation(base_app, owner, initial)
+        return base_app.id
+
+    @arc4.abimethod
+    def create_many(
+        self, args: arc4.DynamicArray[CompensationCreateArgs]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Create compensation contracts from a single payment.
+
+        Arguments:
+        - args, owner and initial of each contract
+
+        Returns:
+        - app ids
+        """
+        ##########################################
+        payment_amount = require_payment(Txn.sender)
+        assert args.length > 0, "args not empty"
+        ##########################################
+        app_ids = arc4.DynamicArray[arc4.UInt64]()
+        cost = UInt64(0)
+        for i in urange(args.length):
+            arg = args[i].copy()
+            base_app, mbr_increase = self.create_child(
+                arg.owner, arc4.Address(Txn.sender)
+            )
+            self.init_compensation(base_app, arg.owner, arg.initial.native)
+            cost += mbr_increase + op.Global.min_balance + arg.initial.native
+            app_ids.append(arc4.UInt64(base_app.id))
+        self.settle_payment(payment_amount, cost)
+        return app_ids
+
+    @subroutine
+    def init_compensation(
+        self, base_app: Application, owner: arc4.Address, initial: UInt64
+    ) -> None:
+        """
+        Fund and initialize compensation contract.
+        """
         ##########################################
         # total, payment amount
         # period, 0 (no lockup)
@@ -1307,43 +2237,48 @@ class CompensationFactory(BaseFactory):
         # owner arg
         # funder Sender
         ##########################################
-        compiled = compile_contract(Airdrop, extra_program_pages=3) # max extra pages
-        base_app = arc4.arc4_create(Airdrop, compiled=compiled).created_app
-        arc4.emit(FactoryCreated(arc4.UInt64(base_app.id)))
-        arc4.abi_call(  # emit Template
-            Airdrop.template,
-            arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
-            arc4.UInt64(UInt64(0)),  # vesting delay
-            arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
-            arc4.UInt64(TemplateVar[UInt64]("PERIOD_SECONDS")),
-            arc4.UInt64(TemplateVar[UInt64]("MESSENGER_ID")),
-            arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_COUNT")),
-            arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_SECONDS")),
-            arc4.UInt64(UInt64(0)),  # period
-            Global.latest_timestamp,  # deadline
-            initial,  # total
-            Global.latest_timestamp,  # funding
-            Global.zero_address, # delegate
-            app_id=base_app,
-        )
-        arc4.abi_call(  # inherit upgrader
-            Airdrop.grant_upgrader,
-            Global.creator_address,
-            app_id=base_app,
-        )
+        shared = self.params.maybe()[1]
         itxn.Payment(
             receiver=base_app.address, amount=initial + op.Global.min_balance, fee=0
         ).submit()
-        arc4.abi_call(  # emit Setup(Txn.sender, owner, Txn.sender, initial)
-            Airdrop.setup,
-            Txn.sender,  # deployer
-            owner,  # owner
-            Txn.sender,  # funder
-            initial,  # initial
-            app_id=base_app,
-        )
+        if shared:
+            arc4.abi_call(  # emit Template, UpgraderGranted, Setup
+                Airdrop.init_shared,
+                arc4.UInt64(UInt64(0)),  # period
+                Global.latest_timestamp,  # deadline
+                initial,  # total
+                Global.latest_timestamp,  # funding
+                Global.zero_address, # delegate
+                Global.creator_address,  # inherit upgrader
+                Txn.sender,  # deployer
+                owner,  # owner
+                Txn.sender,  # funder
+                initial,  # initial
+                app_id=base_app,
+            )
+        else:
+            arc4.abi_call(  # emit Template, UpgraderGranted, Setup
+                Airdrop.init,
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_LIMIT")),
+                arc4.UInt64(UInt64(0)),  # vesting delay
+                arc4.UInt64(TemplateVar[UInt64]("LOCKUP_DELAY")),
+                arc4.UInt64(TemplateVar[UInt64]("PERIOD_SECONDS")),
+                arc4.UInt64(TemplateVar[UInt64]("MESSENGER_ID")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_COUNT")),
+                arc4.UInt64(TemplateVar[UInt64]("DISTRIBUTION_SECONDS")),
+                arc4.UInt64(UInt64(0)),  # period
+                Global.latest_timestamp,  # deadline
+                initial,  # total
+                Global.latest_timestamp,  # funding
+                Global.zero_address, # delegate
+                Global.creator_address,  # inherit upgrader
+                Txn.sender,  # deployer
+                owner,  # owner
+                Txn.sender,  # funder
+                initial,  # initial
+                app_id=base_app,
+            )
         # vesting
         #   withdraw, participate
         # close
         #########################################
-        return base_app.id
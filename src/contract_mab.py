@@ -2,36 +2,52 @@ from algopy import UInt64, subroutine
 
 
 ##############################################
-# function: calculate_mab_pure (internal)
+# function: calculate_fully_vested (internal)
 # arguments:
-# - now, timestamp
 # - vesting_delay, how many periods in vesting
 # - period_seconds, how many seconds in period
 # - lockup delay, how many period in lockup
 # - period, how many periods
 # - funding, when funded
+# purpose: calculate when fully vested, fixed
+#   once funding is set since period can no
+#   longer be configured
+# returns' fully vested timestamp
+##############################################
+@subroutine
+def calculate_fully_vested(
+    vesting_delay: UInt64,
+    period_seconds: UInt64,
+    lockup_delay: UInt64,
+    period: UInt64,
+    funding: UInt64,
+) -> UInt64:
+    lockup_periods = lockup_delay * period
+    lockup_seconds = lockup_periods * period_seconds
+    vesting_seconds = vesting_delay * period_seconds
+    return funding + vesting_seconds + lockup_seconds
+
+
+##############################################
+# function: calculate_mab_vested (internal)
+# arguments:
+# - now, timestamp
+# - fully_vested, when fully vested
 # - total, how much funded
 # - distribution_count, how many periods in distribution
 # - distribution_seconds, how many seconds in distribution
 # purpose: calculate minimum allowable balance
+#   from a precomputed fully vested timestamp
 # returns' minimum allowable balance
 ##############################################
 @subroutine
-def calculate_mab_pure(
+def calculate_mab_vested(
     now: UInt64,
-    vesting_delay: UInt64,
-    period_seconds: UInt64,
-    lockup_delay: UInt64,
-    period: UInt64,
-    funding: UInt64,
+    fully_vested: UInt64,
     total: UInt64,
     distribution_count: UInt64,
     distribution_seconds: UInt64,
 ) -> UInt64:
-    lockup_periods = lockup_delay * period
-    lockup_seconds = lockup_periods * period_seconds
-    vesting_seconds = vesting_delay * period_seconds
-    fully_vested = funding + vesting_seconds + lockup_seconds
     locked_up = now <= fully_vested
     if locked_up:
         return total
@@ -43,3 +59,67 @@ def calculate_mab_pure(
             ) // distribution_count
         else:
             return UInt64(0)
+
+
+##############################################
+# function: calculate_mab_pure (internal)
+# arguments:
+# - now, timestamp
+# - vesting_delay, how many periods in vesting
+# - period_seconds, how many seconds in period
+# - lockup delay, how many period in lockup
+# - period, how many periods
+# - funding, when funded
+# - total, how much funded
+# - distribution_count, how many periods in distribution
+# - distribution_seconds, how many seconds in distribution
+# purpose: calculate minimum allowable balance
+# returns' minimum allowable balance
+##############################################
+@subroutine
+def calculate_mab_pure(
+    now: UInt64,
+    vesting_delay: UInt64,
+    period_seconds: UInt64,
+    lockup_delay: UInt64,
+    period: UInt64,
+    funding: UInt64,
+    total: UInt64,
+    distribution_count: UInt64,
+    distribution_seconds: UInt64,
+) -> UInt64:
+    fully_vested = calculate_fully_vested(
+        vesting_delay, period_seconds, lockup_delay, period, funding
+    )
+    return calculate_mab_vested(
+        now, fully_vested, total, distribution_count, distribution_seconds
+    )
+
+
+##############################################
+# function: calculate_next_unlock (internal)
+# arguments: same as calculate_mab_vested
+# purpose: calculate first timestamp after now
+#   at which minimum allowable balance
+#   decreases, skips installments that leave
+#   it unchanged due to floor division
+# returns' timestamp, 0 if it no longer
+#   decreases
+##############################################
+@subroutine
+def calculate_next_unlock(
+    now: UInt64,
+    fully_vested: UInt64,
+    total: UInt64,
+    distribution_count: UInt64,
+    distribution_seconds: UInt64,
+) -> UInt64:
+    mab = calculate_mab_vested(
+        now, fully_vested, total, distribution_count, distribution_seconds
+    )
+    if mab == 0:
+        return UInt64(0)
+    else:
+        remaining_periods = (mab * distribution_count + total - 1) // total
+        elapsed_periods = distribution_count + 1 - remaining_periods
+        return fully_vested + elapsed_periods * distribution_seconds
@@ -0,0 +1,250 @@
+import argparse
+import csv
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator
+from algosdk import abi, transaction
+from algosdk.logic import get_application_address
+from src.bulk import (
+    ClientPool,
+    Item,
+    Outcome,
+    ParamsCache,
+    Submitter,
+    get_account_from_env,
+    get_indexer_from_env,
+    get_params,
+    get_signer,
+    pack_groups,
+)
+
+fill_columns = ["app_id", "amount"]
+# parent_id of children of a factory sharing params, read by set_funding
+optional_fill_columns = ["parent_id"]
+
+# abi selectors, computed once
+fill_selector = abi.Method.from_signature("fill()void").get_selector()
+set_funding_selector = abi.Method.from_signature(
+    "set_funding(uint64)void"
+).get_selector()
+
+
+@dataclass(frozen=True)
+class Fill:
+    app_id: int
+    amount: int
+    parent_id: int = 0
+
+
+def get_item(sender: str, fill: Fill, funding: int | None = None) -> Item:
+    """
+    Payment of fill.amount and fill call of funder sender on fill.app_id,
+    followed by set_funding if funding is given, referencing fill.parent_id
+    if given for params shared by the factory.
+    """
+
+    def txns(params: transaction.SuggestedParams):
+        call_params = get_params(params, params.min_fee)
+        txns = [
+            transaction.PaymentTxn(
+                sender,
+                call_params,
+                get_application_address(fill.app_id),
+                fill.amount,
+            ),
+            transaction.ApplicationNoOpTxn(
+                sender, call_params, fill.app_id, [fill_selector]
+            ),
+        ]
+        if funding is not None:
+            txns.append(
+                transaction.ApplicationNoOpTxn(
+                    sender,
+                    call_params,
+                    fill.app_id,
+                    [set_funding_selector, funding.to_bytes(8, "big")],
+                    foreign_apps=[fill.parent_id] if fill.parent_id else None,
+                )
+            )
+        return txns
+
+    return Item(fill.app_id, 2 if funding is None else 3, txns)
+
+
+def load_fills_csv(csv_file_path: str) -> Iterator[Fill]:
+    """
+    Read fills one row at a time, columns fill_columns and optionally
+    optional_fill_columns, one row per app.
+    """
+    with open(csv_file_path, newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            yield Fill(
+                int(row["app_id"]),
+                int(row["amount"]),
+                int(row.get("parent_id") or 0),
+            )
+
+
+class Journal:
+    """
+    Append only json lines record of sent groups and outcomes, each line
+    flushed to disk before the group is sent.
+
+    - {"sent": [app ids], "txid": ..., "last_valid_round": ...}
+    - {"key": app id, "confirmed": ..., "txid": ..., ...}, see Outcome
+
+    A truncated last line from a crash is ignored.
+    """
+
+    def __init__(self, journal_file_path: str):
+        self.lock = threading.Lock()
+        self.confirmed = set()
+        self.sent = []
+        line = "\n"
+        if os.path.exists(journal_file_path):
+            with open(journal_file_path) as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "sent" in record:
+                        self.sent.append(record)
+                    elif record.get("confirmed"):
+                        self.confirmed.add(record["key"])
+        self.journal_file = open(journal_file_path, "a")
+        if not line.endswith("\n"):
+            # terminate the truncated line
+            self.journal_file.write("\n")
+
+    def close(self):
+        self.journal_file.close()
+
+    def write(self, record: dict):
+        with self.lock:
+            self.journal_file.write(json.dumps(record) + "\n")
+            self.journal_file.flush()
+            os.fsync(self.journal_file.fileno())
+
+    def on_send(self, group: list, txid: str, last_valid_round: int):
+        self.write(
+            {
+                "sent": [item.key for item in group],
+                "txid": txid,
+                "last_valid_round": last_valid_round,
+            }
+        )
+
+    def record(self, outcome: Outcome):
+        self.write(asdict(outcome))
+        if outcome.confirmed:
+            self.confirmed.add(outcome.key)
+
+    def recover(self, submitter: Submitter) -> Iterator[Outcome]:
+        """
+        Resolve groups sent before a restart without a confirmed outcome,
+        waiting for them to expire and looking them up in indexer, so they
+        are not filled twice. Yields outcomes of those found confirmed.
+        """
+        for record in self.sent:
+            keys = [key for key in record["sent"] if key not in self.confirmed]
+            if not keys:
+                continue
+            confirmed_round = submitter.get_confirmed_round(
+                record["txid"], record["last_valid_round"]
+            )
+            if confirmed_round is None:
+                continue
+            for key in keys:
+                outcome = Outcome(key, True, record["txid"], confirmed_round)
+                self.record(outcome)
+                yield outcome
+        self.sent = []
+
+
+def fund(
+    submitter: Submitter,
+    journal: Journal,
+    sender: str,
+    fills: Iterable[Fill],
+    funding: int | None = None,
+    max_in_flight: int = 64,
+):
+    """
+    Fill and optionally set funding of every app in fills not yet
+    confirmed in journal, in full groups submitted concurrently. Yields
+    one outcome per app.
+    """
+    submitter.on_send = journal.on_send
+    yield from journal.recover(submitter)
+    items = (
+        get_item(sender, fill, funding)
+        for fill in fills
+        if fill.app_id not in journal.confirmed
+    )
+    for outcomes in submitter.run(pack_groups(items), max_in_flight):
+        for outcome in outcomes:
+            journal.record(outcome)
+            yield outcome
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Fill and set funding of many contracts as funder."
+    )
+    parser.add_argument(
+        "fills_file",
+        help=f"csv with {', '.join(fill_columns)}, "
+        f"optionally {', '.join(optional_fill_columns)}",
+    )
+    parser.add_argument(
+        "--funding", type=int, help="funding timestamp, set_funding when given"
+    )
+    parser.add_argument(
+        "--journal-file",
+        default="funder.jsonl",
+        help="rerun with the same journal to resume",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--wait-rounds", type=int, default=10)
+    parser.add_argument(
+        "--validity-rounds",
+        type=int,
+        default=100,
+        help="bounds how long a resume waits on groups sent before a crash",
+    )
+    parser.add_argument("--algod-servers", nargs="+", help="default: ALGOD_SERVER")
+    parser.add_argument("--indexer-server", help="default: INDEXER_SERVER")
+    args = parser.parse_args(argv)
+    sender, private_key = get_account_from_env()
+    pool = ClientPool.from_env(args.max_in_flight, args.algod_servers)
+    submitter = Submitter(
+        pool,
+        get_signer(private_key),
+        get_indexer_from_env(args.indexer_server),
+        ParamsCache(pool, validity_rounds=args.validity_rounds),
+        retries=args.retries,
+        wait_rounds=args.wait_rounds,
+    )
+    journal = Journal(args.journal_file)
+    failed = 0
+    try:
+        for outcome in fund(
+            submitter,
+            journal,
+            sender,
+            load_fills_csv(args.fills_file),
+            args.funding,
+            args.max_in_flight,
+        ):
+            failed += not outcome.confirmed
+    finally:
+        journal.close()
+    print(f"{failed} failed, see {args.journal_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import base64
+import csv
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+from algosdk import abi, transaction
+from algosdk.logic import get_application_address
+from src.bulk import (
+    ClientPool,
+    Item,
+    Submitter,
+    get_account_from_env,
+    get_indexer_from_env,
+    get_params,
+    get_signer,
+    pack_groups,
+)
+
+partkey_columns = [
+    "app_id",
+    "vote_key",
+    "selection_key",
+    "vote_first",
+    "vote_last",
+    "vote_key_dilution",
+    "state_proof_key",
+]
+
+participate_args = "byte[32],byte[32],uint64,uint64,uint64,byte[64]"
+
+# abi selectors, computed once
+participate_selector = abi.Method.from_signature(
+    f"participate({participate_args})void"
+).get_selector()
+participate_pooled_selector = abi.Method.from_signature(
+    f"participate_pooled({participate_args})void"
+).get_selector()
+
+
+@dataclass(frozen=True)
+class PartKey:
+    """
+    Participation key of one contract, see PartKeyInfo in contract.py.
+    """
+
+    app_id: int
+    vote_key: bytes
+    selection_key: bytes
+    vote_first: int
+    vote_last: int
+    vote_key_dilution: int
+    state_proof_key: bytes
+
+
+def get_app_args(partkey: PartKey, selector: bytes = participate_selector):
+    """
+    Abi encoded participate call arguments.
+    """
+    if len(partkey.vote_key) != 32 or len(partkey.selection_key) != 32:
+        raise ValueError(f"app {partkey.app_id} vote and selection keys are 32 bytes")
+    if len(partkey.state_proof_key) != 64:
+        raise ValueError(f"app {partkey.app_id} state proof key is 64 bytes")
+    return [
+        selector,
+        partkey.vote_key,
+        partkey.selection_key,
+        partkey.vote_first.to_bytes(8, "big"),
+        partkey.vote_last.to_bytes(8, "big"),
+        partkey.vote_key_dilution.to_bytes(8, "big"),
+        partkey.state_proof_key,
+    ]
+
+
+def get_item(sender: str, partkey: PartKey, pooled: bool = False) -> Item:
+    """
+    Participate call of sender on partkey.app_id, paired with the min fee
+    payment participate requires, or alone with the key registration fee
+    pooled into the app call fee for participate_pooled.
+    """
+    app_args = get_app_args(
+        partkey, participate_pooled_selector if pooled else participate_selector
+    )
+
+    def txns(params: transaction.SuggestedParams):
+        call = transaction.ApplicationNoOpTxn(
+            sender,
+            get_params(params, params.min_fee * (2 if pooled else 1)),
+            partkey.app_id,
+            app_args,
+        )
+        if pooled:
+            return [call]
+        payment = transaction.PaymentTxn(
+            sender,
+            get_params(params, params.min_fee),
+            get_application_address(partkey.app_id),
+            params.min_fee,
+        )
+        return [payment, call]
+
+    return Item(partkey.app_id, 1 if pooled else 2, txns)
+
+
+def load_partkeys_csv(csv_file_path: str) -> Iterator[PartKey]:
+    """
+    Read participation keys, one contract per row, columns partkey_columns
+    with keys base64 encoded.
+    """
+    with open(csv_file_path, newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            yield PartKey(
+                int(row["app_id"]),
+                base64.b64decode(row["vote_key"]),
+                base64.b64decode(row["selection_key"]),
+                int(row["vote_first"]),
+                int(row["vote_last"]),
+                int(row["vote_key_dilution"]),
+                base64.b64decode(row["state_proof_key"]),
+            )
+
+
+def register_keys(
+    submitter: Submitter,
+    sender: str,
+    partkeys: Iterable[PartKey],
+    pooled: bool = False,
+    max_in_flight: int = 8,
+):
+    """
+    Register partkeys in full groups submitted concurrently, yields one
+    outcome per app.
+    """
+    groups = pack_groups(get_item(sender, partkey, pooled) for partkey in partkeys)
+    for outcomes in submitter.run(groups, max_in_flight):
+        yield from outcomes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Register participation keys of many contracts as delegate or owner."
+    )
+    parser.add_argument("partkeys_file", help=f"csv with {', '.join(partkey_columns)}")
+    parser.add_argument(
+        "--pooled",
+        action="store_true",
+        help="call participate_pooled, one transaction per app",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--wait-rounds", type=int, default=10)
+    parser.add_argument("--algod-servers", nargs="+", help="default: ALGOD_SERVER")
+    parser.add_argument("--indexer-server", help="default: INDEXER_SERVER")
+    parser.add_argument("--csv-file", default="keyreg.csv")
+    args = parser.parse_args(argv)
+    sender, private_key = get_account_from_env()
+    pool = ClientPool.from_env(args.max_in_flight, args.algod_servers)
+    submitter = Submitter(
+        pool,
+        get_signer(private_key),
+        get_indexer_from_env(args.indexer_server),
+        retries=args.retries,
+        wait_rounds=args.wait_rounds,
+    )
+    failed = 0
+    with open(args.csv_file, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["app_id", "confirmed", "txid", "confirmed_round", "error"])
+        for outcome in register_keys(
+            submitter,
+            sender,
+            load_partkeys_csv(args.partkeys_file),
+            args.pooled,
+            args.max_in_flight,
+        ):
+            failed += not outcome.confirmed
+            writer.writerow(
+                [
+                    outcome.key,
+                    outcome.confirmed,
+                    outcome.txid,
+                    outcome.confirmed_round,
+                    outcome.error,
+                ]
+            )
+    print(f"{failed} failed, see {args.csv_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,138 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
+    "template_shared(uint64,uint64,uint64,uint64,address)void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      },
+      "structs": {
+        "output": {
+          "name": "AirdropState",
+          "elements": [
+            [
+              "owner",
+              "address"
+            ],
+            [
+              "funder",
+              "address"
+            ],
+            [
+              "delegate",
+              "address"
+            ],
+            [
+              "deployer",
+              "address"
+            ],
+            [
+              "upgrader",
+              "address"
+            ],
+            [
+              "parent_id",
+              "uint64"
+            ],
+            [
+              "messenger_id",
+              "uint64"
+            ],
+            [
+              "period_limit",
+              "uint64"
+            ],
+            [
+              "vesting_delay",
+              "uint64"
+            ],
+            [
+              "lockup_delay",
+              "uint64"
+            ],
+            [
+              "period_seconds",
+              "uint64"
+            ],
+            [
+              "distribution_count",
+              "uint64"
+            ],
+            [
+              "distribution_seconds",
+              "uint64"
+            ],
+            [
+              "period",
+              "uint64"
+            ],
+            [
+              "deadline",
+              "uint64"
+            ],
+            [
+              "total",
+              "uint64"
+            ],
+            [
+              "funding",
+              "uint64"
+            ],
+            [
+              "initial",
+              "uint64"
+            ],
+            [
+              "fully_vested",
+              "uint64"
+            ],
+            [
+              "contract_version",
+              "uint64"
+            ],
+            [
+              "deployment_version",
+              "uint64"
+            ],
+            [
+              "updatable",
+              "bool"
+            ],
+            [
+              "stakeable",
+              "bool"
+            ],
+            [
+              "balance",
+              "uint64"
+            ],
+            [
+              "min_balance",
+              "uint64"
+            ],
+            [
+              "available_balance",
+              "uint64"
+            ]
+          ]
+        }
+      }
+    },
     "abort_funding()void": {
       "call_config": {
         "delete_application": "CALL"
@@ -56,11 +188,33 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
+    "set_funding(uint64)void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "withdraw(uint64)uint64": {
       "call_config": {
         "no_op": "CALL"
       }
     },
+    "withdraw_max()(uint64,uint64)": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "mab_at(uint64)uint64": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "next_unlock(uint64)(uint64,uint64)": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "close()void": {
       "call_config": {
         "delete_application": "CALL"
@@ -81,22 +235,22 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
-    "set_funding(uint64)void": {
+    "reduce_total(uint64)void": {
       "call_config": {
         "no_op": "CALL"
       }
     },
-    "reduce_total(uint64)void": {
+    "set_delegate(address)void": {
       "call_config": {
         "no_op": "CALL"
       }
     },
-    "set_delegate(address)void": {
+    "participate(byte[32],byte[32],uint64,uint64,uint64,byte[64])void": {
       "call_config": {
         "no_op": "CALL"
       }
     },
-    "participate(byte[32],byte[32],uint64,uint64,uint64,byte[64])void": {
+    "participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void": {
       "call_config": {
         "no_op": "CALL"
       }
@@ -118,13 +272,13 @@ export const APP_SPEC: AppSpec = {
     }
   },
   "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcC5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkxNC05MTYKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AyMwogICAgbWV0aG9kICJ0ZW1wbGF0ZSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAiYWJvcnRfZnVuZGluZygpdm9pZCIKICAgIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgbWV0aG9kICJzZXR1cChhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiY29uZmlndXJlKHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdWludDY0IgogICAgbWV0aG9kICJjbG9zZSgpdm9pZCIKICAgIG1ldGhvZCAidHJhbnNmZXIoYWRkcmVzcyl2b2lkIgogICAgbWV0aG9kICJmaWxsKCl2b2lkIgogICAgbWV0aG9kICJncmFudF9mdW5kZXIoYWRkcmVzcyl2b2lkIgogICAgbWV0aG9kICJzZXRfZnVuZGluZyh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAicmVkdWNlX3RvdGFsKHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJzZXRfZGVsZWdhdGUoYWRkcmVzcyl2b2lkIgogICAgbWV0aG9kICJwYXJ0aWNpcGF0ZShieXRlWzMyXSxieXRlWzMyXSx1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzY0XSl2b2lkIgogICAgbWV0aG9kICJzZXRfdmVyc2lvbih1aW50NjQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgImFwcHJvdmVfdXBkYXRlKGJvb2wpdm9pZCIKICAgIG1ldGhvZCAiZ3JhbnRfdXBncmFkZXIoYWRkcmVzcyl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl90ZW1wbGF0ZV9yb3V0ZUA0IG1haW5fYWJvcnRfZnVuZGluZ19yb3V0ZUA1IG1haW5fdXBkYXRlX3JvdXRlQDYgbWFpbl9zZXR1cF9yb3V0ZUA3IG1haW5fY29uZmlndXJlX3JvdXRlQDggbWFpbl93aXRoZHJhd19yb3V0ZUA5IG1haW5fY2xvc2Vfcm91dGVAMTAgbWFpbl90cmFuc2Zlcl9yb3V0ZUAxMSBtYWluX2ZpbGxfcm91dGVAMTIgbWFpbl9ncmFudF9mdW5kZXJfcm91dGVAMTMgbWFpbl9zZXRfZnVuZGluZ19yb3V0ZUAxNCBtYWluX3JlZHVjZV90b3RhbF9yb3V0ZUAxNSBtYWluX3NldF9kZWxlZ2F0ZV9yb3V0ZUAxNiBtYWluX3BhcnRpY2lwYXRlX3JvdXRlQDE3IG1haW5fc2V0X3ZlcnNpb25fcm91dGVAMTggbWFpbl9hcHByb3ZlX3VwZGF0ZV9yb3V0ZUAxOSBtYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDIwCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX3RlbXBsYXRlX3JvdXRlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk0OC05NDkKICAgIC8vICMgaW1wbGVtZW50cyBsb2NrYWJsZSB0ZW1wbGF0ZSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MTQtOTE2CiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk0OC05NDkKICAgIC8vICMgaW1wbGVtZW50cyBsb2NrYWJsZSB0ZW1wbGF0ZSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB0ZW1wbGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9hYm9ydF9mdW5kaW5nX3JvdXRlQDU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMjQtMTAyNgogICAgLy8gIyBvdmVycmlkZSBmdW5kYWJsZSBhYm9ydF9mdW5kaW5nIGFiaW1ldGhvZAogICAgLy8gIyAgIGNsb3NlIG9mZmxpbmUgb24gZGVsZXRlIHRvIG93bmVyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBhYm9ydF9mdW5kaW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZV9yb3V0ZUA2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0dXBfcm91dGVANzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzEyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzZXR1cAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jb25maWd1cmVfcm91dGVAODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzMyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjb25maWd1cmUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVAOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzQ3LTc2NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXcKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGFtb3VudAogICAgLy8gIyByZXR1cm5zOiBtaW4gYmFsYW5jZQogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGZ1bmRzIGZyb20gY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IG93bmVyCiAgICAvLyAjIC0gbGV0IGJhbGFuY2UgYmUgdGhlIGN1cnJlbnQgYmFsYW5jZSBvZiB0aGUKICAgIC8vICMgICBjb250cmFjdAogICAgLy8gIyAtIGJhbGFuY2UgLSBhbW91bnQgPj0gbWluX2JhbGFuY2UKICAgIC8vICMgICAoZmVlIHBhaWQgaW4gYXBwbCB0eG4pCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0cmFuc2ZlciBhbW91bnQgZnJvbSB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyAgIHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOiBjb3N0cyAyIGZlZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MTQtOTE2CiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc0Ny03NjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHdpdGhkcmF3CiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBhbW91bnQKICAgIC8vICMgcmV0dXJuczogbWluIGJhbGFuY2UKICAgIC8vICMgcHVycG9zZTogZXh0cmFjdCBmdW5kcyBmcm9tIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSBvd25lcgogICAgLy8gIyAtIGxldCBiYWxhbmNlIGJlIHRoZSBjdXJyZW50IGJhbGFuY2Ugb2YgdGhlCiAgICAvLyAjICAgY29udHJhY3QKICAgIC8vICMgLSBiYWxhbmNlIC0gYW1vdW50ID49IG1pbl9iYWxhbmNlCiAgICAvLyAjICAgKGZlZSBwYWlkIGluIGFwcGwgdHhuKQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdHJhbnNmZXIgYW1vdW50IGZyb20gdGhlIGNvbnRyYWN0IGFjY291bnQKICAgIC8vICMgICB0byBvd25lcgogICAgLy8gIyBub3RlczogY29zdHMgMiBmZWVzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgd2l0aGRyYXcKICAgIGl0b2IKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY2xvc2Vfcm91dGVAMTA6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc4OS04MDEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNsb3NlCiAgICAvLyAjIHB1cnBvc2U6IGRlbGV0ZXMgY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gbWluIGJhbGFuY2UgaXMgMAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gY29udHJhY3QgaXMgZGVsZXRlZAogICAgLy8gIyAtIGFjY291bnQgY2xvc2VkIG91dCB0byBvd25lciBpZiBpdCBoYXMgYSBiYWxhbmNlCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIHNob3VsZCBiZSBhbGxlZCB3aXRoIG9uQ29tcGxldGlvbgogICAgLy8gIyAgIGRlbGV0ZUFwcGxpY2F0aW9uCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBjbG9zZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl90cmFuc2Zlcl9yb3V0ZUAxMToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MTQtOTE2CiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgdHJhbnNmZXIKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZmlsbF9yb3V0ZUAxMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZmlsbAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9ncmFudF9mdW5kZXJfcm91dGVAMTM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkxNC05MTYKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgZ3JhbnRfZnVuZGVyCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF9mdW5kaW5nX3JvdXRlQDE0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MTQtOTE2CiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9mdW5kaW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3JlZHVjZV90b3RhbF9yb3V0ZUAxNToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZWR1Y2VfdG90YWwKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X2RlbGVnYXRlX3JvdXRlQDE2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyOTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MTQtOTE2CiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9kZWxlZ2F0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9wYXJ0aWNpcGF0ZV9yb3V0ZUAxNzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Mjk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyOTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwYXJ0aWNpcGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUAxODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzZXRfdmVyc2lvbgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX3VwZGF0ZV9yb3V0ZUAxOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhcHByb3ZlX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUAyMDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBncmFudF91cGdyYWRlcgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMjM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkxNC05MTYKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIGludCAwCiAgICBpbnQgNAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgbWF0Y2ggbWFpbl9vbl9jcmVhdGVAMjQgbWFpbl9vbl91cGRhdGVAMjUKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fb25fY3JlYXRlQDI0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MTYKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTE2LTUxNwogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIG9uX2NyZWF0ZShzZWxmKSAtPiBOb25lOgogICAgY2FsbHN1YiBvbl9jcmVhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fb25fdXBkYXRlQDI1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjYKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjYtNDY3CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgY2FsbHN1YiBvbl91cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzcmMuY29udHJhY3QuQWlyZHJvcC50ZW1wbGF0ZShwZXJpb2RfbGltaXQ6IGJ5dGVzLCB2ZXN0aW5nX2RlbGF5OiBieXRlcywgbG9ja3VwX2RlbGF5OiBieXRlcywgcGVyaW9kX3NlY29uZHM6IGJ5dGVzLCBtZXNzZW5nZXJfaWQ6IGJ5dGVzLCBkaXN0cmlidXRpb25fY291bnQ6IGJ5dGVzLCBkaXN0cmlidXRpb25fc2Vjb25kczogYnl0ZXMsIHBlcmlvZDogYnl0ZXMsIGRlYWRsaW5lOiBieXRlcywgdG90YWw6IGJ5dGVzLCBmdW5kaW5nOiBieXRlcywgZGVsZWdhdGU6IGJ5dGVzKSAtPiB2b2lkOgp0ZW1wbGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTQ4LTk2NAogICAgLy8gIyBpbXBsZW1lbnRzIGxvY2thYmxlIHRlbXBsYXRlIG1ldGhvZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgdGVtcGxhdGUoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBwZXJpb2RfbGltaXQ6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHZlc3RpbmdfZGVsYXk6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGxvY2t1cF9kZWxheTogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgcGVyaW9kX3NlY29uZHM6IGFyYzQuVUludDY0LAogICAgLy8gICAgIG1lc3Nlbmdlcl9pZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2NvdW50OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fc2Vjb25kczogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgcGVyaW9kOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBkZWFkbGluZTogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdG90YWw6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGZ1bmRpbmc6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGRlbGVnYXRlOiBhcmM0LkFkZHJlc3MsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAxMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk2OC05NjkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIm11c3QgYmUgY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGNyZWF0b3IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTcwCiAgICAvLyBhc3NlcnQgc2VsZi5wZXJpb2RfbGltaXQgPT0gVUludDY0KDApLCAicGVyaW9kIGxpbWl0IG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4OQogICAgLy8gc2VsZi5wZXJpb2RfbGltaXQgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJwZXJpb2RfbGltaXQiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk3MAogICAgLy8gYXNzZXJ0IHNlbGYucGVyaW9kX2xpbWl0ID09IFVJbnQ2NCgwKSwgInBlcmlvZCBsaW1pdCBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVyaW9kX2xpbWl0IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIHBlcmlvZCBsaW1pdCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTcxCiAgICAvLyBhc3NlcnQgc2VsZi52ZXN0aW5nX2RlbGF5ID09IFVJbnQ2NCgwKSwgInZlc3RpbmcgZGVsYXkgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg4CiAgICAvLyBzZWxmLnZlc3RpbmdfZGVsYXkgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJ2ZXN0aW5nX2RlbGF5IgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NzEKICAgIC8vIGFzc2VydCBzZWxmLnZlc3RpbmdfZGVsYXkgPT0gVUludDY0KDApLCAidmVzdGluZyBkZWxheSBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmVzdGluZ19kZWxheSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyB2ZXN0aW5nIGRlbGF5IG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NzIKICAgIC8vIGFzc2VydCBzZWxmLmxvY2t1cF9kZWxheSA9PSBVSW50NjQoMCksICJsb2NrdXAgZGVsYXkgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg3CiAgICAvLyBzZWxmLmxvY2t1cF9kZWxheSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImxvY2t1cF9kZWxheSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTcyCiAgICAvLyBhc3NlcnQgc2VsZi5sb2NrdXBfZGVsYXkgPT0gVUludDY0KDApLCAibG9ja3VwIGRlbGF5IG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NrdXBfZGVsYXkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gbG9ja3VwIGRlbGF5IG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NzMKICAgIC8vIGFzc2VydCBzZWxmLnBlcmlvZF9zZWNvbmRzID09IFVJbnQ2NCgwKSwgInBlcmlvZCBzZWNvbmRzIG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4NgogICAgLy8gc2VsZi5wZXJpb2Rfc2Vjb25kcyA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZF9zZWNvbmRzIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NzMKICAgIC8vIGFzc2VydCBzZWxmLnBlcmlvZF9zZWNvbmRzID09IFVJbnQ2NCgwKSwgInBlcmlvZCBzZWNvbmRzIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZXJpb2Rfc2Vjb25kcyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBwZXJpb2Qgc2Vjb25kcyBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTc0CiAgICAvLyBhc3NlcnQgc2VsZi5tZXNzZW5nZXJfaWQgPT0gVUludDY0KDApLCAibWVzc2VuZ2VyIGlkIG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBzZWxmLm1lc3Nlbmdlcl9pZCA9IFVJbnQ2NCgpCiAgICBieXRlICJtZXNzZW5nZXJfaWQiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk3NAogICAgLy8gYXNzZXJ0IHNlbGYubWVzc2VuZ2VyX2lkID09IFVJbnQ2NCgwKSwgIm1lc3NlbmdlciBpZCBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVzc2VuZ2VyX2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIG1lc3NlbmdlciBpZCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTc1CiAgICAvLyBhc3NlcnQgc2VsZi5kaXN0cmlidXRpb25fY291bnQgPT0gVUludDY0KAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkwCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9jb3VudCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRpc3RyaWJ1dGlvbl9jb3VudCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTc1CiAgICAvLyBhc3NlcnQgc2VsZi5kaXN0cmlidXRpb25fY291bnQgPT0gVUludDY0KAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc3RyaWJ1dGlvbl9jb3VudCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTc1LTk3NwogICAgLy8gYXNzZXJ0IHNlbGYuZGlzdHJpYnV0aW9uX2NvdW50ID09IFVJbnQ2NCgKICAgIC8vICAgICAwCiAgICAvLyApLCAiZGlzdHJpYnV0aW9uIGNvdW50IG5vdCBpbml0aWFsaXplZCIKICAgICEKICAgIGFzc2VydCAvLyBkaXN0cmlidXRpb24gY291bnQgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk3OAogICAgLy8gYXNzZXJ0IHNlbGYuZGlzdHJpYnV0aW9uX3NlY29uZHMgPT0gVUludDY0KAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkxCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGlzdHJpYnV0aW9uX3NlY29uZHMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk3OAogICAgLy8gYXNzZXJ0IHNlbGYuZGlzdHJpYnV0aW9uX3NlY29uZHMgPT0gVUludDY0KAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NzgtOTgwCiAgICAvLyBhc3NlcnQgc2VsZi5kaXN0cmlidXRpb25fc2Vjb25kcyA9PSBVSW50NjQoCiAgICAvLyAgICAgMAogICAgLy8gKSwgImRpc3RyaWJ1dGlvbiBzZWNvbmRzIG5vdCBpbml0aWFsaXplZCIKICAgICEKICAgIGFzc2VydCAvLyBkaXN0cmlidXRpb24gc2Vjb25kcyBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTgxCiAgICAvLyBhc3NlcnQgc2VsZi5kaXN0cmlidXRpb25fY291bnQgPT0gVUludDY0KAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkwCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9jb3VudCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRpc3RyaWJ1dGlvbl9jb3VudCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTgxCiAgICAvLyBhc3NlcnQgc2VsZi5kaXN0cmlidXRpb25fY291bnQgPT0gVUludDY0KAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc3RyaWJ1dGlvbl9jb3VudCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTgxLTk4MwogICAgLy8gYXNzZXJ0IHNlbGYuZGlzdHJpYnV0aW9uX2NvdW50ID09IFVJbnQ2NCgKICAgIC8vICAgICAwCiAgICAvLyApLCAiZGlzdHJpYnV0aW9uIGNvdW50IG5vdCBpbml0aWFsaXplZCIKICAgICEKICAgIGFzc2VydCAvLyBkaXN0cmlidXRpb24gY291bnQgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk4NAogICAgLy8gYXNzZXJ0IHNlbGYuZGlzdHJpYnV0aW9uX3NlY29uZHMgPT0gVUludDY0KAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkxCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGlzdHJpYnV0aW9uX3NlY29uZHMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk4NAogICAgLy8gYXNzZXJ0IHNlbGYuZGlzdHJpYnV0aW9uX3NlY29uZHMgPT0gVUludDY0KAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODQtOTg2CiAgICAvLyBhc3NlcnQgc2VsZi5kaXN0cmlidXRpb25fc2Vjb25kcyA9PSBVSW50NjQoCiAgICAvLyAgICAgMAogICAgLy8gKSwgImRpc3RyaWJ1dGlvbiBzZWNvbmRzIG5vdCBpbml0aWFsaXplZCIKICAgICEKICAgIGFzc2VydCAvLyBkaXN0cmlidXRpb24gc2Vjb25kcyBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTg3CiAgICAvLyBhc3NlcnQgZGlzdHJpYnV0aW9uX3NlY29uZHMgPiBVSW50NjQoMCksICJkaXN0cmlidXRpb24gc2Vjb25kcyBtdXN0IGJlIHBvc2l0aXZlIgogICAgaW50IDAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtNgogICAgZGlnIDEKICAgIGI+CiAgICBhc3NlcnQgLy8gZGlzdHJpYnV0aW9uIHNlY29uZHMgbXVzdCBiZSBwb3NpdGl2ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODgKICAgIC8vIGFzc2VydCBkaXN0cmlidXRpb25fY291bnQgPiBVSW50NjQoMCksICJkaXN0cmlidXRpb24gY291bnQgbXVzdCBiZSBwb3NpdGl2ZSIKICAgIGZyYW1lX2RpZyAtNwogICAgYjwKICAgIGFzc2VydCAvLyBkaXN0cmlidXRpb24gY291bnQgbXVzdCBiZSBwb3NpdGl2ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODkKICAgIC8vIGFzc2VydCBzZWxmLnBlcmlvZCA9PSBVSW50NjQoMCksICJwZXJpb2Qgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTgzCiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTg5CiAgICAvLyBhc3NlcnQgc2VsZi5wZXJpb2QgPT0gVUludDY0KDApLCAicGVyaW9kIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZXJpb2QgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gcGVyaW9kIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTAKICAgIC8vIGFzc2VydCBzZWxmLmRlYWRsaW5lID09IFVJbnQ2NCgwKSwgImRlYWRsaW5lIG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4NQogICAgLy8gc2VsZi5kZWFkbGluZSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRlYWRsaW5lIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTAKICAgIC8vIGFzc2VydCBzZWxmLmRlYWRsaW5lID09IFVJbnQ2NCgwKSwgImRlYWRsaW5lIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWFkbGluZSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBkZWFkbGluZSBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTkxCiAgICAvLyBhc3NlcnQgc2VsZi50b3RhbCA9PSBVSW50NjQoMCksICJ0b3RhbCBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk5MQogICAgLy8gYXNzZXJ0IHNlbGYudG90YWwgPT0gVUludDY0KDApLCAidG90YWwgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIHRvdGFsIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTIKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApLCAiZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzIKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTIKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApLCAiZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBmdW5kaW5nIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTMKICAgIC8vIGFzc2VydCBzZWxmLmRlbGVnYXRlID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJkZWxlZ2F0ZSBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNTYKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTMKICAgIC8vIGFzc2VydCBzZWxmLmRlbGVnYXRlID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJkZWxlZ2F0ZSBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsZWdhdGUgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gZGVsZWdhdGUgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk5Ni0xMDA5CiAgICAvLyBUZW1wbGF0ZSgKICAgIC8vICAgICBwZXJpb2RfbGltaXQsCiAgICAvLyAgICAgdmVzdGluZ19kZWxheSwKICAgIC8vICAgICBsb2NrdXBfZGVsYXksCiAgICAvLyAgICAgcGVyaW9kX3NlY29uZHMsCiAgICAvLyAgICAgbWVzc2VuZ2VyX2lkLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jb3VudCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fc2Vjb25kcywKICAgIC8vICAgICBwZXJpb2QsCiAgICAvLyAgICAgZGVhZGxpbmUsCiAgICAvLyAgICAgdG90YWwsCiAgICAvLyAgICAgZnVuZGluZywKICAgIC8vICAgICBkZWxlZ2F0ZSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMTIKICAgIGZyYW1lX2RpZyAtMTEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xMAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC04CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk5NC0xMDEwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBUZW1wbGF0ZSgKICAgIC8vICAgICAgICAgcGVyaW9kX2xpbWl0LAogICAgLy8gICAgICAgICB2ZXN0aW5nX2RlbGF5LAogICAgLy8gICAgICAgICBsb2NrdXBfZGVsYXksCiAgICAvLyAgICAgICAgIHBlcmlvZF9zZWNvbmRzLAogICAgLy8gICAgICAgICBtZXNzZW5nZXJfaWQsCiAgICAvLyAgICAgICAgIGRpc3RyaWJ1dGlvbl9jb3VudCwKICAgIC8vICAgICAgICAgZGlzdHJpYnV0aW9uX3NlY29uZHMsCiAgICAvLyAgICAgICAgIHBlcmlvZCwKICAgIC8vICAgICAgICAgZGVhZGxpbmUsCiAgICAvLyAgICAgICAgIHRvdGFsLAogICAgLy8gICAgICAgICBmdW5kaW5nLAogICAgLy8gICAgICAgICBkZWxlZ2F0ZSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIlRlbXBsYXRlKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDExCiAgICAvLyBzZWxmLnBlcmlvZF9saW1pdCA9IHBlcmlvZF9saW1pdC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMTIKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg5CiAgICAvLyBzZWxmLnBlcmlvZF9saW1pdCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZF9saW1pdCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxMQogICAgLy8gc2VsZi5wZXJpb2RfbGltaXQgPSBwZXJpb2RfbGltaXQubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDEyCiAgICAvLyBzZWxmLnZlc3RpbmdfZGVsYXkgPSB2ZXN0aW5nX2RlbGF5Lm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xMQogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODgKICAgIC8vIHNlbGYudmVzdGluZ19kZWxheSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInZlc3RpbmdfZGVsYXkiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTIKICAgIC8vIHNlbGYudmVzdGluZ19kZWxheSA9IHZlc3RpbmdfZGVsYXkubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDEzCiAgICAvLyBzZWxmLmxvY2t1cF9kZWxheSA9IGxvY2t1cF9kZWxheS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMTAKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg3CiAgICAvLyBzZWxmLmxvY2t1cF9kZWxheSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImxvY2t1cF9kZWxheSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxMwogICAgLy8gc2VsZi5sb2NrdXBfZGVsYXkgPSBsb2NrdXBfZGVsYXkubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDE0CiAgICAvLyBzZWxmLnBlcmlvZF9zZWNvbmRzID0gcGVyaW9kX3NlY29uZHMubmF0aXZlCiAgICBmcmFtZV9kaWcgLTkKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg2CiAgICAvLyBzZWxmLnBlcmlvZF9zZWNvbmRzID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kX3NlY29uZHMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTQKICAgIC8vIHNlbGYucGVyaW9kX3NlY29uZHMgPSBwZXJpb2Rfc2Vjb25kcy5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTUKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gbWVzc2VuZ2VyX2lkLm5hdGl2ZQogICAgZnJhbWVfZGlnIC04CiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBzZWxmLm1lc3Nlbmdlcl9pZCA9IFVJbnQ2NCgpCiAgICBieXRlICJtZXNzZW5nZXJfaWQiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTUKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gbWVzc2VuZ2VyX2lkLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxNgogICAgLy8gc2VsZi5kaXN0cmlidXRpb25fY291bnQgPSBkaXN0cmlidXRpb25fY291bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTcKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkwCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9jb3VudCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRpc3RyaWJ1dGlvbl9jb3VudCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxNgogICAgLy8gc2VsZi5kaXN0cmlidXRpb25fY291bnQgPSBkaXN0cmlidXRpb25fY291bnQubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDE3CiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID0gZGlzdHJpYnV0aW9uX3NlY29uZHMubmF0aXZlCiAgICBmcmFtZV9kaWcgLTYKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkxCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGlzdHJpYnV0aW9uX3NlY29uZHMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTcKICAgIC8vIHNlbGYuZGlzdHJpYnV0aW9uX3NlY29uZHMgPSBkaXN0cmlidXRpb25fc2Vjb25kcy5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTgKICAgIC8vIHNlbGYucGVyaW9kID0gcGVyaW9kLm5hdGl2ZQogICAgZnJhbWVfZGlnIC01CiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4MwogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJwZXJpb2QiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTgKICAgIC8vIHNlbGYucGVyaW9kID0gcGVyaW9kLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxOQogICAgLy8gc2VsZi5kZWFkbGluZSA9IGRlYWRsaW5lLm5hdGl2ZQogICAgZnJhbWVfZGlnIC00CiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4NQogICAgLy8gc2VsZi5kZWFkbGluZSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRlYWRsaW5lIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDE5CiAgICAvLyBzZWxmLmRlYWRsaW5lID0gZGVhZGxpbmUubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDIwCiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDIwCiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDIxCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBmdW5kaW5nLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMjEKICAgIC8vIHNlbGYuZnVuZGluZyA9IGZ1bmRpbmcubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNTYKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDIyCiAgICAvLyBzZWxmLmRlbGVnYXRlID0gZGVsZWdhdGUubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQWlyZHJvcC5hYm9ydF9mdW5kaW5nKCkgLT4gdm9pZDoKYWJvcnRfZnVuZGluZzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAyNC0xMDI3CiAgICAvLyAjIG92ZXJyaWRlIGZ1bmRhYmxlIGFib3J0X2Z1bmRpbmcgYWJpbWV0aG9kCiAgICAvLyAjICAgY2xvc2Ugb2ZmbGluZSBvbiBkZWxldGUgdG8gb3duZXIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVtPbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uXSkKICAgIC8vIGRlZiBhYm9ydF9mdW5kaW5nKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzMAogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciBvciBUeG4uc2VuZGVyID09IHNlbGYub3duZXIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzMAogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciBvciBUeG4uc2VuZGVyID09IHNlbGYub3duZXIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICA9PQogICAgYm56IGFib3J0X2Z1bmRpbmdfYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzMAogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciBvciBUeG4uc2VuZGVyID09IHNlbGYub3duZXIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBieiBhYm9ydF9mdW5kaW5nX2Jvb2xfZmFsc2VAMwoKYWJvcnRfZnVuZGluZ19ib29sX3RydWVAMjoKICAgIGludCAxCiAgICBiIGFib3J0X2Z1bmRpbmdfYm9vbF9tZXJnZUA0CgphYm9ydF9mdW5kaW5nX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgphYm9ydF9mdW5kaW5nX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAyOC0xMDMxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciBvciBUeG4uc2VuZGVyID09IHNlbGYub3duZXIKICAgIC8vICksICJtdXN0IGJlIGZ1bmRlciBvciBvd25lciIKICAgIGFzc2VydCAvLyBtdXN0IGJlIGZ1bmRlciBvciBvd25lcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDMyLTEwMzMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA9PSBVSW50NjQoMCkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMzItMTAzMwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzNwogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDM4CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMzgKICAgIC8vIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzNi0xMDM5CiAgICAvLyBDbG9zZWQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDM0LTEwNDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENsb3NlZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgbWV0aG9kICJDbG9zZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNDEKICAgIC8vIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlKHNlbGYub3duZXIpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNDEKICAgIC8vIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlKHNlbGYub3duZXIpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBjYWxsc3ViIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlCiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUoY2xvc2VfcmVtYWluZGVyX3RvOiBieXRlcykgLT4gdm9pZDoKY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGU6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjUwLTUyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlKGNsb3NlX3JlbWFpbmRlcl90bzogQWNjb3VudCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy91dGlscy5weTo1MwogICAgLy8gb2NhID0gVHhuLm9uX2NvbXBsZXRpb24KICAgIHR4biBPbkNvbXBsZXRpb24KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NTQKICAgIC8vIGlmIG9jYSA9PSBPbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uOgogICAgaW50IERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjcwCiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjczCiAgICAvLyBhbW91bnQ9b3AuR2xvYmFsLm1pbl9iYWxhbmNlLAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NzUKICAgIC8vIGl0eG4uc3VibWl0X3R4bnMoa2V5cmVnX3R4biwgcG10X3R4bikKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjQtNjYKICAgIC8vIHN0YXRlX3Byb29mX2tleT1CeXRlcy5mcm9tX2Jhc2U2NCgKICAgIC8vICAgICAiQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUE9PSIKICAgIC8vICksCiAgICBieXRlIGJhc2U2NCBBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQT09CiAgICBpdHhuX2ZpZWxkIFN0YXRlUHJvb2ZQSwogICAgLy8gc3JjL3NyYy91dGlscy5weTo2MwogICAgLy8gdm90ZV9rZXlfZGlsdXRpb249VUludDY0KDApLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgVm90ZUtleURpbHV0aW9uCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjYyCiAgICAvLyB2b3RlX2xhc3Q9VUludDY0KDApLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgVm90ZUxhc3QKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjEKICAgIC8vIHZvdGVfZmlyc3Q9VUludDY0KDApLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgVm90ZUZpcnN0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjU4LTYwCiAgICAvLyBzZWxlY3Rpb25fa2V5PUJ5dGVzLmZyb21fYmFzZTY0KAogICAgLy8gICAgICJBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBPSIKICAgIC8vICksCiAgICBieXRlIGJhc2U2NCBBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBPQogICAgaXR4bl9maWVsZCBTZWxlY3Rpb25QSwogICAgLy8gc3JjL3NyYy91dGlscy5weTo1NwogICAgLy8gdm90ZV9rZXk9Qnl0ZXMuZnJvbV9iYXNlNjQoIkFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUE9IiksCiAgICBieXRlIGJhc2U2NCBBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBPQogICAgaXR4bl9maWVsZCBWb3RlUEsKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NTYKICAgIC8vIG5vbl9wYXJ0aWNpcGF0aW9uPVRydWUsCiAgICBpbnQgMQogICAgaXR4bl9maWVsZCBOb25wYXJ0aWNpcGF0aW9uCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjU1CiAgICAvLyBrZXlyZWdfdHhuID0gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICBpbnQga2V5cmVnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjY3CiAgICAvLyBmZWU9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc3JjL3NyYy91dGlscy5weTo3NQogICAgLy8gaXR4bi5zdWJtaXRfdHhucyhrZXlyZWdfdHhuLCBwbXRfdHhuKQogICAgaXR4bl9uZXh0CiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjkKICAgIC8vIHBtdF90eG4gPSBpdHhuLlBheW1lbnQoCiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjcyCiAgICAvLyBmZWU9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc3JjL3NyYy91dGlscy5weTo3NQogICAgLy8gaXR4bi5zdWJtaXRfdHhucyhrZXlyZWdfdHhuLCBwbXRfdHhuKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wLnVwZGF0ZSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0My0xMDQ0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbl0pCiAgICAvLyBkZWYgdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDQ1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDQ2CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA3CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0NgogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGRhdGFibGUgZXhpc3RzCiAgICBpbnQgMQogICAgPT0KICAgIGFzc2VydCAvLyBub3QgYXBwcm92ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0NwogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIGFyYzQuQWRkcmVzcyhzZWxmLmZ1bmRlcikpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0NwogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIGFyYzQuQWRkcmVzcyhzZWxmLmZ1bmRlcikpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDQ3CiAgICAvLyBhcmM0LmVtaXQoQ2xvc2VkKGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwgYXJjNC5BZGRyZXNzKHNlbGYuZnVuZGVyKSkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgY29uY2F0CiAgICBtZXRob2QgIkNsb3NlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0OAogICAgLy8gY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUoc2VsZi5mdW5kZXIpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzEKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNDgKICAgIC8vIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlKHNlbGYuZnVuZGVyKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgIGNhbGxzdWIgY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS5zZXR1cChkZXBsb3llcjogYnl0ZXMsIG93bmVyOiBieXRlcywgZnVuZGVyOiBieXRlcywgaW5pdGlhbDogYnl0ZXMpIC0+IHZvaWQ6CnNldHVwOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MTItNzE5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXR1cCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGRlcGxveWVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgb3duZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBmdW5kZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBpbml0aWFsOiBhcmM0LlVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MjAtNzIxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLm93bmVyID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJvd25lciBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcyMC03MjEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYub3duZXIgPT0gR2xvYmFsLnplcm9fYWRkcmVzcywgIm93bmVyIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBvd25lciBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzIyCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kZXIgPT0gR2xvYmFsLnplcm9fYWRkcmVzcywgImZ1bmRlciBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzEKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcyMgogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJmdW5kZXIgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBmdW5kZXIgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcyMy03MjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIm11c3QgYmUgY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGNyZWF0b3IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzI1LTcyNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoU2V0dXAoZGVwbG95ZXIsIG93bmVyLCBmdW5kZXIsIGluaXRpYWwpKQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlNldHVwKGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MDIKICAgIC8vIHNlbGYuZGVwbG95ZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlcGxveWVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MjcKICAgIC8vIHNlbGYuZGVwbG95ZXIgPSBkZXBsb3llci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MjgKICAgIC8vIHNlbGYub3duZXIgPSBvd25lci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MjkKICAgIC8vIHNlbGYuZnVuZGVyID0gZnVuZGVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MzAKICAgIC8vIHNlbGYuaW5pdGlhbCA9IGluaXRpYWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg0CiAgICAvLyBzZWxmLmluaXRpYWwgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJpbml0aWFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MzAKICAgIC8vIHNlbGYuaW5pdGlhbCA9IGluaXRpYWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkxvY2thYmxlLmNvbmZpZ3VyZShwZXJpb2Q6IGJ5dGVzKSAtPiB2b2lkOgpjb25maWd1cmU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjczMi03MzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNvbmZpZ3VyZShzZWxmLCBwZXJpb2Q6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjczNC03MzUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA9PSAwLCAiZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzIKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MzQtNzM1CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gMCwgImZ1bmRpbmcgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzM2CiAgICAvLyBhc3NlcnQgc2VsZi50b3RhbCA9PSAwLCAidG90YWwgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MzYKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsID09IDAsICJ0b3RhbCBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gdG90YWwgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjczNy03MzgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjczNy03MzgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzM5LTc0MAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgcGVyaW9kIDw9IHNlbGYucGVyaW9kX2xpbWl0CiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODkKICAgIC8vIHNlbGYucGVyaW9kX2xpbWl0ID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kX2xpbWl0IgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MzktNzQwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBwZXJpb2QgPD0gc2VsZi5wZXJpb2RfbGltaXQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZXJpb2RfbGltaXQgZXhpc3RzCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGI+PQogICAgYXNzZXJ0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc0MS03NDIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZGVhZGxpbmUgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgImRlYWRsaW5lIG5vdCBwYXNzZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODUKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJkZWFkbGluZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzQxLTc0MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5kZWFkbGluZSA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAiZGVhZGxpbmUgbm90IHBhc3NlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWFkbGluZSBleGlzdHMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgID4KICAgIGFzc2VydCAvLyBkZWFkbGluZSBub3QgcGFzc2VkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc0My03NDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KENvbmZpZ3VyZWQoYXJjNC5VSW50NjQoc2VsZi5wZXJpb2QpLCBwZXJpb2QpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTgzCiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzQzLTc0NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoQ29uZmlndXJlZChhcmM0LlVJbnQ2NChzZWxmLnBlcmlvZCksIHBlcmlvZCkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVyaW9kIGV4aXN0cwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiQ29uZmlndXJlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc0NQogICAgLy8gc2VsZi5wZXJpb2QgPSBwZXJpb2QubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTgzCiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzQ1CiAgICAvLyBzZWxmLnBlcmlvZCA9IHBlcmlvZC5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUud2l0aGRyYXcoYW1vdW50OiBieXRlcykgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzQ3LTc2NQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXcKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGFtb3VudAogICAgLy8gIyByZXR1cm5zOiBtaW4gYmFsYW5jZQogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGZ1bmRzIGZyb20gY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IG93bmVyCiAgICAvLyAjIC0gbGV0IGJhbGFuY2UgYmUgdGhlIGN1cnJlbnQgYmFsYW5jZSBvZiB0aGUKICAgIC8vICMgICBjb250cmFjdAogICAgLy8gIyAtIGJhbGFuY2UgLSBhbW91bnQgPj0gbWluX2JhbGFuY2UKICAgIC8vICMgICAoZmVlIHBhaWQgaW4gYXBwbCB0eG4pCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0cmFuc2ZlciBhbW91bnQgZnJvbSB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyAgIHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOiBjb3N0cyAyIGZlZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHdpdGhkcmF3KHNlbGYsIGFtb3VudDogYXJjNC5VSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgYnl0ZSAiIgogICAgZHVwbiAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc2OS03NzAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc2OS03NzAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzcxLTc3MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPiAwOgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzcxLTc3MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPiAwOgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICBieiB3aXRoZHJhd19lbHNlX2JvZHlANQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3NzMKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi5jYWxjdWxhdGVfbWluX2JhbGFuY2UoKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWluX2JhbGFuY2UKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc3NAogICAgLy8gYXJjNC5lbWl0KFdpdGhkcmF3bihhcmM0LlVJbnQ2NChtaW5fYmFsYW5jZSksIGFtb3VudCkpCiAgICBkdXAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIldpdGhkcmF3bih1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc3NQogICAgLy8gYXZhaWxhYmxlX2JhbGFuY2UgPSBnZXRfYXZhaWxhYmxlX2JhbGFuY2UoKQogICAgY2FsbHN1YiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Nzc2CiAgICAvLyBhc3NlcnQgYXZhaWxhYmxlX2JhbGFuY2UgLSBhbW91bnQubmF0aXZlID49IG1pbl9iYWxhbmNlLCAiYmFsYW5jZSBhdmFpbGFibGUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAtCiAgICA8PQogICAgYXNzZXJ0IC8vIGJhbGFuY2UgYXZhaWxhYmxlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc3NwogICAgLy8gaWYgYW1vdW50ID4gMDoKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBieiB3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Nzc4CiAgICAvLyBpdHhuLlBheW1lbnQoYW1vdW50PWFtb3VudC5uYXRpdmUsIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgZnJhbWVfZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0Cgp3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojc3OQogICAgLy8gcmV0dXJuIG1pbl9iYWxhbmNlCiAgICByZXRzdWIKCndpdGhkcmF3X2Vsc2VfYm9keUA1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3ODEKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi50b3RhbAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3ODEKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi50b3RhbAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzgyCiAgICAvLyBhcmM0LmVtaXQoV2l0aGRyYXduKGFyYzQuVUludDY0KG1pbl9iYWxhbmNlKSwgYW1vdW50KSkKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiV2l0aGRyYXduKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzgzCiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IGdldF9hdmFpbGFibGVfYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9hdmFpbGFibGVfYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3ODQKICAgIC8vIGFzc2VydCBhdmFpbGFibGVfYmFsYW5jZSAtIGFtb3VudC5uYXRpdmUgPj0gbWluX2JhbGFuY2UsICJiYWxhbmNlIGF2YWlsYWJsZSIKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC0KICAgIDw9CiAgICBhc3NlcnQgLy8gYmFsYW5jZSBhdmFpbGFibGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Nzg1CiAgICAvLyBpZiBhbW91bnQgPiAwOgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGJ6IHdpdGhkcmF3X2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3ODYKICAgIC8vIGl0eG4uUGF5bWVudChhbW91bnQ9YW1vdW50Lm5hdGl2ZSwgcmVjZWl2ZXI9VHhuLnNlbmRlciwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgMgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCndpdGhkcmF3X2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Nzg3CiAgICAvLyByZXR1cm4gbWluX2JhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS5jYWxjdWxhdGVfbWluX2JhbGFuY2UoKSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV9taW5fYmFsYW5jZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODE1LTgzMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogbWluX2JhbGFuY2UgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2FsY3VhbHRlIG1pbmltdW0gYmFsYW5jZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gbGV0IHBlcmlvZCA9IG51bWJlciBvZiBtb250aHMgdG8gdG8gbG9ja3VwCiAgICAvLyAjICAgICAgIHRvdGFsID0gdG90YWwgYW1vdW50IGludGlhbGx5IGZ1bmRlZCAoYWlyZHJvcCArIGxvY2t1cCBib251cykKICAgIC8vICMgICAgICAgeSA9IHZlc3RpbmcgZGVsYXkgaW4gbW9udGhzCiAgICAvLyAjICAgICAgIHAgPSAxIC8gKHNlbGYucGVyaW9kIHggMTIpIG9yIDEgLyAocGVyaW9kKQogICAgLy8gIyAtIG1pbXVtdW0gYmFsYW5jZSA9CiAgICAvLyAjICAgICB0b3RhbCB4IG1pbigxLCBwIHggbWF4KDAsIChwZXJpb2QgLSAobm93KCkgLSBmdW5kaW5nICsgeSB4IHNlY29uZHMtaW4tbW9udGgpKSAvIHNlY29uZHMtaW4tbW9udGgpKQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjdWxhdGVfbWluX2JhbGFuY2Uoc2VsZikgLT4gVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgzMQogICAgLy8gbm93OiBVSW50NjQgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzQKICAgIC8vIHNlbGYudmVzdGluZ19kZWxheSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4OAogICAgLy8gc2VsZi52ZXN0aW5nX2RlbGF5ID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAidmVzdGluZ19kZWxheSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM0CiAgICAvLyBzZWxmLnZlc3RpbmdfZGVsYXksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmVzdGluZ19kZWxheSBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM1CiAgICAvLyBzZWxmLnBlcmlvZF9zZWNvbmRzLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg2CiAgICAvLyBzZWxmLnBlcmlvZF9zZWNvbmRzID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kX3NlY29uZHMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgzNQogICAgLy8gc2VsZi5wZXJpb2Rfc2Vjb25kcywKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZXJpb2Rfc2Vjb25kcyBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM2CiAgICAvLyBzZWxmLmxvY2t1cF9kZWxheSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4NwogICAgLy8gc2VsZi5sb2NrdXBfZGVsYXkgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJsb2NrdXBfZGVsYXkiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgzNgogICAgLy8gc2VsZi5sb2NrdXBfZGVsYXksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubG9ja3VwX2RlbGF5IGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzcKICAgIC8vIHNlbGYucGVyaW9kLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTgzCiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM3CiAgICAvLyBzZWxmLnBlcmlvZCwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZXJpb2QgZXhpc3RzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgzOAogICAgLy8gc2VsZi5mdW5kaW5nLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM4CiAgICAvLyBzZWxmLmZ1bmRpbmcsCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM5CiAgICAvLyBzZWxmLnRvdGFsLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzkKICAgIC8vIHNlbGYudG90YWwsCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg0MAogICAgLy8gc2VsZi5kaXN0cmlidXRpb25fY291bnQsCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1OTAKICAgIC8vIHNlbGYuZGlzdHJpYnV0aW9uX2NvdW50ID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGlzdHJpYnV0aW9uX2NvdW50IgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NDAKICAgIC8vIHNlbGYuZGlzdHJpYnV0aW9uX2NvdW50LAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc3RyaWJ1dGlvbl9jb3VudCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODQxCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkxCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGlzdHJpYnV0aW9uX3NlY29uZHMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg0MQogICAgLy8gc2VsZi5kaXN0cmlidXRpb25fc2Vjb25kcywKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXN0cmlidXRpb25fc2Vjb25kcyBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODMyLTg0MgogICAgLy8gbWluX2JhbGFuY2U6IFVJbnQ2NCA9IGNhbGN1bGF0ZV9tYWJfcHVyZSgKICAgIC8vICAgICBub3csCiAgICAvLyAgICAgc2VsZi52ZXN0aW5nX2RlbGF5LAogICAgLy8gICAgIHNlbGYucGVyaW9kX3NlY29uZHMsCiAgICAvLyAgICAgc2VsZi5sb2NrdXBfZGVsYXksCiAgICAvLyAgICAgc2VsZi5wZXJpb2QsCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nLAogICAgLy8gICAgIHNlbGYudG90YWwsCiAgICAvLyAgICAgc2VsZi5kaXN0cmlidXRpb25fY291bnQsCiAgICAvLyAgICAgc2VsZi5kaXN0cmlidXRpb25fc2Vjb25kcywKICAgIC8vICkKICAgIGNhbGxzdWIgY2FsY3VsYXRlX21hYl9wdXJlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg0MwogICAgLy8gcmV0dXJuIG1pbl9iYWxhbmNlCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3RfbWFiLmNhbGN1bGF0ZV9tYWJfcHVyZShub3c6IHVpbnQ2NCwgdmVzdGluZ19kZWxheTogdWludDY0LCBwZXJpb2Rfc2Vjb25kczogdWludDY0LCBsb2NrdXBfZGVsYXk6IHVpbnQ2NCwgcGVyaW9kOiB1aW50NjQsIGZ1bmRpbmc6IHVpbnQ2NCwgdG90YWw6IHVpbnQ2NCwgZGlzdHJpYnV0aW9uX2NvdW50OiB1aW50NjQsIGRpc3RyaWJ1dGlvbl9zZWNvbmRzOiB1aW50NjQpIC0+IHVpbnQ2NDoKY2FsY3VsYXRlX21hYl9wdXJlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6NC0zMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY2FsY3VsYXRlX21hYl9wdXJlIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIG5vdywgdGltZXN0YW1wCiAgICAvLyAjIC0gdmVzdGluZ19kZWxheSwgaG93IG1hbnkgcGVyaW9kcyBpbiB2ZXN0aW5nCiAgICAvLyAjIC0gcGVyaW9kX3NlY29uZHMsIGhvdyBtYW55IHNlY29uZHMgaW4gcGVyaW9kCiAgICAvLyAjIC0gbG9ja3VwIGRlbGF5LCBob3cgbWFueSBwZXJpb2QgaW4gbG9ja3VwCiAgICAvLyAjIC0gcGVyaW9kLCBob3cgbWFueSBwZXJpb2RzCiAgICAvLyAjIC0gZnVuZGluZywgd2hlbiBmdW5kZWQKICAgIC8vICMgLSB0b3RhbCwgaG93IG11Y2ggZnVuZGVkCiAgICAvLyAjIC0gZGlzdHJpYnV0aW9uX2NvdW50LCBob3cgbWFueSBwZXJpb2RzIGluIGRpc3RyaWJ1dGlvbgogICAgLy8gIyAtIGRpc3RyaWJ1dGlvbl9zZWNvbmRzLCBob3cgbWFueSBzZWNvbmRzIGluIGRpc3RyaWJ1dGlvbgogICAgLy8gIyBwdXJwb3NlOiBjYWxjdWxhdGUgbWluaW11bSBhbGxvd2FibGUgYmFsYW5jZQogICAgLy8gIyByZXR1cm5zJyBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGN1bGF0ZV9tYWJfcHVyZSgKICAgIC8vICAgICBub3c6IFVJbnQ2NCwKICAgIC8vICAgICB2ZXN0aW5nX2RlbGF5OiBVSW50NjQsCiAgICAvLyAgICAgcGVyaW9kX3NlY29uZHM6IFVJbnQ2NCwKICAgIC8vICAgICBsb2NrdXBfZGVsYXk6IFVJbnQ2NCwKICAgIC8vICAgICBwZXJpb2Q6IFVJbnQ2NCwKICAgIC8vICAgICBmdW5kaW5nOiBVSW50NjQsCiAgICAvLyAgICAgdG90YWw6IFVJbnQ2NCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY291bnQ6IFVJbnQ2NCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fc2Vjb25kczogVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA5IDEKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjMxCiAgICAvLyBsb2NrdXBfcGVyaW9kcyA9IGxvY2t1cF9kZWxheSAqIHBlcmlvZAogICAgZnJhbWVfZGlnIC02CiAgICBmcmFtZV9kaWcgLTUKICAgICoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjMyCiAgICAvLyBsb2NrdXBfc2Vjb25kcyA9IGxvY2t1cF9wZXJpb2RzICogcGVyaW9kX3NlY29uZHMKICAgIGZyYW1lX2RpZyAtNwogICAgKgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MzMKICAgIC8vIHZlc3Rpbmdfc2Vjb25kcyA9IHZlc3RpbmdfZGVsYXkgKiBwZXJpb2Rfc2Vjb25kcwogICAgZnJhbWVfZGlnIC04CiAgICBmcmFtZV9kaWcgLTcKICAgICoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjM0CiAgICAvLyBmdWxseV92ZXN0ZWQgPSBmdW5kaW5nICsgdmVzdGluZ19zZWNvbmRzICsgbG9ja3VwX3NlY29uZHMKICAgIGZyYW1lX2RpZyAtNAogICAgKwogICAgKwogICAgZHVwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weTozNQogICAgLy8gbG9ja2VkX3VwID0gbm93IDw9IGZ1bGx5X3Zlc3RlZAogICAgZnJhbWVfZGlnIC05CiAgICA+PQogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MzYKICAgIC8vIGlmIGxvY2tlZF91cDoKICAgIGJ6IGNhbGN1bGF0ZV9tYWJfcHVyZV9lbHNlX2JvZHlAMgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MzcKICAgIC8vIHJldHVybiB0b3RhbAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKY2FsY3VsYXRlX21hYl9wdXJlX2Vsc2VfYm9keUAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MzkKICAgIC8vIGVsYXBzZWRfcGVyaW9kcyA9IChub3cgLSBmdWxseV92ZXN0ZWQpIC8vIGRpc3RyaWJ1dGlvbl9zZWNvbmRzCiAgICBmcmFtZV9kaWcgLTkKICAgIGZyYW1lX2RpZyAxCiAgICAtCiAgICBmcmFtZV9kaWcgLTEKICAgIC8KICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weTo0MAogICAgLy8gaWYgZWxhcHNlZF9wZXJpb2RzIDw9IGRpc3RyaWJ1dGlvbl9jb3VudDoKICAgIGZyYW1lX2RpZyAtMgogICAgPD0KICAgIGJ6IGNhbGN1bGF0ZV9tYWJfcHVyZV9lbHNlX2JvZHlANAogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6NDIKICAgIC8vIHRvdGFsICogKGRpc3RyaWJ1dGlvbl9jb3VudCAtIGVsYXBzZWRfcGVyaW9kcykKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIDAKICAgIC0KICAgIGZyYW1lX2RpZyAtMwogICAgKgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6NDEtNDMKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgdG90YWwgKiAoZGlzdHJpYnV0aW9uX2NvdW50IC0gZWxhcHNlZF9wZXJpb2RzKQogICAgLy8gKSAvLyBkaXN0cmlidXRpb25fY291bnQKICAgIGZyYW1lX2RpZyAtMgogICAgLwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNhbGN1bGF0ZV9tYWJfcHVyZV9lbHNlX2JvZHlANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjQ1CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuZ2V0X2F2YWlsYWJsZV9iYWxhbmNlKCkgLT4gdWludDY0OgpnZXRfYXZhaWxhYmxlX2JhbGFuY2U6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjM3LTQzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UgKGludGVybmFsKQogICAgLy8gIyBwdXJwb3NlOiBnZXQgYXZhaWxhYmxlIGJhbGFuY2UKICAgIC8vICMgcmV0dXJuczogYXBwIGJhbGFuY2UgYXZhaWxhYmxlIGZvciBzcGVuZGluZwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UoKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NDQKICAgIC8vIGJhbGFuY2UgPSBvcC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYmFsYW5jZQogICAgLy8gc3JjL3NyYy91dGlscy5weTo0NQogICAgLy8gbWluX2JhbGFuY2UgPSBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjQ2CiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IGJhbGFuY2UgLSBtaW5fYmFsYW5jZQogICAgLQogICAgLy8gc3JjL3NyYy91dGlscy5weTo0NwogICAgLy8gcmV0dXJuIGF2YWlsYWJsZV9iYWxhbmNlCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUuY2xvc2UoKSAtPiB2b2lkOgpjbG9zZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Nzg5LTgwMgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY2xvc2UKICAgIC8vICMgcHVycG9zZTogZGVsZXRlcyBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBtaW4gYmFsYW5jZSBpcyAwCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSBjb250cmFjdCBpcyBkZWxldGVkCiAgICAvLyAjIC0gYWNjb3VudCBjbG9zZWQgb3V0IHRvIG93bmVyIGlmIGl0IGhhcyBhIGJhbGFuY2UKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gc2hvdWxkIGJlIGFsbGVkIHdpdGggb25Db21wbGV0aW9uCiAgICAvLyAjICAgZGVsZXRlQXBwbGljYXRpb24KICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVtPbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uXSkKICAgIC8vIGRlZiBjbG9zZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgwMy04MDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPiAwLCAiZnVuZGVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODAzLTgwNAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA+IDAsICJmdW5kZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIGFzc2VydCAvLyBmdW5kZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODA1LTgwNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuY2FsY3VsYXRlX21pbl9iYWxhbmNlKCkgPT0gMCwgIm1pbiBiYWxhbmNlIG5vdCB6ZXJvIgogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWluX2JhbGFuY2UKICAgICEKICAgIGFzc2VydCAvLyBtaW4gYmFsYW5jZSBub3QgemVybwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MDkKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgwOQogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBibnogY2xvc2VfYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODA5CiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYub3duZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlcgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgID09CiAgICBieiBjbG9zZV9ib29sX2ZhbHNlQDMKCmNsb3NlX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgY2xvc2VfYm9vbF9tZXJnZUA0CgpjbG9zZV9ib29sX2ZhbHNlQDM6CiAgICBpbnQgMAoKY2xvc2VfYm9vbF9tZXJnZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MDctODEwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyCiAgICAvLyApLCAibXVzdCBiZSBvd25lciBvciBmdW5kZXIiCiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lciBvciBmdW5kZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODExLTgxMgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSkpCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgxMS04MTIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFyYzQuZW1pdChDbG9zZWQoYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LkFkZHJlc3Moc2VsZi5vd25lcikpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgY29uY2F0CiAgICBtZXRob2QgIkNsb3NlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODEzCiAgICAvLyBjbG9zZV9vZmZsaW5lX29uX2RlbGV0ZShzZWxmLm93bmVyKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MTMKICAgIC8vIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlKHNlbGYub3duZXIpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBjYWxsc3ViIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuT3duYWJsZS50cmFuc2ZlcihuZXdfb3duZXI6IGJ5dGVzKSAtPiB2b2lkOgp0cmFuc2ZlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODQtODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHRyYW5zZmVyKHNlbGYsIG5ld19vd25lcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBhcmM0LmVtaXQoT3duZXJzaGlwVHJhbnNmZXJyZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBuZXdfb3duZXIpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NwogICAgLy8gYXJjNC5lbWl0KE93bmVyc2hpcFRyYW5zZmVycmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgbmV3X293bmVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIk93bmVyc2hpcFRyYW5zZmVycmVkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm93bmVyID0gbmV3X293bmVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkZ1bmRhYmxlLmZpbGwoKSAtPiB2b2lkOgpmaWxsOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzItMTczCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBmaWxsKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0LTE3NQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyLCAibXVzdCBiZSBmdW5kZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzEKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NC0xNzUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciwgIm11c3QgYmUgZnVuZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBmdW5kZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc2LTE3NwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gcmVxdWlyZV9wYXltZW50KHNlbGYuZnVuZGVyKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzYtMTc3CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoc2VsZi5mdW5kZXIpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgY2FsbHN1YiByZXF1aXJlX3BheW1lbnQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc5LTE4MAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHRvdGFsID0gc2VsZi50b3RhbCArIHBheW1lbnRfYW1vdW50CiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3OS0xODAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyB0b3RhbCA9IHNlbGYudG90YWwgKyBwYXltZW50X2Ftb3VudAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgzCiAgICAvLyBhcmM0LlVJbnQ2NChwYXltZW50X2Ftb3VudCksCiAgICBpdG9iCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gYXJjNC5VSW50NjQodG90YWwpLAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4Mi0xODUKICAgIC8vIEZpbGxlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChwYXltZW50X2Ftb3VudCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQodG90YWwpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgxLTE4NgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEZpbGxlZCgKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NCh0b3RhbCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgbWV0aG9kICJGaWxsZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NwogICAgLy8gc2VsZi50b3RhbCA9IHRvdGFsCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLnJlcXVpcmVfcGF5bWVudCh3aG86IGJ5dGVzKSAtPiB1aW50NjQ6CnJlcXVpcmVfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTUtMjMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHJlcXVpcmVfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayBwYXltZW50CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZXF1aXJlX3BheW1lbnQod2hvOiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjQKICAgIC8vIHJlZl9ncm91cF9pbmRleCA9IFR4bi5ncm91cF9pbmRleAogICAgdHhuIEdyb3VwSW5kZXgKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjUKICAgIC8vIGFzc2VydCByZWZfZ3JvdXBfaW5kZXggPiAwLCAiZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBncm91cCBpbmRleCBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc3JjL3NyYy91dGlscy5weToyNgogICAgLy8gcGF5bWVudF9ncm91cF9pbmRleCA9IHJlZl9ncm91cF9pbmRleCAtIDEKICAgIGludCAxCiAgICAtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI4CiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToyNy0yOQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICAvLyApLCAicGF5bWVudCBzZW5kZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCBzZW5kZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzEKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMyCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc3JjL3NyYy91dGlscy5weTozMS0zMgogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIC8vID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMwLTMzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyAgICAgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgInBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy91dGlscy5weTozNAogICAgLy8gcmV0dXJuIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLmFtb3VudAogICAgZ3R4bnMgQW1vdW50CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuRnVuZGFibGUuZ3JhbnRfZnVuZGVyKGZ1bmRlcjogYnl0ZXMpIC0+IHZvaWQ6CmdyYW50X2Z1bmRlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg5LTE5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZ3JhbnRfZnVuZGVyKHNlbGYsIGZ1bmRlcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MS0xOTIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciwgIm11c3QgYmUgZnVuZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTEtMTkyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIsICJtdXN0IGJlIGZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgZnVuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5My0xOTQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoRnVuZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi5mdW5kZXIpLCBmdW5kZXIpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTMtMTk0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KEZ1bmRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYuZnVuZGVyKSwgZnVuZGVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJGdW5kZXJHcmFudGVkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzEKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gc2VsZi5mdW5kZXIgPSBmdW5kZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuRnVuZGFibGUuc2V0X2Z1bmRpbmcoZnVuZGluZzogYnl0ZXMpIC0+IHZvaWQ6CnNldF9mdW5kaW5nOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTctMTk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfZnVuZGluZyhzZWxmLCBmdW5kaW5nOiBhcmM0LlVJbnQ2NCkgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5OS0yMDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciwgIm11c3QgYmUgZnVuZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTktMjAwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIsICJtdXN0IGJlIGZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgZnVuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKSBvciBzZWxmLmZ1bmRpbmcgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAzCiAgICAvLyBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApIG9yIHNlbGYuZnVuZGluZyA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIGJ6IHNldF9mdW5kaW5nX2Jvb2xfdHJ1ZUAyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzIKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDMKICAgIC8vIHNlbGYuZnVuZGluZyA9PSBVSW50NjQoMCkgb3Igc2VsZi5mdW5kaW5nID4gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgPgogICAgYnogc2V0X2Z1bmRpbmdfYm9vbF9mYWxzZUAzCgpzZXRfZnVuZGluZ19ib29sX3RydWVAMjoKICAgIGludCAxCiAgICBiIHNldF9mdW5kaW5nX2Jvb2xfbWVyZ2VANAoKc2V0X2Z1bmRpbmdfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCnNldF9mdW5kaW5nX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAxLTIwNAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKSBvciBzZWxmLmZ1bmRpbmcgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgLy8gKSwgImZ1bmRpbmcgbm90IGJlIGluaXRpYWxpemVkIG9yIGNhbiBiZSBleHRlbmRlZCIKICAgIGFzc2VydCAvLyBmdW5kaW5nIG5vdCBiZSBpbml0aWFsaXplZCBvciBjYW4gYmUgZXh0ZW5kZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA1LTIwNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFyYzQuZW1pdChGdW5kaW5nU2V0KGFyYzQuVUludDY0KHNlbGYuZnVuZGluZyksIGZ1bmRpbmcpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA1LTIwNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFyYzQuZW1pdChGdW5kaW5nU2V0KGFyYzQuVUludDY0KHNlbGYuZnVuZGluZyksIGZ1bmRpbmcpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJGdW5kaW5nU2V0KHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA3CiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBmdW5kaW5nLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gc2VsZi5mdW5kaW5nID0gZnVuZGluZy5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuRnVuZGFibGUucmVkdWNlX3RvdGFsKGFkanVzdG1lbnQ6IGJ5dGVzKSAtPiB2b2lkOgpyZWR1Y2VfdG90YWw6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxOS0yMjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHJlZHVjZV90b3RhbChzZWxmLCBhZGp1c3RtZW50OiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjEtMjIyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIsICJtdXN0IGJlIGZ1bmRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxLTIyMgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyLCAibXVzdCBiZSBmdW5kZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGZ1bmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjMtMjI0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA9PSBVSW50NjQoMCkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyMy0yMjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI1LTIyNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBhZGp1c3RtZW50IDw9IHNlbGYudG90YWwsICJhZGp1c3RtZW50IGFjY3VyYXRlIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjUtMjI2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IGFkanVzdG1lbnQgPD0gc2VsZi50b3RhbCwgImFkanVzdG1lbnQgYWNjdXJhdGUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGI+PQogICAgYXNzZXJ0IC8vIGFkanVzdG1lbnQgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI3LTIyOAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHRvdGFsID0gc2VsZi50b3RhbCAtIGFkanVzdG1lbnQubmF0aXZlCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNy0yMjgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyB0b3RhbCA9IHNlbGYudG90YWwgLSBhZGp1c3RtZW50Lm5hdGl2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAtCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyOQogICAgLy8gYXJjNC5lbWl0KFRvdGFsUmVkdWNlZChhZGp1c3RtZW50LCBhcmM0LlVJbnQ2NCh0b3RhbCkpKQogICAgZHVwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbWV0aG9kICJUb3RhbFJlZHVjZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gc2VsZi50b3RhbCA9IHRvdGFsCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtlYWJsZS5zZXRfZGVsZWdhdGUoZGVsZWdhdGU6IGJ5dGVzKSAtPiB2b2lkOgpzZXRfZGVsZWdhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI5MC0yOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF9kZWxlZ2F0ZShzZWxmLCBkZWxlZ2F0ZTogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI5MwogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyOTMKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBibnogc2V0X2RlbGVnYXRlX2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBzZXRfZGVsZWdhdGVfYm9vbF9mYWxzZUAzCgpzZXRfZGVsZWdhdGVfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBzZXRfZGVsZWdhdGVfYm9vbF9tZXJnZUA0CgpzZXRfZGVsZWdhdGVfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCnNldF9kZWxlZ2F0ZV9ib29sX21lcmdlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI5Mi0yOTQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIm11c3QgYmUgb3duZXIgb3IgY3JlYXRvciIKICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyIG9yIGNyZWF0b3IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Mjk1CiAgICAvLyBhcmM0LmVtaXQoRGVsZWdhdGVVcGRhdGVkKGFyYzQuQWRkcmVzcyhzZWxmLmRlbGVnYXRlKSwgZGVsZWdhdGUpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjU2CiAgICAvLyBzZWxmLmRlbGVnYXRlID0gQWNjb3VudCgpCiAgICBieXRlICJkZWxlZ2F0ZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Mjk1CiAgICAvLyBhcmM0LmVtaXQoRGVsZWdhdGVVcGRhdGVkKGFyYzQuQWRkcmVzcyhzZWxmLmRlbGVnYXRlKSwgZGVsZWdhdGUpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGVnYXRlIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiRGVsZWdhdGVVcGRhdGVkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNTYKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyOTYKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBkZWxlZ2F0ZS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5TdGFrZWFibGUucGFydGljaXBhdGUodm90ZV9rOiBieXRlcywgc2VsX2s6IGJ5dGVzLCB2b3RlX2ZzdDogYnl0ZXMsIHZvdGVfbHN0OiBieXRlcywgdm90ZV9rZDogYnl0ZXMsIHNwX2tleTogYnl0ZXMpIC0+IHZvaWQ6CnBhcnRpY2lwYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyOTgtMzA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwYXJ0aWNpcGF0ZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHZvdGVfazogQnl0ZXMzMiwKICAgIC8vICAgICBzZWxfazogQnl0ZXMzMiwKICAgIC8vICAgICB2b3RlX2ZzdDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdm90ZV9sc3Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHZvdGVfa2Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHNwX2tleTogQnl0ZXM2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDYgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMTAKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZGVsZWdhdGUKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzEwCiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYub3duZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmRlbGVnYXRlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYm56IHBhcnRpY2lwYXRlX2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNTYKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMTAKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZGVsZWdhdGUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxlZ2F0ZSBleGlzdHMKICAgID09CiAgICBieiBwYXJ0aWNpcGF0ZV9ib29sX2ZhbHNlQDMKCnBhcnRpY2lwYXRlX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgcGFydGljaXBhdGVfYm9vbF9tZXJnZUA0CgpwYXJ0aWNpcGF0ZV9ib29sX2ZhbHNlQDM6CiAgICBpbnQgMAoKcGFydGljaXBhdGVfYm9vbF9tZXJnZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMDgtMzExCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZGVsZWdhdGUKICAgIC8vICksICJtdXN0IGJlIG93bmVyIG9yIGRlbGVnYXRlIgogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIgb3IgZGVsZWdhdGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzEyLTMxMwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8ga2V5X3JlZ19mZWUgPSBHbG9iYWwubWluX3R4bl9mZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzE0LTMxNQogICAgLy8gIyByZXF1aXJlIHBheW1lbnQgb2YgbWluIGZlZSB0byBwcmV2ZW50IGRyYWluaW5nCiAgICAvLyBhc3NlcnQgcmVxdWlyZV9wYXltZW50KFR4bi5zZW5kZXIpID09IGtleV9yZWdfZmVlLCAicGF5bWVudCBhbW91dCBhY2N1cmF0ZSIKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3V0IGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMjEKICAgIC8vIGFkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgZHVwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMyMC0zMjgKICAgIC8vIFBhcnRLZXlJbmZvKAogICAgLy8gICAgIGFkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIHZvdGVfa2V5PXZvdGVfaywKICAgIC8vICAgICBzZWxlY3Rpb25fa2V5PXNlbF9rLAogICAgLy8gICAgIHZvdGVfZmlyc3Q9dm90ZV9mc3QsCiAgICAvLyAgICAgdm90ZV9sYXN0PXZvdGVfbHN0LAogICAgLy8gICAgIHZvdGVfa2V5X2RpbHV0aW9uPXZvdGVfa2QsCiAgICAvLyAgICAgc3RhdGVfcHJvb2Zfa2V5PXNwX2tleSwKICAgIC8vICksCiAgICBmcmFtZV9kaWcgLTYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMxOC0zMjkKICAgIC8vIFBhcnRpY2lwYXRlZCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgUGFydEtleUluZm8oCiAgICAvLyAgICAgICAgIGFkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICB2b3RlX2tleT12b3RlX2ssCiAgICAvLyAgICAgICAgIHNlbGVjdGlvbl9rZXk9c2VsX2ssCiAgICAvLyAgICAgICAgIHZvdGVfZmlyc3Q9dm90ZV9mc3QsCiAgICAvLyAgICAgICAgIHZvdGVfbGFzdD12b3RlX2xzdCwKICAgIC8vICAgICAgICAgdm90ZV9rZXlfZGlsdXRpb249dm90ZV9rZCwKICAgIC8vICAgICAgICAgc3RhdGVfcHJvb2Zfa2V5PXNwX2tleSwKICAgIC8vICAgICApLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMxNi0zMzAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQYXJ0aWNpcGF0ZWQoCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgUGFydEtleUluZm8oCiAgICAvLyAgICAgICAgICAgICBhZGRyZXNzPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgICAgIHZvdGVfa2V5PXZvdGVfaywKICAgIC8vICAgICAgICAgICAgIHNlbGVjdGlvbl9rZXk9c2VsX2ssCiAgICAvLyAgICAgICAgICAgICB2b3RlX2ZpcnN0PXZvdGVfZnN0LAogICAgLy8gICAgICAgICAgICAgdm90ZV9sYXN0PXZvdGVfbHN0LAogICAgLy8gICAgICAgICAgICAgdm90ZV9rZXlfZGlsdXRpb249dm90ZV9rZCwKICAgIC8vICAgICAgICAgICAgIHN0YXRlX3Byb29mX2tleT1zcF9rZXksCiAgICAvLyAgICAgICAgICksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgbWV0aG9kICJQYXJ0aWNpcGF0ZWQoYWRkcmVzcywoYWRkcmVzcyxieXRlWzMyXSxieXRlWzMyXSx1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzY0XSkpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzMxLTMzOQogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9dm90ZV9rLmJ5dGVzLAogICAgLy8gICAgIHNlbGVjdGlvbl9rZXk9c2VsX2suYnl0ZXMsCiAgICAvLyAgICAgdm90ZV9maXJzdD12b3RlX2ZzdC5uYXRpdmUsCiAgICAvLyAgICAgdm90ZV9sYXN0PXZvdGVfbHN0Lm5hdGl2ZSwKICAgIC8vICAgICB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLm5hdGl2ZSwKICAgIC8vICAgICBzdGF0ZV9wcm9vZl9rZXk9c3Bfa2V5LmJ5dGVzLAogICAgLy8gICAgIGZlZT1rZXlfcmVnX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzM0CiAgICAvLyB2b3RlX2ZpcnN0PXZvdGVfZnN0Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtNAogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMzUKICAgIC8vIHZvdGVfbGFzdD12b3RlX2xzdC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzM2CiAgICAvLyB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFN0YXRlUHJvb2ZQSwogICAgaXR4bl9maWVsZCBWb3RlS2V5RGlsdXRpb24KICAgIGl0eG5fZmllbGQgVm90ZUxhc3QKICAgIGl0eG5fZmllbGQgVm90ZUZpcnN0CiAgICBmcmFtZV9kaWcgLTUKICAgIGl0eG5fZmllbGQgU2VsZWN0aW9uUEsKICAgIGZyYW1lX2RpZyAtNgogICAgaXR4bl9maWVsZCBWb3RlUEsKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzMxCiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIGludCBrZXlyZWcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMzMS0zMzkKICAgIC8vIGl0eG4uS2V5UmVnaXN0cmF0aW9uKAogICAgLy8gICAgIHZvdGVfa2V5PXZvdGVfay5ieXRlcywKICAgIC8vICAgICBzZWxlY3Rpb25fa2V5PXNlbF9rLmJ5dGVzLAogICAgLy8gICAgIHZvdGVfZmlyc3Q9dm90ZV9mc3QubmF0aXZlLAogICAgLy8gICAgIHZvdGVfbGFzdD12b3RlX2xzdC5uYXRpdmUsCiAgICAvLyAgICAgdm90ZV9rZXlfZGlsdXRpb249dm90ZV9rZC5uYXRpdmUsCiAgICAvLyAgICAgc3RhdGVfcHJvb2Zfa2V5PXNwX2tleS5ieXRlcywKICAgIC8vICAgICBmZWU9a2V5X3JlZ19mZWUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLnNldF92ZXJzaW9uKGNvbnRyYWN0X3ZlcnNpb246IGJ5dGVzLCBkZXBsb3ltZW50X3ZlcnNpb246IGJ5dGVzKSAtPiB2b2lkOgpzZXRfdmVyc2lvbjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3LTQ2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X3ZlcnNpb24oCiAgICAvLyAgICAgc2VsZiwgY29udHJhY3RfdmVyc2lvbjogYXJjNC5VSW50NjQsIGRlcGxveW1lbnRfdmVyc2lvbjogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjIKICAgIC8vIGFyYzQuZW1pdChWZXJzaW9uVXBkYXRlZChjb250cmFjdF92ZXJzaW9uLCBkZXBsb3ltZW50X3ZlcnNpb24pKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJWZXJzaW9uVXBkYXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDUKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJjb250cmFjdF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjMKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjQKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjQKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5hcHByb3ZlX3VwZGF0ZShhcHByb3ZhbDogYnl0ZXMpIC0+IHZvaWQ6CmFwcHJvdmVfdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzUtNDc2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBhcHByb3ZlX3VwZGF0ZShzZWxmLCBhcHByb3ZhbDogYXJjNC5Cb29sKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVXBkYXRlQXBwcm92ZWQoYWRkcmVzcyxib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGdldGJpdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDcKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmdyYW50X3VwZ3JhZGVyKHVwZ3JhZGVyOiBieXRlcykgLT4gdm9pZDoKZ3JhbnRfdXBncmFkZXI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MS00ODIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGdyYW50X3VwZ3JhZGVyKHNlbGYsIHVwZ3JhZGVyOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAibXVzdCBiZSBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgY3JlYXRvcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODQKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODQKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGdyYWRlckdyYW50ZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gc2VsZi51cGdyYWRlciA9IHVwZ3JhZGVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkRlcGxveWFibGUub25fY3JlYXRlKCkgLT4gdm9pZDoKb25fY3JlYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MTYtNTE3CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICAvLyBkZWYgb25fY3JlYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTE4CiAgICAvLyBjYWxsZXJfaWQgPSBHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkCiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MTkKICAgIC8vIGFzc2VydCBjYWxsZXJfaWQgPiAwLCAibXVzdCBiZSBjcmVhdGVkIGJ5IGZhY3RvcnkiCiAgICBkdXAKICAgIGFzc2VydCAvLyBtdXN0IGJlIGNyZWF0ZWQgYnkgZmFjdG9yeQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MDEKICAgIC8vIHNlbGYucGFyZW50X2lkID0gVUludDY0KCkKICAgIGJ5dGUgInBhcmVudF9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTIwCiAgICAvLyBzZWxmLnBhcmVudF9pZCA9IGNhbGxlcl9pZAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5vbl91cGRhdGUoKSAtPiB2b2lkOgpvbl91cGRhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2Ni00NjcKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgb25fdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY4LTQ3MQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIFdBUk5JTkc6IFRoaXMgYXBwIGNhbiBiZSB1cGRhdGVkIGJ5IHRoZSBjcmVhdG9yCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY4LTQ3MQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIFdBUk5JTkc6IFRoaXMgYXBwIGNhbiBiZSB1cGRhdGVkIGJ5IHRoZSBjcmVhdG9yCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGRhdGFibGUgZXhpc3RzCiAgICBpbnQgMQogICAgPT0KICAgIGFzc2VydCAvLyBub3QgYXBwcm92ZWQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkxNwogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6ICAjIHByYWdtYTogbm8gY292ZXIKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MDEKICAgIC8vIHNlbGYucGFyZW50X2lkID0gVUludDY0KCkKICAgIGJ5dGUgInBhcmVudF9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTE4LTkxOQogICAgLy8gIyBkZXBsb3lhYmxlIHN0YXRlCiAgICAvLyBzZWxmLnBhcmVudF9pZCA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTAyCiAgICAvLyBzZWxmLmRlcGxveWVyID0gQWNjb3VudCgpCiAgICBieXRlICJkZXBsb3llciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTIwCiAgICAvLyBzZWxmLmRlcGxveWVyID0gQWNjb3VudCgpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkyMS05MjIKICAgIC8vICMgc3Rha2VhYmxlIHN0YXRlCiAgICAvLyBzZWxmLmRlbGVnYXRlID0gQWNjb3VudCgpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gc2VsZi5zdGFrZWFibGUgPSBib29sKDEpCiAgICBieXRlICJzdGFrZWFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkyMwogICAgLy8gc2VsZi5zdGFrZWFibGUgPSBib29sKDEpCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA1CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTI0LTkyNQogICAgLy8gIyB1cGdyYWRlYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTI2CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA3CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTI3CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGludCAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MjgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTI5LTkzMAogICAgLy8gIyBvd25hYmxlIHN0YXRlCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4MwogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJwZXJpb2QiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkzMS05MzIKICAgIC8vICMgbG9ja2FibGUgc3RhdGUKICAgIC8vIHNlbGYucGVyaW9kID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODQKICAgIC8vIHNlbGYuaW5pdGlhbCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImluaXRpYWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkzMwogICAgLy8gc2VsZi5pbml0aWFsID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODUKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJkZWFkbGluZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTM0CiAgICAvLyBzZWxmLmRlYWRsaW5lID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODYKICAgIC8vIHNlbGYucGVyaW9kX3NlY29uZHMgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJwZXJpb2Rfc2Vjb25kcyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTM1CiAgICAvLyBzZWxmLnBlcmlvZF9zZWNvbmRzID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODcKICAgIC8vIHNlbGYubG9ja3VwX2RlbGF5ID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAibG9ja3VwX2RlbGF5IgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzYKICAgIC8vIHNlbGYubG9ja3VwX2RlbGF5ID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODgKICAgIC8vIHNlbGYudmVzdGluZ19kZWxheSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInZlc3RpbmdfZGVsYXkiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkzNwogICAgLy8gc2VsZi52ZXN0aW5nX2RlbGF5ID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1ODkKICAgIC8vIHNlbGYucGVyaW9kX2xpbWl0ID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kX2xpbWl0IgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzgKICAgIC8vIHNlbGYucGVyaW9kX2xpbWl0ID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1OTAKICAgIC8vIHNlbGYuZGlzdHJpYnV0aW9uX2NvdW50ID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGlzdHJpYnV0aW9uX2NvdW50IgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzkKICAgIC8vIHNlbGYuZGlzdHJpYnV0aW9uX2NvdW50ID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1OTEKICAgIC8vIHNlbGYuZGlzdHJpYnV0aW9uX3NlY29uZHMgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJkaXN0cmlidXRpb25fc2Vjb25kcyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTQwCiAgICAvLyBzZWxmLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzEKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk0MS05NDIKICAgIC8vICMgZnVuZGFibGUgc3RhdGUKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk0MwogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzMKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk0NAogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gVUludDY0KCkKICAgIGJ5dGUgIm1lc3Nlbmdlcl9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTQ1LTk0NgogICAgLy8gIyByZWNlaXZlciBzdGF0ZQogICAgLy8gc2VsZi5tZXNzZW5nZXJfaWQgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcC5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MTQtOTE2CiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcC5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDMxCiAgICBtZXRob2QgInRlbXBsYXRlKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcyl2b2lkIgogICAgbWV0aG9kICJ0ZW1wbGF0ZV9zaGFyZWQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAiaW5pdCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiaW5pdF9zaGFyZWQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZ2V0X3N0YXRlKCkoYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxib29sLGJvb2wsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgbWV0aG9kICJhYm9ydF9mdW5kaW5nKCl2b2lkIgogICAgbWV0aG9kICJ1cGRhdGUoKXZvaWQiCiAgICBtZXRob2QgInNldHVwKGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJjb25maWd1cmUodWludDY0KXZvaWQiCiAgICBtZXRob2QgInNldF9mdW5kaW5nKHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdWludDY0IgogICAgbWV0aG9kICJ3aXRoZHJhd19tYXgoKSh1aW50NjQsdWludDY0KSIKICAgIG1ldGhvZCAibWFiX2F0KHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgIm5leHRfdW5sb2NrKHVpbnQ2NCkodWludDY0LHVpbnQ2NCkiCiAgICBtZXRob2QgImNsb3NlKCl2b2lkIgogICAgbWV0aG9kICJ0cmFuc2ZlcihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgImZpbGwoKXZvaWQiCiAgICBtZXRob2QgImdyYW50X2Z1bmRlcihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgInJlZHVjZV90b3RhbCh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAic2V0X2RlbGVnYXRlKGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAicGFydGljaXBhdGUoYnl0ZVszMl0sYnl0ZVszMl0sdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVs2NF0pdm9pZCIKICAgIG1ldGhvZCAicGFydGljaXBhdGVfcG9vbGVkKGJ5dGVbMzJdLGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbNjRdKXZvaWQiCiAgICBtZXRob2QgInNldF92ZXJzaW9uKHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiYXBwcm92ZV91cGRhdGUoYm9vbCl2b2lkIgogICAgbWV0aG9kICJncmFudF91cGdyYWRlcihhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3RlbXBsYXRlX3JvdXRlQDQgbWFpbl90ZW1wbGF0ZV9zaGFyZWRfcm91dGVANSBtYWluX2luaXRfcm91dGVANiBtYWluX2luaXRfc2hhcmVkX3JvdXRlQDcgbWFpbl9nZXRfc3RhdGVfcm91dGVAOCBtYWluX2Fib3J0X2Z1bmRpbmdfcm91dGVAOSBtYWluX3VwZGF0ZV9yb3V0ZUAxMCBtYWluX3NldHVwX3JvdXRlQDExIG1haW5fY29uZmlndXJlX3JvdXRlQDEyIG1haW5fc2V0X2Z1bmRpbmdfcm91dGVAMTMgbWFpbl93aXRoZHJhd19yb3V0ZUAxNCBtYWluX3dpdGhkcmF3X21heF9yb3V0ZUAxNSBtYWluX21hYl9hdF9yb3V0ZUAxNiBtYWluX25leHRfdW5sb2NrX3JvdXRlQDE3IG1haW5fY2xvc2Vfcm91dGVAMTggbWFpbl90cmFuc2Zlcl9yb3V0ZUAxOSBtYWluX2ZpbGxfcm91dGVAMjAgbWFpbl9ncmFudF9mdW5kZXJfcm91dGVAMjEgbWFpbl9yZWR1Y2VfdG90YWxfcm91dGVAMjIgbWFpbl9zZXRfZGVsZWdhdGVfcm91dGVAMjMgbWFpbl9wYXJ0aWNpcGF0ZV9yb3V0ZUAyNCBtYWluX3BhcnRpY2lwYXRlX3Bvb2xlZF9yb3V0ZUAyNSBtYWluX3NldF92ZXJzaW9uX3JvdXRlQDI2IG1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVAMjcgbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUAyOAogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl90ZW1wbGF0ZV9yb3V0ZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDEwLTE0MTEKICAgIC8vICMgaW1wbGVtZW50cyBsb2NrYWJsZSB0ZW1wbGF0ZSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQxMC0xNDExCiAgICAvLyAjIGltcGxlbWVudHMgbG9ja2FibGUgdGVtcGxhdGUgbWV0aG9kCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgdGVtcGxhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdGVtcGxhdGVfc2hhcmVkX3JvdXRlQDU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NzUtMTQ3NwogICAgLy8gIyBpbXBsZW1lbnRzIGxvY2thYmxlIHRlbXBsYXRlX3NoYXJlZCBtZXRob2QKICAgIC8vICMgICBwYXJhbXMgYW5kIG1lc3NlbmdlciBpZCBhcmUgcmVhZCBmcm9tIHBhcmVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDc1LTE0NzcKICAgIC8vICMgaW1wbGVtZW50cyBsb2NrYWJsZSB0ZW1wbGF0ZV9zaGFyZWQgbWV0aG9kCiAgICAvLyAjICAgcGFyYW1zIGFuZCBtZXNzZW5nZXIgaWQgYXJlIHJlYWQgZnJvbSBwYXJlbnQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB0ZW1wbGF0ZV9zaGFyZWQKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5faW5pdF9yb3V0ZUA2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTMwLTE1MzMKICAgIC8vICMgY29tYmluZXMgdGVtcGxhdGUsIGdyYW50X3VwZ3JhZGVyIGFuZCBzZXR1cAogICAgLy8gIyAgIHNvIHRoYXQgZmFjdG9yeSBjcmVhdGlvbiBpcyBjcmVhdGUsIHBheW1lbnQKICAgIC8vICMgICBhbmQgaW5pdCwgZW1pdHMgc2FtZSBldmVudHMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxNAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTUKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDE1CiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMTUKICAgIGV4dHJhY3QgNjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUzMC0xNTMzCiAgICAvLyAjIGNvbWJpbmVzIHRlbXBsYXRlLCBncmFudF91cGdyYWRlciBhbmQgc2V0dXAKICAgIC8vICMgICBzbyB0aGF0IGZhY3RvcnkgY3JlYXRpb24gaXMgY3JlYXRlLCBwYXltZW50CiAgICAvLyAjICAgYW5kIGluaXQsIGVtaXRzIHNhbWUgZXZlbnRzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgaW5pdAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9pbml0X3NoYXJlZF9yb3V0ZUA3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTc0LTE1NzUKICAgIC8vICMgY29tYmluZXMgdGVtcGxhdGVfc2hhcmVkLCBncmFudF91cGdyYWRlciBhbmQgc2V0dXAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1NzQtMTU3NQogICAgLy8gIyBjb21iaW5lcyB0ZW1wbGF0ZV9zaGFyZWQsIGdyYW50X3VwZ3JhZGVyIGFuZCBzZXR1cAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGluaXRfc2hhcmVkCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dldF9zdGF0ZV9yb3V0ZUA4OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTk3LTE2MDEKICAgIC8vICMgc25hcHNob3Qgb2Ygc3RhdGUgZm9yIHdhbGxldHMgYW5kIGluZGV4ZXJzCiAgICAvLyAjICAgdGVtcGxhdGUgcGFyYW1ldGVycyBhcmUgcmVhZCBmcm9tIHBhcmVudAogICAgLy8gIyAgIHdoZW4gc2hhcmVkLCBtaW4gYmFsYW5jZSBpcyB0aGUgb25lCiAgICAvLyAjICAgd2l0aGRyYXcgZW5mb3JjZXMgbm93CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3N0YXRlCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2Fib3J0X2Z1bmRpbmdfcm91dGVAOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY0Ny0xNjQ5CiAgICAvLyAjIG92ZXJyaWRlIGZ1bmRhYmxlIGFib3J0X2Z1bmRpbmcgYWJpbWV0aG9kCiAgICAvLyAjICAgY2xvc2Ugb2ZmbGluZSBvbiBkZWxldGUgdG8gb3duZXIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVtPbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludCBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGFib3J0X2Z1bmRpbmcKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlX3JvdXRlQDEwOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjY2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0dXBfcm91dGVAMTE6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzZXR1cAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jb25maWd1cmVfcm91dGVAMTI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjb25maWd1cmUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X2Z1bmRpbmdfcm91dGVAMTM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4MC04ODMKICAgIC8vICMgb3ZlcnJpZGUgZnVuZGFibGUgc2V0X2Z1bmRpbmcgYWJpbWV0aG9kCiAgICAvLyAjICAgZGVyaXZlIGZ1bGx5IHZlc3RlZCBvbmNlLCBwZXJpb2QgY2FuIG5vCiAgICAvLyAjICAgbG9uZ2VyIGJlIGNvbmZpZ3VyZWQgYWZ0ZXIgZnVuZGluZyBpcyBzZXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgwLTg4MwogICAgLy8gIyBvdmVycmlkZSBmdW5kYWJsZSBzZXRfZnVuZGluZyBhYmltZXRob2QKICAgIC8vICMgICBkZXJpdmUgZnVsbHkgdmVzdGVkIG9uY2UsIHBlcmlvZCBjYW4gbm8KICAgIC8vICMgICBsb25nZXIgYmUgY29uZmlndXJlZCBhZnRlciBmdW5kaW5nIGlzIHNldAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9mdW5kaW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X3JvdXRlQDE0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OTYtOTEzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiB3aXRoZHJhdwogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gYW1vdW50CiAgICAvLyAjIHJldHVybnM6IG1pbiBiYWxhbmNlCiAgICAvLyAjIHB1cnBvc2U6IGV4dHJhY3QgZnVuZHMgZnJvbSBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG9ubHkgY2FsbGFibGUgYnkgb3duZXIKICAgIC8vICMgLSBsZXQgYmFsYW5jZSBiZSB0aGUgY3VycmVudCBiYWxhbmNlIG9mIHRoZQogICAgLy8gIyAgIGNvbnRyYWN0CiAgICAvLyAjIC0gYmFsYW5jZSAtIGFtb3VudCA+PSBtaW5fYmFsYW5jZQogICAgLy8gIyAgIChmZWUgcGFpZCBpbiBhcHBsIHR4bikKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIHRyYW5zZmVyIGFtb3VudCBmcm9tIHRoZSBjb250cmFjdCBhY2NvdW50CiAgICAvLyAjICAgdG8gb3duZXIKICAgIC8vICMgbm90ZXM6IGNvc3RzIDIgZmVlcwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OTYtOTEzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiB3aXRoZHJhdwogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gYW1vdW50CiAgICAvLyAjIHJldHVybnM6IG1pbiBiYWxhbmNlCiAgICAvLyAjIHB1cnBvc2U6IGV4dHJhY3QgZnVuZHMgZnJvbSBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG9ubHkgY2FsbGFibGUgYnkgb3duZXIKICAgIC8vICMgLSBsZXQgYmFsYW5jZSBiZSB0aGUgY3VycmVudCBiYWxhbmNlIG9mIHRoZQogICAgLy8gIyAgIGNvbnRyYWN0CiAgICAvLyAjIC0gYmFsYW5jZSAtIGFtb3VudCA+PSBtaW5fYmFsYW5jZQogICAgLy8gIyAgIChmZWUgcGFpZCBpbiBhcHBsIHR4bikKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIHRyYW5zZmVyIGFtb3VudCBmcm9tIHRoZSBjb250cmFjdCBhY2NvdW50CiAgICAvLyAjICAgdG8gb3duZXIKICAgIC8vICMgbm90ZXM6IGNvc3RzIDIgZmVlcwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHdpdGhkcmF3CiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X21heF9yb3V0ZUAxNToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTM4LTk0NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXdfbWF4CiAgICAvLyAjIHB1cnBvc2U6IHdpdGhkcmF3IGFsbCBmdW5kcyBhYm92ZSBtaW4KICAgIC8vICMgICBiYWxhbmNlIGluIG9uZSBjYWxsCiAgICAvLyAjIHJldHVybnM6CiAgICAvLyAjIC0gYW1vdW50IHdpdGhkcmF3bgogICAgLy8gIyAtIG1pbiBiYWxhbmNlIGFmdGVyIHdpdGhkcmF3CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgd2l0aGRyYXdfbWF4CiAgICBzd2FwCiAgICBpdG9iCiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fbWFiX2F0X3JvdXRlQDE2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NjctOTc2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBtYWJfYXQKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHRpbWVzdGFtcCwgd2hlbgogICAgLy8gIyBwdXJwb3NlOiBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlCiAgICAvLyAjICAgd2l0aGRyYXcgd291bGQgZW5mb3JjZSBhdCB0aW1lc3RhbXAKICAgIC8vICMgcmV0dXJuczogbWluaW11bSBhbGxvd2FibGUgYmFsYW5jZSwgdG90YWwKICAgIC8vICMgICBiZWZvcmUgZnVuZGluZyBpcyBzZXQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTY3LTk3NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogbWFiX2F0CiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSB0aW1lc3RhbXAsIHdoZW4KICAgIC8vICMgcHVycG9zZTogbWluaW11bSBhbGxvd2FibGUgYmFsYW5jZQogICAgLy8gIyAgIHdpdGhkcmF3IHdvdWxkIGVuZm9yY2UgYXQgdGltZXN0YW1wCiAgICAvLyAjIHJldHVybnM6IG1pbmltdW0gYWxsb3dhYmxlIGJhbGFuY2UsIHRvdGFsCiAgICAvLyAjICAgYmVmb3JlIGZ1bmRpbmcgaXMgc2V0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgbWFiX2F0CiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX25leHRfdW5sb2NrX3JvdXRlQDE3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5OTItMTAwNQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogbmV4dF91bmxvY2sKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHRpbWVzdGFtcCwgd2hlbgogICAgLy8gIyBwdXJwb3NlOiBzY2hlZHVsZSBuZXh0IHdpdGhkcmF3CiAgICAvLyAjIHJldHVybnM6CiAgICAvLyAjIC0gZmlyc3QgdGltZXN0YW1wIGFmdGVyIHRpbWVzdGFtcCBhdCB3aGljaAogICAgLy8gIyAgIG1pbmltdW0gYWxsb3dhYmxlIGJhbGFuY2UgZGVjcmVhc2VzLCAwIGlmCiAgICAvLyAjICAgaXQgZG9lcyBub3QgYmVmb3JlIGZ1bmRpbmcgaXMgc2V0IG9yCiAgICAvLyAjICAgb25jZSBmdWxseSBkaXN0cmlidXRlZAogICAgLy8gIyAtIG1pbmltdW0gYWxsb3dhYmxlIGJhbGFuY2UgdGhlbiwgb3IgYXQKICAgIC8vICMgICB0aW1lc3RhbXAgaWYgaXQgZG9lcyBub3QgZGVjcmVhc2UKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTkyLTEwMDUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IG5leHRfdW5sb2NrCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSB0aW1lc3RhbXAsIHdoZW4KICAgIC8vICMgcHVycG9zZTogc2NoZWR1bGUgbmV4dCB3aXRoZHJhdwogICAgLy8gIyByZXR1cm5zOgogICAgLy8gIyAtIGZpcnN0IHRpbWVzdGFtcCBhZnRlciB0aW1lc3RhbXAgYXQgd2hpY2gKICAgIC8vICMgICBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlIGRlY3JlYXNlcywgMCBpZgogICAgLy8gIyAgIGl0IGRvZXMgbm90IGJlZm9yZSBmdW5kaW5nIGlzIHNldCBvcgogICAgLy8gIyAgIG9uY2UgZnVsbHkgZGlzdHJpYnV0ZWQKICAgIC8vICMgLSBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlIHRoZW4sIG9yIGF0CiAgICAvLyAjICAgdGltZXN0YW1wIGlmIGl0IGRvZXMgbm90IGRlY3JlYXNlCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgbmV4dF91bmxvY2sKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jbG9zZV9yb3V0ZUAxODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzMS0xMDQzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjbG9zZQogICAgLy8gIyBwdXJwb3NlOiBkZWxldGVzIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zOgogICAgLy8gIyAtIG1pbiBiYWxhbmNlIGlzIDAKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIGNvbnRyYWN0IGlzIGRlbGV0ZWQKICAgIC8vICMgLSBhY2NvdW50IGNsb3NlZCBvdXQgdG8gb3duZXIgaWYgaXQgaGFzIGEgYmFsYW5jZQogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBzaG91bGQgYmUgYWxsZWQgd2l0aCBvbkNvbXBsZXRpb24KICAgIC8vICMgICBkZWxldGVBcHBsaWNhdGlvbgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9W09uQ29tcGxldGVBY3Rpb24uRGVsZXRlQXBwbGljYXRpb25dKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50IERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBEZWxldGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xvc2UKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfcm91dGVAMTk6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB0cmFuc2ZlcgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9maWxsX3JvdXRlQDIwOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBmaWxsCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dyYW50X2Z1bmRlcl9yb3V0ZUAyMToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM4MC0xMzgyCiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGdyYW50X2Z1bmRlcgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9yZWR1Y2VfdG90YWxfcm91dGVAMjI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIzNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZWR1Y2VfdG90YWwKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X2RlbGVnYXRlX3JvdXRlQDIzOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2RlbGVnYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3BhcnRpY2lwYXRlX3JvdXRlQDI0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzMxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgcGFydGljaXBhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fcGFydGljaXBhdGVfcG9vbGVkX3JvdXRlQDI1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgcGFydGljaXBhdGVfcG9vbGVkCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF92ZXJzaW9uX3JvdXRlQDI2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X3ZlcnNpb24KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVAMjc6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODAtMTM4MgogICAgLy8gY2xhc3MgQWlyZHJvcCgKICAgIC8vICAgICBMb2NrYWJsZSwgT3duYWJsZSwgRnVuZGFibGUsIERlcGxveWFibGUsIFN0YWtlYWJsZSwgVXBncmFkZWFibGUsIFJlY2VpdmVyCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhcHByb3ZlX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUAyODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM4MC0xMzgyCiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGdyYW50X3VwZ3JhZGVyCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AzMToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM4MC0xMzgyCiAgICAvLyBjbGFzcyBBaXJkcm9wKAogICAgLy8gICAgIExvY2thYmxlLCBPd25hYmxlLCBGdW5kYWJsZSwgRGVwbG95YWJsZSwgU3Rha2VhYmxlLCBVcGdyYWRlYWJsZSwgUmVjZWl2ZXIKICAgIC8vICk6CiAgICBpbnQgMAogICAgaW50IDQKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIG1hdGNoIG1haW5fb25fY3JlYXRlQDMyIG1haW5fb25fdXBkYXRlQDMzCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX29uX2NyZWF0ZUAzMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg5CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU4OS01OTAKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIC8vIGRlZiBvbl9jcmVhdGUoc2VsZikgLT4gTm9uZToKICAgIGNhbGxzdWIgb25fY3JlYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX29uX3VwZGF0ZUAzMzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM5CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM5LTU0MAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIGNhbGxzdWIgb25fdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3AudGVtcGxhdGUocGVyaW9kX2xpbWl0OiBieXRlcywgdmVzdGluZ19kZWxheTogYnl0ZXMsIGxvY2t1cF9kZWxheTogYnl0ZXMsIHBlcmlvZF9zZWNvbmRzOiBieXRlcywgbWVzc2VuZ2VyX2lkOiBieXRlcywgZGlzdHJpYnV0aW9uX2NvdW50OiBieXRlcywgZGlzdHJpYnV0aW9uX3NlY29uZHM6IGJ5dGVzLCBwZXJpb2Q6IGJ5dGVzLCBkZWFkbGluZTogYnl0ZXMsIHRvdGFsOiBieXRlcywgZnVuZGluZzogYnl0ZXMsIGRlbGVnYXRlOiBieXRlcykgLT4gdm9pZDoKdGVtcGxhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MTAtMTQyNgogICAgLy8gIyBpbXBsZW1lbnRzIGxvY2thYmxlIHRlbXBsYXRlIG1ldGhvZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgdGVtcGxhdGUoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBwZXJpb2RfbGltaXQ6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHZlc3RpbmdfZGVsYXk6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGxvY2t1cF9kZWxheTogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgcGVyaW9kX3NlY29uZHM6IGFyYzQuVUludDY0LAogICAgLy8gICAgIG1lc3Nlbmdlcl9pZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2NvdW50OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fc2Vjb25kczogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgcGVyaW9kOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBkZWFkbGluZTogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdG90YWw6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGZ1bmRpbmc6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGRlbGVnYXRlOiBhcmM0LkFkZHJlc3MsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAxMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MzAtMTQzMQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAibXVzdCBiZSBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgY3JlYXRvcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDMyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGFyYW1zLm1heWJlKClbMV0sICJwYXJhbXMgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODMzCiAgICAvLyBzZWxmLnBhcmFtcyA9IEdsb2JhbFN0YXRlKFBhcmFtcykKICAgIGJ5dGUgInBhcmFtcyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzMgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhcmFtcy5tYXliZSgpWzFdLCAicGFyYW1zIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBwYXJhbXMgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MzMKICAgIC8vIGFzc2VydCBzZWxmLm1lc3Nlbmdlcl9pZCA9PSBVSW50NjQoMCksICJtZXNzZW5nZXIgaWQgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjMKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gVUludDY0KCkKICAgIGJ5dGUgIm1lc3Nlbmdlcl9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzMwogICAgLy8gYXNzZXJ0IHNlbGYubWVzc2VuZ2VyX2lkID09IFVJbnQ2NCgwKSwgIm1lc3NlbmdlciBpZCBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVzc2VuZ2VyX2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIG1lc3NlbmdlciBpZCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzNAogICAgLy8gYXNzZXJ0IGRpc3RyaWJ1dGlvbl9zZWNvbmRzID4gVUludDY0KDApLCAiZGlzdHJpYnV0aW9uIHNlY29uZHMgbXVzdCBiZSBwb3NpdGl2ZSIKICAgIGludCAwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTYKICAgIGRpZyAxCiAgICBiPgogICAgYXNzZXJ0IC8vIGRpc3RyaWJ1dGlvbiBzZWNvbmRzIG11c3QgYmUgcG9zaXRpdmUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzNQogICAgLy8gYXNzZXJ0IGRpc3RyaWJ1dGlvbl9jb3VudCA+IFVJbnQ2NCgwKSwgImRpc3RyaWJ1dGlvbiBjb3VudCBtdXN0IGJlIHBvc2l0aXZlIgogICAgZnJhbWVfZGlnIC03CiAgICBiPAogICAgYXNzZXJ0IC8vIGRpc3RyaWJ1dGlvbiBjb3VudCBtdXN0IGJlIHBvc2l0aXZlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MzYKICAgIC8vIGFzc2VydCBzZWxmLnBlcmlvZCA9PSBVSW50NjQoMCksICJwZXJpb2Qgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY4CiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzNgogICAgLy8gYXNzZXJ0IHNlbGYucGVyaW9kID09IFVJbnQ2NCgwKSwgInBlcmlvZCBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVyaW9kIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIHBlcmlvZCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzNwogICAgLy8gYXNzZXJ0IHNlbGYuZGVhZGxpbmUgPT0gVUludDY0KDApLCAiZGVhZGxpbmUgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjcwCiAgICAvLyBzZWxmLmRlYWRsaW5lID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGVhZGxpbmUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MzcKICAgIC8vIGFzc2VydCBzZWxmLmRlYWRsaW5lID09IFVJbnQ2NCgwKSwgImRlYWRsaW5lIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWFkbGluZSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBkZWFkbGluZSBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQzOAogICAgLy8gYXNzZXJ0IHNlbGYudG90YWwgPT0gVUludDY0KDApLCAidG90YWwgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDM4CiAgICAvLyBhc3NlcnQgc2VsZi50b3RhbCA9PSBVSW50NjQoMCksICJ0b3RhbCBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gdG90YWwgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MzkKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApLCAiZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDM5CiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKSwgImZ1bmRpbmcgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ0MAogICAgLy8gYXNzZXJ0IHNlbGYuZGVsZWdhdGUgPT0gR2xvYmFsLnplcm9fYWRkcmVzcywgImRlbGVnYXRlIG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NDAKICAgIC8vIGFzc2VydCBzZWxmLmRlbGVnYXRlID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJkZWxlZ2F0ZSBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsZWdhdGUgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gZGVsZWdhdGUgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NDMtMTQ1NgogICAgLy8gVGVtcGxhdGUoCiAgICAvLyAgICAgcGVyaW9kX2xpbWl0LAogICAgLy8gICAgIHZlc3RpbmdfZGVsYXksCiAgICAvLyAgICAgbG9ja3VwX2RlbGF5LAogICAgLy8gICAgIHBlcmlvZF9zZWNvbmRzLAogICAgLy8gICAgIG1lc3Nlbmdlcl9pZCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY291bnQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX3NlY29uZHMsCiAgICAvLyAgICAgcGVyaW9kLAogICAgLy8gICAgIGRlYWRsaW5lLAogICAgLy8gICAgIHRvdGFsLAogICAgLy8gICAgIGZ1bmRpbmcsCiAgICAvLyAgICAgZGVsZWdhdGUsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEyCiAgICBmcmFtZV9kaWcgLTExCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMTAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC05CiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfZGlnIC04CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NDEtMTQ1NwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgVGVtcGxhdGUoCiAgICAvLyAgICAgICAgIHBlcmlvZF9saW1pdCwKICAgIC8vICAgICAgICAgdmVzdGluZ19kZWxheSwKICAgIC8vICAgICAgICAgbG9ja3VwX2RlbGF5LAogICAgLy8gICAgICAgICBwZXJpb2Rfc2Vjb25kcywKICAgIC8vICAgICAgICAgbWVzc2VuZ2VyX2lkLAogICAgLy8gICAgICAgICBkaXN0cmlidXRpb25fY291bnQsCiAgICAvLyAgICAgICAgIGRpc3RyaWJ1dGlvbl9zZWNvbmRzLAogICAgLy8gICAgICAgICBwZXJpb2QsCiAgICAvLyAgICAgICAgIGRlYWRsaW5lLAogICAgLy8gICAgICAgICB0b3RhbCwKICAgIC8vICAgICAgICAgZnVuZGluZywKICAgIC8vICAgICAgICAgZGVsZWdhdGUsCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgbWV0aG9kICJUZW1wbGF0ZSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ1OC0xNDY1CiAgICAvLyBzZWxmLnBhcmFtcy52YWx1ZSA9IFBhcmFtcygKICAgIC8vICAgICBwZXJpb2RfbGltaXQsCiAgICAvLyAgICAgdmVzdGluZ19kZWxheSwKICAgIC8vICAgICBsb2NrdXBfZGVsYXksCiAgICAvLyAgICAgcGVyaW9kX3NlY29uZHMsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2NvdW50LAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9zZWNvbmRzLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC03CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNgogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgzMwogICAgLy8gc2VsZi5wYXJhbXMgPSBHbG9iYWxTdGF0ZShQYXJhbXMpCiAgICBieXRlICJwYXJhbXMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NTgtMTQ2NQogICAgLy8gc2VsZi5wYXJhbXMudmFsdWUgPSBQYXJhbXMoCiAgICAvLyAgICAgcGVyaW9kX2xpbWl0LAogICAgLy8gICAgIHZlc3RpbmdfZGVsYXksCiAgICAvLyAgICAgbG9ja3VwX2RlbGF5LAogICAgLy8gICAgIHBlcmlvZF9zZWNvbmRzLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jb3VudCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fc2Vjb25kcywKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NjYKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gbWVzc2VuZ2VyX2lkLm5hdGl2ZQogICAgZnJhbWVfZGlnIC04CiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjYzCiAgICAvLyBzZWxmLm1lc3Nlbmdlcl9pZCA9IFVJbnQ2NCgpCiAgICBieXRlICJtZXNzZW5nZXJfaWQiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NjYKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gbWVzc2VuZ2VyX2lkLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ2NwogICAgLy8gc2VsZi5wZXJpb2QgPSBwZXJpb2QubmF0aXZlCiAgICBmcmFtZV9kaWcgLTUKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY4CiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ2NwogICAgLy8gc2VsZi5wZXJpb2QgPSBwZXJpb2QubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDY4CiAgICAvLyBzZWxmLmRlYWRsaW5lID0gZGVhZGxpbmUubmF0aXZlCiAgICBmcmFtZV9kaWcgLTQKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjcwCiAgICAvLyBzZWxmLmRlYWRsaW5lID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGVhZGxpbmUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NjgKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBkZWFkbGluZS5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NjkKICAgIC8vIHNlbGYudG90YWwgPSB0b3RhbC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMwogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NjkKICAgIC8vIHNlbGYudG90YWwgPSB0b3RhbC5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NzAKICAgIC8vIHNlbGYuZnVuZGluZyA9IGZ1bmRpbmcubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ3MAogICAgLy8gc2VsZi5mdW5kaW5nID0gZnVuZGluZy5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NzEKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBkZWxlZ2F0ZS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ3MgogICAgLy8gaWYgc2VsZi5mdW5kaW5nID4gMDoKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NzIKICAgIC8vIGlmIHNlbGYuZnVuZGluZyA+IDA6CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIGJ6IHRlbXBsYXRlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDczCiAgICAvLyBzZWxmLnN0b3JlX2Z1bGx5X3Zlc3RlZChzZWxmLnBhcmFtcy52YWx1ZS5jb3B5KCkpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzMKICAgIC8vIHNlbGYucGFyYW1zID0gR2xvYmFsU3RhdGUoUGFyYW1zKQogICAgYnl0ZSAicGFyYW1zIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDczCiAgICAvLyBzZWxmLnN0b3JlX2Z1bGx5X3Zlc3RlZChzZWxmLnBhcmFtcy52YWx1ZS5jb3B5KCkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFyYW1zIGV4aXN0cwogICAgY2FsbHN1YiBzdG9yZV9mdWxseV92ZXN0ZWQKICAgIHBvcAoKdGVtcGxhdGVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkxvY2thYmxlLnN0b3JlX2Z1bGx5X3Zlc3RlZChwYXJhbXM6IGJ5dGVzKSAtPiBieXRlczoKc3RvcmVfZnVsbHlfdmVzdGVkOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTExLTExMjYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHN0b3JlX2Z1bGx5X3Zlc3RlZCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBwYXJhbXMsIHRlbXBsYXRlIHBhcmFtZXRlcnMKICAgIC8vICMgcHVycG9zZTogZGVyaXZlIGZ1bGx5IHZlc3RlZCBvbmNlIGZ1bmRpbmcKICAgIC8vICMgICBpcyBzZXQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gZnVuZGluZyBzZXQKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIG9ubHkgc3RvcmVkIHdoZW4ga2V5IGV4aXN0cywgYXBwcwogICAgLy8gIyAgIHVwZ3JhZGVkIGZyb20gYmVmb3JlIGl0IHdhcyBhZGRlZAogICAgLy8gIyAgIGhhdmUgbm8gcm9vbSBmb3IgaXQgaW4gdGhlaXIgc2NoZW1hCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHN0b3JlX2Z1bGx5X3Zlc3RlZChzZWxmLCBwYXJhbXM6IFBhcmFtcykgLT4gTm9uZToKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTI3CiAgICAvLyBpZiBzZWxmLmZ1bGx5X3Zlc3RlZC5tYXliZSgpWzFdOgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODM0CiAgICAvLyBzZWxmLmZ1bGx5X3Zlc3RlZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGUgImZ1bGx5X3Zlc3RlZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEyNwogICAgLy8gaWYgc2VsZi5mdWxseV92ZXN0ZWQubWF5YmUoKVsxXToKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIGJ6IHN0b3JlX2Z1bGx5X3Zlc3RlZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEyOQogICAgLy8gcGFyYW1zLnZlc3RpbmdfZGVsYXkubmF0aXZlLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzMAogICAgLy8gcGFyYW1zLnBlcmlvZF9zZWNvbmRzLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTMxCiAgICAvLyBwYXJhbXMubG9ja3VwX2RlbGF5Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAxNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTMyCiAgICAvLyBzZWxmLnBlcmlvZCwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY2OAogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJwZXJpb2QiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMzIKICAgIC8vIHNlbGYucGVyaW9kLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlcmlvZCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzMwogICAgLy8gc2VsZi5mdW5kaW5nLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzMwogICAgLy8gc2VsZi5mdW5kaW5nLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMjgtMTEzNAogICAgLy8gc2VsZi5mdWxseV92ZXN0ZWQudmFsdWUgPSBjYWxjdWxhdGVfZnVsbHlfdmVzdGVkKAogICAgLy8gICAgIHBhcmFtcy52ZXN0aW5nX2RlbGF5Lm5hdGl2ZSwKICAgIC8vICAgICBwYXJhbXMucGVyaW9kX3NlY29uZHMubmF0aXZlLAogICAgLy8gICAgIHBhcmFtcy5sb2NrdXBfZGVsYXkubmF0aXZlLAogICAgLy8gICAgIHNlbGYucGVyaW9kLAogICAgLy8gICAgIHNlbGYuZnVuZGluZywKICAgIC8vICkKICAgIGNhbGxzdWIgY2FsY3VsYXRlX2Z1bGx5X3Zlc3RlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzQKICAgIC8vIHNlbGYuZnVsbHlfdmVzdGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZSAiZnVsbHlfdmVzdGVkIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTI4LTExMzQKICAgIC8vIHNlbGYuZnVsbHlfdmVzdGVkLnZhbHVlID0gY2FsY3VsYXRlX2Z1bGx5X3Zlc3RlZCgKICAgIC8vICAgICBwYXJhbXMudmVzdGluZ19kZWxheS5uYXRpdmUsCiAgICAvLyAgICAgcGFyYW1zLnBlcmlvZF9zZWNvbmRzLm5hdGl2ZSwKICAgIC8vICAgICBwYXJhbXMubG9ja3VwX2RlbGF5Lm5hdGl2ZSwKICAgIC8vICAgICBzZWxmLnBlcmlvZCwKICAgIC8vICAgICBzZWxmLmZ1bmRpbmcsCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKc3RvcmVfZnVsbHlfdmVzdGVkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIGZyYW1lX2RpZyAtMQogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0X21hYi5jYWxjdWxhdGVfZnVsbHlfdmVzdGVkKHZlc3RpbmdfZGVsYXk6IHVpbnQ2NCwgcGVyaW9kX3NlY29uZHM6IHVpbnQ2NCwgbG9ja3VwX2RlbGF5OiB1aW50NjQsIHBlcmlvZDogdWludDY0LCBmdW5kaW5nOiB1aW50NjQpIC0+IHVpbnQ2NDoKY2FsY3VsYXRlX2Z1bGx5X3Zlc3RlZDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjQtMjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNhbGN1bGF0ZV9mdWxseV92ZXN0ZWQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gdmVzdGluZ19kZWxheSwgaG93IG1hbnkgcGVyaW9kcyBpbiB2ZXN0aW5nCiAgICAvLyAjIC0gcGVyaW9kX3NlY29uZHMsIGhvdyBtYW55IHNlY29uZHMgaW4gcGVyaW9kCiAgICAvLyAjIC0gbG9ja3VwIGRlbGF5LCBob3cgbWFueSBwZXJpb2QgaW4gbG9ja3VwCiAgICAvLyAjIC0gcGVyaW9kLCBob3cgbWFueSBwZXJpb2RzCiAgICAvLyAjIC0gZnVuZGluZywgd2hlbiBmdW5kZWQKICAgIC8vICMgcHVycG9zZTogY2FsY3VsYXRlIHdoZW4gZnVsbHkgdmVzdGVkLCBmaXhlZAogICAgLy8gIyAgIG9uY2UgZnVuZGluZyBpcyBzZXQgc2luY2UgcGVyaW9kIGNhbiBubwogICAgLy8gIyAgIGxvbmdlciBiZSBjb25maWd1cmVkCiAgICAvLyAjIHJldHVybnMnIGZ1bGx5IHZlc3RlZCB0aW1lc3RhbXAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY3VsYXRlX2Z1bGx5X3Zlc3RlZCgKICAgIC8vICAgICB2ZXN0aW5nX2RlbGF5OiBVSW50NjQsCiAgICAvLyAgICAgcGVyaW9kX3NlY29uZHM6IFVJbnQ2NCwKICAgIC8vICAgICBsb2NrdXBfZGVsYXk6IFVJbnQ2NCwKICAgIC8vICAgICBwZXJpb2Q6IFVJbnQ2NCwKICAgIC8vICAgICBmdW5kaW5nOiBVSW50NjQsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDUgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MjUKICAgIC8vIGxvY2t1cF9wZXJpb2RzID0gbG9ja3VwX2RlbGF5ICogcGVyaW9kCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MjYKICAgIC8vIGxvY2t1cF9zZWNvbmRzID0gbG9ja3VwX3BlcmlvZHMgKiBwZXJpb2Rfc2Vjb25kcwogICAgZnJhbWVfZGlnIC00CiAgICAqCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weToyNwogICAgLy8gdmVzdGluZ19zZWNvbmRzID0gdmVzdGluZ19kZWxheSAqIHBlcmlvZF9zZWNvbmRzCiAgICBmcmFtZV9kaWcgLTUKICAgIGZyYW1lX2RpZyAtNAogICAgKgogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MjgKICAgIC8vIHJldHVybiBmdW5kaW5nICsgdmVzdGluZ19zZWNvbmRzICsgbG9ja3VwX3NlY29uZHMKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgKwogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3AudGVtcGxhdGVfc2hhcmVkKHBlcmlvZDogYnl0ZXMsIGRlYWRsaW5lOiBieXRlcywgdG90YWw6IGJ5dGVzLCBmdW5kaW5nOiBieXRlcywgZGVsZWdhdGU6IGJ5dGVzKSAtPiB2b2lkOgp0ZW1wbGF0ZV9zaGFyZWQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0NzUtMTQ4NQogICAgLy8gIyBpbXBsZW1lbnRzIGxvY2thYmxlIHRlbXBsYXRlX3NoYXJlZCBtZXRob2QKICAgIC8vICMgICBwYXJhbXMgYW5kIG1lc3NlbmdlciBpZCBhcmUgcmVhZCBmcm9tIHBhcmVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgdGVtcGxhdGVfc2hhcmVkKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcGVyaW9kOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBkZWFkbGluZTogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdG90YWw6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGZ1bmRpbmc6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGRlbGVnYXRlOiBhcmM0LkFkZHJlc3MsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA1IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ4OS0xNDkwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OTEKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXJhbXMubWF5YmUoKVsxXSwgInBhcmFtcyBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzMKICAgIC8vIHNlbGYucGFyYW1zID0gR2xvYmFsU3RhdGUoUGFyYW1zKQogICAgYnl0ZSAicGFyYW1zIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkxCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGFyYW1zLm1heWJlKClbMV0sICJwYXJhbXMgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIHBhcmFtcyBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5MgogICAgLy8gYXNzZXJ0IHNlbGYucGVyaW9kID09IFVJbnQ2NCgwKSwgInBlcmlvZCBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo2NjgKICAgIC8vIHNlbGYucGVyaW9kID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkyCiAgICAvLyBhc3NlcnQgc2VsZi5wZXJpb2QgPT0gVUludDY0KDApLCAicGVyaW9kIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZXJpb2QgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gcGVyaW9kIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkzCiAgICAvLyBhc3NlcnQgc2VsZi5kZWFkbGluZSA9PSBVSW50NjQoMCksICJkZWFkbGluZSBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo2NzAKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJkZWFkbGluZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5MwogICAgLy8gYXNzZXJ0IHNlbGYuZGVhZGxpbmUgPT0gVUludDY0KDApLCAiZGVhZGxpbmUgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlYWRsaW5lIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIGRlYWRsaW5lIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDk0CiAgICAvLyBhc3NlcnQgc2VsZi50b3RhbCA9PSBVSW50NjQoMCksICJ0b3RhbCBub3QgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OTQKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsID09IFVJbnQ2NCgwKSwgInRvdGFsIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyB0b3RhbCBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5NQogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA9PSBVSW50NjQoMCksICJmdW5kaW5nIG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OTUKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApLCAiZnVuZGluZyBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBmdW5kaW5nIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDk2CiAgICAvLyBhc3NlcnQgc2VsZi5kZWxlZ2F0ZSA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAiZGVsZWdhdGUgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Mjc0CiAgICAvLyBzZWxmLmRlbGVnYXRlID0gQWNjb3VudCgpCiAgICBieXRlICJkZWxlZ2F0ZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5NgogICAgLy8gYXNzZXJ0IHNlbGYuZGVsZWdhdGUgPT0gR2xvYmFsLnplcm9fYWRkcmVzcywgImRlbGVnYXRlIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxlZ2F0ZSBleGlzdHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBkZWxlZ2F0ZSBub3QgaW5pdGlhbGl6ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5Ny0xNDk4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHBhcmFtcyA9IHNlbGYuZ2V0X3BhcmFtcygpCiAgICBjYWxsc3ViIGdldF9wYXJhbXMKICAgIGR1cG4gMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDk5CiAgICAvLyBhc3NlcnQgcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzID4gMCwgImRpc3RyaWJ1dGlvbiBzZWNvbmRzIG11c3QgYmUgcG9zaXRpdmUiCiAgICBleHRyYWN0IDQwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYXNzZXJ0IC8vIGRpc3RyaWJ1dGlvbiBzZWNvbmRzIG11c3QgYmUgcG9zaXRpdmUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwMAogICAgLy8gYXNzZXJ0IHBhcmFtcy5kaXN0cmlidXRpb25fY291bnQgPiAwLCAiZGlzdHJpYnV0aW9uIGNvdW50IG11c3QgYmUgcG9zaXRpdmUiCiAgICBkaWcgMQogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBkaXN0cmlidXRpb24gY291bnQgbXVzdCBiZSBwb3NpdGl2ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAyCiAgICAvLyBzZWxmLnBhcmVudF9pZCwgYiJtZXNzZW5nZXJfaWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NzQKICAgIC8vIHNlbGYucGFyZW50X2lkID0gVUludDY0KCkKICAgIGJ5dGUgInBhcmVudF9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwMgogICAgLy8gc2VsZi5wYXJlbnRfaWQsIGIibWVzc2VuZ2VyX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhcmVudF9pZCBleGlzdHMKICAgIGJ5dGUgMHg2ZDY1NzM3MzY1NmU2NzY1NzI1ZjY5NjQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwMS0xNTAzCiAgICAvLyBtZXNzZW5nZXJfaWQsIG1lc3Nlbmdlcl9pZF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBzZWxmLnBhcmVudF9pZCwgYiJtZXNzZW5nZXJfaWQiCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTA0CiAgICAvLyBhc3NlcnQgbWVzc2VuZ2VyX2lkX2V4aXN0cywgIm1lc3NlbmdlciBpZCBleGlzdHMiCiAgICBhc3NlcnQgLy8gbWVzc2VuZ2VyIGlkIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTA4CiAgICAvLyBwYXJhbXMucGVyaW9kX2xpbWl0LAogICAgZGlnIDMKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTA5CiAgICAvLyBwYXJhbXMudmVzdGluZ19kZWxheSwKICAgIGRpZyA0CiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxMAogICAgLy8gcGFyYW1zLmxvY2t1cF9kZWxheSwKICAgIGRpZyA1CiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb3ZlciAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MTEKICAgIC8vIHBhcmFtcy5wZXJpb2Rfc2Vjb25kcywKICAgIHVuY292ZXIgNgogICAgZXh0cmFjdCAyNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEyCiAgICAvLyBhcmM0LlVJbnQ2NChtZXNzZW5nZXJfaWQpLAogICAgaXRvYgogICAgY292ZXIgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTA3LTE1MjAKICAgIC8vIFRlbXBsYXRlKAogICAgLy8gICAgIHBhcmFtcy5wZXJpb2RfbGltaXQsCiAgICAvLyAgICAgcGFyYW1zLnZlc3RpbmdfZGVsYXksCiAgICAvLyAgICAgcGFyYW1zLmxvY2t1cF9kZWxheSwKICAgIC8vICAgICBwYXJhbXMucGVyaW9kX3NlY29uZHMsCiAgICAvLyAgICAgYXJjNC5VSW50NjQobWVzc2VuZ2VyX2lkKSwKICAgIC8vICAgICBwYXJhbXMuZGlzdHJpYnV0aW9uX2NvdW50LAogICAgLy8gICAgIHBhcmFtcy5kaXN0cmlidXRpb25fc2Vjb25kcywKICAgIC8vICAgICBwZXJpb2QsCiAgICAvLyAgICAgZGVhZGxpbmUsCiAgICAvLyAgICAgdG90YWwsCiAgICAvLyAgICAgZnVuZGluZywKICAgIC8vICAgICBkZWxlZ2F0ZSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MDUtMTUyMQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgVGVtcGxhdGUoCiAgICAvLyAgICAgICAgIHBhcmFtcy5wZXJpb2RfbGltaXQsCiAgICAvLyAgICAgICAgIHBhcmFtcy52ZXN0aW5nX2RlbGF5LAogICAgLy8gICAgICAgICBwYXJhbXMubG9ja3VwX2RlbGF5LAogICAgLy8gICAgICAgICBwYXJhbXMucGVyaW9kX3NlY29uZHMsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KG1lc3Nlbmdlcl9pZCksCiAgICAvLyAgICAgICAgIHBhcmFtcy5kaXN0cmlidXRpb25fY291bnQsCiAgICAvLyAgICAgICAgIHBhcmFtcy5kaXN0cmlidXRpb25fc2Vjb25kcywKICAgIC8vICAgICAgICAgcGVyaW9kLAogICAgLy8gICAgICAgICBkZWFkbGluZSwKICAgIC8vICAgICAgICAgdG90YWwsCiAgICAvLyAgICAgICAgIGZ1bmRpbmcsCiAgICAvLyAgICAgICAgIGRlbGVnYXRlLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIG1ldGhvZCAiVGVtcGxhdGUodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MjIKICAgIC8vIHNlbGYucGVyaW9kID0gcGVyaW9kLm5hdGl2ZQogICAgZnJhbWVfZGlnIC01CiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY2OAogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJwZXJpb2QiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MjIKICAgIC8vIHNlbGYucGVyaW9kID0gcGVyaW9kLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUyMwogICAgLy8gc2VsZi5kZWFkbGluZSA9IGRlYWRsaW5lLm5hdGl2ZQogICAgZnJhbWVfZGlnIC00CiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY3MAogICAgLy8gc2VsZi5kZWFkbGluZSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRlYWRsaW5lIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTIzCiAgICAvLyBzZWxmLmRlYWRsaW5lID0gZGVhZGxpbmUubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTI0CiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTI0CiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTI1CiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBmdW5kaW5nLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MjUKICAgIC8vIHNlbGYuZnVuZGluZyA9IGZ1bmRpbmcubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNzQKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTI2CiAgICAvLyBzZWxmLmRlbGVnYXRlID0gZGVsZWdhdGUubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MjcKICAgIC8vIGlmIHNlbGYuZnVuZGluZyA+IDA6CiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTI3CiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPiAwOgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICBieiB0ZW1wbGF0ZV9zaGFyZWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MjgKICAgIC8vIHNlbGYuc3RvcmVfZnVsbHlfdmVzdGVkKHBhcmFtcykKICAgIGZyYW1lX2RpZyAwCiAgICBjYWxsc3ViIHN0b3JlX2Z1bGx5X3Zlc3RlZAogICAgcG9wCgp0ZW1wbGF0ZV9zaGFyZWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkxvY2thYmxlLmdldF9wYXJhbXMoKSAtPiBieXRlczoKZ2V0X3BhcmFtczoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzNi0xMTUwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfcGFyYW1zIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IHRlbXBsYXRlIHBhcmFtZXRlcnMKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdGVtcGxhdGVkCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBvd24gcGFyYW1zIHdoZW4gdGVtcGxhdGVkIHdpdGggdGVtcGxhdGUsCiAgICAvLyAjICAgb3duIGxlZ2FjeSBrZXlzIHdoZW4gdGVtcGxhdGVkIGJlZm9yZQogICAgLy8gIyAgIHBhcmFtcyB3YXMgYWRkZWQsIG90aGVyd2lzZSBwYXJhbXMgb2YKICAgIC8vICMgICBwYXJlbnQsIHBhcmVudCBtdXN0IGJlIGluIGZvcmVpZ24gYXBwcwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfcGFyYW1zKHNlbGYpIC0+IFBhcmFtczoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTUyCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZCwgYiJwYXJhbXMiCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGJ5dGUgMHg3MDYxNzI2MTZkNzMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE1MS0xMTUzCiAgICAvLyBwYXJhbXMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIGIicGFyYW1zIgogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE1NAogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3BhcmFtc19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE1NQogICAgLy8gcmV0dXJuIFBhcmFtcy5mcm9tX2J5dGVzKHBhcmFtcykKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9wYXJhbXNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTU2CiAgICAvLyBpZiBzZWxmLmlzX2xlZ2FjeSgpOgogICAgY2FsbHN1YiBpc19sZWdhY3kKICAgIGJ6IGdldF9wYXJhbXNfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNTgKICAgIC8vIGFyYzQuVUludDY0KG9wLkFwcEdsb2JhbC5nZXRfdWludDY0KGIicGVyaW9kX2xpbWl0IikpLAogICAgYnl0ZSAweDcwNjU3MjY5NmY2NDVmNmM2OTZkNjk3NAogICAgYXBwX2dsb2JhbF9nZXQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE1OQogICAgLy8gYXJjNC5VSW50NjQob3AuQXBwR2xvYmFsLmdldF91aW50NjQoYiJ2ZXN0aW5nX2RlbGF5IikpLAogICAgYnl0ZSAweDc2NjU3Mzc0Njk2ZTY3NWY2NDY1NmM2MTc5CiAgICBhcHBfZ2xvYmFsX2dldAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTYwCiAgICAvLyBhcmM0LlVJbnQ2NChvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChiImxvY2t1cF9kZWxheSIpKSwKICAgIGJ5dGUgMHg2YzZmNjM2Yjc1NzA1ZjY0NjU2YzYxNzkKICAgIGFwcF9nbG9iYWxfZ2V0CiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNjEKICAgIC8vIGFyYzQuVUludDY0KG9wLkFwcEdsb2JhbC5nZXRfdWludDY0KGIicGVyaW9kX3NlY29uZHMiKSksCiAgICBieXRlIDB4NzA2NTcyNjk2ZjY0NWY3MzY1NjM2ZjZlNjQ3MwogICAgYXBwX2dsb2JhbF9nZXQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE2MgogICAgLy8gYXJjNC5VSW50NjQob3AuQXBwR2xvYmFsLmdldF91aW50NjQoYiJkaXN0cmlidXRpb25fY291bnQiKSksCiAgICBieXRlIDB4NjQ2OTczNzQ3MjY5NjI3NTc0Njk2ZjZlNWY2MzZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTYzCiAgICAvLyBhcmM0LlVJbnQ2NChvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChiImRpc3RyaWJ1dGlvbl9zZWNvbmRzIikpLAogICAgYnl0ZSAweDY0Njk3Mzc0NzI2OTYyNzU3NDY5NmY2ZTVmNzM2NTYzNmY2ZTY0NzMKICAgIGFwcF9nbG9iYWxfZ2V0CiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNTctMTE2NAogICAgLy8gcmV0dXJuIFBhcmFtcygKICAgIC8vICAgICBhcmM0LlVJbnQ2NChvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChiInBlcmlvZF9saW1pdCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChiInZlc3RpbmdfZGVsYXkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQob3AuQXBwR2xvYmFsLmdldF91aW50NjQoYiJsb2NrdXBfZGVsYXkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQob3AuQXBwR2xvYmFsLmdldF91aW50NjQoYiJwZXJpb2Rfc2Vjb25kcyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChiImRpc3RyaWJ1dGlvbl9jb3VudCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChiImRpc3RyaWJ1dGlvbl9zZWNvbmRzIikpLAogICAgLy8gKQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9wYXJhbXNfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY1CiAgICAvLyBwYXJhbXMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoc2VsZi5wYXJlbnRfaWQsIGIicGFyYW1zIikKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU3NAogICAgLy8gc2VsZi5wYXJlbnRfaWQgPSBVSW50NjQoKQogICAgYnl0ZSAicGFyZW50X2lkIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY1CiAgICAvLyBwYXJhbXMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoc2VsZi5wYXJlbnRfaWQsIGIicGFyYW1zIikKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJlbnRfaWQgZXhpc3RzCiAgICBieXRlIDB4NzA2MTcyNjE2ZDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY2CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAicGFyYW1zIGV4aXN0IgogICAgYXNzZXJ0IC8vIHBhcmFtcyBleGlzdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY3CiAgICAvLyByZXR1cm4gUGFyYW1zLmZyb21fYnl0ZXMocGFyYW1zKQogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkxvY2thYmxlLmlzX2xlZ2FjeSgpIC0+IHVpbnQ2NDoKaXNfbGVnYWN5OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY5LTExNzkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGlzX2xlZ2FjeSAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiB3aGV0aGVyIHVwZ3JhZGVkIGluIHBsYWNlIGZyb20gYQogICAgLy8gIyAgIHZlcnNpb24gc3RvcmluZyB0ZW1wbGF0ZSBwYXJhbWV0ZXJzIGluCiAgICAvLyAjICAgaW5kaXZpZHVhbCBrZXlzIGluc3RlYWQgb2YgcGFyYW1zCiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpc19sZWdhY3koc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTgxCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZCwgYiJwZXJpb2RfbGltaXQiCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGJ5dGUgMHg3MDY1NzI2OTZmNjQ1ZjZjNjk2ZDY5NzQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE4MC0xMTgyCiAgICAvLyByZXR1cm4gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIGIicGVyaW9kX2xpbWl0IgogICAgLy8gKVsxXQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGJ1cnkgMQogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3AuaW5pdChwZXJpb2RfbGltaXQ6IGJ5dGVzLCB2ZXN0aW5nX2RlbGF5OiBieXRlcywgbG9ja3VwX2RlbGF5OiBieXRlcywgcGVyaW9kX3NlY29uZHM6IGJ5dGVzLCBtZXNzZW5nZXJfaWQ6IGJ5dGVzLCBkaXN0cmlidXRpb25fY291bnQ6IGJ5dGVzLCBkaXN0cmlidXRpb25fc2Vjb25kczogYnl0ZXMsIHBlcmlvZDogYnl0ZXMsIGRlYWRsaW5lOiBieXRlcywgdG90YWw6IGJ5dGVzLCBmdW5kaW5nOiBieXRlcywgZGVsZWdhdGU6IGJ5dGVzLCB1cGdyYWRlcjogYnl0ZXMsIGRlcGxveWVyOiBieXRlcywgb3duZXI6IGJ5dGVzLCBmdW5kZXI6IGJ5dGVzLCBpbml0aWFsOiBieXRlcykgLT4gdm9pZDoKaW5pdDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUzMC0xNTUzCiAgICAvLyAjIGNvbWJpbmVzIHRlbXBsYXRlLCBncmFudF91cGdyYWRlciBhbmQgc2V0dXAKICAgIC8vICMgICBzbyB0aGF0IGZhY3RvcnkgY3JlYXRpb24gaXMgY3JlYXRlLCBwYXltZW50CiAgICAvLyAjICAgYW5kIGluaXQsIGVtaXRzIHNhbWUgZXZlbnRzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBpbml0KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcGVyaW9kX2xpbWl0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2ZXN0aW5nX2RlbGF5OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBsb2NrdXBfZGVsYXk6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHBlcmlvZF9zZWNvbmRzOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBtZXNzZW5nZXJfaWQ6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jb3VudDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX3NlY29uZHM6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHBlcmlvZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZGVhZGxpbmU6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHRvdGFsOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBmdW5kaW5nOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBkZWxlZ2F0ZTogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIHVwZ3JhZGVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZGVwbG95ZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBvd25lcjogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIGZ1bmRlcjogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIGluaXRpYWw6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMTcgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTU3LTE1NzAKICAgIC8vIHNlbGYudGVtcGxhdGUoCiAgICAvLyAgICAgcGVyaW9kX2xpbWl0LAogICAgLy8gICAgIHZlc3RpbmdfZGVsYXksCiAgICAvLyAgICAgbG9ja3VwX2RlbGF5LAogICAgLy8gICAgIHBlcmlvZF9zZWNvbmRzLAogICAgLy8gICAgIG1lc3Nlbmdlcl9pZCwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY291bnQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX3NlY29uZHMsCiAgICAvLyAgICAgcGVyaW9kLAogICAgLy8gICAgIGRlYWRsaW5lLAogICAgLy8gICAgIHRvdGFsLAogICAgLy8gICAgIGZ1bmRpbmcsCiAgICAvLyAgICAgZGVsZWdhdGUsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTE3CiAgICBmcmFtZV9kaWcgLTE2CiAgICBmcmFtZV9kaWcgLTE1CiAgICBmcmFtZV9kaWcgLTE0CiAgICBmcmFtZV9kaWcgLTEzCiAgICBmcmFtZV9kaWcgLTEyCiAgICBmcmFtZV9kaWcgLTExCiAgICBmcmFtZV9kaWcgLTEwCiAgICBmcmFtZV9kaWcgLTkKICAgIGZyYW1lX2RpZyAtOAogICAgZnJhbWVfZGlnIC03CiAgICBmcmFtZV9kaWcgLTYKICAgIGNhbGxzdWIgdGVtcGxhdGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTU3MQogICAgLy8gc2VsZi5ncmFudF91cGdyYWRlcih1cGdyYWRlcikKICAgIGZyYW1lX2RpZyAtNQogICAgY2FsbHN1YiBncmFudF91cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTcyCiAgICAvLyBzZWxmLnNldHVwKGRlcGxveWVyLCBvd25lciwgZnVuZGVyLCBpbml0aWFsKQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHNldHVwCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuZ3JhbnRfdXBncmFkZXIodXBncmFkZXI6IGJ5dGVzKSAtPiB2b2lkOgpncmFudF91cGdyYWRlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU0LTU1NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZ3JhbnRfdXBncmFkZXIoc2VsZiwgdXBncmFkZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZ3JhZGVyR3JhbnRlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gdXBncmFkZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUuc2V0dXAoZGVwbG95ZXI6IGJ5dGVzLCBvd25lcjogYnl0ZXMsIGZ1bmRlcjogYnl0ZXMsIGluaXRpYWw6IGJ5dGVzKSAtPiB2b2lkOgpzZXR1cDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODQ1LTg1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0dXAoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBkZXBsb3llcjogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIG93bmVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZnVuZGVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgaW5pdGlhbDogYXJjNC5VSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODUzLTg1NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5vd25lciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAib3duZXIgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NTMtODU0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLm93bmVyID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJvd25lciBub3QgaW5pdGlhbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gb3duZXIgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg1NQogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJmdW5kZXIgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5CiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NTUKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRlciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAiZnVuZGVyIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gZnVuZGVyIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NTYtODU3CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg1OC04NTkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KFNldHVwKGRlcGxveWVyLCBvd25lciwgZnVuZGVyLCBpbml0aWFsKSkKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJTZXR1cChhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTc1CiAgICAvLyBzZWxmLmRlcGxveWVyID0gQWNjb3VudCgpCiAgICBieXRlICJkZXBsb3llciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODYwCiAgICAvLyBzZWxmLmRlcGxveWVyID0gZGVwbG95ZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODYxCiAgICAvLyBzZWxmLm93bmVyID0gb3duZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODYyCiAgICAvLyBzZWxmLmZ1bmRlciA9IGZ1bmRlci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODYzCiAgICAvLyBzZWxmLmluaXRpYWwgPSBpbml0aWFsLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY2OQogICAgLy8gc2VsZi5pbml0aWFsID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiaW5pdGlhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODYzCiAgICAvLyBzZWxmLmluaXRpYWwgPSBpbml0aWFsLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wLmluaXRfc2hhcmVkKHBlcmlvZDogYnl0ZXMsIGRlYWRsaW5lOiBieXRlcywgdG90YWw6IGJ5dGVzLCBmdW5kaW5nOiBieXRlcywgZGVsZWdhdGU6IGJ5dGVzLCB1cGdyYWRlcjogYnl0ZXMsIGRlcGxveWVyOiBieXRlcywgb3duZXI6IGJ5dGVzLCBmdW5kZXI6IGJ5dGVzLCBpbml0aWFsOiBieXRlcykgLT4gdm9pZDoKaW5pdF9zaGFyZWQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1NzQtMTU4OAogICAgLy8gIyBjb21iaW5lcyB0ZW1wbGF0ZV9zaGFyZWQsIGdyYW50X3VwZ3JhZGVyIGFuZCBzZXR1cAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgaW5pdF9zaGFyZWQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBwZXJpb2Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGRlYWRsaW5lOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB0b3RhbDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZnVuZGluZzogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgZGVsZWdhdGU6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICB1cGdyYWRlcjogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIGRlcGxveWVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgb3duZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBmdW5kZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBpbml0aWFsOiBhcmM0LlVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDEwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTU5MwogICAgLy8gc2VsZi50ZW1wbGF0ZV9zaGFyZWQocGVyaW9kLCBkZWFkbGluZSwgdG90YWwsIGZ1bmRpbmcsIGRlbGVnYXRlKQogICAgZnJhbWVfZGlnIC0xMAogICAgZnJhbWVfZGlnIC05CiAgICBmcmFtZV9kaWcgLTgKICAgIGZyYW1lX2RpZyAtNwogICAgZnJhbWVfZGlnIC02CiAgICBjYWxsc3ViIHRlbXBsYXRlX3NoYXJlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTk0CiAgICAvLyBzZWxmLmdyYW50X3VwZ3JhZGVyKHVwZ3JhZGVyKQogICAgZnJhbWVfZGlnIC01CiAgICBjYWxsc3ViIGdyYW50X3VwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1OTUKICAgIC8vIHNlbGYuc2V0dXAoZGVwbG95ZXIsIG93bmVyLCBmdW5kZXIsIGluaXRpYWwpCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgc2V0dXAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wLmdldF9zdGF0ZSgpIC0+IGJ5dGVzOgpnZXRfc3RhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1OTctMTYwMgogICAgLy8gIyBzbmFwc2hvdCBvZiBzdGF0ZSBmb3Igd2FsbGV0cyBhbmQgaW5kZXhlcnMKICAgIC8vICMgICB0ZW1wbGF0ZSBwYXJhbWV0ZXJzIGFyZSByZWFkIGZyb20gcGFyZW50CiAgICAvLyAjICAgd2hlbiBzaGFyZWQsIG1pbiBiYWxhbmNlIGlzIHRoZSBvbmUKICAgIC8vICMgICB3aXRoZHJhdyBlbmZvcmNlcyBub3cKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9zdGF0ZShzZWxmKSAtPiBBaXJkcm9wU3RhdGU6CiAgICBwcm90byAwIDEKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYwNgogICAgLy8gcGFyYW1zID0gc2VsZi5nZXRfcGFyYW1zKCkKICAgIGNhbGxzdWIgZ2V0X3BhcmFtcwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjA3CiAgICAvLyBtZXNzZW5nZXJfaWQgPSBzZWxmLm1lc3Nlbmdlcl9pZAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjMKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gVUludDY0KCkKICAgIGJ5dGUgIm1lc3Nlbmdlcl9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYwNwogICAgLy8gbWVzc2VuZ2VyX2lkID0gc2VsZi5tZXNzZW5nZXJfaWQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVzc2VuZ2VyX2lkIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjA4CiAgICAvLyBpZiBub3Qgc2VsZi5wYXJhbXMubWF5YmUoKVsxXSBhbmQgbm90IHNlbGYuaXNfbGVnYWN5KCk6CiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzMKICAgIC8vIHNlbGYucGFyYW1zID0gR2xvYmFsU3RhdGUoUGFyYW1zKQogICAgYnl0ZSAicGFyYW1zIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjA4CiAgICAvLyBpZiBub3Qgc2VsZi5wYXJhbXMubWF5YmUoKVsxXSBhbmQgbm90IHNlbGYuaXNfbGVnYWN5KCk6CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYnVyeSAxCiAgICBibnogZ2V0X3N0YXRlX2FmdGVyX2lmX2Vsc2VAMwogICAgY2FsbHN1YiBpc19sZWdhY3kKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDMKICAgIGJueiBnZXRfc3RhdGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MTAKICAgIC8vIHNlbGYucGFyZW50X2lkLCBiIm1lc3Nlbmdlcl9pZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU3NAogICAgLy8gc2VsZi5wYXJlbnRfaWQgPSBVSW50NjQoKQogICAgYnl0ZSAicGFyZW50X2lkIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjEwCiAgICAvLyBzZWxmLnBhcmVudF9pZCwgYiJtZXNzZW5nZXJfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFyZW50X2lkIGV4aXN0cwogICAgYnl0ZSAweDZkNjU3MzczNjU2ZTY3NjU3MjVmNjk2NAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjA5LTE2MTEKICAgIC8vIG1lc3Nlbmdlcl9pZCwgbWVzc2VuZ2VyX2lkX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHNlbGYucGFyZW50X2lkLCBiIm1lc3Nlbmdlcl9pZCIKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGZyYW1lX2J1cnkgMwoKZ2V0X3N0YXRlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYxMgogICAgLy8gZnVsbHlfdmVzdGVkID0gVUludDY0KDApCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MTMKICAgIC8vIGlmIHNlbGYuZnVuZGluZyA+IDA6CiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjEzCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPiAwOgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICBieiBnZXRfc3RhdGVfZWxzZV9ib2R5QDUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYxNAogICAgLy8gZnVsbHlfdmVzdGVkID0gc2VsZi5nZXRfZnVsbHlfdmVzdGVkKHBhcmFtcykKICAgIGZyYW1lX2RpZyAxCiAgICBjYWxsc3ViIGdldF9mdWxseV92ZXN0ZWQKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MTUKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi5jYWxjdWxhdGVfbWluX2JhbGFuY2UoKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWluX2JhbGFuY2UKICAgIGIgZ2V0X3N0YXRlX2FmdGVyX2lmX2Vsc2VANgoKZ2V0X3N0YXRlX2Vsc2VfYm9keUA1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjE3CiAgICAvLyBtaW5fYmFsYW5jZSA9IHNlbGYudG90YWwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYxNwogICAgLy8gbWluX2JhbGFuY2UgPSBzZWxmLnRvdGFsCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCgpnZXRfc3RhdGVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjE5CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MTkKICAgIC8vIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYyMAogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYuZnVuZGVyKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYyMAogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYuZnVuZGVyKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MjEKICAgIC8vIGFyYzQuQWRkcmVzcyhzZWxmLmRlbGVnYXRlKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MjEKICAgIC8vIGFyYzQuQWRkcmVzcyhzZWxmLmRlbGVnYXRlKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxlZ2F0ZSBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYyMgogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYuZGVwbG95ZXIpLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTc1CiAgICAvLyBzZWxmLmRlcGxveWVyID0gQWNjb3VudCgpCiAgICBieXRlICJkZXBsb3llciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYyMgogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYuZGVwbG95ZXIpLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcGxveWVyIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjIzCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjIzCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MjQKICAgIC8vIGFyYzQuVUludDY0KHNlbGYucGFyZW50X2lkKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU3NAogICAgLy8gc2VsZi5wYXJlbnRfaWQgPSBVSW50NjQoKQogICAgYnl0ZSAicGFyZW50X2lkIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjI0CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnBhcmVudF9pZCksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFyZW50X2lkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjI1CiAgICAvLyBhcmM0LlVJbnQ2NChtZXNzZW5nZXJfaWQpLAogICAgZnJhbWVfZGlnIDIKICAgIGl0b2IKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYyNgogICAgLy8gcGFyYW1zLnBlcmlvZF9saW1pdCwKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjI3CiAgICAvLyBwYXJhbXMudmVzdGluZ19kZWxheSwKICAgIGR1cAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb3ZlciA0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MjgKICAgIC8vIHBhcmFtcy5sb2NrdXBfZGVsYXksCiAgICBkdXAKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYyOQogICAgLy8gcGFyYW1zLnBlcmlvZF9zZWNvbmRzLAogICAgZHVwCiAgICBleHRyYWN0IDI0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb3ZlciA2CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MzAKICAgIC8vIHBhcmFtcy5kaXN0cmlidXRpb25fY291bnQsCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYzMQogICAgLy8gcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLAogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgNwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjMyCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnBlcmlvZCksCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo2NjgKICAgIC8vIHNlbGYucGVyaW9kID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjMyCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnBlcmlvZCksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVyaW9kIGV4aXN0cwogICAgaXRvYgogICAgY292ZXIgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjMzCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmRlYWRsaW5lKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY3MAogICAgLy8gc2VsZi5kZWFkbGluZSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRlYWRsaW5lIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjMzCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmRlYWRsaW5lKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWFkbGluZSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYzNAogICAgLy8gYXJjNC5VSW50NjQoc2VsZi50b3RhbCksCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MzQKICAgIC8vIGFyYzQuVUludDY0KHNlbGYudG90YWwpLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjM1CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmZ1bmRpbmcpLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYzNQogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5mdW5kaW5nKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjM2CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmluaXRpYWwpLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY5CiAgICAvLyBzZWxmLmluaXRpYWwgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJpbml0aWFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjM2CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmluaXRpYWwpLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmluaXRpYWwgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MzcKICAgIC8vIGFyYzQuVUludDY0KGZ1bGx5X3Zlc3RlZCksCiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjM4CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmNvbnRyYWN0X3ZlcnNpb24pLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYzOAogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5jb250cmFjdF92ZXJzaW9uKSwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb250cmFjdF92ZXJzaW9uIGV4aXN0cwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjM5CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiksCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTYzOQogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24pLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY0MAogICAgLy8gYXJjNC5Cb29sKHNlbGYudXBkYXRhYmxlKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NDAKICAgIC8vIGFyYzQuQm9vbChzZWxmLnVwZGF0YWJsZSksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBkYXRhYmxlIGV4aXN0cwogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY0MQogICAgLy8gYXJjNC5Cb29sKHNlbGYuc3Rha2VhYmxlKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gc2VsZi5zdGFrZWFibGUgPSBib29sKDEpCiAgICBieXRlICJzdGFrZWFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NDEKICAgIC8vIGFyYzQuQm9vbChzZWxmLnN0YWtlYWJsZSksCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3Rha2VhYmxlIGV4aXN0cwogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY0MgogICAgLy8gYXJjNC5VSW50NjQob3AuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKSksCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYmFsYW5jZQogICAgaXRvYgogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjQzCiAgICAvLyBhcmM0LlVJbnQ2NChtaW5fYmFsYW5jZSksCiAgICB1bmNvdmVyIDI0CiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NDQKICAgIC8vIGFyYzQuVUludDY0KGdldF9hdmFpbGFibGVfYmFsYW5jZSgpKSwKICAgIGNhbGxzdWIgZ2V0X2F2YWlsYWJsZV9iYWxhbmNlCiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2MTgtMTY0NQogICAgLy8gcmV0dXJuIEFpcmRyb3BTdGF0ZSgKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYuZnVuZGVyKSwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi5kZWxlZ2F0ZSksCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYuZGVwbG95ZXIpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnBhcmVudF9pZCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQobWVzc2VuZ2VyX2lkKSwKICAgIC8vICAgICBwYXJhbXMucGVyaW9kX2xpbWl0LAogICAgLy8gICAgIHBhcmFtcy52ZXN0aW5nX2RlbGF5LAogICAgLy8gICAgIHBhcmFtcy5sb2NrdXBfZGVsYXksCiAgICAvLyAgICAgcGFyYW1zLnBlcmlvZF9zZWNvbmRzLAogICAgLy8gICAgIHBhcmFtcy5kaXN0cmlidXRpb25fY291bnQsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYucGVyaW9kKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLmRlYWRsaW5lKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnRvdGFsKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLmZ1bmRpbmcpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuaW5pdGlhbCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoZnVsbHlfdmVzdGVkKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLmNvbnRyYWN0X3ZlcnNpb24pLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuZGVwbG95bWVudF92ZXJzaW9uKSwKICAgIC8vICAgICBhcmM0LkJvb2woc2VsZi51cGRhdGFibGUpLAogICAgLy8gICAgIGFyYzQuQm9vbChzZWxmLnN0YWtlYWJsZSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQob3AuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQobWluX2JhbGFuY2UpLAogICAgLy8gICAgIGFyYzQuVUludDY0KGdldF9hdmFpbGFibGVfYmFsYW5jZSgpKSwKICAgIC8vICkKICAgIHVuY292ZXIgMjUKICAgIHVuY292ZXIgMjUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMjIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDEzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDE0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDE0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDExCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICBzd2FwCiAgICBpbnQgMAogICAgZ2V0Yml0CiAgICBpbnQgMjMwNQogICAgc3dhcAogICAgc2V0Yml0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkxvY2thYmxlLmdldF9mdWxseV92ZXN0ZWQocGFyYW1zOiBieXRlcykgLT4gdWludDY0LCBieXRlczoKZ2V0X2Z1bGx5X3Zlc3RlZDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA4NS0xMDk5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfZnVsbHlfdmVzdGVkIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHBhcmFtcywgdGVtcGxhdGUgcGFyYW1ldGVycwogICAgLy8gIyBwdXJwb3NlOiB3aGVuIGZ1bGx5IHZlc3RlZAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBmdW5kaW5nIHNldAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gZGVyaXZlZCBhdCBmdW5kaW5nIHdoZW4gc3RvcmVkLAogICAgLy8gIyAgIG90aGVyd2lzZSBkZXJpdmVkIGZyb20gdmVzdGluZyBkZWxheSwKICAgIC8vICMgICBsb2NrdXAgZGVsYXksIHBlcmlvZCBhbmQgZnVuZGluZwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfZnVsbHlfdmVzdGVkKHNlbGYsIHBhcmFtczogUGFyYW1zKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwMAogICAgLy8gZnVsbHlfdmVzdGVkLCBleGlzdHMgPSBzZWxmLmZ1bGx5X3Zlc3RlZC5tYXliZSgpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzQKICAgIC8vIHNlbGYuZnVsbHlfdmVzdGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZSAiZnVsbHlfdmVzdGVkIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTAwCiAgICAvLyBmdWxseV92ZXN0ZWQsIGV4aXN0cyA9IHNlbGYuZnVsbHlfdmVzdGVkLm1heWJlKCkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMDEKICAgIC8vIGlmIGV4aXN0cyBhbmQgZnVsbHlfdmVzdGVkID4gMDoKICAgIGJ6IGdldF9mdWxseV92ZXN0ZWRfYWZ0ZXJfaWZfZWxzZUAzCiAgICBmcmFtZV9kaWcgMAogICAgYnogZ2V0X2Z1bGx5X3Zlc3RlZF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwMgogICAgLy8gcmV0dXJuIGZ1bGx5X3Zlc3RlZAogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICByZXRzdWIKCmdldF9mdWxseV92ZXN0ZWRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA0CiAgICAvLyBwYXJhbXMudmVzdGluZ19kZWxheS5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA1CiAgICAvLyBwYXJhbXMucGVyaW9kX3NlY29uZHMubmF0aXZlLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDI0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMDYKICAgIC8vIHBhcmFtcy5sb2NrdXBfZGVsYXkubmF0aXZlLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMDcKICAgIC8vIHNlbGYucGVyaW9kLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY4CiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwNwogICAgLy8gc2VsZi5wZXJpb2QsCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVyaW9kIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA4CiAgICAvLyBzZWxmLmZ1bmRpbmcsCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA4CiAgICAvLyBzZWxmLmZ1bmRpbmcsCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwMy0xMTA5CiAgICAvLyByZXR1cm4gY2FsY3VsYXRlX2Z1bGx5X3Zlc3RlZCgKICAgIC8vICAgICBwYXJhbXMudmVzdGluZ19kZWxheS5uYXRpdmUsCiAgICAvLyAgICAgcGFyYW1zLnBlcmlvZF9zZWNvbmRzLm5hdGl2ZSwKICAgIC8vICAgICBwYXJhbXMubG9ja3VwX2RlbGF5Lm5hdGl2ZSwKICAgIC8vICAgICBzZWxmLnBlcmlvZCwKICAgIC8vICAgICBzZWxmLmZ1bmRpbmcsCiAgICAvLyApCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9mdWxseV92ZXN0ZWQKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUuY2FsY3VsYXRlX21pbl9iYWxhbmNlKCkgLT4gdWludDY0OgpjYWxjdWxhdGVfbWluX2JhbGFuY2U6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNTctMTA3MwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogbWluX2JhbGFuY2UgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2FsY3VhbHRlIG1pbmltdW0gYmFsYW5jZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gbGV0IHBlcmlvZCA9IG51bWJlciBvZiBtb250aHMgdG8gdG8gbG9ja3VwCiAgICAvLyAjICAgICAgIHRvdGFsID0gdG90YWwgYW1vdW50IGludGlhbGx5IGZ1bmRlZCAoYWlyZHJvcCArIGxvY2t1cCBib251cykKICAgIC8vICMgICAgICAgeSA9IHZlc3RpbmcgZGVsYXkgaW4gbW9udGhzCiAgICAvLyAjICAgICAgIHAgPSAxIC8gKHNlbGYucGVyaW9kIHggMTIpIG9yIDEgLyAocGVyaW9kKQogICAgLy8gIyAtIG1pbXVtdW0gYmFsYW5jZSA9CiAgICAvLyAjICAgICB0b3RhbCB4IG1pbigxLCBwIHggbWF4KDAsIChwZXJpb2QgLSAobm93KCkgLSBmdW5kaW5nICsgeSB4IHNlY29uZHMtaW4tbW9udGgpKSAvIHNlY29uZHMtaW4tbW9udGgpKQogICAgLy8gIyAtIGZ1bGx5IHZlc3RlZCBmcm9tIGdldF9mdWxseV92ZXN0ZWQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY3VsYXRlX21pbl9iYWxhbmNlKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDc0CiAgICAvLyBub3c6IFVJbnQ2NCA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzUKICAgIC8vIHBhcmFtcyA9IHNlbGYuZ2V0X3BhcmFtcygpCiAgICBjYWxsc3ViIGdldF9wYXJhbXMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3OAogICAgLy8gc2VsZi5nZXRfZnVsbHlfdmVzdGVkKHBhcmFtcyksCiAgICBjYWxsc3ViIGdldF9mdWxseV92ZXN0ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3OQogICAgLy8gc2VsZi50b3RhbCwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3OQogICAgLy8gc2VsZi50b3RhbCwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA4MAogICAgLy8gcGFyYW1zLmRpc3RyaWJ1dGlvbl9jb3VudC5uYXRpdmUsCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA4MQogICAgLy8gcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLm5hdGl2ZSwKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3Ni0xMDgyCiAgICAvLyBtaW5fYmFsYW5jZTogVUludDY0ID0gY2FsY3VsYXRlX21hYl92ZXN0ZWQoCiAgICAvLyAgICAgbm93LAogICAgLy8gICAgIHNlbGYuZ2V0X2Z1bGx5X3Zlc3RlZChwYXJhbXMpLAogICAgLy8gICAgIHNlbGYudG90YWwsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9jb3VudC5uYXRpdmUsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLm5hdGl2ZSwKICAgIC8vICkKICAgIGNhbGxzdWIgY2FsY3VsYXRlX21hYl92ZXN0ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA4MwogICAgLy8gcmV0dXJuIG1pbl9iYWxhbmNlCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3RfbWFiLmNhbGN1bGF0ZV9tYWJfdmVzdGVkKG5vdzogdWludDY0LCBmdWxseV92ZXN0ZWQ6IHVpbnQ2NCwgdG90YWw6IHVpbnQ2NCwgZGlzdHJpYnV0aW9uX2NvdW50OiB1aW50NjQsIGRpc3RyaWJ1dGlvbl9zZWNvbmRzOiB1aW50NjQpIC0+IHVpbnQ2NDoKY2FsY3VsYXRlX21hYl92ZXN0ZWQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weTozMS01MAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY2FsY3VsYXRlX21hYl92ZXN0ZWQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gbm93LCB0aW1lc3RhbXAKICAgIC8vICMgLSBmdWxseV92ZXN0ZWQsIHdoZW4gZnVsbHkgdmVzdGVkCiAgICAvLyAjIC0gdG90YWwsIGhvdyBtdWNoIGZ1bmRlZAogICAgLy8gIyAtIGRpc3RyaWJ1dGlvbl9jb3VudCwgaG93IG1hbnkgcGVyaW9kcyBpbiBkaXN0cmlidXRpb24KICAgIC8vICMgLSBkaXN0cmlidXRpb25fc2Vjb25kcywgaG93IG1hbnkgc2Vjb25kcyBpbiBkaXN0cmlidXRpb24KICAgIC8vICMgcHVycG9zZTogY2FsY3VsYXRlIG1pbmltdW0gYWxsb3dhYmxlIGJhbGFuY2UKICAgIC8vICMgICBmcm9tIGEgcHJlY29tcHV0ZWQgZnVsbHkgdmVzdGVkIHRpbWVzdGFtcAogICAgLy8gIyByZXR1cm5zJyBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGN1bGF0ZV9tYWJfdmVzdGVkKAogICAgLy8gICAgIG5vdzogVUludDY0LAogICAgLy8gICAgIGZ1bGx5X3Zlc3RlZDogVUludDY0LAogICAgLy8gICAgIHRvdGFsOiBVSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2NvdW50OiBVSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX3NlY29uZHM6IFVJbnQ2NCwKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gNSAxCiAgICBieXRlICIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weTo1MQogICAgLy8gbG9ja2VkX3VwID0gbm93IDw9IGZ1bGx5X3Zlc3RlZAogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIDw9CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weTo1MgogICAgLy8gaWYgbG9ja2VkX3VwOgogICAgYnogY2FsY3VsYXRlX21hYl92ZXN0ZWRfZWxzZV9ib2R5QDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjUzCiAgICAvLyByZXR1cm4gdG90YWwKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgcmV0c3ViCgpjYWxjdWxhdGVfbWFiX3Zlc3RlZF9lbHNlX2JvZHlAMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjU1CiAgICAvLyBlbGFwc2VkX3BlcmlvZHMgPSAobm93IC0gZnVsbHlfdmVzdGVkKSAvLyBkaXN0cmlidXRpb25fc2Vjb25kcwogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIC0KICAgIGZyYW1lX2RpZyAtMQogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjU2CiAgICAvLyBpZiBlbGFwc2VkX3BlcmlvZHMgPD0gZGlzdHJpYnV0aW9uX2NvdW50OgogICAgZnJhbWVfZGlnIC0yCiAgICA8PQogICAgYnogY2FsY3VsYXRlX21hYl92ZXN0ZWRfZWxzZV9ib2R5QDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjU4CiAgICAvLyB0b3RhbCAqIChkaXN0cmlidXRpb25fY291bnQgLSBlbGFwc2VkX3BlcmlvZHMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAwCiAgICAtCiAgICBmcmFtZV9kaWcgLTMKICAgICoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjU3LTU5CiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHRvdGFsICogKGRpc3RyaWJ1dGlvbl9jb3VudCAtIGVsYXBzZWRfcGVyaW9kcykKICAgIC8vICkgLy8gZGlzdHJpYnV0aW9uX2NvdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIC8KICAgIHN3YXAKICAgIHJldHN1YgoKY2FsY3VsYXRlX21hYl92ZXN0ZWRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weTo2MQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50IDAKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5nZXRfYXZhaWxhYmxlX2JhbGFuY2UoKSAtPiB1aW50NjQ6CmdldF9hdmFpbGFibGVfYmFsYW5jZToKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzgtNDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9hdmFpbGFibGVfYmFsYW5jZSAoaW50ZXJuYWwpCiAgICAvLyAjIHB1cnBvc2U6IGdldCBhdmFpbGFibGUgYmFsYW5jZQogICAgLy8gIyByZXR1cm5zOiBhcHAgYmFsYW5jZSBhdmFpbGFibGUgZm9yIHNwZW5kaW5nCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9hdmFpbGFibGVfYmFsYW5jZSgpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy91dGlscy5weTo0NQogICAgLy8gYmFsYW5jZSA9IG9wLmJhbGFuY2UoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcykKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBiYWxhbmNlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjQ2CiAgICAvLyBtaW5fYmFsYW5jZSA9IG9wLkdsb2JhbC5taW5fYmFsYW5jZQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NDcKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICAtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjQ4CiAgICAvLyByZXR1cm4gYXZhaWxhYmxlX2JhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wLmFib3J0X2Z1bmRpbmcoKSAtPiB2b2lkOgphYm9ydF9mdW5kaW5nOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjQ3LTE2NTAKICAgIC8vICMgb3ZlcnJpZGUgZnVuZGFibGUgYWJvcnRfZnVuZGluZyBhYmltZXRob2QKICAgIC8vICMgICBjbG9zZSBvZmZsaW5lIG9uIGRlbGV0ZSB0byBvd25lcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9W09uQ29tcGxldGVBY3Rpb24uRGVsZXRlQXBwbGljYXRpb25dKQogICAgLy8gZGVmIGFib3J0X2Z1bmRpbmcoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjUzCiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lcgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5CiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjUzCiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lcgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgID09CiAgICBibnogYWJvcnRfZnVuZGluZ19ib29sX3RydWVAMgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjUzCiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lcgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGJ6IGFib3J0X2Z1bmRpbmdfYm9vbF9mYWxzZUAzCgphYm9ydF9mdW5kaW5nX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgYWJvcnRfZnVuZGluZ19ib29sX21lcmdlQDQKCmFib3J0X2Z1bmRpbmdfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCmFib3J0X2Z1bmRpbmdfYm9vbF9tZXJnZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjUxLTE2NTQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lcgogICAgLy8gKSwgIm11c3QgYmUgZnVuZGVyIG9yIG93bmVyIgogICAgYXNzZXJ0IC8vIG11c3QgYmUgZnVuZGVyIG9yIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NTUtMTY1NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY1NS0xNjU2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjYwCiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NjEKICAgIC8vIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY2MQogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjU5LTE2NjIKICAgIC8vIENsb3NlZCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NTctMTY2MwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ2xvc2VkKAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIkNsb3NlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY2NAogICAgLy8gY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUoc2VsZi5vd25lcikKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY2NAogICAgLy8gY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUoc2VsZi5vd25lcikKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGNhbGxzdWIgY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5jbG9zZV9vZmZsaW5lX29uX2RlbGV0ZShjbG9zZV9yZW1haW5kZXJfdG86IGJ5dGVzKSAtPiB2b2lkOgpjbG9zZV9vZmZsaW5lX29uX2RlbGV0ZToKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTgzLTE4NQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjbG9zZV9vZmZsaW5lX29uX2RlbGV0ZShjbG9zZV9yZW1haW5kZXJfdG86IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTg2CiAgICAvLyBvY2EgPSBUeG4ub25fY29tcGxldGlvbgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgLy8gc3JjL3NyYy91dGlscy5weToxODcKICAgIC8vIGlmIG9jYSA9PSBPbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uOgogICAgaW50IERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjIwMwogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc3JjL3NyYy91dGlscy5weToyMDYKICAgIC8vIGFtb3VudD1vcC5HbG9iYWwubWluX2JhbGFuY2UsCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgLy8gc3JjL3NyYy91dGlscy5weToyMDgKICAgIC8vIGl0eG4uc3VibWl0X3R4bnMoa2V5cmVnX3R4biwgcG10X3R4bikKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTk3LTE5OQogICAgLy8gc3RhdGVfcHJvb2Zfa2V5PUJ5dGVzLmZyb21fYmFzZTY0KAogICAgLy8gICAgICJBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQT09IgogICAgLy8gKSwKICAgIGJ5dGUgYmFzZTY0IEFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBPT0KICAgIGl0eG5fZmllbGQgU3RhdGVQcm9vZlBLCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE5NgogICAgLy8gdm90ZV9rZXlfZGlsdXRpb249VUludDY0KDApLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgVm90ZUtleURpbHV0aW9uCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE5NQogICAgLy8gdm90ZV9sYXN0PVVJbnQ2NCgwKSwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIFZvdGVMYXN0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE5NAogICAgLy8gdm90ZV9maXJzdD1VSW50NjQoMCksCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBWb3RlRmlyc3QKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTkxLTE5MwogICAgLy8gc2VsZWN0aW9uX2tleT1CeXRlcy5mcm9tX2Jhc2U2NCgKICAgIC8vICAgICAiQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQT0iCiAgICAvLyApLAogICAgYnl0ZSBiYXNlNjQgQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQT0KICAgIGl0eG5fZmllbGQgU2VsZWN0aW9uUEsKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTkwCiAgICAvLyB2b3RlX2tleT1CeXRlcy5mcm9tX2Jhc2U2NCgiQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQT0iKSwKICAgIGJ5dGUgYmFzZTY0IEFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUE9CiAgICBpdHhuX2ZpZWxkIFZvdGVQSwogICAgLy8gc3JjL3NyYy91dGlscy5weToxODkKICAgIC8vIG5vbl9wYXJ0aWNpcGF0aW9uPVRydWUsCiAgICBpbnQgMQogICAgaXR4bl9maWVsZCBOb25wYXJ0aWNpcGF0aW9uCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE4OAogICAgLy8ga2V5cmVnX3R4biA9IGl0eG4uS2V5UmVnaXN0cmF0aW9uKAogICAgaW50IGtleXJlZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy91dGlscy5weToyMDAKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjIwOAogICAgLy8gaXR4bi5zdWJtaXRfdHhucyhrZXlyZWdfdHhuLCBwbXRfdHhuKQogICAgaXR4bl9uZXh0CiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjAyCiAgICAvLyBwbXRfdHhuID0gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy91dGlscy5weToyMDUKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjIwOAogICAgLy8gaXR4bi5zdWJtaXRfdHhucyhrZXlyZWdfdHhuLCBwbXRfdHhuKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wLnVwZGF0ZSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY2Ni0xNjY3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbl0pCiAgICAvLyBkZWYgdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY2OAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjY4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjY5CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY2OQogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGRhdGFibGUgZXhpc3RzCiAgICBpbnQgMQogICAgPT0KICAgIGFzc2VydCAvLyBub3QgYXBwcm92ZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY3MAogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIGFyYzQuQWRkcmVzcyhzZWxmLmZ1bmRlcikpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY3MAogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIGFyYzQuQWRkcmVzcyhzZWxmLmZ1bmRlcikpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5CiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNjcwCiAgICAvLyBhcmM0LmVtaXQoQ2xvc2VkKGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwgYXJjNC5BZGRyZXNzKHNlbGYuZnVuZGVyKSkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgY29uY2F0CiAgICBtZXRob2QgIkNsb3NlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTY3MQogICAgLy8gY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUoc2VsZi5mdW5kZXIpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE2NzEKICAgIC8vIGNsb3NlX29mZmxpbmVfb25fZGVsZXRlKHNlbGYuZnVuZGVyKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgIGNhbGxzdWIgY2xvc2Vfb2ZmbGluZV9vbl9kZWxldGUKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS5jb25maWd1cmUocGVyaW9kOiBieXRlcykgLT4gdm9pZDoKY29uZmlndXJlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NjUtODY2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjb25maWd1cmUoc2VsZiwgcGVyaW9kOiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NjctODY4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gMCwgImZ1bmRpbmcgbm90IGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODY3LTg2OAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID09IDAsICJmdW5kaW5nIG5vdCBpbml0aWFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIGZ1bmRpbmcgbm90IGluaXRpYWxpemVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg2OQogICAgLy8gYXNzZXJ0IHNlbGYudG90YWwgPT0gMCwgInRvdGFsIG5vdCBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODY5CiAgICAvLyBhc3NlcnQgc2VsZi50b3RhbCA9PSAwLCAidG90YWwgbm90IGluaXRpYWxpemVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIHRvdGFsIG5vdCBpbml0aWFsaXplZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NzAtODcxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NzAtODcxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3Mi04NzMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHBlcmlvZCA8PSBzZWxmLmdldF9wYXJhbXMoKS5wZXJpb2RfbGltaXQKICAgIGNhbGxzdWIgZ2V0X3BhcmFtcwogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIGI+PQogICAgYXNzZXJ0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3NC04NzUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZGVhZGxpbmUgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgImRlYWRsaW5lIG5vdCBwYXNzZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo2NzAKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBVSW50NjQoKSAgIyAwCiAgICBieXRlICJkZWFkbGluZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODc0LTg3NQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5kZWFkbGluZSA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAiZGVhZGxpbmUgbm90IHBhc3NlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWFkbGluZSBleGlzdHMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgID4KICAgIGFzc2VydCAvLyBkZWFkbGluZSBub3QgcGFzc2VkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3Ni04NzcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KENvbmZpZ3VyZWQoYXJjNC5VSW50NjQoc2VsZi5wZXJpb2QpLCBwZXJpb2QpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY4CiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODc2LTg3NwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoQ29uZmlndXJlZChhcmM0LlVJbnQ2NChzZWxmLnBlcmlvZCksIHBlcmlvZCkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVyaW9kIGV4aXN0cwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiQ29uZmlndXJlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3OAogICAgLy8gc2VsZi5wZXJpb2QgPSBwZXJpb2QubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY4CiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODc4CiAgICAvLyBzZWxmLnBlcmlvZCA9IHBlcmlvZC5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUuc2V0X2Z1bmRpbmcoZnVuZGluZzogYnl0ZXMpIC0+IHZvaWQ6CnNldF9mdW5kaW5nOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4ODAtODg0CiAgICAvLyAjIG92ZXJyaWRlIGZ1bmRhYmxlIHNldF9mdW5kaW5nIGFiaW1ldGhvZAogICAgLy8gIyAgIGRlcml2ZSBmdWxseSB2ZXN0ZWQgb25jZSwgcGVyaW9kIGNhbiBubwogICAgLy8gIyAgIGxvbmdlciBiZSBjb25maWd1cmVkIGFmdGVyIGZ1bmRpbmcgaXMgc2V0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfZnVuZGluZyhzZWxmLCBmdW5kaW5nOiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4ODUtODg2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIsICJtdXN0IGJlIGZ1bmRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODg1LTg4NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyLCAibXVzdCBiZSBmdW5kZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGZ1bmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4ODkKICAgIC8vIHNlbGYuZnVuZGluZyA9PSBVSW50NjQoMCkgb3Igc2VsZi5mdW5kaW5nID4gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4OQogICAgLy8gc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKSBvciBzZWxmLmZ1bmRpbmcgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICBieiBzZXRfZnVuZGluZ19ib29sX3RydWVAMgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODg5CiAgICAvLyBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApIG9yIHNlbGYuZnVuZGluZyA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgID4KICAgIGJ6IHNldF9mdW5kaW5nX2Jvb2xfZmFsc2VAMwoKc2V0X2Z1bmRpbmdfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBzZXRfZnVuZGluZ19ib29sX21lcmdlQDQKCnNldF9mdW5kaW5nX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpzZXRfZnVuZGluZ19ib29sX21lcmdlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4Ny04OTAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuZnVuZGluZyA9PSBVSW50NjQoMCkgb3Igc2VsZi5mdW5kaW5nID4gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIC8vICksICJmdW5kaW5nIG5vdCBiZSBpbml0aWFsaXplZCBvciBjYW4gYmUgZXh0ZW5kZWQiCiAgICBhc3NlcnQgLy8gZnVuZGluZyBub3QgYmUgaW5pdGlhbGl6ZWQgb3IgY2FuIGJlIGV4dGVuZGVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg5MS04OTIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoRnVuZGluZ1NldChhcmM0LlVJbnQ2NChzZWxmLmZ1bmRpbmcpLCBmdW5kaW5nKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg5MS04OTIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoRnVuZGluZ1NldChhcmM0LlVJbnQ2NChzZWxmLmZ1bmRpbmcpLCBmdW5kaW5nKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiRnVuZGluZ1NldCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg5MwogICAgLy8gc2VsZi5mdW5kaW5nID0gZnVuZGluZy5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OTMKICAgIC8vIHNlbGYuZnVuZGluZyA9IGZ1bmRpbmcubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OTQKICAgIC8vIHNlbGYuc3RvcmVfZnVsbHlfdmVzdGVkKHNlbGYuZ2V0X3BhcmFtcygpKQogICAgY2FsbHN1YiBnZXRfcGFyYW1zCiAgICBjYWxsc3ViIHN0b3JlX2Z1bGx5X3Zlc3RlZAogICAgcG9wCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUud2l0aGRyYXcoYW1vdW50OiBieXRlcykgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODk2LTkxNAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXcKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGFtb3VudAogICAgLy8gIyByZXR1cm5zOiBtaW4gYmFsYW5jZQogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGZ1bmRzIGZyb20gY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IG93bmVyCiAgICAvLyAjIC0gbGV0IGJhbGFuY2UgYmUgdGhlIGN1cnJlbnQgYmFsYW5jZSBvZiB0aGUKICAgIC8vICMgICBjb250cmFjdAogICAgLy8gIyAtIGJhbGFuY2UgLSBhbW91bnQgPj0gbWluX2JhbGFuY2UKICAgIC8vICMgICAoZmVlIHBhaWQgaW4gYXBwbCB0eG4pCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0cmFuc2ZlciBhbW91bnQgZnJvbSB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyAgIHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOiBjb3N0cyAyIGZlZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHdpdGhkcmF3KHNlbGYsIGFtb3VudDogYXJjNC5VSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgYnl0ZSAiIgogICAgZHVwbiAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkxOC05MTkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkxOC05MTkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTIwLTkyMQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPiAwOgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTIwLTkyMQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPiAwOgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmcgZXhpc3RzCiAgICBieiB3aXRoZHJhd19lbHNlX2JvZHlANQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MjIKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi5jYWxjdWxhdGVfbWluX2JhbGFuY2UoKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWluX2JhbGFuY2UKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkyMwogICAgLy8gYXJjNC5lbWl0KFdpdGhkcmF3bihhcmM0LlVJbnQ2NChtaW5fYmFsYW5jZSksIGFtb3VudCkpCiAgICBkdXAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIldpdGhkcmF3bih1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkyNAogICAgLy8gYXZhaWxhYmxlX2JhbGFuY2UgPSBnZXRfYXZhaWxhYmxlX2JhbGFuY2UoKQogICAgY2FsbHN1YiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTI1CiAgICAvLyBhc3NlcnQgYXZhaWxhYmxlX2JhbGFuY2UgLSBhbW91bnQubmF0aXZlID49IG1pbl9iYWxhbmNlLCAiYmFsYW5jZSBhdmFpbGFibGUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAtCiAgICA8PQogICAgYXNzZXJ0IC8vIGJhbGFuY2UgYXZhaWxhYmxlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkyNgogICAgLy8gaWYgYW1vdW50ID4gMDoKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBieiB3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTI3CiAgICAvLyBpdHhuLlBheW1lbnQoYW1vdW50PWFtb3VudC5uYXRpdmUsIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgZnJhbWVfZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0Cgp3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkyOAogICAgLy8gcmV0dXJuIG1pbl9iYWxhbmNlCiAgICByZXRzdWIKCndpdGhkcmF3X2Vsc2VfYm9keUA1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzAKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi50b3RhbAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzAKICAgIC8vIG1pbl9iYWxhbmNlID0gc2VsZi50b3RhbAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTMxCiAgICAvLyBhcmM0LmVtaXQoV2l0aGRyYXduKGFyYzQuVUludDY0KG1pbl9iYWxhbmNlKSwgYW1vdW50KSkKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiV2l0aGRyYXduKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTMyCiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IGdldF9hdmFpbGFibGVfYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9hdmFpbGFibGVfYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzMKICAgIC8vIGFzc2VydCBhdmFpbGFibGVfYmFsYW5jZSAtIGFtb3VudC5uYXRpdmUgPj0gbWluX2JhbGFuY2UsICJiYWxhbmNlIGF2YWlsYWJsZSIKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC0KICAgIDw9CiAgICBhc3NlcnQgLy8gYmFsYW5jZSBhdmFpbGFibGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTM0CiAgICAvLyBpZiBhbW91bnQgPiAwOgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGJ6IHdpdGhkcmF3X2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzUKICAgIC8vIGl0eG4uUGF5bWVudChhbW91bnQ9YW1vdW50Lm5hdGl2ZSwgcmVjZWl2ZXI9VHhuLnNlbmRlciwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgMgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCndpdGhkcmF3X2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTM2CiAgICAvLyByZXR1cm4gbWluX2JhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS53aXRoZHJhd19tYXgoKSAtPiB1aW50NjQsIHVpbnQ2NDoKd2l0aGRyYXdfbWF4OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MzgtOTQ3CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiB3aXRoZHJhd19tYXgKICAgIC8vICMgcHVycG9zZTogd2l0aGRyYXcgYWxsIGZ1bmRzIGFib3ZlIG1pbgogICAgLy8gIyAgIGJhbGFuY2UgaW4gb25lIGNhbGwKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBhbW91bnQgd2l0aGRyYXduCiAgICAvLyAjIC0gbWluIGJhbGFuY2UgYWZ0ZXIgd2l0aGRyYXcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHdpdGhkcmF3X21heChzZWxmKSAtPiB0dXBsZVtVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAwIDIKICAgIGJ5dGUgIiIKICAgIGR1cG4gMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NTEtOTUyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5NTEtOTUyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk1My05NTQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gaWYgc2VsZi5mdW5kaW5nID4gMDoKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk1My05NTQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gaWYgc2VsZi5mdW5kaW5nID4gMDoKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgYnogd2l0aGRyYXdfbWF4X2Vsc2VfYm9keUAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk1NQogICAgLy8gbWluX2JhbGFuY2UgPSBzZWxmLmNhbGN1bGF0ZV9taW5fYmFsYW5jZSgpCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9taW5fYmFsYW5jZQogICAgZnJhbWVfYnVyeSAyCiAgICBiIHdpdGhkcmF3X21heF9hZnRlcl9pZl9lbHNlQDMKCndpdGhkcmF3X21heF9lbHNlX2JvZHlAMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTU3CiAgICAvLyBtaW5fYmFsYW5jZSA9IHNlbGYudG90YWwKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTU3CiAgICAvLyBtaW5fYmFsYW5jZSA9IHNlbGYudG90YWwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwoKd2l0aGRyYXdfbWF4X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTU4CiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IGdldF9hdmFpbGFibGVfYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9hdmFpbGFibGVfYmFsYW5jZQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTU5CiAgICAvLyBhbW91bnQgPSBVSW50NjQoMCkKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTYwCiAgICAvLyBpZiBhdmFpbGFibGVfYmFsYW5jZSA+IG1pbl9iYWxhbmNlOgogICAgZnJhbWVfZGlnIDIKICAgID4KICAgIGJ6IHdpdGhkcmF3X21heF9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTYxCiAgICAvLyBhbW91bnQgPSBhdmFpbGFibGVfYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIC0KICAgIGZyYW1lX2J1cnkgMAoKd2l0aGRyYXdfbWF4X2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTYyCiAgICAvLyBhcmM0LmVtaXQoV2l0aGRyYXduKGFyYzQuVUludDY0KG1pbl9iYWxhbmNlKSwgYXJjNC5VSW50NjQoYW1vdW50KSkpCiAgICBmcmFtZV9kaWcgMgogICAgaXRvYgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBtZXRob2QgIldpdGhkcmF3bih1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk2MwogICAgLy8gaWYgYW1vdW50ID4gMDoKICAgIGJ6IHdpdGhkcmF3X21heF9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTY0CiAgICAvLyBpdHhuLlBheW1lbnQoYW1vdW50PWFtb3VudCwgcmVjZWl2ZXI9VHhuLnNlbmRlciwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCndpdGhkcmF3X21heF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk2NQogICAgLy8gcmV0dXJuIGFtb3VudCwgbWluX2JhbGFuY2UKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS5tYWJfYXQodGltZXN0YW1wOiBieXRlcykgLT4gdWludDY0OgptYWJfYXQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk2Ny05NzcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IG1hYl9hdAogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gdGltZXN0YW1wLCB3aGVuCiAgICAvLyAjIHB1cnBvc2U6IG1pbmltdW0gYWxsb3dhYmxlIGJhbGFuY2UKICAgIC8vICMgICB3aXRoZHJhdyB3b3VsZCBlbmZvcmNlIGF0IHRpbWVzdGFtcAogICAgLy8gIyByZXR1cm5zOiBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlLCB0b3RhbAogICAgLy8gIyAgIGJlZm9yZSBmdW5kaW5nIGlzIHNldAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbWFiX2F0KHNlbGYsIHRpbWVzdGFtcDogYXJjNC5VSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODEKICAgIC8vIGlmIHNlbGYuZnVuZGluZyA9PSAwOgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTgxCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPT0gMDoKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgYm56IG1hYl9hdF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTgyCiAgICAvLyByZXR1cm4gc2VsZi50b3RhbAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODIKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICByZXRzdWIKCm1hYl9hdF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk4MwogICAgLy8gcGFyYW1zID0gc2VsZi5nZXRfcGFyYW1zKCkKICAgIGNhbGxzdWIgZ2V0X3BhcmFtcwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODUKICAgIC8vIHRpbWVzdGFtcC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTg2CiAgICAvLyBzZWxmLmdldF9mdWxseV92ZXN0ZWQocGFyYW1zKSwKICAgIGNhbGxzdWIgZ2V0X2Z1bGx5X3Zlc3RlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODcKICAgIC8vIHNlbGYudG90YWwsCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk4NwogICAgLy8gc2VsZi50b3RhbCwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTg4CiAgICAvLyBwYXJhbXMuZGlzdHJpYnV0aW9uX2NvdW50Lm5hdGl2ZSwKICAgIGR1cAogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5ODkKICAgIC8vIHBhcmFtcy5kaXN0cmlidXRpb25fc2Vjb25kcy5uYXRpdmUsCiAgICBleHRyYWN0IDQwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk4NC05OTAKICAgIC8vIHJldHVybiBjYWxjdWxhdGVfbWFiX3Zlc3RlZCgKICAgIC8vICAgICB0aW1lc3RhbXAubmF0aXZlLAogICAgLy8gICAgIHNlbGYuZ2V0X2Z1bGx5X3Zlc3RlZChwYXJhbXMpLAogICAgLy8gICAgIHNlbGYudG90YWwsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9jb3VudC5uYXRpdmUsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLm5hdGl2ZSwKICAgIC8vICkKICAgIGNhbGxzdWIgY2FsY3VsYXRlX21hYl92ZXN0ZWQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS5uZXh0X3VubG9jayh0aW1lc3RhbXA6IGJ5dGVzKSAtPiB1aW50NjQsIHVpbnQ2NDoKbmV4dF91bmxvY2s6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojk5Mi0xMDA2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBuZXh0X3VubG9jawogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gdGltZXN0YW1wLCB3aGVuCiAgICAvLyAjIHB1cnBvc2U6IHNjaGVkdWxlIG5leHQgd2l0aGRyYXcKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBmaXJzdCB0aW1lc3RhbXAgYWZ0ZXIgdGltZXN0YW1wIGF0IHdoaWNoCiAgICAvLyAjICAgbWluaW11bSBhbGxvd2FibGUgYmFsYW5jZSBkZWNyZWFzZXMsIDAgaWYKICAgIC8vICMgICBpdCBkb2VzIG5vdCBiZWZvcmUgZnVuZGluZyBpcyBzZXQgb3IKICAgIC8vICMgICBvbmNlIGZ1bGx5IGRpc3RyaWJ1dGVkCiAgICAvLyAjIC0gbWluaW11bSBhbGxvd2FibGUgYmFsYW5jZSB0aGVuLCBvciBhdAogICAgLy8gIyAgIHRpbWVzdGFtcCBpZiBpdCBkb2VzIG5vdCBkZWNyZWFzZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbmV4dF91bmxvY2soc2VsZiwgdGltZXN0YW1wOiBhcmM0LlVJbnQ2NCkgLT4gdHVwbGVbVUludDY0LCBVSW50NjRdOgogICAgcHJvdG8gMSAyCiAgICBieXRlICIiCiAgICBkdXBuIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxMAogICAgLy8gaWYgc2VsZi5mdW5kaW5nID09IDA6CiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDEwCiAgICAvLyBpZiBzZWxmLmZ1bmRpbmcgPT0gMDoKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nIGV4aXN0cwogICAgYm56IG5leHRfdW5sb2NrX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDExCiAgICAvLyByZXR1cm4gVUludDY0KDApLCBzZWxmLnRvdGFsCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTEKICAgIC8vIHJldHVybiBVSW50NjQoMCksIHNlbGYudG90YWwKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2J1cnkgMQogICAgcmV0c3ViCgpuZXh0X3VubG9ja19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTIKICAgIC8vIHBhcmFtcyA9IHNlbGYuZ2V0X3BhcmFtcygpCiAgICBjYWxsc3ViIGdldF9wYXJhbXMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxMwogICAgLy8gZnVsbHlfdmVzdGVkID0gc2VsZi5nZXRfZnVsbHlfdmVzdGVkKHBhcmFtcykKICAgIGNhbGxzdWIgZ2V0X2Z1bGx5X3Zlc3RlZAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxNQogICAgLy8gdGltZXN0YW1wLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDE3CiAgICAvLyBzZWxmLnRvdGFsLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDE3CiAgICAvLyBzZWxmLnRvdGFsLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDE4CiAgICAvLyBwYXJhbXMuZGlzdHJpYnV0aW9uX2NvdW50Lm5hdGl2ZSwKICAgIGR1cAogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAxOQogICAgLy8gcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLm5hdGl2ZSwKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMTQtMTAyMAogICAgLy8gbmV4dF90aW1lc3RhbXAgPSBjYWxjdWxhdGVfbmV4dF91bmxvY2soCiAgICAvLyAgICAgdGltZXN0YW1wLm5hdGl2ZSwKICAgIC8vICAgICBmdWxseV92ZXN0ZWQsCiAgICAvLyAgICAgc2VsZi50b3RhbCwKICAgIC8vICAgICBwYXJhbXMuZGlzdHJpYnV0aW9uX2NvdW50Lm5hdGl2ZSwKICAgIC8vICAgICBwYXJhbXMuZGlzdHJpYnV0aW9uX3NlY29uZHMubmF0aXZlLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBjb3ZlciA0CiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9uZXh0X3VubG9jawogICAgZHVwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMjEKICAgIC8vIGlmIG5leHRfdGltZXN0YW1wID09IDA6CiAgICBibnogbmV4dF91bmxvY2tfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMjIKICAgIC8vIHJldHVybiBuZXh0X3RpbWVzdGFtcCwgVUludDY0KDApCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKbmV4dF91bmxvY2tfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDI2CiAgICAvLyBzZWxmLnRvdGFsLAogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDI2CiAgICAvLyBzZWxmLnRvdGFsLAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsIGV4aXN0cwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDIzLTEwMjkKICAgIC8vIHJldHVybiBuZXh0X3RpbWVzdGFtcCwgY2FsY3VsYXRlX21hYl92ZXN0ZWQoCiAgICAvLyAgICAgbmV4dF90aW1lc3RhbXAsCiAgICAvLyAgICAgZnVsbHlfdmVzdGVkLAogICAgLy8gICAgIHNlbGYudG90YWwsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9jb3VudC5uYXRpdmUsCiAgICAvLyAgICAgcGFyYW1zLmRpc3RyaWJ1dGlvbl9zZWNvbmRzLm5hdGl2ZSwKICAgIC8vICkKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgdW5jb3ZlciAyCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIGNhbGxzdWIgY2FsY3VsYXRlX21hYl92ZXN0ZWQKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3RfbWFiLmNhbGN1bGF0ZV9uZXh0X3VubG9jayhub3c6IHVpbnQ2NCwgZnVsbHlfdmVzdGVkOiB1aW50NjQsIHRvdGFsOiB1aW50NjQsIGRpc3RyaWJ1dGlvbl9jb3VudDogdWludDY0LCBkaXN0cmlidXRpb25fc2Vjb25kczogdWludDY0KSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV9uZXh0X3VubG9jazoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5Ojk5LTExNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY2FsY3VsYXRlX25leHRfdW5sb2NrIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBzYW1lIGFzIGNhbGN1bGF0ZV9tYWJfdmVzdGVkCiAgICAvLyAjIHB1cnBvc2U6IGNhbGN1bGF0ZSBmaXJzdCB0aW1lc3RhbXAgYWZ0ZXIgbm93CiAgICAvLyAjICAgYXQgd2hpY2ggbWluaW11bSBhbGxvd2FibGUgYmFsYW5jZQogICAgLy8gIyAgIGRlY3JlYXNlcywgc2tpcHMgaW5zdGFsbG1lbnRzIHRoYXQgbGVhdmUKICAgIC8vICMgICBpdCB1bmNoYW5nZWQgZHVlIHRvIGZsb29yIGRpdmlzaW9uCiAgICAvLyAjIHJldHVybnMnIHRpbWVzdGFtcCwgMCBpZiBpdCBubyBsb25nZXIKICAgIC8vICMgICBkZWNyZWFzZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY3VsYXRlX25leHRfdW5sb2NrKAogICAgLy8gICAgIG5vdzogVUludDY0LAogICAgLy8gICAgIGZ1bGx5X3Zlc3RlZDogVUludDY0LAogICAgLy8gICAgIHRvdGFsOiBVSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2NvdW50OiBVSW50NjQsCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX3NlY29uZHM6IFVJbnQ2NCwKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gNSAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weToxMTctMTE5CiAgICAvLyBtYWIgPSBjYWxjdWxhdGVfbWFiX3Zlc3RlZCgKICAgIC8vICAgICBub3csIGZ1bGx5X3Zlc3RlZCwgdG90YWwsIGRpc3RyaWJ1dGlvbl9jb3VudCwgZGlzdHJpYnV0aW9uX3NlY29uZHMKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9tYWJfdmVzdGVkCiAgICBkdXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjEyMAogICAgLy8gaWYgbWFiID09IDA6CiAgICBibnogY2FsY3VsYXRlX25leHRfdW5sb2NrX2Vsc2VfYm9keUAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weToxMjEKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludCAwCiAgICBzd2FwCiAgICByZXRzdWIKCmNhbGN1bGF0ZV9uZXh0X3VubG9ja19lbHNlX2JvZHlAMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3RfbWFiLnB5OjEyMwogICAgLy8gcmVtYWluaW5nX3BlcmlvZHMgPSAobWFiICogZGlzdHJpYnV0aW9uX2NvdW50ICsgdG90YWwgLSAxKSAvLyB0b3RhbAogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgZnJhbWVfZGlnIC0zCiAgICArCiAgICBpbnQgMQogICAgLQogICAgZnJhbWVfZGlnIC0zCiAgICAvCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0X21hYi5weToxMjQKICAgIC8vIGVsYXBzZWRfcGVyaW9kcyA9IGRpc3RyaWJ1dGlvbl9jb3VudCArIDEgLSByZW1haW5pbmdfcGVyaW9kcwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgMQogICAgKwogICAgc3dhcAogICAgLQogICAgLy8gc3JjL3NyYy9jb250cmFjdF9tYWIucHk6MTI1CiAgICAvLyByZXR1cm4gZnVsbHlfdmVzdGVkICsgZWxhcHNlZF9wZXJpb2RzICogZGlzdHJpYnV0aW9uX3NlY29uZHMKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgZnJhbWVfZGlnIC00CiAgICArCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTG9ja2FibGUuY2xvc2UoKSAtPiB2b2lkOgpjbG9zZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTAzMS0xMDQ0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjbG9zZQogICAgLy8gIyBwdXJwb3NlOiBkZWxldGVzIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zOgogICAgLy8gIyAtIG1pbiBiYWxhbmNlIGlzIDAKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIGNvbnRyYWN0IGlzIGRlbGV0ZWQKICAgIC8vICMgLSBhY2NvdW50IGNsb3NlZCBvdXQgdG8gb3duZXIgaWYgaXQgaGFzIGEgYmFsYW5jZQogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBzaG91bGQgYmUgYWxsZWQgd2l0aCBvbkNvbXBsZXRpb24KICAgIC8vICMgICBkZWxldGVBcHBsaWNhdGlvbgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9W09uQ29tcGxldGVBY3Rpb24uRGVsZXRlQXBwbGljYXRpb25dKQogICAgLy8gZGVmIGNsb3NlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0NS0xMDQ2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID4gMCwgImZ1bmRlZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkKICAgIGJ5dGUgImZ1bmRpbmciCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNDUtMTA0NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA+IDAsICJmdW5kZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgIGFzc2VydCAvLyBmdW5kZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA0Ny0xMDQ4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5jYWxjdWxhdGVfbWluX2JhbGFuY2UoKSA9PSAwLCAibWluIGJhbGFuY2Ugbm90IHplcm8iCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9taW5fYmFsYW5jZQogICAgIQogICAgYXNzZXJ0IC8vIG1pbiBiYWxhbmNlIG5vdCB6ZXJvCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNTEKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNTEKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYm56IGNsb3NlX2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNTEKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgPT0KICAgIGJ6IGNsb3NlX2Jvb2xfZmFsc2VAMwoKY2xvc2VfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBjbG9zZV9ib29sX21lcmdlQDQKCmNsb3NlX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpjbG9zZV9ib29sX21lcmdlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNDktMTA1MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYub3duZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlcgogICAgLy8gKSwgIm11c3QgYmUgb3duZXIgb3IgZnVuZGVyIgogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIgb3IgZnVuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNTMtMTA1NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSkpCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNTMtMTA1NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXJjNC5lbWl0KENsb3NlZChhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBjb25jYXQKICAgIG1ldGhvZCAiQ2xvc2VkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDU1CiAgICAvLyBjbG9zZV9vZmZsaW5lX29uX2RlbGV0ZShzZWxmLm93bmVyKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDU1CiAgICAvLyBjbG9zZV9vZmZsaW5lX29uX2RlbGV0ZShzZWxmLm93bmVyKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgY2FsbHN1YiBjbG9zZV9vZmZsaW5lX29uX2RlbGV0ZQogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0Lk93bmFibGUudHJhbnNmZXIobmV3X293bmVyOiBieXRlcykgLT4gdm9pZDoKdHJhbnNmZXI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwMi0xMDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHRyYW5zZmVyKHNlbGYsIG5ld19vd25lcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA1CiAgICAvLyBhcmM0LmVtaXQoT3duZXJzaGlwVHJhbnNmZXJyZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBuZXdfb3duZXIpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDUKICAgIC8vIGFyYzQuZW1pdChPd25lcnNoaXBUcmFuc2ZlcnJlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIG5ld19vd25lcikpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJPd25lcnNoaXBUcmFuc2ZlcnJlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDYKICAgIC8vIHNlbGYub3duZXIgPSBuZXdfb3duZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuRnVuZGFibGUuZmlsbCgpIC0+IHZvaWQ6CmZpbGw6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MC0xOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGZpbGwoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTItMTkzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIsICJtdXN0IGJlIGZ1bmRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTkyLTE5MwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyLCAibXVzdCBiZSBmdW5kZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGZ1bmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTQtMTk1CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoc2VsZi5mdW5kZXIpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NC0xOTUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBwYXltZW50X2Ftb3VudCA9IHJlcXVpcmVfcGF5bWVudChzZWxmLmZ1bmRlcikKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICBjYWxsc3ViIHJlcXVpcmVfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTctMTk4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gdG90YWwgPSBzZWxmLnRvdGFsICsgcGF5bWVudF9hbW91bnQKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk3LTE5OAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHRvdGFsID0gc2VsZi50b3RhbCArIHBheW1lbnRfYW1vdW50CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICBkaWcgMQogICAgKwogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDEKICAgIC8vIGFyYzQuVUludDY0KHBheW1lbnRfYW1vdW50KSwKICAgIGl0b2IKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAyCiAgICAvLyBhcmM0LlVJbnQ2NCh0b3RhbCksCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAwLTIwMwogICAgLy8gRmlsbGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KHBheW1lbnRfYW1vdW50KSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCh0b3RhbCksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTktMjA0CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgRmlsbGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChwYXltZW50X2Ftb3VudCksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHRvdGFsKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIkZpbGxlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA1CiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMucmVxdWlyZV9wYXltZW50KHdobzogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVxdWlyZV9wYXltZW50OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNi0yNAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcmVxdWlyZV9wYXltZW50IChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGNoZWNrIHBheW1lbnQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlcXVpcmVfcGF5bWVudCh3aG86IEFjY291bnQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy91dGlscy5weToyNQogICAgLy8gcmVmX2dyb3VwX2luZGV4ID0gVHhuLmdyb3VwX2luZGV4CiAgICB0eG4gR3JvdXBJbmRleAogICAgLy8gc3JjL3NyYy91dGlscy5weToyNgogICAgLy8gYXNzZXJ0IHJlZl9ncm91cF9pbmRleCA+IDAsICJncm91cCBpbmRleCBncmVhdGVyIHRoYW4gemVybyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIGdyb3VwIGluZGV4IGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI3CiAgICAvLyBwYXltZW50X2dyb3VwX2luZGV4ID0gcmVmX2dyb3VwX2luZGV4IC0gMQogICAgaW50IDEKICAgIC0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjkKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnNlbmRlciA9PSB3aG8KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGR1cAogICAgZ3R4bnMgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI4LTMwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnNlbmRlciA9PSB3aG8KICAgIC8vICksICJwYXltZW50IHNlbmRlciBhY2N1cmF0ZSIKICAgIGFzc2VydCAvLyBwYXltZW50IHNlbmRlciBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy91dGlscy5weTozMgogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzMKICAgIC8vID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMyLTMzCiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgLy8gPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzEtMzQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIC8vICAgICA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAicGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZSIKICAgIGFzc2VydCAvLyBwYXltZW50IHJlY2VpdmVyIGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjM1CiAgICAvLyByZXR1cm4gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuYW1vdW50CiAgICBndHhucyBBbW91bnQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5GdW5kYWJsZS5ncmFudF9mdW5kZXIoZnVuZGVyOiBieXRlcykgLT4gdm9pZDoKZ3JhbnRfZnVuZGVyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDctMjA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBncmFudF9mdW5kZXIoc2VsZiwgZnVuZGVyOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA5LTIxMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyLCAibXVzdCBiZSBmdW5kZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwOS0yMTAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciwgIm11c3QgYmUgZnVuZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBmdW5kZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjExLTIxMgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFyYzQuZW1pdChGdW5kZXJHcmFudGVkKGFyYzQuQWRkcmVzcyhzZWxmLmZ1bmRlciksIGZ1bmRlcikpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDkKICAgIC8vIHNlbGYuZnVuZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJmdW5kZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMS0yMTIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhcmM0LmVtaXQoRnVuZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi5mdW5kZXIpLCBmdW5kZXIpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIkZ1bmRlckdyYW50ZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjEzCiAgICAvLyBzZWxmLmZ1bmRlciA9IGZ1bmRlci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5GdW5kYWJsZS5yZWR1Y2VfdG90YWwoYWRqdXN0bWVudDogYnl0ZXMpIC0+IHZvaWQ6CnJlZHVjZV90b3RhbDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjM3LTIzOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcmVkdWNlX3RvdGFsKHNlbGYsIGFkanVzdG1lbnQ6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIzOS0yNDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciwgIm11c3QgYmUgZnVuZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5CiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMzktMjQwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5mdW5kZXIsICJtdXN0IGJlIGZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgZnVuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI0MS0yNDIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgc2VsZi5mdW5kaW5nID09IFVJbnQ2NCgwKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgYnl0ZSAiZnVuZGluZyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjQxLTI0MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gVUludDY0KDApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNDMtMjQ0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IGFkanVzdG1lbnQgPD0gc2VsZi50b3RhbCwgImFkanVzdG1lbnQgYWNjdXJhdGUiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgYnl0ZSAidG90YWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI0My0yNDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgYWRqdXN0bWVudCA8PSBzZWxmLnRvdGFsLCAiYWRqdXN0bWVudCBhY2N1cmF0ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbCBleGlzdHMKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgYj49CiAgICBhc3NlcnQgLy8gYWRqdXN0bWVudCBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNDUtMjQ2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gdG90YWwgPSBzZWxmLnRvdGFsIC0gYWRqdXN0bWVudC5uYXRpdmUKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjQ1LTI0NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHRvdGFsID0gc2VsZi50b3RhbCAtIGFkanVzdG1lbnQubmF0aXZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWwgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjQ3CiAgICAvLyBhcmM0LmVtaXQoVG90YWxSZWR1Y2VkKGFkanVzdG1lbnQsIGFyYzQuVUludDY0KHRvdGFsKSkpCiAgICBkdXAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY29uY2F0CiAgICBtZXRob2QgIlRvdGFsUmVkdWNlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjQ4CiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuU3Rha2VhYmxlLnNldF9kZWxlZ2F0ZShkZWxlZ2F0ZTogYnl0ZXMpIC0+IHZvaWQ6CnNldF9kZWxlZ2F0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzIzLTMyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X2RlbGVnYXRlKHNlbGYsIGRlbGVnYXRlOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzI2CiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYub3duZXIgb3IgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMyNgogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGJueiBzZXRfZGVsZWdhdGVfYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IHNldF9kZWxlZ2F0ZV9ib29sX2ZhbHNlQDMKCnNldF9kZWxlZ2F0ZV9ib29sX3RydWVAMjoKICAgIGludCAxCiAgICBiIHNldF9kZWxlZ2F0ZV9ib29sX21lcmdlQDQKCnNldF9kZWxlZ2F0ZV9ib29sX2ZhbHNlQDM6CiAgICBpbnQgMAoKc2V0X2RlbGVnYXRlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzI1LTMyNwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYub3duZXIgb3IgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAibXVzdCBiZSBvd25lciBvciBjcmVhdG9yIgogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIgb3IgY3JlYXRvcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMjgKICAgIC8vIGFyYzQuZW1pdChEZWxlZ2F0ZVVwZGF0ZWQoYXJjNC5BZGRyZXNzKHNlbGYuZGVsZWdhdGUpLCBkZWxlZ2F0ZSkpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNzQKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozMjgKICAgIC8vIGFyYzQuZW1pdChEZWxlZ2F0ZVVwZGF0ZWQoYXJjNC5BZGRyZXNzKHNlbGYuZGVsZWdhdGUpLCBkZWxlZ2F0ZSkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsZWdhdGUgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJEZWxlZ2F0ZVVwZGF0ZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IGRlbGVnYXRlLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtlYWJsZS5wYXJ0aWNpcGF0ZSh2b3RlX2s6IGJ5dGVzLCBzZWxfazogYnl0ZXMsIHZvdGVfZnN0OiBieXRlcywgdm90ZV9sc3Q6IGJ5dGVzLCB2b3RlX2tkOiBieXRlcywgc3Bfa2V5OiBieXRlcykgLT4gdm9pZDoKcGFydGljaXBhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjMzMS0zNDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBhcnRpY2lwYXRlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdm90ZV9rOiBCeXRlczMyLAogICAgLy8gICAgIHNlbF9rOiBCeXRlczMyLAogICAgLy8gICAgIHZvdGVfZnN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2xzdDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdm90ZV9rZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgc3Bfa2V5OiBCeXRlczY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5kZWxlZ2F0ZQogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNDMKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZGVsZWdhdGUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBibnogcGFydGljaXBhdGVfYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5kZWxlZ2F0ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGVnYXRlIGV4aXN0cwogICAgPT0KICAgIGJ6IHBhcnRpY2lwYXRlX2Jvb2xfZmFsc2VAMwoKcGFydGljaXBhdGVfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBwYXJ0aWNpcGF0ZV9ib29sX21lcmdlQDQKCnBhcnRpY2lwYXRlX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpwYXJ0aWNpcGF0ZV9ib29sX21lcmdlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM0MS0zNDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5kZWxlZ2F0ZQogICAgLy8gKSwgIm11c3QgYmUgb3duZXIgb3IgZGVsZWdhdGUiCiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lciBvciBkZWxlZ2F0ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNDUtMzQ2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBrZXlfcmVnX2ZlZSA9IEdsb2JhbC5taW5fdHhuX2ZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNDctMzQ4CiAgICAvLyAjIHJlcXVpcmUgcGF5bWVudCBvZiBtaW4gZmVlIHRvIHByZXZlbnQgZHJhaW5pbmcKICAgIC8vIGFzc2VydCByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikgPT0ga2V5X3JlZ19mZWUsICJwYXltZW50IGFtb3V0IGFjY3VyYXRlIgogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiByZXF1aXJlX3BheW1lbnQKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHBheW1lbnQgYW1vdXQgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzQ5LTM1MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gc2VsZi5yZWdpc3Rlcl9rZXkoCiAgICAvLyAgICAgdm90ZV9rLCBzZWxfaywgdm90ZV9mc3QsIHZvdGVfbHN0LCB2b3RlX2tkLCBzcF9rZXksIGtleV9yZWdfZmVlCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDYKICAgIGNhbGxzdWIgcmVnaXN0ZXJfa2V5CiAgICBmcmFtZV9idXJ5IC0xCiAgICBmcmFtZV9idXJ5IC01CiAgICBmcmFtZV9idXJ5IC02CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuU3Rha2VhYmxlLnJlZ2lzdGVyX2tleSh2b3RlX2s6IGJ5dGVzLCBzZWxfazogYnl0ZXMsIHZvdGVfZnN0OiBieXRlcywgdm90ZV9sc3Q6IGJ5dGVzLCB2b3RlX2tkOiBieXRlcywgc3Bfa2V5OiBieXRlcywgZmVlOiB1aW50NjQpIC0+IGJ5dGVzLCBieXRlcywgYnl0ZXM6CnJlZ2lzdGVyX2tleToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Mzc2LTM4NgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWdpc3Rlcl9rZXkoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB2b3RlX2s6IEJ5dGVzMzIsCiAgICAvLyAgICAgc2VsX2s6IEJ5dGVzMzIsCiAgICAvLyAgICAgdm90ZV9mc3Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHZvdGVfbHN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2tkOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBzcF9rZXk6IEJ5dGVzNjQsCiAgICAvLyAgICAgZmVlOiBVSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA3IDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzkyCiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM5NAogICAgLy8gYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICBkdXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzkzLTQwMQogICAgLy8gUGFydEtleUluZm8oCiAgICAvLyAgICAgYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgdm90ZV9rZXk9dm90ZV9rLAogICAgLy8gICAgIHNlbGVjdGlvbl9rZXk9c2VsX2ssCiAgICAvLyAgICAgdm90ZV9maXJzdD12b3RlX2ZzdCwKICAgIC8vICAgICB2b3RlX2xhc3Q9dm90ZV9sc3QsCiAgICAvLyAgICAgdm90ZV9rZXlfZGlsdXRpb249dm90ZV9rZCwKICAgIC8vICAgICBzdGF0ZV9wcm9vZl9rZXk9c3Bfa2V5LAogICAgLy8gKSwKICAgIGZyYW1lX2RpZyAtNwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzkxLTQwMgogICAgLy8gUGFydGljaXBhdGVkKAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBQYXJ0S2V5SW5mbygKICAgIC8vICAgICAgICAgYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIHZvdGVfa2V5PXZvdGVfaywKICAgIC8vICAgICAgICAgc2VsZWN0aW9uX2tleT1zZWxfaywKICAgIC8vICAgICAgICAgdm90ZV9maXJzdD12b3RlX2ZzdCwKICAgIC8vICAgICAgICAgdm90ZV9sYXN0PXZvdGVfbHN0LAogICAgLy8gICAgICAgICB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLAogICAgLy8gICAgICAgICBzdGF0ZV9wcm9vZl9rZXk9c3Bfa2V5LAogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzkwLTQwMwogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFBhcnRpY2lwYXRlZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBQYXJ0S2V5SW5mbygKICAgIC8vICAgICAgICAgICAgIGFkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICAgICAgdm90ZV9rZXk9dm90ZV9rLAogICAgLy8gICAgICAgICAgICAgc2VsZWN0aW9uX2tleT1zZWxfaywKICAgIC8vICAgICAgICAgICAgIHZvdGVfZmlyc3Q9dm90ZV9mc3QsCiAgICAvLyAgICAgICAgICAgICB2b3RlX2xhc3Q9dm90ZV9sc3QsCiAgICAvLyAgICAgICAgICAgICB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLAogICAgLy8gICAgICAgICAgICAgc3RhdGVfcHJvb2Zfa2V5PXNwX2tleSwKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIlBhcnRpY2lwYXRlZChhZGRyZXNzLChhZGRyZXNzLGJ5dGVbMzJdLGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbNjRdKSkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDQtNDEyCiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIC8vICAgICB2b3RlX2tleT12b3RlX2suYnl0ZXMsCiAgICAvLyAgICAgc2VsZWN0aW9uX2tleT1zZWxfay5ieXRlcywKICAgIC8vICAgICB2b3RlX2ZpcnN0PXZvdGVfZnN0Lm5hdGl2ZSwKICAgIC8vICAgICB2b3RlX2xhc3Q9dm90ZV9sc3QubmF0aXZlLAogICAgLy8gICAgIHZvdGVfa2V5X2RpbHV0aW9uPXZvdGVfa2QubmF0aXZlLAogICAgLy8gICAgIHN0YXRlX3Byb29mX2tleT1zcF9rZXkuYnl0ZXMsCiAgICAvLyAgICAgZmVlPWZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA3CiAgICAvLyB2b3RlX2ZpcnN0PXZvdGVfZnN0Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtNQogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHZvdGVfbGFzdD12b3RlX2xzdC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTQKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA5CiAgICAvLyB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMwogICAgYnRvaQogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFN0YXRlUHJvb2ZQSwogICAgaXR4bl9maWVsZCBWb3RlS2V5RGlsdXRpb24KICAgIGl0eG5fZmllbGQgVm90ZUxhc3QKICAgIGl0eG5fZmllbGQgVm90ZUZpcnN0CiAgICBmcmFtZV9kaWcgLTYKICAgIGl0eG5fZmllbGQgU2VsZWN0aW9uUEsKICAgIGZyYW1lX2RpZyAtNwogICAgaXR4bl9maWVsZCBWb3RlUEsKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA0CiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIGludCBrZXlyZWcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA0LTQxMgogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9dm90ZV9rLmJ5dGVzLAogICAgLy8gICAgIHNlbGVjdGlvbl9rZXk9c2VsX2suYnl0ZXMsCiAgICAvLyAgICAgdm90ZV9maXJzdD12b3RlX2ZzdC5uYXRpdmUsCiAgICAvLyAgICAgdm90ZV9sYXN0PXZvdGVfbHN0Lm5hdGl2ZSwKICAgIC8vICAgICB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLm5hdGl2ZSwKICAgIC8vICAgICBzdGF0ZV9wcm9vZl9rZXk9c3Bfa2V5LmJ5dGVzLAogICAgLy8gICAgIGZlZT1mZWUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgZnJhbWVfZGlnIC03CiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtMgogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtlYWJsZS5wYXJ0aWNpcGF0ZV9wb29sZWQodm90ZV9rOiBieXRlcywgc2VsX2s6IGJ5dGVzLCB2b3RlX2ZzdDogYnl0ZXMsIHZvdGVfbHN0OiBieXRlcywgdm90ZV9rZDogYnl0ZXMsIHNwX2tleTogYnl0ZXMpIC0+IHZvaWQ6CnBhcnRpY2lwYXRlX3Bvb2xlZDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzU0LTM2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcGFydGljaXBhdGVfcG9vbGVkKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdm90ZV9rOiBCeXRlczMyLAogICAgLy8gICAgIHNlbF9rOiBCeXRlczMyLAogICAgLy8gICAgIHZvdGVfZnN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2xzdDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdm90ZV9rZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgc3Bfa2V5OiBCeXRlczY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM2NgogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5kZWxlZ2F0ZQogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNjYKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZGVsZWdhdGUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBibnogcGFydGljaXBhdGVfcG9vbGVkX2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyNzQKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlbGVnYXRlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNjYKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciBvciBUeG4uc2VuZGVyID09IHNlbGYuZGVsZWdhdGUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxlZ2F0ZSBleGlzdHMKICAgID09CiAgICBieiBwYXJ0aWNpcGF0ZV9wb29sZWRfYm9vbF9mYWxzZUAzCgpwYXJ0aWNpcGF0ZV9wb29sZWRfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBwYXJ0aWNpcGF0ZV9wb29sZWRfYm9vbF9tZXJnZUA0CgpwYXJ0aWNpcGF0ZV9wb29sZWRfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCnBhcnRpY2lwYXRlX3Bvb2xlZF9ib29sX21lcmdlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM2NC0zNjcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5kZWxlZ2F0ZQogICAgLy8gKSwgIm11c3QgYmUgb3duZXIgb3IgZGVsZWdhdGUiCiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lciBvciBkZWxlZ2F0ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNjgtMzcwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIHJlcXVpcmUgYXBwIGNhbGwgZmVlIHRvIGNvdmVyIGtleSByZWdpc3RyYXRpb24gdG8gcHJldmVudCBkcmFpbmluZwogICAgLy8gYXNzZXJ0IFR4bi5mZWUgPj0gR2xvYmFsLm1pbl90eG5fZmVlICogMiwgImZlZSBjb3ZlcnMga2V5IHJlZ2lzdHJhdGlvbiIKICAgIHR4biBGZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIGludCAyCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIGZlZSBjb3ZlcnMga2V5IHJlZ2lzdHJhdGlvbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTozNzEtMzc0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBzZWxmLnJlZ2lzdGVyX2tleSgKICAgIC8vICAgICB2b3RlX2ssIHNlbF9rLCB2b3RlX2ZzdCwgdm90ZV9sc3QsIHZvdGVfa2QsIHNwX2tleSwgVUludDY0KDApCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjM3MwogICAgLy8gdm90ZV9rLCBzZWxfaywgdm90ZV9mc3QsIHZvdGVfbHN0LCB2b3RlX2tkLCBzcF9rZXksIFVJbnQ2NCgwKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MzcxLTM3NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gc2VsZi5yZWdpc3Rlcl9rZXkoCiAgICAvLyAgICAgdm90ZV9rLCBzZWxfaywgdm90ZV9mc3QsIHZvdGVfbHN0LCB2b3RlX2tkLCBzcF9rZXksIFVJbnQ2NCgwKQogICAgLy8gKQogICAgY2FsbHN1YiByZWdpc3Rlcl9rZXkKICAgIGZyYW1lX2J1cnkgLTEKICAgIGZyYW1lX2J1cnkgLTUKICAgIGZyYW1lX2J1cnkgLTYKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5zZXRfdmVyc2lvbihjb250cmFjdF92ZXJzaW9uOiBieXRlcywgZGVwbG95bWVudF92ZXJzaW9uOiBieXRlcykgLT4gdm9pZDoKc2V0X3ZlcnNpb246CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzMC01MzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF92ZXJzaW9uKAogICAgLy8gICAgIHNlbGYsIGNvbnRyYWN0X3ZlcnNpb246IGFyYzQuVUludDY0LCBkZXBsb3ltZW50X3ZlcnNpb246IGFyYzQuVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM1CiAgICAvLyBhcmM0LmVtaXQoVmVyc2lvblVwZGF0ZWQoY29udHJhY3RfdmVyc2lvbiwgZGVwbG95bWVudF92ZXJzaW9uKSkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVmVyc2lvblVwZGF0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzYKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM2CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBjb250cmFjdF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM3CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IGRlcGxveW1lbnRfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM3CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IGRlcGxveW1lbnRfdmVyc2lvbi5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuYXBwcm92ZV91cGRhdGUoYXBwcm92YWw6IGJ5dGVzKSAtPiB2b2lkOgphcHByb3ZlX3VwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ4LTU0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgYXBwcm92ZV91cGRhdGUoc2VsZiwgYXBwcm92YWw6IGFyYzQuQm9vbCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTEKICAgIC8vIGFyYzQuZW1pdChVcGRhdGVBcHByb3ZlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIGFwcHJvdmFsKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZGF0ZUFwcHJvdmVkKGFkZHJlc3MsYm9vbCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTIKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAwCiAgICBnZXRiaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUyCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGFwcHJvdmFsLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5EZXBsb3lhYmxlLm9uX2NyZWF0ZSgpIC0+IHZvaWQ6Cm9uX2NyZWF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTg5LTU5MAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIG9uX2NyZWF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU5MQogICAgLy8gY2FsbGVyX2lkID0gR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTkyCiAgICAvLyBhc3NlcnQgY2FsbGVyX2lkID4gMCwgIm11c3QgYmUgY3JlYXRlZCBieSBmYWN0b3J5IgogICAgZHVwCiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdGVkIGJ5IGZhY3RvcnkKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTc0CiAgICAvLyBzZWxmLnBhcmVudF9pZCA9IFVJbnQ2NCgpCiAgICBieXRlICJwYXJlbnRfaWQiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU5MwogICAgLy8gc2VsZi5wYXJlbnRfaWQgPSBjYWxsZXJfaWQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUub25fdXBkYXRlKCkgLT4gdm9pZDoKb25fdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzktNTQwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0MS01NDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0MS01NDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDUKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDUKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBkYXRhYmxlIGV4aXN0cwogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gbm90IGFwcHJvdmVkCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQWlyZHJvcC5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgzCiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODQtMTM4NQogICAgLy8gIyBsb2NrYWJsZSBzdGF0ZSwgZGVjbGFyZXMgcGFyYW1zIGFuZCBmdWxseSB2ZXN0ZWQKICAgIC8vIHN1cGVyKCkuX19pbml0X18oKQogICAgY2FsbHN1YiBMb2NrYWJsZS5fX2luaXRfXwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NzQKICAgIC8vIHNlbGYucGFyZW50X2lkID0gVUludDY0KCkKICAgIGJ5dGUgInBhcmVudF9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM4Ni0xMzg3CiAgICAvLyAjIGRlcGxveWFibGUgc3RhdGUKICAgIC8vIHNlbGYucGFyZW50X2lkID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NzUKICAgIC8vIHNlbGYuZGVwbG95ZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlcGxveWVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzg4CiAgICAvLyBzZWxmLmRlcGxveWVyID0gQWNjb3VudCgpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2VsZi5kZWxlZ2F0ZSA9IEFjY291bnQoKQogICAgYnl0ZSAiZGVsZWdhdGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzODktMTM5MAogICAgLy8gIyBzdGFrZWFibGUgc3RhdGUKICAgIC8vIHNlbGYuZGVsZWdhdGUgPSBBY2NvdW50KCkKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6Mjc1CiAgICAvLyBzZWxmLnN0YWtlYWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInN0YWtlYWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM5MQogICAgLy8gc2VsZi5zdGFrZWFibGUgPSBib29sKDEpCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM5Mi0xMzkzCiAgICAvLyAjIHVwZ3JhZGVhYmxlIHN0YXRlCiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzk0CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM5NQogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM5NgogICAgLy8gc2VsZi51cGdyYWRlciA9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzk3LTEzOTgKICAgIC8vICMgb3duYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo2NjgKICAgIC8vIHNlbGYucGVyaW9kID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAicGVyaW9kIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzk5LTE0MDAKICAgIC8vICMgbG9ja2FibGUgc3RhdGUKICAgIC8vIHNlbGYucGVyaW9kID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo2NjkKICAgIC8vIHNlbGYuaW5pdGlhbCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImluaXRpYWwiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MDEKICAgIC8vIHNlbGYuaW5pdGlhbCA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjcwCiAgICAvLyBzZWxmLmRlYWRsaW5lID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiZGVhZGxpbmUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0MDIKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImZ1bmRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQwMy0xNDA0CiAgICAvLyAjIGZ1bmRhYmxlIHN0YXRlCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNDA1CiAgICAvLyBzZWxmLmZ1bmRpbmcgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBieXRlICJ0b3RhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQwNgogICAgLy8gc2VsZi50b3RhbCA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjMKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gVUludDY0KCkKICAgIGJ5dGUgIm1lc3Nlbmdlcl9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQwNy0xNDA4CiAgICAvLyAjIHJlY2VpdmVyIHN0YXRlCiAgICAvLyBzZWxmLm1lc3Nlbmdlcl9pZCA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Mb2NrYWJsZS5fX2luaXRfXygpIC0+IHZvaWQ6CkxvY2thYmxlLl9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MjYKICAgIC8vIGRlZiBfX2luaXRfXyhzZWxmKSAtPiBOb25lOiAgIyBwcmFnbWE6IG5vIGNvdmVyCiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MjctODI4CiAgICAvLyAjIG93bmFibGUgc3RhdGUKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjY4CiAgICAvLyBzZWxmLnBlcmlvZCA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgInBlcmlvZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODI5LTgzMAogICAgLy8gIyBsb2NrYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY2OQogICAgLy8gc2VsZi5pbml0aWFsID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAiaW5pdGlhbCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODMxCiAgICAvLyBzZWxmLmluaXRpYWwgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjY3MAogICAgLy8gc2VsZi5kZWFkbGluZSA9IFVJbnQ2NCgpICAjIDAKICAgIGJ5dGUgImRlYWRsaW5lIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzIKICAgIC8vIHNlbGYuZGVhZGxpbmUgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjgzNAogICAgLy8gc2VsZi5mdWxseV92ZXN0ZWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlICJmdWxseV92ZXN0ZWQiCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTQ5CiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgYnl0ZSAiZnVuZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzUtODM2CiAgICAvLyAjIGZ1bmRhYmxlIHN0YXRlCiAgICAvLyBzZWxmLmZ1bmRlciA9IEFjY291bnQoKQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBieXRlICJmdW5kaW5nIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzcKICAgIC8vIHNlbGYuZnVuZGluZyA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTUxCiAgICAvLyBzZWxmLnRvdGFsID0gVUludDY0KCkKICAgIGJ5dGUgInRvdGFsIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzgKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU3NAogICAgLy8gc2VsZi5wYXJlbnRfaWQgPSBVSW50NjQoKQogICAgYnl0ZSAicGFyZW50X2lkIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4MzktODQwCiAgICAvLyAjIGRlcGxveWFibGUgc3RhdGUKICAgIC8vIHNlbGYucGFyZW50X2lkID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NzUKICAgIC8vIHNlbGYuZGVwbG95ZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgImRlcGxveWVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NDEKICAgIC8vIHNlbGYuZGVwbG95ZXIgPSBBY2NvdW50KCkKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NjMKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkID0gVUludDY0KCkKICAgIGJ5dGUgIm1lc3Nlbmdlcl9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODQyLTg0MwogICAgLy8gIyByZWNlaXZlciBzdGF0ZQogICAgLy8gc2VsZi5tZXNzZW5nZXJfaWQgPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcC5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzgwLTEzODIKICAgIC8vIGNsYXNzIEFpcmRyb3AoCiAgICAvLyAgICAgTG9ja2FibGUsIE93bmFibGUsIEZ1bmRhYmxlLCBEZXBsb3lhYmxlLCBTdGFrZWFibGUsIFVwZ3JhZGVhYmxlLCBSZWNlaXZlcgogICAgLy8gKToKICAgIGludCAxCiAgICByZXR1cm4K"
   },
   "state": {
     "global": {
-      "num_byte_slices": 5,
-      "num_uints": 17
+      "num_byte_slices": 6,
+      "num_uints": 12
     },
     "local": {
       "num_byte_slices": 0,
@@ -154,13 +308,9 @@ export const APP_SPEC: AppSpec = {
           "type": "uint64",
           "key": "deployment_version"
         },
-        "distribution_count": {
+        "fully_vested": {
           "type": "uint64",
-          "key": "distribution_count"
-        },
-        "distribution_seconds": {
-          "type": "uint64",
-          "key": "distribution_seconds"
+          "key": "fully_vested"
         },
         "funder": {
           "type": "bytes",
@@ -174,10 +324,6 @@ export const APP_SPEC: AppSpec = {
           "type": "uint64",
           "key": "initial"
         },
-        "lockup_delay": {
-          "type": "uint64",
-          "key": "lockup_delay"
-        },
         "messenger_id": {
           "type": "uint64",
           "key": "messenger_id"
@@ -186,6 +332,10 @@ export const APP_SPEC: AppSpec = {
           "type": "bytes",
           "key": "owner"
         },
+        "params": {
+          "type": "bytes",
+          "key": "params"
+        },
         "parent_id": {
           "type": "uint64",
           "key": "parent_id"
@@ -194,14 +344,6 @@ export const APP_SPEC: AppSpec = {
           "type": "uint64",
           "key": "period"
         },
-        "period_limit": {
-          "type": "uint64",
-          "key": "period_limit"
-        },
-        "period_seconds": {
-          "type": "uint64",
-          "key": "period_seconds"
-        },
         "stakeable": {
           "type": "uint64",
           "key": "stakeable"
@@ -217,10 +359,6 @@ export const APP_SPEC: AppSpec = {
         "upgrader": {
           "type": "bytes",
           "key": "upgrader"
-        },
-        "vesting_delay": {
-          "type": "uint64",
-          "key": "vesting_delay"
         }
       },
       "reserved": {}
@@ -291,6 +429,173 @@ export const APP_SPEC: AppSpec = {
         },
         "desc": "Template method."
       },
+      {
+        "name": "template_shared",
+        "args": [
+          {
+            "type": "uint64",
+            "name": "period"
+          },
+          {
+            "type": "uint64",
+            "name": "deadline"
+          },
+          {
+            "type": "uint64",
+            "name": "total"
+          },
+          {
+            "type": "uint64",
+            "name": "funding"
+          },
+          {
+            "type": "address",
+            "name": "delegate"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Template method reading shared template parameters from parent."
+      },
+      {
+        "name": "init",
+        "args": [
+          {
+            "type": "uint64",
+            "name": "period_limit"
+          },
+          {
+            "type": "uint64",
+            "name": "vesting_delay"
+          },
+          {
+            "type": "uint64",
+            "name": "lockup_delay"
+          },
+          {
+            "type": "uint64",
+            "name": "period_seconds"
+          },
+          {
+            "type": "uint64",
+            "name": "messenger_id"
+          },
+          {
+            "type": "uint64",
+            "name": "distribution_count"
+          },
+          {
+            "type": "uint64",
+            "name": "distribution_seconds"
+          },
+          {
+            "type": "uint64",
+            "name": "period"
+          },
+          {
+            "type": "uint64",
+            "name": "deadline"
+          },
+          {
+            "type": "uint64",
+            "name": "total"
+          },
+          {
+            "type": "uint64",
+            "name": "funding"
+          },
+          {
+            "type": "address",
+            "name": "delegate"
+          },
+          {
+            "type": "address",
+            "name": "upgrader"
+          },
+          {
+            "type": "address",
+            "name": "deployer"
+          },
+          {
+            "type": "address",
+            "name": "owner"
+          },
+          {
+            "type": "address",
+            "name": "funder"
+          },
+          {
+            "type": "uint64",
+            "name": "initial"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Initialize template, upgrader and setup. Should be called by creator."
+      },
+      {
+        "name": "init_shared",
+        "args": [
+          {
+            "type": "uint64",
+            "name": "period"
+          },
+          {
+            "type": "uint64",
+            "name": "deadline"
+          },
+          {
+            "type": "uint64",
+            "name": "total"
+          },
+          {
+            "type": "uint64",
+            "name": "funding"
+          },
+          {
+            "type": "address",
+            "name": "delegate"
+          },
+          {
+            "type": "address",
+            "name": "upgrader"
+          },
+          {
+            "type": "address",
+            "name": "deployer"
+          },
+          {
+            "type": "address",
+            "name": "owner"
+          },
+          {
+            "type": "address",
+            "name": "funder"
+          },
+          {
+            "type": "uint64",
+            "name": "initial"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Initialize template from parent, upgrader and setup. Should be\ncalled by creator."
+      },
+      {
+        "name": "get_state",
+        "args": [],
+        "readonly": true,
+        "returns": {
+          "type": "(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)"
+        },
+        "desc": "Get state."
+      },
       {
         "name": "abort_funding",
         "args": [],
@@ -345,6 +650,19 @@ export const APP_SPEC: AppSpec = {
           "type": "void"
         }
       },
+      {
+        "name": "set_funding",
+        "args": [
+          {
+            "type": "uint64",
+            "name": "funding"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        }
+      },
       {
         "name": "withdraw",
         "args": [
@@ -359,6 +677,43 @@ export const APP_SPEC: AppSpec = {
         },
         "desc": "Withdraw funds from contract."
       },
+      {
+        "name": "withdraw_max",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "(uint64,uint64)"
+        },
+        "desc": "Withdraw all available funds from contract."
+      },
+      {
+        "name": "mab_at",
+        "args": [
+          {
+            "type": "uint64",
+            "name": "timestamp"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "uint64"
+        },
+        "desc": "Get minimum allowable balance at timestamp."
+      },
+      {
+        "name": "next_unlock",
+        "args": [
+          {
+            "type": "uint64",
+            "name": "timestamp"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "(uint64,uint64)"
+        },
+        "desc": "Get next timestamp at which minimum allowable balance decreases."
+      },
       {
         "name": "close",
         "args": [],
@@ -402,11 +757,11 @@ export const APP_SPEC: AppSpec = {
         }
       },
       {
-        "name": "set_funding",
+        "name": "reduce_total",
         "args": [
           {
             "type": "uint64",
-            "name": "funding"
+            "name": "adjustment"
           }
         ],
         "readonly": false,
@@ -415,11 +770,11 @@ export const APP_SPEC: AppSpec = {
         }
       },
       {
-        "name": "reduce_total",
+        "name": "set_delegate",
         "args": [
           {
-            "type": "uint64",
-            "name": "adjustment"
+            "type": "address",
+            "name": "delegate"
           }
         ],
         "readonly": false,
@@ -428,11 +783,31 @@ export const APP_SPEC: AppSpec = {
         }
       },
       {
-        "name": "set_delegate",
+        "name": "participate",
         "args": [
           {
-            "type": "address",
-            "name": "delegate"
+            "type": "byte[32]",
+            "name": "vote_k"
+          },
+          {
+            "type": "byte[32]",
+            "name": "sel_k"
+          },
+          {
+            "type": "uint64",
+            "name": "vote_fst"
+          },
+          {
+            "type": "uint64",
+            "name": "vote_lst"
+          },
+          {
+            "type": "uint64",
+            "name": "vote_kd"
+          },
+          {
+            "type": "byte[64]",
+            "name": "sp_key"
           }
         ],
         "readonly": false,
@@ -441,7 +816,7 @@ export const APP_SPEC: AppSpec = {
         }
       },
       {
-        "name": "participate",
+        "name": "participate_pooled",
         "args": [
           {
             "type": "byte[32]",
@@ -613,6 +988,62 @@ export type Airdrop = {
       argsTuple: [periodLimit: bigint | number, vestingDelay: bigint | number, lockupDelay: bigint | number, periodSeconds: bigint | number, messengerId: bigint | number, distributionCount: bigint | number, distributionSeconds: bigint | number, period: bigint | number, deadline: bigint | number, total: bigint | number, funding: bigint | number, delegate: string]
       returns: void
     }>
+    & Record<'template_shared(uint64,uint64,uint64,uint64,address)void' | 'template_shared', {
+      argsObj: {
+        period: bigint | number
+        deadline: bigint | number
+        total: bigint | number
+        funding: bigint | number
+        delegate: string
+      }
+      argsTuple: [period: bigint | number, deadline: bigint | number, total: bigint | number, funding: bigint | number, delegate: string]
+      returns: void
+    }>
+    & Record<'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void' | 'init', {
+      argsObj: {
+        periodLimit: bigint | number
+        vestingDelay: bigint | number
+        lockupDelay: bigint | number
+        periodSeconds: bigint | number
+        messengerId: bigint | number
+        distributionCount: bigint | number
+        distributionSeconds: bigint | number
+        period: bigint | number
+        deadline: bigint | number
+        total: bigint | number
+        funding: bigint | number
+        delegate: string
+        upgrader: string
+        deployer: string
+        owner: string
+        funder: string
+        initial: bigint | number
+      }
+      argsTuple: [periodLimit: bigint | number, vestingDelay: bigint | number, lockupDelay: bigint | number, periodSeconds: bigint | number, messengerId: bigint | number, distributionCount: bigint | number, distributionSeconds: bigint | number, period: bigint | number, deadline: bigint | number, total: bigint | number, funding: bigint | number, delegate: string, upgrader: string, deployer: string, owner: string, funder: string, initial: bigint | number]
+      returns: void
+    }>
+    & Record<'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void' | 'init_shared', {
+      argsObj: {
+        period: bigint | number
+        deadline: bigint | number
+        total: bigint | number
+        funding: bigint | number
+        delegate: string
+        upgrader: string
+        deployer: string
+        owner: string
+        funder: string
+        initial: bigint | number
+      }
+      argsTuple: [period: bigint | number, deadline: bigint | number, total: bigint | number, funding: bigint | number, delegate: string, upgrader: string, deployer: string, owner: string, funder: string, initial: bigint | number]
+      returns: void
+    }>
+    & Record<'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)' | 'get_state', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: AirdropState
+    }>
     & Record<'abort_funding()void' | 'abort_funding', {
       argsObj: {
       }
@@ -642,6 +1073,13 @@ export type Airdrop = {
       argsTuple: [period: bigint | number]
       returns: void
     }>
+    & Record<'set_funding(uint64)void' | 'set_funding', {
+      argsObj: {
+        funding: bigint | number
+      }
+      argsTuple: [funding: bigint | number]
+      returns: void
+    }>
     & Record<'withdraw(uint64)uint64' | 'withdraw', {
       argsObj: {
         amount: bigint | number
@@ -649,6 +1087,26 @@ export type Airdrop = {
       argsTuple: [amount: bigint | number]
       returns: bigint
     }>
+    & Record<'withdraw_max()(uint64,uint64)' | 'withdraw_max', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: [bigint, bigint]
+    }>
+    & Record<'mab_at(uint64)uint64' | 'mab_at', {
+      argsObj: {
+        timestamp: bigint | number
+      }
+      argsTuple: [timestamp: bigint | number]
+      returns: bigint
+    }>
+    & Record<'next_unlock(uint64)(uint64,uint64)' | 'next_unlock', {
+      argsObj: {
+        timestamp: bigint | number
+      }
+      argsTuple: [timestamp: bigint | number]
+      returns: [bigint, bigint]
+    }>
     & Record<'close()void' | 'close', {
       argsObj: {
       }
@@ -675,13 +1133,6 @@ export type Airdrop = {
       argsTuple: [funder: string]
       returns: void
     }>
-    & Record<'set_funding(uint64)void' | 'set_funding', {
-      argsObj: {
-        funding: bigint | number
-      }
-      argsTuple: [funding: bigint | number]
-      returns: void
-    }>
     & Record<'reduce_total(uint64)void' | 'reduce_total', {
       argsObj: {
         adjustment: bigint | number
@@ -708,6 +1159,18 @@ export type Airdrop = {
       argsTuple: [voteK: Uint8Array, selK: Uint8Array, voteFst: bigint | number, voteLst: bigint | number, voteKd: bigint | number, spKey: Uint8Array]
       returns: void
     }>
+    & Record<'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void' | 'participate_pooled', {
+      argsObj: {
+        voteK: Uint8Array
+        selK: Uint8Array
+        voteFst: bigint | number
+        voteLst: bigint | number
+        voteKd: bigint | number
+        spKey: Uint8Array
+      }
+      argsTuple: [voteK: Uint8Array, selK: Uint8Array, voteFst: bigint | number, voteLst: bigint | number, voteKd: bigint | number, spKey: Uint8Array]
+      returns: void
+    }>
     & Record<'set_version(uint64,uint64)void' | 'set_version', {
       argsObj: {
         contractVersion: bigint | number
@@ -740,26 +1203,86 @@ export type Airdrop = {
       delegate?: BinaryState
       deployer?: BinaryState
       deploymentVersion?: IntegerState
-      distributionCount?: IntegerState
-      distributionSeconds?: IntegerState
+      fullyVested?: IntegerState
       funder?: BinaryState
       funding?: IntegerState
       initial?: IntegerState
-      lockupDelay?: IntegerState
       messengerId?: IntegerState
       owner?: BinaryState
+      params?: BinaryState
       parentId?: IntegerState
       period?: IntegerState
-      periodLimit?: IntegerState
-      periodSeconds?: IntegerState
       stakeable?: IntegerState
       total?: IntegerState
       updatable?: IntegerState
       upgrader?: BinaryState
-      vestingDelay?: IntegerState
     }
   }
 }
+/**
+ * Represents a AirdropState result as a struct
+ */
+export type AirdropState = {
+  owner: string
+  funder: string
+  delegate: string
+  deployer: string
+  upgrader: string
+  parentId: bigint
+  messengerId: bigint
+  periodLimit: bigint
+  vestingDelay: bigint
+  lockupDelay: bigint
+  periodSeconds: bigint
+  distributionCount: bigint
+  distributionSeconds: bigint
+  period: bigint
+  deadline: bigint
+  total: bigint
+  funding: bigint
+  initial: bigint
+  fullyVested: bigint
+  contractVersion: bigint
+  deploymentVersion: bigint
+  updatable: boolean
+  stakeable: boolean
+  balance: bigint
+  minBalance: bigint
+  availableBalance: bigint
+}
+/**
+ * Converts the tuple representation of a AirdropState to the struct representation
+ */
+export function AirdropState([owner, funder, delegate, deployer, upgrader, parentId, messengerId, periodLimit, vestingDelay, lockupDelay, periodSeconds, distributionCount, distributionSeconds, period, deadline, total, funding, initial, fullyVested, contractVersion, deploymentVersion, updatable, stakeable, balance, minBalance, availableBalance]: [string, string, string, string, string, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, boolean, boolean, bigint, bigint, bigint] ) {
+  return {
+    owner,
+    funder,
+    delegate,
+    deployer,
+    upgrader,
+    parentId,
+    messengerId,
+    periodLimit,
+    vestingDelay,
+    lockupDelay,
+    periodSeconds,
+    distributionCount,
+    distributionSeconds,
+    period,
+    deadline,
+    total,
+    funding,
+    initial,
+    fullyVested,
+    contractVersion,
+    deploymentVersion,
+    updatable,
+    stakeable,
+    balance,
+    minBalance,
+    availableBalance,
+  }
+}
 /**
  * Defines the possible abi call signatures
  */
@@ -940,52 +1463,179 @@ export abstract class AirdropCallFactory {
    */
   static template(args: MethodArgs<'template(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'template(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address)void' as const,
-      methodArgs: Array.isArray(args) ? args : [args.periodLimit, args.vestingDelay, args.lockupDelay, args.periodSeconds, args.messengerId, args.distributionCount, args.distributionSeconds, args.period, args.deadline, args.total, args.funding, args.delegate],
+      method: 'template(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.periodLimit, args.vestingDelay, args.lockupDelay, args.periodSeconds, args.messengerId, args.distributionCount, args.distributionSeconds, args.period, args.deadline, args.total, args.funding, args.delegate],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the template_shared(uint64,uint64,uint64,uint64,address)void ABI method
+   *
+   * Template method reading shared template parameters from parent.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static templateShared(args: MethodArgs<'template_shared(uint64,uint64,uint64,uint64,address)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'template_shared(uint64,uint64,uint64,uint64,address)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.period, args.deadline, args.total, args.funding, args.delegate],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void ABI method
+   *
+   * Initialize template, upgrader and setup. Should be called by creator.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static init(args: MethodArgs<'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.periodLimit, args.vestingDelay, args.lockupDelay, args.periodSeconds, args.messengerId, args.distributionCount, args.distributionSeconds, args.period, args.deadline, args.total, args.funding, args.delegate, args.upgrader, args.deployer, args.owner, args.funder, args.initial],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void ABI method
+   *
+   * Initialize template from parent, upgrader and setup. Should be
+called by creator.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static initShared(args: MethodArgs<'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.period, args.deadline, args.total, args.funding, args.delegate, args.upgrader, args.deployer, args.owner, args.funder, args.initial],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64) ABI method
+   *
+   * Get state.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getState(args: MethodArgs<'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the setup(address,address,address,uint64)void ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static setup(args: MethodArgs<'setup(address,address,address,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'setup(address,address,address,uint64)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.deployer, args.owner, args.funder, args.initial],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the configure(uint64)void ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static configure(args: MethodArgs<'configure(uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'configure(uint64)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.period],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the set_funding(uint64)void ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static setFunding(args: MethodArgs<'set_funding(uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'set_funding(uint64)void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.funding],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the withdraw(uint64)uint64 ABI method
+   *
+   * Withdraw funds from contract.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static withdraw(args: MethodArgs<'withdraw(uint64)uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'withdraw(uint64)uint64' as const,
+      methodArgs: Array.isArray(args) ? args : [args.amount],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the setup(address,address,address,uint64)void ABI method
+   * Constructs a no op call for the withdraw_max()(uint64,uint64) ABI method
+   *
+   * Withdraw all available funds from contract.
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static setup(args: MethodArgs<'setup(address,address,address,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static withdrawMax(args: MethodArgs<'withdraw_max()(uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'setup(address,address,address,uint64)void' as const,
-      methodArgs: Array.isArray(args) ? args : [args.deployer, args.owner, args.funder, args.initial],
+      method: 'withdraw_max()(uint64,uint64)' as const,
+      methodArgs: Array.isArray(args) ? args : [],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the configure(uint64)void ABI method
+   * Constructs a no op call for the mab_at(uint64)uint64 ABI method
+   *
+   * Get minimum allowable balance at timestamp.
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static configure(args: MethodArgs<'configure(uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static mabAt(args: MethodArgs<'mab_at(uint64)uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'configure(uint64)void' as const,
-      methodArgs: Array.isArray(args) ? args : [args.period],
+      method: 'mab_at(uint64)uint64' as const,
+      methodArgs: Array.isArray(args) ? args : [args.timestamp],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the withdraw(uint64)uint64 ABI method
+   * Constructs a no op call for the next_unlock(uint64)(uint64,uint64) ABI method
    *
-   * Withdraw funds from contract.
+   * Get next timestamp at which minimum allowable balance decreases.
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static withdraw(args: MethodArgs<'withdraw(uint64)uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static nextUnlock(args: MethodArgs<'next_unlock(uint64)(uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'withdraw(uint64)uint64' as const,
-      methodArgs: Array.isArray(args) ? args : [args.amount],
+      method: 'next_unlock(uint64)(uint64,uint64)' as const,
+      methodArgs: Array.isArray(args) ? args : [args.timestamp],
       ...params,
     }
   }
@@ -1031,20 +1681,6 @@ export abstract class AirdropCallFactory {
       ...params,
     }
   }
-  /**
-   * Constructs a no op call for the set_funding(uint64)void ABI method
-   *
-   * @param args Any args for the contract call
-   * @param params Any additional parameters for the call
-   * @returns A TypedCallParams object for the call
-   */
-  static setFunding(args: MethodArgs<'set_funding(uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
-    return {
-      method: 'set_funding(uint64)void' as const,
-      methodArgs: Array.isArray(args) ? args : [args.funding],
-      ...params,
-    }
-  }
   /**
    * Constructs a no op call for the reduce_total(uint64)void ABI method
    *
@@ -1087,6 +1723,20 @@ export abstract class AirdropCallFactory {
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static participatePooled(args: MethodArgs<'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.voteK, args.selK, args.voteFst, args.voteLst, args.voteKd, args.spKey],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the set_version(uint64,uint64)void ABI method
    *
@@ -1301,6 +1951,59 @@ export class AirdropClient {
     return this.call(AirdropCallFactory.template(args, params))
   }
 
+  /**
+   * Calls the template_shared(uint64,uint64,uint64,uint64,address)void ABI method.
+   *
+   * Template method reading shared template parameters from parent.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public templateShared(args: MethodArgs<'template_shared(uint64,uint64,uint64,uint64,address)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.templateShared(args, params))
+  }
+
+  /**
+   * Calls the init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void ABI method.
+   *
+   * Initialize template, upgrader and setup. Should be called by creator.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public init(args: MethodArgs<'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.init(args, params))
+  }
+
+  /**
+   * Calls the init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void ABI method.
+   *
+   * Initialize template from parent, upgrader and setup. Should be
+called by creator.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public initShared(args: MethodArgs<'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.initShared(args, params))
+  }
+
+  /**
+   * Calls the get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64) ABI method.
+   *
+   * Get state.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getState(args: MethodArgs<'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.getState(args, params), AirdropState)
+  }
+
   /**
    * Calls the setup(address,address,address,uint64)void ABI method.
    *
@@ -1323,6 +2026,17 @@ export class AirdropClient {
     return this.call(AirdropCallFactory.configure(args, params))
   }
 
+  /**
+   * Calls the set_funding(uint64)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public setFunding(args: MethodArgs<'set_funding(uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.setFunding(args, params))
+  }
+
   /**
    * Calls the withdraw(uint64)uint64 ABI method.
    *
@@ -1336,6 +2050,45 @@ export class AirdropClient {
     return this.call(AirdropCallFactory.withdraw(args, params))
   }
 
+  /**
+   * Calls the withdraw_max()(uint64,uint64) ABI method.
+   *
+   * Withdraw all available funds from contract.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public withdrawMax(args: MethodArgs<'withdraw_max()(uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.withdrawMax(args, params))
+  }
+
+  /**
+   * Calls the mab_at(uint64)uint64 ABI method.
+   *
+   * Get minimum allowable balance at timestamp.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public mabAt(args: MethodArgs<'mab_at(uint64)uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.mabAt(args, params))
+  }
+
+  /**
+   * Calls the next_unlock(uint64)(uint64,uint64) ABI method.
+   *
+   * Get next timestamp at which minimum allowable balance decreases.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public nextUnlock(args: MethodArgs<'next_unlock(uint64)(uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.nextUnlock(args, params))
+  }
+
   /**
    * Calls the transfer(address)void ABI method.
    *
@@ -1369,17 +2122,6 @@ export class AirdropClient {
     return this.call(AirdropCallFactory.grantFunder(args, params))
   }
 
-  /**
-   * Calls the set_funding(uint64)void ABI method.
-   *
-   * @param args The arguments for the contract call
-   * @param params Any additional parameters for the call
-   * @returns The result of the call
-   */
-  public setFunding(args: MethodArgs<'set_funding(uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(AirdropCallFactory.setFunding(args, params))
-  }
-
   /**
    * Calls the reduce_total(uint64)void ABI method.
    *
@@ -1413,6 +2155,17 @@ export class AirdropClient {
     return this.call(AirdropCallFactory.participate(args, params))
   }
 
+  /**
+   * Calls the participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public participatePooled(args: MethodArgs<'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropCallFactory.participatePooled(args, params))
+  }
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -1511,11 +2264,8 @@ export class AirdropClient {
       get deploymentVersion() {
         return AirdropClient.getIntegerState(state, 'deployment_version')
       },
-      get distributionCount() {
-        return AirdropClient.getIntegerState(state, 'distribution_count')
-      },
-      get distributionSeconds() {
-        return AirdropClient.getIntegerState(state, 'distribution_seconds')
+      get fullyVested() {
+        return AirdropClient.getIntegerState(state, 'fully_vested')
       },
       get funder() {
         return AirdropClient.getBinaryState(state, 'funder')
@@ -1526,27 +2276,21 @@ export class AirdropClient {
       get initial() {
         return AirdropClient.getIntegerState(state, 'initial')
       },
-      get lockupDelay() {
-        return AirdropClient.getIntegerState(state, 'lockup_delay')
-      },
       get messengerId() {
         return AirdropClient.getIntegerState(state, 'messenger_id')
       },
       get owner() {
         return AirdropClient.getBinaryState(state, 'owner')
       },
+      get params() {
+        return AirdropClient.getBinaryState(state, 'params')
+      },
       get parentId() {
         return AirdropClient.getIntegerState(state, 'parent_id')
       },
       get period() {
         return AirdropClient.getIntegerState(state, 'period')
       },
-      get periodLimit() {
-        return AirdropClient.getIntegerState(state, 'period_limit')
-      },
-      get periodSeconds() {
-        return AirdropClient.getIntegerState(state, 'period_seconds')
-      },
       get stakeable() {
         return AirdropClient.getIntegerState(state, 'stakeable')
       },
@@ -1559,9 +2303,6 @@ export class AirdropClient {
       get upgrader() {
         return AirdropClient.getBinaryState(state, 'upgrader')
       },
-      get vestingDelay() {
-        return AirdropClient.getIntegerState(state, 'vesting_delay')
-      },
     }
   }
 
@@ -1576,6 +2317,26 @@ export class AirdropClient {
         resultMappers.push(undefined)
         return this
       },
+      templateShared(args: MethodArgs<'template_shared(uint64,uint64,uint64,uint64,address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.templateShared(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      init(args: MethodArgs<'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.init(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      initShared(args: MethodArgs<'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.initShared(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getState(args: MethodArgs<'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getState(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(AirdropState)
+        return this
+      },
       setup(args: MethodArgs<'setup(address,address,address,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setup(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1586,11 +2347,31 @@ export class AirdropClient {
         resultMappers.push(undefined)
         return this
       },
+      setFunding(args: MethodArgs<'set_funding(uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.setFunding(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       withdraw(args: MethodArgs<'withdraw(uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.withdraw(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      withdrawMax(args: MethodArgs<'withdraw_max()(uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.withdrawMax(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      mabAt(args: MethodArgs<'mab_at(uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.mabAt(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      nextUnlock(args: MethodArgs<'next_unlock(uint64)(uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.nextUnlock(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       transfer(args: MethodArgs<'transfer(address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.transfer(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1606,11 +2387,6 @@ export class AirdropClient {
         resultMappers.push(undefined)
         return this
       },
-      setFunding(args: MethodArgs<'set_funding(uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
-        promiseChain = promiseChain.then(() => client.setFunding(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
-        resultMappers.push(undefined)
-        return this
-      },
       reduceTotal(args: MethodArgs<'reduce_total(uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.reduceTotal(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1626,6 +2402,11 @@ export class AirdropClient {
         resultMappers.push(undefined)
         return this
       },
+      participatePooled(args: MethodArgs<'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.participatePooled(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       setVersion(args: MethodArgs<'set_version(uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setVersion(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1715,6 +2496,51 @@ export type AirdropComposer<TReturns extends [...any[]] = []> = {
    */
   template(args: MethodArgs<'template(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'template(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address)void'>]>
 
+  /**
+   * Calls the template_shared(uint64,uint64,uint64,uint64,address)void ABI method.
+   *
+   * Template method reading shared template parameters from parent.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  templateShared(args: MethodArgs<'template_shared(uint64,uint64,uint64,uint64,address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'template_shared(uint64,uint64,uint64,uint64,address)void'>]>
+
+  /**
+   * Calls the init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void ABI method.
+   *
+   * Initialize template, upgrader and setup. Should be called by creator.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  init(args: MethodArgs<'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'init(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>]>
+
+  /**
+   * Calls the init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void ABI method.
+   *
+   * Initialize template from parent, upgrader and setup. Should be
+called by creator.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  initShared(args: MethodArgs<'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'init_shared(uint64,uint64,uint64,uint64,address,address,address,address,address,uint64)void'>]>
+
+  /**
+   * Calls the get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64) ABI method.
+   *
+   * Get state.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getState(args: MethodArgs<'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'get_state()(address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,uint64,uint64)'>]>
+
   /**
    * Calls the setup(address,address,address,uint64)void ABI method.
    *
@@ -1733,6 +2559,15 @@ export type AirdropComposer<TReturns extends [...any[]] = []> = {
    */
   configure(args: MethodArgs<'configure(uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'configure(uint64)void'>]>
 
+  /**
+   * Calls the set_funding(uint64)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  setFunding(args: MethodArgs<'set_funding(uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'set_funding(uint64)void'>]>
+
   /**
    * Calls the withdraw(uint64)uint64 ABI method.
    *
@@ -1745,40 +2580,64 @@ export type AirdropComposer<TReturns extends [...any[]] = []> = {
   withdraw(args: MethodArgs<'withdraw(uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'withdraw(uint64)uint64'>]>
 
   /**
-   * Calls the transfer(address)void ABI method.
+   * Calls the withdraw_max()(uint64,uint64) ABI method.
+   *
+   * Withdraw all available funds from contract.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  transfer(args: MethodArgs<'transfer(address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'transfer(address)void'>]>
+  withdrawMax(args: MethodArgs<'withdraw_max()(uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'withdraw_max()(uint64,uint64)'>]>
 
   /**
-   * Calls the fill()void ABI method.
+   * Calls the mab_at(uint64)uint64 ABI method.
+   *
+   * Get minimum allowable balance at timestamp.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  fill(args: MethodArgs<'fill()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'fill()void'>]>
+  mabAt(args: MethodArgs<'mab_at(uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'mab_at(uint64)uint64'>]>
 
   /**
-   * Calls the grant_funder(address)void ABI method.
+   * Calls the next_unlock(uint64)(uint64,uint64) ABI method.
+   *
+   * Get next timestamp at which minimum allowable balance decreases.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  grantFunder(args: MethodArgs<'grant_funder(address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'grant_funder(address)void'>]>
+  nextUnlock(args: MethodArgs<'next_unlock(uint64)(uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'next_unlock(uint64)(uint64,uint64)'>]>
 
   /**
-   * Calls the set_funding(uint64)void ABI method.
+   * Calls the transfer(address)void ABI method.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  setFunding(args: MethodArgs<'set_funding(uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'set_funding(uint64)void'>]>
+  transfer(args: MethodArgs<'transfer(address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'transfer(address)void'>]>
+
+  /**
+   * Calls the fill()void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  fill(args: MethodArgs<'fill()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'fill()void'>]>
+
+  /**
+   * Calls the grant_funder(address)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  grantFunder(args: MethodArgs<'grant_funder(address)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'grant_funder(address)void'>]>
 
   /**
    * Calls the reduce_total(uint64)void ABI method.
@@ -1807,6 +2666,15 @@ export type AirdropComposer<TReturns extends [...any[]] = []> = {
    */
   participate(args: MethodArgs<'participate(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'participate(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>]>
 
+  /**
+   * Calls the participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  participatePooled(args: MethodArgs<'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropComposer<[...TReturns, MethodReturn<'participate_pooled(byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>]>
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -31,16 +31,37 @@ import type { ABIResult, TransactionWithSigner } from 'algosdk'
 import { Algodv2, OnApplicationComplete, Transaction, AtomicTransactionComposer, modelsv2 } from 'algosdk'
 export const APP_SPEC: AppSpec = {
   "hints": {
+    "share_params()void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "create(address,address,uint64,uint64)uint64": {
       "call_config": {
         "no_op": "CALL"
       }
     },
+    "create_many((address,address,uint64,uint64)[])uint64[]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "update()void": {
       "call_config": {
         "no_op": "CALL"
       }
     },
+    "enable_registry()void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "set_version(uint64,uint64)void": {
       "call_config": {
         "no_op": "CALL"
@@ -63,13 +84,13 @@ export const APP_SPEC: AppSpec = {
     }
   },
   "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcEZhY3RvcnkuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA1CiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTIKICAgIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KXVpbnQ2NCIKICAgIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgbWV0aG9kICJzZXRfdmVyc2lvbih1aW50NjQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgImFwcHJvdmVfdXBkYXRlKGJvb2wpdm9pZCIKICAgIG1ldGhvZCAiZ3JhbnRfdXBncmFkZXIoYWRkcmVzcyl2b2lkIgogICAgbWV0aG9kICJ0cmFuc2ZlcihhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9yb3V0ZUA0IG1haW5fdXBkYXRlX3JvdXRlQDUgbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUA2IG1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVANyBtYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDggbWFpbl90cmFuc2Zlcl9yb3V0ZUA5CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZV9yb3V0ZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTE0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwNQogICAgLy8gY2xhc3MgQWlyZHJvcEZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTE0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlCiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZV9yb3V0ZUA1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTgyLTExODMKICAgIC8vICMgVE9ETyByZW1vdmUgbWUgbGF0ZXIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X3ZlcnNpb25fcm91dGVANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwNQogICAgLy8gY2xhc3MgQWlyZHJvcEZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzZXRfdmVyc2lvbgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX3VwZGF0ZV9yb3V0ZUA3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA1CiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGFwcHJvdmVfdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDg6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMDUKICAgIC8vIGNsYXNzIEFpcmRyb3BGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgZ3JhbnRfdXBncmFkZXIKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfcm91dGVAOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMDUKICAgIC8vIGNsYXNzIEFpcmRyb3BGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIGludCAwCiAgICBpbnQgNAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgbWF0Y2ggbWFpbl9jcmVhdGVAMTMgbWFpbl9vbl91cGRhdGVAMTQKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fY3JlYXRlQDEzOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTA1CiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX29uX3VwZGF0ZUAxNDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY2CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY2LTQ2NwogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIGNhbGxzdWIgb25fdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3BGYWN0b3J5LmNyZWF0ZShvd25lcjogYnl0ZXMsIGZ1bmRlcjogYnl0ZXMsIGRlYWRsaW5lOiBieXRlcywgaW5pdGlhbDogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTE0LTExMjEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNyZWF0ZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG93bmVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZnVuZGVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZGVhZGxpbmU6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGluaXRpYWw6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzNC0xMTM1CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHNlbGYuZ2V0X2luaXRpYWxfcGF5bWVudCgpCiAgICBjYWxsc3ViIGdldF9pbml0aWFsX3BheW1lbnQKICAgIHBvcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTM4CiAgICAvLyBiYXNlX2FwcCA9IGFyYzQuYXJjNF9jcmVhdGUoQWlyZHJvcCwgY29tcGlsZWQ9Y29tcGlsZWQpLmNyZWF0ZWRfYXBwCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExMzYtMTEzNwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBjb21waWxlZCA9IGNvbXBpbGVfY29udHJhY3QoQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zKSAjIG1heCBleHRyYSBwYWdlcwogICAgaW50IDE3CiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bVVpbnQKICAgIGludCA1CiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgaW50IDMKICAgIGl0eG5fZmllbGQgRXh0cmFQcm9ncmFtUGFnZXMKICAgIGJ5dGUgYmFzZTY0IENvRUJRdz09CiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGJ5dGUgYmFzZTY0IENpQUVBQUVGQWlZYUJXOTNibVZ5Qm1aMWJtUmxjZ2RtZFc1a2FXNW5CWFJ2ZEdGc0NIVndaM0poWkdWeUJuQmxjbWx2WkFoa1pXeGxaMkYwWlJKa2FYTjBjbWxpZFhScGIyNWZZMjkxYm5RVVpHbHpkSEpwWW5WMGFXOXVYM05sWTI5dVpITU1jR1Z5YVc5a1gyeHBiV2wwRFhabGMzUnBibWRmWkdWc1lYa01iRzlqYTNWd1gyUmxiR0Y1RG5CbGNtbHZaRjl6WldOdmJtUnpDR1JsWVdSc2FXNWxDWFZ3WkdGMFlXSnNaUXh0WlhOelpXNW5aWEpmYVdRRVNBZ1E3aUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBaGtaWEJzYjNsbGNnZHBibWwwYVdGc0FBU21nc0FiQ0FBQUFBQUFBQUFBRUdOdmJuUnlZV04wWDNabGNuTnBiMjRTWkdWd2JHOTViV1Z1ZEY5MlpYSnphVzl1Q1hCaGNtVnVkRjlwWkRFWVFBQURpQWViTVJ0QkFidUNFUVF2YmtEK0JGSWxHSzBFb09nWWNnUzcwUEw0QkdjVlEva0VNU0ZCZGdTV1ZnUjZCSzM1S3VRRVhOUDNpZ1RxczVGSUJHZ083VUFFcVdGYzF3UmZmcUpJQk0wazNvZ0VlTHlaMUFSckM0LzRCTlNXdjBNMkdnQ09FUUFCQURFQVBnQkxBR01BY2dDTEFKZ0Fwd0N6QU1JQTBRRGdBTzhCRFFFZkFTNEFNUmtVUkRFWVJEWWFBVFlhQWpZYUF6WWFCRFlhQlRZYUJqWWFCellhQ0RZYUNUWWFDallhQ3pZYURJZ0JLeU5ETVJra0VrUXhHRVNJQWhJalF6RVpKQkpFTVJoRWlBSzRJME14R1JSRU1SaEVOaG9CTmhvQ05ob0ROaG9FaUFMTEkwTXhHUlJFTVJoRU5ob0JpQUwrSTBNeEdSUkVNUmhFTmhvQmlBTXpGb0FFRlI5OGRVeFFzQ05ETVJra0VrUXhHRVNJQkI0alF6RVpGRVF4R0VRMkdnR0lCRW9qUXpFWkZFUXhHRVNJQkY0alF6RVpGRVF4R0VRMkdnR0lCSjRqUXpFWkZFUXhHRVEyR2dHSUJLOGpRekVaRkVReEdFUTJHZ0dJQk5valF6RVpGRVF4R0VRMkdnR0lCUUFqUXpFWkZFUXhHRVEyR2dFMkdnSTJHZ00yR2dRMkdnVTJHZ2FJQlJRalF6RVpGRVF4R0VRMkdnRTJHZ0tJQlcwalF6RVpGRVF4R0VRMkdnR0lCWWNqUXpFWkZFUXhHRVEyR2dHSUJad2pReUtCQkRFWmpnSUFBUUFLQURFWUZFU0lCYWNqUXpFWVJJZ0ZxeU5EaWd3QU1RQXlDUkpFSWljSlpVUVVSQ0luQ21WRUZFUWlKd3RsUkJSRUlpY01aVVFVUkNJbkQyVkVGRVFpSndkbFJCUkVJaWNJWlVRVVJDSW5CMlZFRkVRaUp3aGxSQlJFSWhhTCtrc0JwVVNMK2FSRUlpY0ZaVVFVUkNJbkRXVkVGRVFpSzJWRUZFUWlLbVZFRkVRaUp3WmxSRElERWtTTDlJdjFVSXYyVUl2M1VJdjRVSXY1VUl2NlVJdjdVSXY4VUl2OVVJditVSXYvVUlBRWp5Vkc4RXhRc0l2MEZ5Y0pUR2VMOVJjbkNreG5pL1lYSnd0TVo0djNGeWNNVEdlTCtCY25EMHhuaS9rWEp3ZE1aNHY2RnljSVRHZUwreGNuQlV4bmkvd1hKdzFNWjR2OUZ5dE1aNHYrRnlwTVp5Y0dpLzluaVlvQUFERUFJaWxsUkJKQUFBb3hBQ0lvWlVRU1FRQUVJMElBQVNKRUlpcGxSQlJFTVFBaUtHVkVVQ2NRVEZDd0lpaGxSSWdBQVltS0FRQXhHU1FTUkRJSk1nR3hnRUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBc2o4aXNnNGlzZzBpc2d3bkViSUxKeEd5Q2lPeU9TV3lFQ0t5QWJheUNJdi9zZ215QnlPeUVDS3lBYk9KaWdBQU1RQWlKd1JsUkJKRUlpY09aVVFqRWtRaUp3UmxSQ0lwWlVSUUp4Qk1VTEFpS1dWRWlQOWFpWW9FQUNJb1pVUXlBeEpFSWlsbFJESURFa1F4QURJSkVrU0wvSXY5VUl2K1VJdi9VSUFFblp4dkMweFFzQ2NTaS94bktJdjlaeW1ML21lTC94Y25FMHhuaVlvQkFDSXFaVVFVUkNJclpVUVVSREVBSWlobFJCSkVJaWNKWlVRV2kvK25SQ0luRFdWRU1nY05SQ0luQldWRUZvdi9VSUFFdGo2WGtreFFzSXYvRnljRlRHZUppZ0VCSnhSSEFqRUFJaWhsUkJKRUlpcGxSRUVBTllnQWEwbU1BRWtXaS85UUp4Vk1VTENJQU0rTC94ZEpqQUVKRGtTTC95Y1dwVUVBRUxFeEFMSUhpd0d5Q0NPeUVDS3lBYk9KSWl0bFRFbE9Bb3dBUkVrV2kvOVFKeFZNVUxDSUFKYUwveGRKakFJSkRrU0wveWNXcFVFQUVMRXhBTElIaXdLeUNDT3lFQ0t5QWJPSmlnQUJNZ2NpSndwbFJDSW5ER1ZFSWljTFpVUWlKd1ZsUkNJcVpVUWlLMlZFSWljSFpVUWlKd2hsUklnQUFZbUtDUUVuRkl2Nmkvc0xpL2tMaS9pTCtRdUwvQWdJU1l2M0QwRUFCWXY5akFDSmkvZUxBUW1ML3dwSmpBQ0wvZzVCQUE2TC9vc0FDWXY5QzR2K0Nvd0FpU0tNQUltS0FBRXlDbUF5QVFtSmlnQUFJaXBsUkVTSS8zY1VSREVBSWlobFJCSkFBQW94QUNJcFpVUVNRUUFFSTBJQUFTSkVNUUFpS0dWRVVDY1FURkN3SWlobFJJajlsNG1LQVFBeEFDSW9aVVFTUkNJb1pVU0wvMUNBQkpvaVB2dE1VTEFvaS85bmlZb0FBREVBSWlsbFJCSkVJaWxsUklnQUhTSXJaVVJMQVFoTUZreEpGazhDVEZDQUJNTURwcnhNVUxBclRHZUppZ0VCTVJaSlJDTUpTVGdRSXhKRVNUZ0FpLzhTUkVrNEJ6SUtFa1E0Q0ltS0FRQXhBQ0lwWlVRU1JDSXBaVVNMLzFDQUJFT0gxc0ZNVUxBcGkvOW5pWW9CQURFQUlpbGxSQkpFSWlwbFJFRUFDaUlxWlVReUJ3MUJBQVFqUWdBQklrUWlLbVZFRm92L1VJQUUwRjN1SEV4UXNJdi9GeXBNWjRtS0FRQXhBQ0lwWlVRU1JDSXFaVVFVUkNJclpVUVdpLytuUkNJclpVU0wveGNKU1JhTC8weFFnQVJOU0lFT1RGQ3dLMHhuaVlvQkFERUFJaWhsUkJKQUFBZ3hBRElKRWtFQUJDTkNBQUVpUkNJbkJtVkVpLzlRZ0FSNFpsVjNURkN3SndhTC8yZUppZ1lBTVFBaUtHVkVFa0FBQ3pFQUlpY0daVVFTUVFBRUkwSUFBU0pFTWdBeEFJaisra3NCRWtReEFFbUwrbENMKzFDTC9GQ0wvVkNML2xDTC8xQlFnQVJ0UkpBL1RGQ3dzWXY4RjR2OUY0ditGNHYvc2oreURySU5zZ3lMKzdJTGkvcXlDaVd5RUxJQnM0bUtBZ0F4QUNJbkJHVkVFa1NML292L1VJQUVqSXo1elV4UXNJditGeWNYVEdlTC94Y25HRXhuaVlvQkFERUFJaWhsUkJKRUlpaGxSSXYvVUlBRXdubGxpMHhRc0l2L0lsTW5Ea3huaVlvQkFERUFNZ2tTUkNJbkJHVkVpLzlRZ0FTdDllSzRURkN3SndTTC8yZUppZ0FBTWcxSlJDY1pUR2VKaWdBQU1RQWlKd1JsUkJKRUlpY09aVVFqRWtTSmlnQUFKeGtpWnljU01nTm5Kd1l5QTJlQUNYTjBZV3RsWVdKc1pTTm5KeGNpWnljWUltY25EaU5uSndReUNXY29NZ05uSndVaVp5Y1RJbWNuRFNKbkp3d2laeWNMSW1jbkNpSm5Kd2tpWnljSEltY25DQ0puS1RJRFp5b2laeXNpWnljUEltZUoKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzOAogICAgLy8gYmFzZV9hcHAgPSBhcmM0LmFyYzRfY3JlYXRlKEFpcmRyb3AsIGNvbXBpbGVkPWNvbXBpbGVkKS5jcmVhdGVkX2FwcAogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEzOQogICAgLy8gYXJjNC5lbWl0KEZhY3RvcnlDcmVhdGVkKGFyYzQuVUludDY0KGJhc2VfYXBwLmlkKSkpCiAgICBkdXAKICAgIGl0b2IKICAgIG1ldGhvZCAiRmFjdG9yeUNyZWF0ZWQodWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNDAtMTE1NQogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBBaXJkcm9wLnRlbXBsYXRlLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9TRUNPTkRTIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1FU1NFTkdFUl9JRCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fQ09VTlQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgcGVyaW9kCiAgICAvLyAgICAgZGVhZGxpbmUsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgdG90YWwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyBmdW5kaW5nCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpLCAgIyBkZWxlZ2F0ZQogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE0MgogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgaW50IFRNUExfUEVSSU9EX0xJTUlUCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNDMKICAgIC8vIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHZlc3RpbmcgZGVsYXkKICAgIGludCAwCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNDQKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIGludCBUTVBMX0xPQ0tVUF9ERUxBWQogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTQ1CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIGludCBUTVBMX1BFUklPRF9TRUNPTkRTCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNDYKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1FU1NFTkdFUl9JRCIpKSwKICAgIGludCBUTVBMX01FU1NFTkdFUl9JRAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTQ3CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fQ09VTlQiKSksCiAgICBpbnQgVE1QTF9ESVNUUklCVVRJT05fQ09VTlQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE0OAogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9ESVNUUklCVVRJT05fU0VDT05EUwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTUzCiAgICAvLyBhcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksICAjIGRlbGVnYXRlCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGNvdmVyIDcKICAgIGRpZyA4CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE0MC0xMTU1CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIEFpcmRyb3AudGVtcGxhdGUsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHZlc3RpbmcgZGVsYXkKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9DT1VOVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyBwZXJpb2QKICAgIC8vICAgICBkZWFkbGluZSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB0b3RhbAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksICAjIGRlbGVnYXRlCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJ0ZW1wbGF0ZSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3Mpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDYKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgNQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTU2LTExNjAKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGluaGVyaXQgdXBncmFkZXIKICAgIC8vICAgICBBaXJkcm9wLmdyYW50X3VwZ3JhZGVyLAogICAgLy8gICAgIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTU4CiAgICAvLyBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNTYtMTE2MAogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgaW5oZXJpdCB1cGdyYWRlcgogICAgLy8gICAgIEFpcmRyb3AuZ3JhbnRfdXBncmFkZXIsCiAgICAvLyAgICAgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBtZXRob2QgImdyYW50X3VwZ3JhZGVyKGFkZHJlc3Mpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE2MS0xMTY1CiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgQWlyZHJvcC5ncmFudF91cGdyYWRlciwKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE2MwogICAgLy8gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTYxLTExNjUKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGluaGVyaXQgdXBncmFkZXIKICAgIC8vICAgICBBaXJkcm9wLmdyYW50X3VwZ3JhZGVyLAogICAgLy8gICAgIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJncmFudF91cGdyYWRlcihhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNjYtMTE2OAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1vcC5HbG9iYWwubWluX2JhbGFuY2UsIGZlZT0wICAjIDEwMDAwMAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY3CiAgICAvLyByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9b3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MCAgIyAxMDAwMDAKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNjYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE2NwogICAgLy8gcmVjZWl2ZXI9YmFzZV9hcHAuYWRkcmVzcywgYW1vdW50PW9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAgICMgMTAwMDAwCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE2Ni0xMTY4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9YmFzZV9hcHAuYWRkcmVzcywgYW1vdW50PW9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAgICMgMTAwMDAwCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTY5LTExNzEKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIHNldHVwKGRlcGxveWVyLCBvd25lciwgZnVuZGVyLCBpbml0aWFsKQogICAgLy8gICAgIEFpcmRyb3Auc2V0dXAsIFR4bi5zZW5kZXIsIG93bmVyLCBmdW5kZXIsIGluaXRpYWwsIGFwcF9pZD1iYXNlX2FwcAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTcwCiAgICAvLyBBaXJkcm9wLnNldHVwLCBUeG4uc2VuZGVyLCBvd25lciwgZnVuZGVyLCBpbml0aWFsLCBhcHBfaWQ9YmFzZV9hcHAKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE2OS0xMTcxCiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBzZXR1cChkZXBsb3llciwgb3duZXIsIGZ1bmRlciwgaW5pdGlhbCkKICAgIC8vICAgICBBaXJkcm9wLnNldHVwLCBUeG4uc2VuZGVyLCBvd25lciwgZnVuZGVyLCBpbml0aWFsLCBhcHBfaWQ9YmFzZV9hcHAKICAgIC8vICkKICAgIG1ldGhvZCAic2V0dXAoYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsdWludDY0KXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExNzItMTE4MAogICAgLy8gIyBjb25maWd1cmVkIGJ5IG93bmVyCiAgICAvLyAjIGZ1bmRlcgogICAgLy8gIyAgIGZpbGwKICAgIC8vICMgICBzZXQgZnVuZGluZwogICAgLy8gIyB2ZXN0aW5nCiAgICAvLyAjIGxvY2t1cAogICAgLy8gIyBkb25lCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHJldHVybiBiYXNlX2FwcC5pZAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LmdldF9pbml0aWFsX3BheW1lbnQoKSAtPiB1aW50NjQ6CmdldF9pbml0aWFsX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwODMtMTA4NAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfaW5pdGlhbF9wYXltZW50KHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDg4CiAgICAvLyBwYXltZW50X2Ftb3VudCA9IHJlcXVpcmVfcGF5bWVudChUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiByZXF1aXJlX3BheW1lbnQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5MAogICAgLy8gbWluX2JhbGFuY2UgPSBvcC5HbG9iYWwubWluX2JhbGFuY2UgICMgMTAwMDAwCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDg5CiAgICAvLyBtYnJfaW5jcmVhc2UgPSBVSW50NjQoMTIzNDUwMCkKICAgIGludCAxMjM0NTAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwOTIKICAgIC8vIHBheW1lbnRfYW1vdW50ID49IG1icl9pbmNyZWFzZSArIG1pbl9iYWxhbmNlCiAgICBkaWcgMQogICAgKwogICAgZGlnIDIKICAgIDw9CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwOTEtMTA5MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50X2Ftb3VudCA+PSBtYnJfaW5jcmVhc2UgKyBtaW5fYmFsYW5jZQogICAgLy8gKSwgInBheW1lbnQgYW1vdW50IGFjY3VyYXRlIiAgIyAxMjM0NTAwICsgMTAwMDAwID0gMTMzNDUwMAogICAgYXNzZXJ0IC8vIHBheW1lbnQgYW1vdW50IGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIGluaXRpYWwgPSBwYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSAtIG1pbl9iYWxhbmNlCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwODkKICAgIC8vIG1icl9pbmNyZWFzZSA9IFVJbnQ2NCgxMjM0NTAwKQogICAgaW50IDEyMzQ1MDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5NAogICAgLy8gaW5pdGlhbCA9IHBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlIC0gbWluX2JhbGFuY2UKICAgIC0KICAgIHN3YXAKICAgIC0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5NQogICAgLy8gcmV0dXJuIGluaXRpYWwKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5yZXF1aXJlX3BheW1lbnQod2hvOiBieXRlcykgLT4gdWludDY0OgpyZXF1aXJlX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE1LTIzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiByZXF1aXJlX3BheW1lbnQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2hlY2sgcGF5bWVudAogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9wYXltZW50KHdobzogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI0CiAgICAvLyByZWZfZ3JvdXBfaW5kZXggPSBUeG4uZ3JvdXBfaW5kZXgKICAgIHR4biBHcm91cEluZGV4CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI1CiAgICAvLyBhc3NlcnQgcmVmX2dyb3VwX2luZGV4ID4gMCwgImdyb3VwIGluZGV4IGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjYKICAgIC8vIHBheW1lbnRfZ3JvdXBfaW5kZXggPSByZWZfZ3JvdXBfaW5kZXggLSAxCiAgICBpbnQgMQogICAgLQogICAgLy8gc3JjL3NyYy91dGlscy5weToyOAogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuc2VuZGVyID09IHdobwogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgZHVwCiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjctMjkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuc2VuZGVyID09IHdobwogICAgLy8gKSwgInBheW1lbnQgc2VuZGVyIGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgc2VuZGVyIGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMxCiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy91dGlscy5weTozMgogICAgLy8gPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzEtMzIKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weTozMC0zMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgLy8gICAgID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJwYXltZW50IHJlY2VpdmVyIGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzQKICAgIC8vIHJldHVybiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5hbW91bnQKICAgIGd0eG5zIEFtb3VudAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3BGYWN0b3J5LnVwZGF0ZSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE4Mi0xMTg0CiAgICAvLyAjIFRPRE8gcmVtb3ZlIG1lIGxhdGVyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiB1cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTg1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExODUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExODYKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDcKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTg2CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZGF0YWJsZSBleGlzdHMKICAgIGludCAxCiAgICA9PQogICAgYXNzZXJ0IC8vIG5vdCBhcHByb3ZlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTg3CiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IGdldF9hdmFpbGFibGVfYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9hdmFpbGFibGVfYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTg4CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PWF2YWlsYWJsZV9iYWxhbmNlLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHR4biBTZW5kZXIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuZ2V0X2F2YWlsYWJsZV9iYWxhbmNlKCkgLT4gdWludDY0OgpnZXRfYXZhaWxhYmxlX2JhbGFuY2U6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjM3LTQzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UgKGludGVybmFsKQogICAgLy8gIyBwdXJwb3NlOiBnZXQgYXZhaWxhYmxlIGJhbGFuY2UKICAgIC8vICMgcmV0dXJuczogYXBwIGJhbGFuY2UgYXZhaWxhYmxlIGZvciBzcGVuZGluZwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UoKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NDQKICAgIC8vIGJhbGFuY2UgPSBvcC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYmFsYW5jZQogICAgLy8gc3JjL3NyYy91dGlscy5weTo0NQogICAgLy8gbWluX2JhbGFuY2UgPSBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjQ2CiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IGJhbGFuY2UgLSBtaW5fYmFsYW5jZQogICAgLQogICAgLy8gc3JjL3NyYy91dGlscy5weTo0NwogICAgLy8gcmV0dXJuIGF2YWlsYWJsZV9iYWxhbmNlCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuc2V0X3ZlcnNpb24oY29udHJhY3RfdmVyc2lvbjogYnl0ZXMsIGRlcGxveW1lbnRfdmVyc2lvbjogYnl0ZXMpIC0+IHZvaWQ6CnNldF92ZXJzaW9uOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NTctNDYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfdmVyc2lvbigKICAgIC8vICAgICBzZWxmLCBjb250cmFjdF92ZXJzaW9uOiBhcmM0LlVJbnQ2NCwgZGVwbG95bWVudF92ZXJzaW9uOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MgogICAgLy8gYXJjNC5lbWl0KFZlcnNpb25VcGRhdGVkKGNvbnRyYWN0X3ZlcnNpb24sIGRlcGxveW1lbnRfdmVyc2lvbikpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlZlcnNpb25VcGRhdGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYzCiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBjb250cmFjdF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBkZXBsb3ltZW50X3ZlcnNpb24ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA2CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJkZXBsb3ltZW50X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBkZXBsb3ltZW50X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmFwcHJvdmVfdXBkYXRlKGFwcHJvdmFsOiBieXRlcykgLT4gdm9pZDoKYXBwcm92ZV91cGRhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NS00NzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGFwcHJvdmVfdXBkYXRlKHNlbGYsIGFwcHJvdmFsOiBhcmM0LkJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzgKICAgIC8vIGFyYzQuZW1pdChVcGRhdGVBcHByb3ZlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIGFwcHJvdmFsKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGRhdGVBcHByb3ZlZChhZGRyZXNzLGJvb2wpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGFwcHJvdmFsLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZ2V0Yml0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuZ3JhbnRfdXBncmFkZXIodXBncmFkZXI6IGJ5dGVzKSAtPiB2b2lkOgpncmFudF91cGdyYWRlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxLTQ4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZ3JhbnRfdXBncmFkZXIoc2VsZiwgdXBncmFkZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4NAogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4NAogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZ3JhZGVyR3JhbnRlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDg1CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gdXBncmFkZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUub25fdXBkYXRlKCkgLT4gdm9pZDoKb25fdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjYtNDY3CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2OC00NzEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2OC00NzEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzIKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDcKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzIKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBkYXRhYmxlIGV4aXN0cwogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gbm90IGFwcHJvdmVkCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQWlyZHJvcEZhY3RvcnkuX19pbml0X18oKSAtPiB2b2lkOgpfX2luaXRfXzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTExMQogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6ICAjIHByYWdtYTogbm8gY292ZXIKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTEyCiAgICAvLyBzdXBlcigpLl9faW5pdF9fKCkKICAgIGNhbGxzdWIgQmFzZUZhY3RvcnkuX19pbml0X18KICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5fX2luaXRfXygpIC0+IHZvaWQ6CkJhc2VGYWN0b3J5Ll9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDY3CiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzEtMTA3MgogICAgLy8gIyB1cGdyYWRlYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3MwogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzQKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgaW50IDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzUKICAgIC8vIHNlbGYudXBncmFkZXIgPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcEZhY3RvcnkuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTEwNQogICAgLy8gY2xhc3MgQWlyZHJvcEZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgaW50IDEKICAgIHJldHVybgo="
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcEZhY3RvcnkuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODQxCiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTYKICAgIG1ldGhvZCAic2hhcmVfcGFyYW1zKCl2b2lkIgogICAgbWV0aG9kICJjcmVhdGUoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdWludDY0IgogICAgbWV0aG9kICJjcmVhdGVfbWFueSgoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpW10pdWludDY0W10iCiAgICBtZXRob2QgInVwZGF0ZSgpdm9pZCIKICAgIG1ldGhvZCAiZW5hYmxlX3JlZ2lzdHJ5KCl2b2lkIgogICAgbWV0aG9kICJnZXRfY2hpbGRyZW4oYWRkcmVzcyx1aW50NjQsdWludDY0KSh1aW50NjQsKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NClbXSkiCiAgICBtZXRob2QgInNldF92ZXJzaW9uKHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiYXBwcm92ZV91cGRhdGUoYm9vbCl2b2lkIgogICAgbWV0aG9kICJncmFudF91cGdyYWRlcihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgInRyYW5zZmVyKGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fc2hhcmVfcGFyYW1zX3JvdXRlQDQgbWFpbl9jcmVhdGVfcm91dGVANSBtYWluX2NyZWF0ZV9tYW55X3JvdXRlQDYgbWFpbl91cGRhdGVfcm91dGVANyBtYWluX2VuYWJsZV9yZWdpc3RyeV9yb3V0ZUA4IG1haW5fZ2V0X2NoaWxkcmVuX3JvdXRlQDkgbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUAxMCBtYWluX2FwcHJvdmVfdXBkYXRlX3JvdXRlQDExIG1haW5fZ3JhbnRfdXBncmFkZXJfcm91dGVAMTIgbWFpbl90cmFuc2Zlcl9yb3V0ZUAxMwogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9zaGFyZV9wYXJhbXNfcm91dGVANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg1MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHNoYXJlX3BhcmFtcwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfcm91dGVANToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NDEKICAgIC8vIGNsYXNzIEFpcmRyb3BGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNyZWF0ZQogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbWFueV9yb3V0ZUA2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODk2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg0MQogICAgLy8gY2xhc3MgQWlyZHJvcEZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODk2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlX21hbnkKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlX3JvdXRlQDc6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5ODgtMTk4OQogICAgLy8gIyBUT0RPIHJlbW92ZSBtZSBsYXRlcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9lbmFibGVfcmVnaXN0cnlfcm91dGVAODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGVuYWJsZV9yZWdpc3RyeQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2hpbGRyZW5fcm91dGVAOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NDEKICAgIC8vIGNsYXNzIEFpcmRyb3BGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9jaGlsZHJlbgogICAgc3dhcAogICAgaXRvYgogICAgYnl0ZSAweDAwMGEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF92ZXJzaW9uX3JvdXRlQDEwOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODQxCiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF92ZXJzaW9uCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfdXBkYXRlX3JvdXRlQDExOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODQxCiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGFwcHJvdmVfdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDEyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODQxCiAgICAvLyBjbGFzcyBBaXJkcm9wRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGdyYW50X3VwZ3JhZGVyCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX3JvdXRlQDEzOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxNjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg0MQogICAgLy8gY2xhc3MgQWlyZHJvcEZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgaW50IDAKICAgIGludCA0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBtYXRjaCBtYWluX2NyZWF0ZUAxNyBtYWluX29uX3VwZGF0ZUAxOAogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9jcmVhdGVAMTc6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NDEKICAgIC8vIGNsYXNzIEFpcmRyb3BGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fb25fdXBkYXRlQDE4OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzkKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzktNTQwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgY2FsbHN1YiBvbl91cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzcmMuY29udHJhY3QuQWlyZHJvcEZhY3Rvcnkuc2hhcmVfcGFyYW1zKCkgLT4gdm9pZDoKc2hhcmVfcGFyYW1zOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODUwLTE4NTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNoYXJlX3BhcmFtcyhzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NTgKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIGludCBUTVBMX1BFUklPRF9MSU1JVAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODU5CiAgICAvLyBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICBpbnQgMAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODYwCiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICBpbnQgVE1QTF9MT0NLVVBfREVMQVkKICAgIGl0b2IKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg2MQogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9QRVJJT0RfU0VDT05EUwogICAgaXRvYgogICAgY292ZXIgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODYyCiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fQ09VTlQiKSksCiAgICBpbnQgVE1QTF9ESVNUUklCVVRJT05fQ09VTlQKICAgIGl0b2IKICAgIGNvdmVyIDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg2MwogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9ESVNUUklCVVRJT05fU0VDT05EUwogICAgaXRvYgogICAgY292ZXIgNQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODU3LTE4NjQKICAgIC8vIFBhcmFtcygKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgdmVzdGluZyBkZWxheQogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fQ09VTlQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyApLAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODY1CiAgICAvLyBUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSwKICAgIGludCBUTVBMX01FU1NFTkdFUl9JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODU2LTE4NjYKICAgIC8vIHNlbGYuc2hhcmUoCiAgICAvLyAgICAgUGFyYW1zKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHZlc3RpbmcgZGVsYXkKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fU0VDT05EUyIpKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1FU1NFTkdFUl9JRCIpLAogICAgLy8gKQogICAgY2FsbHN1YiBzaGFyZQogICAgcG9wCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3Rvcnkuc2hhcmUocGFyYW1zOiBieXRlcywgbWVzc2VuZ2VyX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpzaGFyZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcyMy0xNzI0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHNoYXJlKHNlbGYsIHBhcmFtczogUGFyYW1zLCBtZXNzZW5nZXJfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzMyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MzIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MzMKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXJhbXMubWF5YmUoKVsxXSwgInBhcmFtcyBub3Qgc2hhcmVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMC0xNzExCiAgICAvLyAjIHNoYXJlZCB0ZW1wbGF0ZSBzdGF0ZQogICAgLy8gc2VsZi5wYXJhbXMgPSBHbG9iYWxTdGF0ZShQYXJhbXMpCiAgICBieXRlICJwYXJhbXMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MzMKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXJhbXMubWF5YmUoKVsxXSwgInBhcmFtcyBub3Qgc2hhcmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIHBhcmFtcyBub3Qgc2hhcmVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MzUKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTczNC0xNzM2CiAgICAvLyBudW1fdWludCwgX2V4aXN0cyA9IG9wLkFwcFBhcmFtc0dldC5hcHBfZ2xvYmFsX251bV91aW50KAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkCiAgICAvLyApCiAgICBhcHBfcGFyYW1zX2dldCBBcHBHbG9iYWxOdW1VaW50CiAgICBwb3AKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTczOAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzM3LTE3MzkKICAgIC8vIG51bV9ieXRlX3NsaWNlLCBfZXhpc3RzID0gb3AuQXBwUGFyYW1zR2V0LmFwcF9nbG9iYWxfbnVtX2J5dGVfc2xpY2UoCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQKICAgIC8vICkKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEdsb2JhbE51bUJ5dGVTbGljZQogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NDAKICAgIC8vIGFzc2VydCBudW1fdWludCA+IDMgYW5kIG51bV9ieXRlX3NsaWNlID4gMiwgInNjaGVtYSBoYXMgcm9vbSBmb3IgcGFyYW1zIgogICAgaW50IDMKICAgID4KICAgIGJ6IHNoYXJlX2Jvb2xfZmFsc2VAMwogICAgZnJhbWVfZGlnIDAKICAgIGludCAyCiAgICA+CiAgICBieiBzaGFyZV9ib29sX2ZhbHNlQDMKICAgIGludCAxCiAgICBiIHNoYXJlX2Jvb2xfbWVyZ2VANAoKc2hhcmVfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCnNoYXJlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0MAogICAgLy8gYXNzZXJ0IG51bV91aW50ID4gMyBhbmQgbnVtX2J5dGVfc2xpY2UgPiAyLCAic2NoZW1hIGhhcyByb29tIGZvciBwYXJhbXMiCiAgICBhc3NlcnQgLy8gc2NoZW1hIGhhcyByb29tIGZvciBwYXJhbXMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0MQogICAgLy8gYXJjNC5lbWl0KFBhcmFtc1NoYXJlZChwYXJhbXMsIGFyYzQuVUludDY0KG1lc3Nlbmdlcl9pZCkpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbWV0aG9kICJQYXJhbXNTaGFyZWQoKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMC0xNzExCiAgICAvLyAjIHNoYXJlZCB0ZW1wbGF0ZSBzdGF0ZQogICAgLy8gc2VsZi5wYXJhbXMgPSBHbG9iYWxTdGF0ZShQYXJhbXMpCiAgICBieXRlICJwYXJhbXMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NDIKICAgIC8vIHNlbGYucGFyYW1zLnZhbHVlID0gcGFyYW1zLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzEyCiAgICAvLyBzZWxmLm1lc3Nlbmdlcl9pZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCkKICAgIGJ5dGUgIm1lc3Nlbmdlcl9pZCIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0MwogICAgLy8gc2VsZi5tZXNzZW5nZXJfaWQudmFsdWUgPSBtZXNzZW5nZXJfaWQKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3BGYWN0b3J5LmNyZWF0ZShvd25lcjogYnl0ZXMsIGZ1bmRlcjogYnl0ZXMsIGRlYWRsaW5lOiBieXRlcywgaW5pdGlhbDogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODY4LTE4NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNyZWF0ZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG93bmVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZnVuZGVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZGVhZGxpbmU6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGluaXRpYWw6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg4OC0xODg5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gcmVxdWlyZV9wYXltZW50KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIHJlcXVpcmVfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODkwLTE4OTEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYmFzZV9hcHAsIG1icl9pbmNyZWFzZSA9IHNlbGYuY3JlYXRlX2NoaWxkKG93bmVyLCBmdW5kZXIpCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiBjcmVhdGVfY2hpbGQKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg5MgogICAgLy8gc2VsZi5pbml0X2FpcmRyb3AoYmFzZV9hcHAsIG93bmVyLCBmdW5kZXIsIGRlYWRsaW5lLCBpbml0aWFsKQogICAgZHVwCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgaW5pdF9haXJkcm9wCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4OTMKICAgIC8vIHNlbGYuc2V0dGxlX3BheW1lbnQocGF5bWVudF9hbW91bnQsIG1icl9pbmNyZWFzZSArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSkKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY2FsbHN1YiBzZXR0bGVfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODk0CiAgICAvLyByZXR1cm4gYmFzZV9hcHAuaWQKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5yZXF1aXJlX3BheW1lbnQod2hvOiBieXRlcykgLT4gdWludDY0OgpyZXF1aXJlX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2LTI0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiByZXF1aXJlX3BheW1lbnQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2hlY2sgcGF5bWVudAogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9wYXltZW50KHdobzogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI1CiAgICAvLyByZWZfZ3JvdXBfaW5kZXggPSBUeG4uZ3JvdXBfaW5kZXgKICAgIHR4biBHcm91cEluZGV4CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI2CiAgICAvLyBhc3NlcnQgcmVmX2dyb3VwX2luZGV4ID4gMCwgImdyb3VwIGluZGV4IGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjcKICAgIC8vIHBheW1lbnRfZ3JvdXBfaW5kZXggPSByZWZfZ3JvdXBfaW5kZXggLSAxCiAgICBpbnQgMQogICAgLQogICAgLy8gc3JjL3NyYy91dGlscy5weToyOQogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuc2VuZGVyID09IHdobwogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgZHVwCiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjgtMzAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuc2VuZGVyID09IHdobwogICAgLy8gKSwgInBheW1lbnQgc2VuZGVyIGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgc2VuZGVyIGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMyCiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy91dGlscy5weTozMwogICAgLy8gPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzItMzMKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weTozMS0zNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgLy8gICAgID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJwYXltZW50IHJlY2VpdmVyIGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzUKICAgIC8vIHJldHVybiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5hbW91bnQKICAgIGd0eG5zIEFtb3VudAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LmNyZWF0ZV9jaGlsZChvd25lcjogYnl0ZXMsIGZ1bmRlcjogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpjcmVhdGVfY2hpbGQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3ODktMTc5MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjcmVhdGVfY2hpbGQoCiAgICAvLyAgICAgc2VsZiwgb3duZXI6IGFyYzQuQWRkcmVzcywgZnVuZGVyOiBhcmM0LkFkZHJlc3MKICAgIC8vICkgLT4gdHVwbGVbQXBwbGljYXRpb24sIFVJbnQ2NF06CiAgICBwcm90byAyIDIKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwMQogICAgLy8gbWluX2JhbGFuY2UgPSBnZXRfbWluX2JhbGFuY2UoKQogICAgY2FsbHN1YiBnZXRfbWluX2JhbGFuY2UKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwMgogICAgLy8gc2hhcmVkID0gc2VsZi5wYXJhbXMubWF5YmUoKVsxXQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMC0xNzExCiAgICAvLyAjIHNoYXJlZCB0ZW1wbGF0ZSBzdGF0ZQogICAgLy8gc2VsZi5wYXJhbXMgPSBHbG9iYWxTdGF0ZShQYXJhbXMpCiAgICBieXRlICJwYXJhbXMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDIKICAgIC8vIHNoYXJlZCA9IHNlbGYucGFyYW1zLm1heWJlKClbMV0KICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwMwogICAgLy8gaWYgc2hhcmVkOgogICAgYnogY3JlYXRlX2NoaWxkX2Vsc2VfYm9keUAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDUKICAgIC8vIEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MywgZ2xvYmFsX2J5dGVzPTUKICAgIGludCA1CiAgICBiIGNyZWF0ZV9jaGlsZF9hZnRlcl9pZl9lbHNlQDMKCmNyZWF0ZV9jaGlsZF9lbHNlX2JvZHlAMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwOAogICAgLy8gY29tcGlsZWQgPSBjb21waWxlX2NvbnRyYWN0KEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MykgIyBtYXggZXh0cmEgcGFnZXMKICAgIGludCA2CgpjcmVhdGVfY2hpbGRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODA5CiAgICAvLyBiYXNlX2FwcCA9IGFyYzQuYXJjNF9jcmVhdGUoQWlyZHJvcCwgY29tcGlsZWQ9Y29tcGlsZWQpLmNyZWF0ZWRfYXBwCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDQtMTgwNgogICAgLy8gY29tcGlsZWQgPSBjb21waWxlX2NvbnRyYWN0KAogICAgLy8gICAgIEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MywgZ2xvYmFsX2J5dGVzPTUKICAgIC8vICkgICMgd2l0aG91dCBwYXJhbXMKICAgIGludCAxMgogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1VaW50CiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODA1CiAgICAvLyBBaXJkcm9wLCBleHRyYV9wcm9ncmFtX3BhZ2VzPTMsIGdsb2JhbF9ieXRlcz01CiAgICBpbnQgMwogICAgaXR4bl9maWVsZCBFeHRyYVByb2dyYW1QYWdlcwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODA0LTE4MDYKICAgIC8vIGNvbXBpbGVkID0gY29tcGlsZV9jb250cmFjdCgKICAgIC8vICAgICBBaXJkcm9wLCBleHRyYV9wcm9ncmFtX3BhZ2VzPTMsIGdsb2JhbF9ieXRlcz01CiAgICAvLyApICAjIHdpdGhvdXQgcGFyYW1zCiAgICBieXRlIGJhc2U2NCBDb0VCUXc9PQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBieXRlIGJhc2U2NCBDaUFFQUFFRkFpWWJCMloxYm1ScGJtY0ZkRzkwWVd3RmIzZHVaWElHWm5WdVpHVnlCbkJsY21sdlpBaGtaV3hsWjJGMFpRaGtaV0ZrYkdsdVpRaDFjR2R5WVdSbGNnWndZWEpoYlhNTWJXVnpjMlZ1WjJWeVgybGtDWEJoY21WdWRGOXBaQVFWSDN4MUFBbDFjR1JoZEdGaWJHVU1ablZzYkhsZmRtVnpkR1ZrQ0FBQUFBQUFBQUFBQ0dSbGNHeHZlV1Z5QjJsdWFYUnBZV3dRWTI5dWRISmhZM1JmZG1WeWMybHZiaEprWlhCc2IzbHRaVzUwWDNabGNuTnBiMjRFU0FnUTdnU21nc0FiQkk4bFJ2QU1jR1Z5YVc5a1gyeHBiV2wwQVFBSmMzUmhhMlZoWW14bElBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBTVJoQUFBT0lEV3d4RzBFQzc0SVpCQzl1UVA0RUN1dkQyd1F3T1JOb0JIVlV3Mk1FWU9rakNnUlNKUml0QktEb0dISUV1OUR5K0FSbkZVUDVCR2dPN1VBRU1TRkJkZ1NFTUlueUJKaGFSWjhFMjBZQ253U1dWZ1I2QkszNUt1UUVYTlAzaWdUcXM1RklCS2xoWE5jRVgzNmlTQVROSk42SUJOV0YxYUFFZUx5WjFBUnJDNC80Qk5TV3YwTTJHZ0NPR1FBQkFERUFUQUNVQUw0QXp3RGNBT2tCQVFFUUFSOEJOQUZLQVY4QmVBR0ZBWlFCb0FHdkFiNEJ6UUhyQWdrQ0d3SXFBREVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dVMkdnWTJHZ2MyR2dnMkdnazJHZ28yR2dzMkdneUlBaWNqUXpFWkZFUXhHRVEyR2dFMkdnSTJHZ00yR2dRMkdnV0lBd01qUXpFWkZFUXhHRVEyR2dFMkdnSTJHZ00yR2dRMkdnVTJHZ1kyR2djMkdnZzJHZ2syR2dvMkdnczJHZ3cyR2cwMkdnNDJHZzlYQUNBMkdnOVhJQ0EyR2c5WFFBaUlCQjBqUXpFWkZFUXhHRVEyR2dFMkdnSTJHZ00yR2dRMkdnVTJHZ1kyR2djMkdnZzJHZ2syR2dxSUJJUWpRekVaRkVReEdFU0lCSmtuQzB4UXNDTkRNUmtrRWtReEdFU0lCbGtqUXpFWkpCSkVNUmhFaUFiL0kwTXhHUlJFTVJoRU5ob0JOaG9DTmhvRE5ob0VpQVAvSTBNeEdSUkVNUmhFTmhvQmlBY0RJME14R1JSRU1SaEVOaG9CaUFjNEkwTXhHUlJFTVJoRU5ob0JpQWRxRmljTFRGQ3dJME14R1JSRU1SaEVpQWZjVEJaTUZsQW5DMHhRc0NORE1Sa1VSREVZUkRZYUFZZ0lLUlluQzB4UXNDTkRNUmtVUkRFWVJEWWFBWWdJUWt3V1RCWlFKd3RNVUxBalF6RVpKQkpFTVJoRWlBakVJME14R1JSRU1SaEVOaG9CaUFqd0kwTXhHUlJFTVJoRWlBa0VJME14R1JSRU1SaEVOaG9CaUFsRUkwTXhHUlJFTVJoRU5ob0JpQWxWSTBNeEdSUkVNUmhFTmhvQmlBbDdJME14R1JSRU1SaEVOaG9CTmhvQ05ob0ROaG9FTmhvRk5ob0dpQW1QSTBNeEdSUkVNUmhFTmhvQk5ob0NOaG9ETmhvRU5ob0ZOaG9HaUFuL0kwTXhHUlJFTVJoRU5ob0JOaG9DaUFvcUkwTXhHUlJFTVJoRU5ob0JpQXBFSTBNeEdSUkVNUmhFTmhvQmlBS25JME1pZ1FReEdZNENBQUVBQ2dBeEdCUkVpQXBFSTBNeEdFU0lDa2dqUTRvTUFERUFNZ2tTUkNJbkNHVkZBUlJFSWljSlpVUVVSQ0lXaS9wTEFhVkVpL21rUkNJbkJHVkVGRVFpSndabFJCUkVJaWxsUkJSRUlpaGxSQlJFSWljRlpVUXlBeEpFaS9TTDlWQ0w5bENMOTFCSmkvaFFpL2xRaS9wUWkvdFFpL3hRaS8xUWkvNVFpLzlRSnhaTVVMQ0wrVkNMK2xBbkNFeG5pL2dYSndsTVo0djdGeWNFVEdlTC9CY25Ca3huaS8wWEtVeG5pLzRYS0V4bkp3V0wvMmNpS0dWRVFRQUpJaWNJWlVTSUFBSklpWW9CQVNJbkRtVkZBVUVBSW92L1Z3Z0lGNHYvVnhnSUY0di9WeEFJRnlJbkJHVkVJaWhsUklnQUJ5Y09UR2VMLzRtS0JRR0wvWXYrQzR2OEM0djdpL3dMaS84SUNJbUtCUUF4QURJSkVrUWlKd2hsUlFFVVJDSW5CR1ZFRkVRaUp3WmxSQlJFSWlsbFJCUkVJaWhsUkJSRUlpY0ZaVVF5QXhKRWlBQ0pSd0pYS0FoSkp3K2xSRXNCVnlBSVNTY1BwVVFpSndwbFJDY0paVVJMQTFjQUNFeExCRmNJQ0V4TEJWY1FDRTRDVHdaWEdBaE9BeFpPQkU4RFRGQk1VRXhRVEZCTVVFeFFpL3RRaS94UWkvMVFpLzVRaS85UUp4Wk1VTENMK3hjbkJFeG5pL3dYSndaTVo0djlGeWxNWjR2K0Z5aE1aeWNGaS85bklpaGxSRUVBQm9zQWlQNzhTSW1LQUFFeUNDY0laVUVBQklzQVRJbUlBSVZCQUhjbkYyUVdnQTEyWlhOMGFXNW5YMlJsYkdGNVpCYUFER3h2WTJ0MWNGOWtaV3hoZVdRV2dBNXdaWEpwYjJSZmMyVmpiMjVrYzJRV2dCSmthWE4wY21saWRYUnBiMjVmWTI5MWJuUmtGb0FVWkdsemRISnBZblYwYVc5dVgzTmxZMjl1WkhOa0ZrOEZUd1ZRVHdSUVR3TlFUd0pRVEZCTWlTSW5DbVZFSndobFJFeUppZ0FCTWdnbkYyVkZBWW1LRVFDTDc0dndpL0dMOG92emkvU0w5WXYyaS9lTCtJdjVpL3FJL1ltTCs0Z0FESXY4aS8yTC9vdi9pQUFoaVlvQkFERUFNZ2tTUkNJbkIyVkVpLzlRZ0FTdDllSzRURkN3SndlTC8yZUppZ1FBSWlwbFJESURFa1FpSzJWRU1nTVNSREVBTWdrU1JJdjhpLzFRaS81UWkvOVFnQVNkbkc4TFRGQ3dKeENML0djcWkvMW5LNHYrWjR2L0Z5Y1JUR2VKaWdvQWkvYUw5NHY0aS9tTCtvajkvWXY3aVArSmkveUwvWXYraS8rSS81NkppZ0FCSnd5SS9xUWlKd2xsVEVsUEFrUWlKd2hsUlFGQUFCV0kveWFMQW93RFFBQUxJaWNLWlVRbkNXVklqQU9MQTR3Q0lvd0FJaWhsUkVFQUQ0c0JpQUQ3akFHTUFJZ0JMVUlBQkNJcFpVUWlLbVZFSWl0bFJDSW5CV1ZFSWljUVpVUWlKd2RsUkNJbkNtVkVGb3NDRmt5TEFVbFhBQWhPQTBsWENBaE9CRWxYRUFoT0JVbFhHQWhPQmtsWElBaE9CMWNvQ0U0SElpY0VaVVFXVGdJaUp3WmxSQllpS1dWRUZpSW9aVVFXSWljUlpVUVdpd0FXVENJbkVtVkVGaUluRTJWRUZpSW5EV1ZFSnhnaVR3SlVJaWNaWlVRbkdDSlBBbFF5Q21BV1RFOFlGazRDaUFEaEZrNENUeGxQR1ZCUEdGQlBGMUJQRmxCUERWQlBEVkJQRGxCUERsQlBEbEJQRGxCUERsQlBEbEJQRFZCUERGQlBDMUJQQ2xCUENGQlBDRkJQQjFCUEJsQlBCVkJNSWxPQmdSSk1WRXhRVHdKUVRGQ01BSW1LQVFJaUp3NWxRUUFNaXdCQkFBZUxBSXYvVHdLSmkvOVhDQWdYaS85WEdBZ1hpLzlYRUFnWElpY0VaVVFpS0dWRWlQeG1pLzlQQW9tS0FBRXlCNGo5TG9qL3ZDSXBaVXhPQWtSSlZ5QUlGMHhYS0FnWGlBQUJpWW9GQVNjTWkvdUwvQTVCQUFTTC9VeUppL3VML0FtTC93cEpqQUNML2c1QkFBMkwvb3NBQ1l2OUM0ditDa3lKSWt5SmlnQUJNZ3BnTWdFSmlZb0FBREVBSWl0bFJCSkFBQW94QUNJcVpVUVNRUUFFSTBJQUFTSkVJaWhsUkJSRU1RQWlLbVZFVUNjVVRGQ3dJaXBsUklnQUFZbUtBUUF4R1NRU1JESUpNZ0d4Z0VBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQXNqOGlzZzRpc2cwaXNnd25HcklMSnhxeUNpT3lPU1d5RUNLeUFiYXlDSXYvc2dteUJ5T3lFQ0t5QWJPSmlnQUFNUUFpSndkbFJCSkVJaWNOWlVRakVrUWlKd2RsUkNJclpVUlFKeFJNVUxBaUsyVkVpUDlhaVlvQkFDSW9aVVFVUkNJcFpVUVVSREVBSWlwbFJCSkVpUHZpVndBSWkvK25SQ0luQm1WRU1nY05SQ0luQkdWRUZvdi9VSUFFdGo2WGtreFFzSXYvRnljRVRHZUppZ0VBTVFBaUsyVkVFa1FpS0dWRVFRQUtJaWhsUkRJSERVRUFCQ05DQUFFaVJDSW9aVVFXaS85UWdBVFFYZTRjVEZDd2kvOFhLRXhuaVB0OGlQcHpTSW1LQVFFbkRFY0NNUUFpS21WRUVrUWlLR1ZFUVFBMWlQNG9TWXdBU1JhTC8xQW5GVXhRc0lqK2Fvdi9GMG1NQVFrT1JJdi9KdytsUVFBUXNURUFzZ2VMQWJJSUk3SVFJcklCczRraUtXVk1TVTRDakFCRVNSYUwvMUFuRlV4UXNJaitNWXYvRjBtTUFna09SSXYvSncrbFFRQVFzVEVBc2dlTEFySUlJN0lRSXJJQnM0bUtBQUluREVjQ01RQWlLbVZFRWtRaUtHVkVRUUFJaVAya2pBSkNBQWNpS1dWTWpBSkVpUDNuU1l3Qklvd0Fpd0lOUVFBSGl3R0xBZ21NQUlzQ0Zvc0FTVTRDRmxBbkZVeFFzRUVBRUxFeEFMSUhpd0N5Q0NPeUVDS3lBYk9MQUlzQ2pBR01BSW1LQVFFaUtHVkVRQUFGSWlsbFJJbUkrbnVML3hkTWlQMEZJaWxsVEU0Q1JFbFhJQWdYVEZjb0NCZUkvVXFKaWdFQ0p3eEhBaUlvWlVSQUFBb2lLV1ZFSW93QWpBR0ppUHBFaVB6U1RFbE9Bb3dBaS84WFRDSXBaVXhPQWtSSlZ5QUlGMGxPQW93QlZ5Z0lGMG1NQWs4RFRnU0lBQ0JKUUFBR0lvd0JqQUNKSWlsbFJFc0Jpd0JQQW9zQml3S0kvT2VNQVl3QWlZb0ZBWXY3aS95TC9ZditpLytJL05KSlFBQURJa3lKaXdDTC9ndUwvUWdqQ1l2OUNvditJd2hNQ1l2L0M0djhDRXlKaWdBQUlpaGxSRVNJL0lVVVJERUFJaXBsUkJKQUFBb3hBQ0lyWlVRU1FRQUVJMElBQVNKRU1RQWlLbVZFVUNjVVRGQ3dJaXBsUklqODZZbUtBUUF4QUNJcVpVUVNSQ0lxWlVTTC8xQ0FCSm9pUHZ0TVVMQXFpLzluaVlvQUFERUFJaXRsUkJKRUlpdGxSSWdBSFNJcFpVUkxBUWhNRmt4SkZrOENURkNBQk1NRHByeE1VTEFwVEdlSmlnRUJNUlpKUkNNSlNUZ1FJeEpFU1RnQWkvOFNSRWs0QnpJS0VrUTRDSW1LQVFBeEFDSXJaVVFTUkNJclpVU0wvMUNBQkVPSDFzRk1VTEFyaS85bmlZb0JBREVBSWl0bFJCSkVJaWhsUkJSRUlpbGxSQmFMLzZkRUlpbGxSSXYvRndsSkZvdi9URkNBQkUxSWdRNU1VTEFwVEdlSmlnRUFNUUFpS21WRUVrQUFDREVBTWdrU1FRQUVJMElBQVNKRUlpY0ZaVVNMLzFDQUJIaG1WWGRNVUxBbkJZdi9aNG1LQmdBeEFDSXFaVVFTUUFBTE1RQWlKd1ZsUkJKQkFBUWpRZ0FCSWtReUFERUFpUDgwU3dFU1JJdjZpL3VML0l2OWkvNkwvMDhHaUFBSGpQK00rNHo2aVlvSEF6RUFTWXY1VUl2NlVJdjdVSXY4VUl2OVVJditVRkNBQkcxRWtEOU1VTEN4aS9zWGkvd1hpLzBYaS82eVA3SU9zZzJ5REl2NnNndUwrYklLSmJJUWkvK3lBYk9MK1l2NmkvNkppZ1lBTVFBaUttVkVFa0FBQ3pFQUlpY0ZaVVFTUVFBRUkwSUFBU0pFTVFFeUFDVUxEMFNMK292N2kveUwvWXYraS84aWlQOTlqUCtNKzR6NmlZb0NBREVBSWljSFpVUVNSSXYraS85UWdBU01qUG5OVEZDd2kvNFhKeEpNWjR2L0Z5Y1RUR2VKaWdFQU1RQWlLbVZFRWtRaUttVkVpLzlRZ0FUQ2VXV0xURkN3aS84aVV5Y05UR2VKaWdBQU1nMUpSQ2NLVEdlSmlnQUFNUUFpSndkbFJCSkVJaWNOWlVRakVrU0ppZ0FBaUFCQ0p3b2laeWNRTWdObkp3VXlBMmNuR1NObkp4SWlaeWNUSW1jbkRTTm5Kd2N5Q1djcU1nTm5Kd1FpWnljUkltY25CaUpuS3pJRFp5Z2laeWtpWnljSkltZUppZ0FBS2pJRFp5Y0VJbWNuRVNKbkp3WWlaeWNPSW1jck1nTm5LQ0puS1NKbkp3b2laeWNRTWdObkp3a2laNGs9CiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDkKICAgIC8vIGJhc2VfYXBwID0gYXJjNC5hcmM0X2NyZWF0ZShBaXJkcm9wLCBjb21waWxlZD1jb21waWxlZCkuY3JlYXRlZF9hcHAKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODEwCiAgICAvLyBhcmM0LmVtaXQoRmFjdG9yeUNyZWF0ZWQoYXJjNC5VSW50NjQoYmFzZV9hcHAuaWQpKSkKICAgIGl0b2IKICAgIG1ldGhvZCAiRmFjdG9yeUNyZWF0ZWQodWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MTMtMTcxNQogICAgLy8gIyByZWdpc3RyeSBzdGF0ZSwgaW4gYm94ZXMgc28gZmFjdG9yaWVzIHVwZGF0ZWQKICAgIC8vICMgICBpbiBwbGFjZSBrZWVwIHRoZWlyIGdsb2JhbCBzY2hlbWEKICAgIC8vIHNlbGYucmVnaXN0cnkgPSBCb3goVUludDY0LCBrZXk9YiJyZWdpc3RyeSIpCiAgICBieXRlIDB4NzI2NTY3Njk3Mzc0NzI3OQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODExCiAgICAvLyBpZiBzZWxmLnJlZ2lzdHJ5OgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBjcmVhdGVfY2hpbGRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTIKICAgIC8vIHNlbGYucmVnaXN0ZXIoYmFzZV9hcHAuaWQsIG93bmVyLCBmdW5kZXIpCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcmVnaXN0ZXIKCmNyZWF0ZV9jaGlsZF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTMKICAgIC8vIHJldHVybiBiYXNlX2FwcCwgZ2V0X21pbl9iYWxhbmNlKCkgLSBtaW5fYmFsYW5jZQogICAgY2FsbHN1YiBnZXRfbWluX2JhbGFuY2UKICAgIGZyYW1lX2RpZyAxCiAgICAtCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5nZXRfbWluX2JhbGFuY2UoKSAtPiB1aW50NjQ6CmdldF9taW5fYmFsYW5jZToKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NTEtNTgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9taW5fYmFsYW5jZSAoaW50ZXJuYWwpCiAgICAvLyAjIHB1cnBvc2U6IGdldCBtaW4gYmFsYW5jZSBvZiBhcHAgYWNjb3VudCwKICAgIC8vICMgICBncm93cyB3aXRoIGFwcHMgY3JlYXRlZCBieSBpdAogICAgLy8gIyByZXR1cm5zOiBhcHAgbWluIGJhbGFuY2UKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X21pbl9iYWxhbmNlKCkgLT4gVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjYwCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc3JjL3NyYy91dGlscy5weTo1OS02MQogICAgLy8gbWluX2JhbGFuY2UsIGV4aXN0cyA9IG9wLkFjY3RQYXJhbXNHZXQuYWNjdF9taW5fYmFsYW5jZSgKICAgIC8vICAgICBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIHBvcAogICAgLy8gc3JjL3NyYy91dGlscy5weTo2MgogICAgLy8gcmV0dXJuIG1pbl9iYWxhbmNlCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkucmVnaXN0ZXIoYXBwX2lkOiB1aW50NjQsIG93bmVyOiBieXRlcywgZnVuZGVyOiBieXRlcykgLT4gdm9pZDoKcmVnaXN0ZXI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NzYtMTc3OQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWdpc3RlcigKICAgIC8vICAgICBzZWxmLCBhcHBfaWQ6IFVJbnQ2NCwgb3duZXI6IGFyYzQuQWRkcmVzcywgZnVuZGVyOiBhcmM0LkFkZHJlc3MKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzg0CiAgICAvLyBiImMiICsgb3duZXIuYnl0ZXMsCiAgICBieXRlIDB4NjMKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3ODUKICAgIC8vIENoaWxkSW5mbyhhcmM0LlVJbnQ2NChhcHBfaWQpLCBmdW5kZXIsIGFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCkpLmJ5dGVzLAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBnbG9iYWwgUm91bmQKICAgIGl0b2IKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc4NgogICAgLy8gVUludDY0KDIxKSwKICAgIGludCAyMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzgzLTE3ODcKICAgIC8vIGFwcGVuZF9wYWdlZCgKICAgIC8vICAgICBiImMiICsgb3duZXIuYnl0ZXMsCiAgICAvLyAgICAgQ2hpbGRJbmZvKGFyYzQuVUludDY0KGFwcF9pZCksIGZ1bmRlciwgYXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSkuYnl0ZXMsCiAgICAvLyAgICAgVUludDY0KDIxKSwKICAgIC8vICkKICAgIGNhbGxzdWIgYXBwZW5kX3BhZ2VkCiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuYXBwZW5kX3BhZ2VkKGtleTogYnl0ZXMsIGl0ZW06IGJ5dGVzLCBwYWdlX3NpemU6IHVpbnQ2NCkgLT4gdm9pZDoKYXBwZW5kX3BhZ2VkOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMTItMTI0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBhcHBlbmRfcGFnZWQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0ga2V5LCBsaXN0IGtleSwgYm94IGtleSBob2xkcyBpdGVtIGNvdW50LAogICAgLy8gIyAgIGJveCBrZXkgKyBwYWdlIGluZGV4IGhvbGRzIHBhZ2Ugb2YgaXRlbXMKICAgIC8vICMgLSBpdGVtLCBmaXhlZCBzaXplIGl0ZW0KICAgIC8vICMgLSBwYWdlX3NpemUsIGl0ZW1zIHBlciBwYWdlLCBwYWdlcyBhcmUKICAgIC8vICMgICBhdCBtb3N0IDFLQiB0byBiZSByZWFkIHdpdGggb25lIGJveCByZWYKICAgIC8vICMgcHVycG9zZTogYXBwZW5kIGl0ZW0gdG8gbGlzdCBrZXB0IGluIHBhZ2VzCiAgICAvLyAjICAgd3JpdGluZyBvbmx5IGNvdW50IGFuZCBsYXN0IHBhZ2UKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXBwZW5kX3BhZ2VkKGtleTogQnl0ZXMsIGl0ZW06IEJ5dGVzLCBwYWdlX3NpemU6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgYnl0ZSAiIgogICAgZHVwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEyNQogICAgLy8gY291bnQgPSBVSW50NjQoMCkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEyNgogICAgLy8gY291bnRfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoa2V5KQogICAgZnJhbWVfZGlnIC0zCiAgICBib3hfZ2V0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEyNwogICAgLy8gaWYgZXhpc3RzOgogICAgYnogYXBwZW5kX3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMjgKICAgIC8vIGNvdW50ID0gb3AuYnRvaShjb3VudF9ieXRlcykKICAgIGZyYW1lX2RpZyAzCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDIKCmFwcGVuZF9wYWdlZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEyOQogICAgLy8gcGFnZV9rZXkgPSBrZXkgKyBvcC5pdG9iKGNvdW50IC8vIHBhZ2Vfc2l6ZSkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgLwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTMwCiAgICAvLyBvZmZzZXQgPSAoY291bnQgJSBwYWdlX3NpemUpICogaXRlbS5sZW5ndGgKICAgIGZyYW1lX2RpZyAtMQogICAgJQogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAqCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzEKICAgIC8vIGlmIG9mZnNldCA9PSAwOgogICAgYm56IGFwcGVuZF9wYWdlZF9lbHNlX2JvZHlANAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzIKICAgIC8vIG9wLkJveC5wdXQocGFnZV9rZXksIGl0ZW0pCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9wdXQKICAgIGIgYXBwZW5kX3BhZ2VkX2FmdGVyX2lmX2Vsc2VANQoKYXBwZW5kX3BhZ2VkX2Vsc2VfYm9keUA0OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzQKICAgIC8vIG9wLkJveC5yZXNpemUocGFnZV9rZXksIG9mZnNldCArIGl0ZW0ubGVuZ3RoKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIHVuY292ZXIgMgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXNpemUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTM1CiAgICAvLyBvcC5Cb3gucmVwbGFjZShwYWdlX2tleSwgb2Zmc2V0LCBpdGVtKQogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfcmVwbGFjZQoKYXBwZW5kX3BhZ2VkX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTM2CiAgICAvLyBvcC5Cb3gucHV0KGtleSwgb3AuaXRvYihjb3VudCArIDEpKQogICAgZnJhbWVfZGlnIDIKICAgIGludCAxCiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wRmFjdG9yeS5pbml0X2FpcmRyb3AoYmFzZV9hcHA6IHVpbnQ2NCwgb3duZXI6IGJ5dGVzLCBmdW5kZXI6IGJ5dGVzLCBkZWFkbGluZTogYnl0ZXMsIGluaXRpYWw6IGJ5dGVzKSAtPiB2b2lkOgppbml0X2FpcmRyb3A6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MjYtMTkzNAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpbml0X2FpcmRyb3AoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBiYXNlX2FwcDogQXBwbGljYXRpb24sCiAgICAvLyAgICAgb3duZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBmdW5kZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBkZWFkbGluZTogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgaW5pdGlhbDogYXJjNC5VSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA1IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTkzOAogICAgLy8gc2hhcmVkID0gc2VsZi5wYXJhbXMubWF5YmUoKVsxXQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMC0xNzExCiAgICAvLyAjIHNoYXJlZCB0ZW1wbGF0ZSBzdGF0ZQogICAgLy8gc2VsZi5wYXJhbXMgPSBHbG9iYWxTdGF0ZShQYXJhbXMpCiAgICBieXRlICJwYXJhbXMiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MzgKICAgIC8vIHNoYXJlZCA9IHNlbGYucGFyYW1zLm1heWJlKClbMV0KICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTkzOS0xOTQxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9YmFzZV9hcHAuYWRkcmVzcywgYW1vdW50PW9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAgICMgMTAwMDAwCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NDAKICAgIC8vIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1vcC5HbG9iYWwubWluX2JhbGFuY2UsIGZlZT0wICAjIDEwMDAwMAogICAgZnJhbWVfZGlnIC01CiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTkzOQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTQwCiAgICAvLyByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9b3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MCAgIyAxMDAwMDAKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTM5LTE5NDEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9b3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MCAgIyAxMDAwMDAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NDIKICAgIC8vIGlmIHNoYXJlZDoKICAgIGJ6IGluaXRfYWlyZHJvcF9lbHNlX2JvZHlANAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTQzLTE5NTYKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGVtaXQgVGVtcGxhdGUsIFVwZ3JhZGVyR3JhbnRlZCwgU2V0dXAKICAgIC8vICAgICBBaXJkcm9wLmluaXRfc2hhcmVkLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHBlcmlvZAogICAgLy8gICAgIGRlYWRsaW5lLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHRvdGFsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgZnVuZGluZwogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKSwgICMgZGVsZWdhdGUKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIC8vICAgICBvd25lciwKICAgIC8vICAgICBmdW5kZXIsCiAgICAvLyAgICAgaW5pdGlhbCwKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NDUKICAgIC8vIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHBlcmlvZAogICAgaW50IDAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk0OQogICAgLy8gYXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpLCAgIyBkZWxlZ2F0ZQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NTAKICAgIC8vIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICAjIGluaGVyaXQgdXBncmFkZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY292ZXIgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTUxCiAgICAvLyBUeG4uc2VuZGVyLCAgIyBkZXBsb3llcgogICAgdHhuIFNlbmRlcgogICAgY292ZXIgMwogICAgZnJhbWVfZGlnIC01CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk0My0xOTU2CiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFRlbXBsYXRlLCBVcGdyYWRlckdyYW50ZWQsIFNldHVwCiAgICAvLyAgICAgQWlyZHJvcC5pbml0X3NoYXJlZCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyBwZXJpb2QKICAgIC8vICAgICBkZWFkbGluZSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB0b3RhbAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksICAjIGRlbGVnYXRlCiAgICAvLyAgICAgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgICMgaW5oZXJpdCB1cGdyYWRlcgogICAgLy8gICAgIFR4bi5zZW5kZXIsICAjIGRlcGxveWVyCiAgICAvLyAgICAgb3duZXIsCiAgICAvLyAgICAgZnVuZGVyLAogICAgLy8gICAgIGluaXRpYWwsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJpbml0X3NoYXJlZCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGR1cAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGR1cAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgYiBpbml0X2FpcmRyb3BfYWZ0ZXJfaWZfZWxzZUA2Cgppbml0X2FpcmRyb3BfZWxzZV9ib2R5QDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NTgtMTk3OAogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBUZW1wbGF0ZSwgVXBncmFkZXJHcmFudGVkLCBTZXR1cAogICAgLy8gICAgIEFpcmRyb3AuaW5pdCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgdmVzdGluZyBkZWxheQogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHBlcmlvZAogICAgLy8gICAgIGRlYWRsaW5lLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHRvdGFsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgZnVuZGluZwogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKSwgICMgZGVsZWdhdGUKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIC8vICAgICBvd25lciwKICAgIC8vICAgICBmdW5kZXIsCiAgICAvLyAgICAgaW5pdGlhbCwKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NjAKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIGludCBUTVBMX1BFUklPRF9MSU1JVAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTYxCiAgICAvLyBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICBpbnQgMAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTYyCiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICBpbnQgVE1QTF9MT0NLVVBfREVMQVkKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk2MwogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9QRVJJT0RfU0VDT05EUwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTY0CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICBpbnQgVE1QTF9NRVNTRU5HRVJfSUQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk2NQogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgaW50IFRNUExfRElTVFJJQlVUSU9OX0NPVU5UCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NjYKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgaW50IFRNUExfRElTVFJJQlVUSU9OX1NFQ09ORFMKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk3MQogICAgLy8gYXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpLCAgIyBkZWxlZ2F0ZQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBjb3ZlciA3CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5NzIKICAgIC8vIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICAjIGluaGVyaXQgdXBncmFkZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY292ZXIgOAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTczCiAgICAvLyBUeG4uc2VuZGVyLCAgIyBkZXBsb3llcgogICAgdHhuIFNlbmRlcgogICAgY292ZXIgOQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTc0LTE5NzYKICAgIC8vIG93bmVyLAogICAgLy8gZnVuZGVyLAogICAgLy8gaW5pdGlhbCwKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBjb3ZlciAzCiAgICBmcmFtZV9kaWcgLTUKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTU4LTE5NzgKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGVtaXQgVGVtcGxhdGUsIFVwZ3JhZGVyR3JhbnRlZCwgU2V0dXAKICAgIC8vICAgICBBaXJkcm9wLmluaXQsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHZlc3RpbmcgZGVsYXkKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9DT1VOVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyBwZXJpb2QKICAgIC8vICAgICBkZWFkbGluZSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB0b3RhbAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksICAjIGRlbGVnYXRlCiAgICAvLyAgICAgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgICMgaW5oZXJpdCB1cGdyYWRlcgogICAgLy8gICAgIFR4bi5zZW5kZXIsICAjIGRlcGxveWVyCiAgICAvLyAgICAgb3duZXIsCiAgICAvLyAgICAgZnVuZGVyLAogICAgLy8gICAgIGluaXRpYWwsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJpbml0KHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyA2CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKaW5pdF9haXJkcm9wX2FmdGVyX2lmX2Vsc2VANjoKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5zZXR0bGVfcGF5bWVudChwYXltZW50X2Ftb3VudDogdWludDY0LCBjb3N0OiB1aW50NjQpIC0+IHZvaWQ6CnNldHRsZV9wYXltZW50OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODE1LTE4MTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0dGxlX3BheW1lbnQoc2VsZiwgcGF5bWVudF9hbW91bnQ6IFVJbnQ2NCwgY29zdDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjAKICAgIC8vIGFzc2VydCBwYXltZW50X2Ftb3VudCA+PSBjb3N0LCAicGF5bWVudCBhbW91bnQgYWNjdXJhdGUiCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgPj0KICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3VudCBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODIxCiAgICAvLyBpZiBwYXltZW50X2Ftb3VudCA+IGNvc3Q6CiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgYnogc2V0dGxlX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjItMTgyNAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjMKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgyMgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODIzCiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5bWVudF9hbW91bnQgLSBjb3N0LCBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjItMTgyNAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKc2V0dGxlX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkFpcmRyb3BGYWN0b3J5LmNyZWF0ZV9tYW55KGFyZ3M6IGJ5dGVzKSAtPiBieXRlczoKY3JlYXRlX21hbnk6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4OTYtMTg5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX21hbnkoCiAgICAvLyAgICAgc2VsZiwgYXJnczogYXJjNC5EeW5hbWljQXJyYXlbQWlyZHJvcENyZWF0ZUFyZ3NdCiAgICAvLyApIC0+IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XToKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTA5LTE5MTAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MTEKICAgIC8vIGFzc2VydCBhcmdzLmxlbmd0aCA+IDAsICJhcmdzIG5vdCBlbXB0eSIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGFzc2VydCAvLyBhcmdzIG5vdCBlbXB0eQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTEyLTE5MTMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXBwX2lkcyA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSgpCiAgICBieXRlIDB4MDAwMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTE0CiAgICAvLyBjb3N0ID0gVUludDY0KDApCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTE1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXJncy5sZW5ndGgpOgogICAgZHVwCgpjcmVhdGVfbWFueV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MTUKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcmdzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGNyZWF0ZV9tYW55X2FmdGVyX2ZvckA0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MTYKICAgIC8vIGFyZyA9IGFyZ3NbaV0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnQgODAKICAgICoKICAgIGludCA4MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MTcKICAgIC8vIGJhc2VfYXBwLCBtYnJfaW5jcmVhc2UgPSBzZWxmLmNyZWF0ZV9jaGlsZChhcmcub3duZXIsIGFyZy5mdW5kZXIpCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIGR1cAogICAgZXh0cmFjdCAzMiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAyCiAgICBkaWcgMQogICAgY2FsbHN1YiBjcmVhdGVfY2hpbGQKICAgIGNvdmVyIDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTkxOQogICAgLy8gYmFzZV9hcHAsIGFyZy5vd25lciwgYXJnLmZ1bmRlciwgYXJnLmRlYWRsaW5lLCBhcmcuaW5pdGlhbAogICAgZGlnIDIKICAgIGV4dHJhY3QgNjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdCA3MiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTE4LTE5MjAKICAgIC8vIHNlbGYuaW5pdF9haXJkcm9wKAogICAgLy8gICAgIGJhc2VfYXBwLCBhcmcub3duZXIsIGFyZy5mdW5kZXIsIGFyZy5kZWFkbGluZSwgYXJnLmluaXRpYWwKICAgIC8vICkKICAgIGRpZyAxCiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDQKICAgIGNhbGxzdWIgaW5pdF9haXJkcm9wCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MjEKICAgIC8vIGNvc3QgKz0gbWJyX2luY3JlYXNlICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgdW5jb3ZlciAyCiAgICArCiAgICBmcmFtZV9kaWcgMwogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MjIKICAgIC8vIGFwcF9pZHMuYXBwZW5kKGFyYzQuVUludDY0KGJhc2VfYXBwLmlkKSkKICAgIGZyYW1lX2RpZyAyCiAgICBleHRyYWN0IDIgMAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50IDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTE1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXJncy5sZW5ndGgpOgogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBjcmVhdGVfbWFueV9mb3JfaGVhZGVyQDEKCmNyZWF0ZV9tYW55X2FmdGVyX2ZvckA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTIzCiAgICAvLyBzZWxmLnNldHRsZV9wYXltZW50KHBheW1lbnRfYW1vdW50LCBjb3N0KQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAzCiAgICBjYWxsc3ViIHNldHRsZV9wYXltZW50CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5MjQKICAgIC8vIHJldHVybiBhcHBfaWRzCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQWlyZHJvcEZhY3RvcnkudXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxOTg4LTE5OTAKICAgIC8vICMgVE9ETyByZW1vdmUgbWUgbGF0ZXIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHVwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5OTEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk5MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTk5MgogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5OTIKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBkYXRhYmxlIGV4aXN0cwogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gbm90IGFwcHJvdmVkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5OTMKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gZ2V0X2F2YWlsYWJsZV9iYWxhbmNlKCkKICAgIGNhbGxzdWIgZ2V0X2F2YWlsYWJsZV9iYWxhbmNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE5OTQKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9YXZhaWxhYmxlX2JhbGFuY2UsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5nZXRfYXZhaWxhYmxlX2JhbGFuY2UoKSAtPiB1aW50NjQ6CmdldF9hdmFpbGFibGVfYmFsYW5jZToKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzgtNDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9hdmFpbGFibGVfYmFsYW5jZSAoaW50ZXJuYWwpCiAgICAvLyAjIHB1cnBvc2U6IGdldCBhdmFpbGFibGUgYmFsYW5jZQogICAgLy8gIyByZXR1cm5zOiBhcHAgYmFsYW5jZSBhdmFpbGFibGUgZm9yIHNwZW5kaW5nCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9hdmFpbGFibGVfYmFsYW5jZSgpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy91dGlscy5weTo0NQogICAgLy8gYmFsYW5jZSA9IG9wLmJhbGFuY2UoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcykKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBiYWxhbmNlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjQ2CiAgICAvLyBtaW5fYmFsYW5jZSA9IG9wLkdsb2JhbC5taW5fYmFsYW5jZQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NDcKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICAtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjQ4CiAgICAvLyByZXR1cm4gYXZhaWxhYmxlX2JhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5lbmFibGVfcmVnaXN0cnkoKSAtPiB2b2lkOgplbmFibGVfcmVnaXN0cnk6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NDUtMTc0NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZW5hYmxlX3JlZ2lzdHJ5KHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzUyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzUzCiAgICAvLyBtaW5fYmFsYW5jZSA9IGdldF9taW5fYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzU0CiAgICAvLyBzZWxmLnJlZ2lzdHJ5LnZhbHVlID0gVUludDY0KDEpCiAgICBpbnQgMQogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzEzLTE3MTUKICAgIC8vICMgcmVnaXN0cnkgc3RhdGUsIGluIGJveGVzIHNvIGZhY3RvcmllcyB1cGRhdGVkCiAgICAvLyAjICAgaW4gcGxhY2Uga2VlcCB0aGVpciBnbG9iYWwgc2NoZW1hCiAgICAvLyBzZWxmLnJlZ2lzdHJ5ID0gQm94KFVJbnQ2NCwga2V5PWIicmVnaXN0cnkiKQogICAgYnl0ZSAweDcyNjU2NzY5NzM3NDcyNzkKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NAogICAgLy8gc2VsZi5yZWdpc3RyeS52YWx1ZSA9IFVJbnQ2NCgxKQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzU1CiAgICAvLyBzZXR0bGVfbWJyX3BheW1lbnQobWluX2JhbGFuY2UpCiAgICBjYWxsc3ViIHNldHRsZV9tYnJfcGF5bWVudAogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLnNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZTogdWludDY0KSAtPiB2b2lkOgpzZXR0bGVfbWJyX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjY1LTc5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBzZXR0bGVfbWJyX3BheW1lbnQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gbWluX2JhbGFuY2UsIGFwcCBtaW4gYmFsYW5jZSBiZWZvcmUgYm94ZXMKICAgIC8vICMgICB3ZXJlIHdyaXR0ZW4KICAgIC8vICMgcHVycG9zZTogcmVxdWlyZSBwYXltZW50IHByZWNlZGluZyBjYWxsIGZyb20KICAgIC8vICMgICBzZW5kZXIgY292ZXJpbmcgbWluIGJhbGFuY2UgaW5jcmVhc2Ugc2luY2UKICAgIC8vICMgICBtaW5fYmFsYW5jZSwgcmVmdW5kIGV4Y2VzcyB0byBzZW5kZXIKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gcGF5bWVudCBvbmx5IHJlcXVpcmVkIHdoZW4gbWluIGJhbGFuY2UKICAgIC8vICMgICBpbmNyZWFzZWQsIHJlZnVuZGVkIGluIGZ1bGwgb3RoZXJ3aXNlCiAgICAvLyAjIC0gcmVmdW5kIGNvc3RzIDEgZmVlLCBwb29sZWQgYnkgc2VuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICBieXRlICIiCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjgwCiAgICAvLyBtYnJfaW5jcmVhc2UgPSBnZXRfbWluX2JhbGFuY2UoKSAtIG1pbl9iYWxhbmNlCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBkdXAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODEKICAgIC8vIGlmIG1icl9pbmNyZWFzZSA+IDA6CiAgICBieiBzZXR0bGVfbWJyX3BheW1lbnRfZWxzZV9ib2R5QDIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODIKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gcmVxdWlyZV9wYXltZW50KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIHJlcXVpcmVfcGF5bWVudAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODMKICAgIC8vIGFzc2VydCBwYXltZW50X2Ftb3VudCA+PSBtYnJfaW5jcmVhc2UsICJwYXltZW50IGFtb3VudCBhY2N1cmF0ZSIKICAgIGZyYW1lX2RpZyAxCiAgICA+PQogICAgYXNzZXJ0IC8vIHBheW1lbnQgYW1vdW50IGFjY3VyYXRlCiAgICBiIHNldHRsZV9tYnJfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDMKCnNldHRsZV9tYnJfcGF5bWVudF9lbHNlX2JvZHlAMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODUKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gZ2V0X3BheW1lbnRfYW1vdW50KCkKICAgIGNhbGxzdWIgZ2V0X3BheW1lbnRfYW1vdW50CiAgICBmcmFtZV9idXJ5IDAKCnNldHRsZV9tYnJfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg2CiAgICAvLyBpZiBwYXltZW50X2Ftb3VudCA+IG1icl9pbmNyZWFzZToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgPgogICAgYnogc2V0dGxlX21icl9wYXltZW50X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4Ny04OQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODgKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSwgZmVlPTAKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODgKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSwgZmVlPTAKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc3JjL3NyYy91dGlscy5weTo4Ny04OQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpzZXR0bGVfbWJyX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLmdldF9wYXltZW50X2Ftb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X3BheW1lbnRfYW1vdW50OgogICAgLy8gc3JjL3NyYy91dGlscy5weTo5Mi05OQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X3BheW1lbnRfYW1vdW50IChpbnRlcm5hbCkKICAgIC8vICMgcHVycG9zZTogYW1vdW50IG9mIG9wdGlvbmFsIHBheW1lbnQgcHJlY2VkaW5nCiAgICAvLyAjICAgY2FsbCBmcm9tIHNlbmRlciB0byBhcHAKICAgIC8vICMgcmV0dXJuczogcGF5bWVudCBhbW91bnQsIDAgd2l0aG91dCBwYXltZW50CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9wYXltZW50X2Ftb3VudCgpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgYnl0ZSAiIgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDAKICAgIC8vIGlmIFR4bi5ncm91cF9pbmRleCA9PSAwOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGJueiBnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwMQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50IDAKICAgIHN3YXAKICAgIHJldHN1YgoKZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTAyCiAgICAvLyBwYXltZW50ID0gZ3R4bi5UcmFuc2FjdGlvbihUeG4uZ3JvdXBfaW5kZXggLSAxKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDQKICAgIC8vIHBheW1lbnQudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuUGF5bWVudAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNC0xMDYKICAgIC8vIHBheW1lbnQudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuUGF5bWVudAogICAgLy8gYW5kIHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIC8vIGFuZCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGJ6IGdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA1CiAgICAvLyBhbmQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgZnJhbWVfZGlnIDAKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA0LTEwNgogICAgLy8gcGF5bWVudC50eXBlID09IFRyYW5zYWN0aW9uVHlwZS5QYXltZW50CiAgICAvLyBhbmQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgLy8gYW5kIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgYnogZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDYKICAgIC8vIGFuZCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNC0xMDYKICAgIC8vIHBheW1lbnQudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuUGF5bWVudAogICAgLy8gYW5kIHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIC8vIGFuZCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGJ6IGdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA4CiAgICAvLyByZXR1cm4gcGF5bWVudC5hbW91bnQKICAgIGZyYW1lX2RpZyAwCiAgICBndHhucyBBbW91bnQKICAgIHN3YXAKICAgIHJldHN1YgoKZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA5CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnQgMAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LmdldF9jaGlsZHJlbihvd25lcjogYnl0ZXMsIG9mZnNldDogYnl0ZXMsIGxpbWl0OiBieXRlcykgLT4gdWludDY0LCBieXRlczoKZ2V0X2NoaWxkcmVuOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzU3LTE3NjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9jaGlsZHJlbigKICAgIC8vICAgICBzZWxmLCBvd25lcjogYXJjNC5BZGRyZXNzLCBvZmZzZXQ6IGFyYzQuVUludDY0LCBsaW1pdDogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gdHVwbGVbVUludDY0LCBhcmM0LkR5bmFtaWNBcnJheVtDaGlsZEluZm9dXToKICAgIHByb3RvIDMgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzcwCiAgICAvLyBiImMiICsgb3duZXIuYnl0ZXMsIG9mZnNldC5uYXRpdmUsIGxpbWl0Lm5hdGl2ZSwgVUludDY0KDQ4KSwgVUludDY0KDIxKQogICAgYnl0ZSAweDYzCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGludCA0OAogICAgaW50IDIxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NjktMTc3MQogICAgLy8gY291bnQsIGNoaWxkcmVuID0gZ2V0X3BhZ2VkKAogICAgLy8gICAgIGIiYyIgKyBvd25lci5ieXRlcywgb2Zmc2V0Lm5hdGl2ZSwgbGltaXQubmF0aXZlLCBVSW50NjQoNDgpLCBVSW50NjQoMjEpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF9wYWdlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzczCiAgICAvLyBhcmM0LlVJbnQxNihjaGlsZHJlbi5sZW5ndGggLy8gNDgpLmJ5dGVzICsgY2hpbGRyZW4KICAgIGR1cAogICAgbGVuCiAgICBpbnQgNDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc3Mi0xNzc0CiAgICAvLyByZXR1cm4gY291bnQsIGFyYzQuRHluYW1pY0FycmF5W0NoaWxkSW5mb10uZnJvbV9ieXRlcygKICAgIC8vICAgICBhcmM0LlVJbnQxNihjaGlsZHJlbi5sZW5ndGggLy8gNDgpLmJ5dGVzICsgY2hpbGRyZW4KICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5nZXRfcGFnZWQoa2V5OiBieXRlcywgb2Zmc2V0OiB1aW50NjQsIGxpbWl0OiB1aW50NjQsIGl0ZW1fc2l6ZTogdWludDY0LCBwYWdlX3NpemU6IHVpbnQ2NCkgLT4gdWludDY0LCBieXRlczoKZ2V0X3BhZ2VkOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzktMTU2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfcGFnZWQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0ga2V5LCBsaXN0IGtleSwgc2VlIGFwcGVuZF9wYWdlZAogICAgLy8gIyAtIG9mZnNldCwgaW5kZXggb2YgZmlyc3QgaXRlbQogICAgLy8gIyAtIGxpbWl0LCBtYXggaXRlbXMsIGF0IG1vc3QgcGFnZV9zaXplCiAgICAvLyAjIC0gaXRlbV9zaXplLCBpdGVtIHNpemUKICAgIC8vICMgLSBwYWdlX3NpemUsIGl0ZW1zIHBlciBwYWdlCiAgICAvLyAjIHB1cnBvc2U6IHJlYWQgaXRlbXMgZnJvbSBsaXN0IGtlcHQgaW4gcGFnZXMKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBpdGVtIGNvdW50CiAgICAvLyAjIC0gaXRlbXMgZnJvbSBvZmZzZXQsIGF0IG1vc3QgbGltaXQsIHNwYW5zCiAgICAvLyAjICAgYXQgbW9zdCAyIHBhZ2VzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9wYWdlZCgKICAgIC8vICAgICBrZXk6IEJ5dGVzLCBvZmZzZXQ6IFVJbnQ2NCwgbGltaXQ6IFVJbnQ2NCwgaXRlbV9zaXplOiBVSW50NjQsIHBhZ2Vfc2l6ZTogVUludDY0CiAgICAvLyApIC0+IHR1cGxlW1VJbnQ2NCwgQnl0ZXNdOgogICAgcHJvdG8gNSAyCiAgICBpbnQgMAogICAgYnl0ZSAiIgogICAgZHVwbiA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE1NwogICAgLy8gY291bnRfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoa2V5KQogICAgZnJhbWVfZGlnIC01CiAgICBib3hfZ2V0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE1OAogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE1OQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKSwgQnl0ZXMoKQogICAgaW50IDAKICAgIGJ5dGUgMHgKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2MAogICAgLy8gY291bnQgPSBvcC5idG9pKGNvdW50X2J5dGVzKQogICAgZnJhbWVfZGlnIDgKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2MQogICAgLy8gaWYgb2Zmc2V0ID49IGNvdW50OgogICAgZnJhbWVfZGlnIC00CiAgICA8PQogICAgYnogZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjIKICAgIC8vIHJldHVybiBjb3VudCwgQnl0ZXMoKQogICAgZnJhbWVfZGlnIDEKICAgIGJ5dGUgMHgKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2My0xNjQKICAgIC8vICMgY2xhbXAgYmVmb3JlIGFkZGluZyB0byBvZmZzZXQsIHdoaWNoIG1heSBvdmVyZmxvdwogICAgLy8gaWYgbGltaXQgPiBwYWdlX3NpemU6CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgYnogZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VANgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IC0zCgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjYKICAgIC8vIGlmIGxpbWl0ID4gY291bnQgLSBvZmZzZXQ6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC00CiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfZGlnIC0zCiAgICA8CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA4CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfYnVyeSAtMwoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTY4CiAgICAvLyBpdGVtcyA9IEJ5dGVzKCkKICAgIGJ5dGUgMHgKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzAKICAgIC8vIGVuZCA9IG9mZnNldCArIGxpbWl0CiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2J1cnkgMwoKZ2V0X3BhZ2VkX3doaWxlX3RvcEA5OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzEKICAgIC8vIHdoaWxlIGluZGV4IDwgZW5kOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfd2hpbGVAMTMKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTcyCiAgICAvLyBzbG90ID0gaW5kZXggJSBwYWdlX3NpemUKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgJQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTczCiAgICAvLyBzaXplID0gcGFnZV9zaXplIC0gc2xvdAogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNQogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzQKICAgIC8vIGlmIHNpemUgPiBlbmQgLSBpbmRleDoKICAgIGZyYW1lX2RpZyAyCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA2CiAgICA+CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAxMgogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2J1cnkgNQoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMTI6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3NwogICAgLy8ga2V5ICsgb3AuaXRvYihpbmRleCAvLyBwYWdlX3NpemUpLCBzbG90ICogaXRlbV9zaXplLCBzaXplICogaXRlbV9zaXplCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIC8KICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtNQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfZGlnIC0yCiAgICAqCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTc2LTE3OAogICAgLy8gaXRlbXMgKz0gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAga2V5ICsgb3AuaXRvYihpbmRleCAvLyBwYWdlX3NpemUpLCBzbG90ICogaXRlbV9zaXplLCBzaXplICogaXRlbV9zaXplCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3OQogICAgLy8gaW5kZXggKz0gc2l6ZQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGdldF9wYWdlZF93aGlsZV90b3BAOQoKZ2V0X3BhZ2VkX2FmdGVyX3doaWxlQDEzOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxODAKICAgIC8vIHJldHVybiBjb3VudCwgaXRlbXMKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5zZXRfdmVyc2lvbihjb250cmFjdF92ZXJzaW9uOiBieXRlcywgZGVwbG95bWVudF92ZXJzaW9uOiBieXRlcykgLT4gdm9pZDoKc2V0X3ZlcnNpb246CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzMC01MzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF92ZXJzaW9uKAogICAgLy8gICAgIHNlbGYsIGNvbnRyYWN0X3ZlcnNpb246IGFyYzQuVUludDY0LCBkZXBsb3ltZW50X3ZlcnNpb246IGFyYzQuVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM1CiAgICAvLyBhcmM0LmVtaXQoVmVyc2lvblVwZGF0ZWQoY29udHJhY3RfdmVyc2lvbiwgZGVwbG95bWVudF92ZXJzaW9uKSkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVmVyc2lvblVwZGF0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzYKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM2CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBjb250cmFjdF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM3CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IGRlcGxveW1lbnRfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM3CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IGRlcGxveW1lbnRfdmVyc2lvbi5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuYXBwcm92ZV91cGRhdGUoYXBwcm92YWw6IGJ5dGVzKSAtPiB2b2lkOgphcHByb3ZlX3VwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ4LTU0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgYXBwcm92ZV91cGRhdGUoc2VsZiwgYXBwcm92YWw6IGFyYzQuQm9vbCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTEKICAgIC8vIGFyYzQuZW1pdChVcGRhdGVBcHByb3ZlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIGFwcHJvdmFsKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZGF0ZUFwcHJvdmVkKGFkZHJlc3MsYm9vbCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTIKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAwCiAgICBnZXRiaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUyCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGFwcHJvdmFsLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5ncmFudF91cGdyYWRlcih1cGdyYWRlcjogYnl0ZXMpIC0+IHZvaWQ6CmdyYW50X3VwZ3JhZGVyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTQtNTU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBncmFudF91cGdyYWRlcihzZWxmLCB1cGdyYWRlcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIm11c3QgYmUgY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGNyZWF0b3IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU3CiAgICAvLyBhcmM0LmVtaXQoVXBncmFkZXJHcmFudGVkKGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwgdXBncmFkZXIpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU3CiAgICAvLyBhcmM0LmVtaXQoVXBncmFkZXJHcmFudGVkKGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwgdXBncmFkZXIpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVXBncmFkZXJHcmFudGVkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTgKICAgIC8vIHNlbGYudXBncmFkZXIgPSB1cGdyYWRlci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5vbl91cGRhdGUoKSAtPiB2b2lkOgpvbl91cGRhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzOS01NDAKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgb25fdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQxLTU0NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIFdBUk5JTkc6IFRoaXMgYXBwIGNhbiBiZSB1cGRhdGVkIGJ5IHRoZSBjcmVhdG9yCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQxLTU0NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIFdBUk5JTkc6IFRoaXMgYXBwIGNhbiBiZSB1cGRhdGVkIGJ5IHRoZSBjcmVhdG9yCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0NQogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0NQogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGRhdGFibGUgZXhpc3RzCiAgICBpbnQgMQogICAgPT0KICAgIGFzc2VydCAvLyBub3QgYXBwcm92ZWQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5BaXJkcm9wRmFjdG9yeS5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODQ3CiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4NDgKICAgIC8vIHN1cGVyKCkuX19pbml0X18oKQogICAgY2FsbHN1YiBCYXNlRmFjdG9yeS5fX2luaXRfXwogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5Ll9faW5pdF9fKCkgLT4gdm9pZDoKQmFzZUZhY3RvcnkuX19pbml0X186CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MDEKICAgIC8vIGRlZiBfX2luaXRfXyhzZWxmKSAtPiBOb25lOiAgIyBwcmFnbWE6IG5vIGNvdmVyCiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwNS0xNzA2CiAgICAvLyAjIHVwZ3JhZGVhYmxlIHN0YXRlCiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzA3CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwOAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwOQogICAgLy8gc2VsZi51cGdyYWRlciA9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQWlyZHJvcEZhY3RvcnkuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTg0MQogICAgLy8gY2xhc3MgQWlyZHJvcEZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgaW50IDEKICAgIHJldHVybgo="
   },
   "state": {
     "global": {
-      "num_byte_slices": 2,
-      "num_uints": 3
+      "num_byte_slices": 3,
+      "num_uints": 4
     },
     "local": {
       "num_byte_slices": 0,
@@ -87,10 +108,18 @@ export const APP_SPEC: AppSpec = {
           "type": "uint64",
           "key": "deployment_version"
         },
+        "messenger_id": {
+          "type": "uint64",
+          "key": "messenger_id"
+        },
         "owner": {
           "type": "bytes",
           "key": "owner"
         },
+        "params": {
+          "type": "bytes",
+          "key": "params"
+        },
         "updatable": {
           "type": "uint64",
           "key": "updatable"
@@ -111,6 +140,15 @@ export const APP_SPEC: AppSpec = {
     "name": "AirdropFactory",
     "desc": "\n    Factory for airdrop requiring lockup period\n    configuration and funding.\n    ",
     "methods": [
+      {
+        "name": "share_params",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Share template parameters, children created from now on read\nthem from factory global state instead of storing a copy."
+      },
       {
         "name": "create",
         "args": [
@@ -137,6 +175,20 @@ export const APP_SPEC: AppSpec = {
         },
         "desc": "Create airdrop.\nArguments: - owner, who is the beneficiary - funder, who funded the contract - deadline, funding deadline - initial, initial funded value not including lockup bonus\nReturns: - app id"
       },
+      {
+        "name": "create_many",
+        "args": [
+          {
+            "type": "(address,address,uint64,uint64)[]",
+            "name": "args"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "uint64[]"
+        },
+        "desc": "Create airdrops from a single payment.\nArguments: - args, owner, funder, deadline and initial of each airdrop\nReturns: - app ids"
+      },
       {
         "name": "update",
         "args": [],
@@ -145,6 +197,37 @@ export const APP_SPEC: AppSpec = {
           "type": "void"
         }
       },
+      {
+        "name": "enable_registry",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Record children created from now on in box registry by owner.\nCreators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled."
+      },
+      {
+        "name": "get_children",
+        "args": [
+          {
+            "type": "address",
+            "name": "owner"
+          },
+          {
+            "type": "uint64",
+            "name": "offset"
+          },
+          {
+            "type": "uint64",
+            "name": "limit"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "(uint64,(uint64,address,uint64)[])"
+        },
+        "desc": "Get page of children of owner in creation order."
+      },
       {
         "name": "set_version",
         "args": [
@@ -281,6 +364,12 @@ export type AirdropFactory = {
    * Maps method signatures / names to their argument and return types.
    */
   methods:
+    & Record<'share_params()void' | 'share_params', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: void
+    }>
     & Record<'create(address,address,uint64,uint64)uint64' | 'create', {
       argsObj: {
         owner: string
@@ -291,12 +380,34 @@ export type AirdropFactory = {
       argsTuple: [owner: string, funder: string, deadline: bigint | number, initial: bigint | number]
       returns: bigint
     }>
+    & Record<'create_many((address,address,uint64,uint64)[])uint64[]' | 'create_many', {
+      argsObj: {
+        args: [string, string, bigint | number, bigint | number][]
+      }
+      argsTuple: [args: [string, string, bigint | number, bigint | number][]]
+      returns: bigint[]
+    }>
     & Record<'update()void' | 'update', {
       argsObj: {
       }
       argsTuple: []
       returns: void
     }>
+    & Record<'enable_registry()void' | 'enable_registry', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: void
+    }>
+    & Record<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])' | 'get_children', {
+      argsObj: {
+        owner: string
+        offset: bigint | number
+        limit: bigint | number
+      }
+      argsTuple: [owner: string, offset: bigint | number, limit: bigint | number]
+      returns: [bigint, [bigint, string, bigint][]]
+    }>
     & Record<'set_version(uint64,uint64)void' | 'set_version', {
       argsObj: {
         contractVersion: bigint | number
@@ -333,7 +444,9 @@ export type AirdropFactory = {
     global: {
       contractVersion?: IntegerState
       deploymentVersion?: IntegerState
+      messengerId?: IntegerState
       owner?: BinaryState
+      params?: BinaryState
       updatable?: IntegerState
       upgrader?: BinaryState
     }
@@ -443,6 +556,23 @@ export abstract class AirdropFactoryCallFactory {
     }
   }
 
+  /**
+   * Constructs a no op call for the share_params()void ABI method
+   *
+   * Share template parameters, children created from now on read
+them from factory global state instead of storing a copy.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static shareParams(args: MethodArgs<'share_params()void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'share_params()void' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the create(address,address,uint64,uint64)uint64 ABI method
    *
@@ -461,6 +591,24 @@ Returns: - app id
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the create_many((address,address,uint64,uint64)[])uint64[] ABI method
+   *
+   * Create airdrops from a single payment.
+Arguments: - args, owner, funder, deadline and initial of each airdrop
+Returns: - app ids
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static createMany(args: MethodArgs<'create_many((address,address,uint64,uint64)[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'create_many((address,address,uint64,uint64)[])uint64[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.args],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the update()void ABI method
    *
@@ -475,6 +623,39 @@ Returns: - app id
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the enable_registry()void ABI method
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'enable_registry()void' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])' as const,
+      methodArgs: Array.isArray(args) ? args : [args.owner, args.offset, args.limit],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the set_version(uint64,uint64)void ABI method
    *
@@ -651,6 +832,20 @@ export class AirdropFactoryClient {
     return this.appClient.clearState(args)
   }
 
+  /**
+   * Calls the share_params()void ABI method.
+   *
+   * Share template parameters, children created from now on read
+them from factory global state instead of storing a copy.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public shareParams(args: MethodArgs<'share_params()void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropFactoryCallFactory.shareParams(args, params))
+  }
+
   /**
    * Calls the create(address,address,uint64,uint64)uint64 ABI method.
    *
@@ -666,6 +861,21 @@ Returns: - app id
     return this.call(AirdropFactoryCallFactory.create(args, params))
   }
 
+  /**
+   * Calls the create_many((address,address,uint64,uint64)[])uint64[] ABI method.
+   *
+   * Create airdrops from a single payment.
+Arguments: - args, owner, funder, deadline and initial of each airdrop
+Returns: - app ids
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public createMany(args: MethodArgs<'create_many((address,address,uint64,uint64)[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropFactoryCallFactory.createMany(args, params))
+  }
+
   /**
    * Calls the update()void ABI method.
    *
@@ -677,6 +887,33 @@ Returns: - app id
     return this.call(AirdropFactoryCallFactory.update(args, params))
   }
 
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropFactoryCallFactory.enableRegistry(args, params))
+  }
+
+  /**
+   * Calls the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method.
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(AirdropFactoryCallFactory.getChildren(args, params))
+  }
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -779,9 +1016,15 @@ Returns: - app id
       get deploymentVersion() {
         return AirdropFactoryClient.getIntegerState(state, 'deployment_version')
       },
+      get messengerId() {
+        return AirdropFactoryClient.getIntegerState(state, 'messenger_id')
+      },
       get owner() {
         return AirdropFactoryClient.getBinaryState(state, 'owner')
       },
+      get params() {
+        return AirdropFactoryClient.getBinaryState(state, 'params')
+      },
       get updatable() {
         return AirdropFactoryClient.getIntegerState(state, 'updatable')
       },
@@ -797,16 +1040,36 @@ Returns: - app id
     let promiseChain:Promise<unknown> = Promise.resolve()
     const resultMappers: Array<undefined | ((x: any) => any)> = []
     return {
+      shareParams(args: MethodArgs<'share_params()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.shareParams(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       create(args: MethodArgs<'create(address,address,uint64,uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.create(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      createMany(args: MethodArgs<'create_many((address,address,uint64,uint64)[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.createMany(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       update(args: MethodArgs<'update()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.update(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.enableRegistry(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getChildren(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       setVersion(args: MethodArgs<'set_version(uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setVersion(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -870,6 +1133,18 @@ Returns: - app id
   }
 }
 export type AirdropFactoryComposer<TReturns extends [...any[]] = []> = {
+  /**
+   * Calls the share_params()void ABI method.
+   *
+   * Share template parameters, children created from now on read
+them from factory global state instead of storing a copy.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  shareParams(args: MethodArgs<'share_params()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropFactoryComposer<[...TReturns, MethodReturn<'share_params()void'>]>
+
   /**
    * Calls the create(address,address,uint64,uint64)uint64 ABI method.
    *
@@ -883,6 +1158,19 @@ Returns: - app id
    */
   create(args: MethodArgs<'create(address,address,uint64,uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropFactoryComposer<[...TReturns, MethodReturn<'create(address,address,uint64,uint64)uint64'>]>
 
+  /**
+   * Calls the create_many((address,address,uint64,uint64)[])uint64[] ABI method.
+   *
+   * Create airdrops from a single payment.
+Arguments: - args, owner, funder, deadline and initial of each airdrop
+Returns: - app ids
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createMany(args: MethodArgs<'create_many((address,address,uint64,uint64)[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropFactoryComposer<[...TReturns, MethodReturn<'create_many((address,address,uint64,uint64)[])uint64[]'>]>
+
   /**
    * Calls the update()void ABI method.
    *
@@ -892,6 +1180,29 @@ Returns: - app id
    */
   update(args: MethodArgs<'update()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropFactoryComposer<[...TReturns, MethodReturn<'update()void'>]>
 
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropFactoryComposer<[...TReturns, MethodReturn<'enable_registry()void'>]>
+
+  /**
+   * Calls the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method.
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): AirdropFactoryComposer<[...TReturns, MethodReturn<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>]>
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -31,11 +31,32 @@ import type { ABIResult, TransactionWithSigner } from 'algosdk'
 import { Algodv2, OnApplicationComplete, Transaction, AtomicTransactionComposer, modelsv2 } from 'algosdk'
 export const APP_SPEC: AppSpec = {
   "hints": {
+    "share_params()void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "create(address)uint64": {
       "call_config": {
         "no_op": "CALL"
       }
     },
+    "create_many((address,uint64)[])uint64[]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "enable_registry()void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "set_version(uint64,uint64)void": {
       "call_config": {
         "no_op": "CALL"
@@ -58,13 +79,13 @@ export const APP_SPEC: AppSpec = {
     }
   },
   "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQ29tcGVuc2F0aW9uRmFjdG9yeS5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNzcKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDExCiAgICBtZXRob2QgImNyZWF0ZShhZGRyZXNzKXVpbnQ2NCIKICAgIG1ldGhvZCAic2V0X3ZlcnNpb24odWludDY0LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJhcHByb3ZlX3VwZGF0ZShib29sKXZvaWQiCiAgICBtZXRob2QgImdyYW50X3VwZ3JhZGVyKGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAidHJhbnNmZXIoYWRkcmVzcyl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfcm91dGVANCBtYWluX3NldF92ZXJzaW9uX3JvdXRlQDUgbWFpbl9hcHByb3ZlX3VwZGF0ZV9yb3V0ZUA2IG1haW5fZ3JhbnRfdXBncmFkZXJfcm91dGVANyBtYWluX3RyYW5zZmVyX3JvdXRlQDgKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fY3JlYXRlX3JvdXRlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyODQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjc3CiAgICAvLyBjbGFzcyBDb21wZW5zYXRpb25GYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI4NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNyZWF0ZQogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUA1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjc3CiAgICAvLyBjbGFzcyBDb21wZW5zYXRpb25GYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X3ZlcnNpb24KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI3NwogICAgLy8gY2xhc3MgQ29tcGVuc2F0aW9uRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGFwcHJvdmVfdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDc6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNzcKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBncmFudF91cGdyYWRlcgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl90cmFuc2Zlcl9yb3V0ZUA4OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI3NwogICAgLy8gY2xhc3MgQ29tcGVuc2F0aW9uRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICBpbnQgMAogICAgaW50IDQKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIG1hdGNoIG1haW5fY3JlYXRlQDEyIG1haW5fb25fdXBkYXRlQDEzCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZUAxMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI3NwogICAgLy8gY2xhc3MgQ29tcGVuc2F0aW9uRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX29uX3VwZGF0ZUAxMzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY2CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY2LTQ2NwogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIGNhbGxzdWIgb25fdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgoKLy8gc3JjLmNvbnRyYWN0LkNvbXBlbnNhdGlvbkZhY3RvcnkuY3JlYXRlKG93bmVyOiBieXRlcykgLT4gdWludDY0OgpjcmVhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyODQtMTI4OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgb3duZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyOTktMTMwMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBpbml0aWFsID0gc2VsZi5nZXRfaW5pdGlhbF9wYXltZW50KCkKICAgIGNhbGxzdWIgZ2V0X2luaXRpYWxfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzExCiAgICAvLyBiYXNlX2FwcCA9IGFyYzQuYXJjNF9jcmVhdGUoQWlyZHJvcCwgY29tcGlsZWQ9Y29tcGlsZWQpLmNyZWF0ZWRfYXBwCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMDEtMTMxMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIHRvdGFsLCBwYXltZW50IGFtb3VudAogICAgLy8gIyBwZXJpb2QsIDAgKG5vIGxvY2t1cCkKICAgIC8vICMgZGVhZGxpbmUsIG5vdwogICAgLy8gIyB2ZXN0aW5nIGRlbGF5LCAwIChubyB2ZXN0aW5nKQogICAgLy8gIyBkZXBsb3llciBTZW5kZXIKICAgIC8vICMgb3duZXIgYXJnCiAgICAvLyAjIGZ1bmRlciBTZW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gY29tcGlsZWQgPSBjb21waWxlX2NvbnRyYWN0KEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MykgIyBtYXggZXh0cmEgcGFnZXMKICAgIGludCAxNwogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1VaW50CiAgICBpbnQgNQogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIGludCAzCiAgICBpdHhuX2ZpZWxkIEV4dHJhUHJvZ3JhbVBhZ2VzCiAgICBieXRlIGJhc2U2NCBDb0VCUXc9PQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBieXRlIGJhc2U2NCBDaUFFQUFFRkFpWWFCVzkzYm1WeUJtWjFibVJsY2dkbWRXNWthVzVuQlhSdmRHRnNDSFZ3WjNKaFpHVnlCbkJsY21sdlpBaGtaV3hsWjJGMFpSSmthWE4wY21saWRYUnBiMjVmWTI5MWJuUVVaR2x6ZEhKcFluVjBhVzl1WDNObFkyOXVaSE1NY0dWeWFXOWtYMnhwYldsMERYWmxjM1JwYm1kZlpHVnNZWGtNYkc5amEzVndYMlJsYkdGNURuQmxjbWx2WkY5elpXTnZibVJ6Q0dSbFlXUnNhVzVsQ1hWd1pHRjBZV0pzWlF4dFpYTnpaVzVuWlhKZmFXUUVTQWdRN2lBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQWhrWlhCc2IzbGxjZ2RwYm1sMGFXRnNBQVNtZ3NBYkNBQUFBQUFBQUFBQUVHTnZiblJ5WVdOMFgzWmxjbk5wYjI0U1pHVndiRzk1YldWdWRGOTJaWEp6YVc5dUNYQmhjbVZ1ZEY5cFpERVlRQUFEaUFlYk1SdEJBYnVDRVFRdmJrRCtCRklsR0swRW9PZ1ljZ1M3MFBMNEJHY1ZRL2tFTVNGQmRnU1dWZ1I2QkszNUt1UUVYTlAzaWdUcXM1RklCR2dPN1VBRXFXRmMxd1JmZnFKSUJNMGszb2dFZUx5WjFBUnJDNC80Qk5TV3YwTTJHZ0NPRVFBQkFERUFQZ0JMQUdNQWNnQ0xBSmdBcHdDekFNSUEwUURnQU84QkRRRWZBUzRBTVJrVVJERVlSRFlhQVRZYUFqWWFBellhQkRZYUJUWWFCallhQnpZYUNEWWFDVFlhQ2pZYUN6WWFESWdCS3lORE1Sa2tFa1F4R0VTSUFoSWpRekVaSkJKRU1SaEVpQUs0STBNeEdSUkVNUmhFTmhvQk5ob0NOaG9ETmhvRWlBTExJME14R1JSRU1SaEVOaG9CaUFMK0kwTXhHUlJFTVJoRU5ob0JpQU16Rm9BRUZSOThkVXhRc0NORE1Sa2tFa1F4R0VTSUJCNGpRekVaRkVReEdFUTJHZ0dJQkVvalF6RVpGRVF4R0VTSUJGNGpRekVaRkVReEdFUTJHZ0dJQko0alF6RVpGRVF4R0VRMkdnR0lCSzhqUXpFWkZFUXhHRVEyR2dHSUJOb2pRekVaRkVReEdFUTJHZ0dJQlFBalF6RVpGRVF4R0VRMkdnRTJHZ0kyR2dNMkdnUTJHZ1UyR2dhSUJSUWpRekVaRkVReEdFUTJHZ0UyR2dLSUJXMGpRekVaRkVReEdFUTJHZ0dJQlljalF6RVpGRVF4R0VRMkdnR0lCWndqUXlLQkJERVpqZ0lBQVFBS0FERVlGRVNJQmFjalF6RVlSSWdGcXlORGlnd0FNUUF5Q1JKRUlpY0paVVFVUkNJbkNtVkVGRVFpSnd0bFJCUkVJaWNNWlVRVVJDSW5EMlZFRkVRaUp3ZGxSQlJFSWljSVpVUVVSQ0luQjJWRUZFUWlKd2hsUkJSRUloYUwra3NCcFVTTCthUkVJaWNGWlVRVVJDSW5EV1ZFRkVRaUsyVkVGRVFpS21WRUZFUWlKd1psUkRJREVrU0w5SXYxVUl2MlVJdjNVSXY0VUl2NVVJdjZVSXY3VUl2OFVJdjlVSXYrVUl2L1VJQUVqeVZHOEV4UXNJdjBGeWNKVEdlTDlSY25Da3huaS9ZWEp3dE1aNHYzRnljTVRHZUwrQmNuRDB4bmkva1hKd2RNWjR2NkZ5Y0lUR2VMK3hjbkJVeG5pL3dYSncxTVo0djlGeXRNWjR2K0Z5cE1aeWNHaS85bmlZb0FBREVBSWlsbFJCSkFBQW94QUNJb1pVUVNRUUFFSTBJQUFTSkVJaXBsUkJSRU1RQWlLR1ZFVUNjUVRGQ3dJaWhsUklnQUFZbUtBUUF4R1NRU1JESUpNZ0d4Z0VBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQXNqOGlzZzRpc2cwaXNnd25FYklMSnhHeUNpT3lPU1d5RUNLeUFiYXlDSXYvc2dteUJ5T3lFQ0t5QWJPSmlnQUFNUUFpSndSbFJCSkVJaWNPWlVRakVrUWlKd1JsUkNJcFpVUlFKeEJNVUxBaUtXVkVpUDlhaVlvRUFDSW9aVVF5QXhKRUlpbGxSRElERWtReEFESUpFa1NML0l2OVVJditVSXYvVUlBRW5aeHZDMHhRc0NjU2kveG5LSXY5WnltTC9tZUwveGNuRTB4bmlZb0JBQ0lxWlVRVVJDSXJaVVFVUkRFQUlpaGxSQkpFSWljSlpVUVdpLytuUkNJbkRXVkVNZ2NOUkNJbkJXVkVGb3YvVUlBRXRqNlhra3hRc0l2L0Z5Y0ZUR2VKaWdFQkp4UkhBakVBSWlobFJCSkVJaXBsUkVFQU5ZZ0FhMG1NQUVrV2kvOVFKeFZNVUxDSUFNK0wveGRKakFFSkRrU0wveWNXcFVFQUVMRXhBTElIaXdHeUNDT3lFQ0t5QWJPSklpdGxURWxPQW93QVJFa1dpLzlRSnhWTVVMQ0lBSmFML3hkSmpBSUpEa1NML3ljV3BVRUFFTEV4QUxJSGl3S3lDQ095RUNLeUFiT0ppZ0FCTWdjaUp3cGxSQ0luREdWRUlpY0xaVVFpSndWbFJDSXFaVVFpSzJWRUlpY0haVVFpSndobFJJZ0FBWW1LQ1FFbkZJdjZpL3NMaS9rTGkvaUwrUXVML0FnSVNZdjNEMEVBQll2OWpBQ0ppL2VMQVFtTC93cEpqQUNML2c1QkFBNkwvb3NBQ1l2OUM0ditDb3dBaVNLTUFJbUtBQUV5Q21BeUFRbUppZ0FBSWlwbFJFU0kvM2NVUkRFQUlpaGxSQkpBQUFveEFDSXBaVVFTUVFBRUkwSUFBU0pFTVFBaUtHVkVVQ2NRVEZDd0lpaGxSSWo5bDRtS0FRQXhBQ0lvWlVRU1JDSW9aVVNMLzFDQUJKb2lQdnRNVUxBb2kvOW5pWW9BQURFQUlpbGxSQkpFSWlsbFJJZ0FIU0lyWlVSTEFRaE1Ga3hKRms4Q1RGQ0FCTU1EcHJ4TVVMQXJUR2VKaWdFQk1SWkpSQ01KU1RnUUl4SkVTVGdBaS84U1JFazRCeklLRWtRNENJbUtBUUF4QUNJcFpVUVNSQ0lwWlVTTC8xQ0FCRU9IMXNGTVVMQXBpLzluaVlvQkFERUFJaWxsUkJKRUlpcGxSRUVBQ2lJcVpVUXlCdzFCQUFRalFnQUJJa1FpS21WRUZvdi9VSUFFMEYzdUhFeFFzSXYvRnlwTVo0bUtBUUF4QUNJcFpVUVNSQ0lxWlVRVVJDSXJaVVFXaS8rblJDSXJaVVNML3hjSlNSYUwvMHhRZ0FSTlNJRU9URkN3SzB4bmlZb0JBREVBSWlobFJCSkFBQWd4QURJSkVrRUFCQ05DQUFFaVJDSW5CbVZFaS85UWdBUjRabFYzVEZDd0p3YUwvMmVKaWdZQU1RQWlLR1ZFRWtBQUN6RUFJaWNHWlVRU1FRQUVJMElBQVNKRU1nQXhBSWorK2tzQkVrUXhBRW1MK2xDTCsxQ0wvRkNML1ZDTC9sQ0wvMUJRZ0FSdFJKQS9URkN3c1l2OEY0djlGNHYrRjR2L3NqK3lEcklOc2d5TCs3SUxpL3F5Q2lXeUVMSUJzNG1LQWdBeEFDSW5CR1ZFRWtTTC9vdi9VSUFFakl6NXpVeFFzSXYrRnljWFRHZUwveGNuR0V4bmlZb0JBREVBSWlobFJCSkVJaWhsUkl2L1VJQUV3bmxsaTB4UXNJdi9JbE1uRGt4bmlZb0JBREVBTWdrU1JDSW5CR1ZFaS85UWdBU3Q5ZUs0VEZDd0p3U0wvMmVKaWdBQU1nMUpSQ2NaVEdlSmlnQUFNUUFpSndSbFJCSkVJaWNPWlVRakVrU0ppZ0FBSnhraVp5Y1NNZ05uSndZeUEyZUFDWE4wWVd0bFlXSnNaU05uSnhjaVp5Y1lJbWNuRGlObkp3UXlDV2NvTWdObkp3VWlaeWNUSW1jbkRTSm5Kd3dpWnljTEltY25DaUpuSndraVp5Y0hJbWNuQ0NKbktUSURaeW9pWnlzaVp5Y1BJbWVKCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMTEKICAgIC8vIGJhc2VfYXBwID0gYXJjNC5hcmM0X2NyZWF0ZShBaXJkcm9wLCBjb21waWxlZD1jb21waWxlZCkuY3JlYXRlZF9hcHAKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMTIKICAgIC8vIGFyYzQuZW1pdChGYWN0b3J5Q3JlYXRlZChhcmM0LlVJbnQ2NChiYXNlX2FwcC5pZCkpKQogICAgZHVwCiAgICBpdG9iCiAgICBtZXRob2QgIkZhY3RvcnlDcmVhdGVkKHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzEzLTEzMjgKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGVtaXQgVGVtcGxhdGUKICAgIC8vICAgICBBaXJkcm9wLnRlbXBsYXRlLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9TRUNPTkRTIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1FU1NFTkdFUl9JRCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fQ09VTlQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgcGVyaW9kCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGRlYWRsaW5lCiAgICAvLyAgICAgaW5pdGlhbCwgICMgdG90YWwKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZnVuZGluZwogICAgLy8gICAgIEdsb2JhbC56ZXJvX2FkZHJlc3MsICMgZGVsZWdhdGUKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMTUKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIGludCBUTVBMX1BFUklPRF9MSU1JVAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzE2CiAgICAvLyBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICBpbnQgMAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzE3CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICBpbnQgVE1QTF9MT0NLVVBfREVMQVkKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMxOAogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9QRVJJT0RfU0VDT05EUwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzE5CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICBpbnQgVE1QTF9NRVNTRU5HRVJfSUQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyMAogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgaW50IFRNUExfRElTVFJJQlVUSU9OX0NPVU5UCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMjEKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgaW50IFRNUExfRElTVFJJQlVUSU9OX1NFQ09ORFMKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyMwogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGRlYWRsaW5lCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMjQKICAgIC8vIGluaXRpYWwsICAjIHRvdGFsCiAgICBkaWcgOQogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzI1CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZnVuZGluZwogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzI2CiAgICAvLyBHbG9iYWwuemVyb19hZGRyZXNzLCAjIGRlbGVnYXRlCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIHN3YXAKICAgIGRpZyAxMQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMTMtMTMyOAogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBUZW1wbGF0ZQogICAgLy8gICAgIEFpcmRyb3AudGVtcGxhdGUsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHZlc3RpbmcgZGVsYXkKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9DT1VOVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyBwZXJpb2QKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZGVhZGxpbmUKICAgIC8vICAgICBpbml0aWFsLCAgIyB0b3RhbAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBmdW5kaW5nCiAgICAvLyAgICAgR2xvYmFsLnplcm9fYWRkcmVzcywgIyBkZWxlZ2F0ZQogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIG1ldGhvZCAidGVtcGxhdGUodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAxMAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyA5CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA4CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA3CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA2CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMjktMTMzMwogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgaW5oZXJpdCB1cGdyYWRlcgogICAgLy8gICAgIEFpcmRyb3AuZ3JhbnRfdXBncmFkZXIsCiAgICAvLyAgICAgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMzEKICAgIC8vIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyOS0xMzMzCiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgQWlyZHJvcC5ncmFudF91cGdyYWRlciwKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIG1ldGhvZCAiZ3JhbnRfdXBncmFkZXIoYWRkcmVzcyl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzM0LTEzMzYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9aW5pdGlhbCArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzNQogICAgLy8gcmVjZWl2ZXI9YmFzZV9hcHAuYWRkcmVzcywgYW1vdW50PWluaXRpYWwgKyBvcC5HbG9iYWwubWluX2JhbGFuY2UsIGZlZT0wCiAgICBkaWcgMQogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIHVuY292ZXIgNAogICAgKwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzNAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzM1CiAgICAvLyByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9aW5pdGlhbCArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzM0LTEzMzYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9aW5pdGlhbCArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMzctMTM0NAogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBTZXR1cChUeG4uc2VuZGVyLCBvd25lciwgVHhuLnNlbmRlciwgaW5pdGlhbCkKICAgIC8vICAgICBBaXJkcm9wLnNldHVwLAogICAgLy8gICAgIFR4bi5zZW5kZXIsICAjIGRlcGxveWVyCiAgICAvLyAgICAgb3duZXIsICAjIG93bmVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZnVuZGVyCiAgICAvLyAgICAgaW5pdGlhbCwgICMgaW5pdGlhbAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTM0MQogICAgLy8gVHhuLnNlbmRlciwgICMgZnVuZGVyCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMzkKICAgIC8vIFR4bi5zZW5kZXIsICAjIGRlcGxveWVyCiAgICBkdXAKICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzNy0xMzQ0CiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFNldHVwKFR4bi5zZW5kZXIsIG93bmVyLCBUeG4uc2VuZGVyLCBpbml0aWFsKQogICAgLy8gICAgIEFpcmRyb3Auc2V0dXAsCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIC8vICAgICBvd25lciwgICMgb3duZXIKICAgIC8vICAgICBUeG4uc2VuZGVyLCAgIyBmdW5kZXIKICAgIC8vICAgICBpbml0aWFsLCAgIyBpbml0aWFsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJzZXR1cChhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzQ1LTEzNDkKICAgIC8vICMgdmVzdGluZwogICAgLy8gIyAgIHdpdGhkcmF3LCBwYXJ0aWNpcGF0ZQogICAgLy8gIyBjbG9zZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHJldHVybiBiYXNlX2FwcC5pZAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LmdldF9pbml0aWFsX3BheW1lbnQoKSAtPiB1aW50NjQ6CmdldF9pbml0aWFsX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwODMtMTA4NAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfaW5pdGlhbF9wYXltZW50KHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDg4CiAgICAvLyBwYXltZW50X2Ftb3VudCA9IHJlcXVpcmVfcGF5bWVudChUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiByZXF1aXJlX3BheW1lbnQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5MAogICAgLy8gbWluX2JhbGFuY2UgPSBvcC5HbG9iYWwubWluX2JhbGFuY2UgICMgMTAwMDAwCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDg5CiAgICAvLyBtYnJfaW5jcmVhc2UgPSBVSW50NjQoMTIzNDUwMCkKICAgIGludCAxMjM0NTAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwOTIKICAgIC8vIHBheW1lbnRfYW1vdW50ID49IG1icl9pbmNyZWFzZSArIG1pbl9iYWxhbmNlCiAgICBkaWcgMQogICAgKwogICAgZGlnIDIKICAgIDw9CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwOTEtMTA5MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50X2Ftb3VudCA+PSBtYnJfaW5jcmVhc2UgKyBtaW5fYmFsYW5jZQogICAgLy8gKSwgInBheW1lbnQgYW1vdW50IGFjY3VyYXRlIiAgIyAxMjM0NTAwICsgMTAwMDAwID0gMTMzNDUwMAogICAgYXNzZXJ0IC8vIHBheW1lbnQgYW1vdW50IGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIGluaXRpYWwgPSBwYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSAtIG1pbl9iYWxhbmNlCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwODkKICAgIC8vIG1icl9pbmNyZWFzZSA9IFVJbnQ2NCgxMjM0NTAwKQogICAgaW50IDEyMzQ1MDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5NAogICAgLy8gaW5pdGlhbCA9IHBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlIC0gbWluX2JhbGFuY2UKICAgIC0KICAgIHN3YXAKICAgIC0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5NQogICAgLy8gcmV0dXJuIGluaXRpYWwKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5yZXF1aXJlX3BheW1lbnQod2hvOiBieXRlcykgLT4gdWludDY0OgpyZXF1aXJlX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE1LTIzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiByZXF1aXJlX3BheW1lbnQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2hlY2sgcGF5bWVudAogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9wYXltZW50KHdobzogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI0CiAgICAvLyByZWZfZ3JvdXBfaW5kZXggPSBUeG4uZ3JvdXBfaW5kZXgKICAgIHR4biBHcm91cEluZGV4CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI1CiAgICAvLyBhc3NlcnQgcmVmX2dyb3VwX2luZGV4ID4gMCwgImdyb3VwIGluZGV4IGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZHVwCiAgICBhc3NlcnQgLy8gZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjYKICAgIC8vIHBheW1lbnRfZ3JvdXBfaW5kZXggPSByZWZfZ3JvdXBfaW5kZXggLSAxCiAgICBpbnQgMQogICAgLQogICAgLy8gc3JjL3NyYy91dGlscy5weToyOAogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuc2VuZGVyID09IHdobwogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgZHVwCiAgICBndHhucyBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjctMjkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuc2VuZGVyID09IHdobwogICAgLy8gKSwgInBheW1lbnQgc2VuZGVyIGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgc2VuZGVyIGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMxCiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy91dGlscy5weTozMgogICAgLy8gPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzEtMzIKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weTozMC0zMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgLy8gICAgID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJwYXltZW50IHJlY2VpdmVyIGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzQKICAgIC8vIHJldHVybiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5hbW91bnQKICAgIGd0eG5zIEFtb3VudAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLnNldF92ZXJzaW9uKGNvbnRyYWN0X3ZlcnNpb246IGJ5dGVzLCBkZXBsb3ltZW50X3ZlcnNpb246IGJ5dGVzKSAtPiB2b2lkOgpzZXRfdmVyc2lvbjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3LTQ2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X3ZlcnNpb24oCiAgICAvLyAgICAgc2VsZiwgY29udHJhY3RfdmVyc2lvbjogYXJjNC5VSW50NjQsIGRlcGxveW1lbnRfdmVyc2lvbjogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjIKICAgIC8vIGFyYzQuZW1pdChWZXJzaW9uVXBkYXRlZChjb250cmFjdF92ZXJzaW9uLCBkZXBsb3ltZW50X3ZlcnNpb24pKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJWZXJzaW9uVXBkYXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDUKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJjb250cmFjdF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjMKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjQKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjQKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5hcHByb3ZlX3VwZGF0ZShhcHByb3ZhbDogYnl0ZXMpIC0+IHZvaWQ6CmFwcHJvdmVfdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzUtNDc2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBhcHByb3ZlX3VwZGF0ZShzZWxmLCBhcHByb3ZhbDogYXJjNC5Cb29sKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVXBkYXRlQXBwcm92ZWQoYWRkcmVzcyxib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGdldGJpdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDcKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmdyYW50X3VwZ3JhZGVyKHVwZ3JhZGVyOiBieXRlcykgLT4gdm9pZDoKZ3JhbnRfdXBncmFkZXI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MS00ODIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGdyYW50X3VwZ3JhZGVyKHNlbGYsIHVwZ3JhZGVyOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAibXVzdCBiZSBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgY3JlYXRvcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODQKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODQKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGdyYWRlckdyYW50ZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gc2VsZi51cGdyYWRlciA9IHVwZ3JhZGVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLm9uX3VwZGF0ZSgpIC0+IHZvaWQ6Cm9uX3VwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY2LTQ2NwogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjgtNDcxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgV0FSTklORzogVGhpcyBhcHAgY2FuIGJlIHVwZGF0ZWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjgtNDcxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgV0FSTklORzogVGhpcyBhcHAgY2FuIGJlIHVwZGF0ZWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDcyCiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA3CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDcyCiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZGF0YWJsZSBleGlzdHMKICAgIGludCAxCiAgICA9PQogICAgYXNzZXJ0IC8vIG5vdCBhcHByb3ZlZAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkNvbXBlbnNhdGlvbkZhY3RvcnkuX19pbml0X18oKSAtPiB2b2lkOgpfX2luaXRfXzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI3OAogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6ICAjIHByYWdtYTogbm8gY292ZXIKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjgyCiAgICAvLyBzdXBlcigpLl9faW5pdF9fKCkKICAgIGNhbGxzdWIgQmFzZUZhY3RvcnkuX19pbml0X18KICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5fX2luaXRfXygpIC0+IHZvaWQ6CkJhc2VGYWN0b3J5Ll9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDY3CiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzEtMTA3MgogICAgLy8gIyB1cGdyYWRlYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3MwogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzQKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgaW50IDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzUKICAgIC8vIHNlbGYudXBncmFkZXIgPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQ29tcGVuc2F0aW9uRmFjdG9yeS5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjc3CiAgICAvLyBjbGFzcyBDb21wZW5zYXRpb25GYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIGludCAxCiAgICByZXR1cm4K"
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQ29tcGVuc2F0aW9uRmFjdG9yeS5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDIKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDE1CiAgICBtZXRob2QgInNoYXJlX3BhcmFtcygpdm9pZCIKICAgIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3MpdWludDY0IgogICAgbWV0aG9kICJjcmVhdGVfbWFueSgoYWRkcmVzcyx1aW50NjQpW10pdWludDY0W10iCiAgICBtZXRob2QgImVuYWJsZV9yZWdpc3RyeSgpdm9pZCIKICAgIG1ldGhvZCAiZ2V0X2NoaWxkcmVuKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkodWludDY0LCh1aW50NjQsYWRkcmVzcyx1aW50NjQpW10pIgogICAgbWV0aG9kICJzZXRfdmVyc2lvbih1aW50NjQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgImFwcHJvdmVfdXBkYXRlKGJvb2wpdm9pZCIKICAgIG1ldGhvZCAiZ3JhbnRfdXBncmFkZXIoYWRkcmVzcyl2b2lkIgogICAgbWV0aG9kICJ0cmFuc2ZlcihhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3NoYXJlX3BhcmFtc19yb3V0ZUA0IG1haW5fY3JlYXRlX3JvdXRlQDUgbWFpbl9jcmVhdGVfbWFueV9yb3V0ZUA2IG1haW5fZW5hYmxlX3JlZ2lzdHJ5X3JvdXRlQDcgbWFpbl9nZXRfY2hpbGRyZW5fcm91dGVAOCBtYWluX3NldF92ZXJzaW9uX3JvdXRlQDkgbWFpbl9hcHByb3ZlX3VwZGF0ZV9yb3V0ZUAxMCBtYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDExIG1haW5fdHJhbnNmZXJfcm91dGVAMTIKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fc2hhcmVfcGFyYW1zX3JvdXRlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBzaGFyZV9wYXJhbXMKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3JvdXRlQDU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTQyCiAgICAvLyBjbGFzcyBDb21wZW5zYXRpb25GYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE2NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNyZWF0ZQogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbWFueV9yb3V0ZUA2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE0MgogICAgLy8gY2xhc3MgQ29tcGVuc2F0aW9uRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxOTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjcmVhdGVfbWFueQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9lbmFibGVfcmVnaXN0cnlfcm91dGVANzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGVuYWJsZV9yZWdpc3RyeQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2hpbGRyZW5fcm91dGVAODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDIKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2NoaWxkcmVuCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlIDB4MDAwYQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X3ZlcnNpb25fcm91dGVAOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE0MgogICAgLy8gY2xhc3MgQ29tcGVuc2F0aW9uRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF92ZXJzaW9uCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfdXBkYXRlX3JvdXRlQDEwOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTQyCiAgICAvLyBjbGFzcyBDb21wZW5zYXRpb25GYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgYXBwcm92ZV91cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZ3JhbnRfdXBncmFkZXJfcm91dGVAMTE6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDIKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBncmFudF91cGdyYWRlcgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl90cmFuc2Zlcl9yb3V0ZUAxMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDIKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgaW50IDAKICAgIGludCA0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBtYXRjaCBtYWluX2NyZWF0ZUAxNiBtYWluX29uX3VwZGF0ZUAxNwogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9jcmVhdGVAMTY6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDIKICAgIC8vIGNsYXNzIENvbXBlbnNhdGlvbkZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9vbl91cGRhdGVAMTc6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzOS01NDAKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgb25fdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBjYWxsc3ViIG9uX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNyYy5jb250cmFjdC5Db21wZW5zYXRpb25GYWN0b3J5LnNoYXJlX3BhcmFtcygpIC0+IHZvaWQ6CnNoYXJlX3BhcmFtczoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE0OS0yMTUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzaGFyZV9wYXJhbXMoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTU3CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICBpbnQgVE1QTF9QRVJJT0RfTElNSVQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE1OAogICAgLy8gYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgdmVzdGluZyBkZWxheQogICAgaW50IDAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE1OQogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikpLAogICAgaW50IFRNUExfTE9DS1VQX0RFTEFZCiAgICBpdG9iCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNjAKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9TRUNPTkRTIikpLAogICAgaW50IFRNUExfUEVSSU9EX1NFQ09ORFMKICAgIGl0b2IKICAgIGNvdmVyIDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE2MQogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgaW50IFRNUExfRElTVFJJQlVUSU9OX0NPVU5UCiAgICBpdG9iCiAgICBjb3ZlciA0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNjIKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgaW50IFRNUExfRElTVFJJQlVUSU9OX1NFQ09ORFMKICAgIGl0b2IKICAgIGNvdmVyIDUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE1Ni0yMTYzCiAgICAvLyBQYXJhbXMoCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHZlc3RpbmcgZGVsYXkKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgLy8gKSwKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE2NAogICAgLy8gVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIiksCiAgICBpbnQgVE1QTF9NRVNTRU5HRVJfSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE1NS0yMTY1CiAgICAvLyBzZWxmLnNoYXJlKAogICAgLy8gICAgIFBhcmFtcygKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9DT1VOVCIpKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSwKICAgIC8vICkKICAgIGNhbGxzdWIgc2hhcmUKICAgIHBvcAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LnNoYXJlKHBhcmFtczogYnl0ZXMsIG1lc3Nlbmdlcl9pZDogdWludDY0KSAtPiBieXRlczoKc2hhcmU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MjMtMTcyNAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBzaGFyZShzZWxmLCBwYXJhbXM6IFBhcmFtcywgbWVzc2VuZ2VyX2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTczMgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzMyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzMzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGFyYW1zLm1heWJlKClbMV0sICJwYXJhbXMgbm90IHNoYXJlZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MTAtMTcxMQogICAgLy8gIyBzaGFyZWQgdGVtcGxhdGUgc3RhdGUKICAgIC8vIHNlbGYucGFyYW1zID0gR2xvYmFsU3RhdGUoUGFyYW1zKQogICAgYnl0ZSAicGFyYW1zIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzMzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGFyYW1zLm1heWJlKClbMV0sICJwYXJhbXMgbm90IHNoYXJlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBwYXJhbXMgbm90IHNoYXJlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzM1CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MzQtMTczNgogICAgLy8gbnVtX3VpbnQsIF9leGlzdHMgPSBvcC5BcHBQYXJhbXNHZXQuYXBwX2dsb2JhbF9udW1fdWludCgKICAgIC8vICAgICBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZAogICAgLy8gKQogICAgYXBwX3BhcmFtc19nZXQgQXBwR2xvYmFsTnVtVWludAogICAgcG9wCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MzgKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTczNy0xNzM5CiAgICAvLyBudW1fYnl0ZV9zbGljZSwgX2V4aXN0cyA9IG9wLkFwcFBhcmFtc0dldC5hcHBfZ2xvYmFsX251bV9ieXRlX3NsaWNlKAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkCiAgICAvLyApCiAgICBhcHBfcGFyYW1zX2dldCBBcHBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIHBvcAogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzQwCiAgICAvLyBhc3NlcnQgbnVtX3VpbnQgPiAzIGFuZCBudW1fYnl0ZV9zbGljZSA+IDIsICJzY2hlbWEgaGFzIHJvb20gZm9yIHBhcmFtcyIKICAgIGludCAzCiAgICA+CiAgICBieiBzaGFyZV9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAwCiAgICBpbnQgMgogICAgPgogICAgYnogc2hhcmVfYm9vbF9mYWxzZUAzCiAgICBpbnQgMQogICAgYiBzaGFyZV9ib29sX21lcmdlQDQKCnNoYXJlX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpzaGFyZV9ib29sX21lcmdlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NDAKICAgIC8vIGFzc2VydCBudW1fdWludCA+IDMgYW5kIG51bV9ieXRlX3NsaWNlID4gMiwgInNjaGVtYSBoYXMgcm9vbSBmb3IgcGFyYW1zIgogICAgYXNzZXJ0IC8vIHNjaGVtYSBoYXMgcm9vbSBmb3IgcGFyYW1zCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NDEKICAgIC8vIGFyYzQuZW1pdChQYXJhbXNTaGFyZWQocGFyYW1zLCBhcmM0LlVJbnQ2NChtZXNzZW5nZXJfaWQpKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIG1ldGhvZCAiUGFyYW1zU2hhcmVkKCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCksdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MTAtMTcxMQogICAgLy8gIyBzaGFyZWQgdGVtcGxhdGUgc3RhdGUKICAgIC8vIHNlbGYucGFyYW1zID0gR2xvYmFsU3RhdGUoUGFyYW1zKQogICAgYnl0ZSAicGFyYW1zIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzQyCiAgICAvLyBzZWxmLnBhcmFtcy52YWx1ZSA9IHBhcmFtcy5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMgogICAgLy8gc2VsZi5tZXNzZW5nZXJfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQpCiAgICBieXRlICJtZXNzZW5nZXJfaWQiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NDMKICAgIC8vIHNlbGYubWVzc2VuZ2VyX2lkLnZhbHVlID0gbWVzc2VuZ2VyX2lkCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5Db21wZW5zYXRpb25GYWN0b3J5LmNyZWF0ZShvd25lcjogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTY3LTIxNzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNyZWF0ZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG93bmVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTgyLTIxODMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxODQtMjE4NQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBiYXNlX2FwcCwgbWJyX2luY3JlYXNlID0gc2VsZi5jcmVhdGVfY2hpbGQob3duZXIsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkKICAgIGZyYW1lX2RpZyAtMQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiBjcmVhdGVfY2hpbGQKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE4OAogICAgLy8gcGF5bWVudF9hbW91bnQgPj0gbWJyX2luY3JlYXNlICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlCiAgICBkdXAKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICArCiAgICBkaWcgMgogICAgPD0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE4Ni0yMTg5CiAgICAvLyAjIHN1cnBsdXMgaXMgdGhlIGluaXRpYWwgYmFsYW5jZSBvZiB0aGUgY2hpbGQsIG5vdCByZWZ1bmRlZAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50X2Ftb3VudCA+PSBtYnJfaW5jcmVhc2UgKyBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIC8vICksICJwYXltZW50IGFtb3VudCBhY2N1cmF0ZSIKICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3VudCBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTkwCiAgICAvLyBpbml0aWFsID0gcGF5bWVudF9hbW91bnQgLSBtYnJfaW5jcmVhc2UgLSBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIC0KICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAtCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxOTEKICAgIC8vIHNlbGYuaW5pdF9jb21wZW5zYXRpb24oYmFzZV9hcHAsIG93bmVyLCBpbml0aWFsKQogICAgZGlnIDEKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGluaXRfY29tcGVuc2F0aW9uCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxOTIKICAgIC8vIHJldHVybiBiYXNlX2FwcC5pZAogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLnJlcXVpcmVfcGF5bWVudCh3aG86IGJ5dGVzKSAtPiB1aW50NjQ6CnJlcXVpcmVfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYtMjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHJlcXVpcmVfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayBwYXltZW50CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZXF1aXJlX3BheW1lbnQod2hvOiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjUKICAgIC8vIHJlZl9ncm91cF9pbmRleCA9IFR4bi5ncm91cF9pbmRleAogICAgdHhuIEdyb3VwSW5kZXgKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjYKICAgIC8vIGFzc2VydCByZWZfZ3JvdXBfaW5kZXggPiAwLCAiZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBncm91cCBpbmRleCBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc3JjL3NyYy91dGlscy5weToyNwogICAgLy8gcGF5bWVudF9ncm91cF9pbmRleCA9IHJlZl9ncm91cF9pbmRleCAtIDEKICAgIGludCAxCiAgICAtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI5CiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToyOC0zMAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICAvLyApLCAicGF5bWVudCBzZW5kZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCBzZW5kZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzIKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMzCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc3JjL3NyYy91dGlscy5weTozMi0zMwogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIC8vID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMxLTM0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyAgICAgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgInBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy91dGlscy5weTozNQogICAgLy8gcmV0dXJuIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLmFtb3VudAogICAgZ3R4bnMgQW1vdW50CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkuY3JlYXRlX2NoaWxkKG93bmVyOiBieXRlcywgZnVuZGVyOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CmNyZWF0ZV9jaGlsZDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc4OS0xNzkyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNyZWF0ZV9jaGlsZCgKICAgIC8vICAgICBzZWxmLCBvd25lcjogYXJjNC5BZGRyZXNzLCBmdW5kZXI6IGFyYzQuQWRkcmVzcwogICAgLy8gKSAtPiB0dXBsZVtBcHBsaWNhdGlvbiwgVUludDY0XToKICAgIHByb3RvIDIgMgogICAgYnl0ZSAiIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODAxCiAgICAvLyBtaW5fYmFsYW5jZSA9IGdldF9taW5fYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODAyCiAgICAvLyBzaGFyZWQgPSBzZWxmLnBhcmFtcy5tYXliZSgpWzFdCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzEwLTE3MTEKICAgIC8vICMgc2hhcmVkIHRlbXBsYXRlIHN0YXRlCiAgICAvLyBzZWxmLnBhcmFtcyA9IEdsb2JhbFN0YXRlKFBhcmFtcykKICAgIGJ5dGUgInBhcmFtcyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwMgogICAgLy8gc2hhcmVkID0gc2VsZi5wYXJhbXMubWF5YmUoKVsxXQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGJ1cnkgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODAzCiAgICAvLyBpZiBzaGFyZWQ6CiAgICBieiBjcmVhdGVfY2hpbGRfZWxzZV9ib2R5QDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwNQogICAgLy8gQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zLCBnbG9iYWxfYnl0ZXM9NQogICAgaW50IDUKICAgIGIgY3JlYXRlX2NoaWxkX2FmdGVyX2lmX2Vsc2VAMwoKY3JlYXRlX2NoaWxkX2Vsc2VfYm9keUAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODA4CiAgICAvLyBjb21waWxlZCA9IGNvbXBpbGVfY29udHJhY3QoQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zKSAjIG1heCBleHRyYSBwYWdlcwogICAgaW50IDYKCmNyZWF0ZV9jaGlsZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDkKICAgIC8vIGJhc2VfYXBwID0gYXJjNC5hcmM0X2NyZWF0ZShBaXJkcm9wLCBjb21waWxlZD1jb21waWxlZCkuY3JlYXRlZF9hcHAKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwNC0xODA2CiAgICAvLyBjb21waWxlZCA9IGNvbXBpbGVfY29udHJhY3QoCiAgICAvLyAgICAgQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zLCBnbG9iYWxfYnl0ZXM9NQogICAgLy8gKSAgIyB3aXRob3V0IHBhcmFtcwogICAgaW50IDEyCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bVVpbnQKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDUKICAgIC8vIEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MywgZ2xvYmFsX2J5dGVzPTUKICAgIGludCAzCiAgICBpdHhuX2ZpZWxkIEV4dHJhUHJvZ3JhbVBhZ2VzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDQtMTgwNgogICAgLy8gY29tcGlsZWQgPSBjb21waWxlX2NvbnRyYWN0KAogICAgLy8gICAgIEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MywgZ2xvYmFsX2J5dGVzPTUKICAgIC8vICkgICMgd2l0aG91dCBwYXJhbXMKICAgIGJ5dGUgYmFzZTY0IENvRUJRdz09CiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGJ5dGUgYmFzZTY0IENpQUVBQUVGQWlZYkIyWjFibVJwYm1jRmRHOTBZV3dGYjNkdVpYSUdablZ1WkdWeUJuQmxjbWx2WkFoa1pXeGxaMkYwWlFoa1pXRmtiR2x1WlFoMWNHZHlZV1JsY2dad1lYSmhiWE1NYldWemMyVnVaMlZ5WDJsa0NYQmhjbVZ1ZEY5cFpBUVZIM3gxQUFsMWNHUmhkR0ZpYkdVTVpuVnNiSGxmZG1WemRHVmtDQUFBQUFBQUFBQUFDR1JsY0d4dmVXVnlCMmx1YVhScFlXd1FZMjl1ZEhKaFkzUmZkbVZ5YzJsdmJoSmtaWEJzYjNsdFpXNTBYM1psY25OcGIyNEVTQWdRN2dTbWdzQWJCSThsUnZBTWNHVnlhVzlrWDJ4cGJXbDBBUUFKYzNSaGEyVmhZbXhsSUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFNUmhBQUFPSURXd3hHMEVDNzRJWkJDOXVRUDRFQ3V2RDJ3UXdPUk5vQkhWVXcyTUVZT2tqQ2dSU0pSaXRCS0RvR0hJRXU5RHkrQVJuRlVQNUJHZ083VUFFTVNGQmRnU0VNSW55QkpoYVJaOEUyMFlDbndTV1ZnUjZCSzM1S3VRRVhOUDNpZ1RxczVGSUJLbGhYTmNFWDM2aVNBVE5KTjZJQk5XRjFhQUVlTHlaMUFSckM0LzRCTlNXdjBNMkdnQ09HUUFCQURFQVRBQ1VBTDRBendEY0FPa0JBUUVRQVI4Qk5BRktBVjhCZUFHRkFaUUJvQUd2QWI0QnpRSHJBZ2tDR3dJcUFERVpGRVF4R0VRMkdnRTJHZ0kyR2dNMkdnUTJHZ1UyR2dZMkdnYzJHZ2cyR2drMkdnbzJHZ3MyR2d5SUFpY2pRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dXSUF3TWpRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dVMkdnWTJHZ2MyR2dnMkdnazJHZ28yR2dzMkdndzJHZzAyR2c0MkdnOVhBQ0EyR2c5WElDQTJHZzlYUUFpSUJCMGpRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dVMkdnWTJHZ2MyR2dnMkdnazJHZ3FJQklRalF6RVpGRVF4R0VTSUJKa25DMHhRc0NORE1Sa2tFa1F4R0VTSUJsa2pRekVaSkJKRU1SaEVpQWIvSTBNeEdSUkVNUmhFTmhvQk5ob0NOaG9ETmhvRWlBUC9JME14R1JSRU1SaEVOaG9CaUFjREkwTXhHUlJFTVJoRU5ob0JpQWM0STBNeEdSUkVNUmhFTmhvQmlBZHFGaWNMVEZDd0kwTXhHUlJFTVJoRWlBZmNUQlpNRmxBbkMweFFzQ05ETVJrVVJERVlSRFlhQVlnSUtSWW5DMHhRc0NORE1Sa1VSREVZUkRZYUFZZ0lRa3dXVEJaUUp3dE1VTEFqUXpFWkpCSkVNUmhFaUFqRUkwTXhHUlJFTVJoRU5ob0JpQWp3STBNeEdSUkVNUmhFaUFrRUkwTXhHUlJFTVJoRU5ob0JpQWxFSTBNeEdSUkVNUmhFTmhvQmlBbFZJME14R1JSRU1SaEVOaG9CaUFsN0kwTXhHUlJFTVJoRU5ob0JOaG9DTmhvRE5ob0VOaG9GTmhvR2lBbVBJME14R1JSRU1SaEVOaG9CTmhvQ05ob0ROaG9FTmhvRk5ob0dpQW4vSTBNeEdSUkVNUmhFTmhvQk5ob0NpQW9xSTBNeEdSUkVNUmhFTmhvQmlBcEVJME14R1JSRU1SaEVOaG9CaUFLbkkwTWlnUVF4R1k0Q0FBRUFDZ0F4R0JSRWlBcEVJME14R0VTSUNrZ2pRNG9NQURFQU1na1NSQ0luQ0dWRkFSUkVJaWNKWlVRVVJDSVdpL3BMQWFWRWkvbWtSQ0luQkdWRUZFUWlKd1psUkJSRUlpbGxSQlJFSWlobFJCUkVJaWNGWlVReUF4SkVpL1NMOVZDTDlsQ0w5MUJKaS9oUWkvbFFpL3BRaS90UWkveFFpLzFRaS81UWkvOVFKeFpNVUxDTCtWQ0wrbEFuQ0V4bmkvZ1hKd2xNWjR2N0Z5Y0VUR2VML0JjbkJreG5pLzBYS1V4bmkvNFhLRXhuSndXTC8yY2lLR1ZFUVFBSklpY0laVVNJQUFKSWlZb0JBU0luRG1WRkFVRUFJb3YvVndnSUY0di9WeGdJRjR2L1Z4QUlGeUluQkdWRUlpaGxSSWdBQnljT1RHZUwvNG1LQlFHTC9ZditDNHY4QzR2N2kvd0xpLzhJQ0ltS0JRQXhBRElKRWtRaUp3aGxSUUVVUkNJbkJHVkVGRVFpSndabFJCUkVJaWxsUkJSRUlpaGxSQlJFSWljRlpVUXlBeEpFaUFDSlJ3SlhLQWhKSncrbFJFc0JWeUFJU1NjUHBVUWlKd3BsUkNjSlpVUkxBMWNBQ0V4TEJGY0lDRXhMQlZjUUNFNENUd1pYR0FoT0F4Wk9CRThEVEZCTVVFeFFURkJNVUV4UWkvdFFpL3hRaS8xUWkvNVFpLzlRSnhaTVVMQ0wreGNuQkV4bmkvd1hKd1pNWjR2OUZ5bE1aNHYrRnloTVp5Y0ZpLzluSWlobFJFRUFCb3NBaVA3OFNJbUtBQUV5Q0NjSVpVRUFCSXNBVEltSUFJVkJBSGNuRjJRV2dBMTJaWE4wYVc1blgyUmxiR0Y1WkJhQURHeHZZMnQxY0Y5a1pXeGhlV1FXZ0E1d1pYSnBiMlJmYzJWamIyNWtjMlFXZ0JKa2FYTjBjbWxpZFhScGIyNWZZMjkxYm5Sa0ZvQVVaR2x6ZEhKcFluVjBhVzl1WDNObFkyOXVaSE5rRms4RlR3VlFUd1JRVHdOUVR3SlFURkJNaVNJbkNtVkVKd2hsUkV5SmlnQUJNZ2duRjJWRkFZbUtFUUNMNzR2d2kvR0w4b3Z6aS9TTDlZdjJpL2VMK0l2NWkvcUkvWW1MKzRnQURJdjhpLzJML292L2lBQWhpWW9CQURFQU1na1NSQ0luQjJWRWkvOVFnQVN0OWVLNFRGQ3dKd2VMLzJlSmlnUUFJaXBsUkRJREVrUWlLMlZFTWdNU1JERUFNZ2tTUkl2OGkvMVFpLzVRaS85UWdBU2RuRzhMVEZDd0p4Q0wvR2NxaS8xbks0ditaNHYvRnljUlRHZUppZ29BaS9hTDk0djRpL21MK29qOS9ZdjdpUCtKaS95TC9ZditpLytJLzU2SmlnQUJKd3lJL3FRaUp3bGxURWxQQWtRaUp3aGxSUUZBQUJXSS95YUxBb3dEUUFBTElpY0taVVFuQ1dWSWpBT0xBNHdDSW93QUlpaGxSRUVBRDRzQmlBRDdqQUdNQUlnQkxVSUFCQ0lwWlVRaUttVkVJaXRsUkNJbkJXVkVJaWNRWlVRaUp3ZGxSQ0luQ21WRUZvc0NGa3lMQVVsWEFBaE9BMGxYQ0FoT0JFbFhFQWhPQlVsWEdBaE9Ca2xYSUFoT0IxY29DRTRISWljRVpVUVdUZ0lpSndabFJCWWlLV1ZFRmlJb1pVUVdJaWNSWlVRV2l3QVdUQ0luRW1WRUZpSW5FMlZFRmlJbkRXVkVKeGdpVHdKVUlpY1paVVFuR0NKUEFsUXlDbUFXVEU4WUZrNENpQURoRms0Q1R4bFBHVkJQR0ZCUEYxQlBGbEJQRFZCUERWQlBEbEJQRGxCUERsQlBEbEJQRGxCUERsQlBEVkJQREZCUEMxQlBDbEJQQ0ZCUENGQlBCMUJQQmxCUEJWQk1JbE9CZ1JKTVZFeFFUd0pRVEZDTUFJbUtBUUlpSnc1bFFRQU1pd0JCQUFlTEFJdi9Ud0tKaS85WENBZ1hpLzlYR0FnWGkvOVhFQWdYSWljRVpVUWlLR1ZFaVB4bWkvOVBBb21LQUFFeUI0ajlMb2ovdkNJcFpVeE9Ba1JKVnlBSUYweFhLQWdYaUFBQmlZb0ZBU2NNaS91TC9BNUJBQVNML1V5SmkvdUwvQW1ML3dwSmpBQ0wvZzVCQUEyTC9vc0FDWXY5QzR2K0NreUpJa3lKaWdBQk1ncGdNZ0VKaVlvQUFERUFJaXRsUkJKQUFBb3hBQ0lxWlVRU1FRQUVJMElBQVNKRUlpaGxSQlJFTVFBaUttVkVVQ2NVVEZDd0lpcGxSSWdBQVltS0FRQXhHU1FTUkRJSk1nR3hnRUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBc2o4aXNnNGlzZzBpc2d3bkdySUxKeHF5Q2lPeU9TV3lFQ0t5QWJheUNJdi9zZ215QnlPeUVDS3lBYk9KaWdBQU1RQWlKd2RsUkJKRUlpY05aVVFqRWtRaUp3ZGxSQ0lyWlVSUUp4Uk1VTEFpSzJWRWlQOWFpWW9CQUNJb1pVUVVSQ0lwWlVRVVJERUFJaXBsUkJKRWlQdmlWd0FJaS8rblJDSW5CbVZFTWdjTlJDSW5CR1ZFRm92L1VJQUV0ajZYa2t4UXNJdi9GeWNFVEdlSmlnRUFNUUFpSzJWRUVrUWlLR1ZFUVFBS0lpaGxSRElIRFVFQUJDTkNBQUVpUkNJb1pVUVdpLzlRZ0FUUVhlNGNURkN3aS84WEtFeG5pUHQ4aVBwelNJbUtBUUVuREVjQ01RQWlLbVZFRWtRaUtHVkVRUUExaVA0b1NZd0FTUmFMLzFBbkZVeFFzSWorYW92L0YwbU1BUWtPUkl2L0p3K2xRUUFRc1RFQXNnZUxBYklJSTdJUUlySUJzNGtpS1dWTVNVNENqQUJFU1JhTC8xQW5GVXhRc0lqK01Zdi9GMG1NQWdrT1JJdi9KdytsUVFBUXNURUFzZ2VMQXJJSUk3SVFJcklCczRtS0FBSW5ERWNDTVFBaUttVkVFa1FpS0dWRVFRQUlpUDJrakFKQ0FBY2lLV1ZNakFKRWlQM25TWXdCSW93QWl3SU5RUUFIaXdHTEFnbU1BSXNDRm9zQVNVNENGbEFuRlV4UXNFRUFFTEV4QUxJSGl3Q3lDQ095RUNLeUFiT0xBSXNDakFHTUFJbUtBUUVpS0dWRVFBQUZJaWxsUkltSStudUwveGRNaVAwRklpbGxURTRDUkVsWElBZ1hURmNvQ0JlSS9VcUppZ0VDSnd4SEFpSW9aVVJBQUFvaUtXVkVJb3dBakFHSmlQcEVpUHpTVEVsT0Fvd0FpLzhYVENJcFpVeE9Ba1JKVnlBSUYwbE9Bb3dCVnlnSUYwbU1BazhEVGdTSUFDQkpRQUFHSW93QmpBQ0pJaWxsUkVzQml3QlBBb3NCaXdLSS9PZU1BWXdBaVlvRkFZdjdpL3lML1l2K2kvK0kvTkpKUUFBRElreUppd0NML2d1TC9RZ2pDWXY5Q292K0l3aE1DWXYvQzR2OENFeUppZ0FBSWlobFJFU0kvSVVVUkRFQUlpcGxSQkpBQUFveEFDSXJaVVFTUVFBRUkwSUFBU0pFTVFBaUttVkVVQ2NVVEZDd0lpcGxSSWo4NlltS0FRQXhBQ0lxWlVRU1JDSXFaVVNMLzFDQUJKb2lQdnRNVUxBcWkvOW5pWW9BQURFQUlpdGxSQkpFSWl0bFJJZ0FIU0lwWlVSTEFRaE1Ga3hKRms4Q1RGQ0FCTU1EcHJ4TVVMQXBUR2VKaWdFQk1SWkpSQ01KU1RnUUl4SkVTVGdBaS84U1JFazRCeklLRWtRNENJbUtBUUF4QUNJclpVUVNSQ0lyWlVTTC8xQ0FCRU9IMXNGTVVMQXJpLzluaVlvQkFERUFJaXRsUkJKRUlpaGxSQlJFSWlsbFJCYUwvNmRFSWlsbFJJdi9Gd2xKRm92L1RGQ0FCRTFJZ1E1TVVMQXBUR2VKaWdFQU1RQWlLbVZFRWtBQUNERUFNZ2tTUVFBRUkwSUFBU0pFSWljRlpVU0wvMUNBQkhobVZYZE1VTEFuQll2L1o0bUtCZ0F4QUNJcVpVUVNRQUFMTVFBaUp3VmxSQkpCQUFRalFnQUJJa1F5QURFQWlQODBTd0VTUkl2NmkvdUwvSXY5aS82TC8wOEdpQUFIalArTSs0ejZpWW9IQXpFQVNZdjVVSXY2VUl2N1VJdjhVSXY5VUl2K1VGQ0FCRzFFa0Q5TVVMQ3hpL3NYaS93WGkvMFhpLzZ5UDdJT3NnMnlESXY2c2d1TCtiSUtKYklRaS8reUFiT0wrWXY2aS82SmlnWUFNUUFpS21WRUVrQUFDekVBSWljRlpVUVNRUUFFSTBJQUFTSkVNUUV5QUNVTEQwU0wrb3Y3aS95TC9ZditpLzhpaVA5OWpQK00rNHo2aVlvQ0FERUFJaWNIWlVRU1JJditpLzlRZ0FTTWpQbk5URkN3aS80WEp4Sk1aNHYvRnljVFRHZUppZ0VBTVFBaUttVkVFa1FpS21WRWkvOVFnQVRDZVdXTFRGQ3dpLzhpVXljTlRHZUppZ0FBTWcxSlJDY0tUR2VKaWdBQU1RQWlKd2RsUkJKRUlpY05aVVFqRWtTSmlnQUFpQUJDSndvaVp5Y1FNZ05uSndVeUEyY25HU05uSnhJaVp5Y1RJbWNuRFNObkp3Y3lDV2NxTWdObkp3UWlaeWNSSW1jbkJpSm5LeklEWnlnaVp5a2laeWNKSW1lSmlnQUFLaklEWnljRUltY25FU0puSndZaVp5Y09JbWNyTWdObktDSm5LU0puSndvaVp5Y1FNZ05uSndraVo0az0KICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwOQogICAgLy8gYmFzZV9hcHAgPSBhcmM0LmFyYzRfY3JlYXRlKEFpcmRyb3AsIGNvbXBpbGVkPWNvbXBpbGVkKS5jcmVhdGVkX2FwcAogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTAKICAgIC8vIGFyYzQuZW1pdChGYWN0b3J5Q3JlYXRlZChhcmM0LlVJbnQ2NChiYXNlX2FwcC5pZCkpKQogICAgaXRvYgogICAgbWV0aG9kICJGYWN0b3J5Q3JlYXRlZCh1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMy0xNzE1CiAgICAvLyAjIHJlZ2lzdHJ5IHN0YXRlLCBpbiBib3hlcyBzbyBmYWN0b3JpZXMgdXBkYXRlZAogICAgLy8gIyAgIGluIHBsYWNlIGtlZXAgdGhlaXIgZ2xvYmFsIHNjaGVtYQogICAgLy8gc2VsZi5yZWdpc3RyeSA9IEJveChVSW50NjQsIGtleT1iInJlZ2lzdHJ5IikKICAgIGJ5dGUgMHg3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTEKICAgIC8vIGlmIHNlbGYucmVnaXN0cnk6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGNyZWF0ZV9jaGlsZF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgxMgogICAgLy8gc2VsZi5yZWdpc3RlcihiYXNlX2FwcC5pZCwgb3duZXIsIGZ1bmRlcikKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiByZWdpc3RlcgoKY3JlYXRlX2NoaWxkX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgxMwogICAgLy8gcmV0dXJuIGJhc2VfYXBwLCBnZXRfbWluX2JhbGFuY2UoKSAtIG1pbl9iYWxhbmNlCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgZnJhbWVfZGlnIDEKICAgIC0KICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLmdldF9taW5fYmFsYW5jZSgpIC0+IHVpbnQ2NDoKZ2V0X21pbl9iYWxhbmNlOgogICAgLy8gc3JjL3NyYy91dGlscy5weTo1MS01OAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X21pbl9iYWxhbmNlIChpbnRlcm5hbCkKICAgIC8vICMgcHVycG9zZTogZ2V0IG1pbiBiYWxhbmNlIG9mIGFwcCBhY2NvdW50LAogICAgLy8gIyAgIGdyb3dzIHdpdGggYXBwcyBjcmVhdGVkIGJ5IGl0CiAgICAvLyAjIHJldHVybnM6IGFwcCBtaW4gYmFsYW5jZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfbWluX2JhbGFuY2UoKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjAKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjU5LTYxCiAgICAvLyBtaW5fYmFsYW5jZSwgZXhpc3RzID0gb3AuQWNjdFBhcmFtc0dldC5hY2N0X21pbl9iYWxhbmNlKAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICkKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgcG9wCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjYyCiAgICAvLyByZXR1cm4gbWluX2JhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5yZWdpc3RlcihhcHBfaWQ6IHVpbnQ2NCwgb3duZXI6IGJ5dGVzLCBmdW5kZXI6IGJ5dGVzKSAtPiB2b2lkOgpyZWdpc3RlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc3Ni0xNzc5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlZ2lzdGVyKAogICAgLy8gICAgIHNlbGYsIGFwcF9pZDogVUludDY0LCBvd25lcjogYXJjNC5BZGRyZXNzLCBmdW5kZXI6IGFyYzQuQWRkcmVzcwogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3ODQKICAgIC8vIGIiYyIgKyBvd25lci5ieXRlcywKICAgIGJ5dGUgMHg2MwogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc4NQogICAgLy8gQ2hpbGRJbmZvKGFyYzQuVUludDY0KGFwcF9pZCksIGZ1bmRlciwgYXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSkuYnl0ZXMsCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgc3dhcAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzg2CiAgICAvLyBVSW50NjQoMjEpLAogICAgaW50IDIxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3ODMtMTc4NwogICAgLy8gYXBwZW5kX3BhZ2VkKAogICAgLy8gICAgIGIiYyIgKyBvd25lci5ieXRlcywKICAgIC8vICAgICBDaGlsZEluZm8oYXJjNC5VSW50NjQoYXBwX2lkKSwgZnVuZGVyLCBhcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpKS5ieXRlcywKICAgIC8vICAgICBVSW50NjQoMjEpLAogICAgLy8gKQogICAgY2FsbHN1YiBhcHBlbmRfcGFnZWQKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5hcHBlbmRfcGFnZWQoa2V5OiBieXRlcywgaXRlbTogYnl0ZXMsIHBhZ2Vfc2l6ZTogdWludDY0KSAtPiB2b2lkOgphcHBlbmRfcGFnZWQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjExMi0xMjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGFwcGVuZF9wYWdlZCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBrZXksIGxpc3Qga2V5LCBib3gga2V5IGhvbGRzIGl0ZW0gY291bnQsCiAgICAvLyAjICAgYm94IGtleSArIHBhZ2UgaW5kZXggaG9sZHMgcGFnZSBvZiBpdGVtcwogICAgLy8gIyAtIGl0ZW0sIGZpeGVkIHNpemUgaXRlbQogICAgLy8gIyAtIHBhZ2Vfc2l6ZSwgaXRlbXMgcGVyIHBhZ2UsIHBhZ2VzIGFyZQogICAgLy8gIyAgIGF0IG1vc3QgMUtCIHRvIGJlIHJlYWQgd2l0aCBvbmUgYm94IHJlZgogICAgLy8gIyBwdXJwb3NlOiBhcHBlbmQgaXRlbSB0byBsaXN0IGtlcHQgaW4gcGFnZXMKICAgIC8vICMgICB3cml0aW5nIG9ubHkgY291bnQgYW5kIGxhc3QgcGFnZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhcHBlbmRfcGFnZWQoa2V5OiBCeXRlcywgaXRlbTogQnl0ZXMsIHBhZ2Vfc2l6ZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICBieXRlICIiCiAgICBkdXAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI1CiAgICAvLyBjb3VudCA9IFVJbnQ2NCgwKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI2CiAgICAvLyBjb3VudF9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9nZXQKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI3CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBhcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEyOAogICAgLy8gY291bnQgPSBvcC5idG9pKGNvdW50X2J5dGVzKQogICAgZnJhbWVfZGlnIDMKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMgoKYXBwZW5kX3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI5CiAgICAvLyBwYWdlX2tleSA9IGtleSArIG9wLml0b2IoY291bnQgLy8gcGFnZV9zaXplKQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICAvCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzAKICAgIC8vIG9mZnNldCA9IChjb3VudCAlIHBhZ2Vfc2l6ZSkgKiBpdGVtLmxlbmd0aAogICAgZnJhbWVfZGlnIC0xCiAgICAlCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgICoKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzMQogICAgLy8gaWYgb2Zmc2V0ID09IDA6CiAgICBibnogYXBwZW5kX3BhZ2VkX2Vsc2VfYm9keUA0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzMgogICAgLy8gb3AuQm94LnB1dChwYWdlX2tleSwgaXRlbSkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X3B1dAogICAgYiBhcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA1CgphcHBlbmRfcGFnZWRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzNAogICAgLy8gb3AuQm94LnJlc2l6ZShwYWdlX2tleSwgb2Zmc2V0ICsgaXRlbS5sZW5ndGgpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYm94X3Jlc2l6ZQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzUKICAgIC8vIG9wLkJveC5yZXBsYWNlKHBhZ2Vfa2V5LCBvZmZzZXQsIGl0ZW0pCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9yZXBsYWNlCgphcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzYKICAgIC8vIG9wLkJveC5wdXQoa2V5LCBvcC5pdG9iKGNvdW50ICsgMSkpCiAgICBmcmFtZV9kaWcgMgogICAgaW50IDEKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkNvbXBlbnNhdGlvbkZhY3RvcnkuaW5pdF9jb21wZW5zYXRpb24oYmFzZV9hcHA6IHVpbnQ2NCwgb3duZXI6IGJ5dGVzLCBpbml0aWFsOiB1aW50NjQpIC0+IHZvaWQ6CmluaXRfY29tcGVuc2F0aW9uOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjI0LTIyMjcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaW5pdF9jb21wZW5zYXRpb24oCiAgICAvLyAgICAgc2VsZiwgYmFzZV9hcHA6IEFwcGxpY2F0aW9uLCBvd25lcjogYXJjNC5BZGRyZXNzLCBpbml0aWFsOiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjMxLTIyNDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyB0b3RhbCwgcGF5bWVudCBhbW91bnQKICAgIC8vICMgcGVyaW9kLCAwIChubyBsb2NrdXApCiAgICAvLyAjIGRlYWRsaW5lLCBub3cKICAgIC8vICMgdmVzdGluZyBkZWxheSwgMCAobm8gdmVzdGluZykKICAgIC8vICMgZGVwbG95ZXIgU2VuZGVyCiAgICAvLyAjIG93bmVyIGFyZwogICAgLy8gIyBmdW5kZXIgU2VuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHNoYXJlZCA9IHNlbGYucGFyYW1zLm1heWJlKClbMV0KICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MTAtMTcxMQogICAgLy8gIyBzaGFyZWQgdGVtcGxhdGUgc3RhdGUKICAgIC8vIHNlbGYucGFyYW1zID0gR2xvYmFsU3RhdGUoUGFyYW1zKQogICAgYnl0ZSAicGFyYW1zIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjMxLTIyNDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyB0b3RhbCwgcGF5bWVudCBhbW91bnQKICAgIC8vICMgcGVyaW9kLCAwIChubyBsb2NrdXApCiAgICAvLyAjIGRlYWRsaW5lLCBub3cKICAgIC8vICMgdmVzdGluZyBkZWxheSwgMCAobm8gdmVzdGluZykKICAgIC8vICMgZGVwbG95ZXIgU2VuZGVyCiAgICAvLyAjIG93bmVyIGFyZwogICAgLy8gIyBmdW5kZXIgU2VuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHNoYXJlZCA9IHNlbGYucGFyYW1zLm1heWJlKClbMV0KICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI0MS0yMjQzCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9YmFzZV9hcHAuYWRkcmVzcywgYW1vdW50PWluaXRpYWwgKyBvcC5HbG9iYWwubWluX2JhbGFuY2UsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNDIKICAgIC8vIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICArCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjQxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNDIKICAgIC8vIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNDEtMjI0MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI0NAogICAgLy8gaWYgc2hhcmVkOgogICAgYnogaW5pdF9jb21wZW5zYXRpb25fZWxzZV9ib2R5QDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI0NS0yMjU4CiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFRlbXBsYXRlLCBVcGdyYWRlckdyYW50ZWQsIFNldHVwCiAgICAvLyAgICAgQWlyZHJvcC5pbml0X3NoYXJlZCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyBwZXJpb2QKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZGVhZGxpbmUKICAgIC8vICAgICBpbml0aWFsLCAgIyB0b3RhbAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBmdW5kaW5nCiAgICAvLyAgICAgR2xvYmFsLnplcm9fYWRkcmVzcywgIyBkZWxlZ2F0ZQogICAgLy8gICAgIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICAjIGluaGVyaXQgdXBncmFkZXIKICAgIC8vICAgICBUeG4uc2VuZGVyLCAgIyBkZXBsb3llcgogICAgLy8gICAgIG93bmVyLCAgIyBvd25lcgogICAgLy8gICAgIFR4bi5zZW5kZXIsICAjIGZ1bmRlcgogICAgLy8gICAgIGluaXRpYWwsICAjIGluaXRpYWwKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNDcKICAgIC8vIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHBlcmlvZAogICAgaW50IDAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI0OAogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGRlYWRsaW5lCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNDkKICAgIC8vIGluaXRpYWwsICAjIHRvdGFsCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI1MAogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGZ1bmRpbmcKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI1MQogICAgLy8gR2xvYmFsLnplcm9fYWRkcmVzcywgIyBkZWxlZ2F0ZQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNTIKICAgIC8vIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICAjIGluaGVyaXQgdXBncmFkZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY292ZXIgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjUzCiAgICAvLyBUeG4uc2VuZGVyLCAgIyBkZXBsb3llcgogICAgdHhuIFNlbmRlcgogICAgY292ZXIgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjU1CiAgICAvLyBUeG4uc2VuZGVyLCAgIyBmdW5kZXIKICAgIHR4biBTZW5kZXIKICAgIGNvdmVyIDQKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNDUtMjI1OAogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBUZW1wbGF0ZSwgVXBncmFkZXJHcmFudGVkLCBTZXR1cAogICAgLy8gICAgIEFpcmRyb3AuaW5pdF9zaGFyZWQsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgcGVyaW9kCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGRlYWRsaW5lCiAgICAvLyAgICAgaW5pdGlhbCwgICMgdG90YWwKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZnVuZGluZwogICAgLy8gICAgIEdsb2JhbC56ZXJvX2FkZHJlc3MsICMgZGVsZWdhdGUKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIC8vICAgICBvd25lciwgICMgb3duZXIKICAgIC8vICAgICBUeG4uc2VuZGVyLCAgIyBmdW5kZXIKICAgIC8vICAgICBpbml0aWFsLCAgIyBpbml0aWFsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJpbml0X3NoYXJlZCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGIgaW5pdF9jb21wZW5zYXRpb25fYWZ0ZXJfaWZfZWxzZUA2Cgppbml0X2NvbXBlbnNhdGlvbl9lbHNlX2JvZHlANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI2MC0yMjgwCiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFRlbXBsYXRlLCBVcGdyYWRlckdyYW50ZWQsIFNldHVwCiAgICAvLyAgICAgQWlyZHJvcC5pbml0LAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChVSW50NjQoMCkpLCAgIyB2ZXN0aW5nIGRlbGF5CiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9TRUNPTkRTIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1FU1NFTkdFUl9JRCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fQ09VTlQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgcGVyaW9kCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGRlYWRsaW5lCiAgICAvLyAgICAgaW5pdGlhbCwgICMgdG90YWwKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZnVuZGluZwogICAgLy8gICAgIEdsb2JhbC56ZXJvX2FkZHJlc3MsICMgZGVsZWdhdGUKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIC8vICAgICBvd25lciwgICMgb3duZXIKICAgIC8vICAgICBUeG4uc2VuZGVyLCAgIyBmdW5kZXIKICAgIC8vICAgICBpbml0aWFsLCAgIyBpbml0aWFsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjYyCiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICBpbnQgVE1QTF9QRVJJT0RfTElNSVQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI2MwogICAgLy8gYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgdmVzdGluZyBkZWxheQogICAgaW50IDAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI2NAogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikpLAogICAgaW50IFRNUExfTE9DS1VQX0RFTEFZCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNjUKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9TRUNPTkRTIikpLAogICAgaW50IFRNUExfUEVSSU9EX1NFQ09ORFMKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI2NgogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIikpLAogICAgaW50IFRNUExfTUVTU0VOR0VSX0lECiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNjcKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9DT1VOVCIpKSwKICAgIGludCBUTVBMX0RJU1RSSUJVVElPTl9DT1VOVAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjY4CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fU0VDT05EUyIpKSwKICAgIGludCBUTVBMX0RJU1RSSUJVVElPTl9TRUNPTkRTCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNzAKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBkZWFkbGluZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjcxCiAgICAvLyBpbml0aWFsLCAgIyB0b3RhbAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNzIKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBmdW5kaW5nCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNzMKICAgIC8vIEdsb2JhbC56ZXJvX2FkZHJlc3MsICMgZGVsZWdhdGUKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgY292ZXIgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjc0CiAgICAvLyBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGNvdmVyIDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI3NQogICAgLy8gVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIHR4biBTZW5kZXIKICAgIGNvdmVyIDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjI3Ni0yMjc4CiAgICAvLyBvd25lciwgICMgb3duZXIKICAgIC8vIFR4bi5zZW5kZXIsICAjIGZ1bmRlcgogICAgLy8gaW5pdGlhbCwgICMgaW5pdGlhbAogICAgZnJhbWVfZGlnIC0yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNzcKICAgIC8vIFR4bi5zZW5kZXIsICAjIGZ1bmRlcgogICAgdHhuIFNlbmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjc2LTIyNzgKICAgIC8vIG93bmVyLCAgIyBvd25lcgogICAgLy8gVHhuLnNlbmRlciwgICMgZnVuZGVyCiAgICAvLyBpbml0aWFsLCAgIyBpbml0aWFsCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyNjAtMjI4MAogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBUZW1wbGF0ZSwgVXBncmFkZXJHcmFudGVkLCBTZXR1cAogICAgLy8gICAgIEFpcmRyb3AuaW5pdCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgdmVzdGluZyBkZWxheQogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX0NPVU5UIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIHBlcmlvZAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBkZWFkbGluZQogICAgLy8gICAgIGluaXRpYWwsICAjIHRvdGFsCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICAjIGZ1bmRpbmcKICAgIC8vICAgICBHbG9iYWwuemVyb19hZGRyZXNzLCAjIGRlbGVnYXRlCiAgICAvLyAgICAgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgICMgaW5oZXJpdCB1cGdyYWRlcgogICAgLy8gICAgIFR4bi5zZW5kZXIsICAjIGRlcGxveWVyCiAgICAvLyAgICAgb3duZXIsICAjIG93bmVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZnVuZGVyCiAgICAvLyAgICAgaW5pdGlhbCwgICMgaW5pdGlhbAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIG1ldGhvZCAiaW5pdCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDEzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDEyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAxMQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMTAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDkKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDgKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDcKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDcKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDYKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKaW5pdF9jb21wZW5zYXRpb25fYWZ0ZXJfaWZfZWxzZUA2OgogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkNvbXBlbnNhdGlvbkZhY3RvcnkuY3JlYXRlX21hbnkoYXJnczogYnl0ZXMpIC0+IGJ5dGVzOgpjcmVhdGVfbWFueToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjE5NC0yMTk3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjcmVhdGVfbWFueSgKICAgIC8vICAgICBzZWxmLCBhcmdzOiBhcmM0LkR5bmFtaWNBcnJheVtDb21wZW5zYXRpb25DcmVhdGVBcmdzXQogICAgLy8gKSAtPiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF06CiAgICBwcm90byAxIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIwNy0yMjA4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gcmVxdWlyZV9wYXltZW50KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIHJlcXVpcmVfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjA5CiAgICAvLyBhc3NlcnQgYXJncy5sZW5ndGggPiAwLCAiYXJncyBub3QgZW1wdHkiCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBhc3NlcnQgLy8gYXJncyBub3QgZW1wdHkKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxMC0yMjExCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFwcF9pZHMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxMgogICAgLy8gY29zdCA9IFVJbnQ2NCgwKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxMwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFyZ3MubGVuZ3RoKToKICAgIGR1cAoKY3JlYXRlX21hbnlfZm9yX2hlYWRlckAxOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjEzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXJncy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBjcmVhdGVfbWFueV9hZnRlcl9mb3JANAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjE0CiAgICAvLyBhcmcgPSBhcmdzW2ldLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50IDQwCiAgICAqCiAgICBpbnQgNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjE2CiAgICAvLyBhcmcub3duZXIsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgZHVwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyMTUtMjIxNwogICAgLy8gYmFzZV9hcHAsIG1icl9pbmNyZWFzZSA9IHNlbGYuY3JlYXRlX2NoaWxkKAogICAgLy8gICAgIGFyZy5vd25lciwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICAvLyApCiAgICBkdXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxNgogICAgLy8gYXJnLm93bmVyLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxNS0yMjE3CiAgICAvLyBiYXNlX2FwcCwgbWJyX2luY3JlYXNlID0gc2VsZi5jcmVhdGVfY2hpbGQoCiAgICAvLyAgICAgYXJnLm93bmVyLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICkKICAgIGNhbGxzdWIgY3JlYXRlX2NoaWxkCiAgICBjb3ZlciAzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIyMTgKICAgIC8vIHNlbGYuaW5pdF9jb21wZW5zYXRpb24oYmFzZV9hcHAsIGFyZy5vd25lciwgYXJnLmluaXRpYWwubmF0aXZlKQogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBkaWcgMQogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgY2FsbHN1YiBpbml0X2NvbXBlbnNhdGlvbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjE5CiAgICAvLyBjb3N0ICs9IG1icl9pbmNyZWFzZSArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSArIGFyZy5pbml0aWFsLm5hdGl2ZQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIHVuY292ZXIgMwogICAgKwogICAgKwogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjIwCiAgICAvLyBhcHBfaWRzLmFwcGVuZChhcmM0LlVJbnQ2NChiYXNlX2FwcC5pZCkpCiAgICBmcmFtZV9kaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludCA4CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIxMwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFyZ3MubGVuZ3RoKToKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgY3JlYXRlX21hbnlfZm9yX2hlYWRlckAxCgpjcmVhdGVfbWFueV9hZnRlcl9mb3JANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjIyMQogICAgLy8gc2VsZi5zZXR0bGVfcGF5bWVudChwYXltZW50X2Ftb3VudCwgY29zdCkKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMwogICAgY2FsbHN1YiBzZXR0bGVfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMjIyCiAgICAvLyByZXR1cm4gYXBwX2lkcwogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LnNldHRsZV9wYXltZW50KHBheW1lbnRfYW1vdW50OiB1aW50NjQsIGNvc3Q6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0dGxlX3BheW1lbnQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTUtMTgxNgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBzZXR0bGVfcGF5bWVudChzZWxmLCBwYXltZW50X2Ftb3VudDogVUludDY0LCBjb3N0OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgyMAogICAgLy8gYXNzZXJ0IHBheW1lbnRfYW1vdW50ID49IGNvc3QsICJwYXltZW50IGFtb3VudCBhY2N1cmF0ZSIKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICA+PQogICAgYXNzZXJ0IC8vIHBheW1lbnQgYW1vdW50IGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjEKICAgIC8vIGlmIHBheW1lbnRfYW1vdW50ID4gY29zdDoKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBieiBzZXR0bGVfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgyMi0xODI0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gY29zdCwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgyMwogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gY29zdCwgZmVlPTAKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODIyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjMKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgyMi0xODI0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gY29zdCwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpzZXR0bGVfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDM6CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkuZW5hYmxlX3JlZ2lzdHJ5KCkgLT4gdm9pZDoKZW5hYmxlX3JlZ2lzdHJ5OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzQ1LTE3NDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGVuYWJsZV9yZWdpc3RyeShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1MwogICAgLy8gbWluX2JhbGFuY2UgPSBnZXRfbWluX2JhbGFuY2UoKQogICAgY2FsbHN1YiBnZXRfbWluX2JhbGFuY2UKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NAogICAgLy8gc2VsZi5yZWdpc3RyeS52YWx1ZSA9IFVJbnQ2NCgxKQogICAgaW50IDEKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMy0xNzE1CiAgICAvLyAjIHJlZ2lzdHJ5IHN0YXRlLCBpbiBib3hlcyBzbyBmYWN0b3JpZXMgdXBkYXRlZAogICAgLy8gIyAgIGluIHBsYWNlIGtlZXAgdGhlaXIgZ2xvYmFsIHNjaGVtYQogICAgLy8gc2VsZi5yZWdpc3RyeSA9IEJveChVSW50NjQsIGtleT1iInJlZ2lzdHJ5IikKICAgIGJ5dGUgMHg3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTQKICAgIC8vIHNlbGYucmVnaXN0cnkudmFsdWUgPSBVSW50NjQoMSkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NQogICAgLy8gc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlKQogICAgY2FsbHN1YiBzZXR0bGVfbWJyX3BheW1lbnQKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5zZXR0bGVfbWJyX3BheW1lbnQobWluX2JhbGFuY2U6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0dGxlX21icl9wYXltZW50OgogICAgLy8gc3JjL3NyYy91dGlscy5weTo2NS03OQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogc2V0dGxlX21icl9wYXltZW50IChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIG1pbl9iYWxhbmNlLCBhcHAgbWluIGJhbGFuY2UgYmVmb3JlIGJveGVzCiAgICAvLyAjICAgd2VyZSB3cml0dGVuCiAgICAvLyAjIHB1cnBvc2U6IHJlcXVpcmUgcGF5bWVudCBwcmVjZWRpbmcgY2FsbCBmcm9tCiAgICAvLyAjICAgc2VuZGVyIGNvdmVyaW5nIG1pbiBiYWxhbmNlIGluY3JlYXNlIHNpbmNlCiAgICAvLyAjICAgbWluX2JhbGFuY2UsIHJlZnVuZCBleGNlc3MgdG8gc2VuZGVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIHBheW1lbnQgb25seSByZXF1aXJlZCB3aGVuIG1pbiBiYWxhbmNlCiAgICAvLyAjICAgaW5jcmVhc2VkLCByZWZ1bmRlZCBpbiBmdWxsIG90aGVyd2lzZQogICAgLy8gIyAtIHJlZnVuZCBjb3N0cyAxIGZlZSwgcG9vbGVkIGJ5IHNlbmRlcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBzZXR0bGVfbWJyX3BheW1lbnQobWluX2JhbGFuY2U6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgYnl0ZSAiIgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MAogICAgLy8gbWJyX2luY3JlYXNlID0gZ2V0X21pbl9iYWxhbmNlKCkgLSBtaW5fYmFsYW5jZQogICAgY2FsbHN1YiBnZXRfbWluX2JhbGFuY2UKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgZHVwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjgxCiAgICAvLyBpZiBtYnJfaW5jcmVhc2UgPiAwOgogICAgYnogc2V0dGxlX21icl9wYXltZW50X2Vsc2VfYm9keUAyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjgyCiAgICAvLyBwYXltZW50X2Ftb3VudCA9IHJlcXVpcmVfcGF5bWVudChUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiByZXF1aXJlX3BheW1lbnQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjgzCiAgICAvLyBhc3NlcnQgcGF5bWVudF9hbW91bnQgPj0gbWJyX2luY3JlYXNlLCAicGF5bWVudCBhbW91bnQgYWNjdXJhdGUiCiAgICBmcmFtZV9kaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3VudCBhY2N1cmF0ZQogICAgYiBzZXR0bGVfbWJyX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUAzCgpzZXR0bGVfbWJyX3BheW1lbnRfZWxzZV9ib2R5QDI6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg1CiAgICAvLyBwYXltZW50X2Ftb3VudCA9IGdldF9wYXltZW50X2Ftb3VudCgpCiAgICBjYWxsc3ViIGdldF9wYXltZW50X2Ftb3VudAogICAgZnJhbWVfYnVyeSAwCgpzZXR0bGVfbWJyX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4NgogICAgLy8gaWYgcGF5bWVudF9hbW91bnQgPiBtYnJfaW5jcmVhc2U6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgID4KICAgIGJ6IHNldHRsZV9tYnJfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODctODkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5bWVudF9hbW91bnQgLSBtYnJfaW5jcmVhc2UsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg4CiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5bWVudF9hbW91bnQgLSBtYnJfaW5jcmVhc2UsIGZlZT0wCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIC0KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg4CiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5bWVudF9hbW91bnQgLSBtYnJfaW5jcmVhc2UsIGZlZT0wCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODctODkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5bWVudF9hbW91bnQgLSBtYnJfaW5jcmVhc2UsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKc2V0dGxlX21icl9wYXltZW50X2FmdGVyX2lmX2Vsc2VANjoKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5nZXRfcGF5bWVudF9hbW91bnQoKSAtPiB1aW50NjQ6CmdldF9wYXltZW50X2Ftb3VudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6OTItOTkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9wYXltZW50X2Ftb3VudCAoaW50ZXJuYWwpCiAgICAvLyAjIHB1cnBvc2U6IGFtb3VudCBvZiBvcHRpb25hbCBwYXltZW50IHByZWNlZGluZwogICAgLy8gIyAgIGNhbGwgZnJvbSBzZW5kZXIgdG8gYXBwCiAgICAvLyAjIHJldHVybnM6IHBheW1lbnQgYW1vdW50LCAwIHdpdGhvdXQgcGF5bWVudAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfcGF5bWVudF9hbW91bnQoKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTAwCiAgICAvLyBpZiBUeG4uZ3JvdXBfaW5kZXggPT0gMDoKICAgIHR4biBHcm91cEluZGV4CiAgICBibnogZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDEKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludCAwCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwMgogICAgLy8gcGF5bWVudCA9IGd0eG4uVHJhbnNhY3Rpb24oVHhuLmdyb3VwX2luZGV4IC0gMSkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA0CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDQtMTA2CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIC8vIGFuZCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBieiBnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNQogICAgLy8gYW5kIHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNC0xMDYKICAgIC8vIHBheW1lbnQudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuUGF5bWVudAogICAgLy8gYW5kIHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIC8vIGFuZCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGJ6IGdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA2CiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgMAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDQtMTA2CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIC8vIGFuZCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBieiBnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwOAogICAgLy8gcmV0dXJuIHBheW1lbnQuYW1vdW50CiAgICBmcmFtZV9kaWcgMAogICAgZ3R4bnMgQW1vdW50CiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwOQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50IDAKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5nZXRfY2hpbGRyZW4ob3duZXI6IGJ5dGVzLCBvZmZzZXQ6IGJ5dGVzLCBsaW1pdDogYnl0ZXMpIC0+IHVpbnQ2NCwgYnl0ZXM6CmdldF9jaGlsZHJlbjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1Ny0xNzYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfY2hpbGRyZW4oCiAgICAvLyAgICAgc2VsZiwgb3duZXI6IGFyYzQuQWRkcmVzcywgb2Zmc2V0OiBhcmM0LlVJbnQ2NCwgbGltaXQ6IGFyYzQuVUludDY0CiAgICAvLyApIC0+IHR1cGxlW1VJbnQ2NCwgYXJjNC5EeW5hbWljQXJyYXlbQ2hpbGRJbmZvXV06CiAgICBwcm90byAzIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc3MAogICAgLy8gYiJjIiArIG93bmVyLmJ5dGVzLCBvZmZzZXQubmF0aXZlLCBsaW1pdC5uYXRpdmUsIFVJbnQ2NCg0OCksIFVJbnQ2NCgyMSkKICAgIGJ5dGUgMHg2MwogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpbnQgNDgKICAgIGludCAyMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzY5LTE3NzEKICAgIC8vIGNvdW50LCBjaGlsZHJlbiA9IGdldF9wYWdlZCgKICAgIC8vICAgICBiImMiICsgb3duZXIuYnl0ZXMsIG9mZnNldC5uYXRpdmUsIGxpbWl0Lm5hdGl2ZSwgVUludDY0KDQ4KSwgVUludDY0KDIxKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfcGFnZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc3MwogICAgLy8gYXJjNC5VSW50MTYoY2hpbGRyZW4ubGVuZ3RoIC8vIDQ4KS5ieXRlcyArIGNoaWxkcmVuCiAgICBkdXAKICAgIGxlbgogICAgaW50IDQ4CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NzItMTc3NAogICAgLy8gcmV0dXJuIGNvdW50LCBhcmM0LkR5bmFtaWNBcnJheVtDaGlsZEluZm9dLmZyb21fYnl0ZXMoCiAgICAvLyAgICAgYXJjNC5VSW50MTYoY2hpbGRyZW4ubGVuZ3RoIC8vIDQ4KS5ieXRlcyArIGNoaWxkcmVuCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuZ2V0X3BhZ2VkKGtleTogYnl0ZXMsIG9mZnNldDogdWludDY0LCBsaW1pdDogdWludDY0LCBpdGVtX3NpemU6IHVpbnQ2NCwgcGFnZV9zaXplOiB1aW50NjQpIC0+IHVpbnQ2NCwgYnl0ZXM6CmdldF9wYWdlZDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTM5LTE1NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X3BhZ2VkIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGtleSwgbGlzdCBrZXksIHNlZSBhcHBlbmRfcGFnZWQKICAgIC8vICMgLSBvZmZzZXQsIGluZGV4IG9mIGZpcnN0IGl0ZW0KICAgIC8vICMgLSBsaW1pdCwgbWF4IGl0ZW1zLCBhdCBtb3N0IHBhZ2Vfc2l6ZQogICAgLy8gIyAtIGl0ZW1fc2l6ZSwgaXRlbSBzaXplCiAgICAvLyAjIC0gcGFnZV9zaXplLCBpdGVtcyBwZXIgcGFnZQogICAgLy8gIyBwdXJwb3NlOiByZWFkIGl0ZW1zIGZyb20gbGlzdCBrZXB0IGluIHBhZ2VzCiAgICAvLyAjIHJldHVybnM6CiAgICAvLyAjIC0gaXRlbSBjb3VudAogICAgLy8gIyAtIGl0ZW1zIGZyb20gb2Zmc2V0LCBhdCBtb3N0IGxpbWl0LCBzcGFucwogICAgLy8gIyAgIGF0IG1vc3QgMiBwYWdlcwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfcGFnZWQoCiAgICAvLyAgICAga2V5OiBCeXRlcywgb2Zmc2V0OiBVSW50NjQsIGxpbWl0OiBVSW50NjQsIGl0ZW1fc2l6ZTogVUludDY0LCBwYWdlX3NpemU6IFVJbnQ2NAogICAgLy8gKSAtPiB0dXBsZVtVSW50NjQsIEJ5dGVzXToKICAgIHByb3RvIDUgMgogICAgaW50IDAKICAgIGJ5dGUgIiIKICAgIGR1cG4gNgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNTcKICAgIC8vIGNvdW50X2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGtleSkKICAgIGZyYW1lX2RpZyAtNQogICAgYm94X2dldAogICAgLy8gc3JjL3NyYy91dGlscy5weToxNTgKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBibnogZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNTkKICAgIC8vIHJldHVybiBVSW50NjQoMCksIEJ5dGVzKCkKICAgIGludCAwCiAgICBieXRlIDB4CiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjAKICAgIC8vIGNvdW50ID0gb3AuYnRvaShjb3VudF9ieXRlcykKICAgIGZyYW1lX2RpZyA4CiAgICBidG9pCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjEKICAgIC8vIGlmIG9mZnNldCA+PSBjb3VudDoKICAgIGZyYW1lX2RpZyAtNAogICAgPD0KICAgIGJ6IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYyCiAgICAvLyByZXR1cm4gY291bnQsIEJ5dGVzKCkKICAgIGZyYW1lX2RpZyAxCiAgICBieXRlIDB4CiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjMtMTY0CiAgICAvLyAjIGNsYW1wIGJlZm9yZSBhZGRpbmcgdG8gb2Zmc2V0LCB3aGljaCBtYXkgb3ZlcmZsb3cKICAgIC8vIGlmIGxpbWl0ID4gcGFnZV9zaXplOgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTEKICAgID4KICAgIGJ6IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDYKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAtMwoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTY2CiAgICAvLyBpZiBsaW1pdCA+IGNvdW50IC0gb2Zmc2V0OgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtNAogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDQKICAgIGZyYW1lX2RpZyAtMwogICAgPAogICAgYnogZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAOAogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2J1cnkgLTMKCmdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2OAogICAgLy8gaXRlbXMgPSBCeXRlcygpCiAgICBieXRlIDB4CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTcwCiAgICAvLyBlbmQgPSBvZmZzZXQgKyBsaW1pdAogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9idXJ5IDMKCmdldF9wYWdlZF93aGlsZV90b3BAOToKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTcxCiAgICAvLyB3aGlsZSBpbmRleCA8IGVuZDoKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogZ2V0X3BhZ2VkX2FmdGVyX3doaWxlQDEzCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3MgogICAgLy8gc2xvdCA9IGluZGV4ICUgcGFnZV9zaXplCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgICUKICAgIGR1cAogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3MwogICAgLy8gc2l6ZSA9IHBhZ2Vfc2l6ZSAtIHNsb3QKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTc0CiAgICAvLyBpZiBzaXplID4gZW5kIC0gaW5kZXg6CiAgICBmcmFtZV9kaWcgMgogICAgdW5jb3ZlciAyCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgPgogICAgYnogZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMTIKICAgIGZyYW1lX2RpZyA2CiAgICBmcmFtZV9idXJ5IDUKCmdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzcKICAgIC8vIGtleSArIG9wLml0b2IoaW5kZXggLy8gcGFnZV9zaXplKSwgc2xvdCAqIGl0ZW1fc2l6ZSwgc2l6ZSAqIGl0ZW1fc2l6ZQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICAvCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgY292ZXIgMwogICAgZnJhbWVfZGlnIC0yCiAgICAqCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3Ni0xNzgKICAgIC8vIGl0ZW1zICs9IG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgIGtleSArIG9wLml0b2IoaW5kZXggLy8gcGFnZV9zaXplKSwgc2xvdCAqIGl0ZW1fc2l6ZSwgc2l6ZSAqIGl0ZW1fc2l6ZQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzkKICAgIC8vIGluZGV4ICs9IHNpemUKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBnZXRfcGFnZWRfd2hpbGVfdG9wQDkKCmdldF9wYWdlZF9hZnRlcl93aGlsZUAxMzoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTgwCiAgICAvLyByZXR1cm4gY291bnQsIGl0ZW1zCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuc2V0X3ZlcnNpb24oY29udHJhY3RfdmVyc2lvbjogYnl0ZXMsIGRlcGxveW1lbnRfdmVyc2lvbjogYnl0ZXMpIC0+IHZvaWQ6CnNldF92ZXJzaW9uOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzAtNTMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfdmVyc2lvbigKICAgIC8vICAgICBzZWxmLCBjb250cmFjdF92ZXJzaW9uOiBhcmM0LlVJbnQ2NCwgZGVwbG95bWVudF92ZXJzaW9uOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNQogICAgLy8gYXJjNC5lbWl0KFZlcnNpb25VcGRhdGVkKGNvbnRyYWN0X3ZlcnNpb24sIGRlcGxveW1lbnRfdmVyc2lvbikpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlZlcnNpb25VcGRhdGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM2CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBjb250cmFjdF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNwogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBkZXBsb3ltZW50X3ZlcnNpb24ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJkZXBsb3ltZW50X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNwogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBkZXBsb3ltZW50X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmFwcHJvdmVfdXBkYXRlKGFwcHJvdmFsOiBieXRlcykgLT4gdm9pZDoKYXBwcm92ZV91cGRhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0OC01NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGFwcHJvdmVfdXBkYXRlKHNlbGYsIGFwcHJvdmFsOiBhcmM0LkJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTEKICAgIC8vIGFyYzQuZW1pdChVcGRhdGVBcHByb3ZlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIGFwcHJvdmFsKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUxCiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGRhdGVBcHByb3ZlZChhZGRyZXNzLGJvb2wpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUyCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGFwcHJvdmFsLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZ2V0Yml0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MgogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuZ3JhbnRfdXBncmFkZXIodXBncmFkZXI6IGJ5dGVzKSAtPiB2b2lkOgpncmFudF91cGdyYWRlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU0LTU1NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZ3JhbnRfdXBncmFkZXIoc2VsZiwgdXBncmFkZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZ3JhZGVyR3JhbnRlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gdXBncmFkZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUub25fdXBkYXRlKCkgLT4gdm9pZDoKb25fdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzktNTQwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0MS01NDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0MS01NDQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDUKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDUKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBkYXRhYmxlIGV4aXN0cwogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gbm90IGFwcHJvdmVkCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQ29tcGVuc2F0aW9uRmFjdG9yeS5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTQzCiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxNDcKICAgIC8vIHN1cGVyKCkuX19pbml0X18oKQogICAgY2FsbHN1YiBCYXNlRmFjdG9yeS5fX2luaXRfXwogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5Ll9faW5pdF9fKCkgLT4gdm9pZDoKQmFzZUZhY3RvcnkuX19pbml0X186CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MDEKICAgIC8vIGRlZiBfX2luaXRfXyhzZWxmKSAtPiBOb25lOiAgIyBwcmFnbWE6IG5vIGNvdmVyCiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwNS0xNzA2CiAgICAvLyAjIHVwZ3JhZGVhYmxlIHN0YXRlCiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzA3CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwOAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwOQogICAgLy8gc2VsZi51cGdyYWRlciA9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuQ29tcGVuc2F0aW9uRmFjdG9yeS5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTQyCiAgICAvLyBjbGFzcyBDb21wZW5zYXRpb25GYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIGludCAxCiAgICByZXR1cm4K"
   },
   "state": {
     "global": {
-      "num_byte_slices": 2,
-      "num_uints": 3
+      "num_byte_slices": 3,
+      "num_uints": 4
     },
     "local": {
       "num_byte_slices": 0,
@@ -82,10 +103,18 @@ export const APP_SPEC: AppSpec = {
           "type": "uint64",
           "key": "deployment_version"
         },
+        "messenger_id": {
+          "type": "uint64",
+          "key": "messenger_id"
+        },
         "owner": {
           "type": "bytes",
           "key": "owner"
         },
+        "params": {
+          "type": "bytes",
+          "key": "params"
+        },
         "updatable": {
           "type": "uint64",
           "key": "updatable"
@@ -105,6 +134,15 @@ export const APP_SPEC: AppSpec = {
   "contract": {
     "name": "CompensationFactory",
     "methods": [
+      {
+        "name": "share_params",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Share template parameters, children created from now on read\nthem from factory global state instead of storing a copy."
+      },
       {
         "name": "create",
         "args": [
@@ -119,6 +157,51 @@ export const APP_SPEC: AppSpec = {
         },
         "desc": "Create compensation contract.\nArguments: - owner, who is the beneficiary - period, vesting period\nReturns: - app id"
       },
+      {
+        "name": "create_many",
+        "args": [
+          {
+            "type": "(address,uint64)[]",
+            "name": "args"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "uint64[]"
+        },
+        "desc": "Create compensation contracts from a single payment.\nArguments: - args, owner and initial of each contract\nReturns: - app ids"
+      },
+      {
+        "name": "enable_registry",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Record children created from now on in box registry by owner.\nCreators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled."
+      },
+      {
+        "name": "get_children",
+        "args": [
+          {
+            "type": "address",
+            "name": "owner"
+          },
+          {
+            "type": "uint64",
+            "name": "offset"
+          },
+          {
+            "type": "uint64",
+            "name": "limit"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "(uint64,(uint64,address,uint64)[])"
+        },
+        "desc": "Get page of children of owner in creation order."
+      },
       {
         "name": "set_version",
         "args": [
@@ -255,6 +338,12 @@ export type CompensationFactory = {
    * Maps method signatures / names to their argument and return types.
    */
   methods:
+    & Record<'share_params()void' | 'share_params', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: void
+    }>
     & Record<'create(address)uint64' | 'create', {
       argsObj: {
         owner: string
@@ -262,6 +351,28 @@ export type CompensationFactory = {
       argsTuple: [owner: string]
       returns: bigint
     }>
+    & Record<'create_many((address,uint64)[])uint64[]' | 'create_many', {
+      argsObj: {
+        args: [string, bigint | number][]
+      }
+      argsTuple: [args: [string, bigint | number][]]
+      returns: bigint[]
+    }>
+    & Record<'enable_registry()void' | 'enable_registry', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: void
+    }>
+    & Record<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])' | 'get_children', {
+      argsObj: {
+        owner: string
+        offset: bigint | number
+        limit: bigint | number
+      }
+      argsTuple: [owner: string, offset: bigint | number, limit: bigint | number]
+      returns: [bigint, [bigint, string, bigint][]]
+    }>
     & Record<'set_version(uint64,uint64)void' | 'set_version', {
       argsObj: {
         contractVersion: bigint | number
@@ -298,7 +409,9 @@ export type CompensationFactory = {
     global: {
       contractVersion?: IntegerState
       deploymentVersion?: IntegerState
+      messengerId?: IntegerState
       owner?: BinaryState
+      params?: BinaryState
       updatable?: IntegerState
       upgrader?: BinaryState
     }
@@ -408,6 +521,23 @@ export abstract class CompensationFactoryCallFactory {
     }
   }
 
+  /**
+   * Constructs a no op call for the share_params()void ABI method
+   *
+   * Share template parameters, children created from now on read
+them from factory global state instead of storing a copy.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static shareParams(args: MethodArgs<'share_params()void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'share_params()void' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the create(address)uint64 ABI method
    *
@@ -426,6 +556,57 @@ Returns: - app id
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the create_many((address,uint64)[])uint64[] ABI method
+   *
+   * Create compensation contracts from a single payment.
+Arguments: - args, owner and initial of each contract
+Returns: - app ids
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static createMany(args: MethodArgs<'create_many((address,uint64)[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'create_many((address,uint64)[])uint64[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.args],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the enable_registry()void ABI method
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'enable_registry()void' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])' as const,
+      methodArgs: Array.isArray(args) ? args : [args.owner, args.offset, args.limit],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the set_version(uint64,uint64)void ABI method
    *
@@ -602,6 +783,20 @@ export class CompensationFactoryClient {
     return this.appClient.clearState(args)
   }
 
+  /**
+   * Calls the share_params()void ABI method.
+   *
+   * Share template parameters, children created from now on read
+them from factory global state instead of storing a copy.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public shareParams(args: MethodArgs<'share_params()void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(CompensationFactoryCallFactory.shareParams(args, params))
+  }
+
   /**
    * Calls the create(address)uint64 ABI method.
    *
@@ -617,6 +812,48 @@ Returns: - app id
     return this.call(CompensationFactoryCallFactory.create(args, params))
   }
 
+  /**
+   * Calls the create_many((address,uint64)[])uint64[] ABI method.
+   *
+   * Create compensation contracts from a single payment.
+Arguments: - args, owner and initial of each contract
+Returns: - app ids
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public createMany(args: MethodArgs<'create_many((address,uint64)[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(CompensationFactoryCallFactory.createMany(args, params))
+  }
+
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(CompensationFactoryCallFactory.enableRegistry(args, params))
+  }
+
+  /**
+   * Calls the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method.
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(CompensationFactoryCallFactory.getChildren(args, params))
+  }
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -719,9 +956,15 @@ Returns: - app id
       get deploymentVersion() {
         return CompensationFactoryClient.getIntegerState(state, 'deployment_version')
       },
+      get messengerId() {
+        return CompensationFactoryClient.getIntegerState(state, 'messenger_id')
+      },
       get owner() {
         return CompensationFactoryClient.getBinaryState(state, 'owner')
       },
+      get params() {
+        return CompensationFactoryClient.getBinaryState(state, 'params')
+      },
       get updatable() {
         return CompensationFactoryClient.getIntegerState(state, 'updatable')
       },
@@ -737,11 +980,31 @@ Returns: - app id
     let promiseChain:Promise<unknown> = Promise.resolve()
     const resultMappers: Array<undefined | ((x: any) => any)> = []
     return {
+      shareParams(args: MethodArgs<'share_params()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.shareParams(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       create(args: MethodArgs<'create(address)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.create(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      createMany(args: MethodArgs<'create_many((address,uint64)[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.createMany(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.enableRegistry(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getChildren(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       setVersion(args: MethodArgs<'set_version(uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setVersion(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -805,6 +1068,18 @@ Returns: - app id
   }
 }
 export type CompensationFactoryComposer<TReturns extends [...any[]] = []> = {
+  /**
+   * Calls the share_params()void ABI method.
+   *
+   * Share template parameters, children created from now on read
+them from factory global state instead of storing a copy.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  shareParams(args: MethodArgs<'share_params()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): CompensationFactoryComposer<[...TReturns, MethodReturn<'share_params()void'>]>
+
   /**
    * Calls the create(address)uint64 ABI method.
    *
@@ -818,6 +1093,42 @@ Returns: - app id
    */
   create(args: MethodArgs<'create(address)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): CompensationFactoryComposer<[...TReturns, MethodReturn<'create(address)uint64'>]>
 
+  /**
+   * Calls the create_many((address,uint64)[])uint64[] ABI method.
+   *
+   * Create compensation contracts from a single payment.
+Arguments: - args, owner and initial of each contract
+Returns: - app ids
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createMany(args: MethodArgs<'create_many((address,uint64)[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): CompensationFactoryComposer<[...TReturns, MethodReturn<'create_many((address,uint64)[])uint64[]'>]>
+
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): CompensationFactoryComposer<[...TReturns, MethodReturn<'enable_registry()void'>]>
+
+  /**
+   * Calls the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method.
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): CompensationFactoryComposer<[...TReturns, MethodReturn<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>]>
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -36,6 +36,63 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
+    "partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "enable_registry()void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      },
+      "structs": {
+        "output": {
+          "name": "PartKeyInfo",
+          "elements": [
+            [
+              "address",
+              "address"
+            ],
+            [
+              "vote_key",
+              "byte[32]"
+            ],
+            [
+              "selection_key",
+              "byte[32]"
+            ],
+            [
+              "vote_first",
+              "uint64"
+            ],
+            [
+              "vote_last",
+              "uint64"
+            ],
+            [
+              "vote_key_dilution",
+              "uint64"
+            ],
+            [
+              "state_proof_key",
+              "byte[64]"
+            ]
+          ]
+        }
+      }
+    },
+    "get_partkey_addresses(address,uint64,uint64)(uint64,address[])": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "set_version(uint64,uint64)void": {
       "call_config": {
         "no_op": "CALL"
@@ -58,8 +115,8 @@ export const APP_SPEC: AppSpec = {
     }
   },
   "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuTWVzc2VuZ2VyLmFwcHJvdmFsX3Byb2dyYW06CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fZW50cnlwb2ludEAyCiAgICBjYWxsc3ViIF9faW5pdF9fCgptYWluX2VudHJ5cG9pbnRAMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODc5CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTEKICAgIG1ldGhvZCAicGFydGtleV9icm9hc3RjYXN0KGFkZHJlc3MsYnl0ZVszMl0sYnl0ZVszMl0sdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVs2NF0pdm9pZCIKICAgIG1ldGhvZCAic2V0X3ZlcnNpb24odWludDY0LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJhcHByb3ZlX3VwZGF0ZShib29sKXZvaWQiCiAgICBtZXRob2QgImdyYW50X3VwZ3JhZGVyKGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAidHJhbnNmZXIoYWRkcmVzcyl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9wYXJ0a2V5X2Jyb2FzdGNhc3Rfcm91dGVANCBtYWluX3NldF92ZXJzaW9uX3JvdXRlQDUgbWFpbl9hcHByb3ZlX3VwZGF0ZV9yb3V0ZUA2IG1haW5fZ3JhbnRfdXBncmFkZXJfcm91dGVANyBtYWluX3RyYW5zZmVyX3JvdXRlQDgKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fcGFydGtleV9icm9hc3RjYXN0X3JvdXRlQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3OQogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4ODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwYXJ0a2V5X2Jyb2FzdGNhc3QKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X3ZlcnNpb25fcm91dGVANToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODc5CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF92ZXJzaW9uCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfdXBkYXRlX3JvdXRlQDY6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3OQogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhcHByb3ZlX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUA3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4NzkKICAgIC8vIGNsYXNzIE1lc3NlbmdlcihNZXNzZW5nZXJJbnRlcmZhY2UsIFVwZ3JhZGVhYmxlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgZ3JhbnRfdXBncmFkZXIKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfcm91dGVAODoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTE6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3OQogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgaW50IDAKICAgIGludCA0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBtYXRjaCBtYWluX2NyZWF0ZUAxMiBtYWluX29uX3VwZGF0ZUAxMwogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9jcmVhdGVAMTI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3OQogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9vbl91cGRhdGVAMTM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2NgogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2Ni00NjcKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgb25fdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBjYWxsc3ViIG9uX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNyYy5jb250cmFjdC5NZXNzZW5nZXIucGFydGtleV9icm9hc3RjYXN0KGFkZHJlc3M6IGJ5dGVzLCB2b3RlX2s6IGJ5dGVzLCBzZWxfazogYnl0ZXMsIHZvdGVfZnN0OiBieXRlcywgdm90ZV9sc3Q6IGJ5dGVzLCB2b3RlX2tkOiBieXRlcywgc3Bfa2V5OiBieXRlcykgLT4gdm9pZDoKcGFydGtleV9icm9hc3RjYXN0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4ODctODk3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwYXJ0a2V5X2Jyb2FzdGNhc3QoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBhZGRyZXNzOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgdm90ZV9rOiBCeXRlczMyLAogICAgLy8gICAgIHNlbF9rOiBCeXRlczMyLAogICAgLy8gICAgIHZvdGVfZnN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2xzdDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdm90ZV9rZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgc3Bfa2V5OiBCeXRlczY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNyAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjkwMAogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MDEtOTAzCiAgICAvLyBQYXJ0S2V5SW5mbygKICAgIC8vICAgICBhZGRyZXNzLCB2b3RlX2ssIHNlbF9rLCB2b3RlX2ZzdCwgdm90ZV9sc3QsIHZvdGVfa2QsIHNwX2tleQogICAgLy8gKSwKICAgIGZyYW1lX2RpZyAtNwogICAgZnJhbWVfZGlnIC02CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OTktOTA0CiAgICAvLyBNZXNzYWdlUGFydEtleUluZm8oCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIFBhcnRLZXlJbmZvKAogICAgLy8gICAgICAgICBhZGRyZXNzLCB2b3RlX2ssIHNlbF9rLCB2b3RlX2ZzdCwgdm90ZV9sc3QsIHZvdGVfa2QsIHNwX2tleQogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODk4LTkwNQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIE1lc3NhZ2VQYXJ0S2V5SW5mbygKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBQYXJ0S2V5SW5mbygKICAgIC8vICAgICAgICAgICAgIGFkZHJlc3MsIHZvdGVfaywgc2VsX2ssIHZvdGVfZnN0LCB2b3RlX2xzdCwgdm90ZV9rZCwgc3Bfa2V5CiAgICAvLyAgICAgICAgICksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgbWV0aG9kICJNZXNzYWdlUGFydEtleUluZm8oYWRkcmVzcywoYWRkcmVzcyxieXRlWzMyXSxieXRlWzMyXSx1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzY0XSkpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5zZXRfdmVyc2lvbihjb250cmFjdF92ZXJzaW9uOiBieXRlcywgZGVwbG95bWVudF92ZXJzaW9uOiBieXRlcykgLT4gdm9pZDoKc2V0X3ZlcnNpb246CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ1Ny00NjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF92ZXJzaW9uKAogICAgLy8gICAgIHNlbGYsIGNvbnRyYWN0X3ZlcnNpb246IGFyYzQuVUludDY0LCBkZXBsb3ltZW50X3ZlcnNpb246IGFyYzQuVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYyCiAgICAvLyBhcmM0LmVtaXQoVmVyc2lvblVwZGF0ZWQoY29udHJhY3RfdmVyc2lvbiwgZGVwbG95bWVudF92ZXJzaW9uKSkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVmVyc2lvblVwZGF0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjMKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA1CiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiY29udHJhY3RfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYzCiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBjb250cmFjdF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY0CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IGRlcGxveW1lbnRfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY0CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IGRlcGxveW1lbnRfdmVyc2lvbi5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuYXBwcm92ZV91cGRhdGUoYXBwcm92YWw6IGJ5dGVzKSAtPiB2b2lkOgphcHByb3ZlX3VwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc1LTQ3NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgYXBwcm92ZV91cGRhdGUoc2VsZiwgYXBwcm92YWw6IGFyYzQuQm9vbCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIG93bmVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgIm93bmVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzgKICAgIC8vIGFyYzQuZW1pdChVcGRhdGVBcHByb3ZlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIGFwcHJvdmFsKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZGF0ZUFwcHJvdmVkKGFkZHJlc3MsYm9vbCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAwCiAgICBnZXRiaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA3CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGFwcHJvdmFsLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5ncmFudF91cGdyYWRlcih1cGdyYWRlcjogYnl0ZXMpIC0+IHZvaWQ6CmdyYW50X3VwZ3JhZGVyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEtNDgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBncmFudF91cGdyYWRlcihzZWxmLCB1cGdyYWRlcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIm11c3QgYmUgY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGNyZWF0b3IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDg0CiAgICAvLyBhcmM0LmVtaXQoVXBncmFkZXJHcmFudGVkKGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwgdXBncmFkZXIpKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDg0CiAgICAvLyBhcmM0LmVtaXQoVXBncmFkZXJHcmFudGVkKGFyYzQuQWRkcmVzcyhzZWxmLnVwZ3JhZGVyKSwgdXBncmFkZXIpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVXBncmFkZXJHcmFudGVkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODUKICAgIC8vIHNlbGYudXBncmFkZXIgPSB1cGdyYWRlci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5vbl91cGRhdGUoKSAtPiB2b2lkOgpvbl91cGRhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2Ni00NjcKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgb25fdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY4LTQ3MQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIFdBUk5JTkc6IFRoaXMgYXBwIGNhbiBiZSB1cGRhdGVkIGJ5IHRoZSBjcmVhdG9yCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDY4LTQ3MQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIFdBUk5JTkc6IFRoaXMgYXBwIGNhbiBiZSB1cGRhdGVkIGJ5IHRoZSBjcmVhdG9yCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gYXNzZXJ0IHNlbGYudXBkYXRhYmxlID09IFVJbnQ2NCgxKSwgIm5vdCBhcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGRhdGFibGUgZXhpc3RzCiAgICBpbnQgMQogICAgPT0KICAgIGFzc2VydCAvLyBub3QgYXBwcm92ZWQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5NZXNzZW5nZXIuX19pbml0X18oKSAtPiB2b2lkOgpfX2luaXRfXzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODgwCiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4MS04ODIKICAgIC8vICMgdXBncmFkZWFibGUgc3RhdGUKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA2CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJkZXBsb3ltZW50X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4MwogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg4NAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6ODg1CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCg==",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuTWVzc2VuZ2VyLmNsZWFyX3N0YXRlX3Byb2dyYW06CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5Ojg3OQogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgaW50IDEKICAgIHJldHVybgo="
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuTWVzc2VuZ2VyLmFwcHJvdmFsX3Byb2dyYW06CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fZW50cnlwb2ludEAyCiAgICBjYWxsc3ViIF9faW5pdF9fCgptYWluX2VudHJ5cG9pbnRAMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIyNwogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDE1CiAgICBtZXRob2QgInBhcnRrZXlfYnJvYXN0Y2FzdChhZGRyZXNzLGJ5dGVbMzJdLGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbNjRdKXZvaWQiCiAgICBtZXRob2QgInBhcnRrZXlfYnJvYXN0Y2FzdF9tYW55KChhZGRyZXNzLGJ5dGVbMzJdLGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbNjRdKVtdKXZvaWQiCiAgICBtZXRob2QgImVuYWJsZV9yZWdpc3RyeSgpdm9pZCIKICAgIG1ldGhvZCAiZ2V0X3BhcnRrZXkoYWRkcmVzcyxhZGRyZXNzKShhZGRyZXNzLGJ5dGVbMzJdLGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbNjRdKSIKICAgIG1ldGhvZCAiZ2V0X3BhcnRrZXlfYWRkcmVzc2VzKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkodWludDY0LGFkZHJlc3NbXSkiCiAgICBtZXRob2QgInNldF92ZXJzaW9uKHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiYXBwcm92ZV91cGRhdGUoYm9vbCl2b2lkIgogICAgbWV0aG9kICJncmFudF91cGdyYWRlcihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgInRyYW5zZmVyKGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fcGFydGtleV9icm9hc3RjYXN0X3JvdXRlQDQgbWFpbl9wYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueV9yb3V0ZUA1IG1haW5fZW5hYmxlX3JlZ2lzdHJ5X3JvdXRlQDYgbWFpbl9nZXRfcGFydGtleV9yb3V0ZUA3IG1haW5fZ2V0X3BhcnRrZXlfYWRkcmVzc2VzX3JvdXRlQDggbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUA5IG1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVAMTAgbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUAxMSBtYWluX3RyYW5zZmVyX3JvdXRlQDEyCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX3BhcnRrZXlfYnJvYXN0Y2FzdF9yb3V0ZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIyNwogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgcGFydGtleV9icm9hc3RjYXN0CiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3BhcnRrZXlfYnJvYXN0Y2FzdF9tYW55X3JvdXRlQDU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI3CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9lbmFibGVfcmVnaXN0cnlfcm91dGVANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI4OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGVuYWJsZV9yZWdpc3RyeQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfcGFydGtleV9yb3V0ZUA3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzAyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIyNwogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzAyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3BhcnRrZXkKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3BhcnRrZXlfYWRkcmVzc2VzX3JvdXRlQDg6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI3CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcGFydGtleV9hZGRyZXNzZXMKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGUgMHgwMDBhCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUA5OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI3CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF92ZXJzaW9uCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfdXBkYXRlX3JvdXRlQDEwOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI3CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGFwcHJvdmVfdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDExOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI3CiAgICAvLyBjbGFzcyBNZXNzZW5nZXIoTWVzc2VuZ2VySW50ZXJmYWNlLCBVcGdyYWRlYWJsZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGdyYW50X3VwZ3JhZGVyCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX3JvdXRlQDEyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxNToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIyNwogICAgLy8gY2xhc3MgTWVzc2VuZ2VyKE1lc3NlbmdlckludGVyZmFjZSwgVXBncmFkZWFibGUpOgogICAgaW50IDAKICAgIGludCA0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBtYXRjaCBtYWluX2NyZWF0ZUAxNiBtYWluX29uX3VwZGF0ZUAxNwogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9jcmVhdGVAMTY6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMjcKICAgIC8vIGNsYXNzIE1lc3NlbmdlcihNZXNzZW5nZXJJbnRlcmZhY2UsIFVwZ3JhZGVhYmxlKToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fb25fdXBkYXRlQDE3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzkKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzktNTQwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgY2FsbHN1YiBvbl91cGRhdGUKICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzcmMuY29udHJhY3QuTWVzc2VuZ2VyLnBhcnRrZXlfYnJvYXN0Y2FzdChhZGRyZXNzOiBieXRlcywgdm90ZV9rOiBieXRlcywgc2VsX2s6IGJ5dGVzLCB2b3RlX2ZzdDogYnl0ZXMsIHZvdGVfbHN0OiBieXRlcywgdm90ZV9rZDogYnl0ZXMsIHNwX2tleTogYnl0ZXMpIC0+IHZvaWQ6CnBhcnRrZXlfYnJvYXN0Y2FzdDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI0MS0xMjUxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwYXJ0a2V5X2Jyb2FzdGNhc3QoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBhZGRyZXNzOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgdm90ZV9rOiBCeXRlczMyLAogICAgLy8gICAgIHNlbF9rOiBCeXRlczMyLAogICAgLy8gICAgIHZvdGVfZnN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2xzdDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgdm90ZV9rZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgc3Bfa2V5OiBCeXRlczY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNyAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNTItMTI2MAogICAgLy8gcGFydGtleSA9IFBhcnRLZXlJbmZvKAogICAgLy8gICAgIGFkZHJlc3MsCiAgICAvLyAgICAgdm90ZV9rLmNvcHkoKSwKICAgIC8vICAgICBzZWxfay5jb3B5KCksCiAgICAvLyAgICAgdm90ZV9mc3QsCiAgICAvLyAgICAgdm90ZV9sc3QsCiAgICAvLyAgICAgdm90ZV9rZCwKICAgIC8vICAgICBzcF9rZXkuY29weSgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC03CiAgICBmcmFtZV9kaWcgLTYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI2MQogICAgLy8gYXJjNC5lbWl0KE1lc3NhZ2VQYXJ0S2V5SW5mbyhhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIHBhcnRrZXkuY29weSgpKSkKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbWV0aG9kICJNZXNzYWdlUGFydEtleUluZm8oYWRkcmVzcywoYWRkcmVzcyxieXRlWzMyXSxieXRlWzMyXSx1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzY0XSkpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIzNC0xMjM2CiAgICAvLyAjIHJlZ2lzdHJ5IHN0YXRlLCBpbiBib3hlcyBzbyBtZXNzZW5nZXIgdXBkYXRlZAogICAgLy8gIyAgIGluIHBsYWNlIGtlZXBzIGl0cyBnbG9iYWwgc2NoZW1hCiAgICAvLyBzZWxmLnJlZ2lzdHJ5ID0gQm94KFVJbnQ2NCwga2V5PWIicmVnaXN0cnkiKQogICAgYnl0ZSAweDcyNjU2NzY5NzM3NDcyNzkKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI2MgogICAgLy8gaWYgc2VsZi5yZWdpc3RyeToKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogcGFydGtleV9icm9hc3RjYXN0X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjYzCiAgICAvLyBtaW5fYmFsYW5jZSA9IGdldF9taW5fYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjY0CiAgICAvLyBzZWxmLnJlY29yZChwYXJ0a2V5KQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgcmVjb3JkCiAgICBwb3AKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI2NQogICAgLy8gc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlKQogICAgY2FsbHN1YiBzZXR0bGVfbWJyX3BheW1lbnQKCnBhcnRrZXlfYnJvYXN0Y2FzdF9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuZ2V0X21pbl9iYWxhbmNlKCkgLT4gdWludDY0OgpnZXRfbWluX2JhbGFuY2U6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjUxLTU4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfbWluX2JhbGFuY2UgKGludGVybmFsKQogICAgLy8gIyBwdXJwb3NlOiBnZXQgbWluIGJhbGFuY2Ugb2YgYXBwIGFjY291bnQsCiAgICAvLyAjICAgZ3Jvd3Mgd2l0aCBhcHBzIGNyZWF0ZWQgYnkgaXQKICAgIC8vICMgcmV0dXJuczogYXBwIG1pbiBiYWxhbmNlCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9taW5fYmFsYW5jZSgpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc3JjL3NyYy91dGlscy5weTo2MAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NTktNjEKICAgIC8vIG1pbl9iYWxhbmNlLCBleGlzdHMgPSBvcC5BY2N0UGFyYW1zR2V0LmFjY3RfbWluX2JhbGFuY2UoCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKQogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBwb3AKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjIKICAgIC8vIHJldHVybiBtaW5fYmFsYW5jZQogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0Lk1lc3Nlbmdlci5yZWNvcmQocGFydGtleTogYnl0ZXMpIC0+IGJ5dGVzOgpyZWNvcmQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzMzAtMTMzMQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWNvcmQoc2VsZiwgcGFydGtleTogUGFydEtleUluZm8pIC0+IE5vbmU6CiAgICBwcm90byAxIDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzNwogICAgLy8ga2V5ID0gVHhuLnNlbmRlci5ieXRlcyArIHBhcnRrZXkuYWRkcmVzcy5ieXRlcwogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzctMTMzOAogICAgLy8gICAgICMga2V5ZWQgYnkgc2VuZGVyIGFuZCBhZGRyZXNzIHdpdGhvdXQgcHJlZml4LCBib3ggbmFtZXMgYXJlCiAgICAvLyAgICAgIyAgIGF0IG1vc3QgNjQgYnl0ZXMKICAgIC8vICAgICBzZWxmLnBhcnRrZXlzID0gQm94TWFwKEJ5dGVzLCBQYXJ0S2V5SW5mbywga2V5X3ByZWZpeD1iIiIpCiAgICAvLyAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBhcnRrZXlfYnJvYXN0Y2FzdCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGFkZHJlc3M6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICB2b3RlX2s6IEJ5dGVzMzIsCiAgICAvLyAgICAgc2VsX2s6IEJ5dGVzMzIsCiAgICAvLyAgICAgdm90ZV9mc3Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHZvdGVfbHN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2tkOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBzcF9rZXk6IEJ5dGVzNjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICAvLyAgICAgcGFydGtleSA9IFBhcnRLZXlJbmZvKAogICAgLy8gICAgICAgICBhZGRyZXNzLAogICAgLy8gICAgICAgICB2b3RlX2suY29weSgpLAogICAgLy8gICAgICAgICBzZWxfay5jb3B5KCksCiAgICAvLyAgICAgICAgIHZvdGVfZnN0LAogICAgLy8gICAgICAgICB2b3RlX2xzdCwKICAgIC8vICAgICAgICAgdm90ZV9rZCwKICAgIC8vICAgICAgICAgc3Bfa2V5LmNvcHkoKSwKICAgIC8vICAgICApCiAgICAvLyAgICAgYXJjNC5lbWl0KE1lc3NhZ2VQYXJ0S2V5SW5mbyhhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIHBhcnRrZXkuY29weSgpKSkKICAgIC8vICAgICBpZiBzZWxmLnJlZ2lzdHJ5OgogICAgLy8gICAgICAgICBtaW5fYmFsYW5jZSA9IGdldF9taW5fYmFsYW5jZSgpCiAgICAvLyAgICAgICAgIHNlbGYucmVjb3JkKHBhcnRrZXkpCiAgICAvLyAgICAgICAgIHNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZSkKICAgIC8vIAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcGFydGtleV9icm9hc3RjYXN0X21hbnkoCiAgICAvLyAgICAgc2VsZiwgcGFydGtleXM6IGFyYzQuRHluYW1pY0FycmF5W1BhcnRLZXlJbmZvXQogICAgLy8gKSAtPiBOb25lOgogICAgLy8gICAgICIiIgogICAgLy8gICAgIEJyb2FzdGNhc3QgcGFydGtleSBpbmZvcm1hdGlvbiBvZiBtYW55IGFkZHJlc3NlcywgZW1pdHMgb25lCiAgICAvLyAgICAgTWVzc2FnZVBhcnRLZXlJbmZvIHBlciBhZGRyZXNzIGxpa2UgcGFydGtleV9icm9hc3RjYXN0LgogICAgLy8gICAgICIiIgogICAgLy8gICAgICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gICAgIGFzc2VydCBwYXJ0a2V5cy5sZW5ndGggPiAwLCAicGFydGtleXMgbm90IGVtcHR5IgogICAgLy8gICAgICMgZWFjaCBsb2cgaXMgMjIwIGJ5dGVzIG9mIHRoZSAxMDI0IGJ5dGVzIG9mIGxvZ3MgcGVyIGNhbGwKICAgIC8vICAgICBhc3NlcnQgcGFydGtleXMubGVuZ3RoIDw9IDQsICJwYXJ0a2V5cyBhdCBtb3N0IDQiCiAgICAvLyAgICAgIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAgICAgbWluX2JhbGFuY2UgPSBnZXRfbWluX2JhbGFuY2UoKQogICAgLy8gICAgIGZvciBpIGluIHVyYW5nZShwYXJ0a2V5cy5sZW5ndGgpOgogICAgLy8gICAgICAgICBwYXJ0a2V5ID0gcGFydGtleXNbaV0uY29weSgpCiAgICAvLyAgICAgICAgIGFyYzQuZW1pdChNZXNzYWdlUGFydEtleUluZm8oYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBwYXJ0a2V5LmNvcHkoKSkpCiAgICAvLyAgICAgICAgIGlmIHNlbGYucmVnaXN0cnk6CiAgICAvLyAgICAgICAgICAgICBzZWxmLnJlY29yZChwYXJ0a2V5KQogICAgLy8gICAgIGlmIHNlbGYucmVnaXN0cnk6CiAgICAvLyAgICAgICAgIHNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZSkKICAgIC8vIAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZW5hYmxlX3JlZ2lzdHJ5KHNlbGYpIC0+IE5vbmU6CiAgICAvLyAgICAgIiIiCiAgICAvLyAgICAgS2VlcCBsYXRlc3QgcGFydGtleSBicm9hZGNhc3QgYnkgZWFjaCBzZW5kZXIgZm9yIGVhY2ggYWRkcmVzcwogICAgLy8gICAgIGluIGJveCByZWdpc3RyeSBmcm9tIG5vdyBvbi4gU2VuZGVycyBwYXkgZm9yIHRoZSBib3hlcywKICAgIC8vICAgICB1cGdyYWRlciBmb3IgdGhlIHJlZ2lzdHJ5IGJveCB3aXRoIGEgcGF5bWVudCBwcmVjZWRpbmcgY2FsbC4KICAgIC8vICAgICBDYW4gbm90IGJlIGRpc2FibGVkLgogICAgLy8gICAgICIiIgogICAgLy8gICAgIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgLy8gICAgIG1pbl9iYWxhbmNlID0gZ2V0X21pbl9iYWxhbmNlKCkKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5LnZhbHVlID0gVUludDY0KDEpCiAgICAvLyAgICAgc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlKQogICAgLy8gCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcGFydGtleShzZWxmLCB3aG86IGFyYzQuQWRkcmVzcywgYWRkcmVzczogYXJjNC5BZGRyZXNzKSAtPiBQYXJ0S2V5SW5mbzoKICAgIC8vICAgICAiIiIKICAgIC8vICAgICBHZXQgbGF0ZXN0IHBhcnRrZXkgYnJvYWRjYXN0IGJ5IHdobyBmb3IgYWRkcmVzcy4KICAgIC8vICAgICAiIiIKICAgIC8vICAgICBrZXkgPSB3aG8uYnl0ZXMgKyBhZGRyZXNzLmJ5dGVzCiAgICAvLyAgICAgYXNzZXJ0IGtleSBpbiBzZWxmLnBhcnRrZXlzLCAicGFydGtleSByZWdpc3RlcmVkIgogICAgLy8gICAgIHJldHVybiBzZWxmLnBhcnRrZXlzW2tleV0KICAgIC8vIAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3BhcnRrZXlfYWRkcmVzc2VzKAogICAgLy8gICAgIHNlbGYsIHdobzogYXJjNC5BZGRyZXNzLCBvZmZzZXQ6IGFyYzQuVUludDY0LCBsaW1pdDogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gdHVwbGVbVUludDY0LCBhcmM0LkR5bmFtaWNBcnJheVthcmM0LkFkZHJlc3NdXToKICAgIC8vICAgICAiIiIKICAgIC8vICAgICBHZXQgcGFnZSBvZiBhZGRyZXNzZXMgd2hvIGJyb2FkY2FzdCBwYXJ0a2V5cyBmb3IsIGluIG9yZGVyIG9mCiAgICAvLyAgICAgZmlyc3QgYnJvYWRjYXN0LgogICAgLy8gCiAgICAvLyAgICAgUmV0dXJuczoKICAgIC8vICAgICAtIG51bWJlciBvZiBhZGRyZXNzZXMKICAgIC8vICAgICAtIGFkZHJlc3NlcyBmcm9tIG9mZnNldCwgYXQgbW9zdCBsaW1pdCwgYXQgbW9zdCAzMQogICAgLy8gICAgICIiIgogICAgLy8gICAgIGNvdW50LCBhZGRyZXNzZXMgPSBnZXRfcGFnZWQoCiAgICAvLyAgICAgICAgIGIiYSIgKyB3aG8uYnl0ZXMsIG9mZnNldC5uYXRpdmUsIGxpbWl0Lm5hdGl2ZSwgVUludDY0KDMyKSwgVUludDY0KDMxKQogICAgLy8gICAgICkKICAgIC8vICAgICByZXR1cm4gY291bnQsIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuQWRkcmVzc10uZnJvbV9ieXRlcygKICAgIC8vICAgICAgICAgYXJjNC5VSW50MTYoYWRkcmVzc2VzLmxlbmd0aCAvLyAzMikuYnl0ZXMgKyBhZGRyZXNzZXMKICAgIC8vICAgICApCiAgICAvLyAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVjb3JkKHNlbGYsIHBhcnRrZXk6IFBhcnRLZXlJbmZvKSAtPiBOb25lOgogICAgLy8gICAgICIiIgogICAgLy8gICAgIFJlY29yZCBwYXJ0a2V5IGJyb2FkY2FzdCBieSBzZW5kZXIsIGFkZHJlc3NlcyBpbiBwYWdlcyBvZiAzMQogICAgLy8gICAgIGFkZHJlc3NlcywgOTkyIGJ5dGVzLCBzbyBhIHBhZ2UgZml0cyB0aGUgMTAyNCBieXRlcyBvZiB0aGUKICAgIC8vICAgICBnZXRfcGFydGtleV9hZGRyZXNzZXMgcmV0dXJuIGxvZy4KICAgIC8vICAgICAiIiIKICAgIC8vICAgICBrZXkgPSBUeG4uc2VuZGVyLmJ5dGVzICsgcGFydGtleS5hZGRyZXNzLmJ5dGVzCiAgICAvLyAgICAgaWYga2V5IG5vdCBpbiBzZWxmLnBhcnRrZXlzOgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogcmVjb3JkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzQwCiAgICAvLyBiImEiICsgVHhuLnNlbmRlci5ieXRlcywgcGFydGtleS5hZGRyZXNzLmJ5dGVzLCBVSW50NjQoMzEpCiAgICBieXRlIDB4NjEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzM5LTEzNDEKICAgIC8vIGFwcGVuZF9wYWdlZCgKICAgIC8vICAgICBiImEiICsgVHhuLnNlbmRlci5ieXRlcywgcGFydGtleS5hZGRyZXNzLmJ5dGVzLCBVSW50NjQoMzEpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzQwCiAgICAvLyBiImEiICsgVHhuLnNlbmRlci5ieXRlcywgcGFydGtleS5hZGRyZXNzLmJ5dGVzLCBVSW50NjQoMzEpCiAgICBpbnQgMzEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMzOS0xMzQxCiAgICAvLyBhcHBlbmRfcGFnZWQoCiAgICAvLyAgICAgYiJhIiArIFR4bi5zZW5kZXIuYnl0ZXMsIHBhcnRrZXkuYWRkcmVzcy5ieXRlcywgVUludDY0KDMxKQogICAgLy8gKQogICAgY2FsbHN1YiBhcHBlbmRfcGFnZWQKCnJlY29yZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEzNDIKICAgIC8vIHNlbGYucGFydGtleXNba2V5XSA9IHBhcnRrZXkuY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLmFwcGVuZF9wYWdlZChrZXk6IGJ5dGVzLCBpdGVtOiBieXRlcywgcGFnZV9zaXplOiB1aW50NjQpIC0+IHZvaWQ6CmFwcGVuZF9wYWdlZDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTEyLTEyNAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogYXBwZW5kX3BhZ2VkIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGtleSwgbGlzdCBrZXksIGJveCBrZXkgaG9sZHMgaXRlbSBjb3VudCwKICAgIC8vICMgICBib3gga2V5ICsgcGFnZSBpbmRleCBob2xkcyBwYWdlIG9mIGl0ZW1zCiAgICAvLyAjIC0gaXRlbSwgZml4ZWQgc2l6ZSBpdGVtCiAgICAvLyAjIC0gcGFnZV9zaXplLCBpdGVtcyBwZXIgcGFnZSwgcGFnZXMgYXJlCiAgICAvLyAjICAgYXQgbW9zdCAxS0IgdG8gYmUgcmVhZCB3aXRoIG9uZSBib3ggcmVmCiAgICAvLyAjIHB1cnBvc2U6IGFwcGVuZCBpdGVtIHRvIGxpc3Qga2VwdCBpbiBwYWdlcwogICAgLy8gIyAgIHdyaXRpbmcgb25seSBjb3VudCBhbmQgbGFzdCBwYWdlCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFwcGVuZF9wYWdlZChrZXk6IEJ5dGVzLCBpdGVtOiBCeXRlcywgcGFnZV9zaXplOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIGJ5dGUgIiIKICAgIGR1cAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMjUKICAgIC8vIGNvdW50ID0gVUludDY0KDApCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMjYKICAgIC8vIGNvdW50X2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGtleSkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2dldAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMjcKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGFwcGVuZF9wYWdlZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI4CiAgICAvLyBjb3VudCA9IG9wLmJ0b2koY291bnRfYnl0ZXMpCiAgICBmcmFtZV9kaWcgMwogICAgYnRvaQogICAgZnJhbWVfYnVyeSAyCgphcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMjkKICAgIC8vIHBhZ2Vfa2V5ID0ga2V5ICsgb3AuaXRvYihjb3VudCAvLyBwYWdlX3NpemUpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIC8KICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzMAogICAgLy8gb2Zmc2V0ID0gKGNvdW50ICUgcGFnZV9zaXplKSAqIGl0ZW0ubGVuZ3RoCiAgICBmcmFtZV9kaWcgLTEKICAgICUKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgKgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTMxCiAgICAvLyBpZiBvZmZzZXQgPT0gMDoKICAgIGJueiBhcHBlbmRfcGFnZWRfZWxzZV9ib2R5QDQKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTMyCiAgICAvLyBvcC5Cb3gucHV0KHBhZ2Vfa2V5LCBpdGVtKQogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfcHV0CiAgICBiIGFwcGVuZF9wYWdlZF9hZnRlcl9pZl9lbHNlQDUKCmFwcGVuZF9wYWdlZF9lbHNlX2JvZHlANDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTM0CiAgICAvLyBvcC5Cb3gucmVzaXplKHBhZ2Vfa2V5LCBvZmZzZXQgKyBpdGVtLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGZyYW1lX2RpZyAxCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVzaXplCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzNQogICAgLy8gb3AuQm94LnJlcGxhY2UocGFnZV9rZXksIG9mZnNldCwgaXRlbSkKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X3JlcGxhY2UKCmFwcGVuZF9wYWdlZF9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzNgogICAgLy8gb3AuQm94LnB1dChrZXksIG9wLml0b2IoY291bnQgKyAxKSkKICAgIGZyYW1lX2RpZyAyCiAgICBpbnQgMQogICAgKwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlOiB1aW50NjQpIC0+IHZvaWQ6CnNldHRsZV9tYnJfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjUtNzkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHNldHRsZV9tYnJfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBtaW5fYmFsYW5jZSwgYXBwIG1pbiBiYWxhbmNlIGJlZm9yZSBib3hlcwogICAgLy8gIyAgIHdlcmUgd3JpdHRlbgogICAgLy8gIyBwdXJwb3NlOiByZXF1aXJlIHBheW1lbnQgcHJlY2VkaW5nIGNhbGwgZnJvbQogICAgLy8gIyAgIHNlbmRlciBjb3ZlcmluZyBtaW4gYmFsYW5jZSBpbmNyZWFzZSBzaW5jZQogICAgLy8gIyAgIG1pbl9iYWxhbmNlLCByZWZ1bmQgZXhjZXNzIHRvIHNlbmRlcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBwYXltZW50IG9ubHkgcmVxdWlyZWQgd2hlbiBtaW4gYmFsYW5jZQogICAgLy8gIyAgIGluY3JlYXNlZCwgcmVmdW5kZWQgaW4gZnVsbCBvdGhlcndpc2UKICAgIC8vICMgLSByZWZ1bmQgY29zdHMgMSBmZWUsIHBvb2xlZCBieSBzZW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODAKICAgIC8vIG1icl9pbmNyZWFzZSA9IGdldF9taW5fYmFsYW5jZSgpIC0gbWluX2JhbGFuY2UKICAgIGNhbGxzdWIgZ2V0X21pbl9iYWxhbmNlCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGR1cAogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MQogICAgLy8gaWYgbWJyX2luY3JlYXNlID4gMDoKICAgIGJ6IHNldHRsZV9tYnJfcGF5bWVudF9lbHNlX2JvZHlAMgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MgogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MwogICAgLy8gYXNzZXJ0IHBheW1lbnRfYW1vdW50ID49IG1icl9pbmNyZWFzZSwgInBheW1lbnQgYW1vdW50IGFjY3VyYXRlIgogICAgZnJhbWVfZGlnIDEKICAgID49CiAgICBhc3NlcnQgLy8gcGF5bWVudCBhbW91bnQgYWNjdXJhdGUKICAgIGIgc2V0dGxlX21icl9wYXltZW50X2FmdGVyX2lmX2Vsc2VAMwoKc2V0dGxlX21icl9wYXltZW50X2Vsc2VfYm9keUAyOgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4NQogICAgLy8gcGF5bWVudF9hbW91bnQgPSBnZXRfcGF5bWVudF9hbW91bnQoKQogICAgY2FsbHN1YiBnZXRfcGF5bWVudF9hbW91bnQKICAgIGZyYW1lX2J1cnkgMAoKc2V0dGxlX21icl9wYXltZW50X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODYKICAgIC8vIGlmIHBheW1lbnRfYW1vdW50ID4gbWJyX2luY3JlYXNlOgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICA+CiAgICBieiBzZXR0bGVfbWJyX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg3LTg5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4OAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy91dGlscy5weTo4OAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg3LTg5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCnNldHRsZV9tYnJfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDY6CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMucmVxdWlyZV9wYXltZW50KHdobzogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVxdWlyZV9wYXltZW50OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNi0yNAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcmVxdWlyZV9wYXltZW50IChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGNoZWNrIHBheW1lbnQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlcXVpcmVfcGF5bWVudCh3aG86IEFjY291bnQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy91dGlscy5weToyNQogICAgLy8gcmVmX2dyb3VwX2luZGV4ID0gVHhuLmdyb3VwX2luZGV4CiAgICB0eG4gR3JvdXBJbmRleAogICAgLy8gc3JjL3NyYy91dGlscy5weToyNgogICAgLy8gYXNzZXJ0IHJlZl9ncm91cF9pbmRleCA+IDAsICJncm91cCBpbmRleCBncmVhdGVyIHRoYW4gemVybyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIGdyb3VwIGluZGV4IGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI3CiAgICAvLyBwYXltZW50X2dyb3VwX2luZGV4ID0gcmVmX2dyb3VwX2luZGV4IC0gMQogICAgaW50IDEKICAgIC0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjkKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnNlbmRlciA9PSB3aG8KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGR1cAogICAgZ3R4bnMgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI4LTMwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnNlbmRlciA9PSB3aG8KICAgIC8vICksICJwYXltZW50IHNlbmRlciBhY2N1cmF0ZSIKICAgIGFzc2VydCAvLyBwYXltZW50IHNlbmRlciBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy91dGlscy5weTozMgogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzMKICAgIC8vID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMyLTMzCiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5yZWNlaXZlcgogICAgLy8gPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzEtMzQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIC8vICAgICA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAicGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZSIKICAgIGFzc2VydCAvLyBwYXltZW50IHJlY2VpdmVyIGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjM1CiAgICAvLyByZXR1cm4gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkuYW1vdW50CiAgICBndHhucyBBbW91bnQKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5nZXRfcGF5bWVudF9hbW91bnQoKSAtPiB1aW50NjQ6CmdldF9wYXltZW50X2Ftb3VudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6OTItOTkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9wYXltZW50X2Ftb3VudCAoaW50ZXJuYWwpCiAgICAvLyAjIHB1cnBvc2U6IGFtb3VudCBvZiBvcHRpb25hbCBwYXltZW50IHByZWNlZGluZwogICAgLy8gIyAgIGNhbGwgZnJvbSBzZW5kZXIgdG8gYXBwCiAgICAvLyAjIHJldHVybnM6IHBheW1lbnQgYW1vdW50LCAwIHdpdGhvdXQgcGF5bWVudAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfcGF5bWVudF9hbW91bnQoKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTAwCiAgICAvLyBpZiBUeG4uZ3JvdXBfaW5kZXggPT0gMDoKICAgIHR4biBHcm91cEluZGV4CiAgICBibnogZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDEKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludCAwCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwMgogICAgLy8gcGF5bWVudCA9IGd0eG4uVHJhbnNhY3Rpb24oVHhuLmdyb3VwX2luZGV4IC0gMSkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA0CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDQtMTA2CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIC8vIGFuZCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBieiBnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNQogICAgLy8gYW5kIHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNC0xMDYKICAgIC8vIHBheW1lbnQudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuUGF5bWVudAogICAgLy8gYW5kIHBheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIC8vIGFuZCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGJ6IGdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA2CiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgMAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDQtMTA2CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIC8vIGFuZCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBieiBnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwOAogICAgLy8gcmV0dXJuIHBheW1lbnQuYW1vdW50CiAgICBmcmFtZV9kaWcgMAogICAgZ3R4bnMgQW1vdW50CiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwOQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50IDAKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5NZXNzZW5nZXIucGFydGtleV9icm9hc3RjYXN0X21hbnkocGFydGtleXM6IGJ5dGVzKSAtPiB2b2lkOgpwYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI2Ny0xMjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueSgKICAgIC8vICAgICBzZWxmLCBwYXJ0a2V5czogYXJjNC5EeW5hbWljQXJyYXlbUGFydEtleUluZm9dCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNzUtMTI3NgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgcGFydGtleXMubGVuZ3RoID4gMCwgInBhcnRrZXlzIG5vdCBlbXB0eSIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIGFzc2VydCAvLyBwYXJ0a2V5cyBub3QgZW1wdHkKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI3Ny0xMjc4CiAgICAvLyAjIGVhY2ggbG9nIGlzIDIyMCBieXRlcyBvZiB0aGUgMTAyNCBieXRlcyBvZiBsb2dzIHBlciBjYWxsCiAgICAvLyBhc3NlcnQgcGFydGtleXMubGVuZ3RoIDw9IDQsICJwYXJ0a2V5cyBhdCBtb3N0IDQiCiAgICBpbnQgNAogICAgPD0KICAgIGFzc2VydCAvLyBwYXJ0a2V5cyBhdCBtb3N0IDQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI3OS0xMjgwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIG1pbl9iYWxhbmNlID0gZ2V0X21pbl9iYWxhbmNlKCkKICAgIGNhbGxzdWIgZ2V0X21pbl9iYWxhbmNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyODEKICAgIC8vIGZvciBpIGluIHVyYW5nZShwYXJ0a2V5cy5sZW5ndGgpOgogICAgaW50IDAKCnBhcnRrZXlfYnJvYXN0Y2FzdF9tYW55X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI4MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHBhcnRrZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IHBhcnRrZXlfYnJvYXN0Y2FzdF9tYW55X2FmdGVyX2ZvckA2CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyODIKICAgIC8vIHBhcnRrZXkgPSBwYXJ0a2V5c1tpXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBpbnQgMTg0CiAgICAqCiAgICBpbnQgMTg0CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyODMKICAgIC8vIGFyYzQuZW1pdChNZXNzYWdlUGFydEtleUluZm8oYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBwYXJ0a2V5LmNvcHkoKSkpCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIG1ldGhvZCAiTWVzc2FnZVBhcnRLZXlJbmZvKGFkZHJlc3MsKGFkZHJlc3MsYnl0ZVszMl0sYnl0ZVszMl0sdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVs2NF0pKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzQtMTIzNgogICAgLy8gIyByZWdpc3RyeSBzdGF0ZSwgaW4gYm94ZXMgc28gbWVzc2VuZ2VyIHVwZGF0ZWQKICAgIC8vICMgICBpbiBwbGFjZSBrZWVwcyBpdHMgZ2xvYmFsIHNjaGVtYQogICAgLy8gc2VsZi5yZWdpc3RyeSA9IEJveChVSW50NjQsIGtleT1iInJlZ2lzdHJ5IikKICAgIGJ5dGUgMHg3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyODQKICAgIC8vIGlmIHNlbGYucmVnaXN0cnk6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IHBhcnRrZXlfYnJvYXN0Y2FzdF9tYW55X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjg1CiAgICAvLyBzZWxmLnJlY29yZChwYXJ0a2V5KQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgcmVjb3JkCiAgICBwb3AKCnBhcnRrZXlfYnJvYXN0Y2FzdF9tYW55X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI4MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHBhcnRrZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMwogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBwYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueV9mb3JfaGVhZGVyQDEKCnBhcnRrZXlfYnJvYXN0Y2FzdF9tYW55X2FmdGVyX2ZvckA2OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjM0LTEyMzYKICAgIC8vICMgcmVnaXN0cnkgc3RhdGUsIGluIGJveGVzIHNvIG1lc3NlbmdlciB1cGRhdGVkCiAgICAvLyAjICAgaW4gcGxhY2Uga2VlcHMgaXRzIGdsb2JhbCBzY2hlbWEKICAgIC8vIHNlbGYucmVnaXN0cnkgPSBCb3goVUludDY0LCBrZXk9YiJyZWdpc3RyeSIpCiAgICBieXRlIDB4NzI2NTY3Njk3Mzc0NzI3OQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjg2CiAgICAvLyBpZiBzZWxmLnJlZ2lzdHJ5OgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBwYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueV9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI4NwogICAgLy8gc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlKQogICAgZnJhbWVfZGlnIDIKICAgIGNhbGxzdWIgc2V0dGxlX21icl9wYXltZW50CgpwYXJ0a2V5X2Jyb2FzdGNhc3RfbWFueV9hZnRlcl9pZl9lbHNlQDg6CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuTWVzc2VuZ2VyLmVuYWJsZV9yZWdpc3RyeSgpIC0+IHZvaWQ6CmVuYWJsZV9yZWdpc3RyeToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI4OS0xMjkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBlbmFibGVfcmVnaXN0cnkoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjk3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyOTcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyOTgKICAgIC8vIG1pbl9iYWxhbmNlID0gZ2V0X21pbl9iYWxhbmNlKCkKICAgIGNhbGxzdWIgZ2V0X21pbl9iYWxhbmNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyOTkKICAgIC8vIHNlbGYucmVnaXN0cnkudmFsdWUgPSBVSW50NjQoMSkKICAgIGludCAxCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzQtMTIzNgogICAgLy8gIyByZWdpc3RyeSBzdGF0ZSwgaW4gYm94ZXMgc28gbWVzc2VuZ2VyIHVwZGF0ZWQKICAgIC8vICMgICBpbiBwbGFjZSBrZWVwcyBpdHMgZ2xvYmFsIHNjaGVtYQogICAgLy8gc2VsZi5yZWdpc3RyeSA9IEJveChVSW50NjQsIGtleT1iInJlZ2lzdHJ5IikKICAgIGJ5dGUgMHg3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyOTkKICAgIC8vIHNlbGYucmVnaXN0cnkudmFsdWUgPSBVSW50NjQoMSkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMwMAogICAgLy8gc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlKQogICAgY2FsbHN1YiBzZXR0bGVfbWJyX3BheW1lbnQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5NZXNzZW5nZXIuZ2V0X3BhcnRrZXkod2hvOiBieXRlcywgYWRkcmVzczogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfcGFydGtleToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMwMi0xMzAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcGFydGtleShzZWxmLCB3aG86IGFyYzQuQWRkcmVzcywgYWRkcmVzczogYXJjNC5BZGRyZXNzKSAtPiBQYXJ0S2V5SW5mbzoKICAgIHByb3RvIDIgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzA3CiAgICAvLyBrZXkgPSB3aG8uYnl0ZXMgKyBhZGRyZXNzLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzctMTMwOAogICAgLy8gICAgICMga2V5ZWQgYnkgc2VuZGVyIGFuZCBhZGRyZXNzIHdpdGhvdXQgcHJlZml4LCBib3ggbmFtZXMgYXJlCiAgICAvLyAgICAgIyAgIGF0IG1vc3QgNjQgYnl0ZXMKICAgIC8vICAgICBzZWxmLnBhcnRrZXlzID0gQm94TWFwKEJ5dGVzLCBQYXJ0S2V5SW5mbywga2V5X3ByZWZpeD1iIiIpCiAgICAvLyAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBhcnRrZXlfYnJvYXN0Y2FzdCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGFkZHJlc3M6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICB2b3RlX2s6IEJ5dGVzMzIsCiAgICAvLyAgICAgc2VsX2s6IEJ5dGVzMzIsCiAgICAvLyAgICAgdm90ZV9mc3Q6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHZvdGVfbHN0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICB2b3RlX2tkOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBzcF9rZXk6IEJ5dGVzNjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICAvLyAgICAgcGFydGtleSA9IFBhcnRLZXlJbmZvKAogICAgLy8gICAgICAgICBhZGRyZXNzLAogICAgLy8gICAgICAgICB2b3RlX2suY29weSgpLAogICAgLy8gICAgICAgICBzZWxfay5jb3B5KCksCiAgICAvLyAgICAgICAgIHZvdGVfZnN0LAogICAgLy8gICAgICAgICB2b3RlX2xzdCwKICAgIC8vICAgICAgICAgdm90ZV9rZCwKICAgIC8vICAgICAgICAgc3Bfa2V5LmNvcHkoKSwKICAgIC8vICAgICApCiAgICAvLyAgICAgYXJjNC5lbWl0KE1lc3NhZ2VQYXJ0S2V5SW5mbyhhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIHBhcnRrZXkuY29weSgpKSkKICAgIC8vICAgICBpZiBzZWxmLnJlZ2lzdHJ5OgogICAgLy8gICAgICAgICBtaW5fYmFsYW5jZSA9IGdldF9taW5fYmFsYW5jZSgpCiAgICAvLyAgICAgICAgIHNlbGYucmVjb3JkKHBhcnRrZXkpCiAgICAvLyAgICAgICAgIHNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZSkKICAgIC8vIAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcGFydGtleV9icm9hc3RjYXN0X21hbnkoCiAgICAvLyAgICAgc2VsZiwgcGFydGtleXM6IGFyYzQuRHluYW1pY0FycmF5W1BhcnRLZXlJbmZvXQogICAgLy8gKSAtPiBOb25lOgogICAgLy8gICAgICIiIgogICAgLy8gICAgIEJyb2FzdGNhc3QgcGFydGtleSBpbmZvcm1hdGlvbiBvZiBtYW55IGFkZHJlc3NlcywgZW1pdHMgb25lCiAgICAvLyAgICAgTWVzc2FnZVBhcnRLZXlJbmZvIHBlciBhZGRyZXNzIGxpa2UgcGFydGtleV9icm9hc3RjYXN0LgogICAgLy8gICAgICIiIgogICAgLy8gICAgICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gICAgIGFzc2VydCBwYXJ0a2V5cy5sZW5ndGggPiAwLCAicGFydGtleXMgbm90IGVtcHR5IgogICAgLy8gICAgICMgZWFjaCBsb2cgaXMgMjIwIGJ5dGVzIG9mIHRoZSAxMDI0IGJ5dGVzIG9mIGxvZ3MgcGVyIGNhbGwKICAgIC8vICAgICBhc3NlcnQgcGFydGtleXMubGVuZ3RoIDw9IDQsICJwYXJ0a2V5cyBhdCBtb3N0IDQiCiAgICAvLyAgICAgIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAgICAgbWluX2JhbGFuY2UgPSBnZXRfbWluX2JhbGFuY2UoKQogICAgLy8gICAgIGZvciBpIGluIHVyYW5nZShwYXJ0a2V5cy5sZW5ndGgpOgogICAgLy8gICAgICAgICBwYXJ0a2V5ID0gcGFydGtleXNbaV0uY29weSgpCiAgICAvLyAgICAgICAgIGFyYzQuZW1pdChNZXNzYWdlUGFydEtleUluZm8oYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBwYXJ0a2V5LmNvcHkoKSkpCiAgICAvLyAgICAgICAgIGlmIHNlbGYucmVnaXN0cnk6CiAgICAvLyAgICAgICAgICAgICBzZWxmLnJlY29yZChwYXJ0a2V5KQogICAgLy8gICAgIGlmIHNlbGYucmVnaXN0cnk6CiAgICAvLyAgICAgICAgIHNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZSkKICAgIC8vIAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZW5hYmxlX3JlZ2lzdHJ5KHNlbGYpIC0+IE5vbmU6CiAgICAvLyAgICAgIiIiCiAgICAvLyAgICAgS2VlcCBsYXRlc3QgcGFydGtleSBicm9hZGNhc3QgYnkgZWFjaCBzZW5kZXIgZm9yIGVhY2ggYWRkcmVzcwogICAgLy8gICAgIGluIGJveCByZWdpc3RyeSBmcm9tIG5vdyBvbi4gU2VuZGVycyBwYXkgZm9yIHRoZSBib3hlcywKICAgIC8vICAgICB1cGdyYWRlciBmb3IgdGhlIHJlZ2lzdHJ5IGJveCB3aXRoIGEgcGF5bWVudCBwcmVjZWRpbmcgY2FsbC4KICAgIC8vICAgICBDYW4gbm90IGJlIGRpc2FibGVkLgogICAgLy8gICAgICIiIgogICAgLy8gICAgIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgLy8gICAgIG1pbl9iYWxhbmNlID0gZ2V0X21pbl9iYWxhbmNlKCkKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5LnZhbHVlID0gVUludDY0KDEpCiAgICAvLyAgICAgc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlKQogICAgLy8gCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcGFydGtleShzZWxmLCB3aG86IGFyYzQuQWRkcmVzcywgYWRkcmVzczogYXJjNC5BZGRyZXNzKSAtPiBQYXJ0S2V5SW5mbzoKICAgIC8vICAgICAiIiIKICAgIC8vICAgICBHZXQgbGF0ZXN0IHBhcnRrZXkgYnJvYWRjYXN0IGJ5IHdobyBmb3IgYWRkcmVzcy4KICAgIC8vICAgICAiIiIKICAgIC8vICAgICBrZXkgPSB3aG8uYnl0ZXMgKyBhZGRyZXNzLmJ5dGVzCiAgICAvLyAgICAgYXNzZXJ0IGtleSBpbiBzZWxmLnBhcnRrZXlzLCAicGFydGtleSByZWdpc3RlcmVkIgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMwOAogICAgLy8gYXNzZXJ0IGtleSBpbiBzZWxmLnBhcnRrZXlzLCAicGFydGtleSByZWdpc3RlcmVkIgogICAgYXNzZXJ0IC8vIHBhcnRrZXkgcmVnaXN0ZXJlZAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzA5CiAgICAvLyByZXR1cm4gc2VsZi5wYXJ0a2V5c1trZXldCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJ0a2V5cyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5NZXNzZW5nZXIuZ2V0X3BhcnRrZXlfYWRkcmVzc2VzKHdobzogYnl0ZXMsIG9mZnNldDogYnl0ZXMsIGxpbWl0OiBieXRlcykgLT4gdWludDY0LCBieXRlczoKZ2V0X3BhcnRrZXlfYWRkcmVzc2VzOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMzExLTEzMTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9wYXJ0a2V5X2FkZHJlc3NlcygKICAgIC8vICAgICBzZWxmLCB3aG86IGFyYzQuQWRkcmVzcywgb2Zmc2V0OiBhcmM0LlVJbnQ2NCwgbGltaXQ6IGFyYzQuVUludDY0CiAgICAvLyApIC0+IHR1cGxlW1VJbnQ2NCwgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXV06CiAgICBwcm90byAzIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyNAogICAgLy8gYiJhIiArIHdoby5ieXRlcywgb2Zmc2V0Lm5hdGl2ZSwgbGltaXQubmF0aXZlLCBVSW50NjQoMzIpLCBVSW50NjQoMzEpCiAgICBieXRlIDB4NjEKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgaW50IDMyCiAgICBpbnQgMzEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyMy0xMzI1CiAgICAvLyBjb3VudCwgYWRkcmVzc2VzID0gZ2V0X3BhZ2VkKAogICAgLy8gICAgIGIiYSIgKyB3aG8uYnl0ZXMsIG9mZnNldC5uYXRpdmUsIGxpbWl0Lm5hdGl2ZSwgVUludDY0KDMyKSwgVUludDY0KDMxKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfcGFnZWQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyNwogICAgLy8gYXJjNC5VSW50MTYoYWRkcmVzc2VzLmxlbmd0aCAvLyAzMikuYnl0ZXMgKyBhZGRyZXNzZXMKICAgIGR1cAogICAgbGVuCiAgICBpbnQgMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTMyNi0xMzI4CiAgICAvLyByZXR1cm4gY291bnQsIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuQWRkcmVzc10uZnJvbV9ieXRlcygKICAgIC8vICAgICBhcmM0LlVJbnQxNihhZGRyZXNzZXMubGVuZ3RoIC8vIDMyKS5ieXRlcyArIGFkZHJlc3NlcwogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLmdldF9wYWdlZChrZXk6IGJ5dGVzLCBvZmZzZXQ6IHVpbnQ2NCwgbGltaXQ6IHVpbnQ2NCwgaXRlbV9zaXplOiB1aW50NjQsIHBhZ2Vfc2l6ZTogdWludDY0KSAtPiB1aW50NjQsIGJ5dGVzOgpnZXRfcGFnZWQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzOS0xNTYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9wYWdlZCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBrZXksIGxpc3Qga2V5LCBzZWUgYXBwZW5kX3BhZ2VkCiAgICAvLyAjIC0gb2Zmc2V0LCBpbmRleCBvZiBmaXJzdCBpdGVtCiAgICAvLyAjIC0gbGltaXQsIG1heCBpdGVtcywgYXQgbW9zdCBwYWdlX3NpemUKICAgIC8vICMgLSBpdGVtX3NpemUsIGl0ZW0gc2l6ZQogICAgLy8gIyAtIHBhZ2Vfc2l6ZSwgaXRlbXMgcGVyIHBhZ2UKICAgIC8vICMgcHVycG9zZTogcmVhZCBpdGVtcyBmcm9tIGxpc3Qga2VwdCBpbiBwYWdlcwogICAgLy8gIyByZXR1cm5zOgogICAgLy8gIyAtIGl0ZW0gY291bnQKICAgIC8vICMgLSBpdGVtcyBmcm9tIG9mZnNldCwgYXQgbW9zdCBsaW1pdCwgc3BhbnMKICAgIC8vICMgICBhdCBtb3N0IDIgcGFnZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X3BhZ2VkKAogICAgLy8gICAgIGtleTogQnl0ZXMsIG9mZnNldDogVUludDY0LCBsaW1pdDogVUludDY0LCBpdGVtX3NpemU6IFVJbnQ2NCwgcGFnZV9zaXplOiBVSW50NjQKICAgIC8vICkgLT4gdHVwbGVbVUludDY0LCBCeXRlc106CiAgICBwcm90byA1IDIKICAgIGludCAwCiAgICBieXRlICIiCiAgICBkdXBuIDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTU3CiAgICAvLyBjb3VudF9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBmcmFtZV9kaWcgLTUKICAgIGJveF9nZXQKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTU4CiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTU5CiAgICAvLyByZXR1cm4gVUludDY0KDApLCBCeXRlcygpCiAgICBpbnQgMAogICAgYnl0ZSAweAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYwCiAgICAvLyBjb3VudCA9IG9wLmJ0b2koY291bnRfYnl0ZXMpCiAgICBmcmFtZV9kaWcgOAogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYxCiAgICAvLyBpZiBvZmZzZXQgPj0gY291bnQ6CiAgICBmcmFtZV9kaWcgLTQKICAgIDw9CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2MgogICAgLy8gcmV0dXJuIGNvdW50LCBCeXRlcygpCiAgICBmcmFtZV9kaWcgMQogICAgYnl0ZSAweAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYzLTE2NAogICAgLy8gIyBjbGFtcCBiZWZvcmUgYWRkaW5nIHRvIG9mZnNldCwgd2hpY2ggbWF5IG92ZXJmbG93CiAgICAvLyBpZiBsaW1pdCA+IHBhZ2Vfc2l6ZToKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA2CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgLTMKCmdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2NgogICAgLy8gaWYgbGltaXQgPiBjb3VudCAtIG9mZnNldDoKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgLTQKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgLTMKICAgIDwKICAgIGJ6IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDgKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IC0zCgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjgKICAgIC8vIGl0ZW1zID0gQnl0ZXMoKQogICAgYnl0ZSAweAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3MAogICAgLy8gZW5kID0gb2Zmc2V0ICsgbGltaXQKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfYnVyeSAzCgpnZXRfcGFnZWRfd2hpbGVfdG9wQDk6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3MQogICAgLy8gd2hpbGUgaW5kZXggPCBlbmQ6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGdldF9wYWdlZF9hZnRlcl93aGlsZUAxMwogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzIKICAgIC8vIHNsb3QgPSBpbmRleCAlIHBhZ2Vfc2l6ZQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICAlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzMKICAgIC8vIHNpemUgPSBwYWdlX3NpemUgLSBzbG90CiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3NAogICAgLy8gaWYgc2l6ZSA+IGVuZCAtIGluZGV4OgogICAgZnJhbWVfZGlnIDIKICAgIHVuY292ZXIgMgogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgID4KICAgIGJ6IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDEyCiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfYnVyeSA1CgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTc3CiAgICAvLyBrZXkgKyBvcC5pdG9iKGluZGV4IC8vIHBhZ2Vfc2l6ZSksIHNsb3QgKiBpdGVtX3NpemUsIHNpemUgKiBpdGVtX3NpemUKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgLwogICAgaXRvYgogICAgZnJhbWVfZGlnIC01CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzYtMTc4CiAgICAvLyBpdGVtcyArPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBrZXkgKyBvcC5pdG9iKGluZGV4IC8vIHBhZ2Vfc2l6ZSksIHNsb3QgKiBpdGVtX3NpemUsIHNpemUgKiBpdGVtX3NpemUKICAgIC8vICkKICAgIGJveF9leHRyYWN0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTc5CiAgICAvLyBpbmRleCArPSBzaXplCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgZ2V0X3BhZ2VkX3doaWxlX3RvcEA5CgpnZXRfcGFnZWRfYWZ0ZXJfd2hpbGVAMTM6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE4MAogICAgLy8gcmV0dXJuIGNvdW50LCBpdGVtcwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLnNldF92ZXJzaW9uKGNvbnRyYWN0X3ZlcnNpb246IGJ5dGVzLCBkZXBsb3ltZW50X3ZlcnNpb246IGJ5dGVzKSAtPiB2b2lkOgpzZXRfdmVyc2lvbjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTMwLTUzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X3ZlcnNpb24oCiAgICAvLyAgICAgc2VsZiwgY29udHJhY3RfdmVyc2lvbjogYXJjNC5VSW50NjQsIGRlcGxveW1lbnRfdmVyc2lvbjogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzUKICAgIC8vIGFyYzQuZW1pdChWZXJzaW9uVXBkYXRlZChjb250cmFjdF92ZXJzaW9uLCBkZXBsb3ltZW50X3ZlcnNpb24pKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJWZXJzaW9uVXBkYXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzgKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJjb250cmFjdF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzYKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzcKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzcKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5hcHByb3ZlX3VwZGF0ZShhcHByb3ZhbDogYnl0ZXMpIC0+IHZvaWQ6CmFwcHJvdmVfdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgtNTQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBhcHByb3ZlX3VwZGF0ZShzZWxmLCBhcHByb3ZhbDogYXJjNC5Cb29sKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUxCiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVXBkYXRlQXBwcm92ZWQoYWRkcmVzcyxib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MgogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGdldGJpdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTIKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmdyYW50X3VwZ3JhZGVyKHVwZ3JhZGVyOiBieXRlcykgLT4gdm9pZDoKZ3JhbnRfdXBncmFkZXI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NC01NTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGdyYW50X3VwZ3JhZGVyKHNlbGYsIHVwZ3JhZGVyOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU2CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAibXVzdCBiZSBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgY3JlYXRvcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTcKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTcKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGdyYWRlckdyYW50ZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1OAogICAgLy8gc2VsZi51cGdyYWRlciA9IHVwZ3JhZGVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLm9uX3VwZGF0ZSgpIC0+IHZvaWQ6Cm9uX3VwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM5LTU0MAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDEtNTQ0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgV0FSTklORzogVGhpcyBhcHAgY2FuIGJlIHVwZGF0ZWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDEtNTQ0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgV0FSTklORzogVGhpcyBhcHAgY2FuIGJlIHVwZGF0ZWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ1CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ1CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZGF0YWJsZSBleGlzdHMKICAgIGludCAxCiAgICA9PQogICAgYXNzZXJ0IC8vIG5vdCBhcHByb3ZlZAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0Lk1lc3Nlbmdlci5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI4CiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMjktMTIzMAogICAgLy8gIyB1cGdyYWRlYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzkKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIzMQogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzIKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgaW50IDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzMKICAgIC8vIHNlbGYudXBncmFkZXIgPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuTWVzc2VuZ2VyLmNsZWFyX3N0YXRlX3Byb2dyYW06CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMjcKICAgIC8vIGNsYXNzIE1lc3NlbmdlcihNZXNzZW5nZXJJbnRlcmZhY2UsIFVwZ3JhZGVhYmxlKToKICAgIGludCAxCiAgICByZXR1cm4K"
   },
   "state": {
     "global": {
@@ -142,6 +199,69 @@ export const APP_SPEC: AppSpec = {
           "type": "void"
         }
       },
+      {
+        "name": "partkey_broastcast_many",
+        "args": [
+          {
+            "type": "(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[]",
+            "name": "partkeys"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Broastcast partkey information of many addresses, emits one\nMessagePartKeyInfo per address like partkey_broastcast."
+      },
+      {
+        "name": "enable_registry",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Keep latest partkey broadcast by each sender for each address\nin box registry from now on. Senders pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled."
+      },
+      {
+        "name": "get_partkey",
+        "args": [
+          {
+            "type": "address",
+            "name": "who"
+          },
+          {
+            "type": "address",
+            "name": "address"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])"
+        },
+        "desc": "Get latest partkey broadcast by who for address."
+      },
+      {
+        "name": "get_partkey_addresses",
+        "args": [
+          {
+            "type": "address",
+            "name": "who"
+          },
+          {
+            "type": "uint64",
+            "name": "offset"
+          },
+          {
+            "type": "uint64",
+            "name": "limit"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "(uint64,address[])"
+        },
+        "desc": "Get page of addresses who broadcast partkeys for, in order of\nfirst broadcast."
+      },
       {
         "name": "set_version",
         "args": [
@@ -291,6 +411,36 @@ export type Messenger = {
       argsTuple: [address: string, voteK: Uint8Array, selK: Uint8Array, voteFst: bigint | number, voteLst: bigint | number, voteKd: bigint | number, spKey: Uint8Array]
       returns: void
     }>
+    & Record<'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void' | 'partkey_broastcast_many', {
+      argsObj: {
+        partkeys: [string, Uint8Array, Uint8Array, bigint | number, bigint | number, bigint | number, Uint8Array][]
+      }
+      argsTuple: [partkeys: [string, Uint8Array, Uint8Array, bigint | number, bigint | number, bigint | number, Uint8Array][]]
+      returns: void
+    }>
+    & Record<'enable_registry()void' | 'enable_registry', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: void
+    }>
+    & Record<'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])' | 'get_partkey', {
+      argsObj: {
+        who: string
+        address: string
+      }
+      argsTuple: [who: string, address: string]
+      returns: PartKeyInfo
+    }>
+    & Record<'get_partkey_addresses(address,uint64,uint64)(uint64,address[])' | 'get_partkey_addresses', {
+      argsObj: {
+        who: string
+        offset: bigint | number
+        limit: bigint | number
+      }
+      argsTuple: [who: string, offset: bigint | number, limit: bigint | number]
+      returns: [bigint, string[]]
+    }>
     & Record<'set_version(uint64,uint64)void' | 'set_version', {
       argsObj: {
         contractVersion: bigint | number
@@ -333,6 +483,32 @@ export type Messenger = {
     }
   }
 }
+/**
+ * Represents a PartKeyInfo result as a struct
+ */
+export type PartKeyInfo = {
+  address: string
+  voteKey: Uint8Array
+  selectionKey: Uint8Array
+  voteFirst: bigint
+  voteLast: bigint
+  voteKeyDilution: bigint
+  stateProofKey: Uint8Array
+}
+/**
+ * Converts the tuple representation of a PartKeyInfo to the struct representation
+ */
+export function PartKeyInfo([address, voteKey, selectionKey, voteFirst, voteLast, voteKeyDilution, stateProofKey]: [string, Uint8Array, Uint8Array, bigint, bigint, bigint, Uint8Array] ) {
+  return {
+    address,
+    voteKey,
+    selectionKey,
+    voteFirst,
+    voteLast,
+    voteKeyDilution,
+    stateProofKey,
+  }
+}
 /**
  * Defines the possible abi call signatures
  */
@@ -451,6 +627,73 @@ export abstract class MessengerCallFactory {
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void ABI method
+   *
+   * Broastcast partkey information of many addresses, emits one
+MessagePartKeyInfo per address like partkey_broastcast.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static partkeyBroastcastMany(args: MethodArgs<'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void' as const,
+      methodArgs: Array.isArray(args) ? args : [args.partkeys],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the enable_registry()void ABI method
+   *
+   * Keep latest partkey broadcast by each sender for each address
+in box registry from now on. Senders pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'enable_registry()void' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64]) ABI method
+   *
+   * Get latest partkey broadcast by who for address.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getPartkey(args: MethodArgs<'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])' as const,
+      methodArgs: Array.isArray(args) ? args : [args.who, args.address],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_partkey_addresses(address,uint64,uint64)(uint64,address[]) ABI method
+   *
+   * Get page of addresses who broadcast partkeys for, in order of
+first broadcast.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getPartkeyAddresses(args: MethodArgs<'get_partkey_addresses(address,uint64,uint64)(uint64,address[])'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_partkey_addresses(address,uint64,uint64)(uint64,address[])' as const,
+      methodArgs: Array.isArray(args) ? args : [args.who, args.offset, args.limit],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the set_version(uint64,uint64)void ABI method
    *
@@ -638,6 +881,61 @@ export class MessengerClient {
     return this.call(MessengerCallFactory.partkeyBroastcast(args, params))
   }
 
+  /**
+   * Calls the partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void ABI method.
+   *
+   * Broastcast partkey information of many addresses, emits one
+MessagePartKeyInfo per address like partkey_broastcast.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public partkeyBroastcastMany(args: MethodArgs<'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(MessengerCallFactory.partkeyBroastcastMany(args, params))
+  }
+
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Keep latest partkey broadcast by each sender for each address
+in box registry from now on. Senders pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(MessengerCallFactory.enableRegistry(args, params))
+  }
+
+  /**
+   * Calls the get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64]) ABI method.
+   *
+   * Get latest partkey broadcast by who for address.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getPartkey(args: MethodArgs<'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(MessengerCallFactory.getPartkey(args, params), PartKeyInfo)
+  }
+
+  /**
+   * Calls the get_partkey_addresses(address,uint64,uint64)(uint64,address[]) ABI method.
+   *
+   * Get page of addresses who broadcast partkeys for, in order of
+first broadcast.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getPartkeyAddresses(args: MethodArgs<'get_partkey_addresses(address,uint64,uint64)(uint64,address[])'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(MessengerCallFactory.getPartkeyAddresses(args, params))
+  }
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -763,6 +1061,26 @@ export class MessengerClient {
         resultMappers.push(undefined)
         return this
       },
+      partkeyBroastcastMany(args: MethodArgs<'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.partkeyBroastcastMany(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.enableRegistry(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getPartkey(args: MethodArgs<'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getPartkey(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(PartKeyInfo)
+        return this
+      },
+      getPartkeyAddresses(args: MethodArgs<'get_partkey_addresses(address,uint64,uint64)(uint64,address[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getPartkeyAddresses(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       setVersion(args: MethodArgs<'set_version(uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setVersion(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -835,6 +1153,53 @@ export type MessengerComposer<TReturns extends [...any[]] = []> = {
    */
   partkeyBroastcast(args: MethodArgs<'partkey_broastcast(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): MessengerComposer<[...TReturns, MethodReturn<'partkey_broastcast(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])void'>]>
 
+  /**
+   * Calls the partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void ABI method.
+   *
+   * Broastcast partkey information of many addresses, emits one
+MessagePartKeyInfo per address like partkey_broastcast.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  partkeyBroastcastMany(args: MethodArgs<'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): MessengerComposer<[...TReturns, MethodReturn<'partkey_broastcast_many((address,byte[32],byte[32],uint64,uint64,uint64,byte[64])[])void'>]>
+
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Keep latest partkey broadcast by each sender for each address
+in box registry from now on. Senders pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): MessengerComposer<[...TReturns, MethodReturn<'enable_registry()void'>]>
+
+  /**
+   * Calls the get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64]) ABI method.
+   *
+   * Get latest partkey broadcast by who for address.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPartkey(args: MethodArgs<'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): MessengerComposer<[...TReturns, MethodReturn<'get_partkey(address,address)(address,byte[32],byte[32],uint64,uint64,uint64,byte[64])'>]>
+
+  /**
+   * Calls the get_partkey_addresses(address,uint64,uint64)(uint64,address[]) ABI method.
+   *
+   * Get page of addresses who broadcast partkeys for, in order of
+first broadcast.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPartkeyAddresses(args: MethodArgs<'get_partkey_addresses(address,uint64,uint64)(uint64,address[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): MessengerComposer<[...TReturns, MethodReturn<'get_partkey_addresses(address,uint64,uint64)(uint64,address[])'>]>
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
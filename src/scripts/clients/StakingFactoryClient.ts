@@ -36,6 +36,22 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
+    "create_many((address,address,address,uint64,uint64)[])uint64[]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "enable_registry()void": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "set_version(uint64,uint64)void": {
       "call_config": {
         "no_op": "CALL"
@@ -58,13 +74,13 @@ export const APP_SPEC: AppSpec = {
     }
   },
   "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuU3Rha2luZ0ZhY3RvcnkuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTk2CiAgICAvLyBjbGFzcyBTdGFraW5nRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTEKICAgIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgInNldF92ZXJzaW9uKHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiYXBwcm92ZV91cGRhdGUoYm9vbCl2b2lkIgogICAgbWV0aG9kICJncmFudF91cGdyYWRlcihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgInRyYW5zZmVyKGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX3JvdXRlQDQgbWFpbl9zZXRfdmVyc2lvbl9yb3V0ZUA1IG1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVANiBtYWluX2dyYW50X3VwZ3JhZGVyX3JvdXRlQDcgbWFpbl90cmFuc2Zlcl9yb3V0ZUA4CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZV9yb3V0ZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE5NgogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlCiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF92ZXJzaW9uX3JvdXRlQDU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjExOTYKICAgIC8vIGNsYXNzIFN0YWtpbmdGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X3ZlcnNpb24KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE5NgogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhcHByb3ZlX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUA3OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTk2CiAgICAvLyBjbGFzcyBTdGFraW5nRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGdyYW50X3VwZ3JhZGVyCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX3JvdXRlQDg6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDExOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMTk2CiAgICAvLyBjbGFzcyBTdGFraW5nRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICBpbnQgMAogICAgaW50IDQKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIG1hdGNoIG1haW5fY3JlYXRlQDEyIG1haW5fb25fdXBkYXRlQDEzCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZUAxMjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE5NgogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9vbl91cGRhdGVAMTM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2NgogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2Ni00NjcKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgb25fdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBjYWxsc3ViIG9uX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNyYy5jb250cmFjdC5TdGFraW5nRmFjdG9yeS5jcmVhdGUob3duZXI6IGJ5dGVzLCBmdW5kZXI6IGJ5dGVzLCBkZWxlZ2F0ZTogYnl0ZXMsIHBlcmlvZDogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjAzLTEyMTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNyZWF0ZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG93bmVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZnVuZGVyOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgZGVsZWdhdGU6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBwZXJpb2Q6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIyMy0xMjI0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGluaXRpYWwgPSBzZWxmLmdldF9pbml0aWFsX3BheW1lbnQoKQogICAgY2FsbHN1YiBnZXRfaW5pdGlhbF9wYXltZW50CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMjUtMTIyNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgcGVyaW9kIDwgMTgsICJwZXJpb2QgbGVzcyB0aGFuIDE4IgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAxMgogICAgYjwKICAgIGFzc2VydCAvLyBwZXJpb2QgbGVzcyB0aGFuIDE4CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMjkKICAgIC8vIGJhc2VfYXBwID0gYXJjNC5hcmM0X2NyZWF0ZShBaXJkcm9wLCBjb21waWxlZD1jb21waWxlZCkuY3JlYXRlZF9hcHAKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIyNy0xMjI4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIGNvbXBpbGVkID0gY29tcGlsZV9jb250cmFjdChBaXJkcm9wLCBleHRyYV9wcm9ncmFtX3BhZ2VzPTMpICMgbWF4IGV4dHJhIHBhZ2VzCiAgICBpbnQgMTcKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgaW50IDUKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICBpbnQgMwogICAgaXR4bl9maWVsZCBFeHRyYVByb2dyYW1QYWdlcwogICAgYnl0ZSBiYXNlNjQgQ29FQlF3PT0KICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgYnl0ZSBiYXNlNjQgQ2lBRUFBRUZBaVlhQlc5M2JtVnlCbVoxYm1SbGNnZG1kVzVrYVc1bkJYUnZkR0ZzQ0hWd1ozSmhaR1Z5Qm5CbGNtbHZaQWhrWld4bFoyRjBaUkprYVhOMGNtbGlkWFJwYjI1ZlkyOTFiblFVWkdsemRISnBZblYwYVc5dVgzTmxZMjl1WkhNTWNHVnlhVzlrWDJ4cGJXbDBEWFpsYzNScGJtZGZaR1ZzWVhrTWJHOWphM1Z3WDJSbGJHRjVEbkJsY21sdlpGOXpaV052Ym1SekNHUmxZV1JzYVc1bENYVndaR0YwWVdKc1pReHRaWE56Wlc1blpYSmZhV1FFU0FnUTdpQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFoa1pYQnNiM2xsY2dkcGJtbDBhV0ZzQUFTbWdzQWJDQUFBQUFBQUFBQUFFR052Ym5SeVlXTjBYM1psY25OcGIyNFNaR1Z3Ykc5NWJXVnVkRjkyWlhKemFXOXVDWEJoY21WdWRGOXBaREVZUUFBRGlBZWJNUnRCQWJ1Q0VRUXZia0QrQkZJbEdLMEVvT2dZY2dTNzBQTDRCR2NWUS9rRU1TRkJkZ1NXVmdSNkJLMzVLdVFFWE5QM2lnVHFzNUZJQkdnTzdVQUVxV0ZjMXdSZmZxSklCTTBrM29nRWVMeVoxQVJyQzQvNEJOU1d2ME0yR2dDT0VRQUJBREVBUGdCTEFHTUFjZ0NMQUpnQXB3Q3pBTUlBMFFEZ0FPOEJEUUVmQVM0QU1Sa1VSREVZUkRZYUFUWWFBallhQXpZYUJEWWFCVFlhQmpZYUJ6WWFDRFlhQ1RZYUNqWWFDellhRElnQkt5TkRNUmtrRWtReEdFU0lBaElqUXpFWkpCSkVNUmhFaUFLNEkwTXhHUlJFTVJoRU5ob0JOaG9DTmhvRE5ob0VpQUxMSTBNeEdSUkVNUmhFTmhvQmlBTCtJME14R1JSRU1SaEVOaG9CaUFNekZvQUVGUjk4ZFV4UXNDTkRNUmtrRWtReEdFU0lCQjRqUXpFWkZFUXhHRVEyR2dHSUJFb2pRekVaRkVReEdFU0lCRjRqUXpFWkZFUXhHRVEyR2dHSUJKNGpRekVaRkVReEdFUTJHZ0dJQks4alF6RVpGRVF4R0VRMkdnR0lCTm9qUXpFWkZFUXhHRVEyR2dHSUJRQWpRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dVMkdnYUlCUlFqUXpFWkZFUXhHRVEyR2dFMkdnS0lCVzBqUXpFWkZFUXhHRVEyR2dHSUJZY2pRekVaRkVReEdFUTJHZ0dJQlp3alF5S0JCREVaamdJQUFRQUtBREVZRkVTSUJhY2pRekVZUklnRnF5TkRpZ3dBTVFBeUNSSkVJaWNKWlVRVVJDSW5DbVZFRkVRaUp3dGxSQlJFSWljTVpVUVVSQ0luRDJWRUZFUWlKd2RsUkJSRUlpY0laVVFVUkNJbkIyVkVGRVFpSndobFJCUkVJaGFMK2tzQnBVU0wrYVJFSWljRlpVUVVSQ0luRFdWRUZFUWlLMlZFRkVRaUttVkVGRVFpSndabFJESURFa1NMOUl2MVVJdjJVSXYzVUl2NFVJdjVVSXY2VUl2N1VJdjhVSXY5VUl2K1VJdi9VSUFFanlWRzhFeFFzSXYwRnljSlRHZUw5UmNuQ2t4bmkvWVhKd3RNWjR2M0Z5Y01UR2VMK0JjbkQweG5pL2tYSndkTVo0djZGeWNJVEdlTCt4Y25CVXhuaS93WEp3MU1aNHY5Rnl0TVo0ditGeXBNWnljR2kvOW5pWW9BQURFQUlpbGxSQkpBQUFveEFDSW9aVVFTUVFBRUkwSUFBU0pFSWlwbFJCUkVNUUFpS0dWRVVDY1FURkN3SWlobFJJZ0FBWW1LQVFBeEdTUVNSRElKTWdHeGdFQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFzajhpc2c0aXNnMGlzZ3duRWJJTEp4R3lDaU95T1NXeUVDS3lBYmF5Q0l2L3NnbXlCeU95RUNLeUFiT0ppZ0FBTVFBaUp3UmxSQkpFSWljT1pVUWpFa1FpSndSbFJDSXBaVVJRSnhCTVVMQWlLV1ZFaVA5YWlZb0VBQ0lvWlVReUF4SkVJaWxsUkRJREVrUXhBRElKRWtTTC9JdjlVSXYrVUl2L1VJQUVuWnh2QzB4UXNDY1NpL3huS0l2OVp5bUwvbWVML3hjbkUweG5pWW9CQUNJcVpVUVVSQ0lyWlVRVVJERUFJaWhsUkJKRUlpY0paVVFXaS8rblJDSW5EV1ZFTWdjTlJDSW5CV1ZFRm92L1VJQUV0ajZYa2t4UXNJdi9GeWNGVEdlSmlnRUJKeFJIQWpFQUlpaGxSQkpFSWlwbFJFRUFOWWdBYTBtTUFFa1dpLzlRSnhWTVVMQ0lBTStML3hkSmpBRUpEa1NML3ljV3BVRUFFTEV4QUxJSGl3R3lDQ095RUNLeUFiT0pJaXRsVEVsT0Fvd0FSRWtXaS85UUp4Vk1VTENJQUphTC94ZEpqQUlKRGtTTC95Y1dwVUVBRUxFeEFMSUhpd0t5Q0NPeUVDS3lBYk9KaWdBQk1nY2lKd3BsUkNJbkRHVkVJaWNMWlVRaUp3VmxSQ0lxWlVRaUsyVkVJaWNIWlVRaUp3aGxSSWdBQVltS0NRRW5GSXY2aS9zTGkva0xpL2lMK1F1TC9BZ0lTWXYzRDBFQUJZdjlqQUNKaS9lTEFRbUwvd3BKakFDTC9nNUJBQTZML29zQUNZdjlDNHYrQ293QWlTS01BSW1LQUFFeUNtQXlBUW1KaWdBQUlpcGxSRVNJLzNjVVJERUFJaWhsUkJKQUFBb3hBQ0lwWlVRU1FRQUVJMElBQVNKRU1RQWlLR1ZFVUNjUVRGQ3dJaWhsUklqOWw0bUtBUUF4QUNJb1pVUVNSQ0lvWlVTTC8xQ0FCSm9pUHZ0TVVMQW9pLzluaVlvQUFERUFJaWxsUkJKRUlpbGxSSWdBSFNJclpVUkxBUWhNRmt4SkZrOENURkNBQk1NRHByeE1VTEFyVEdlSmlnRUJNUlpKUkNNSlNUZ1FJeEpFU1RnQWkvOFNSRWs0QnpJS0VrUTRDSW1LQVFBeEFDSXBaVVFTUkNJcFpVU0wvMUNBQkVPSDFzRk1VTEFwaS85bmlZb0JBREVBSWlsbFJCSkVJaXBsUkVFQUNpSXFaVVF5QncxQkFBUWpRZ0FCSWtRaUttVkVGb3YvVUlBRTBGM3VIRXhRc0l2L0Z5cE1aNG1LQVFBeEFDSXBaVVFTUkNJcVpVUVVSQ0lyWlVRV2kvK25SQ0lyWlVTTC94Y0pTUmFMLzB4UWdBUk5TSUVPVEZDd0sweG5pWW9CQURFQUlpaGxSQkpBQUFneEFESUpFa0VBQkNOQ0FBRWlSQ0luQm1WRWkvOVFnQVI0WmxWM1RGQ3dKd2FMLzJlSmlnWUFNUUFpS0dWRUVrQUFDekVBSWljR1pVUVNRUUFFSTBJQUFTSkVNZ0F4QUlqKytrc0JFa1F4QUVtTCtsQ0wrMUNML0ZDTC9WQ0wvbENMLzFCUWdBUnRSSkEvVEZDd3NZdjhGNHY5RjR2K0Y0di9zait5RHJJTnNneUwrN0lMaS9xeUNpV3lFTElCczRtS0FnQXhBQ0luQkdWRUVrU0wvb3YvVUlBRWpJejV6VXhRc0l2K0Z5Y1hUR2VML3hjbkdFeG5pWW9CQURFQUlpaGxSQkpFSWlobFJJdi9VSUFFd25sbGkweFFzSXYvSWxNbkRreG5pWW9CQURFQU1na1NSQ0luQkdWRWkvOVFnQVN0OWVLNFRGQ3dKd1NMLzJlSmlnQUFNZzFKUkNjWlRHZUppZ0FBTVFBaUp3UmxSQkpFSWljT1pVUWpFa1NKaWdBQUp4a2laeWNTTWdObkp3WXlBMmVBQ1hOMFlXdGxZV0pzWlNObkp4Y2laeWNZSW1jbkRpTm5Kd1F5Q1djb01nTm5Kd1VpWnljVEltY25EU0puSnd3aVp5Y0xJbWNuQ2lKbkp3a2laeWNISW1jbkNDSm5LVElEWnlvaVp5c2laeWNQSW1lSgogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjI5CiAgICAvLyBiYXNlX2FwcCA9IGFyYzQuYXJjNF9jcmVhdGUoQWlyZHJvcCwgY29tcGlsZWQ9Y29tcGlsZWQpLmNyZWF0ZWRfYXBwCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjMwCiAgICAvLyBhcmM0LmVtaXQoRmFjdG9yeUNyZWF0ZWQoYXJjNC5VSW50NjQoYmFzZV9hcHAuaWQpKSkKICAgIGR1cAogICAgaXRvYgogICAgbWV0aG9kICJGYWN0b3J5Q3JlYXRlZCh1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIzMS0xMjQ2CiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFRlbXBsYXRlCiAgICAvLyAgICAgQWlyZHJvcC50ZW1wbGF0ZSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiVkVTVElOR19ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KChwZXJpb2QubmF0aXZlICsgVUludDY0KDIpKSAqIFVJbnQ2NCgyKSAvLyBVSW50NjQoMykpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgLy8gICAgIHBlcmlvZCwKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZGVhZGxpbmUKICAgIC8vICAgICBpbml0aWFsLCAgIyB0b3RhbAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIC8vICAgICBkZWxlZ2F0ZSwKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyMzMKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIGludCBUTVBMX1BFUklPRF9MSU1JVAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjM0CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJWRVNUSU5HX0RFTEFZIikpLAogICAgaW50IFRNUExfVkVTVElOR19ERUxBWQogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjM1CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICBpbnQgVE1QTF9MT0NLVVBfREVMQVkKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIzNgogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9QRVJJT0RfU0VDT05EUwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjM3CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICBpbnQgVE1QTF9NRVNTRU5HRVJfSUQKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIzOAogICAgLy8gYXJjNC5VSW50NjQoKHBlcmlvZC5uYXRpdmUgKyBVSW50NjQoMikpICogVUludDY0KDIpIC8vIFVJbnQ2NCgzKSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGludCAyCiAgICArCiAgICBpbnQgMgogICAgKgogICAgaW50IDMKICAgIC8KICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTIzOQogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICBpbnQgVE1QTF9ESVNUUklCVVRJT05fU0VDT05EUwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjQxCiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZGVhZGxpbmUKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI0MgogICAgLy8gaW5pdGlhbCwgICMgdG90YWwKICAgIGRpZyA5CiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNDMKICAgIC8vIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIGludCAwCiAgICBpdG9iCiAgICBkaWcgMTAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjMxLTEyNDYKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGVtaXQgVGVtcGxhdGUKICAgIC8vICAgICBBaXJkcm9wLnRlbXBsYXRlLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJWRVNUSU5HX0RFTEFZIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoKHBlcmlvZC5uYXRpdmUgKyBVSW50NjQoMikpICogVUludDY0KDIpIC8vIFVJbnQ2NCgzKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyAgICAgcGVyaW9kLAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBkZWFkbGluZQogICAgLy8gICAgIGluaXRpYWwsICAjIHRvdGFsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgZnVuZGluZwogICAgLy8gICAgIGRlbGVnYXRlLAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIG1ldGhvZCAidGVtcGxhdGUodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA5CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA4CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA3CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA2CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI0Ny0xMjUxCiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgQWlyZHJvcC5ncmFudF91cGdyYWRlciwKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI0OQogICAgLy8gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjQ3LTEyNTEKICAgIC8vIGFyYzQuYWJpX2NhbGwoICAjIGluaGVyaXQgdXBncmFkZXIKICAgIC8vICAgICBBaXJkcm9wLmdyYW50X3VwZ3JhZGVyLAogICAgLy8gICAgIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJncmFudF91cGdyYWRlcihhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNTItMTI1NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjUzCiAgICAvLyByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9aW5pdGlhbCArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAKICAgIGRpZyAxCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgdW5jb3ZlciA0CiAgICArCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjUyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNTMKICAgIC8vIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNTItMTI1NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTI1NS0xMjYyCiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFNldHVwKGRlcGxveWVyLCBvd25lciwgZnVuZGVyLCBpbnR0aWFsKQogICAgLy8gICAgIEFpcmRyb3Auc2V0dXAsCiAgICAvLyAgICAgVHhuLnNlbmRlciwKICAgIC8vICAgICBvd25lciwKICAgIC8vICAgICBmdW5kZXIsCiAgICAvLyAgICAgaW5pdGlhbCwKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNTcKICAgIC8vIFR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNTUtMTI2MgogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBTZXR1cChkZXBsb3llciwgb3duZXIsIGZ1bmRlciwgaW50dGlhbCkKICAgIC8vICAgICBBaXJkcm9wLnNldHVwLAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgb3duZXIsCiAgICAvLyAgICAgZnVuZGVyLAogICAgLy8gICAgIGluaXRpYWwsCiAgICAvLyAgICAgYXBwX2lkPWJhc2VfYXBwLAogICAgLy8gKQogICAgbWV0aG9kICJzZXR1cChhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC00CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEyNjMtMTI2OQogICAgLy8gIyBmdW5kZXIKICAgIC8vICMgICBmaWxsLCBzZXQgZnVuZGluZywgYWJvcnQKICAgIC8vICMgdmVzdGluZywgbG9ja3VwCiAgICAvLyAjICAgd2l0aGRyYXcsIHBhcnRpY2lwYXRlCiAgICAvLyAjIGNsb3NlCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcmV0dXJuIGJhc2VfYXBwLmlkCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkuZ2V0X2luaXRpYWxfcGF5bWVudCgpIC0+IHVpbnQ2NDoKZ2V0X2luaXRpYWxfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA4My0xMDg0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9pbml0aWFsX3BheW1lbnQoc2VsZikgLT4gVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwODgKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gcmVxdWlyZV9wYXltZW50KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIHJlcXVpcmVfcGF5bWVudAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDkwCiAgICAvLyBtaW5fYmFsYW5jZSA9IG9wLkdsb2JhbC5taW5fYmFsYW5jZSAgIyAxMDAwMDAKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwODkKICAgIC8vIG1icl9pbmNyZWFzZSA9IFVJbnQ2NCgxMjM0NTAwKQogICAgaW50IDEyMzQ1MDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5MgogICAgLy8gcGF5bWVudF9hbW91bnQgPj0gbWJyX2luY3JlYXNlICsgbWluX2JhbGFuY2UKICAgIGRpZyAxCiAgICArCiAgICBkaWcgMgogICAgPD0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5MS0xMDkzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnRfYW1vdW50ID49IG1icl9pbmNyZWFzZSArIG1pbl9iYWxhbmNlCiAgICAvLyApLCAicGF5bWVudCBhbW91bnQgYWNjdXJhdGUiICAjIDEyMzQ1MDAgKyAxMDAwMDAgPSAxMzM0NTAwCiAgICBhc3NlcnQgLy8gcGF5bWVudCBhbW91bnQgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA5NAogICAgLy8gaW5pdGlhbCA9IHBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlIC0gbWluX2JhbGFuY2UKICAgIHN3YXAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA4OQogICAgLy8gbWJyX2luY3JlYXNlID0gVUludDY0KDEyMzQ1MDApCiAgICBpbnQgMTIzNDUwMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDk0CiAgICAvLyBpbml0aWFsID0gcGF5bWVudF9hbW91bnQgLSBtYnJfaW5jcmVhc2UgLSBtaW5fYmFsYW5jZQogICAgLQogICAgc3dhcAogICAgLQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDk1CiAgICAvLyByZXR1cm4gaW5pdGlhbAogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLnJlcXVpcmVfcGF5bWVudCh3aG86IGJ5dGVzKSAtPiB1aW50NjQ6CnJlcXVpcmVfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTUtMjMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHJlcXVpcmVfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayBwYXltZW50CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZXF1aXJlX3BheW1lbnQod2hvOiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjQKICAgIC8vIHJlZl9ncm91cF9pbmRleCA9IFR4bi5ncm91cF9pbmRleAogICAgdHhuIEdyb3VwSW5kZXgKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjUKICAgIC8vIGFzc2VydCByZWZfZ3JvdXBfaW5kZXggPiAwLCAiZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBncm91cCBpbmRleCBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc3JjL3NyYy91dGlscy5weToyNgogICAgLy8gcGF5bWVudF9ncm91cF9pbmRleCA9IHJlZl9ncm91cF9pbmRleCAtIDEKICAgIGludCAxCiAgICAtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI4CiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToyNy0yOQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICAvLyApLCAicGF5bWVudCBzZW5kZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCBzZW5kZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzEKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMyCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc3JjL3NyYy91dGlscy5weTozMS0zMgogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIC8vID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMwLTMzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyAgICAgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgInBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy91dGlscy5weTozNAogICAgLy8gcmV0dXJuIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLmFtb3VudAogICAgZ3R4bnMgQW1vdW50CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuc2V0X3ZlcnNpb24oY29udHJhY3RfdmVyc2lvbjogYnl0ZXMsIGRlcGxveW1lbnRfdmVyc2lvbjogYnl0ZXMpIC0+IHZvaWQ6CnNldF92ZXJzaW9uOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NTctNDYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfdmVyc2lvbigKICAgIC8vICAgICBzZWxmLCBjb250cmFjdF92ZXJzaW9uOiBhcmM0LlVJbnQ2NCwgZGVwbG95bWVudF92ZXJzaW9uOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDgKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MgogICAgLy8gYXJjNC5lbWl0KFZlcnNpb25VcGRhdGVkKGNvbnRyYWN0X3ZlcnNpb24sIGRlcGxveW1lbnRfdmVyc2lvbikpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlZlcnNpb25VcGRhdGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDYzCiAgICAvLyBzZWxmLmNvbnRyYWN0X3ZlcnNpb24gPSBjb250cmFjdF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBkZXBsb3ltZW50X3ZlcnNpb24ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA2CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJkZXBsb3ltZW50X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBkZXBsb3ltZW50X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmFwcHJvdmVfdXBkYXRlKGFwcHJvdmFsOiBieXRlcykgLT4gdm9pZDoKYXBwcm92ZV91cGRhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3NS00NzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGFwcHJvdmVfdXBkYXRlKHNlbGYsIGFwcHJvdmFsOiBhcmM0LkJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLCAibXVzdCBiZSBvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzgKICAgIC8vIGFyYzQuZW1pdChVcGRhdGVBcHByb3ZlZChhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksIGFwcHJvdmFsKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLm93bmVyID0gQWNjb3VudCgpCiAgICBieXRlICJvd25lciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc4CiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGRhdGVBcHByb3ZlZChhZGRyZXNzLGJvb2wpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGFwcHJvdmFsLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZ2V0Yml0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUuZ3JhbnRfdXBncmFkZXIodXBncmFkZXI6IGJ5dGVzKSAtPiB2b2lkOgpncmFudF91cGdyYWRlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxLTQ4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZ3JhbnRfdXBncmFkZXIoc2VsZiwgdXBncmFkZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4NAogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4NAogICAgLy8gYXJjNC5lbWl0KFVwZ3JhZGVyR3JhbnRlZChhcmM0LkFkZHJlc3Moc2VsZi51cGdyYWRlciksIHVwZ3JhZGVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBtZXRob2QgIlVwZ3JhZGVyR3JhbnRlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDA4CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDg1CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gdXBncmFkZXIubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuVXBncmFkZWFibGUub25fdXBkYXRlKCkgLT4gdm9pZDoKb25fdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NjYtNDY3CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIG9uX3VwZGF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2OC00NzEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ2OC00NzEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBXQVJOSU5HOiBUaGlzIGFwcCBjYW4gYmUgdXBkYXRlZCBieSB0aGUgY3JlYXRvcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzIKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDcKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzIKICAgIC8vIGFzc2VydCBzZWxmLnVwZGF0YWJsZSA9PSBVSW50NjQoMSksICJub3QgYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBkYXRhYmxlIGV4aXN0cwogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gbm90IGFwcHJvdmVkCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuU3Rha2luZ0ZhY3RvcnkuX19pbml0X18oKSAtPiB2b2lkOgpfX2luaXRfXzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE5NwogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6ICAjIHByYWdtYTogbm8gY292ZXIKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMjAxCiAgICAvLyBzdXBlcigpLl9faW5pdF9fKCkKICAgIGNhbGxzdWIgQmFzZUZhY3RvcnkuX19pbml0X18KICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5fX2luaXRfXygpIC0+IHZvaWQ6CkJhc2VGYWN0b3J5Ll9faW5pdF9fOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxMDY3CiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZTogICMgcHJhZ21hOiBubyBjb3ZlcgogICAgcHJvdG8gMCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImNvbnRyYWN0X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzEtMTA3MgogICAgLy8gIyB1cGdyYWRlYWJsZSBzdGF0ZQogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0MDYKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGJ5dGUgImRlcGxveW1lbnRfdmVyc2lvbiIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTA3MwogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gc2VsZi51cGRhdGFibGUgPSBib29sKDEpCiAgICBieXRlICJ1cGRhdGFibGUiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzQKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgaW50IDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjEwNzUKICAgIC8vIHNlbGYudXBncmFkZXIgPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuU3Rha2luZ0ZhY3RvcnkuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTE5NgogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgaW50IDEKICAgIHJldHVybgo="
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuU3Rha2luZ0ZhY3RvcnkuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDEwCiAgICAvLyBjbGFzcyBTdGFraW5nRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTQKICAgIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgImNyZWF0ZV9tYW55KChhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KVtdKXVpbnQ2NFtdIgogICAgbWV0aG9kICJlbmFibGVfcmVnaXN0cnkoKXZvaWQiCiAgICBtZXRob2QgImdldF9jaGlsZHJlbihhZGRyZXNzLHVpbnQ2NCx1aW50NjQpKHVpbnQ2NCwodWludDY0LGFkZHJlc3MsdWludDY0KVtdKSIKICAgIG1ldGhvZCAic2V0X3ZlcnNpb24odWludDY0LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJhcHByb3ZlX3VwZGF0ZShib29sKXZvaWQiCiAgICBtZXRob2QgImdyYW50X3VwZ3JhZGVyKGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAidHJhbnNmZXIoYWRkcmVzcyl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfcm91dGVANCBtYWluX2NyZWF0ZV9tYW55X3JvdXRlQDUgbWFpbl9lbmFibGVfcmVnaXN0cnlfcm91dGVANiBtYWluX2dldF9jaGlsZHJlbl9yb3V0ZUA3IG1haW5fc2V0X3ZlcnNpb25fcm91dGVAOCBtYWluX2FwcHJvdmVfdXBkYXRlX3JvdXRlQDkgbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUAxMCBtYWluX3RyYW5zZmVyX3JvdXRlQDExCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZV9yb3V0ZUA0OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAxMAogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlCiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9tYW55X3JvdXRlQDU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDEwCiAgICAvLyBjbGFzcyBTdGFraW5nRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjcmVhdGVfbWFueQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9lbmFibGVfcmVnaXN0cnlfcm91dGVANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGVuYWJsZV9yZWdpc3RyeQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2hpbGRyZW5fcm91dGVANzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMTAKICAgIC8vIGNsYXNzIFN0YWtpbmdGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9jaGlsZHJlbgogICAgc3dhcAogICAgaXRvYgogICAgYnl0ZSAweDAwMGEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF92ZXJzaW9uX3JvdXRlQDg6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMTAKICAgIC8vIGNsYXNzIFN0YWtpbmdGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X3ZlcnNpb24KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV91cGRhdGVfcm91dGVAOToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAxMAogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhcHByb3ZlX3VwZGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9ncmFudF91cGdyYWRlcl9yb3V0ZUAxMDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAxMAogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBncmFudF91cGdyYWRlcgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl90cmFuc2Zlcl9yb3V0ZUAxMToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6OTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMTAKICAgIC8vIGNsYXNzIFN0YWtpbmdGYWN0b3J5KEJhc2VGYWN0b3J5KToKICAgIGludCAwCiAgICBpbnQgNAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgbWF0Y2ggbWFpbl9jcmVhdGVAMTUgbWFpbl9vbl91cGRhdGVAMTYKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fY3JlYXRlQDE1OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDEwCiAgICAvLyBjbGFzcyBTdGFraW5nRmFjdG9yeShCYXNlRmFjdG9yeSk6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX29uX3VwZGF0ZUAxNjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM5CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM5LTU0MAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIGNhbGxzdWIgb25fdXBkYXRlCiAgICBpbnQgMQogICAgcmV0dXJuCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtpbmdGYWN0b3J5LmNyZWF0ZShvd25lcjogYnl0ZXMsIGZ1bmRlcjogYnl0ZXMsIGRlbGVnYXRlOiBieXRlcywgcGVyaW9kOiBieXRlcykgLT4gdWludDY0OgpjcmVhdGU6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMTctMjAyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgb3duZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBmdW5kZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBkZWxlZ2F0ZTogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIHBlcmlvZDogYXJjNC5VSW50NjQsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDM3LTIwMzgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMzktMjA0MAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBiYXNlX2FwcCwgbWJyX2luY3JlYXNlID0gc2VsZi5jcmVhdGVfY2hpbGQob3duZXIsIGZ1bmRlcikKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIGNyZWF0ZV9jaGlsZAogICAgc3dhcAogICAgY292ZXIgMgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDQzCiAgICAvLyBwYXltZW50X2Ftb3VudCA+PSBtYnJfaW5jcmVhc2UgKyBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIGR1cAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgICsKICAgIGRpZyAyCiAgICA8PQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDQxLTIwNDQKICAgIC8vICMgc3VycGx1cyBpcyB0aGUgaW5pdGlhbCBiYWxhbmNlIG9mIHRoZSBjaGlsZCwgbm90IHJlZnVuZGVkCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnRfYW1vdW50ID49IG1icl9pbmNyZWFzZSArIG9wLkdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gKSwgInBheW1lbnQgYW1vdW50IGFjY3VyYXRlIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgYW1vdW50IGFjY3VyYXRlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNDUKICAgIC8vIGluaXRpYWwgPSBwYXltZW50X2Ftb3VudCAtIG1icl9pbmNyZWFzZSAtIG9wLkdsb2JhbC5taW5fYmFsYW5jZQogICAgLQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIC0KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA0NgogICAgLy8gc2VsZi5pbml0X3N0YWtpbmcoYmFzZV9hcHAsIG93bmVyLCBmdW5kZXIsIGRlbGVnYXRlLCBwZXJpb2QsIGluaXRpYWwpCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDUKICAgIGNhbGxzdWIgaW5pdF9zdGFraW5nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNDcKICAgIC8vIHJldHVybiBiYXNlX2FwcC5pZAogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLnJlcXVpcmVfcGF5bWVudCh3aG86IGJ5dGVzKSAtPiB1aW50NjQ6CnJlcXVpcmVfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYtMjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHJlcXVpcmVfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayBwYXltZW50CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZXF1aXJlX3BheW1lbnQod2hvOiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjUKICAgIC8vIHJlZl9ncm91cF9pbmRleCA9IFR4bi5ncm91cF9pbmRleAogICAgdHhuIEdyb3VwSW5kZXgKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MjYKICAgIC8vIGFzc2VydCByZWZfZ3JvdXBfaW5kZXggPiAwLCAiZ3JvdXAgaW5kZXggZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBncm91cCBpbmRleCBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc3JjL3NyYy91dGlscy5weToyNwogICAgLy8gcGF5bWVudF9ncm91cF9pbmRleCA9IHJlZl9ncm91cF9pbmRleCAtIDEKICAgIGludCAxCiAgICAtCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjI5CiAgICAvLyBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToyOC0zMAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihwYXltZW50X2dyb3VwX2luZGV4KS5zZW5kZXIgPT0gd2hvCiAgICAvLyApLCAicGF5bWVudCBzZW5kZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCBzZW5kZXIgYWNjdXJhdGUKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MzIKICAgIC8vIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMzCiAgICAvLyA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc3JjL3NyYy91dGlscy5weTozMi0zMwogICAgLy8gZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24ocGF5bWVudF9ncm91cF9pbmRleCkucmVjZWl2ZXIKICAgIC8vID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgID09CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjMxLTM0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLnJlY2VpdmVyCiAgICAvLyAgICAgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgInBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUiCiAgICBhc3NlcnQgLy8gcGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy91dGlscy5weTozNQogICAgLy8gcmV0dXJuIGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHBheW1lbnRfZ3JvdXBfaW5kZXgpLmFtb3VudAogICAgZ3R4bnMgQW1vdW50CiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkuY3JlYXRlX2NoaWxkKG93bmVyOiBieXRlcywgZnVuZGVyOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CmNyZWF0ZV9jaGlsZDoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc4OS0xNzkyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNyZWF0ZV9jaGlsZCgKICAgIC8vICAgICBzZWxmLCBvd25lcjogYXJjNC5BZGRyZXNzLCBmdW5kZXI6IGFyYzQuQWRkcmVzcwogICAgLy8gKSAtPiB0dXBsZVtBcHBsaWNhdGlvbiwgVUludDY0XToKICAgIHByb3RvIDIgMgogICAgYnl0ZSAiIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODAxCiAgICAvLyBtaW5fYmFsYW5jZSA9IGdldF9taW5fYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODAyCiAgICAvLyBzaGFyZWQgPSBzZWxmLnBhcmFtcy5tYXliZSgpWzFdCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzEwLTE3MTEKICAgIC8vICMgc2hhcmVkIHRlbXBsYXRlIHN0YXRlCiAgICAvLyBzZWxmLnBhcmFtcyA9IEdsb2JhbFN0YXRlKFBhcmFtcykKICAgIGJ5dGUgInBhcmFtcyIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwMgogICAgLy8gc2hhcmVkID0gc2VsZi5wYXJhbXMubWF5YmUoKVsxXQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGJ1cnkgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODAzCiAgICAvLyBpZiBzaGFyZWQ6CiAgICBieiBjcmVhdGVfY2hpbGRfZWxzZV9ib2R5QDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwNQogICAgLy8gQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zLCBnbG9iYWxfYnl0ZXM9NQogICAgaW50IDUKICAgIGIgY3JlYXRlX2NoaWxkX2FmdGVyX2lmX2Vsc2VAMwoKY3JlYXRlX2NoaWxkX2Vsc2VfYm9keUAyOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODA4CiAgICAvLyBjb21waWxlZCA9IGNvbXBpbGVfY29udHJhY3QoQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zKSAjIG1heCBleHRyYSBwYWdlcwogICAgaW50IDYKCmNyZWF0ZV9jaGlsZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDkKICAgIC8vIGJhc2VfYXBwID0gYXJjNC5hcmM0X2NyZWF0ZShBaXJkcm9wLCBjb21waWxlZD1jb21waWxlZCkuY3JlYXRlZF9hcHAKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwNC0xODA2CiAgICAvLyBjb21waWxlZCA9IGNvbXBpbGVfY29udHJhY3QoCiAgICAvLyAgICAgQWlyZHJvcCwgZXh0cmFfcHJvZ3JhbV9wYWdlcz0zLCBnbG9iYWxfYnl0ZXM9NQogICAgLy8gKSAgIyB3aXRob3V0IHBhcmFtcwogICAgaW50IDEyCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bVVpbnQKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDUKICAgIC8vIEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MywgZ2xvYmFsX2J5dGVzPTUKICAgIGludCAzCiAgICBpdHhuX2ZpZWxkIEV4dHJhUHJvZ3JhbVBhZ2VzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MDQtMTgwNgogICAgLy8gY29tcGlsZWQgPSBjb21waWxlX2NvbnRyYWN0KAogICAgLy8gICAgIEFpcmRyb3AsIGV4dHJhX3Byb2dyYW1fcGFnZXM9MywgZ2xvYmFsX2J5dGVzPTUKICAgIC8vICkgICMgd2l0aG91dCBwYXJhbXMKICAgIGJ5dGUgYmFzZTY0IENvRUJRdz09CiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGJ5dGUgYmFzZTY0IENpQUVBQUVGQWlZYkIyWjFibVJwYm1jRmRHOTBZV3dGYjNkdVpYSUdablZ1WkdWeUJuQmxjbWx2WkFoa1pXeGxaMkYwWlFoa1pXRmtiR2x1WlFoMWNHZHlZV1JsY2dad1lYSmhiWE1NYldWemMyVnVaMlZ5WDJsa0NYQmhjbVZ1ZEY5cFpBUVZIM3gxQUFsMWNHUmhkR0ZpYkdVTVpuVnNiSGxmZG1WemRHVmtDQUFBQUFBQUFBQUFDR1JsY0d4dmVXVnlCMmx1YVhScFlXd1FZMjl1ZEhKaFkzUmZkbVZ5YzJsdmJoSmtaWEJzYjNsdFpXNTBYM1psY25OcGIyNEVTQWdRN2dTbWdzQWJCSThsUnZBTWNHVnlhVzlrWDJ4cGJXbDBBUUFKYzNSaGEyVmhZbXhsSUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFNUmhBQUFPSURXd3hHMEVDNzRJWkJDOXVRUDRFQ3V2RDJ3UXdPUk5vQkhWVXcyTUVZT2tqQ2dSU0pSaXRCS0RvR0hJRXU5RHkrQVJuRlVQNUJHZ083VUFFTVNGQmRnU0VNSW55QkpoYVJaOEUyMFlDbndTV1ZnUjZCSzM1S3VRRVhOUDNpZ1RxczVGSUJLbGhYTmNFWDM2aVNBVE5KTjZJQk5XRjFhQUVlTHlaMUFSckM0LzRCTlNXdjBNMkdnQ09HUUFCQURFQVRBQ1VBTDRBendEY0FPa0JBUUVRQVI4Qk5BRktBVjhCZUFHRkFaUUJvQUd2QWI0QnpRSHJBZ2tDR3dJcUFERVpGRVF4R0VRMkdnRTJHZ0kyR2dNMkdnUTJHZ1UyR2dZMkdnYzJHZ2cyR2drMkdnbzJHZ3MyR2d5SUFpY2pRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dXSUF3TWpRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dVMkdnWTJHZ2MyR2dnMkdnazJHZ28yR2dzMkdndzJHZzAyR2c0MkdnOVhBQ0EyR2c5WElDQTJHZzlYUUFpSUJCMGpRekVaRkVReEdFUTJHZ0UyR2dJMkdnTTJHZ1EyR2dVMkdnWTJHZ2MyR2dnMkdnazJHZ3FJQklRalF6RVpGRVF4R0VTSUJKa25DMHhRc0NORE1Sa2tFa1F4R0VTSUJsa2pRekVaSkJKRU1SaEVpQWIvSTBNeEdSUkVNUmhFTmhvQk5ob0NOaG9ETmhvRWlBUC9JME14R1JSRU1SaEVOaG9CaUFjREkwTXhHUlJFTVJoRU5ob0JpQWM0STBNeEdSUkVNUmhFTmhvQmlBZHFGaWNMVEZDd0kwTXhHUlJFTVJoRWlBZmNUQlpNRmxBbkMweFFzQ05ETVJrVVJERVlSRFlhQVlnSUtSWW5DMHhRc0NORE1Sa1VSREVZUkRZYUFZZ0lRa3dXVEJaUUp3dE1VTEFqUXpFWkpCSkVNUmhFaUFqRUkwTXhHUlJFTVJoRU5ob0JpQWp3STBNeEdSUkVNUmhFaUFrRUkwTXhHUlJFTVJoRU5ob0JpQWxFSTBNeEdSUkVNUmhFTmhvQmlBbFZJME14R1JSRU1SaEVOaG9CaUFsN0kwTXhHUlJFTVJoRU5ob0JOaG9DTmhvRE5ob0VOaG9GTmhvR2lBbVBJME14R1JSRU1SaEVOaG9CTmhvQ05ob0ROaG9FTmhvRk5ob0dpQW4vSTBNeEdSUkVNUmhFTmhvQk5ob0NpQW9xSTBNeEdSUkVNUmhFTmhvQmlBcEVJME14R1JSRU1SaEVOaG9CaUFLbkkwTWlnUVF4R1k0Q0FBRUFDZ0F4R0JSRWlBcEVJME14R0VTSUNrZ2pRNG9NQURFQU1na1NSQ0luQ0dWRkFSUkVJaWNKWlVRVVJDSVdpL3BMQWFWRWkvbWtSQ0luQkdWRUZFUWlKd1psUkJSRUlpbGxSQlJFSWlobFJCUkVJaWNGWlVReUF4SkVpL1NMOVZDTDlsQ0w5MUJKaS9oUWkvbFFpL3BRaS90UWkveFFpLzFRaS81UWkvOVFKeFpNVUxDTCtWQ0wrbEFuQ0V4bmkvZ1hKd2xNWjR2N0Z5Y0VUR2VML0JjbkJreG5pLzBYS1V4bmkvNFhLRXhuSndXTC8yY2lLR1ZFUVFBSklpY0laVVNJQUFKSWlZb0JBU0luRG1WRkFVRUFJb3YvVndnSUY0di9WeGdJRjR2L1Z4QUlGeUluQkdWRUlpaGxSSWdBQnljT1RHZUwvNG1LQlFHTC9ZditDNHY4QzR2N2kvd0xpLzhJQ0ltS0JRQXhBRElKRWtRaUp3aGxSUUVVUkNJbkJHVkVGRVFpSndabFJCUkVJaWxsUkJSRUlpaGxSQlJFSWljRlpVUXlBeEpFaUFDSlJ3SlhLQWhKSncrbFJFc0JWeUFJU1NjUHBVUWlKd3BsUkNjSlpVUkxBMWNBQ0V4TEJGY0lDRXhMQlZjUUNFNENUd1pYR0FoT0F4Wk9CRThEVEZCTVVFeFFURkJNVUV4UWkvdFFpL3hRaS8xUWkvNVFpLzlRSnhaTVVMQ0wreGNuQkV4bmkvd1hKd1pNWjR2OUZ5bE1aNHYrRnloTVp5Y0ZpLzluSWlobFJFRUFCb3NBaVA3OFNJbUtBQUV5Q0NjSVpVRUFCSXNBVEltSUFJVkJBSGNuRjJRV2dBMTJaWE4wYVc1blgyUmxiR0Y1WkJhQURHeHZZMnQxY0Y5a1pXeGhlV1FXZ0E1d1pYSnBiMlJmYzJWamIyNWtjMlFXZ0JKa2FYTjBjbWxpZFhScGIyNWZZMjkxYm5Sa0ZvQVVaR2x6ZEhKcFluVjBhVzl1WDNObFkyOXVaSE5rRms4RlR3VlFUd1JRVHdOUVR3SlFURkJNaVNJbkNtVkVKd2hsUkV5SmlnQUJNZ2duRjJWRkFZbUtFUUNMNzR2d2kvR0w4b3Z6aS9TTDlZdjJpL2VMK0l2NWkvcUkvWW1MKzRnQURJdjhpLzJML292L2lBQWhpWW9CQURFQU1na1NSQ0luQjJWRWkvOVFnQVN0OWVLNFRGQ3dKd2VMLzJlSmlnUUFJaXBsUkRJREVrUWlLMlZFTWdNU1JERUFNZ2tTUkl2OGkvMVFpLzVRaS85UWdBU2RuRzhMVEZDd0p4Q0wvR2NxaS8xbks0ditaNHYvRnljUlRHZUppZ29BaS9hTDk0djRpL21MK29qOS9ZdjdpUCtKaS95TC9ZditpLytJLzU2SmlnQUJKd3lJL3FRaUp3bGxURWxQQWtRaUp3aGxSUUZBQUJXSS95YUxBb3dEUUFBTElpY0taVVFuQ1dWSWpBT0xBNHdDSW93QUlpaGxSRUVBRDRzQmlBRDdqQUdNQUlnQkxVSUFCQ0lwWlVRaUttVkVJaXRsUkNJbkJXVkVJaWNRWlVRaUp3ZGxSQ0luQ21WRUZvc0NGa3lMQVVsWEFBaE9BMGxYQ0FoT0JFbFhFQWhPQlVsWEdBaE9Ca2xYSUFoT0IxY29DRTRISWljRVpVUVdUZ0lpSndabFJCWWlLV1ZFRmlJb1pVUVdJaWNSWlVRV2l3QVdUQ0luRW1WRUZpSW5FMlZFRmlJbkRXVkVKeGdpVHdKVUlpY1paVVFuR0NKUEFsUXlDbUFXVEU4WUZrNENpQURoRms0Q1R4bFBHVkJQR0ZCUEYxQlBGbEJQRFZCUERWQlBEbEJQRGxCUERsQlBEbEJQRGxCUERsQlBEVkJQREZCUEMxQlBDbEJQQ0ZCUENGQlBCMUJQQmxCUEJWQk1JbE9CZ1JKTVZFeFFUd0pRVEZDTUFJbUtBUUlpSnc1bFFRQU1pd0JCQUFlTEFJdi9Ud0tKaS85WENBZ1hpLzlYR0FnWGkvOVhFQWdYSWljRVpVUWlLR1ZFaVB4bWkvOVBBb21LQUFFeUI0ajlMb2ovdkNJcFpVeE9Ba1JKVnlBSUYweFhLQWdYaUFBQmlZb0ZBU2NNaS91TC9BNUJBQVNML1V5SmkvdUwvQW1ML3dwSmpBQ0wvZzVCQUEyTC9vc0FDWXY5QzR2K0NreUpJa3lKaWdBQk1ncGdNZ0VKaVlvQUFERUFJaXRsUkJKQUFBb3hBQ0lxWlVRU1FRQUVJMElBQVNKRUlpaGxSQlJFTVFBaUttVkVVQ2NVVEZDd0lpcGxSSWdBQVltS0FRQXhHU1FTUkRJSk1nR3hnRUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBc2o4aXNnNGlzZzBpc2d3bkdySUxKeHF5Q2lPeU9TV3lFQ0t5QWJheUNJdi9zZ215QnlPeUVDS3lBYk9KaWdBQU1RQWlKd2RsUkJKRUlpY05aVVFqRWtRaUp3ZGxSQ0lyWlVSUUp4Uk1VTEFpSzJWRWlQOWFpWW9CQUNJb1pVUVVSQ0lwWlVRVVJERUFJaXBsUkJKRWlQdmlWd0FJaS8rblJDSW5CbVZFTWdjTlJDSW5CR1ZFRm92L1VJQUV0ajZYa2t4UXNJdi9GeWNFVEdlSmlnRUFNUUFpSzJWRUVrUWlLR1ZFUVFBS0lpaGxSRElIRFVFQUJDTkNBQUVpUkNJb1pVUVdpLzlRZ0FUUVhlNGNURkN3aS84WEtFeG5pUHQ4aVBwelNJbUtBUUVuREVjQ01RQWlLbVZFRWtRaUtHVkVRUUExaVA0b1NZd0FTUmFMLzFBbkZVeFFzSWorYW92L0YwbU1BUWtPUkl2L0p3K2xRUUFRc1RFQXNnZUxBYklJSTdJUUlySUJzNGtpS1dWTVNVNENqQUJFU1JhTC8xQW5GVXhRc0lqK01Zdi9GMG1NQWdrT1JJdi9KdytsUVFBUXNURUFzZ2VMQXJJSUk3SVFJcklCczRtS0FBSW5ERWNDTVFBaUttVkVFa1FpS0dWRVFRQUlpUDJrakFKQ0FBY2lLV1ZNakFKRWlQM25TWXdCSW93QWl3SU5RUUFIaXdHTEFnbU1BSXNDRm9zQVNVNENGbEFuRlV4UXNFRUFFTEV4QUxJSGl3Q3lDQ095RUNLeUFiT0xBSXNDakFHTUFJbUtBUUVpS0dWRVFBQUZJaWxsUkltSStudUwveGRNaVAwRklpbGxURTRDUkVsWElBZ1hURmNvQ0JlSS9VcUppZ0VDSnd4SEFpSW9aVVJBQUFvaUtXVkVJb3dBakFHSmlQcEVpUHpTVEVsT0Fvd0FpLzhYVENJcFpVeE9Ba1JKVnlBSUYwbE9Bb3dCVnlnSUYwbU1BazhEVGdTSUFDQkpRQUFHSW93QmpBQ0pJaWxsUkVzQml3QlBBb3NCaXdLSS9PZU1BWXdBaVlvRkFZdjdpL3lML1l2K2kvK0kvTkpKUUFBRElreUppd0NML2d1TC9RZ2pDWXY5Q292K0l3aE1DWXYvQzR2OENFeUppZ0FBSWlobFJFU0kvSVVVUkRFQUlpcGxSQkpBQUFveEFDSXJaVVFTUVFBRUkwSUFBU0pFTVFBaUttVkVVQ2NVVEZDd0lpcGxSSWo4NlltS0FRQXhBQ0lxWlVRU1JDSXFaVVNMLzFDQUJKb2lQdnRNVUxBcWkvOW5pWW9BQURFQUlpdGxSQkpFSWl0bFJJZ0FIU0lwWlVSTEFRaE1Ga3hKRms4Q1RGQ0FCTU1EcHJ4TVVMQXBUR2VKaWdFQk1SWkpSQ01KU1RnUUl4SkVTVGdBaS84U1JFazRCeklLRWtRNENJbUtBUUF4QUNJclpVUVNSQ0lyWlVTTC8xQ0FCRU9IMXNGTVVMQXJpLzluaVlvQkFERUFJaXRsUkJKRUlpaGxSQlJFSWlsbFJCYUwvNmRFSWlsbFJJdi9Gd2xKRm92L1RGQ0FCRTFJZ1E1TVVMQXBUR2VKaWdFQU1RQWlLbVZFRWtBQUNERUFNZ2tTUVFBRUkwSUFBU0pFSWljRlpVU0wvMUNBQkhobVZYZE1VTEFuQll2L1o0bUtCZ0F4QUNJcVpVUVNRQUFMTVFBaUp3VmxSQkpCQUFRalFnQUJJa1F5QURFQWlQODBTd0VTUkl2NmkvdUwvSXY5aS82TC8wOEdpQUFIalArTSs0ejZpWW9IQXpFQVNZdjVVSXY2VUl2N1VJdjhVSXY5VUl2K1VGQ0FCRzFFa0Q5TVVMQ3hpL3NYaS93WGkvMFhpLzZ5UDdJT3NnMnlESXY2c2d1TCtiSUtKYklRaS8reUFiT0wrWXY2aS82SmlnWUFNUUFpS21WRUVrQUFDekVBSWljRlpVUVNRUUFFSTBJQUFTSkVNUUV5QUNVTEQwU0wrb3Y3aS95TC9ZditpLzhpaVA5OWpQK00rNHo2aVlvQ0FERUFJaWNIWlVRU1JJditpLzlRZ0FTTWpQbk5URkN3aS80WEp4Sk1aNHYvRnljVFRHZUppZ0VBTVFBaUttVkVFa1FpS21WRWkvOVFnQVRDZVdXTFRGQ3dpLzhpVXljTlRHZUppZ0FBTWcxSlJDY0tUR2VKaWdBQU1RQWlKd2RsUkJKRUlpY05aVVFqRWtTSmlnQUFpQUJDSndvaVp5Y1FNZ05uSndVeUEyY25HU05uSnhJaVp5Y1RJbWNuRFNObkp3Y3lDV2NxTWdObkp3UWlaeWNSSW1jbkJpSm5LeklEWnlnaVp5a2laeWNKSW1lSmlnQUFLaklEWnljRUltY25FU0puSndZaVp5Y09JbWNyTWdObktDSm5LU0puSndvaVp5Y1FNZ05uSndraVo0az0KICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgwOQogICAgLy8gYmFzZV9hcHAgPSBhcmM0LmFyYzRfY3JlYXRlKEFpcmRyb3AsIGNvbXBpbGVkPWNvbXBpbGVkKS5jcmVhdGVkX2FwcAogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTAKICAgIC8vIGFyYzQuZW1pdChGYWN0b3J5Q3JlYXRlZChhcmM0LlVJbnQ2NChiYXNlX2FwcC5pZCkpKQogICAgaXRvYgogICAgbWV0aG9kICJGYWN0b3J5Q3JlYXRlZCh1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcxMy0xNzE1CiAgICAvLyAjIHJlZ2lzdHJ5IHN0YXRlLCBpbiBib3hlcyBzbyBmYWN0b3JpZXMgdXBkYXRlZAogICAgLy8gIyAgIGluIHBsYWNlIGtlZXAgdGhlaXIgZ2xvYmFsIHNjaGVtYQogICAgLy8gc2VsZi5yZWdpc3RyeSA9IEJveChVSW50NjQsIGtleT1iInJlZ2lzdHJ5IikKICAgIGJ5dGUgMHg3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MTEKICAgIC8vIGlmIHNlbGYucmVnaXN0cnk6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGNyZWF0ZV9jaGlsZF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgxMgogICAgLy8gc2VsZi5yZWdpc3RlcihiYXNlX2FwcC5pZCwgb3duZXIsIGZ1bmRlcikKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiByZWdpc3RlcgoKY3JlYXRlX2NoaWxkX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgxMwogICAgLy8gcmV0dXJuIGJhc2VfYXBwLCBnZXRfbWluX2JhbGFuY2UoKSAtIG1pbl9iYWxhbmNlCiAgICBjYWxsc3ViIGdldF9taW5fYmFsYW5jZQogICAgZnJhbWVfZGlnIDEKICAgIC0KICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLmdldF9taW5fYmFsYW5jZSgpIC0+IHVpbnQ2NDoKZ2V0X21pbl9iYWxhbmNlOgogICAgLy8gc3JjL3NyYy91dGlscy5weTo1MS01OAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X21pbl9iYWxhbmNlIChpbnRlcm5hbCkKICAgIC8vICMgcHVycG9zZTogZ2V0IG1pbiBiYWxhbmNlIG9mIGFwcCBhY2NvdW50LAogICAgLy8gIyAgIGdyb3dzIHdpdGggYXBwcyBjcmVhdGVkIGJ5IGl0CiAgICAvLyAjIHJldHVybnM6IGFwcCBtaW4gYmFsYW5jZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfbWluX2JhbGFuY2UoKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjAKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjU5LTYxCiAgICAvLyBtaW5fYmFsYW5jZSwgZXhpc3RzID0gb3AuQWNjdFBhcmFtc0dldC5hY2N0X21pbl9iYWxhbmNlKAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICkKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgcG9wCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjYyCiAgICAvLyByZXR1cm4gbWluX2JhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5yZWdpc3RlcihhcHBfaWQ6IHVpbnQ2NCwgb3duZXI6IGJ5dGVzLCBmdW5kZXI6IGJ5dGVzKSAtPiB2b2lkOgpyZWdpc3RlcjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc3Ni0xNzc5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlZ2lzdGVyKAogICAgLy8gICAgIHNlbGYsIGFwcF9pZDogVUludDY0LCBvd25lcjogYXJjNC5BZGRyZXNzLCBmdW5kZXI6IGFyYzQuQWRkcmVzcwogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3ODQKICAgIC8vIGIiYyIgKyBvd25lci5ieXRlcywKICAgIGJ5dGUgMHg2MwogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc4NQogICAgLy8gQ2hpbGRJbmZvKGFyYzQuVUludDY0KGFwcF9pZCksIGZ1bmRlciwgYXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSkuYnl0ZXMsCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgc3dhcAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzg2CiAgICAvLyBVSW50NjQoMjEpLAogICAgaW50IDIxCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3ODMtMTc4NwogICAgLy8gYXBwZW5kX3BhZ2VkKAogICAgLy8gICAgIGIiYyIgKyBvd25lci5ieXRlcywKICAgIC8vICAgICBDaGlsZEluZm8oYXJjNC5VSW50NjQoYXBwX2lkKSwgZnVuZGVyLCBhcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpKS5ieXRlcywKICAgIC8vICAgICBVSW50NjQoMjEpLAogICAgLy8gKQogICAgY2FsbHN1YiBhcHBlbmRfcGFnZWQKICAgIHJldHN1YgoKCi8vIHNyYy51dGlscy5hcHBlbmRfcGFnZWQoa2V5OiBieXRlcywgaXRlbTogYnl0ZXMsIHBhZ2Vfc2l6ZTogdWludDY0KSAtPiB2b2lkOgphcHBlbmRfcGFnZWQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjExMi0xMjQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGFwcGVuZF9wYWdlZCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBrZXksIGxpc3Qga2V5LCBib3gga2V5IGhvbGRzIGl0ZW0gY291bnQsCiAgICAvLyAjICAgYm94IGtleSArIHBhZ2UgaW5kZXggaG9sZHMgcGFnZSBvZiBpdGVtcwogICAgLy8gIyAtIGl0ZW0sIGZpeGVkIHNpemUgaXRlbQogICAgLy8gIyAtIHBhZ2Vfc2l6ZSwgaXRlbXMgcGVyIHBhZ2UsIHBhZ2VzIGFyZQogICAgLy8gIyAgIGF0IG1vc3QgMUtCIHRvIGJlIHJlYWQgd2l0aCBvbmUgYm94IHJlZgogICAgLy8gIyBwdXJwb3NlOiBhcHBlbmQgaXRlbSB0byBsaXN0IGtlcHQgaW4gcGFnZXMKICAgIC8vICMgICB3cml0aW5nIG9ubHkgY291bnQgYW5kIGxhc3QgcGFnZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhcHBlbmRfcGFnZWQoa2V5OiBCeXRlcywgaXRlbTogQnl0ZXMsIHBhZ2Vfc2l6ZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICBieXRlICIiCiAgICBkdXAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI1CiAgICAvLyBjb3VudCA9IFVJbnQ2NCgwKQogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI2CiAgICAvLyBjb3VudF9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9nZXQKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI3CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBhcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEyOAogICAgLy8gY291bnQgPSBvcC5idG9pKGNvdW50X2J5dGVzKQogICAgZnJhbWVfZGlnIDMKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMgoKYXBwZW5kX3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTI5CiAgICAvLyBwYWdlX2tleSA9IGtleSArIG9wLml0b2IoY291bnQgLy8gcGFnZV9zaXplKQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICAvCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzAKICAgIC8vIG9mZnNldCA9IChjb3VudCAlIHBhZ2Vfc2l6ZSkgKiBpdGVtLmxlbmd0aAogICAgZnJhbWVfZGlnIC0xCiAgICAlCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgICoKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzMQogICAgLy8gaWYgb2Zmc2V0ID09IDA6CiAgICBibnogYXBwZW5kX3BhZ2VkX2Vsc2VfYm9keUA0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzMgogICAgLy8gb3AuQm94LnB1dChwYWdlX2tleSwgaXRlbSkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X3B1dAogICAgYiBhcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA1CgphcHBlbmRfcGFnZWRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzNAogICAgLy8gb3AuQm94LnJlc2l6ZShwYWdlX2tleSwgb2Zmc2V0ICsgaXRlbS5sZW5ndGgpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYm94X3Jlc2l6ZQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzUKICAgIC8vIG9wLkJveC5yZXBsYWNlKHBhZ2Vfa2V5LCBvZmZzZXQsIGl0ZW0pCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9yZXBsYWNlCgphcHBlbmRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMzYKICAgIC8vIG9wLkJveC5wdXQoa2V5LCBvcC5pdG9iKGNvdW50ICsgMSkpCiAgICBmcmFtZV9kaWcgMgogICAgaW50IDEKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtpbmdGYWN0b3J5LmluaXRfc3Rha2luZyhiYXNlX2FwcDogdWludDY0LCBvd25lcjogYnl0ZXMsIGZ1bmRlcjogYnl0ZXMsIGRlbGVnYXRlOiBieXRlcywgcGVyaW9kOiBieXRlcywgaW5pdGlhbDogdWludDY0KSAtPiB2b2lkOgppbml0X3N0YWtpbmc6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwODQtMjA5MwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpbml0X3N0YWtpbmcoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBiYXNlX2FwcDogQXBwbGljYXRpb24sCiAgICAvLyAgICAgb3duZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBmdW5kZXI6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICBkZWxlZ2F0ZTogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIHBlcmlvZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgaW5pdGlhbDogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwOTctMjA5OAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBhc3NlcnQgcGVyaW9kIDwgMTgsICJwZXJpb2QgbGVzcyB0aGFuIDE4IgogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAxMgogICAgYjwKICAgIGFzc2VydCAvLyBwZXJpb2QgbGVzcyB0aGFuIDE4CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwOTktMjEwMgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9YmFzZV9hcHAuYWRkcmVzcywgYW1vdW50PWluaXRpYWwgKyBvcC5HbG9iYWwubWluX2JhbGFuY2UsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMDEKICAgIC8vIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgZnJhbWVfZGlnIC02CiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICArCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDk5LTIxMDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTAxCiAgICAvLyByZWNlaXZlcj1iYXNlX2FwcC5hZGRyZXNzLCBhbW91bnQ9aW5pdGlhbCArIG9wLkdsb2JhbC5taW5fYmFsYW5jZSwgZmVlPTAKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDk5LTIxMDIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPWJhc2VfYXBwLmFkZHJlc3MsIGFtb3VudD1pbml0aWFsICsgb3AuR2xvYmFsLm1pbl9iYWxhbmNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjEwMy0yMTIzCiAgICAvLyBhcmM0LmFiaV9jYWxsKCAgIyBlbWl0IFRlbXBsYXRlLCBVcGdyYWRlckdyYW50ZWQsIFNldHVwCiAgICAvLyAgICAgQWlyZHJvcC5pbml0LAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9MSU1JVCIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJWRVNUSU5HX0RFTEFZIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJNRVNTRU5HRVJfSUQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoKHBlcmlvZC5uYXRpdmUgKyBVSW50NjQoMikpICogVUludDY0KDIpIC8vIFVJbnQ2NCgzKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiRElTVFJJQlVUSU9OX1NFQ09ORFMiKSksCiAgICAvLyAgICAgcGVyaW9kLAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBkZWFkbGluZQogICAgLy8gICAgIGluaXRpYWwsICAjIHRvdGFsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVUludDY0KDApKSwgICMgZnVuZGluZwogICAgLy8gICAgIGRlbGVnYXRlLAogICAgLy8gICAgIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICAjIGluaGVyaXQgdXBncmFkZXIKICAgIC8vICAgICBUeG4uc2VuZGVyLCAgIyBkZXBsb3llcgogICAgLy8gICAgIG93bmVyLAogICAgLy8gICAgIGZ1bmRlciwKICAgIC8vICAgICBpbml0aWFsLAogICAgLy8gICAgIGFwcF9pZD1iYXNlX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjEwNQogICAgLy8gYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX0xJTUlUIikpLAogICAgaW50IFRNUExfUEVSSU9EX0xJTUlUCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMDYKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlZFU1RJTkdfREVMQVkiKSksCiAgICBpbnQgVE1QTF9WRVNUSU5HX0RFTEFZCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMDcKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpKSwKICAgIGludCBUTVBMX0xPQ0tVUF9ERUxBWQogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTA4CiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfU0VDT05EUyIpKSwKICAgIGludCBUTVBMX1BFUklPRF9TRUNPTkRTCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMDkKICAgIC8vIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1FU1NFTkdFUl9JRCIpKSwKICAgIGludCBUTVBMX01FU1NFTkdFUl9JRAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTEwCiAgICAvLyBhcmM0LlVJbnQ2NCgocGVyaW9kLm5hdGl2ZSArIFVJbnQ2NCgyKSkgKiBVSW50NjQoMikgLy8gVUludDY0KDMpKSwKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgaW50IDIKICAgICsKICAgIGludCAyCiAgICAqCiAgICBpbnQgMwogICAgLwogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTExCiAgICAvLyBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJESVNUUklCVVRJT05fU0VDT05EUyIpKSwKICAgIGludCBUTVBMX0RJU1RSSUJVVElPTl9TRUNPTkRTCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMTMKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wLCAgIyBkZWFkbGluZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTE0CiAgICAvLyBpbml0aWFsLCAgIyB0b3RhbAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMTUKICAgIC8vIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIGludCAwCiAgICBpdG9iCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMTcKICAgIC8vIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICAjIGluaGVyaXQgdXBncmFkZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY292ZXIgMwogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTE4CiAgICAvLyBUeG4uc2VuZGVyLCAgIyBkZXBsb3llcgogICAgdHhuIFNlbmRlcgogICAgY292ZXIgNAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMTE5LTIxMjEKICAgIC8vIG93bmVyLAogICAgLy8gZnVuZGVyLAogICAgLy8gaW5pdGlhbCwKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtNgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIxMDMtMjEyMwogICAgLy8gYXJjNC5hYmlfY2FsbCggICMgZW1pdCBUZW1wbGF0ZSwgVXBncmFkZXJHcmFudGVkLCBTZXR1cAogICAgLy8gICAgIEFpcmRyb3AuaW5pdCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJQRVJJT0RfTElNSVQiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiVkVTVElOR19ERUxBWSIpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChUZW1wbGF0ZVZhcltVSW50NjRdKCJMT0NLVVBfREVMQVkiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoVGVtcGxhdGVWYXJbVUludDY0XSgiTUVTU0VOR0VSX0lEIikpLAogICAgLy8gICAgIGFyYzQuVUludDY0KChwZXJpb2QubmF0aXZlICsgVUludDY0KDIpKSAqIFVJbnQ2NCgyKSAvLyBVSW50NjQoMykpLAogICAgLy8gICAgIGFyYzQuVUludDY0KFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkRJU1RSSUJVVElPTl9TRUNPTkRTIikpLAogICAgLy8gICAgIHBlcmlvZCwKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCwgICMgZGVhZGxpbmUKICAgIC8vICAgICBpbml0aWFsLCAgIyB0b3RhbAogICAgLy8gICAgIGFyYzQuVUludDY0KFVJbnQ2NCgwKSksICAjIGZ1bmRpbmcKICAgIC8vICAgICBkZWxlZ2F0ZSwKICAgIC8vICAgICBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAgIyBpbmhlcml0IHVwZ3JhZGVyCiAgICAvLyAgICAgVHhuLnNlbmRlciwgICMgZGVwbG95ZXIKICAgIC8vICAgICBvd25lciwKICAgIC8vICAgICBmdW5kZXIsCiAgICAvLyAgICAgaW5pdGlhbCwKICAgIC8vICAgICBhcHBfaWQ9YmFzZV9hcHAsCiAgICAvLyApCiAgICBtZXRob2QgImluaXQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsdWludDY0KXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAxMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDEwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA5CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA4CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA3CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA2CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtpbmdGYWN0b3J5LmNyZWF0ZV9tYW55KGFyZ3M6IGJ5dGVzKSAtPiBieXRlczoKY3JlYXRlX21hbnk6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNDktMjA1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX21hbnkoCiAgICAvLyAgICAgc2VsZiwgYXJnczogYXJjNC5EeW5hbWljQXJyYXlbU3Rha2luZ0NyZWF0ZUFyZ3NdCiAgICAvLyApIC0+IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XToKICAgIHByb3RvIDEgMQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDYyLTIwNjMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNjQKICAgIC8vIGFzc2VydCBhcmdzLmxlbmd0aCA+IDAsICJhcmdzIG5vdCBlbXB0eSIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGFzc2VydCAvLyBhcmdzIG5vdCBlbXB0eQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDY1LTIwNjYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXBwX2lkcyA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSgpCiAgICBieXRlIDB4MDAwMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDY3CiAgICAvLyBjb3N0ID0gVUludDY0KDApCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDY4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXJncy5sZW5ndGgpOgogICAgZHVwCgpjcmVhdGVfbWFueV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNjgKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcmdzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGNyZWF0ZV9tYW55X2FmdGVyX2ZvckA0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNjkKICAgIC8vIGFyZyA9IGFyZ3NbaV0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnQgMTEyCiAgICAqCiAgICBpbnQgMTEyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA3MAogICAgLy8gYmFzZV9hcHAsIG1icl9pbmNyZWFzZSA9IHNlbGYuY3JlYXRlX2NoaWxkKGFyZy5vd25lciwgYXJnLmZ1bmRlcikKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZHVwCiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDIKICAgIGRpZyAxCiAgICBjYWxsc3ViIGNyZWF0ZV9jaGlsZAogICAgY292ZXIgNAogICAgc3dhcAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToyMDc1CiAgICAvLyBhcmcuZGVsZWdhdGUsCiAgICBkaWcgMgogICAgZXh0cmFjdCA2NCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA3NgogICAgLy8gYXJnLnBlcmlvZCwKICAgIGRpZyAzCiAgICBleHRyYWN0IDk2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNzcKICAgIC8vIGFyZy5pbml0aWFsLm5hdGl2ZSwKICAgIHVuY292ZXIgNAogICAgZXh0cmFjdCAxMDQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA3MS0yMDc4CiAgICAvLyBzZWxmLmluaXRfc3Rha2luZygKICAgIC8vICAgICBiYXNlX2FwcCwKICAgIC8vICAgICBhcmcub3duZXIsCiAgICAvLyAgICAgYXJnLmZ1bmRlciwKICAgIC8vICAgICBhcmcuZGVsZWdhdGUsCiAgICAvLyAgICAgYXJnLnBlcmlvZCwKICAgIC8vICAgICBhcmcuaW5pdGlhbC5uYXRpdmUsCiAgICAvLyApCiAgICBkaWcgMwogICAgdW5jb3ZlciA2CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgNgogICAgdW5jb3ZlciA1CiAgICBkaWcgNQogICAgY2FsbHN1YiBpbml0X3N0YWtpbmcKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA3OQogICAgLy8gY29zdCArPSBtYnJfaW5jcmVhc2UgKyBvcC5HbG9iYWwubWluX2JhbGFuY2UgKyBhcmcuaW5pdGlhbC5uYXRpdmUKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICB1bmNvdmVyIDMKICAgICsKICAgICsKICAgIGZyYW1lX2RpZyAzCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA4MAogICAgLy8gYXBwX2lkcy5hcHBlbmQoYXJjNC5VSW50NjQoYmFzZV9hcHAuaWQpKQogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnQgOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwNjgKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcmdzLmxlbmd0aCk6CiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGNyZWF0ZV9tYW55X2Zvcl9oZWFkZXJAMQoKY3JlYXRlX21hbnlfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwODEKICAgIC8vIHNlbGYuc2V0dGxlX3BheW1lbnQocGF5bWVudF9hbW91bnQsIGNvc3QpCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDMKICAgIGNhbGxzdWIgc2V0dGxlX3BheW1lbnQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjA4MgogICAgLy8gcmV0dXJuIGFwcF9pZHMKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5CYXNlRmFjdG9yeS5zZXR0bGVfcGF5bWVudChwYXltZW50X2Ftb3VudDogdWludDY0LCBjb3N0OiB1aW50NjQpIC0+IHZvaWQ6CnNldHRsZV9wYXltZW50OgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODE1LTE4MTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0dGxlX3BheW1lbnQoc2VsZiwgcGF5bWVudF9hbW91bnQ6IFVJbnQ2NCwgY29zdDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjAKICAgIC8vIGFzc2VydCBwYXltZW50X2Ftb3VudCA+PSBjb3N0LCAicGF5bWVudCBhbW91bnQgYWNjdXJhdGUiCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgPj0KICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3VudCBhY2N1cmF0ZQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODIxCiAgICAvLyBpZiBwYXltZW50X2Ftb3VudCA+IGNvc3Q6CiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgYnogc2V0dGxlX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjItMTgyNAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjMKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTgyMgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxODIzCiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5bWVudF9hbW91bnQgLSBjb3N0LCBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE4MjItMTgyNAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50X2Ftb3VudCAtIGNvc3QsIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKc2V0dGxlX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LkJhc2VGYWN0b3J5LmVuYWJsZV9yZWdpc3RyeSgpIC0+IHZvaWQ6CmVuYWJsZV9yZWdpc3RyeToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc0NS0xNzQ2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBlbmFibGVfcmVnaXN0cnkoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzUyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIHR4biBTZW5kZXIKICAgIGludCAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZ3JhZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIHVwZ3JhZGVyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTMKICAgIC8vIG1pbl9iYWxhbmNlID0gZ2V0X21pbl9iYWxhbmNlKCkKICAgIGNhbGxzdWIgZ2V0X21pbl9iYWxhbmNlCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTQKICAgIC8vIHNlbGYucmVnaXN0cnkudmFsdWUgPSBVSW50NjQoMSkKICAgIGludCAxCiAgICBpdG9iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MTMtMTcxNQogICAgLy8gIyByZWdpc3RyeSBzdGF0ZSwgaW4gYm94ZXMgc28gZmFjdG9yaWVzIHVwZGF0ZWQKICAgIC8vICMgICBpbiBwbGFjZSBrZWVwIHRoZWlyIGdsb2JhbCBzY2hlbWEKICAgIC8vIHNlbGYucmVnaXN0cnkgPSBCb3goVUludDY0LCBrZXk9YiJyZWdpc3RyeSIpCiAgICBieXRlIDB4NzI2NTY3Njk3Mzc0NzI3OQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzU0CiAgICAvLyBzZWxmLnJlZ2lzdHJ5LnZhbHVlID0gVUludDY0KDEpCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTUKICAgIC8vIHNldHRsZV9tYnJfcGF5bWVudChtaW5fYmFsYW5jZSkKICAgIGNhbGxzdWIgc2V0dGxlX21icl9wYXltZW50CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlOiB1aW50NjQpIC0+IHZvaWQ6CnNldHRsZV9tYnJfcGF5bWVudDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6NjUtNzkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHNldHRsZV9tYnJfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBtaW5fYmFsYW5jZSwgYXBwIG1pbiBiYWxhbmNlIGJlZm9yZSBib3hlcwogICAgLy8gIyAgIHdlcmUgd3JpdHRlbgogICAgLy8gIyBwdXJwb3NlOiByZXF1aXJlIHBheW1lbnQgcHJlY2VkaW5nIGNhbGwgZnJvbQogICAgLy8gIyAgIHNlbmRlciBjb3ZlcmluZyBtaW4gYmFsYW5jZSBpbmNyZWFzZSBzaW5jZQogICAgLy8gIyAgIG1pbl9iYWxhbmNlLCByZWZ1bmQgZXhjZXNzIHRvIHNlbmRlcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBwYXltZW50IG9ubHkgcmVxdWlyZWQgd2hlbiBtaW4gYmFsYW5jZQogICAgLy8gIyAgIGluY3JlYXNlZCwgcmVmdW5kZWQgaW4gZnVsbCBvdGhlcndpc2UKICAgIC8vICMgLSByZWZ1bmQgY29zdHMgMSBmZWUsIHBvb2xlZCBieSBzZW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0dGxlX21icl9wYXltZW50KG1pbl9iYWxhbmNlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIGJ5dGUgIiIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODAKICAgIC8vIG1icl9pbmNyZWFzZSA9IGdldF9taW5fYmFsYW5jZSgpIC0gbWluX2JhbGFuY2UKICAgIGNhbGxzdWIgZ2V0X21pbl9iYWxhbmNlCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGR1cAogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MQogICAgLy8gaWYgbWJyX2luY3JlYXNlID4gMDoKICAgIGJ6IHNldHRsZV9tYnJfcGF5bWVudF9lbHNlX2JvZHlAMgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MgogICAgLy8gcGF5bWVudF9hbW91bnQgPSByZXF1aXJlX3BheW1lbnQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc3JjL3NyYy91dGlscy5weTo4MwogICAgLy8gYXNzZXJ0IHBheW1lbnRfYW1vdW50ID49IG1icl9pbmNyZWFzZSwgInBheW1lbnQgYW1vdW50IGFjY3VyYXRlIgogICAgZnJhbWVfZGlnIDEKICAgID49CiAgICBhc3NlcnQgLy8gcGF5bWVudCBhbW91bnQgYWNjdXJhdGUKICAgIGIgc2V0dGxlX21icl9wYXltZW50X2FmdGVyX2lmX2Vsc2VAMwoKc2V0dGxlX21icl9wYXltZW50X2Vsc2VfYm9keUAyOgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4NQogICAgLy8gcGF5bWVudF9hbW91bnQgPSBnZXRfcGF5bWVudF9hbW91bnQoKQogICAgY2FsbHN1YiBnZXRfcGF5bWVudF9hbW91bnQKICAgIGZyYW1lX2J1cnkgMAoKc2V0dGxlX21icl9wYXltZW50X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6ODYKICAgIC8vIGlmIHBheW1lbnRfYW1vdW50ID4gbWJyX2luY3JlYXNlOgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICA+CiAgICBieiBzZXR0bGVfbWJyX3BheW1lbnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg3LTg5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4OAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc3JjL3NyYy91dGlscy5weTo4NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc3JjL3NyYy91dGlscy5weTo4OAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5Ojg3LTg5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnRfYW1vdW50IC0gbWJyX2luY3JlYXNlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCnNldHRsZV9tYnJfcGF5bWVudF9hZnRlcl9pZl9lbHNlQDY6CiAgICByZXRzdWIKCgovLyBzcmMudXRpbHMuZ2V0X3BheW1lbnRfYW1vdW50KCkgLT4gdWludDY0OgpnZXRfcGF5bWVudF9hbW91bnQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjkyLTk5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBnZXRfcGF5bWVudF9hbW91bnQgKGludGVybmFsKQogICAgLy8gIyBwdXJwb3NlOiBhbW91bnQgb2Ygb3B0aW9uYWwgcGF5bWVudCBwcmVjZWRpbmcKICAgIC8vICMgICBjYWxsIGZyb20gc2VuZGVyIHRvIGFwcAogICAgLy8gIyByZXR1cm5zOiBwYXltZW50IGFtb3VudCwgMCB3aXRob3V0IHBheW1lbnQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X3BheW1lbnRfYW1vdW50KCkgLT4gVUludDY0OgogICAgcHJvdG8gMCAxCiAgICBieXRlICIiCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwMAogICAgLy8gaWYgVHhuLmdyb3VwX2luZGV4ID09IDA6CiAgICB0eG4gR3JvdXBJbmRleAogICAgYm56IGdldF9wYXltZW50X2Ftb3VudF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTAxCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnQgMAogICAgc3dhcAogICAgcmV0c3ViCgpnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDIKICAgIC8vIHBheW1lbnQgPSBndHhuLlRyYW5zYWN0aW9uKFR4bi5ncm91cF9pbmRleCAtIDEpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNAogICAgLy8gcGF5bWVudC50eXBlID09IFRyYW5zYWN0aW9uVHlwZS5QYXltZW50CiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA0LTEwNgogICAgLy8gcGF5bWVudC50eXBlID09IFRyYW5zYWN0aW9uVHlwZS5QYXltZW50CiAgICAvLyBhbmQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgLy8gYW5kIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgYnogZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDUKICAgIC8vIGFuZCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICBmcmFtZV9kaWcgMAogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDQtMTA2CiAgICAvLyBwYXltZW50LnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQKICAgIC8vIGFuZCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICAvLyBhbmQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBieiBnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEwNgogICAgLy8gYW5kIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIDAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTA0LTEwNgogICAgLy8gcGF5bWVudC50eXBlID09IFRyYW5zYWN0aW9uVHlwZS5QYXltZW50CiAgICAvLyBhbmQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgLy8gYW5kIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgYnogZ2V0X3BheW1lbnRfYW1vdW50X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDgKICAgIC8vIHJldHVybiBwYXltZW50LmFtb3VudAogICAgZnJhbWVfZGlnIDAKICAgIGd0eG5zIEFtb3VudAogICAgc3dhcAogICAgcmV0c3ViCgpnZXRfcGF5bWVudF9hbW91bnRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxMDkKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludCAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkuZ2V0X2NoaWxkcmVuKG93bmVyOiBieXRlcywgb2Zmc2V0OiBieXRlcywgbGltaXQ6IGJ5dGVzKSAtPiB1aW50NjQsIGJ5dGVzOgpnZXRfY2hpbGRyZW46CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NTctMTc2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2NoaWxkcmVuKAogICAgLy8gICAgIHNlbGYsIG93bmVyOiBhcmM0LkFkZHJlc3MsIG9mZnNldDogYXJjNC5VSW50NjQsIGxpbWl0OiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiB0dXBsZVtVSW50NjQsIGFyYzQuRHluYW1pY0FycmF5W0NoaWxkSW5mb11dOgogICAgcHJvdG8gMyAyCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NzAKICAgIC8vIGIiYyIgKyBvd25lci5ieXRlcywgb2Zmc2V0Lm5hdGl2ZSwgbGltaXQubmF0aXZlLCBVSW50NjQoNDgpLCBVSW50NjQoMjEpCiAgICBieXRlIDB4NjMKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgaW50IDQ4CiAgICBpbnQgMjEKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTc2OS0xNzcxCiAgICAvLyBjb3VudCwgY2hpbGRyZW4gPSBnZXRfcGFnZWQoCiAgICAvLyAgICAgYiJjIiArIG93bmVyLmJ5dGVzLCBvZmZzZXQubmF0aXZlLCBsaW1pdC5uYXRpdmUsIFVJbnQ2NCg0OCksIFVJbnQ2NCgyMSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3BhZ2VkCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3NzMKICAgIC8vIGFyYzQuVUludDE2KGNoaWxkcmVuLmxlbmd0aCAvLyA0OCkuYnl0ZXMgKyBjaGlsZHJlbgogICAgZHVwCiAgICBsZW4KICAgIGludCA0OAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzcyLTE3NzQKICAgIC8vIHJldHVybiBjb3VudCwgYXJjNC5EeW5hbWljQXJyYXlbQ2hpbGRJbmZvXS5mcm9tX2J5dGVzKAogICAgLy8gICAgIGFyYzQuVUludDE2KGNoaWxkcmVuLmxlbmd0aCAvLyA0OCkuYnl0ZXMgKyBjaGlsZHJlbgogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc3JjLnV0aWxzLmdldF9wYWdlZChrZXk6IGJ5dGVzLCBvZmZzZXQ6IHVpbnQ2NCwgbGltaXQ6IHVpbnQ2NCwgaXRlbV9zaXplOiB1aW50NjQsIHBhZ2Vfc2l6ZTogdWludDY0KSAtPiB1aW50NjQsIGJ5dGVzOgpnZXRfcGFnZWQ6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjEzOS0xNTYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGdldF9wYWdlZCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBrZXksIGxpc3Qga2V5LCBzZWUgYXBwZW5kX3BhZ2VkCiAgICAvLyAjIC0gb2Zmc2V0LCBpbmRleCBvZiBmaXJzdCBpdGVtCiAgICAvLyAjIC0gbGltaXQsIG1heCBpdGVtcywgYXQgbW9zdCBwYWdlX3NpemUKICAgIC8vICMgLSBpdGVtX3NpemUsIGl0ZW0gc2l6ZQogICAgLy8gIyAtIHBhZ2Vfc2l6ZSwgaXRlbXMgcGVyIHBhZ2UKICAgIC8vICMgcHVycG9zZTogcmVhZCBpdGVtcyBmcm9tIGxpc3Qga2VwdCBpbiBwYWdlcwogICAgLy8gIyByZXR1cm5zOgogICAgLy8gIyAtIGl0ZW0gY291bnQKICAgIC8vICMgLSBpdGVtcyBmcm9tIG9mZnNldCwgYXQgbW9zdCBsaW1pdCwgc3BhbnMKICAgIC8vICMgICBhdCBtb3N0IDIgcGFnZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X3BhZ2VkKAogICAgLy8gICAgIGtleTogQnl0ZXMsIG9mZnNldDogVUludDY0LCBsaW1pdDogVUludDY0LCBpdGVtX3NpemU6IFVJbnQ2NCwgcGFnZV9zaXplOiBVSW50NjQKICAgIC8vICkgLT4gdHVwbGVbVUludDY0LCBCeXRlc106CiAgICBwcm90byA1IDIKICAgIGludCAwCiAgICBieXRlICIiCiAgICBkdXBuIDYKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTU3CiAgICAvLyBjb3VudF9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBmcmFtZV9kaWcgLTUKICAgIGJveF9nZXQKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTU4CiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTU5CiAgICAvLyByZXR1cm4gVUludDY0KDApLCBCeXRlcygpCiAgICBpbnQgMAogICAgYnl0ZSAweAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYwCiAgICAvLyBjb3VudCA9IG9wLmJ0b2koY291bnRfYnl0ZXMpCiAgICBmcmFtZV9kaWcgOAogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYxCiAgICAvLyBpZiBvZmZzZXQgPj0gY291bnQ6CiAgICBmcmFtZV9kaWcgLTQKICAgIDw9CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2MgogICAgLy8gcmV0dXJuIGNvdW50LCBCeXRlcygpCiAgICBmcmFtZV9kaWcgMQogICAgYnl0ZSAweAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3BhZ2VkX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTYzLTE2NAogICAgLy8gIyBjbGFtcCBiZWZvcmUgYWRkaW5nIHRvIG9mZnNldCwgd2hpY2ggbWF5IG92ZXJmbG93CiAgICAvLyBpZiBsaW1pdCA+IHBhZ2Vfc2l6ZToKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBieiBnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA2CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgLTMKCmdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE2NgogICAgLy8gaWYgbGltaXQgPiBjb3VudCAtIG9mZnNldDoKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgLTQKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgLTMKICAgIDwKICAgIGJ6IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDgKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IC0zCgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNjgKICAgIC8vIGl0ZW1zID0gQnl0ZXMoKQogICAgYnl0ZSAweAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3MAogICAgLy8gZW5kID0gb2Zmc2V0ICsgbGltaXQKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfYnVyeSAzCgpnZXRfcGFnZWRfd2hpbGVfdG9wQDk6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3MQogICAgLy8gd2hpbGUgaW5kZXggPCBlbmQ6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGdldF9wYWdlZF9hZnRlcl93aGlsZUAxMwogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzIKICAgIC8vIHNsb3QgPSBpbmRleCAlIHBhZ2Vfc2l6ZQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICAlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzMKICAgIC8vIHNpemUgPSBwYWdlX3NpemUgLSBzbG90CiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE3NAogICAgLy8gaWYgc2l6ZSA+IGVuZCAtIGluZGV4OgogICAgZnJhbWVfZGlnIDIKICAgIHVuY292ZXIgMgogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgID4KICAgIGJ6IGdldF9wYWdlZF9hZnRlcl9pZl9lbHNlQDEyCiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfYnVyeSA1CgpnZXRfcGFnZWRfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTc3CiAgICAvLyBrZXkgKyBvcC5pdG9iKGluZGV4IC8vIHBhZ2Vfc2l6ZSksIHNsb3QgKiBpdGVtX3NpemUsIHNpemUgKiBpdGVtX3NpemUKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgLwogICAgaXRvYgogICAgZnJhbWVfZGlnIC01CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgLy8gc3JjL3NyYy91dGlscy5weToxNzYtMTc4CiAgICAvLyBpdGVtcyArPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBrZXkgKyBvcC5pdG9iKGluZGV4IC8vIHBhZ2Vfc2l6ZSksIHNsb3QgKiBpdGVtX3NpemUsIHNpemUgKiBpdGVtX3NpemUKICAgIC8vICkKICAgIGJveF9leHRyYWN0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNyYy9zcmMvdXRpbHMucHk6MTc5CiAgICAvLyBpbmRleCArPSBzaXplCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgZ2V0X3BhZ2VkX3doaWxlX3RvcEA5CgpnZXRfcGFnZWRfYWZ0ZXJfd2hpbGVAMTM6CiAgICAvLyBzcmMvc3JjL3V0aWxzLnB5OjE4MAogICAgLy8gcmV0dXJuIGNvdW50LCBpdGVtcwogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLnNldF92ZXJzaW9uKGNvbnRyYWN0X3ZlcnNpb246IGJ5dGVzLCBkZXBsb3ltZW50X3ZlcnNpb246IGJ5dGVzKSAtPiB2b2lkOgpzZXRfdmVyc2lvbjoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTMwLTUzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X3ZlcnNpb24oCiAgICAvLyAgICAgc2VsZiwgY29udHJhY3RfdmVyc2lvbjogYXJjNC5VSW50NjQsIGRlcGxveW1lbnRfdmVyc2lvbjogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudXBncmFkZXIsICJtdXN0IGJlIHVwZ3JhZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gQWNjb3VudCgpCiAgICBieXRlICJ1cGdyYWRlciIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnVwZ3JhZGVyLCAibXVzdCBiZSB1cGdyYWRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51cGdyYWRlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSB1cGdyYWRlcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzUKICAgIC8vIGFyYzQuZW1pdChWZXJzaW9uVXBkYXRlZChjb250cmFjdF92ZXJzaW9uLCBkZXBsb3ltZW50X3ZlcnNpb24pKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJWZXJzaW9uVXBkYXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gc2VsZi5jb250cmFjdF92ZXJzaW9uID0gY29udHJhY3RfdmVyc2lvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzgKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJjb250cmFjdF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzYKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IGNvbnRyYWN0X3ZlcnNpb24ubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzcKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5kZXBsb3ltZW50X3ZlcnNpb24gPSBVSW50NjQoKQogICAgYnl0ZSAiZGVwbG95bWVudF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1MzcKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gZGVwbG95bWVudF92ZXJzaW9uLm5hdGl2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNyYy5jb250cmFjdC5VcGdyYWRlYWJsZS5hcHByb3ZlX3VwZGF0ZShhcHByb3ZhbDogYnl0ZXMpIC0+IHZvaWQ6CmFwcHJvdmVfdXBkYXRlOgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDgtNTQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBhcHByb3ZlX3VwZGF0ZShzZWxmLCBhcHByb3ZhbDogYXJjNC5Cb29sKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lciwgIm11c3QgYmUgb3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgb3duZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTUxCiAgICAvLyBhcmM0LmVtaXQoVXBkYXRlQXBwcm92ZWQoYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLCBhcHByb3ZhbCkpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5vd25lciA9IEFjY291bnQoKQogICAgYnl0ZSAib3duZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gYXJjNC5lbWl0KFVwZGF0ZUFwcHJvdmVkKGFyYzQuQWRkcmVzcyhzZWxmLm93bmVyKSwgYXBwcm92YWwpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIG1ldGhvZCAiVXBkYXRlQXBwcm92ZWQoYWRkcmVzcyxib29sKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1MgogICAgLy8gc2VsZi51cGRhdGFibGUgPSBhcHByb3ZhbC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGdldGJpdAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTIKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYXBwcm92YWwubmF0aXZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLmdyYW50X3VwZ3JhZGVyKHVwZ3JhZGVyOiBieXRlcykgLT4gdm9pZDoKZ3JhbnRfdXBncmFkZXI6CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1NC01NTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGdyYW50X3VwZ3JhZGVyKHNlbGYsIHVwZ3JhZGVyOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTU2CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAibXVzdCBiZSBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgY3JlYXRvcgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTcKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NTcKICAgIC8vIGFyYzQuZW1pdChVcGdyYWRlckdyYW50ZWQoYXJjNC5BZGRyZXNzKHNlbGYudXBncmFkZXIpLCB1cGdyYWRlcikpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgbWV0aG9kICJVcGdyYWRlckdyYW50ZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gc2VsZi51cGdyYWRlciA9IEFjY291bnQoKQogICAgYnl0ZSAidXBncmFkZXIiCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjU1OAogICAgLy8gc2VsZi51cGdyYWRlciA9IHVwZ3JhZGVyLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlVwZ3JhZGVhYmxlLm9uX3VwZGF0ZSgpIC0+IHZvaWQ6Cm9uX3VwZGF0ZToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTM5LTU0MAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBvbl91cGRhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDEtNTQ0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgV0FSTklORzogVGhpcyBhcHAgY2FuIGJlIHVwZGF0ZWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo1NDEtNTQ0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgV0FSTklORzogVGhpcyBhcHAgY2FuIGJlIHVwZGF0ZWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi51cGdyYWRlciwgIm11c3QgYmUgdXBncmFkZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXBncmFkZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgdXBncmFkZXIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ1CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgaW50IDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDgwCiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGJ5dGUgInVwZGF0YWJsZSIKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NTQ1CiAgICAvLyBhc3NlcnQgc2VsZi51cGRhdGFibGUgPT0gVUludDY0KDEpLCAibm90IGFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVwZGF0YWJsZSBleGlzdHMKICAgIGludCAxCiAgICA9PQogICAgYXNzZXJ0IC8vIG5vdCBhcHByb3ZlZAogICAgcmV0c3ViCgoKLy8gc3JjLmNvbnRyYWN0LlN0YWtpbmdGYWN0b3J5Ll9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjIwMTEKICAgIC8vIGRlZiBfX2luaXRfXyhzZWxmKSAtPiBOb25lOiAgIyBwcmFnbWE6IG5vIGNvdmVyCiAgICBwcm90byAwIDAKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAxNQogICAgLy8gc3VwZXIoKS5fX2luaXRfXygpCiAgICBjYWxsc3ViIEJhc2VGYWN0b3J5Ll9faW5pdF9fCiAgICByZXRzdWIKCgovLyBzcmMuY29udHJhY3QuQmFzZUZhY3RvcnkuX19pbml0X18oKSAtPiB2b2lkOgpCYXNlRmFjdG9yeS5fX2luaXRfXzoKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MTcwMQogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6ICAjIHByYWdtYTogbm8gY292ZXIKICAgIHByb3RvIDAgMAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0NzgKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJjb250cmFjdF92ZXJzaW9uIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzA1LTE3MDYKICAgIC8vICMgdXBncmFkZWFibGUgc3RhdGUKICAgIC8vIHNlbGYuY29udHJhY3RfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLmRlcGxveW1lbnRfdmVyc2lvbiA9IFVJbnQ2NCgpCiAgICBieXRlICJkZXBsb3ltZW50X3ZlcnNpb24iCiAgICAvLyBzcmMvc3JjL2NvbnRyYWN0LnB5OjE3MDcKICAgIC8vIHNlbGYuZGVwbG95bWVudF92ZXJzaW9uID0gVUludDY0KCkKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYudXBkYXRhYmxlID0gYm9vbCgxKQogICAgYnl0ZSAidXBkYXRhYmxlIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzA4CiAgICAvLyBzZWxmLnVwZGF0YWJsZSA9IGJvb2woMSkKICAgIGludCAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weTo0ODEKICAgIC8vIHNlbGYudXBncmFkZXIgPSBBY2NvdW50KCkKICAgIGJ5dGUgInVwZ3JhZGVyIgogICAgLy8gc3JjL3NyYy9jb250cmFjdC5weToxNzA5CiAgICAvLyBzZWxmLnVwZ3JhZGVyID0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCg==",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzcmMuY29udHJhY3QuU3Rha2luZ0ZhY3RvcnkuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNyYy9zcmMvY29udHJhY3QucHk6MjAxMAogICAgLy8gY2xhc3MgU3Rha2luZ0ZhY3RvcnkoQmFzZUZhY3RvcnkpOgogICAgaW50IDEKICAgIHJldHVybgo="
   },
   "state": {
     "global": {
-      "num_byte_slices": 2,
-      "num_uints": 3
+      "num_byte_slices": 3,
+      "num_uints": 4
     },
     "local": {
       "num_byte_slices": 0,
@@ -82,10 +98,18 @@ export const APP_SPEC: AppSpec = {
           "type": "uint64",
           "key": "deployment_version"
         },
+        "messenger_id": {
+          "type": "uint64",
+          "key": "messenger_id"
+        },
         "owner": {
           "type": "bytes",
           "key": "owner"
         },
+        "params": {
+          "type": "bytes",
+          "key": "params"
+        },
         "updatable": {
           "type": "uint64",
           "key": "updatable"
@@ -131,6 +155,51 @@ export const APP_SPEC: AppSpec = {
         },
         "desc": "Create early stake reward.\nArguments: - owner, who is the beneficiary - funder, who funded the contract - delegate, who is the delegate - period, lockup period\nReturns: - app id"
       },
+      {
+        "name": "create_many",
+        "args": [
+          {
+            "type": "(address,address,address,uint64,uint64)[]",
+            "name": "args"
+          }
+        ],
+        "readonly": false,
+        "returns": {
+          "type": "uint64[]"
+        },
+        "desc": "Create early stake rewards from a single payment.\nArguments: - args, owner, funder, delegate, period and initial of each contract\nReturns: - app ids"
+      },
+      {
+        "name": "enable_registry",
+        "args": [],
+        "readonly": false,
+        "returns": {
+          "type": "void"
+        },
+        "desc": "Record children created from now on in box registry by owner.\nCreators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled."
+      },
+      {
+        "name": "get_children",
+        "args": [
+          {
+            "type": "address",
+            "name": "owner"
+          },
+          {
+            "type": "uint64",
+            "name": "offset"
+          },
+          {
+            "type": "uint64",
+            "name": "limit"
+          }
+        ],
+        "readonly": true,
+        "returns": {
+          "type": "(uint64,(uint64,address,uint64)[])"
+        },
+        "desc": "Get page of children of owner in creation order."
+      },
       {
         "name": "set_version",
         "args": [
@@ -277,6 +346,28 @@ export type StakingFactory = {
       argsTuple: [owner: string, funder: string, delegate: string, period: bigint | number]
       returns: bigint
     }>
+    & Record<'create_many((address,address,address,uint64,uint64)[])uint64[]' | 'create_many', {
+      argsObj: {
+        args: [string, string, string, bigint | number, bigint | number][]
+      }
+      argsTuple: [args: [string, string, string, bigint | number, bigint | number][]]
+      returns: bigint[]
+    }>
+    & Record<'enable_registry()void' | 'enable_registry', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: void
+    }>
+    & Record<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])' | 'get_children', {
+      argsObj: {
+        owner: string
+        offset: bigint | number
+        limit: bigint | number
+      }
+      argsTuple: [owner: string, offset: bigint | number, limit: bigint | number]
+      returns: [bigint, [bigint, string, bigint][]]
+    }>
     & Record<'set_version(uint64,uint64)void' | 'set_version', {
       argsObj: {
         contractVersion: bigint | number
@@ -313,7 +404,9 @@ export type StakingFactory = {
     global: {
       contractVersion?: IntegerState
       deploymentVersion?: IntegerState
+      messengerId?: IntegerState
       owner?: BinaryState
+      params?: BinaryState
       updatable?: IntegerState
       upgrader?: BinaryState
     }
@@ -441,6 +534,57 @@ Returns: - app id
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the create_many((address,address,address,uint64,uint64)[])uint64[] ABI method
+   *
+   * Create early stake rewards from a single payment.
+Arguments: - args, owner, funder, delegate, period and initial of each contract
+Returns: - app ids
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static createMany(args: MethodArgs<'create_many((address,address,address,uint64,uint64)[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'create_many((address,address,address,uint64,uint64)[])uint64[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.args],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the enable_registry()void ABI method
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'enable_registry()void' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])' as const,
+      methodArgs: Array.isArray(args) ? args : [args.owner, args.offset, args.limit],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the set_version(uint64,uint64)void ABI method
    *
@@ -632,6 +776,48 @@ Returns: - app id
     return this.call(StakingFactoryCallFactory.create(args, params))
   }
 
+  /**
+   * Calls the create_many((address,address,address,uint64,uint64)[])uint64[] ABI method.
+   *
+   * Create early stake rewards from a single payment.
+Arguments: - args, owner, funder, delegate, period and initial of each contract
+Returns: - app ids
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public createMany(args: MethodArgs<'create_many((address,address,address,uint64,uint64)[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(StakingFactoryCallFactory.createMany(args, params))
+  }
+
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public enableRegistry(args: MethodArgs<'enable_registry()void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(StakingFactoryCallFactory.enableRegistry(args, params))
+  }
+
+  /**
+   * Calls the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method.
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(StakingFactoryCallFactory.getChildren(args, params))
+  }
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -734,9 +920,15 @@ Returns: - app id
       get deploymentVersion() {
         return StakingFactoryClient.getIntegerState(state, 'deployment_version')
       },
+      get messengerId() {
+        return StakingFactoryClient.getIntegerState(state, 'messenger_id')
+      },
       get owner() {
         return StakingFactoryClient.getBinaryState(state, 'owner')
       },
+      get params() {
+        return StakingFactoryClient.getBinaryState(state, 'params')
+      },
       get updatable() {
         return StakingFactoryClient.getIntegerState(state, 'updatable')
       },
@@ -757,6 +949,21 @@ Returns: - app id
         resultMappers.push(undefined)
         return this
       },
+      createMany(args: MethodArgs<'create_many((address,address,address,uint64,uint64)[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.createMany(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.enableRegistry(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getChildren(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       setVersion(args: MethodArgs<'set_version(uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setVersion(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -833,6 +1040,42 @@ Returns: - app id
    */
   create(args: MethodArgs<'create(address,address,address,uint64)uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): StakingFactoryComposer<[...TReturns, MethodReturn<'create(address,address,address,uint64)uint64'>]>
 
+  /**
+   * Calls the create_many((address,address,address,uint64,uint64)[])uint64[] ABI method.
+   *
+   * Create early stake rewards from a single payment.
+Arguments: - args, owner, funder, delegate, period and initial of each contract
+Returns: - app ids
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createMany(args: MethodArgs<'create_many((address,address,address,uint64,uint64)[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): StakingFactoryComposer<[...TReturns, MethodReturn<'create_many((address,address,address,uint64,uint64)[])uint64[]'>]>
+
+  /**
+   * Calls the enable_registry()void ABI method.
+   *
+   * Record children created from now on in box registry by owner.
+Creators pay for the boxes, upgrader for the registry box with a payment preceding call. Can not be disabled.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enableRegistry(args: MethodArgs<'enable_registry()void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): StakingFactoryComposer<[...TReturns, MethodReturn<'enable_registry()void'>]>
+
+  /**
+   * Calls the get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[]) ABI method.
+   *
+   * Get page of children of owner in creation order.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getChildren(args: MethodArgs<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): StakingFactoryComposer<[...TReturns, MethodReturn<'get_children(address,uint64,uint64)(uint64,(uint64,address,uint64)[])'>]>
+
   /**
    * Calls the set_version(uint64,uint64)void ABI method.
    *
@@ -21,6 +21,7 @@ import {
   APP_SPEC as MessengerSpec,
 } from "./clients/MessengerClient.js";
 import algosdk, { waitForConfirmation } from "algosdk";
+import { getCreatePayment as getFactoryCreatePayment } from "./payment.js";
 import { CONTRACT, abi } from "ulujs";
 import moment from "moment";
 import * as dotenv from "dotenv";
@@ -103,6 +104,10 @@ export const getApplicationAvailableBalance = async (apid: number) => {
   return await getAvailableBalance(algosdk.getApplicationAddress(apid));
 };
 
+// min payment of factory create, see payment.ts
+export const getCreatePayment = (factoryId: number, owner: string) =>
+  getFactoryCreatePayment(algodClient, factoryId, owner);
+
 type DeployType =
   | "airdrop-factory"
   | "staking-factory"
@@ -317,9 +322,11 @@ export const deployCompensation: any = async (
     }
   );
   const stakeAmount = Number(options.amount) * 1e6;
-  const paymentAmount =
-    stakeAmount + 1234500 + 1e5 + (options.extraPayment || 0);
   const owner = options.owner || addr2;
+  const paymentAmount =
+    stakeAmount +
+    (await getCreatePayment(ctcInfo, owner)) +
+    Number(options.extraPayment || 0);
   ci.setFee(10000);
   ci.setPaymentAmount(paymentAmount);
   const createR = await ci.create(owner);
@@ -369,8 +376,10 @@ export const deployAirdrop: any = async (options: DeployAirdropOptions) => {
     }
   );
   const initial = Number(options.initial) * 1e6;
-  const paymentAmount = 1234500 + 1e5 + Number(options.extraPayment || 0);
   const owner = options.owner || addr2;
+  const paymentAmount =
+    (await getCreatePayment(ctcInfo, owner)) +
+    Number(options.extraPayment || 0);
   const funder = options.funder || addr;
   const deadline = options.deadline
     ? Number(options.deadline)
@@ -487,9 +496,11 @@ export const deployStaking: any = async (options: DeployStakingOptions) => {
     }
   );
   const stakingAmount = Number(options.amount) * 1e6;
-  const paymentAmount =
-    stakingAmount + 1234500 + 1e5 + Number(options.extraPayment || 0);
   const owner = options.owner || addr2;
+  const paymentAmount =
+    stakingAmount +
+    (await getCreatePayment(ctcInfo, owner)) +
+    Number(options.extraPayment || 0);
   const funder = options.funder || addr;
   const delegate = options.delegate || addr3;
   const period = Number(options.period || 0);
@@ -642,6 +653,56 @@ export const airdropSetVersion = async (options: AirdropSetVersionOptions) => {
   return false;
 };
 
+// global state of apid by key, values as returned by algod
+const getGlobalStateEntries = async (apid: number) => {
+  const app = await algodClient.getApplicationByID(apid).do();
+  return Object.fromEntries(
+    (app.params["global-state"] || []).map((entry: any) => [
+      Buffer.from(entry.key, "base64").toString(),
+      entry.value,
+    ])
+  );
+};
+
+// template params keys of apps upgraded in place from a version without
+// params, in params order, see docs/contract-global-state.md
+const legacyParamsKeys = [
+  "period_limit",
+  "vesting_delay",
+  "lockup_delay",
+  "period_seconds",
+  "distribution_count",
+  "distribution_seconds",
+];
+
+// params of apid and its messenger id, read in the order of
+// Lockable.get_params: params key, legacy keys, then the parent factory
+// when shared, which also holds the messenger id
+const getParams = async (apid: number) => {
+  const state = await getGlobalStateEntries(apid);
+  const messengerId = state.messenger_id?.uint || 0;
+  if (state.params) {
+    return {
+      params: new Uint8Array(Buffer.from(state.params.bytes, "base64")),
+      messengerId,
+    };
+  }
+  if (state.period_limit) {
+    const params = new Uint8Array(48);
+    legacyParamsKeys.forEach((key, index) =>
+      params.set(algosdk.encodeUint64(state[key]?.uint || 0), index * 8)
+    );
+    return { params, messengerId };
+  }
+  const parent = await getGlobalStateEntries(state.parent_id?.uint || 0);
+  return {
+    params: parent.params
+      ? new Uint8Array(Buffer.from(parent.params.bytes, "base64"))
+      : new Uint8Array(48),
+    messengerId: parent.messenger_id?.uint || 0,
+  };
+};
+
 interface AirdropGetStateOptions {
   apid: number;
   name?: string;
@@ -655,6 +716,11 @@ export const airdropGetState: any = async (options: AirdropGetStateOptions) => {
   if (options.lazy) {
     return { globalState };
   }
+  // params packs period limit, vesting delay, lockup delay, period seconds,
+  // distribution count and distribution seconds as uint64 big endian
+  const { params, messengerId } = await getParams(Number(options.apid));
+  const param = (index: number) =>
+    Number(algosdk.decodeUint64(params.slice(index * 8, index * 8 + 8), "bigint"));
   const state = {
     contractVersion: globalState.contractVersion?.asNumber(),
     deadline: globalState.deadline?.asNumber(),
@@ -665,29 +731,29 @@ export const airdropGetState: any = async (options: AirdropGetStateOptions) => {
       globalState.deployer?.asByteArray() || new Uint8Array()
     ),
     deploymentVersion: globalState.deploymentVersion?.asNumber(),
-    distributionCount: globalState.distributionCount?.asNumber(),
-    distributionSeconds: globalState.distributionSeconds?.asNumber(),
+    distributionCount: param(4),
+    distributionSeconds: param(5),
     funder: algosdk.encodeAddress(
       globalState.funder?.asByteArray() || new Uint8Array()
     ),
     funding: globalState.funding?.asNumber(),
     initial: globalState.initial?.asBigInt().toString(),
-    lockupDelay: globalState.lockupDelay?.asNumber(),
-    messengerId: globalState.messengerId?.asNumber(),
+    lockupDelay: param(2),
+    messengerId,
     owner: algosdk.encodeAddress(
       globalState.owner?.asByteArray() || new Uint8Array()
     ),
     parentId: globalState.parentId?.asNumber(),
     period: globalState.period?.asNumber(),
-    periodLimit: globalState.periodLimit?.asNumber(),
-    periodSeconds: globalState.periodSeconds?.asNumber(),
+    periodLimit: param(0),
+    periodSeconds: param(3),
     stakeable: globalState.stakeable?.asNumber(),
     total: globalState.total?.asBigInt().toString(),
     updatable: globalState.updatable?.asNumber(),
     upgrader: algosdk.encodeAddress(
       globalState.upgrader?.asByteArray() || new Uint8Array()
     ),
-    vestingDelay: globalState.vestingDelay?.asNumber(),
+    vestingDelay: param(1),
   };
   return state;
 };
@@ -15,6 +15,7 @@ import {
   APP_SPEC as MessengerSpec,
 } from "./clients/MessengerClient.js";
 import algosdk from "algosdk";
+import { getCreatePayment } from "./payment.js";
 import { CONTRACT } from "ulujs";
 import moment from "moment";
 import * as dotenv from "dotenv";
@@ -358,10 +359,11 @@ do {
   // create staking
   do {
     break;
-    const paymentAmount = 1e6 + 834500 + 100000; // MBR increase for new contract
+    const owner = addr2;
+    const paymentAmount =
+      1e6 + (await getCreatePayment(algodClient, ctcInfo, owner)); // initial and min payment
     ci.setPaymentAmount(paymentAmount);
     ci.setFee(8000);
-    const owner = addr2;
     const funder = addr;
     const delegate = addr3;
     const period = 9;
@@ -476,7 +478,11 @@ do {
         for (const airdrop of results) {
           const { owner, funder, deadline, initial } = airdrop;
           console.log(owner, funder, deadline, initial);
-          const paymentAmount = 777500 + 100000; // MBR increase for new contract
+          const paymentAmount = await getCreatePayment(
+            algodClient,
+            ctcInfo,
+            owner
+          ); // min payment
           ci.setPaymentAmount(paymentAmount);
           ci.setFee(5000);
           const initialBi = BigInt(initial);
@@ -493,11 +499,11 @@ do {
   // create airdrop
   do {
     break;
-    const paymentAmount = 777500 + 100000; // MBR increase for new contract
+    const owner = addr2;
+    const paymentAmount = await getCreatePayment(algodClient, ctcInfo, owner); // min payment
     ci.setPaymentAmount(paymentAmount);
     ci.setFee(5000);
     // begin params
-    const owner = addr2;
     const funder = addr;
     const now: number = moment().unix();
     const deadline = now + 3600 * 24; // 1 hour
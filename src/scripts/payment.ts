@@ -0,0 +1,72 @@
+import algosdk from "algosdk";
+import { APP_SPEC as AirdropSpec } from "./clients/AirdropClient.js";
+
+// payments of factory calls, read through the given algod client so
+// scripts in program can use them without the setup of command.ts
+
+const getBox = async (
+  algodClient: algosdk.Algodv2,
+  apid: number,
+  name: Uint8Array
+) => {
+  try {
+    return (await algodClient.getApplicationBoxByName(apid, name).do()).value;
+  } catch (e) {
+    return undefined;
+  }
+};
+
+// box min balance, 2500 per box and 400 per byte of name and value
+const getBoxMinBalance = (nameLength: number, size: number) =>
+  2500 + 400 * (nameLength + size);
+
+// min balance increase of recording a child of owner once the factory
+// registry is enabled, a 48 byte record appended to pages of 21 records
+// named c + owner + page, counted in box c + owner, see docs/factory.md
+const getRegistryPayment = async (
+  algodClient: algosdk.Algodv2,
+  factoryId: number,
+  owner: string
+) => {
+  const registry = new TextEncoder().encode("registry");
+  if (!(await getBox(algodClient, factoryId, registry))) {
+    return 0;
+  }
+  const key = new Uint8Array([
+    ...new TextEncoder().encode("c"),
+    ...algosdk.decodeAddress(owner).publicKey,
+  ]);
+  const countBox = await getBox(algodClient, factoryId, key);
+  const count = countBox ? Number(algosdk.decodeUint64(countBox, "safe")) : 0;
+  return (
+    400 * 48 +
+    (countBox ? 0 : getBoxMinBalance(key.length, 8)) +
+    (count % 21 === 0 ? getBoxMinBalance(key.length + 8, 0) : 0)
+  );
+};
+
+// min payment of factory create, the min balance increase of creating a
+// child plus the global min balance paid to it, the avm derives the
+// increase from the child extra pages (3) and global schema, one byte
+// slice less when the factory shares params, and registry boxes of
+// owner, see docs/factory.md
+export const getCreatePayment = async (
+  algodClient: algosdk.Algodv2,
+  factoryId: number,
+  owner: string
+) => {
+  const { num_uints, num_byte_slices } = AirdropSpec.state.global;
+  const app = await algodClient.getApplicationByID(factoryId).do();
+  const shared = (app.params["global-state"] || []).some(
+    (entry: any) => Buffer.from(entry.key, "base64").toString() === "params"
+  );
+  const mbrIncrease =
+    1e5 * (1 + 3) +
+    28500 * num_uints +
+    50000 * (num_byte_slices - (shared ? 1 : 0));
+  return (
+    mbrIncrease +
+    (await getRegistryPayment(algodClient, factoryId, owner)) +
+    1e5
+  );
+};
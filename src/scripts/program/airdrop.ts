@@ -4,6 +4,7 @@ import csv from "csv-parser";
 import algosdk from "algosdk";
 import { APP_SPEC as AirdropFactorySpec } from "../clients/AirdropFactoryClient.js";
 import { APP_SPEC as AirdropSpec } from "../clients/AirdropClient.js";
+import { getCreatePayment } from "../payment.js";
 import * as dotenv from "dotenv";
 import { CONTRACT, abi } from "ulujs";
 import moment from "moment";
@@ -191,8 +192,12 @@ program
               sk: new Uint8Array(0),
             }
           );
-          const paymentAmount = 1134500 + 100000; // min payment (1234500)
           const owner = Address;
+          const paymentAmount = await getCreatePayment(
+            algodClient,
+            ctcInfo,
+            owner
+          );
           const funder = options.funder || addr; // funder is provided or defaults to deployer
           const deadline = options.deadline
             ? Number(options.deadline) // use provided timestamp
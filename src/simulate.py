@@ -1,9 +1,13 @@
-from typing import Callable
-import matplotlib.pyplot as plt
+from typing import Callable, NamedTuple
+import argparse
 import csv
+import functools
 import math
+from fractions import Fraction
+import numpy as np
 from datetime import datetime, timedelta
-from simulate_mab import calculate_mab_pure
+from src.simulate_mab import calculate_mab_pure, calculate_mab_schedule
+from src.simulate_mab_batch import calculate_mab_batch
 
 
 def get_apr(period, period_limit):
@@ -20,6 +24,43 @@ def calculate_accumulated(principal, apr, time):
         return int(principal * (1 + apr / 100) ** time)
 
 
+def to_fraction(value):
+    # floats as written, ex) 0.075 is 3/40 not its binary approximation
+    return Fraction(str(value)) if isinstance(value, float) else Fraction(value)
+
+
+def calculate_accumulated_exact(principal, apr, time):
+    if apr == None:
+        return 0
+    else:
+        return math.floor(to_fraction(principal) * (1 + Fraction(apr, 100)) ** time)
+
+
+@functools.lru_cache(maxsize=None)
+def get_bonus_table(total, period_limit: int, scale=1, exact: bool = False):
+    """
+    Total plus lockup bonus for each period up to period_limit, scaled.
+    Cached on (total, period_limit, scale, exact) so each bonus is computed
+    once per sweep instead of once per sample. exact compounds with
+    rationals and floors once, otherwise float compounding is used as in
+    calculate_accumulated.
+    """
+    if exact:
+        return tuple(
+            math.floor(
+                calculate_accumulated_exact(
+                    total, get_apr(period, period_limit), period
+                )
+                * to_fraction(scale)
+            )
+            for period in range(period_limit + 1)
+        )
+    return tuple(
+        int(calculate_accumulated(total, get_apr(period, period_limit), period) * scale)
+        for period in range(period_limit + 1)
+    )
+
+
 def convert_point_to_tokens(points):
     return points * 3.75 // 100
 
@@ -35,7 +76,9 @@ def calculate_mab(
     distribution_seconds: int,
     period_limit: int,
     scale: int = 1,
+    exact: bool = False,
 ):
+    bonus_table = get_bonus_table(total, period_limit, scale, exact)
     return [
         calculate_mab_pure(
             now,
@@ -44,10 +87,7 @@ def calculate_mab(
             lockup_delay,
             period,
             funding,
-            int(
-                calculate_accumulated(total, get_apr(period, period_limit), period)
-                * scale
-            ),
+            bonus_table[period],
             distribution_count(period),
             distribution_seconds,
         )
@@ -55,6 +95,147 @@ def calculate_mab(
     ]
 
 
+def calculate_mab_grid(
+    now_values,
+    vesting_delay: Callable[[int], int],
+    period_seconds: int,
+    lockup_delay: int,
+    funding: int,
+    total: int,
+    distribution_count: Callable[[int], int],
+    distribution_seconds: int,
+    period_limit: int,
+    scale: int = 1,
+    exact: bool = False,
+):
+    """
+    Batched calculate_mab. Returns a (period_limit + 1, len(now_values))
+    array with one contiguous column per period, column[period][i] is
+    calculate_mab(now_values[i], ...)[period].
+    """
+    periods = range(period_limit + 1)
+    mab, panic = calculate_mab_batch(
+        np.asarray(now_values, dtype=np.uint64)[None, :],
+        np.array([vesting_delay(period) for period in periods])[:, None],
+        int(period_seconds),
+        lockup_delay,
+        np.array(periods)[:, None],
+        funding,
+        np.array(get_bonus_table(total, period_limit, scale, exact))[:, None],
+        np.array([distribution_count(period) for period in periods])[:, None],
+        int(distribution_seconds),
+    )
+    assert not panic.any(), "mab calculation would panic"
+    return mab
+
+
+def calculate_mab_schedules(
+    vesting_delay: Callable[[int], int],
+    period_seconds: int,
+    lockup_delay: int,
+    funding: int,
+    total: int,
+    distribution_count: Callable[[int], int],
+    distribution_seconds: int,
+    period_limit: int,
+    scale: int = 1,
+    exact: bool = False,
+):
+    """
+    Exact MAB breakpoints for each period, see calculate_mab_schedule.
+    """
+    bonus_table = get_bonus_table(total, period_limit, scale, exact)
+    return [
+        calculate_mab_schedule(
+            vesting_delay(period),
+            period_seconds,
+            lockup_delay,
+            period,
+            funding,
+            bonus_table[period],
+            distribution_count(period),
+            distribution_seconds,
+        )
+        for period in range(period_limit + 1)
+    ]
+
+
+def iter_mab_columns(
+    x_values: range,
+    vesting_delay: Callable[[int], int],
+    period_seconds: int,
+    lockup_delay: int,
+    funding: int,
+    total: int,
+    distribution_count: Callable[[int], int],
+    distribution_seconds: int,
+    period_limit: int,
+    scale: int = 1,
+    exact: bool = False,
+    chunk_size: int = 65536,
+):
+    """
+    Yield (x, columns) chunks of calculate_mab_grid over x_values, at most
+    chunk_size samples at a time so memory stays flat for long horizons.
+    """
+    for start in range(0, len(x_values), chunk_size):
+        x = np.array(x_values[start : start + chunk_size], dtype=np.uint64)
+        yield x, calculate_mab_grid(
+            x,
+            vesting_delay,
+            period_seconds,
+            lockup_delay,
+            funding,
+            total,
+            distribution_count,
+            distribution_seconds,
+            period_limit,
+            scale,
+            exact,
+        )
+
+
+def write_mab_csv(csv_file_path: str, chunks, period_limit: int):
+    """
+    Stream (x, columns) chunks to csv with columns X, Y0, ..., Y{period_limit}.
+    """
+    with open(csv_file_path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["X"] + [f"Y{period}" for period in range(period_limit + 1)])
+        for x, columns in chunks:
+            writer.writerows(zip(x.tolist(), *columns.tolist()))
+
+
+def plot_mab_schedules(plt, schedules, horizon: int):
+    """
+    Plot MAB schedules as step functions from funding until horizon.
+    """
+    for period, schedule in enumerate(schedules):
+        x_values = [timestamp for timestamp, _ in schedule if timestamp < horizon]
+        y_values = [mab for _, mab in schedule[: len(x_values)]]
+        plt.step(
+            [timestamp_utc + timedelta(seconds=s) for s in x_values + [horizon]],
+            y_values + y_values[-1:],
+            where="post",
+            label=f"period {period}",
+        )
+
+
+def load_pyplot(show: bool):
+    """
+    Import pyplot on demand, with the non-interactive Agg backend unless
+    the plot is shown, so batch runs need neither a display nor matplotlib
+    at import time.
+    """
+    import matplotlib
+
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 ###################################################
 
 points = 6000000  # 6M
@@ -74,60 +255,39 @@ seconds_in_month = days_in_month * 24 * 60 * 60
 funding = 0
 
 
+class Program(NamedTuple):
+    vesting_delay: Callable[[int], int]
+    period_seconds: int
+    lockup_delay: int
+    distribution_count: Callable[[int], int]
+    distribution_seconds: int
+    period_limit: int
+    x_value_range: int  # months
+    scale: float = 1
+
+
 ###################################################
 # Incentivized Testnet Airdrop
 ###################################################
 
 
-def plot_mab_airdrop():
-    def vesting_delay(period):
-        return 0
+def airdrop_vesting_delay(period):
+    return 0
 
-    def distribution_count(period):
-        return 12
 
-    period_limit = 5
-    # Calcualte delays
-    for i in range(0, period_limit + 1):
-        print(
-            f"vesting_delay({i}): {vesting_delay(i)}  lockup_delay: {i}  total_delay: {vesting_delay(i) + i}"
-        )
-    # Calculate Airdop + Bonus
-    for i in range(0, period_limit + 1):
-        print(
-            f"Airdrop + Bonus {i}: {calculate_accumulated(tokens, get_apr(i, period_limit), i)}"
-        )
-    lockup_delay = 12
-    distribution_seconds = seconds_in_month
-    x_value_range = 90
+def airdrop_distribution_count(period):
+    return 12
 
-    # Generate x values and initialize an empty list for y values
-    x_values = list(
-        range(0, int(seconds_in_month * x_value_range), int(seconds_in_month // 10))
-    )
-    y_values = []
 
-    # Generate y values in a loop
-    for x in x_values:
-        y = calculate_mab(
-            x,
-            vesting_delay,
-            seconds_in_month,
-            lockup_delay,
-            funding,
-            tokens,
-            distribution_count,
-            distribution_seconds,
-            period_limit,
-        )
-        y_values.append(y)
-
-    # TODO - Add CSV output
-
-    plt.plot(
-        [timestamp_utc + timedelta(seconds=s) for s in x_values],
-        y_values,
-    )
+airdrop = Program(
+    vesting_delay=airdrop_vesting_delay,
+    period_seconds=seconds_in_month,
+    lockup_delay=12,
+    distribution_count=airdrop_distribution_count,
+    distribution_seconds=seconds_in_month,
+    period_limit=5,
+    x_value_range=90,
+)
 
 
 ###################################################
@@ -135,60 +295,28 @@ def plot_mab_airdrop():
 ###################################################
 
 
-def plot_mab_staking():
-    def vesting_delay(period):
-        return 0
-
-    def distribution_count(period):
-        count = int(2 * (period + 1) // 3)
-        if count == 0:
-            return 1
-        else:
-            return count
+def staking_vesting_delay(period):
+    return 0
 
-    period_limit = 18
-    for i in range(1, period_limit + 1):
-        print(
-            f"vesting_delay({i}): {vesting_delay(i)}  lockup_delay: {i}  total_delay: {vesting_delay(i) + i}   distribution_count: {distribution_count(i)}"
-        )
-    # Calculate Airdop + Bonus
-    for i in range(0, period_limit + 1):
-        print(
-            f"Airdrop + Bonus {i}: {calculate_accumulated(tokens, get_apr(i, period_limit), i)}"
-        )
-    lockup_delay = 1
-    period_seconds = seconds_in_month
-    distribution_seconds = seconds_in_month
-    x_value_range = 32
-
-    # Generate x values and initialize an empty list for y values
-    x_values = list(
-        range(0, int(seconds_in_month * x_value_range), int(seconds_in_month // 10))
-    )
-    y_values = []
 
-    # Generate y values in a loop
-    for x in x_values:
-        y = calculate_mab(
-            x,
-            vesting_delay,
-            period_seconds,
-            lockup_delay,
-            funding,
-            tokens,
-            distribution_count,
-            distribution_seconds,
-            period_limit,
-            scale=0.075,
-        )
-        y_values.append(y)
+def staking_distribution_count(period):
+    count = int(2 * (period + 1) // 3)
+    if count == 0:
+        return 1
+    else:
+        return count
 
-    # TODO - Add CSV output
 
-    plt.plot(
-        [timestamp_utc + timedelta(seconds=s) for s in x_values],
-        y_values,
-    )
+staking = Program(
+    vesting_delay=staking_vesting_delay,
+    period_seconds=seconds_in_month,
+    lockup_delay=1,
+    distribution_count=staking_distribution_count,
+    distribution_seconds=seconds_in_month,
+    period_limit=18,
+    x_value_range=32,
+    scale=0.075,
+)
 
 
 ###################################################
@@ -196,160 +324,147 @@ def plot_mab_staking():
 ###################################################
 
 
-def plot_mab_compensation():
+def compensation_vesting_delay(period):
+    return 0
+
+
+def compensation_distribution_count(period):
+    return 12
+
+
+compensation = Program(
+    vesting_delay=compensation_vesting_delay,
+    period_seconds=seconds_in_month,
+    lockup_delay=0,
+    distribution_count=compensation_distribution_count,
+    distribution_seconds=seconds_in_month,
+    period_limit=0,
+    x_value_range=12,
+)
 
-    def vesting_delay(period):
-        return 0
 
-    def distribution_count(period):
-        return 12
+programs = {
+    "airdrop": airdrop,
+    "staking": staking,
+    "compensation": compensation,
+}
 
-    period_limit = 0
-    for i in range(0, period_limit + 1):
+
+###################################################
+
+
+def get_program_args(program: Program, total, funding: int):
+    """
+    Arguments shared by calculate_mab, calculate_mab_grid,
+    calculate_mab_schedules and iter_mab_columns for a program.
+    """
+    return (
+        program.vesting_delay,
+        program.period_seconds,
+        program.lockup_delay,
+        funding,
+        total,
+        program.distribution_count,
+        program.distribution_seconds,
+        program.period_limit,
+        program.scale,
+    )
+
+
+def simulate(
+    program: Program,
+    total=tokens,
+    funding: int = funding,
+    exact: bool = False,
+    x_value_range: int | None = None,
+    step: int = int(seconds_in_month // 10),
+    csv_file_path: str | None = None,
+    png_file_path: str | None = None,
+    show: bool = False,
+):
+    """
+    Print delays and bonuses of a program, then write sampled MAB columns
+    to csv_file_path and plot exact MAB schedules to png_file_path or
+    screen if requested.
+    """
+    args = get_program_args(program, total, funding)
+    horizon = funding + int(seconds_in_month * (x_value_range or program.x_value_range))
+    # Calcualte delays
+    for i in range(0, program.period_limit + 1):
         print(
-            f"vesting_delay({i}): {vesting_delay(i)}  lockup_delay: {i}  total_delay: {vesting_delay(i) + i}"
+            f"vesting_delay({i}): {program.vesting_delay(i)}  lockup_delay: {i}  total_delay: {program.vesting_delay(i) + i}   distribution_count: {program.distribution_count(i)}"
         )
     # Calculate Airdop + Bonus
-    for i in range(0, period_limit + 1):
-        print(
-            f"Airdrop + Bonus {i}: {calculate_accumulated(tokens, get_apr(i, period_limit), i)}"
+    bonus_table = get_bonus_table(total, program.period_limit, exact=exact)
+    for i in range(0, program.period_limit + 1):
+        print(f"Airdrop + Bonus {i}: {bonus_table[i]}")
+
+    if csv_file_path:
+        write_mab_csv(
+            csv_file_path,
+            iter_mab_columns(range(funding, horizon, step), *args, exact=exact),
+            program.period_limit,
         )
-    lockup_delay = 0
-    distribution_seconds = seconds_in_month
-    x_value_range = 12
 
-    # Generate x values and initialize an empty list for y values
-    x_values = list(
-        range(0, int(seconds_in_month * x_value_range), int(seconds_in_month // 10))
+    if png_file_path or show:
+        plt = load_pyplot(show)
+        plot_mab_schedules(plt, calculate_mab_schedules(*args, exact=exact), horizon)
+        plt.ylabel("MB")
+        plt.xlabel("t")
+        plt.title("MB over time by lockup period")
+        plt.legend()
+        if png_file_path:
+            plt.savefig(png_file_path)
+        if show:
+            plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Simulate minimum allowable balance over time by lockup period."
     )
-    y_values = []
-
-    # Generate y values in a loop
-    for x in x_values:
-        y = calculate_mab(
-            x,
-            vesting_delay,
-            seconds_in_month,
-            lockup_delay,
-            funding,
-            tokens,
-            distribution_count,
-            distribution_seconds,
-            period_limit,
+    subparsers = parser.add_subparsers(dest="program", required=True)
+    for name in programs:
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument(
+            "--output",
+            nargs="+",
+            choices=["csv", "png", "none"],
+            default=["csv", "png"],
+            help="outputs to write (default: csv png)",
         )
-        y_values.append(y)
-
-    # TODO - Add CSV output
-
-    plt.plot(
-        [timestamp_utc + timedelta(seconds=s) for s in x_values],
-        y_values,
+        subparser.add_argument("--csv-file", default="simulate.csv")
+        subparser.add_argument("--png-file", default="simulate.png")
+        subparser.add_argument(
+            "--show", action="store_true", help="show plot interactively"
+        )
+        subparser.add_argument("--points", type=int, default=points)
+        subparser.add_argument("--funding", type=int, default=funding)
+        subparser.add_argument(
+            "--months", type=int, help="months to simulate (default: per program)"
+        )
+        subparser.add_argument(
+            "--step",
+            type=int,
+            default=int(seconds_in_month // 10),
+            help="seconds between csv samples",
+        )
+        subparser.add_argument(
+            "--exact", action="store_true", help="exact rational bonus compounding"
+        )
+    args = parser.parse_args(argv)
+    simulate(
+        programs[args.program],
+        total=convert_point_to_tokens(args.points),
+        funding=args.funding,
+        exact=args.exact,
+        x_value_range=args.months,
+        step=args.step,
+        csv_file_path=args.csv_file if "csv" in args.output else None,
+        png_file_path=args.png_file if "png" in args.output else None,
+        show=args.show,
     )
 
 
-###################################################
-
-
-# # Generate x values and initialize an empty list for y values
-# x_values = list(
-#     range(0, int(seconds_in_month * x_value_range), int(seconds_in_month // 10))
-# )
-# y_values = []
-
-# # Generate y values in a loop
-# for x in x_values:
-#     y = calculate_mab(
-#         x,
-#         vesting_delay,
-#         seconds_in_month,
-#         lockup_delay,
-#         funding,
-#         tokens,
-#         distribution_count,
-#         distribution_seconds,
-#         period_limit,
-#     )
-#     y_values.append(y)
-
-
-# # CSV
-
-# y0 = [inner_array[0] for inner_array in y_values] if period_limit > 0 else []
-# y1 = [inner_array[1] for inner_array in y_values] if period_limit > 1 else []
-# y2 = [inner_array[2] for inner_array in y_values] if period_limit > 2 else []
-# y3 = [inner_array[3] for inner_array in y_values] if period_limit > 3 else []
-# y4 = [inner_array[4] for inner_array in y_values] if period_limit > 4 else []
-# y5 = [inner_array[5] for inner_array in y_values] if period_limit > 5 else []
-# y6 = [inner_array[6] for inner_array in y_values] if period_limit > 6 else []
-# y7 = [inner_array[7] for inner_array in y_values] if period_limit > 7 else []
-# y8 = [inner_array[8] for inner_array in y_values] if period_limit > 8 else []
-# y9 = [inner_array[9] for inner_array in y_values] if period_limit > 9 else []
-# y10 = [inner_array[10] for inner_array in y_values] if period_limit > 10 else []
-# y11 = [inner_array[11] for inner_array in y_values] if period_limit > 11 else []
-# y12 = [inner_array[12] for inner_array in y_values] if period_limit > 12 else []
-# y13 = [inner_array[13] for inner_array in y_values] if period_limit > 13 else []
-# y14 = [inner_array[14] for inner_array in y_values] if period_limit > 14 else []
-# y15 = [inner_array[15] for inner_array in y_values] if period_limit > 15 else []
-# y16 = [inner_array[16] for inner_array in y_values] if period_limit > 16 else []
-# y17 = [inner_array[17] for inner_array in y_values] if period_limit > 17 else []
-
-# data = zip(
-#     x_values,
-#     y0,
-#     y1,
-#     y2,
-#     y3,
-#     y4,
-#     y5,
-#     y6,
-#     y7,
-#     y8,
-#     y9,
-#     y10,
-#     y11,
-#     y12,
-#     y13,
-#     y14,
-#     y15,
-#     y16,
-#     y17,
-# )
-# csv_file_path = "simulate.csv"
-# with open(csv_file_path, "w", newline="") as csv_file:
-#     writer = csv.writer(csv_file)
-#     writer.writerow(
-#         [
-#             "X",
-#             "Y0",
-#             "Y1",
-#             "Y2",
-#             "Y3",
-#             "Y4",
-#             "Y5",
-#             "Y6",
-#             "Y7",
-#             "Y8",
-#             "Y9",
-#             "Y10",
-#             "Y11",
-#             "Y12",
-#             "Y13",
-#             "Y14",
-#             "Y15",
-#             "Y16",
-#             "Y17",
-#         ]
-#     )
-#     writer.writerows(data)
-
-# TOD - generate plot from args
-
-plot_mab_airdrop()
-#plot_mab_staking()
-#plot_mab_compensation()
-
-plt.ylabel("MB")
-plt.xlabel("t")
-plt.title("MB over time by lockup period")
-plt.legend()
-plt.show()
+if __name__ == "__main__":
+    main()
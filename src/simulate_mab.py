@@ -1,3 +1,61 @@
+##############################################
+# function: calculate_fully_vested (internal)
+# arguments:
+# - vesting_delay, how many periods in vesting
+# - period_seconds, how many seconds in period
+# - lockup delay, how many period in lockup
+# - period, how many periods
+# - funding, when funded
+# purpose: calculate when fully vested, fixed
+#   once funding is set since period can no
+#   longer be configured
+# returns' fully vested timestamp
+##############################################
+def calculate_fully_vested(
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+):
+    lockup_periods = lockup_delay * period
+    lockup_seconds = lockup_periods * period_seconds
+    vesting_seconds = vesting_delay * period_seconds
+    return funding + vesting_seconds + lockup_seconds
+
+
+##############################################
+# function: calculate_mab_vested (internal)
+# arguments:
+# - now, timestamp
+# - fully_vested, when fully vested
+# - total, how much funded
+# - distribution_count, how many periods in distribution
+# - distribution_seconds, how many seconds in distribution
+# purpose: calculate minimum allowable balance
+#   from a precomputed fully vested timestamp
+# returns' minimum allowable balance
+##############################################
+def calculate_mab_vested(
+    now,
+    fully_vested,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    locked_up = now <= fully_vested
+    if locked_up:
+        return total
+    else:  
+        elapsed_periods = (now - fully_vested) // distribution_seconds
+        if elapsed_periods <= distribution_count:
+            return (
+                total * (distribution_count - elapsed_periods)
+            ) // distribution_count
+        else:
+            return 0
+
+
 ##############################################
 # function: calculate_mab_pure (internal)
 # arguments:
@@ -24,18 +82,162 @@ def calculate_mab_pure(
     distribution_count,
     distribution_seconds,
 ):
+    fully_vested = calculate_fully_vested(
+        vesting_delay, period_seconds, lockup_delay, period, funding
+    )
+    return calculate_mab_vested(
+        now, fully_vested, total, distribution_count, distribution_seconds
+    )
+
+
+##############################################
+# function: calculate_next_unlock (internal)
+# arguments: same as calculate_mab_vested
+# purpose: calculate first timestamp after now
+#   at which minimum allowable balance
+#   decreases, skips installments that leave
+#   it unchanged due to floor division
+# returns' timestamp, 0 if it no longer
+#   decreases
+##############################################
+def calculate_next_unlock(
+    now,
+    fully_vested,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    mab = calculate_mab_vested(
+        now, fully_vested, total, distribution_count, distribution_seconds
+    )
+    if mab == 0:
+        return 0
+    else:
+        remaining_periods = (mab * distribution_count + total - 1) // total
+        elapsed_periods = distribution_count + 1 - remaining_periods
+        return fully_vested + elapsed_periods * distribution_seconds
+
+
+##############################################
+# function: calculate_mab_schedule
+# arguments: same as calculate_mab_pure
+#   without now
+# purpose: calculate exact breakpoints of
+#   calculate_mab_pure, O(distribution_count)
+# returns: list of (timestamp, mab) sorted by
+#   timestamp, where mab applies from timestamp
+#   until the next breakpoint, the first
+#   breakpoint is at funding and mab before it
+#   is total
+##############################################
+def calculate_mab_schedule(
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    if distribution_count <= 0 or distribution_seconds <= 0:
+        raise ValueError("distribution count and seconds must be positive")
     lockup_periods = lockup_delay * period
     lockup_seconds = lockup_periods * period_seconds
     vesting_seconds = vesting_delay * period_seconds
     fully_vested = funding + vesting_seconds + lockup_seconds
-    locked_up = now <= fully_vested
-    if locked_up:
-        return total
-    else:  
-        elapsed_periods = (now - fully_vested) // distribution_seconds
-        if elapsed_periods <= distribution_count:
-            return (
-                total * (distribution_count - elapsed_periods)
-            ) // distribution_count
-        else:
-            return 0
+    schedule = [(funding, total)]
+    # mab is total until fully_vested + distribution_seconds
+    for elapsed_periods in range(1, distribution_count + 1):
+        mab = (total * (distribution_count - elapsed_periods)) // distribution_count
+        if mab != schedule[-1][1]:
+            schedule.append(
+                (fully_vested + elapsed_periods * distribution_seconds, mab)
+            )
+    return schedule
+
+
+##############################################
+# function: calculate_unlock_time
+# arguments:
+# - amount, how much to withdraw
+# - balance, contract account balance
+# - min_balance, account min balance
+# - rest, same as calculate_mab_pure without
+#   now
+# purpose: earliest timestamp at which
+#   withdraw(amount) succeeds, ie)
+#   balance - min_balance - amount >= mab,
+#   O(1)
+# returns: timestamp, 0 if satisfied at any
+#   time, None if never satisfied
+##############################################
+def calculate_unlock_time(
+    amount,
+    balance,
+    min_balance,
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    if distribution_count <= 0 or distribution_seconds <= 0:
+        raise ValueError("distribution count and seconds must be positive")
+    target = balance - min_balance - amount
+    if target < 0:
+        return None
+    if target >= total:
+        return 0
+    lockup_periods = lockup_delay * period
+    lockup_seconds = lockup_periods * period_seconds
+    vesting_seconds = vesting_delay * period_seconds
+    fully_vested = funding + vesting_seconds + lockup_seconds
+    # smallest elapsed_periods with
+    #   total * (distribution_count - elapsed_periods) // distribution_count <= target
+    elapsed_periods = max(
+        1, distribution_count - ((target + 1) * distribution_count - 1) // total
+    )
+    return fully_vested + elapsed_periods * distribution_seconds
+
+
+##############################################
+# function: calculate_max_withdrawable
+# arguments:
+# - now, timestamp
+# - balance, contract account balance
+# - min_balance, account min balance
+# - rest, same as calculate_mab_pure without
+#   now
+# purpose: largest amount withdraw accepts at
+#   now, O(1)
+# returns: max withdrawable amount
+##############################################
+def calculate_max_withdrawable(
+    now,
+    balance,
+    min_balance,
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    mab = calculate_mab_pure(
+        now,
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        period,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    )
+    return max(0, balance - min_balance - mab)
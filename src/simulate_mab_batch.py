@@ -0,0 +1,284 @@
+import numpy as np
+
+UINT64_MAX = np.iinfo(np.uint64).max
+
+
+##############################################
+# function: mul_overflows (internal)
+# arguments:
+# - a, uint64 array
+# - b, uint64 array
+# purpose: detect uint64 multiplication overflow
+# returns: mask where a * b > UINT64_MAX
+##############################################
+def mul_overflows(a, b):
+    safe_b = np.where(b == 0, np.uint64(1), b)
+    return (b != 0) & (a > UINT64_MAX // safe_b)
+
+
+##############################################
+# function: add_overflows (internal)
+# arguments:
+# - a, uint64 array
+# - b, uint64 array
+# purpose: detect uint64 addition overflow
+# returns: mask where a + b > UINT64_MAX
+##############################################
+def add_overflows(a, b):
+    return a > UINT64_MAX - b
+
+
+##############################################
+# function: calculate_fully_vested_batch
+# arguments:
+# - vesting_delay, period_seconds,
+#   lockup_delay, period, funding, uint64
+#   arrays
+# purpose: calculate when lockup ends and
+#   distribution starts
+# returns:
+# - fully_vested, uint64 array
+# - panic, bool array, true on uint64 overflow
+##############################################
+def calculate_fully_vested_batch(
+    vesting_delay, period_seconds, lockup_delay, period, funding
+):
+    # uint64 arithmetic wraps in numpy, overflow is tracked in panic
+    with np.errstate(over="ignore"):
+        lockup_periods = lockup_delay * period
+        panic = mul_overflows(lockup_delay, period)
+        lockup_seconds = lockup_periods * period_seconds
+        panic |= mul_overflows(lockup_periods, period_seconds)
+        vesting_seconds = vesting_delay * period_seconds
+        panic |= mul_overflows(vesting_delay, period_seconds)
+        vested = funding + vesting_seconds
+        panic |= add_overflows(funding, vesting_seconds)
+        fully_vested = vested + lockup_seconds
+        panic |= add_overflows(vested, lockup_seconds)
+    return fully_vested, panic
+
+
+##############################################
+# function: calculate_mab_batch
+# arguments: same as calculate_mab_pure, each
+#   argument may be a scalar or an array, all
+#   arguments are broadcast against each other
+# purpose: calculate minimum allowable balance
+#   for many (now, params) tuples in one call
+#   with the same uint64 semantics as the
+#   contract
+# returns:
+# - mab, uint64 array of minimum allowable
+#   balances (0 where the avm would panic)
+# - panic, bool array, true where the avm
+#   would panic, either on uint64 overflow
+#   (ex. total * (distribution_count -
+#   elapsed_periods)) or on division by zero
+##############################################
+def calculate_mab_batch(
+    now,
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    (
+        now,
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        period,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    ) = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=np.uint64)
+            for value in (
+                now,
+                vesting_delay,
+                period_seconds,
+                lockup_delay,
+                period,
+                funding,
+                total,
+                distribution_count,
+                distribution_seconds,
+            )
+        )
+    )
+    zero = np.uint64(0)
+    one = np.uint64(1)
+    fully_vested, panic = calculate_fully_vested_batch(
+        vesting_delay, period_seconds, lockup_delay, period, funding
+    )
+    # uint64 arithmetic wraps in numpy, overflow is tracked in panic
+    with np.errstate(over="ignore"):
+        locked_up = now <= fully_vested
+        # now > fully_vested
+        distributing = ~locked_up
+        panic |= distributing & (distribution_seconds == 0)
+        elapsed_periods = np.where(distributing, now - fully_vested, zero) // np.where(
+            distribution_seconds == 0, one, distribution_seconds
+        )
+        # elapsed_periods <= distribution_count
+        installments = distributing & (elapsed_periods <= distribution_count)
+        panic |= installments & (distribution_count == 0)
+        remaining = np.where(installments, distribution_count - elapsed_periods, zero)
+        panic |= installments & mul_overflows(total, remaining)
+        remaining_total = (total * remaining) // np.where(
+            distribution_count == 0, one, distribution_count
+        )
+    mab = np.where(locked_up, total, np.where(installments, remaining_total, zero))
+    mab[panic] = zero
+    return mab, panic
+
+
+##############################################
+# function: calculate_unlock_time_batch
+# arguments: same as calculate_unlock_time,
+#   scalars or arrays broadcast against each
+#   other
+# purpose: earliest timestamp at which
+#   withdraw(amount) succeeds for many
+#   contracts, with uint64 semantics, ie)
+#   skips installments where the mab
+#   calculation would panic
+# returns:
+# - unlock_time, uint64 array, 0 if satisfied
+#   at any time
+# - possible, bool array, false where never
+#   satisfied
+##############################################
+def calculate_unlock_time_batch(
+    amount,
+    balance,
+    min_balance,
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    (
+        amount,
+        balance,
+        min_balance,
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        period,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    ) = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=np.uint64)
+            for value in (
+                amount,
+                balance,
+                min_balance,
+                vesting_delay,
+                period_seconds,
+                lockup_delay,
+                period,
+                funding,
+                total,
+                distribution_count,
+                distribution_seconds,
+            )
+        )
+    )
+    if (distribution_count == 0).any() or (distribution_seconds == 0).any():
+        raise ValueError("distribution count and seconds must be positive")
+    zero = np.uint64(0)
+    one = np.uint64(1)
+    # every mab calculation panics if fully_vested overflows
+    fully_vested, panic = calculate_fully_vested_batch(
+        vesting_delay, period_seconds, lockup_delay, period, funding
+    )
+    with np.errstate(over="ignore"):
+        available = np.where(balance >= min_balance, balance - min_balance, zero)
+        possible = ~panic & (balance >= min_balance) & (available >= amount)
+        target = np.where(possible, available - amount, zero)
+        anytime = possible & (target >= total)
+        # smallest elapsed_periods with
+        #   total * (distribution_count - elapsed_periods) // distribution_count <= target
+        # using python ints where (target + 1) * distribution_count overflows
+        safe_total = np.where(total == 0, one, total)
+        overflows = mul_overflows(target + one, distribution_count)
+        bound = np.array(((target + one) * distribution_count - one) // safe_total)
+        for i in map(tuple, np.argwhere(overflows)):
+            bound[i] = ((int(target[i]) + 1) * int(distribution_count[i]) - 1) // int(
+                safe_total[i]
+            )
+        elapsed_periods = np.maximum(
+            one, distribution_count - np.minimum(bound, distribution_count)
+        )
+        # total * (distribution_count - elapsed_periods) must fit in uint64
+        elapsed_periods = np.maximum(
+            elapsed_periods,
+            distribution_count
+            - np.minimum(UINT64_MAX // safe_total, distribution_count),
+        )
+        offset = elapsed_periods * distribution_seconds
+        unreachable = mul_overflows(elapsed_periods, distribution_seconds)
+        unreachable |= add_overflows(fully_vested, offset)
+        unlock_time = fully_vested + offset
+    possible &= anytime | ~unreachable
+    unlock_time = np.where(anytime | ~possible, zero, unlock_time)
+    return unlock_time, possible
+
+
+##############################################
+# function: calculate_max_withdrawable_batch
+# arguments: same as calculate_max_withdrawable,
+#   scalars or arrays broadcast against each
+#   other
+# purpose: largest amount withdraw accepts at
+#   now for many contracts
+# returns:
+# - amount, uint64 array (0 where the avm
+#   would panic)
+# - panic, bool array, see calculate_mab_batch
+##############################################
+def calculate_max_withdrawable_batch(
+    now,
+    balance,
+    min_balance,
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    mab, panic = calculate_mab_batch(
+        now,
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        period,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    )
+    balance = np.asarray(balance, dtype=np.uint64)
+    min_balance = np.asarray(min_balance, dtype=np.uint64)
+    zero = np.uint64(0)
+    available = np.where(balance >= min_balance, balance - min_balance, zero)
+    amount = np.where(available > mab, available - mab, zero)
+    amount[panic] = zero
+    return amount, panic
@@ -0,0 +1,205 @@
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.simulate import (
+    Program,
+    convert_point_to_tokens,
+    get_bonus_table,
+    points,
+    programs,
+    seconds_in_month,
+)
+from src.simulate_supply import calculate_locked_supply, sample_locked_supply
+
+
+def sample_owners(
+    rng,
+    owners: int,
+    program: Program,
+    period_weights,
+    withdraw_delay_mean: float,
+    total,
+    funding: int,
+):
+    """
+    Sample contract parameters for a population of owners.
+
+    Each owner configures period with probability period_weights[period],
+    owners who never call configure before the deadline keep period 0 and
+    count towards period_weights[0]. Each owner withdraws every installment
+    an exponentially distributed delay with mean withdraw_delay_mean
+    seconds after it unlocks, modelled by shifting funding by the delay.
+    Returns contract parameters in calculate_mab_pure argument order.
+    """
+    periods = range(program.period_limit + 1)
+    period = rng.choice(len(periods), size=owners, p=period_weights)
+    if withdraw_delay_mean > 0:
+        delay = rng.exponential(withdraw_delay_mean, owners).astype(np.uint64)
+    else:
+        delay = np.zeros(owners, dtype=np.uint64)
+    bonus_table = get_bonus_table(total, program.period_limit, program.scale)
+    return [
+        np.array([program.vesting_delay(p) for p in periods], dtype=np.uint64)[period],
+        int(program.period_seconds),
+        program.lockup_delay,
+        period.astype(np.uint64),
+        np.uint64(funding) + delay,
+        np.array(bonus_table, dtype=np.uint64)[period],
+        np.array([program.distribution_count(p) for p in periods], dtype=np.uint64)[
+            period
+        ],
+        int(program.distribution_seconds),
+    ]
+
+
+def simulate_batch(
+    seed,
+    owners: int,
+    x_values,
+    program: Program,
+    period_weights,
+    withdraw_delay_mean: float,
+    total,
+    funding: int,
+):
+    """
+    Circulating supply over x_values of one batch of sampled owners.
+    """
+    contracts = sample_owners(
+        np.random.default_rng(seed),
+        owners,
+        program,
+        period_weights,
+        withdraw_delay_mean,
+        total,
+        funding,
+    )
+    batch_total = contracts[5].sum(dtype=np.uint64)
+    timestamps, locked = calculate_locked_supply(*contracts)
+    return batch_total - sample_locked_supply(timestamps, locked, batch_total, x_values)
+
+
+def monte_carlo(
+    program: Program,
+    owners: int,
+    replicates: int,
+    x_values,
+    period_weights=None,
+    withdraw_delay_mean: float = 0,
+    total=convert_point_to_tokens(points),
+    funding: int = 0,
+    seed: int = 0,
+    batch_size: int = 100000,
+    workers: int | None = None,
+    percentiles=(5, 50, 95),
+):
+    """
+    Simulate replicates populations of owners in batches on a process pool.
+
+    Batches draw from independent streams spawned from seed, so results
+    do not depend on the number of workers. Returns (curves, bands), where
+    curves[r] is the circulating supply of replicate r over x_values and
+    bands maps each percentile to its curve across replicates.
+    """
+    if period_weights is None:
+        period_weights = np.full(
+            program.period_limit + 1, 1 / (program.period_limit + 1)
+        )
+    period_weights = np.asarray(period_weights, dtype=np.float64)
+    if len(period_weights) != program.period_limit + 1:
+        raise ValueError("one period weight per period from 0 to period limit")
+    period_weights = period_weights / period_weights.sum()
+    x_values = np.asarray(x_values, dtype=np.uint64)
+    batch_sizes = [
+        min(batch_size, owners - start) for start in range(0, owners, batch_size)
+    ]
+    replicate_seeds = np.random.SeedSequence(seed).spawn(replicates)
+    curves = np.zeros((replicates, len(x_values)), dtype=np.uint64)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        futures = [
+            (
+                replicate,
+                executor.submit(
+                    simulate_batch,
+                    batch_seed,
+                    size,
+                    x_values,
+                    program,
+                    period_weights,
+                    withdraw_delay_mean,
+                    total,
+                    funding,
+                ),
+            )
+            for replicate, replicate_seed in enumerate(replicate_seeds)
+            for size, batch_seed in zip(
+                batch_sizes, replicate_seed.spawn(len(batch_sizes))
+            )
+        ]
+        for replicate, future in futures:
+            curves[replicate] += future.result()
+    bands = {
+        percentile: np.percentile(curves, percentile, axis=0)
+        for percentile in percentiles
+    }
+    return curves, bands
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo circulating supply over owner period choices and withdraw timing."
+    )
+    parser.add_argument("program", choices=programs)
+    parser.add_argument("--owners", type=int, default=100000)
+    parser.add_argument("--replicates", type=int, default=20)
+    parser.add_argument(
+        "--period-weights",
+        type=float,
+        nargs="+",
+        help="relative share of owners per period (default: uniform)",
+    )
+    parser.add_argument(
+        "--withdraw-delay-days",
+        type=float,
+        default=0,
+        help="mean delay between unlock and withdraw",
+    )
+    parser.add_argument("--points", type=int, default=points)
+    parser.add_argument("--months", type=int, help="default: per program")
+    parser.add_argument("--step", type=int, default=int(seconds_in_month // 10))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=100000)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--csv-file", default="monte_carlo.csv")
+    args = parser.parse_args(argv)
+    program = programs[args.program]
+    x_values = np.arange(
+        0,
+        int(seconds_in_month * (args.months or program.x_value_range)),
+        args.step,
+        dtype=np.uint64,
+    )
+    _, bands = monte_carlo(
+        program,
+        args.owners,
+        args.replicates,
+        x_values,
+        period_weights=args.period_weights,
+        withdraw_delay_mean=args.withdraw_delay_days * 24 * 60 * 60,
+        total=convert_point_to_tokens(args.points),
+        seed=args.seed,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+    with open(args.csv_file, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["X"] + [f"P{percentile}" for percentile in bands])
+        writer.writerows(
+            zip(x_values.tolist(), *(band.tolist() for band in bands.values()))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import argparse
+import csv
+import numpy as np
+from src.simulate_mab_batch import (
+    add_overflows,
+    calculate_fully_vested_batch,
+    mul_overflows,
+)
+
+contract_columns = [
+    "vesting_delay",
+    "period_seconds",
+    "lockup_delay",
+    "period",
+    "funding",
+    "total",
+    "distribution_count",
+    "distribution_seconds",
+]
+
+
+##############################################
+# function: get_unlock_events
+# arguments: same as calculate_mab_pure
+#   without now, one array element per
+#   contract
+# purpose: unlock events of all contracts,
+#   O(E log E) for E = sum(distribution_count)
+# returns:
+# - timestamps, sorted unique uint64 array
+# - unlocked, uint64 array, amount the summed
+#   mab decreases by at each timestamp
+##############################################
+def get_unlock_events(
+    vesting_delay,
+    period_seconds,
+    lockup_delay,
+    period,
+    funding,
+    total,
+    distribution_count,
+    distribution_seconds,
+):
+    (
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        period,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    ) = (
+        value.ravel()
+        for value in np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=np.uint64)
+                for value in (
+                    vesting_delay,
+                    period_seconds,
+                    lockup_delay,
+                    period,
+                    funding,
+                    total,
+                    distribution_count,
+                    distribution_seconds,
+                )
+            )
+        )
+    )
+    if (distribution_count == 0).any() or (distribution_seconds == 0).any():
+        raise ValueError("distribution count and seconds must be positive")
+    fully_vested, panic = calculate_fully_vested_batch(
+        vesting_delay, period_seconds, lockup_delay, period, funding
+    )
+    panic |= mul_overflows(total, distribution_count)
+    panic |= mul_overflows(distribution_count, distribution_seconds)
+    panic |= add_overflows(fully_vested, distribution_count * distribution_seconds)
+    if panic.any():
+        raise OverflowError("mab calculation would panic")
+    # one event per installment, k = 1 .. distribution_count
+    contract = np.repeat(np.arange(len(total)), distribution_count.astype(np.int64))
+    offsets = np.cumsum(distribution_count) - distribution_count
+    k = np.arange(len(contract), dtype=np.uint64) - offsets[contract] + np.uint64(1)
+    count = distribution_count[contract]
+    seconds = distribution_seconds[contract]
+    contract_total = total[contract]
+    before = (contract_total * (count - k + np.uint64(1))) // count
+    after = (contract_total * (count - k)) // count
+    timestamps = fully_vested[contract] + k * seconds
+    unlocked = before - after
+    # floor division repeats values for small totals
+    timestamps = timestamps[unlocked > 0]
+    unlocked = unlocked[unlocked > 0]
+    order = np.argsort(timestamps, kind="stable")
+    timestamps = timestamps[order]
+    unlocked = unlocked[order]
+    # merge events at the same timestamp
+    timestamps, starts = np.unique(timestamps, return_index=True)
+    if len(starts) == 0:
+        return timestamps, unlocked
+    return timestamps, np.add.reduceat(unlocked, starts)
+
+
+##############################################
+# function: calculate_locked_supply
+# arguments: same as get_unlock_events
+# purpose: sum of calculate_mab_pure over all
+#   contracts as a step function
+# returns:
+# - timestamps, sorted uint64 array
+# - locked, uint64 array, summed mab from
+#   timestamps[i] until timestamps[i + 1],
+#   before timestamps[0] it is sum(total)
+##############################################
+def calculate_locked_supply(*contracts):
+    timestamps, unlocked = get_unlock_events(*contracts)
+    total = np.asarray(contracts[5], dtype=np.uint64).sum(dtype=np.uint64)
+    return timestamps, total - np.cumsum(unlocked, dtype=np.uint64)
+
+
+##############################################
+# function: sample_locked_supply
+# arguments:
+# - timestamps, locked, from
+#   calculate_locked_supply
+# - total, sum of totals
+# - now, sample timestamps
+# purpose: evaluate locked supply at now in
+#   O(len(now) log len(timestamps))
+# returns: uint64 array of locked supply
+##############################################
+def sample_locked_supply(timestamps, locked, total, now):
+    index = np.searchsorted(timestamps, np.asarray(now, dtype=np.uint64), side="right")
+    return np.concatenate(([np.uint64(total)], locked))[index]
+
+
+def load_contracts_csv(csv_file_path: str):
+    """
+    Read contract parameters, one contract per row, columns named after
+    the calculate_mab_pure arguments.
+    """
+    with open(csv_file_path, newline="") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    return [
+        np.array([int(row[column]) for row in rows], dtype=np.uint64)
+        for column in contract_columns
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Aggregate locked supply over all contracts."
+    )
+    parser.add_argument(
+        "contracts_file", help=f"csv with {', '.join(contract_columns)}"
+    )
+    parser.add_argument("--csv-file", default="supply.csv")
+    args = parser.parse_args(argv)
+    timestamps, locked = calculate_locked_supply(
+        *load_contracts_csv(args.contracts_file)
+    )
+    with open(args.csv_file, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["timestamp", "locked"])
+        writer.writerows(zip(timestamps.tolist(), locked.tolist()))
+
+
+if __name__ == "__main__":
+    main()
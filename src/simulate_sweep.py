@@ -0,0 +1,207 @@
+import argparse
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from src.simulate import get_bonus_table, seconds_in_month, tokens
+from src.simulate_mab_batch import calculate_mab_batch
+
+# factory template variables, see docs/factory.md
+template_variables = [
+    "PERIOD_LIMIT",
+    "VESTING_DELAY",
+    "LOCKUP_DELAY",
+    "PERIOD_SECONDS",
+    "DISTRIBUTION_COUNT",
+    "DISTRIBUTION_SECONDS",
+]
+
+# airdrop mainnet settings
+default_configuration = {
+    "PERIOD_LIMIT": 5,
+    "VESTING_DELAY": 1,
+    "LOCKUP_DELAY": 12,
+    "PERIOD_SECONDS": 2628288,
+    "DISTRIBUTION_COUNT": 12,
+    "DISTRIBUTION_SECONDS": 2628288,
+}
+
+
+def get_configurations(grid: dict):
+    """
+    Cartesian product of template variable values, variables missing from
+    grid take their default_configuration value.
+    """
+    values = [
+        grid.get(name, [default_configuration[name]]) for name in template_variables
+    ]
+    return [
+        dict(zip(template_variables, configuration))
+        for configuration in itertools.product(*values)
+    ]
+
+
+def calculate_unlock_curve(configuration: dict, x_values, total):
+    """
+    Locked fraction of total plus bonus over x_values for a configuration,
+    assuming owners spread evenly over periods 0 .. PERIOD_LIMIT.
+    """
+    period_limit = configuration["PERIOD_LIMIT"]
+    bonus_table = np.array(get_bonus_table(total, period_limit), dtype=np.uint64)
+    mab, panic = calculate_mab_batch(
+        x_values[None, :],
+        configuration["VESTING_DELAY"],
+        configuration["PERIOD_SECONDS"],
+        configuration["LOCKUP_DELAY"],
+        np.arange(period_limit + 1)[:, None],
+        0,  # funding
+        bonus_table[:, None],
+        configuration["DISTRIBUTION_COUNT"],
+        configuration["DISTRIBUTION_SECONDS"],
+    )
+    assert not panic.any(), "mab calculation would panic"
+    return mab.sum(axis=0, dtype=np.float64) / bonus_table.sum(dtype=np.float64)
+
+
+def summarize(configuration: dict, curve, x_values, total):
+    """
+    Summary metrics of a configuration and its unlock curve.
+    """
+    period_limit = configuration["PERIOD_LIMIT"]
+    bonus_table = get_bonus_table(total, period_limit)
+    # owner choosing period limit unlocks last
+    delay = (
+        configuration["VESTING_DELAY"] + configuration["LOCKUP_DELAY"] * period_limit
+    )
+    distribution = (
+        configuration["DISTRIBUTION_COUNT"] * configuration["DISTRIBUTION_SECONDS"]
+    )
+    fully_unlocked = delay * configuration["PERIOD_SECONDS"] + distribution
+    half_unlocked = np.flatnonzero(curve <= 0.5)
+    return {
+        **configuration,
+        "fully_unlocked_months": fully_unlocked / seconds_in_month,
+        "half_unlocked_months": (
+            float(x_values[half_unlocked[0]]) / seconds_in_month
+            if len(half_unlocked) > 0
+            else None
+        ),
+        "mean_locked": float(curve.mean()),
+        "max_bonus": bonus_table[-1] / bonus_table[0] - 1,
+    }
+
+
+##############################################
+# process pool workers
+##############################################
+
+worker_state = {}
+
+
+def init_worker(shm_name: str, shape, x_values, total):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    worker_state["shm"] = shm  # keep mapping alive
+    worker_state["curves"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    worker_state["x_values"] = x_values
+    worker_state["total"] = total
+
+
+def run_chunk(start: int, configurations):
+    curves = worker_state["curves"]
+    x_values = worker_state["x_values"]
+    total = worker_state["total"]
+    summaries = []
+    for index, configuration in enumerate(configurations, start):
+        curves[index] = calculate_unlock_curve(configuration, x_values, total)
+        summaries.append(summarize(configuration, curves[index], x_values, total))
+    return summaries
+
+
+##############################################
+
+
+def sweep(
+    grid: dict,
+    total=tokens,
+    horizon: int = int(seconds_in_month * 120),
+    step: int = int(seconds_in_month // 10),
+    workers: int | None = None,
+    chunk_size: int | None = None,
+):
+    """
+    Simulate every configuration in grid on a process pool.
+
+    Returns (x_values, curves, summaries), where curves[i] is the unlock
+    curve of configuration i over x_values and summaries[i] its metrics.
+    Workers write curves straight into one shared array.
+    """
+    if total <= 0:
+        # curves and bonuses are relative to total
+        raise ValueError("total must be positive")
+    configurations = get_configurations(grid)
+    x_values = np.arange(0, horizon, step, dtype=np.uint64)
+    shape = (len(configurations), len(x_values))
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, len(configurations) // (workers * 4))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(shm.name, shape, x_values, total),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    run_chunk, start, configurations[start : start + chunk_size]
+                )
+                for start in range(0, len(configurations), chunk_size)
+            ]
+            summaries = [summary for future in futures for summary in future.result()]
+        curves = np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return x_values, curves, summaries
+
+
+def write_summaries_csv(csv_file_path: str, summaries):
+    with open(csv_file_path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(summaries[0]))
+        writer.writeheader()
+        writer.writerows(summaries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Sweep factory template variables and summarize unlock curves."
+    )
+    for name in template_variables:
+        parser.add_argument(
+            f"--{name.lower().replace('_', '-')}",
+            dest=name,
+            type=int,
+            nargs="+",
+            default=[default_configuration[name]],
+        )
+    parser.add_argument("--months", type=int, default=120)
+    parser.add_argument("--step", type=int, default=int(seconds_in_month // 10))
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--csv-file", default="sweep.csv")
+    parser.add_argument("--curves-file", help="save unlock curves as .npy")
+    args = parser.parse_args(argv)
+    x_values, curves, summaries = sweep(
+        {name: getattr(args, name) for name in template_variables},
+        horizon=int(seconds_in_month * args.months),
+        step=args.step,
+        workers=args.workers,
+    )
+    write_summaries_csv(args.csv_file, summaries)
+    if args.curves_file:
+        np.save(args.curves_file, curves)
+    print(f"{len(summaries)} configurations, {len(x_values)} samples each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import msgpack
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+
+class MockAlgod:
+    """
+    Local algod serving params, status, pending transaction info and
+    accepting groups, confirmed in the next round, and indexer serving
+    transaction lookup by txid.
+
+    - reject(group) returns an error message to reject a group with 400
+    - failures, number of sends answered 503 before being accepted
+    - lost, number of sends accepted but answered 503
+    - dropped, number of accepted groups that never confirm
+    - pruned, pending transaction info answers 404 for confirmed groups,
+      ie) behind a load balancer
+    """
+
+    def __init__(self, reject=None, failures=0, lost=0, dropped=0, pruned=False):
+        self.reject = reject
+        self.failures = failures
+        self.lost = lost
+        self.dropped = dropped
+        self.pruned = pruned
+        self.lock = threading.Lock()
+        self.round = 1000
+        self.sends = 0
+        self.groups = []
+        self.confirmed = {}
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def reply(self, code, body):
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with mock.lock:
+                    self.reply(*mock.get(self.path))
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with mock.lock:
+                    self.reply(*mock.post(self.path, body))
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self) -> AlgodClient:
+        return AlgodClient("", f"http://127.0.0.1:{self.server.server_port}")
+
+    def indexer(self) -> IndexerClient:
+        return IndexerClient("", f"http://127.0.0.1:{self.server.server_port}")
+
+    def get(self, path: str):
+        if path.startswith("/v2/transactions/params"):
+            return 200, {
+                "consensus-version": "future",
+                "fee": 0,
+                "genesis-hash": base64.b64encode(bytes(32)).decode(),
+                "genesis-id": "mock",
+                "last-round": self.round,
+                "min-fee": 1000,
+            }
+        if path.startswith("/v2/transactions/pending/"):
+            txid = path.split("/")[4].split("?")[0]
+            if self.pruned or txid not in self.confirmed:
+                return 404, {"message": "txn does not exist"}
+            return 200, {"confirmed-round": self.confirmed[txid], "pool-error": ""}
+        if path.startswith("/v2/transactions?"):
+            txid = parse_qs(urlparse(path).query)["txid"][0]
+            transactions = (
+                [{"id": txid, "confirmed-round": self.confirmed[txid]}]
+                if txid in self.confirmed
+                else []
+            )
+            return 200, {"current-round": self.round, "transactions": transactions}
+        if path.startswith("/v2/status/wait-for-block-after/"):
+            self.round += 1
+        return 200, {"last-round": self.round}
+
+    def post(self, path: str, body: bytes):
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(body)
+        group = [encoding.msgpack_decode(signed) for signed in unpacker]
+        txid = group[0].get_txid()
+        self.sends += 1
+        if self.failures:
+            self.failures -= 1
+            return 503, {"message": "unavailable"}
+        if txid in self.confirmed:
+            return 400, {"message": f"transaction already in ledger: {txid}"}
+        message = self.reject and self.reject(group)
+        if message:
+            return 400, {"message": message}
+        if any(txn.transaction.last_valid_round < self.round for txn in group):
+            return 400, {"message": "txn dead"}
+        if self.dropped:
+            self.dropped -= 1
+            return 200, {"txId": txid}
+        self.groups.append(group)
+        self.confirmed[txid] = self.round + 1
+        if self.lost:
+            self.lost -= 1
+            return 503, {"message": "unavailable"}
+        return 200, {"txId": txid}
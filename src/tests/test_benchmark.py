@@ -0,0 +1,67 @@
+import json
+import pytest
+
+from src.benchmark import benchmarks, compare, main, run_benchmarks
+
+
+def test_run_benchmarks():
+    """
+    Test run_benchmarks runs every benchmark and skips large scalar sizes
+    """
+    report = run_benchmarks(sizes=[10, 100], max_scalar_size=10, repeat=1)
+    keys = [(result["name"], result["size"]) for result in report["results"]]
+    for name, (_, scalar) in benchmarks.items():
+        assert (name, 10) in keys
+        assert ((name, 100) in keys) != scalar
+    assert all(result["seconds"] >= 0 for result in report["results"])
+
+
+def test_compare():
+    """
+    Test compare flags results slower than baseline beyond tolerance
+    """
+    baseline = {
+        "results": [
+            {"name": "mab_batch", "size": 10, "seconds": 1.0},
+            {"name": "mab_batch", "size": 100, "seconds": 1.0},
+        ]
+    }
+    report = {
+        "results": [
+            {"name": "mab_batch", "size": 10, "seconds": 1.2},
+            {"name": "mab_batch", "size": 100, "seconds": 1.3},
+            {"name": "mab_scalar", "size": 10, "seconds": 9.0},
+        ]
+    }
+    comparisons = compare(report, baseline, tolerance=0.25)
+    assert [c["regression"] for c in comparisons] == [False, True]
+
+
+def test_main_baseline(tmp_path):
+    """
+    Test main writes json and exits non zero on regression
+    """
+    output = tmp_path / "benchmark.json"
+    main(
+        [
+            "--names",
+            "mab_batch",
+            "--sizes",
+            "10",
+            "--repeat",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+    report = json.loads(output.read_text())
+    assert report["results"][0]["name"] == "mab_batch"
+    report["results"][0]["seconds"] = 1e-12
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+    with pytest.raises(SystemExit):
+        main(
+            ["--names", "mab_batch", "--sizes", "10", "--repeat", "1"]
+            + ["--output", str(output), "--baseline", str(baseline)]
+        )
+    assert "comparisons" in json.loads(output.read_text())
@@ -4,7 +4,7 @@ from algopy_testing import AlgopyTestContext, algopy_testing_context
 from unittest.mock import MagicMock
 import typing
 import algopy
-from src.contract import Airdrop
+from src.contract import Airdrop, Params
 
 zero_address = algopy.arc4.Address(
     "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
@@ -39,10 +39,7 @@ def contract(context: AlgopyTestContext) -> Airdrop:
 
 def test_airdrop(contract: Airdrop):
     assert contract is not None
-    assert contract.period_seconds == 0
-    assert contract.lockup_delay == 0
-    assert contract.vesting_delay == 0
-    assert contract.period_limit == 0
+    assert not contract.params.maybe()[1]
     assert contract.messenger_id == 0
     assert contract.contract_version == 0
     assert contract.deployment_version == 0
@@ -60,12 +57,6 @@ def test_airdrop(contract: Airdrop):
 
 
 def test_airdrop_template(contract: Airdrop, context: AlgopyTestContext):
-    contract.period_seconds = algopy.UInt64(0)
-    contract.lockup_delay = algopy.UInt64(0)
-    contract.vesting_delay = algopy.UInt64(0)
-    contract.period_limit = algopy.UInt64(0)
-    contract.distribution_count = algopy.UInt64(0)
-    contract.distribution_seconds = algopy.UInt64(0)
     contract.messenger_id = algopy.UInt64(0)
     period_limit = context.any.arc4.uint64()
     vesting_delay = context.any.arc4.uint64()
@@ -97,12 +88,12 @@ def test_airdrop_template(contract: Airdrop, context: AlgopyTestContext):
         funding,
         delegate,
     )
-    assert contract.period_seconds == period_seconds
-    assert contract.lockup_delay == lockup_delay
-    assert contract.vesting_delay == vesting_delay
-    assert contract.period_limit == period_limit
-    assert contract.distribution_count == distribution_count
-    assert contract.distribution_seconds == distribution_seconds
+    assert contract.params.value.period_seconds == period_seconds
+    assert contract.params.value.lockup_delay == lockup_delay
+    assert contract.params.value.vesting_delay == vesting_delay
+    assert contract.params.value.period_limit == period_limit
+    assert contract.params.value.distribution_count == distribution_count
+    assert contract.params.value.distribution_seconds == distribution_seconds
     assert contract.messenger_id == messenger_id
     assert contract.period == period
     assert contract.deadline == deadline
@@ -111,6 +102,171 @@ def test_airdrop_template(contract: Airdrop, context: AlgopyTestContext):
     assert contract.delegate == delegate
 
 
+def test_airdrop_template_shared(contract: Airdrop, context: AlgopyTestContext):
+    parent = context.any.application()
+    params = Params(
+        algopy.arc4.UInt64(5),  # period_limit
+        algopy.arc4.UInt64(0),  # vesting_delay
+        algopy.arc4.UInt64(12),  # lockup_delay
+        algopy.arc4.UInt64(60),  # period_seconds
+        algopy.arc4.UInt64(12),  # distribution_count
+        algopy.arc4.UInt64(60),  # distribution_seconds
+    )
+    contract.parent_id = parent.id
+    delegate = context.any.arc4.address()
+    args = (
+        algopy.arc4.UInt64(0),  # period
+        algopy.arc4.UInt64(100),  # deadline
+        algopy.arc4.UInt64(1000),  # total
+        algopy.arc4.UInt64(10),  # funding
+        delegate,
+    )
+    # parent params not shared
+    with pytest.raises(AssertionError):
+        contract.template_shared(*args)
+    context.ledger.set_global_state(parent, b"params", params.bytes.value)
+    context.ledger.set_global_state(parent, b"messenger_id", 7)
+    contract.template_shared(*args)
+    assert not contract.params.maybe()[1]
+    assert contract.messenger_id == 0
+    assert contract.deadline == 100
+    assert contract.total == 1000
+    assert contract.funding == 10
+    assert contract.delegate == delegate
+    assert contract.fully_vested.value == 10
+    # withdraw reads params from parent
+    contract.owner = context.default_sender
+    context.ledger.update_account(
+        context.ledger.get_app(contract).address,
+        balance=algopy.Global.min_balance + 1000,
+    )
+    context.ledger.patch_global_fields(latest_timestamp=10 + 60)
+    assert contract.withdraw(algopy.arc4.UInt64(0)) == 1000 * 11 // 12
+    # templated once
+    with pytest.raises(AssertionError):
+        contract.template_shared(*args)
+
+
+def test_airdrop_init(contract: Airdrop, context: AlgopyTestContext):
+    upgrader = context.any.arc4.address()
+    deployer = context.any.arc4.address()
+    owner = context.any.arc4.address()
+    funder = context.any.arc4.address()
+    delegate = context.any.arc4.address()
+    contract.init(
+        algopy.arc4.UInt64(5),  # period_limit
+        algopy.arc4.UInt64(0),  # vesting_delay
+        algopy.arc4.UInt64(12),  # lockup_delay
+        algopy.arc4.UInt64(60),  # period_seconds
+        algopy.arc4.UInt64(7),  # messenger_id
+        algopy.arc4.UInt64(12),  # distribution_count
+        algopy.arc4.UInt64(60),  # distribution_seconds
+        algopy.arc4.UInt64(0),  # period
+        algopy.arc4.UInt64(100),  # deadline
+        algopy.arc4.UInt64(1000),  # total
+        algopy.arc4.UInt64(0),  # funding
+        delegate,
+        upgrader,
+        deployer,
+        owner,
+        funder,
+        algopy.arc4.UInt64(10),  # initial
+    )
+    assert contract.params.value.period_limit == 5
+    assert contract.params.value.distribution_count == 12
+    assert contract.messenger_id == 7
+    assert contract.deadline == 100
+    assert contract.total == 1000
+    assert contract.delegate == delegate
+    assert contract.upgrader == upgrader
+    assert contract.deployer == deployer
+    assert contract.owner == owner
+    assert contract.funder == funder
+    assert contract.initial == 10
+    assert contract.fully_vested.value == 0
+
+
+def test_airdrop_init_shared(contract: Airdrop, context: AlgopyTestContext):
+    parent = context.any.application()
+    contract.parent_id = parent.id
+    context.ledger.set_global_state(
+        parent,
+        b"params",
+        Params(
+            algopy.arc4.UInt64(5),  # period_limit
+            algopy.arc4.UInt64(0),  # vesting_delay
+            algopy.arc4.UInt64(12),  # lockup_delay
+            algopy.arc4.UInt64(60),  # period_seconds
+            algopy.arc4.UInt64(12),  # distribution_count
+            algopy.arc4.UInt64(60),  # distribution_seconds
+        ).bytes.value,
+    )
+    context.ledger.set_global_state(parent, b"messenger_id", 7)
+    upgrader = context.any.arc4.address()
+    owner = context.any.arc4.address()
+    args = (
+        algopy.arc4.UInt64(0),  # period
+        algopy.arc4.UInt64(100),  # deadline
+        algopy.arc4.UInt64(1000),  # total
+        algopy.arc4.UInt64(10),  # funding
+        zero_address,  # delegate
+        upgrader,
+        algopy.arc4.Address(context.default_sender),  # deployer
+        owner,
+        algopy.arc4.Address(context.default_sender),  # funder
+        algopy.arc4.UInt64(1000),  # initial
+    )
+    contract.init_shared(*args)
+    assert not contract.params.maybe()[1]
+    assert contract.total == 1000
+    assert contract.fully_vested.value == 10
+    assert contract.upgrader == upgrader
+    assert contract.owner == owner
+    assert contract.funder == context.default_sender
+    assert contract.initial == 1000
+    # initialized once
+    with pytest.raises(AssertionError):
+        contract.init_shared(*args)
+
+
+def test_airdrop_get_state(contract: Airdrop, context: AlgopyTestContext):
+    owner = context.any.arc4.address()
+    contract.template(
+        algopy.arc4.UInt64(5),  # period_limit
+        algopy.arc4.UInt64(0),  # vesting_delay
+        algopy.arc4.UInt64(12),  # lockup_delay
+        algopy.arc4.UInt64(60),  # period_seconds
+        algopy.arc4.UInt64(7),  # messenger_id
+        algopy.arc4.UInt64(12),  # distribution_count
+        algopy.arc4.UInt64(60),  # distribution_seconds
+        algopy.arc4.UInt64(0),  # period
+        algopy.arc4.UInt64(100),  # deadline
+        algopy.arc4.UInt64(1000),  # total
+        algopy.arc4.UInt64(10),  # funding
+        zero_address,  # delegate
+    )
+    contract.owner = owner.native
+    context.ledger.update_account(
+        context.ledger.get_app(contract).address,
+        balance=algopy.Global.min_balance + 1500,
+    )
+    context.ledger.patch_global_fields(latest_timestamp=10 + 60)
+    state = contract.get_state()
+    assert state.owner == owner
+    assert state.messenger_id == 7
+    assert state.period_limit == 5
+    assert state.lockup_delay == 12
+    assert state.distribution_count == 12
+    assert state.deadline == 100
+    assert state.total == 1000
+    assert state.funding == 10
+    assert state.fully_vested == 10
+    assert state.updatable.native
+    assert state.balance == algopy.Global.min_balance + 1500
+    assert state.min_balance == 1000 * 11 // 12
+    assert state.available_balance == 1500
+
+
 # TODO write test
 # when called offline key reg and close out to creator address
 def test_fundable_abort_funding(contract: Airdrop, context: AlgopyTestContext):
@@ -123,3 +279,45 @@ def test_fundable_abort_funding(contract: Airdrop, context: AlgopyTestContext):
     contract.funding = algopy.UInt64(0)
     contract.funder = context.default_sender
     contract.abort_funding()
+
+
+def test_airdrop_get_state_legacy(contract: Airdrop, context: AlgopyTestContext):
+    """
+    Test get_state of an app upgraded from before params, reading its
+    individual template parameter keys and own messenger id
+    """
+    app = context.ledger.get_app(contract)
+    for key, value in [
+        (b"period_limit", 5),
+        (b"vesting_delay", 0),
+        (b"lockup_delay", 12),
+        (b"period_seconds", 60),
+        (b"distribution_count", 12),
+        (b"distribution_seconds", 60),
+    ]:
+        context.ledger.set_global_state(app, key, value)
+    del contract.fully_vested.value
+    contract.messenger_id = algopy.UInt64(7)
+    contract.parent_id = context.any.application().id
+    contract.total = algopy.UInt64(1000)
+    contract.funding = algopy.UInt64(10)
+    context.ledger.update_account(
+        app.address, balance=algopy.Global.min_balance + 1500
+    )
+    context.ledger.patch_global_fields(latest_timestamp=10 + 60)
+    state = contract.get_state()
+    assert state.messenger_id == 7
+    assert state.period_limit == 5
+    assert state.lockup_delay == 12
+    assert state.distribution_count == 12
+    assert state.fully_vested == 10
+    assert state.min_balance == 1000 * 11 // 12
+    # period limited by legacy period limit
+    contract.owner = context.default_sender
+    contract.funding = algopy.UInt64(0)
+    contract.total = algopy.UInt64(0)
+    contract.deadline = algopy.UInt64(100)
+    with pytest.raises(AssertionError):
+        contract.configure(algopy.arc4.UInt64(6))
+    contract.configure(algopy.arc4.UInt64(5))
+    assert contract.period == 5
@@ -3,7 +3,8 @@ import pytest
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 from unittest.mock import patch, MagicMock
 import typing
-from src.contract import AirdropFactory
+import algopy
+from src.contract import AirdropCreateArgs, AirdropFactory, ChildInfo
 
 
 class MockApp:
@@ -56,3 +57,175 @@ def test_factory_airdrop_create(contract: AirdropFactory, context: AlgopyTestCon
     # with patch("algopy.arc4.arc4_create", return_value=MockApp(context)):
     #     with context.txn.create_group([extra_payment, deferred_call]):
     #         deferred_call.submit()
+
+
+def test_factory_airdrop_create_many(
+    contract: AirdropFactory, context: AlgopyTestContext
+):
+    app = context.ledger.get_app(contract)
+    args = algopy.arc4.DynamicArray[AirdropCreateArgs](
+        *(
+            AirdropCreateArgs(
+                context.any.arc4.address(),  # owner
+                context.any.arc4.address(),  # funder
+                algopy.arc4.UInt64(100),  # deadline
+                algopy.arc4.UInt64(1000),  # initial
+            )
+            for _ in range(3)
+        )
+    )
+
+    def call(amount: int, args: algopy.arc4.DynamicArray[AirdropCreateArgs]):
+        payment = context.any.txn.payment(
+            amount=amount,
+            sender=context.default_sender,
+            receiver=app.address,
+        )
+        deferred_call = context.txn.defer_app_call(contract.create_many, args)
+        with context.txn.create_group([payment, deferred_call]):
+            return deferred_call.submit()
+
+    # one payment covers every child
+    children = [(context.any.application(), 1042000) for _ in range(3)]
+    with (
+        patch.object(AirdropFactory, "create_child", side_effect=children * 3),
+        patch.object(AirdropFactory, "init_airdrop") as init_airdrop,
+    ):
+        with pytest.raises(AssertionError):
+            call(3 * (1042000 + 100000) - 1, args)
+        with pytest.raises(AssertionError):
+            call(0, algopy.arc4.DynamicArray[AirdropCreateArgs]())
+        app_ids = call(3 * (1042000 + 100000), args)
+        assert [app_id.native for app_id in app_ids] == [
+            app.id for app, _ in children
+        ]
+        assert init_airdrop.call_args.args[1] == args[2].owner
+        assert len(context.txn.last_group.itxn_groups) == 0
+        # excess refunded
+        call(3 * (1042000 + 100000) + 7, args)
+        refund = context.txn.last_group.last_itxn.payment
+        assert refund.receiver == context.default_sender
+        assert refund.amount == 7
+
+
+def test_factory_airdrop_share_params(
+    contract: AirdropFactory, context: AlgopyTestContext
+):
+    for name, value in [
+        ("PERIOD_LIMIT", 5),
+        ("LOCKUP_DELAY", 12),
+        ("PERIOD_SECONDS", 60),
+        ("MESSENGER_ID", 7),
+        ("DISTRIBUTION_COUNT", 12),
+        ("DISTRIBUTION_SECONDS", 60),
+    ]:
+        context.set_template_var(name, algopy.UInt64(value))
+    contract.upgrader = context.any.account()
+    with pytest.raises(AssertionError):
+        contract.share_params()
+    contract.upgrader = context.default_sender
+    assert not contract.params.maybe()[1]
+    # updated in place from before sharing, no room in schema
+    app = context.ledger.get_app(contract)
+    context.ledger.update_app(
+        app, global_num_uint=algopy.UInt64(3), global_num_bytes=algopy.UInt64(2)
+    )
+    with pytest.raises(AssertionError):
+        contract.share_params()
+    context.ledger.update_app(
+        app, global_num_uint=algopy.UInt64(5), global_num_bytes=algopy.UInt64(3)
+    )
+    contract.share_params()
+    assert contract.params.value.period_limit == 5
+    assert contract.params.value.vesting_delay == 0
+    assert contract.params.value.lockup_delay == 12
+    assert contract.params.value.period_seconds == 60
+    assert contract.params.value.distribution_count == 12
+    assert contract.params.value.distribution_seconds == 60
+    assert contract.messenger_id.value == 7
+    # can not be unshared or changed
+    with pytest.raises(AssertionError):
+        contract.share_params()
+
+
+def test_factory_airdrop_registry(
+    contract: AirdropFactory, context: AlgopyTestContext
+):
+    contract.upgrader = context.any.account()
+    with pytest.raises(AssertionError):
+        contract.enable_registry()
+    contract.upgrader = context.default_sender
+    assert not contract.registry
+    # upgrader pays for the registry box, excess refunded
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(
+        amount=9000,
+        sender=context.default_sender,
+        receiver=app.address,
+    )
+    deferred_call = context.txn.defer_app_call(contract.enable_registry)
+    min_balances = iter([algopy.UInt64(100000), algopy.UInt64(108900)])
+    with (
+        patch("src.contract.get_min_balance", lambda: next(min_balances)),
+        patch("src.utils.get_min_balance", lambda: next(min_balances)),
+        context.txn.create_group([payment, deferred_call]),
+    ):
+        deferred_call.submit()
+    refund = context.txn.last_group.last_itxn.payment
+    assert refund.receiver == context.default_sender
+    assert refund.amount == 100
+    assert contract.registry
+    owner = context.any.arc4.address()
+    funder = context.any.arc4.address()
+    offset, limit = algopy.arc4.UInt64(0), algopy.arc4.UInt64(10)
+    count, children = contract.get_children(owner, offset, limit)
+    assert count == 0
+    assert children.length == 0
+    context.ledger.patch_global_fields(round=7)
+
+    def register(app_ids: typing.Iterable[int]):
+        app_call = context.any.txn.application_call(
+            app_id=context.ledger.get_app(contract)
+        )
+        with context.txn.create_group([app_call]):
+            for app_id in app_ids:
+                contract.register(algopy.UInt64(app_id), owner, funder)
+
+    register([11, 12, 13])
+    count, children = contract.get_children(owner, offset, limit)
+    assert count == 3
+    assert children == algopy.arc4.DynamicArray[ChildInfo](
+        *(
+            ChildInfo(algopy.arc4.UInt64(app_id), funder, algopy.arc4.UInt64(7))
+            for app_id in [11, 12, 13]
+        )
+    )
+    count, children = contract.get_children(
+        owner, algopy.arc4.UInt64(1), algopy.arc4.UInt64(1)
+    )
+    assert count == 3
+    assert [child.app_id for child in children] == [12]
+    count, children = contract.get_children(owner, algopy.arc4.UInt64(3), limit)
+    assert count == 3
+    assert children.length == 0
+    # pages of 21 children, limit clamped to a page without overflow
+    register(range(14, 56))
+    count, children = contract.get_children(
+        owner, algopy.arc4.UInt64(19), algopy.arc4.UInt64(2**64 - 1)
+    )
+    assert count == 45
+    assert [child.app_id for child in children] == list(range(30, 51))
+    count, children = contract.get_children(
+        owner, algopy.arc4.UInt64(40), algopy.arc4.UInt64(10)
+    )
+    assert [child.app_id for child in children] == list(range(51, 56))
+    count, children = contract.get_children(
+        owner, algopy.arc4.UInt64(2**64 - 1), algopy.arc4.UInt64(2**64 - 1)
+    )
+    assert count == 45
+    assert children.length == 0
+    key = b"c" + owner.bytes.value
+    assert [
+        len(context.ledger.get_box(contract, key + page.to_bytes(8, "big")))
+        for page in range(3)
+    ] == [21 * 48, 21 * 48, 3 * 48]
@@ -0,0 +1,98 @@
+from collections.abc import Generator
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from unittest.mock import patch
+import algopy
+from src.contract import StakingCreateArgs, StakingFactory
+
+
+@pytest.fixture()
+def context() -> Generator[AlgopyTestContext, None, None]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> StakingFactory:  # noqa: ARG001
+    return StakingFactory()
+
+
+def test_factory_staking_create(contract: StakingFactory, context: AlgopyTestContext):
+    app = context.ledger.get_app(contract)
+    owner = context.any.arc4.address()
+    funder = context.any.arc4.address()
+    delegate = context.any.arc4.address()
+    period = algopy.arc4.UInt64(5)
+
+    def call(amount: int):
+        payment = context.any.txn.payment(
+            amount=amount,
+            sender=context.default_sender,
+            receiver=app.address,
+        )
+        deferred_call = context.txn.defer_app_call(
+            contract.create, owner, funder, delegate, period
+        )
+        with context.txn.create_group([payment, deferred_call]):
+            return deferred_call.submit()
+
+    child = context.any.application()
+    with (
+        patch.object(StakingFactory, "create_child", return_value=(child, 1042000)),
+        patch.object(StakingFactory, "init_staking") as init_staking,
+    ):
+        with pytest.raises(AssertionError):
+            call(1042000 + 100000 - 1)
+        # surplus is the initial balance, not refunded
+        assert call(1042000 + 100000 + 5000) == child.id
+        assert init_staking.call_args.args == (
+            child,
+            owner,
+            funder,
+            delegate,
+            period,
+            5000,
+        )
+        assert len(context.txn.last_group.itxn_groups) == 0
+
+
+def test_factory_staking_create_many(
+    contract: StakingFactory, context: AlgopyTestContext
+):
+    app = context.ledger.get_app(contract)
+    args = algopy.arc4.DynamicArray[StakingCreateArgs](
+        *(
+            StakingCreateArgs(
+                context.any.arc4.address(),  # owner
+                context.any.arc4.address(),  # funder
+                context.any.arc4.address(),  # delegate
+                algopy.arc4.UInt64(5),  # period
+                algopy.arc4.UInt64(1000),  # initial
+            )
+            for _ in range(3)
+        )
+    )
+
+    def call(amount: int):
+        payment = context.any.txn.payment(
+            amount=amount,
+            sender=context.default_sender,
+            receiver=app.address,
+        )
+        deferred_call = context.txn.defer_app_call(contract.create_many, args)
+        with context.txn.create_group([payment, deferred_call]):
+            return deferred_call.submit()
+
+    children = [(context.any.application(), 1042000) for _ in range(3)]
+    with (
+        patch.object(StakingFactory, "create_child", side_effect=children * 2),
+        patch.object(StakingFactory, "init_staking"),
+    ):
+        with pytest.raises(AssertionError):
+            call(3 * (1042000 + 100000 + 1000) - 1)
+        # excess refunded
+        app_ids = call(3 * (1042000 + 100000 + 1000) + 7)
+        assert [app_id.native for app_id in app_ids] == [app.id for app, _ in children]
+        refund = context.txn.last_group.last_itxn.payment
+        assert refund.receiver == context.default_sender
+        assert refund.amount == 7
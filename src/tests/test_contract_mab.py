@@ -1,4 +1,9 @@
-from src.contract_mab import calculate_mab_pure
+from src.contract_mab import (
+    calculate_fully_vested,
+    calculate_mab_pure,
+    calculate_mab_vested,
+    calculate_next_unlock,
+)
 
 
 def test_calculate_mab_pure():
@@ -60,3 +65,58 @@ def test_calculate_mab_pure():
             distribution_seconds,
         )
         assert result <= total and result > 0
+
+
+def test_calculate_mab_vested():
+    """
+    Test the calculate_mab_vested function matches calculate_mab_pure
+    given calculate_fully_vested
+    """
+    vesting_delay = 1
+    period_seconds = 60
+    lockup_delay = 12
+    period = 2
+    funding = 1000
+    total = 1000003
+    distribution_count = 12
+    distribution_seconds = 60
+    fully_vested = calculate_fully_vested(
+        vesting_delay, period_seconds, lockup_delay, period, funding
+    )
+    assert fully_vested == funding + (vesting_delay + lockup_delay * period) * 60
+    for now in range(0, fully_vested + 14 * distribution_seconds, 7):
+        assert calculate_mab_vested(
+            now, fully_vested, total, distribution_count, distribution_seconds
+        ) == calculate_mab_pure(
+            now,
+            vesting_delay,
+            period_seconds,
+            lockup_delay,
+            period,
+            funding,
+            total,
+            distribution_count,
+            distribution_seconds,
+        )
+
+
+def test_calculate_next_unlock():
+    """
+    Test the calculate_next_unlock function against a time scan
+    """
+    fully_vested = 100
+    distribution_seconds = 7
+    for total, distribution_count in [(1000003, 12), (7, 12), (0, 12), (100, 1)]:
+        horizon = fully_vested + (distribution_count + 2) * distribution_seconds
+        mab = [
+            calculate_mab_vested(
+                now, fully_vested, total, distribution_count, distribution_seconds
+            )
+            for now in range(horizon)
+        ]
+        for now in range(horizon):
+            next_unlock = calculate_next_unlock(
+                now, fully_vested, total, distribution_count, distribution_seconds
+            )
+            scan = [t for t in range(now + 1, horizon) if mab[t] < mab[now]]
+            assert next_unlock == (scan[0] if scan else 0)
@@ -1,8 +1,9 @@
 from collections.abc import Generator
 import pytest
 from algopy_testing import AlgopyTestContext, algopy_testing_context
+from unittest.mock import patch
 import algopy
-from src.contract import Messenger
+from src.contract import Bytes32, Bytes64, Messenger, PartKeyInfo
 
 @pytest.fixture()
 def context() -> Generator[AlgopyTestContext, None, None]:
@@ -31,3 +32,151 @@ def test_lockable_partkey_broastcast(contract: Messenger, context: AlgopyTestCon
     pass
     # emits event
 
+
+def test_messenger_registry(contract: Messenger, context: AlgopyTestContext):
+    """
+    Test the partkey registry
+    Enabled by upgrader, latest partkey per sender and address
+    """
+    addresses = [context.any.arc4.address() for _ in range(3)]
+
+    def broadcast(address: algopy.arc4.Address, vote_fst: int):
+        contract.partkey_broastcast(
+            address,
+            Bytes32.from_bytes(bytes(32)),
+            Bytes32.from_bytes(bytes(32)),
+            algopy.arc4.UInt64(vote_fst),
+            algopy.arc4.UInt64(vote_fst + 1000),
+            algopy.arc4.UInt64(100),
+            Bytes64.from_bytes(bytes(64)),
+        )
+
+    who = algopy.arc4.Address(context.default_sender)
+    offset, limit = algopy.arc4.UInt64(0), algopy.arc4.UInt64(10)
+    # not recorded until enabled
+    broadcast(addresses[0], 1)
+    count, _ = contract.get_partkey_addresses(who, offset, limit)
+    assert count == 0
+    contract.upgrader = context.any.account()
+    with pytest.raises(AssertionError):
+        contract.enable_registry()
+    contract.upgrader = context.default_sender
+    contract.enable_registry()
+    for vote_fst, address in enumerate(addresses):
+        broadcast(address, vote_fst)
+    broadcast(addresses[0], 10)
+    assert contract.get_partkey(who, addresses[0]).vote_first == 10
+    assert contract.get_partkey(who, addresses[0]).vote_last == 1010
+    assert contract.get_partkey(who, addresses[2]).vote_first == 2
+    # box names are at most 64 bytes
+    key = who.bytes + addresses[0].bytes
+    assert len(key) <= 64
+    assert context.ledger.box_exists(contract, key)
+    with pytest.raises(AssertionError):
+        contract.get_partkey(addresses[1], addresses[0])
+    # first broadcast order, overwrites do not repeat
+    count, page = contract.get_partkey_addresses(who, offset, limit)
+    assert count == 3
+    assert [address for address in page] == addresses
+    count, page = contract.get_partkey_addresses(
+        who, algopy.arc4.UInt64(2), algopy.arc4.UInt64(5)
+    )
+    assert [address for address in page] == addresses[2:]
+    # pages of 31 addresses, limit clamped to a page without overflow
+    addresses += [context.any.arc4.address() for _ in range(40)]
+    for address in addresses[3:]:
+        broadcast(address, 0)
+    count, page = contract.get_partkey_addresses(
+        who, algopy.arc4.UInt64(20), algopy.arc4.UInt64(2**64 - 1)
+    )
+    assert count == 43
+    assert [address for address in page] == addresses[20:51]
+    assert len(context.ledger.get_box(contract, b"a" + who.bytes + bytes(8))) == 992
+    count, page = contract.get_partkey_addresses(
+        who, algopy.arc4.UInt64(2**64 - 1), algopy.arc4.UInt64(2**64 - 1)
+    )
+    assert count == 43
+    assert page.length == 0
+
+
+def test_messenger_registry_payment(contract: Messenger, context: AlgopyTestContext):
+    """
+    Test the partkey registry payment
+    Covers the min balance increase, excess refunded
+    """
+    app = context.ledger.get_app(contract)
+    contract.upgrader = context.default_sender
+    contract.enable_registry()
+
+    def broadcast(amount: int, min_balances: list[int]):
+        payment = context.any.txn.payment(
+            amount=amount,
+            sender=context.default_sender,
+            receiver=app.address,
+        )
+        deferred_call = context.txn.defer_app_call(
+            contract.partkey_broastcast,
+            context.any.arc4.address(),
+            Bytes32.from_bytes(bytes(32)),
+            Bytes32.from_bytes(bytes(32)),
+            algopy.arc4.UInt64(1),
+            algopy.arc4.UInt64(1000),
+            algopy.arc4.UInt64(100),
+            Bytes64.from_bytes(bytes(64)),
+        )
+        min_balance = iter(map(algopy.UInt64, min_balances))
+        with (
+            patch("src.contract.get_min_balance", lambda: next(min_balance)),
+            patch("src.utils.get_min_balance", lambda: next(min_balance)),
+            context.txn.create_group([payment, deferred_call]),
+        ):
+            deferred_call.submit()
+
+    with pytest.raises(AssertionError):
+        broadcast(999, [100000, 101000])
+    broadcast(1007, [100000, 101000])
+    refund = context.txn.last_group.last_itxn.payment
+    assert refund.receiver == context.default_sender
+    assert refund.amount == 7
+    # min balance unchanged, refunded in full
+    broadcast(1000, [101000, 101000])
+    assert context.txn.last_group.last_itxn.payment.amount == 1000
+
+
+def test_messenger_partkey_broastcast_many(
+    contract: Messenger, context: AlgopyTestContext
+):
+    """
+    Test the partkey_broastcast_many function
+    Must be called by anyone, at most 4 partkeys
+    """
+    partkeys = [
+        PartKeyInfo(
+            context.any.arc4.address(),
+            Bytes32.from_bytes(bytes(32)),
+            Bytes32.from_bytes(bytes(32)),
+            algopy.arc4.UInt64(vote_fst),
+            algopy.arc4.UInt64(vote_fst + 1000),
+            algopy.arc4.UInt64(100),
+            Bytes64.from_bytes(bytes(64)),
+        )
+        for vote_fst in range(5)
+    ]
+    with pytest.raises(AssertionError):
+        contract.partkey_broastcast_many(algopy.arc4.DynamicArray[PartKeyInfo]())
+    with pytest.raises(AssertionError):
+        contract.partkey_broastcast_many(
+            algopy.arc4.DynamicArray[PartKeyInfo](*partkeys)
+        )
+    contract.upgrader = context.default_sender
+    contract.enable_registry()
+    contract.partkey_broastcast_many(
+        algopy.arc4.DynamicArray[PartKeyInfo](*partkeys[:4])
+    )
+    who = algopy.arc4.Address(context.default_sender)
+    for partkey in partkeys[:4]:
+        assert contract.get_partkey(who, partkey.address) == partkey
+    count, _ = contract.get_partkey_addresses(
+        who, algopy.arc4.UInt64(0), algopy.arc4.UInt64(10)
+    )
+    assert count == 4
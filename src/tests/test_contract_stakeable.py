@@ -80,3 +80,33 @@ def test_stakeable_participate(contract: Stakeable, context: AlgopyTestContext):
     assert contract.delegate == context.default_sender
 
     participate_helper(contract, context)
+
+
+def test_stakeable_participate_pooled(
+    contract: Stakeable, context: AlgopyTestContext
+):
+    """
+    Test the participate_pooled function
+    Must be called by the owner or delegate with fee covering key registration
+    """
+    args = (
+        Bytes32(),  # vote_k
+        Bytes32(),  # sel_k
+        context.any.arc4.uint64(),  # vote_fst
+        context.any.arc4.uint64(),  # vote_lst
+        context.any.arc4.uint64(),  # vote_kd
+        Bytes64(),  # sp_key
+    )
+
+    def call(fee: int):
+        with context.txn.create_group(active_txn_overrides={"fee": fee}):
+            contract.participate_pooled(*args)
+
+    with pytest.raises(AssertionError):
+        call(algopy.Global.min_txn_fee * 2)
+    contract.delegate = context.default_sender
+    with pytest.raises(AssertionError):
+        call(algopy.Global.min_txn_fee * 2 - 1)
+    call(algopy.Global.min_txn_fee * 2)
+    keyreg_txn = context.txn.last_group.last_itxn.key_registration
+    assert keyreg_txn.fee == 0
@@ -0,0 +1,194 @@
+import json
+import pytest
+
+pytest.importorskip("algosdk")
+
+from algosdk import account, transaction
+from src.bulk import ClientPool, ParamsCache, Submitter, get_signer, pack_groups
+from src.funder import (
+    Fill,
+    Journal,
+    fill_selector,
+    fund,
+    get_item,
+    load_fills_csv,
+    set_funding_selector,
+)
+from src.tests.mock_algod import MockAlgod
+
+private_key, sender = account.generate_account()
+
+
+def get_submitter(algod: MockAlgod, size: int = 4, validity_rounds=None):
+    pool = ClientPool(algod.client() for _ in range(size))
+    return Submitter(
+        pool,
+        get_signer(private_key),
+        algod.indexer(),
+        ParamsCache(pool, validity_rounds=validity_rounds),
+        backoff=0,
+    )
+
+
+def get_fills(count: int):
+    return [Fill(app_id, app_id * 1000) for app_id in range(1, count + 1)]
+
+
+def get_filled(algod: MockAlgod):
+    return sorted(
+        txn.transaction.index
+        for group in algod.groups
+        for txn in group
+        if isinstance(txn.transaction, transaction.ApplicationCallTxn)
+        and txn.transaction.app_args[0] == fill_selector
+    )
+
+
+def test_funder_pack_groups():
+    """
+    Test fills are packed into full groups
+    """
+    items = [get_item(sender, fill) for fill in get_fills(20)]
+    assert [len(group) for group in pack_groups(items)] == [8, 8, 4]
+    items = [get_item(sender, fill, 1700000000) for fill in get_fills(12)]
+    assert [len(group) for group in pack_groups(items)] == [5, 5, 2]
+
+
+def test_funder_shared(tmp_path):
+    """
+    Test set_funding of children of a factory sharing params references
+    the factory, read from the parent_id column
+    """
+    fills_file_path = tmp_path / "fills.csv"
+    fills_file_path.write_text("app_id,amount,parent_id\n1,1000,\n2,2000,7\n")
+    fills = list(load_fills_csv(fills_file_path))
+    assert fills == [Fill(1, 1000), Fill(2, 2000, 7)]
+    journal = Journal(tmp_path / "funder.jsonl")
+    with MockAlgod() as algod:
+        outcomes = list(fund(get_submitter(algod), journal, sender, fills, 1700000000))
+    journal.close()
+    assert all(outcome.confirmed for outcome in outcomes)
+    [group] = algod.groups
+    assert [txn.transaction.foreign_apps for txn in group[2::3]] == [None, [7]]
+    assert [txn.transaction.foreign_apps for txn in group[1::3]] == [None, None]
+
+
+def test_funder_fund(tmp_path):
+    """
+    Test fund fills and sets funding of every app
+    """
+    journal = Journal(tmp_path / "funder.jsonl")
+    with MockAlgod() as algod:
+        outcomes = list(
+            fund(get_submitter(algod), journal, sender, get_fills(12), 1700000000)
+        )
+    journal.close()
+    assert sorted(outcome.key for outcome in outcomes) == list(range(1, 13))
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert sorted(len(group) for group in algod.groups) == [6, 15, 15]
+    for group in algod.groups:
+        for payment, fill, set_funding in zip(group[::3], group[1::3], group[2::3]):
+            app_id = fill.transaction.index
+            assert payment.transaction.amt == app_id * 1000
+            assert fill.transaction.app_args == [fill_selector]
+            assert set_funding.transaction.index == app_id
+            assert set_funding.transaction.app_args == [
+                set_funding_selector,
+                (1700000000).to_bytes(8, "big"),
+            ]
+    # rerun fills nothing
+    journal = Journal(tmp_path / "funder.jsonl")
+    with MockAlgod() as algod:
+        assert list(fund(get_submitter(algod), journal, sender, get_fills(12))) == []
+    journal.close()
+    assert algod.sends == 0
+
+
+def test_funder_fund_resume(tmp_path):
+    """
+    Test fund resumes from the journal without filling twice
+    """
+    journal_file_path = tmp_path / "funder.jsonl"
+    with MockAlgod() as algod:
+        # crash after sending the first group, before recording outcomes
+        journal = Journal(journal_file_path)
+        submitter = get_submitter(algod)
+        submitter.on_send = journal.on_send
+        submitter.submit([get_item(sender, fill) for fill in get_fills(8)])
+        # crash after journaling the second group, before sending it
+        submitter.build([get_item(sender, fill) for fill in get_fills(16)[8:]])
+        journal.close()
+        with open(journal_file_path, "a") as journal_file:
+            journal_file.write('{"sent": [17')
+        journal = Journal(journal_file_path)
+        outcomes = list(fund(get_submitter(algod), journal, sender, get_fills(20)))
+        journal.close()
+    assert sorted(outcome.key for outcome in outcomes) == list(range(1, 21))
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert get_filled(algod) == list(range(1, 21))
+    with open(journal_file_path) as journal_file:
+        lines = journal_file.readlines()
+    assert lines.count('{"sent": [17\n') == 1
+    records = [
+        json.loads(line) for line in lines if not line.startswith('{"sent": [17')
+    ]
+    assert sorted(record["key"] for record in records if "key" in record) == list(
+        range(1, 21)
+    )
+
+
+def test_funder_fund_pruned(tmp_path):
+    """
+    Test fund does not fill twice when groups confirm but pending
+    transaction info answers 404
+    """
+    journal_file_path = tmp_path / "funder.jsonl"
+    with MockAlgod(lost=1, pruned=True) as algod:
+        journal = Journal(journal_file_path)
+        outcomes = list(
+            fund(get_submitter(algod, 4, 10), journal, sender, get_fills(8))
+        )
+        journal.close()
+        assert sorted(outcome.key for outcome in outcomes) == list(range(1, 9))
+        assert all(outcome.confirmed for outcome in outcomes)
+        assert get_filled(algod) == list(range(1, 9))
+        # crash after sending, before recording outcomes
+        journal = Journal(journal_file_path)
+        submitter = get_submitter(algod, 4, 10)
+        submitter.on_send = journal.on_send
+        submitter.build([get_item(sender, fill) for fill in get_fills(16)[8:]])
+        signed = submitter.build(
+            [get_item(sender, fill) for fill in get_fills(24)[16:]]
+        )[0]
+        algod.client().send_transactions(signed)
+        journal.close()
+        journal = Journal(journal_file_path)
+        outcomes = list(
+            fund(get_submitter(algod, 4, 10), journal, sender, get_fills(24))
+        )
+        journal.close()
+    assert sorted(outcome.key for outcome in outcomes) == list(range(9, 25))
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert get_filled(algod) == list(range(1, 25))
+
+
+def test_funder_fund_rejected(tmp_path):
+    """
+    Test fund retries rejected apps on rerun
+    """
+
+    def reject(group):
+        if any(txn.transaction.index == 3 for txn in group[1::2]):
+            return "logic eval error: must be funder"
+
+    journal = Journal(tmp_path / "funder.jsonl")
+    with MockAlgod(reject=reject) as algod:
+        outcomes = list(fund(get_submitter(algod), journal, sender, get_fills(8)))
+    journal.close()
+    assert [outcome.key for outcome in outcomes if not outcome.confirmed] == [3]
+    journal = Journal(tmp_path / "funder.jsonl")
+    with MockAlgod() as algod:
+        outcomes = list(fund(get_submitter(algod), journal, sender, get_fills(8)))
+    journal.close()
+    assert [outcome.key for outcome in outcomes] == [3]
+    assert get_filled(algod) == [3]
@@ -0,0 +1,177 @@
+import pytest
+
+pytest.importorskip("algosdk")
+
+from algosdk import account, transaction
+from algosdk.logic import get_application_address
+from src.bulk import ClientPool, Submitter, get_signer, pack_groups
+from src.keyreg import (
+    PartKey,
+    get_app_args,
+    get_item,
+    participate_pooled_selector,
+    participate_selector,
+    register_keys,
+)
+from src.tests.mock_algod import MockAlgod
+
+private_key, sender = account.generate_account()
+
+
+def get_partkey(app_id: int):
+    return PartKey(
+        app_id,
+        bytes([1] * 32),
+        bytes([2] * 32),
+        100,
+        200,
+        1000,
+        bytes([3] * 64),
+    )
+
+
+def get_submitter(algod: MockAlgod, size: int = 4):
+    return Submitter(
+        ClientPool(algod.client() for _ in range(size)),
+        get_signer(private_key),
+        algod.indexer(),
+        backoff=0,
+    )
+
+
+def get_app_ids(group):
+    return [
+        txn.transaction.index
+        for txn in group
+        if isinstance(txn.transaction, transaction.ApplicationCallTxn)
+    ]
+
+
+def test_keyreg_app_args():
+    """
+    Test participate arguments are abi encoded
+    """
+    assert len(participate_selector) == 4
+    assert participate_selector != participate_pooled_selector
+    app_args = get_app_args(get_partkey(1))
+    assert app_args[0] == participate_selector
+    assert b"".join(app_args[3:6]) == (100).to_bytes(8, "big") + (
+        200
+    ).to_bytes(8, "big") + (1000).to_bytes(8, "big")
+    with pytest.raises(ValueError):
+        get_app_args(PartKey(1, bytes(31), bytes(32), 0, 0, 0, bytes(64)))
+    with pytest.raises(ValueError):
+        get_app_args(PartKey(1, bytes(32), bytes(32), 0, 0, 0, bytes(32)))
+
+
+def test_keyreg_pack_groups():
+    """
+    Test items are packed into full groups
+    """
+    items = [get_item(sender, get_partkey(i)) for i in range(20)]
+    assert [len(group) for group in pack_groups(items)] == [8, 8, 4]
+    items = [get_item(sender, get_partkey(i), pooled=True) for i in range(20)]
+    assert [len(group) for group in pack_groups(items)] == [16, 4]
+
+
+def test_keyreg_register_keys():
+    """
+    Test register_keys submits payment and participate pairs
+    """
+    with MockAlgod() as algod:
+        outcomes = list(
+            register_keys(
+                get_submitter(algod), sender, map(get_partkey, range(1, 21))
+            )
+        )
+    assert sorted(outcome.key for outcome in outcomes) == list(range(1, 21))
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert sorted(len(group) for group in algod.groups) == [8, 16, 16]
+    for group in algod.groups:
+        for payment, call in zip(group[::2], group[1::2]):
+            assert payment.transaction.receiver == get_application_address(
+                call.transaction.index
+            )
+            assert payment.transaction.amt == 1000
+            assert payment.transaction.fee == 1000
+            assert call.transaction.app_args[0] == participate_selector
+            assert call.transaction.fee == 1000
+        assert len({txn.transaction.group for txn in group}) == 1
+
+
+def test_keyreg_register_keys_pooled():
+    """
+    Test register_keys with participate_pooled pools the key registration fee
+    """
+    with MockAlgod() as algod:
+        outcomes = list(
+            register_keys(
+                get_submitter(algod),
+                sender,
+                map(get_partkey, range(1, 21)),
+                pooled=True,
+            )
+        )
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert sorted(len(group) for group in algod.groups) == [4, 16]
+    for group in algod.groups:
+        for call in group:
+            assert call.transaction.app_args[0] == participate_pooled_selector
+            assert call.transaction.fee == 2000
+
+
+def test_keyreg_register_keys_rejected():
+    """
+    Test register_keys isolates rejected apps
+    """
+
+    def reject(group):
+        if 7 in get_app_ids(group):
+            return "logic eval error: must be owner or delegate"
+
+    with MockAlgod(reject=reject) as algod:
+        outcomes = {
+            outcome.key: outcome
+            for outcome in register_keys(
+                get_submitter(algod), sender, map(get_partkey, range(1, 21))
+            )
+        }
+    assert [key for key, outcome in outcomes.items() if not outcome.confirmed] == [7]
+    assert "must be owner or delegate" in outcomes[7].error
+    confirmed = sorted(app_id for group in algod.groups for app_id in get_app_ids(group))
+    assert confirmed == [i for i in range(1, 21) if i != 7]
+
+
+def test_keyreg_register_keys_retries():
+    """
+    Test register_keys retries transient failures without confirming twice
+    """
+    # unavailable, then accepted but the response lost
+    with MockAlgod(failures=2, lost=1) as algod:
+        outcomes = list(
+            register_keys(get_submitter(algod, 1), sender, map(get_partkey, range(1, 9)))
+        )
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert len(algod.groups) == 1
+    assert algod.sends == 4
+    # retries exhausted
+    with MockAlgod(failures=10) as algod:
+        outcomes = list(
+            register_keys(get_submitter(algod, 1), sender, map(get_partkey, range(1, 9)))
+        )
+    assert not any(outcome.confirmed for outcome in outcomes)
+    assert algod.sends == 4 and not algod.groups
+
+
+def test_keyreg_register_keys_expired():
+    """
+    Test register_keys resubmits a group dropped by the node once it expired
+    """
+    with MockAlgod(dropped=1) as algod:
+        outcomes = list(
+            register_keys(get_submitter(algod, 1), sender, map(get_partkey, range(1, 9)))
+        )
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert len(algod.groups) == 1
+    assert algod.sends == 2
+    assert algod.groups[0][0].transaction.first_valid_round > 2000
@@ -0,0 +1,112 @@
+import csv
+import pathlib
+import subprocess
+import sys
+
+from src import simulate
+
+
+def test_get_bonus_table():
+    """
+    Test the get_bonus_table function matches calculate_accumulated
+    """
+    table = simulate.get_bonus_table(225000.0, 5)
+    assert table == tuple(
+        simulate.calculate_accumulated(225000.0, simulate.get_apr(period, 5), period)
+        for period in range(6)
+    )
+    assert simulate.get_bonus_table(225000.0, 5) is table
+    exact_table = simulate.get_bonus_table(225000.0, 5, exact=True)
+    assert exact_table[0] == 225000
+    # 225000 * 1.2 ** 5 = 559872 exactly, float compounding floors to 559871
+    assert exact_table[5] == 559872
+    assert simulate.get_bonus_table(225000, 18, 0.075, True)[0] == 16875
+
+
+def test_calculate_mab_exact():
+    """
+    Test the calculate_mab function reads total plus bonus from the table
+    """
+    args = simulate.get_program_args(simulate.airdrop, 225000.0, 0)
+    # nothing is unlocked at funding
+    assert simulate.calculate_mab(0, *args) == list(
+        simulate.get_bonus_table(225000.0, 5)
+    )
+    assert simulate.calculate_mab(0, *args, exact=True) == list(
+        simulate.get_bonus_table(225000.0, 5, exact=True)
+    )
+
+
+def test_calculate_mab_grid():
+    """
+    Test the calculate_mab_grid function matches calculate_mab
+    """
+    program = simulate.staking
+    args = simulate.get_program_args(program, simulate.tokens, 0)
+    x_values = range(0, int(simulate.seconds_in_month * 32), 1000003)
+    columns = simulate.calculate_mab_grid(x_values, *args)
+    assert columns.shape == (program.period_limit + 1, len(x_values))
+    for i, x in enumerate(x_values):
+        assert columns[:, i].tolist() == simulate.calculate_mab(x, *args)
+
+
+def test_write_mab_csv(tmp_path):
+    """
+    Test the write_mab_csv function streams all chunks
+    """
+    program = simulate.airdrop
+    args = simulate.get_program_args(program, simulate.tokens, 0)
+    x_values = range(0, int(simulate.seconds_in_month * 90), 86400)
+    csv_file_path = tmp_path / "simulate.csv"
+    simulate.write_mab_csv(
+        csv_file_path,
+        simulate.iter_mab_columns(x_values, *args, chunk_size=100),
+        program.period_limit,
+    )
+    with open(csv_file_path, newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows[0] == ["X", "Y0", "Y1", "Y2", "Y3", "Y4", "Y5"]
+    assert len(rows) == len(x_values) + 1
+    for row in rows[1::97]:
+        assert [int(value) for value in row[1:]] == simulate.calculate_mab(
+            int(row[0]), *args
+        )
+
+
+def test_main(tmp_path):
+    """
+    Test the simulate entry point writes requested outputs only
+    """
+    csv_file_path = tmp_path / "compensation.csv"
+    png_file_path = tmp_path / "compensation.png"
+    simulate.main(
+        [
+            "compensation",
+            "--output",
+            "csv",
+            "--csv-file",
+            str(csv_file_path),
+            "--png-file",
+            str(png_file_path),
+        ]
+    )
+    assert csv_file_path.exists()
+    assert not png_file_path.exists()
+
+
+def test_import_does_not_load_matplotlib():
+    """
+    Test importing simulate does not import matplotlib
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.simulate; print('matplotlib' in sys.modules)",
+        ],
+        cwd=pathlib.Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,101 @@
+import bisect
+import pytest
+from src.simulate_mab import (
+    calculate_mab_pure,
+    calculate_mab_schedule,
+    calculate_max_withdrawable,
+    calculate_unlock_time,
+)
+
+
+@pytest.mark.parametrize(
+    "vesting_delay,lockup_delay,period,total,distribution_count",
+    [
+        (1, 12, 5, 1000003, 12),
+        (0, 0, 0, 7, 12),  # repeated floor values
+        (12, 1, 3, 100, 1),
+    ],
+)
+def test_calculate_mab_schedule(
+    vesting_delay, lockup_delay, period, total, distribution_count
+):
+    """
+    Test the calculate_mab_schedule function matches calculate_mab_pure
+    """
+    period_seconds = 10
+    funding = 3
+    distribution_seconds = 7
+    schedule = calculate_mab_schedule(
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        period,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    )
+    timestamps = [timestamp for timestamp, _ in schedule]
+    assert timestamps == sorted(set(timestamps))
+    assert schedule[0] == (funding, total)
+    assert schedule[-1][1] == 0
+    for now in range(0, schedule[-1][0] + 2 * distribution_seconds):
+        index = max(bisect.bisect_right(timestamps, now) - 1, 0)
+        assert schedule[index][1] == calculate_mab_pure(
+            now,
+            vesting_delay,
+            period_seconds,
+            lockup_delay,
+            period,
+            funding,
+            total,
+            distribution_count,
+            distribution_seconds,
+        )
+
+
+def test_calculate_mab_schedule_invalid():
+    """
+    Test the calculate_mab_schedule function rejects zero distribution
+    """
+    with pytest.raises(ValueError):
+        calculate_mab_schedule(0, 60, 0, 0, 0, 100, 0, 60)
+    with pytest.raises(ValueError):
+        calculate_mab_schedule(0, 60, 0, 0, 0, 100, 12, 0)
+
+
+@pytest.mark.parametrize("total", [0, 7, 1000003])
+def test_calculate_unlock_time(total):
+    """
+    Test the calculate_unlock_time function against a time scan
+    """
+    params = (1, 10, 12, 2, 3, total, 12, 7)  # vesting_delay .. distribution_seconds
+    min_balance = 100000
+    horizon = 3 + (1 + 12 * 2) * 10 + 13 * 7
+    for balance in [min_balance - 1, min_balance, min_balance + total // 2]:
+        for amount in range(0, total + 2, max(1, total // 97)):
+            unlock_time = calculate_unlock_time(amount, balance, min_balance, *params)
+            scan = [
+                now
+                for now in range(horizon)
+                if balance - min_balance - amount >= calculate_mab_pure(now, *params)
+            ]
+            if not scan:
+                assert unlock_time is None
+            elif scan[0] == 0:
+                assert unlock_time == 0
+            else:
+                assert unlock_time == scan[0]
+                # mab is non-increasing, satisfied from then on
+                assert scan == list(range(scan[0], horizon))
+
+
+def test_calculate_max_withdrawable():
+    """
+    Test the calculate_max_withdrawable function
+    """
+    params = (1, 10, 12, 2, 3, 1200, 12, 7)
+    for now in range(0, 400, 3):
+        amount = calculate_max_withdrawable(now, 101000, 100000, *params)
+        mab = calculate_mab_pure(now, *params)
+        assert amount == max(0, 1000 - mab)
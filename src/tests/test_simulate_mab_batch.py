@@ -0,0 +1,149 @@
+import itertools
+import numpy as np
+from src.simulate_mab import (
+    calculate_mab_pure,
+    calculate_max_withdrawable,
+    calculate_unlock_time,
+)
+from src.simulate_mab_batch import (
+    UINT64_MAX,
+    calculate_mab_batch,
+    calculate_max_withdrawable_batch,
+    calculate_unlock_time_batch,
+)
+
+
+def test_calculate_mab_batch_matches_pure():
+    """
+    Test calculate_mab_batch against calculate_mab_pure
+    """
+    vesting_delay = 1
+    period_seconds = 60
+    lockup_delay = 12
+    funding = 1
+    total = 1000003
+    distribution_count = 12
+    distribution_seconds = 60
+    periods = list(range(6))
+    now_values = list(range(0, 60 * 100, 7))
+    mab, panic = calculate_mab_batch(
+        np.array(now_values)[:, None],
+        vesting_delay,
+        period_seconds,
+        lockup_delay,
+        periods,
+        funding,
+        total,
+        distribution_count,
+        distribution_seconds,
+    )
+    assert mab.shape == (len(now_values), len(periods))
+    assert not panic.any()
+    for (i, now), (j, period) in itertools.product(
+        enumerate(now_values), enumerate(periods)
+    ):
+        assert mab[i, j] == calculate_mab_pure(
+            now,
+            vesting_delay,
+            period_seconds,
+            lockup_delay,
+            period,
+            funding,
+            total,
+            distribution_count,
+            distribution_seconds,
+        )
+
+
+def test_calculate_mab_batch_exact_uint64():
+    """
+    Test calculate_mab_batch keeps exact integer semantics near 2^64
+    """
+    total = UINT64_MAX // 12
+    now = [0, 61, 121, 60 * 13]
+    mab, panic = calculate_mab_batch(now, 0, 60, 0, 0, 0, total, 12, 60)
+    assert not panic.any()
+    assert [int(value) for value in mab] == [
+        calculate_mab_pure(t, 0, 60, 0, 0, 0, int(total), 12, 60) for t in now
+    ]
+
+
+def test_calculate_mab_batch_panic():
+    """
+    Test calculate_mab_batch flags elements on which the avm would panic
+    """
+    total = UINT64_MAX // 2
+    # total * (12 - 0) overflows, locked up and fully distributed do not
+    mab, panic = calculate_mab_batch([0, 1, 60 * 13], 0, 60, 0, 0, 0, total, 12, 60)
+    assert panic.tolist() == [False, True, False]
+    assert mab.tolist() == [total, 0, 0]
+    # fully vested overflows
+    _, panic = calculate_mab_batch(0, 0, 60, 1, UINT64_MAX, 0, 1, 12, 60)
+    assert panic.all()
+    # division by zero
+    _, panic = calculate_mab_batch([0, 1], 0, 60, 0, 0, 0, 1, 12, 0)
+    assert panic.tolist() == [False, True]
+
+
+def test_calculate_unlock_time_batch():
+    """
+    Test calculate_unlock_time_batch against calculate_unlock_time
+    """
+    rng = np.random.default_rng(3)
+    n = 2000
+    amount = rng.integers(0, 2 * 10**6, n)
+    balance = rng.integers(0, 3 * 10**6, n)
+    min_balance = np.full(n, 100000)
+    params = [
+        rng.integers(0, 2, n),  # vesting_delay
+        rng.integers(1, 100, n),  # period_seconds
+        rng.integers(0, 13, n),  # lockup_delay
+        rng.integers(0, 6, n),  # period
+        rng.integers(0, 10**6, n),  # funding
+        rng.integers(0, 2 * 10**6, n),  # total
+        rng.integers(1, 25, n),  # distribution_count
+        rng.integers(1, 100, n),  # distribution_seconds
+    ]
+    unlock_time, possible = calculate_unlock_time_batch(
+        amount, balance, min_balance, *params
+    )
+    for i in range(n):
+        expected = calculate_unlock_time(
+            int(amount[i]),
+            int(balance[i]),
+            int(min_balance[i]),
+            *(int(column[i]) for column in params),
+        )
+        assert possible[i] == (expected is not None)
+        assert unlock_time[i] == (expected or 0)
+    amount, panic = calculate_max_withdrawable_batch(
+        params[4] + 500, balance, min_balance, *params
+    )
+    assert not panic.any()
+    for i in range(0, n, 7):
+        assert amount[i] == calculate_max_withdrawable(
+            int(params[4][i]) + 500,
+            int(balance[i]),
+            int(min_balance[i]),
+            *(int(column[i]) for column in params),
+        )
+
+
+def test_calculate_unlock_time_batch_uint64():
+    """
+    Test calculate_unlock_time_batch skips installments that would panic
+    """
+    total = UINT64_MAX // 2
+    # total * 2 overflows, first installment that fits leaves total * 1
+    unlock_time, possible = calculate_unlock_time_batch(
+        0, UINT64_MAX, 0, 0, 60, 0, 0, 0, total, 12, 60
+    )
+    assert possible and unlock_time == 0
+    unlock_time, possible = calculate_unlock_time_batch(
+        0, total + 100000, 100000, 0, 60, 0, 0, 0, total * 2, 12, 60
+    )
+    assert possible
+    mab, panic = calculate_mab_batch(unlock_time, 0, 60, 0, 0, 0, total * 2, 12, 60)
+    assert not panic and mab <= total
+    _, panic = calculate_mab_batch(unlock_time - 60, 0, 60, 0, 0, 0, total * 2, 12, 60)
+    assert panic
@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from src.simulate import airdrop, calculate_mab
+from src.simulate_monte_carlo import monte_carlo
+
+
+def test_monte_carlo_deterministic():
+    """
+    Test the monte_carlo function without randomness matches calculate_mab
+    """
+    x_values = np.arange(0, int(airdrop.period_seconds) * 40, 1000003)
+    period_weights = [0, 0, 1, 0, 0, 0]  # all owners choose period 2
+    curves, bands = monte_carlo(
+        airdrop, 10, 2, x_values, period_weights, total=1000, workers=1, batch_size=3
+    )
+    expected = [
+        10 * (int(1000 * 1.08**2) - calculate_mab(int(x), *args)[2])
+        for x in x_values
+        for args in [
+            (
+                airdrop.vesting_delay,
+                airdrop.period_seconds,
+                airdrop.lockup_delay,
+                0,
+                1000,
+                airdrop.distribution_count,
+                airdrop.distribution_seconds,
+                airdrop.period_limit,
+            )
+        ]
+    ]
+    assert curves[0].tolist() == expected
+    assert curves[1].tolist() == expected
+    assert bands[50].tolist() == expected
+
+
+def test_monte_carlo_seeded():
+    """
+    Test the monte_carlo function is reproducible across worker counts
+    """
+    x_values = np.arange(0, int(airdrop.period_seconds) * 90, 2628288)
+    kwargs = dict(withdraw_delay_mean=30 * 24 * 60 * 60, seed=7, batch_size=250)
+    curves, bands = monte_carlo(airdrop, 1000, 4, x_values, workers=1, **kwargs)
+    parallel_curves, _ = monte_carlo(airdrop, 1000, 4, x_values, workers=2, **kwargs)
+    assert np.array_equal(curves, parallel_curves)
+    assert not np.array_equal(curves[0], curves[1])
+    assert (bands[5] <= bands[50]).all() and (bands[50] <= bands[95]).all()
+    # circulating supply only grows
+    assert (np.diff(curves.astype(np.int64), axis=1) >= 0).all()
+    with pytest.raises(ValueError):
+        monte_carlo(airdrop, 10, 1, x_values, period_weights=[1, 1])
@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+from src.simulate_mab import calculate_mab_pure
+from src.simulate_supply import (
+    calculate_locked_supply,
+    get_unlock_events,
+    sample_locked_supply,
+)
+
+
+def test_calculate_locked_supply():
+    """
+    Test the calculate_locked_supply function sums calculate_mab_pure
+    """
+    rng = np.random.default_rng(1)
+    n = 200
+    contracts = [
+        rng.integers(0, 2, n),  # vesting_delay
+        np.full(n, 10),  # period_seconds
+        rng.integers(0, 13, n),  # lockup_delay
+        rng.integers(0, 6, n),  # period
+        rng.integers(0, 100, n),  # funding
+        rng.integers(0, 10**9, n),  # total
+        rng.integers(1, 25, n),  # distribution_count
+        rng.integers(1, 20, n),  # distribution_seconds
+    ]
+    timestamps, locked = calculate_locked_supply(*contracts)
+    assert (np.diff(timestamps.astype(np.int64)) > 0).all()
+    assert (np.diff(locked.astype(np.int64)) < 0).all()
+    assert locked[-1] == 0
+    total = int(contracts[5].sum())
+    now = np.arange(0, int(timestamps[-1]) + 10, 3)
+    sampled = sample_locked_supply(timestamps, locked, total, now)
+    for t, value in zip(now.tolist(), sampled.tolist()):
+        assert value == sum(
+            calculate_mab_pure(t, *(int(column[i]) for column in contracts))
+            for i in range(n)
+        )
+
+
+def test_get_unlock_events_invalid():
+    """
+    Test the get_unlock_events function rejects contracts the avm would reject
+    """
+    with pytest.raises(ValueError):
+        get_unlock_events([0], [60], [0], [0], [0], [100], [0], [60])
+    with pytest.raises(OverflowError):
+        get_unlock_events([0], [60], [0], [0], [0], [2**63], [12], [60])
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+from src.simulate_sweep import (
+    calculate_unlock_curve,
+    default_configuration,
+    get_configurations,
+    sweep,
+)
+
+
+def test_get_configurations():
+    """
+    Test the get_configurations function fills defaults
+    """
+    configurations = get_configurations({"PERIOD_LIMIT": [1, 5], "LOCKUP_DELAY": [1]})
+    assert len(configurations) == 2
+    assert configurations[1] == {
+        **default_configuration,
+        "PERIOD_LIMIT": 5,
+        "LOCKUP_DELAY": 1,
+    }
+
+
+def test_sweep():
+    """
+    Test the sweep function collects every configuration from the pool
+    """
+    grid = {"PERIOD_LIMIT": [0, 5], "DISTRIBUTION_COUNT": [1, 12, 24]}
+    x_values, curves, summaries = sweep(grid, workers=2, chunk_size=1)
+    configurations = get_configurations(grid)
+    assert curves.shape == (len(configurations), len(x_values))
+    for configuration, curve, summary in zip(configurations, curves, summaries):
+        assert summary.items() >= configuration.items()
+        expected = calculate_unlock_curve(configuration, x_values, 225000)
+        assert np.array_equal(curve, expected)
+        assert curve[0] == 1
+        assert summary["mean_locked"] == pytest.approx(curve.mean())
+
+
+def test_sweep_zero_total():
+    """
+    Test the sweep function rejects a zero total
+    """
+    with pytest.raises(ValueError):
+        sweep({"PERIOD_LIMIT": [5]}, total=0, workers=1)
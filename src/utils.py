@@ -3,6 +3,7 @@ from algopy import (
     Bytes,
     Global,
     OnCompleteAction,
+    TransactionType,
     Txn,
     UInt64,
     gtxn,
@@ -47,6 +48,138 @@ def get_available_balance() -> UInt64:
     return available_balance
 
 
+##############################################
+# function: get_min_balance (internal)
+# purpose: get min balance of app account,
+#   grows with apps created by it
+# returns: app min balance
+##############################################
+@subroutine
+def get_min_balance() -> UInt64:
+    min_balance, exists = op.AcctParamsGet.acct_min_balance(
+        Global.current_application_address
+    )
+    return min_balance
+
+
+##############################################
+# function: settle_mbr_payment (internal)
+# arguments:
+# - min_balance, app min balance before boxes
+#   were written
+# purpose: require payment preceding call from
+#   sender covering min balance increase since
+#   min_balance, refund excess to sender
+# notes:
+# - payment only required when min balance
+#   increased, refunded in full otherwise
+# - refund costs 1 fee, pooled by sender
+##############################################
+@subroutine
+def settle_mbr_payment(min_balance: UInt64) -> None:
+    mbr_increase = get_min_balance() - min_balance
+    if mbr_increase > 0:
+        payment_amount = require_payment(Txn.sender)
+        assert payment_amount >= mbr_increase, "payment amount accurate"
+    else:
+        payment_amount = get_payment_amount()
+    if payment_amount > mbr_increase:
+        itxn.Payment(
+            receiver=Txn.sender, amount=payment_amount - mbr_increase, fee=0
+        ).submit()
+
+
+##############################################
+# function: get_payment_amount (internal)
+# purpose: amount of optional payment preceding
+#   call from sender to app
+# returns: payment amount, 0 without payment
+##############################################
+@subroutine
+def get_payment_amount() -> UInt64:
+    if Txn.group_index == 0:
+        return UInt64(0)
+    payment = gtxn.Transaction(Txn.group_index - 1)
+    if (
+        payment.type == TransactionType.Payment
+        and payment.sender == Txn.sender
+        and payment.receiver == Global.current_application_address
+    ):
+        return payment.amount
+    return UInt64(0)
+
+
+##############################################
+# function: append_paged (internal)
+# arguments:
+# - key, list key, box key holds item count,
+#   box key + page index holds page of items
+# - item, fixed size item
+# - page_size, items per page, pages are
+#   at most 1KB to be read with one box ref
+# purpose: append item to list kept in pages
+#   writing only count and last page
+##############################################
+@subroutine
+def append_paged(key: Bytes, item: Bytes, page_size: UInt64) -> None:
+    count = UInt64(0)
+    count_bytes, exists = op.Box.get(key)
+    if exists:
+        count = op.btoi(count_bytes)
+    page_key = key + op.itob(count // page_size)
+    offset = (count % page_size) * item.length
+    if offset == 0:
+        op.Box.put(page_key, item)
+    else:
+        op.Box.resize(page_key, offset + item.length)
+        op.Box.replace(page_key, offset, item)
+    op.Box.put(key, op.itob(count + 1))
+
+
+##############################################
+# function: get_paged (internal)
+# arguments:
+# - key, list key, see append_paged
+# - offset, index of first item
+# - limit, max items, at most page_size
+# - item_size, item size
+# - page_size, items per page
+# purpose: read items from list kept in pages
+# returns:
+# - item count
+# - items from offset, at most limit, spans
+#   at most 2 pages
+##############################################
+@subroutine
+def get_paged(
+    key: Bytes, offset: UInt64, limit: UInt64, item_size: UInt64, page_size: UInt64
+) -> tuple[UInt64, Bytes]:
+    count_bytes, exists = op.Box.get(key)
+    if not exists:
+        return UInt64(0), Bytes()
+    count = op.btoi(count_bytes)
+    if offset >= count:
+        return count, Bytes()
+    # clamp before adding to offset, which may overflow
+    if limit > page_size:
+        limit = page_size
+    if limit > count - offset:
+        limit = count - offset
+    items = Bytes()
+    index = offset
+    end = offset + limit
+    while index < end:
+        slot = index % page_size
+        size = page_size - slot
+        if size > end - index:
+            size = end - index
+        items += op.Box.extract(
+            key + op.itob(index // page_size), slot * item_size, size * item_size
+        )
+        index += size
+    return count, items
+
+
 ##############################################
 @subroutine
 def close_offline_on_delete(close_remainder_to: Account) -> None: